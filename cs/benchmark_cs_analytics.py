@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Customer Service Analytics Micro-Benchmarks
+===========================================
+
+Times every public calculate_* function in cs_analytics (plus the sentiment
+and churn analyses) on synthetic tables scaled up from the sample workbook.
+
+The sample sheets are resampled row-wise so every column keeps its real
+schema; ids are rewritten and foreign keys re-drawn from the scaled parent
+tables, and all dates of a row are shifted by the same offset.
+
+Usage:
+    python benchmark_cs_analytics.py
+    python benchmark_cs_analytics.py --tickets 200000 --repeat 5 --filter agent
+"""
+
+import argparse
+import inspect
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import cs_analytics
+
+SAMPLE_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'customer_service_sample_dataset.xlsx')
+
+# Rows per ticket for every scaled table
+TABLE_RATIOS = {
+    'customers': 1 / 50,
+    'agents': 1 / 500,
+    'tickets': 1.0,
+    'interactions': 1.0,
+    'feedback': 0.5,
+    'sla': None  # SLA rules are configuration and are not scaled
+}
+
+# Primary key column and id prefix per table
+TABLE_KEYS = {
+    'customers': ('customer_id', 'CUST'),
+    'agents': ('agent_id', 'AGENT'),
+    'tickets': ('ticket_id', 'TICKET'),
+    'interactions': ('interaction_id', 'INT'),
+    'feedback': ('feedback_id', 'FB')
+}
+
+# Non-calculate_* analyses included in the suite
+EXTRA_FUNCTIONS = ['analyze_sentiment', 'predict_customer_churn']
+
+# ============================================================================
+# DATA GENERATION
+# ============================================================================
+
+def _scale_table(df, n_rows, rng, max_shift_days=365):
+    """Resample rows with replacement and shift each row's dates together."""
+    scaled = df.iloc[rng.integers(0, len(df), n_rows)].reset_index(drop=True)
+    shift = pd.to_timedelta(rng.integers(0, max_shift_days * 24, n_rows), unit='h')
+    for col in scaled.columns:
+        if pd.api.types.is_datetime64_any_dtype(scaled[col]):
+            scaled[col] = scaled[col] + shift
+    return scaled
+
+
+def _make_ids(prefix, n_rows):
+    """Sequential string ids such as CUST_000001."""
+    return pd.Series(np.arange(1, n_rows + 1)).map(lambda i: f'{prefix}_{i:07d}')
+
+
+def build_benchmark_tables(n_tickets=1_000_000, seed=42, dataset_path=SAMPLE_DATASET):
+    """
+    Build benchmark tables with n_tickets tickets.
+
+    Args:
+        n_tickets (int): Number of tickets; other tables scale by TABLE_RATIOS
+        seed (int): Random seed
+        dataset_path (str): Sample workbook used as the row template
+
+    Returns:
+        dict: Table name -> DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    sheets = pd.read_excel(dataset_path, sheet_name=None)
+    templates = {name.lower(): df for name, df in sheets.items()}
+
+    tables = {}
+    for name, ratio in TABLE_RATIOS.items():
+        template = templates.get(name, pd.DataFrame())
+        if ratio is None or template.empty:
+            tables[name] = template
+            continue
+        tables[name] = _scale_table(template, max(1, int(n_tickets * ratio)), rng)
+        key_column, prefix = TABLE_KEYS[name]
+        tables[name][key_column] = _make_ids(prefix, len(tables[name]))
+
+    # Re-draw foreign keys from the scaled parent tables
+    for name, df in tables.items():
+        for parent, (key_column, _) in TABLE_KEYS.items():
+            if parent != name and key_column in df.columns and not tables[parent].empty:
+                parent_ids = tables[parent][key_column].to_numpy()
+                df[key_column] = parent_ids[rng.integers(0, len(parent_ids), len(df))]
+    return tables
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def discover_benchmarks(name_filter=None):
+    """
+    Public analytics functions to benchmark.
+
+    Returns:
+        list: (name, function) pairs for every calculate_* defined in
+        cs_analytics plus EXTRA_FUNCTIONS
+    """
+    functions = [
+        (name, func) for name, func in inspect.getmembers(cs_analytics, inspect.isfunction)
+        if func.__module__ == cs_analytics.__name__
+        and (name.startswith('calculate_') or name in EXTRA_FUNCTIONS)
+    ]
+    if name_filter:
+        functions = [(name, func) for name, func in functions if name_filter in name]
+    return functions
+
+
+def _call_arguments(func, tables):
+    """Map <table>_df parameters to shallow copies of the benchmark tables."""
+    arguments = []
+    for parameter in inspect.signature(func).parameters:
+        table_name = parameter[:-3] if parameter.endswith('_df') else parameter
+        # Shallow copies keep functions that assign columns from leaking into later runs
+        arguments.append(tables.get(table_name, pd.DataFrame()).copy(deep=False))
+    return arguments
+
+
+def run_benchmarks(tables, repeat=3, name_filter=None):
+    """
+    Time each analytics function.
+
+    Args:
+        tables (dict): Output of build_benchmark_tables
+        repeat (int): Timed runs per function
+        name_filter (str): Only run functions whose name contains this text
+
+    Returns:
+        pd.DataFrame: Best and median seconds per function, with the
+        function's own message so swallowed errors are visible
+    """
+    results = []
+    for name, func in discover_benchmarks(name_filter):
+        timings = []
+        message = ''
+        for _ in range(repeat):
+            arguments = _call_arguments(func, tables)
+            start = time.perf_counter()
+            result = func(*arguments)
+            timings.append(time.perf_counter() - start)
+        if isinstance(result, tuple) and len(result) > 1 and isinstance(result[-1], str):
+            message = result[-1]
+        results.append({
+            'function': name,
+            'best_s': min(timings),
+            'median_s': float(np.median(timings)),
+            'error': message.startswith('Error'),
+            'message': message[:80]
+        })
+    return pd.DataFrame(results).sort_values('median_s', ascending=False, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the customer service analytics functions')
+    parser.add_argument('--tickets', type=int, default=1_000_000, help='Number of synthetic tickets')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per function')
+    parser.add_argument('--filter', default=None, help='Only run functions whose name contains this text')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic tables')
+    parser.add_argument('--csv', default=None, help='Optional path to write the results as CSV')
+    args = parser.parse_args()
+
+    print(f"🎧 Building benchmark tables with {args.tickets:,} tickets...")
+    start = time.perf_counter()
+    tables = build_benchmark_tables(args.tickets, seed=args.seed)
+    print(f"   built in {time.perf_counter() - start:.1f}s: "
+          + ", ".join(f"{name}={len(df):,}" for name, df in tables.items()))
+
+    results = run_benchmarks(tables, repeat=args.repeat, name_filter=args.filter)
+    print(results.to_string(index=False, formatters={'best_s': '{:.3f}'.format, 'median_s': '{:.3f}'.format}))
+    print(f"\n⏱️ Total median time: {results['median_s'].sum():.2f}s across {len(results)} functions")
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+        print(f"💾 Results written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
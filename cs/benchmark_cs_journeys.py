@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Customer Journey Sessionization Benchmark
+=========================================
+
+Streams synthetic interactions through cs_journeys.analyze_journeys in
+chunks (as pd.read_csv(..., chunksize=n) would) and reports throughput
+and peak resident memory, so the bounded-memory path can be checked at
+tens of millions of rows without holding them all at once.
+
+Usage:
+    python benchmark_cs_journeys.py
+    python benchmark_cs_journeys.py --interactions 50000000 --chunk-rows 1000000
+"""
+
+import argparse
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cs_journeys import analyze_journeys, DEFAULT_INACTIVITY_GAP_HOURS
+
+CHANNELS = np.array(['Chat', 'Email', 'Phone', 'Portal', 'Social Media'], dtype=object)
+OUTCOMES = np.array(['Resolved', 'Escalated', 'Information Provided', 'Follow-up Required'], dtype=object)
+
+# Synthetic interactions per customer and span of the start times
+INTERACTIONS_PER_CUSTOMER = 20
+SPAN_DAYS = 365
+
+
+def generate_chunks(n_interactions, chunk_rows, seed=42):
+    """Yield interaction chunks in arrival order with customers spread over every chunk."""
+    rng = np.random.default_rng(seed)
+    n_customers = max(1, n_interactions // INTERACTIONS_PER_CUSTOMER)
+    # Categorical ids, as read_csv(..., dtype={'customer_id': 'category'}) would give
+    customer_ids = pd.Index([f'CUST_{i:08d}' for i in range(n_customers)])
+    start = pd.Timestamp('2023-01-01').value
+    span_ns = SPAN_DAYS * 24 * 3_600_000_000_000
+    for offset in range(0, n_interactions, chunk_rows):
+        size = min(chunk_rows, n_interactions - offset)
+        customers = rng.integers(0, n_customers, size)
+        yield pd.DataFrame({
+            'customer_id': pd.Categorical.from_codes(customers, categories=customer_ids),
+            'start_time': np.sort(rng.integers(start, start + span_ns, size)).astype('datetime64[ns]'),
+            'channel': CHANNELS[rng.integers(0, len(CHANNELS), size)],
+            'outcome': OUTCOMES[rng.integers(0, len(OUTCOMES), size)]
+        })
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark chunked journey sessionization')
+    parser.add_argument('--interactions', type=int, default=5_000_000, help='Number of synthetic interactions')
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000, help='Rows per streamed chunk')
+    parser.add_argument('--partitions', type=int, default=None, help='Customer-hash partitions (default rows / chunk rows)')
+    parser.add_argument('--gap-hours', type=float, default=DEFAULT_INACTIVITY_GAP_HOURS, help='Inactivity gap')
+    args = parser.parse_args()
+
+    partitions = args.partitions or max(1, -(-args.interactions // args.chunk_rows))
+    print(f"🔄 Sessionizing {args.interactions:,} interactions in {args.chunk_rows:,}-row chunks "
+          f"over {partitions} partitions...")
+
+    start = time.perf_counter()
+    analysis = analyze_journeys(generate_chunks(args.interactions, args.chunk_rows),
+                                gap_hours=args.gap_hours, n_partitions=partitions)
+    elapsed = time.perf_counter() - start
+
+    summary = analysis.summary()
+    print(f"⏱️ {elapsed:.1f}s ({args.interactions / elapsed / 1e6:.2f}M interactions/s, "
+          f"including generation), peak RSS {peak_rss_mb():,.0f} MB")
+    print(f"👥 {summary['customers']:,} customers, {summary['journeys']:,} journeys, "
+          f"{summary['avg_touchpoints']:.2f} touchpoints and {summary['avg_channel_switches']:.2f} switches per journey")
+    print(analysis.path_frequencies(5).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Customer Service Page-Render Benchmark
+======================================
+
+Times the metric computations each CS page performs while rendering, on
+synthetic tables from benchmark_cs_analytics.build_benchmark_tables.
+
+Each page is rendered twice in a fresh session: the first (cold) render
+pays for every shared intermediate, the second (warm) one shows what a
+Streamlit rerun costs once those are cached.
+
+Usage:
+    python benchmark_cs_metrics.py
+    python benchmark_cs_metrics.py --tickets 200000 --repeat 3
+"""
+
+import argparse
+import importlib
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from benchmark_cs_analytics import build_benchmark_tables
+
+SESSION_TABLES = ['customers', 'tickets', 'agents', 'interactions', 'feedback', 'sla']
+
+# Page -> metric calls made during one render, as (module, function, argument tables).
+# Page helpers called several times per render are listed once per call.
+PAGE_RENDERS = {
+    'home': [
+        ('cs_metrics_calculator', 'calculate_customer_satisfaction_metrics', ['customers', 'feedback', 'tickets']),
+        ('cs_metrics_calculator', 'calculate_agent_performance_metrics', ['agents', 'tickets', 'feedback'])
+    ],
+    'agent_performance': [
+        ('cs_pages.agent_performance_page', 'calculate_agent_performance_metrics', []),
+        ('cs_pages.agent_performance_page', 'calculate_agent_performance_metrics', []),
+        ('cs_pages.agent_performance_page', 'calculate_workload_metrics', [])
+    ],
+    'customer_retention': [
+        ('cs_pages.customer_retention_page', 'calculate_customer_retention_metrics', []),
+        ('cs_pages.customer_retention_page', 'calculate_customer_retention_metrics', []),
+        ('cs_pages.customer_retention_page', 'calculate_customer_value_metrics', [])
+    ],
+    'metric_summaries': [
+        ('cs_metrics_calculator', 'calculate_customer_satisfaction_metrics', ['customers', 'feedback', 'tickets']),
+        ('cs_metrics_calculator', 'calculate_response_resolution_metrics', ['tickets', 'interactions', 'sla']),
+        ('cs_metrics_calculator', 'calculate_service_efficiency_metrics', ['tickets', 'agents', 'interactions']),
+        ('cs_metrics_calculator', 'calculate_customer_retention_metrics', ['customers', 'tickets', 'interactions']),
+        ('cs_metrics_calculator', 'calculate_agent_performance_metrics', ['agents', 'tickets', 'feedback']),
+        ('cs_metrics_calculator', 'calculate_interaction_analysis_metrics', ['interactions', 'tickets']),
+        ('cs_metrics_calculator', 'calculate_omnichannel_metrics', ['interactions', 'tickets']),
+        ('cs_metrics_calculator', 'calculate_business_impact_metrics', ['customers', 'tickets', 'feedback']),
+        ('cs_metrics_calculator', 'calculate_agent_productivity_metrics', ['agents', 'tickets', 'interactions'])
+    ]
+}
+
+
+def _reset_session(tables):
+    """Fresh session holding the benchmark tables and no cached analytics."""
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    for name in SESSION_TABLES:
+        st.session_state[name] = tables.get(name, pd.DataFrame())
+
+
+def _render(calls, tables):
+    start = time.perf_counter()
+    for module_name, function_name, arguments in calls:
+        function = getattr(importlib.import_module(module_name), function_name)
+        function(*[tables[name] for name in arguments])
+    return time.perf_counter() - start
+
+
+def run_page_benchmarks(tables, repeat=3, pages=None):
+    """
+    Time cold and warm renders of each page's metric computations.
+
+    Args:
+        tables (dict): Output of build_benchmark_tables
+        repeat (int): Timed sessions per page
+        pages (list): Page names from PAGE_RENDERS, defaults to all
+
+    Returns:
+        pd.DataFrame: Median cold and warm seconds per page
+    """
+    results = []
+    for page in pages or PAGE_RENDERS:
+        cold, warm = [], []
+        for _ in range(repeat):
+            _reset_session(tables)
+            cold.append(_render(PAGE_RENDERS[page], tables))
+            warm.append(_render(PAGE_RENDERS[page], tables))
+        results.append({'page': page, 'cold_s': float(np.median(cold)), 'warm_s': float(np.median(warm))})
+    return pd.DataFrame(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CS page-render metric computations')
+    parser.add_argument('--tickets', type=int, default=200_000, help='Number of synthetic tickets')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed sessions per page')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic tables')
+    args = parser.parse_args()
+
+    print(f"🎧 Building benchmark tables with {args.tickets:,} tickets...")
+    tables = build_benchmark_tables(args.tickets, seed=args.seed)
+
+    results = run_page_benchmarks(tables, repeat=args.repeat)
+    print(results.to_string(index=False, formatters={'cold_s': '{:.3f}'.format, 'warm_s': '{:.3f}'.format}))
+    print(f"\n⏱️ Total page-render compute: {results['cold_s'].sum():.2f}s cold, {results['warm_s'].sum():.2f}s warm")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Customer Service Text Analytics Benchmark
+=========================================
+
+Times cs_text_analytics on synthetic comments: a first pass that vectorizes
+and clusters every distinct text, then a refresh with a share of new
+comments, where only the new texts are processed.
+
+Usage:
+    python benchmark_cs_text.py
+    python benchmark_cs_text.py --comments 1000000 --new-share 0.05 --jobs 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from cs_text_analytics import analyze_texts, summarize_topics
+
+# Phrases combined into synthetic comments
+TOPIC_PHRASES = [
+    'refund for the duplicate billing charge', 'cannot login after the password reset',
+    'app crashes when uploading files', 'invoice shows the wrong plan price',
+    'delivery is late and tracking is broken', 'account locked after failed attempts',
+    'upgrade to the premium plan', 'email notifications never arrive'
+]
+TONE_PHRASES = ['great and quick support', 'agent was rude and slow', 'thanks for the help',
+                'still waiting for an answer', 'very helpful team', 'poor experience overall', '']
+
+
+def generate_comments(n_comments, seed=42):
+    """Comments from a topic and a tone phrase, with per-comment ids as real exports carry."""
+    rng = np.random.default_rng(seed)
+    topics = np.array(TOPIC_PHRASES, dtype=object)[rng.integers(0, len(TOPIC_PHRASES), n_comments)]
+    tones = np.array(TONE_PHRASES, dtype=object)[rng.integers(0, len(TONE_PHRASES), n_comments)]
+    words = np.array(['today', 'again', 'please', 'urgent', 'twice', 'yesterday', 'now'], dtype=object)
+    extra = words[rng.integers(0, len(words), n_comments)] + ' ' + words[rng.integers(0, len(words), n_comments)]
+    return pd.Series(topics + ', ' + tones + ' ' + extra + ' order ' + np.arange(n_comments).astype(str).astype(object))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batched text analytics')
+    parser.add_argument('--comments', type=int, default=200_000, help='Number of synthetic comments')
+    parser.add_argument('--new-share', type=float, default=0.05, help='Share of new comments on refresh')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+
+    comments = generate_comments(args.comments)
+    print(f"📝 Analyzing {len(comments):,} comments...")
+    start = time.perf_counter()
+    documents, _, processed = analyze_texts(comments, 'benchmark', n_jobs=args.jobs)
+    print(f"⏱️ First pass: {time.perf_counter() - start:.1f}s, {processed:,} distinct texts processed")
+    print(summarize_topics(documents).round(2).to_string(index=False))
+
+    refreshed = pd.concat([comments, generate_comments(int(args.comments * args.new_share), seed=7)
+                           .radd('follow up: ')], ignore_index=True)
+    start = time.perf_counter()
+    _, _, processed = analyze_texts(refreshed, 'benchmark', n_jobs=args.jobs)
+    print(f"\n🔄 Refresh with {len(refreshed) - len(comments):,} new comments: "
+          f"{time.perf_counter() - start:.1f}s, {processed:,} distinct texts processed")
+
+
+if __name__ == "__main__":
+    main()
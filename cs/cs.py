@@ -12,6 +12,8 @@ import os
 # Import customer service metric calculation functions
 from cs_metrics_calculator import *
 from cs_analytics import calculate_csat_score, calculate_nps_score, calculate_ces_score, analyze_sentiment, calculate_resolution_satisfaction
+from cs_data_utils import process_uploaded_excel, load_sample_dataset, create_ingestion_progress
+from cs_metrics_engine import get_metric_context
 
 def calculate_first_response_time(tickets_df):
     """Calculate first response time metrics"""
@@ -690,81 +692,6 @@ def calculate_agent_utilization_rate(agents_data, interactions_data):
     except Exception as e:
         return pd.DataFrame(), f"Error calculating agent utilization rate: {str(e)}"
 
-def calculate_sla_compliance(tickets_data, sla_data):
-    """Calculate SLA compliance metrics for customer service"""
-    try:
-        if tickets_data.empty or sla_data.empty:
-            return pd.DataFrame(), "No ticket or SLA data available"
-        
-        # Merge tickets with SLA data to get target response times
-        if 'ticket_type' in tickets_data.columns and 'priority' in tickets_data.columns:
-            merged_data = tickets_data.merge(sla_data, on=['ticket_type', 'priority'], how='left')
-            tickets_with_sla = merged_data[merged_data['first_response_target_hours'].notna()].copy()
-            
-            if not tickets_with_sla.empty:
-                # Convert dates to datetime
-                if 'created_date' in tickets_with_sla.columns and 'first_response_date' in tickets_with_sla.columns:
-                    tickets_with_sla['created_date'] = pd.to_datetime(tickets_with_sla['created_date'], errors='coerce')
-                    tickets_with_sla['first_response_date'] = pd.to_datetime(tickets_with_sla['first_response_date'], errors='coerce')
-                    
-                    # Filter tickets with valid dates
-                    valid_tickets = tickets_with_sla[
-                        (tickets_with_sla['created_date'].notna()) & 
-                        (tickets_with_sla['first_response_date'].notna())
-                    ]
-                    
-                    if not valid_tickets.empty:
-                        # Calculate actual response time in hours
-                        valid_tickets['actual_response_hours'] = (
-                            valid_tickets['first_response_date'] - valid_tickets['created_date']
-                        ).dt.total_seconds() / 3600
-                        
-                        # Check SLA compliance
-                        valid_tickets['sla_compliant'] = (
-                            valid_tickets['actual_response_hours'] <= valid_tickets['first_response_target_hours']
-                        )
-                        
-                        # Calculate metrics
-                        total_tickets = len(valid_tickets)
-                        compliant_tickets = valid_tickets['sla_compliant'].sum()
-                        non_compliant_tickets = total_tickets - compliant_tickets
-                        compliance_rate = (compliant_tickets / total_tickets * 100) if total_tickets > 0 else 0
-                        
-                    else:
-                        total_tickets = 0
-                        compliant_tickets = 0
-                        non_compliant_tickets = 0
-                        compliance_rate = 0
-                else:
-                    total_tickets = 0
-                    compliant_tickets = 0
-                    non_compliant_tickets = 0
-                    compliance_rate = 0
-            else:
-                total_tickets = 0
-                compliant_tickets = 0
-                non_compliant_tickets = 0
-                compliance_rate = 0
-        else:
-            total_tickets = 0
-            compliant_tickets = 0
-            non_compliant_tickets = 0
-            compliance_rate = 0
-        
-        # Create summary DataFrame
-        sla_summary = pd.DataFrame([
-            ['SLA Compliance Rate', f"{compliance_rate:.1f}%"],
-            ['Compliant Tickets', compliant_tickets],
-            ['Total Tickets', total_tickets],
-            ['Non-Compliant Tickets', non_compliant_tickets]
-        ], columns=['Metric', 'Value'])
-        
-        message = f"SLA compliance analysis completed. Overall compliance rate: {compliance_rate:.1f}%"
-        return sla_summary, message
-        
-    except Exception as e:
-        return pd.DataFrame(), f"Error calculating SLA compliance: {str(e)}"
-
 def calculate_channel_performance_analysis(tickets_data):
     """Calculate channel performance analysis metrics"""
     try:
@@ -2283,60 +2210,12 @@ def calculate_sla_compliance(tickets_data, sla_data):
         if tickets_data.empty or sla_data.empty:
             return pd.DataFrame(), "No ticket or SLA data available"
         
-        # Merge tickets with SLA data to get target response times
-        if 'ticket_type' in tickets_data.columns and 'priority' in tickets_data.columns:
-            merged_data = tickets_data.merge(sla_data, on=['ticket_type', 'priority'], how='left')
-            tickets_with_sla = merged_data[merged_data['first_response_target_hours'].notna()].copy()
-            
-            if not tickets_with_sla.empty:
-                # Convert dates to datetime
-                if 'created_date' in tickets_with_sla.columns and 'first_response_date' in tickets_with_sla.columns:
-                    tickets_with_sla['created_date'] = pd.to_datetime(tickets_with_sla['created_date'], errors='coerce')
-                    tickets_with_sla['first_response_date'] = pd.to_datetime(tickets_with_sla['first_response_date'], errors='coerce')
-                    
-                    # Filter tickets with valid dates
-                    valid_tickets = tickets_with_sla[
-                        (tickets_with_sla['created_date'].notna()) & 
-                        (tickets_with_sla['first_response_date'].notna())
-                    ]
-                    
-                    if not valid_tickets.empty:
-                        # Calculate actual response time in hours
-                        valid_tickets['actual_response_hours'] = (
-                            valid_tickets['first_response_date'] - valid_tickets['created_date']
-                        ).dt.total_seconds() / 3600
-                        
-                        # Check SLA compliance
-                        valid_tickets['sla_compliant'] = (
-                            valid_tickets['actual_response_hours'] <= valid_tickets['first_response_target_hours']
-                        )
-                        
-                        # Calculate metrics
-                        total_tickets = len(valid_tickets)
-                        compliant_tickets = valid_tickets['sla_compliant'].sum()
-                        non_compliant_tickets = total_tickets - compliant_tickets
-                        compliance_rate = (compliant_tickets / total_tickets * 100) if total_tickets > 0 else 0
-                        
-                    else:
-                        total_tickets = 0
-                        compliant_tickets = 0
-                        non_compliant_tickets = 0
-                        compliance_rate = 0
-                else:
-                    total_tickets = 0
-                    compliant_tickets = 0
-                    non_compliant_tickets = 0
-                    compliance_rate = 0
-            else:
-                total_tickets = 0
-                compliant_tickets = 0
-                non_compliant_tickets = 0
-                compliance_rate = 0
-        else:
-            total_tickets = 0
-            compliant_tickets = 0
-            non_compliant_tickets = 0
-            compliance_rate = 0
+        # First response clock from the SLA engine (rule fallback, business hours, grace period)
+        overall = get_metric_context(tickets=tickets_data, sla=sla_data).intermediate('sla_overall')
+        total_tickets = int(overall['response_measured']) if overall is not None else 0
+        non_compliant_tickets = int(overall['response_breaches']) if overall is not None else 0
+        compliant_tickets = total_tickets - non_compliant_tickets
+        compliance_rate = (compliant_tickets / total_tickets * 100) if total_tickets > 0 else 0
         
         # Create summary DataFrame
         sla_summary = pd.DataFrame([
@@ -3141,62 +3020,6 @@ def create_template_for_download():
     output.seek(0)
     return output.getvalue()
 
-def process_uploaded_excel(uploaded_file):
-    """Process uploaded Excel file and load data into session state"""
-    try:
-        # Read all sheets from the Excel file
-        excel_data = pd.read_excel(uploaded_file, sheet_name=None)
-        
-        # Check if all required sheets are present
-        required_sheets = ['Customers', 'Tickets', 'Agents', 'Interactions', 'Feedback', 'SLA', 'Knowledge_Base', 'Training']
-        missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_data.keys()]
-        
-        if missing_sheets:
-            return False, f"Missing required sheets: {', '.join(missing_sheets)}"
-        
-        # Load data into session state
-        st.session_state.customers = excel_data['Customers']
-        st.session_state.tickets = excel_data['Tickets']
-        st.session_state.agents = excel_data['Agents']
-        st.session_state.interactions = excel_data['Interactions']
-        st.session_state.feedback = excel_data['Feedback']
-        st.session_state.sla = excel_data['SLA']
-        st.session_state.knowledge_base = excel_data['Knowledge_Base']
-        st.session_state.training = excel_data['Training']
-        
-        return True, f"All customer service data loaded successfully! Loaded {len(st.session_state.customers)} customers, {len(st.session_state.tickets)} tickets, {len(st.session_state.agents)} agents, and more..."
-        
-    except Exception as e:
-        return False, f"Error reading Excel file: {str(e)}"
-
-def load_sample_dataset(file_path):
-    """Load sample dataset from Excel file for testing purposes"""
-    try:
-        # Read all sheets from the sample Excel file
-        excel_data = pd.read_excel(file_path, sheet_name=None)
-        
-        # Check if all required sheets are present
-        required_sheets = ['Customers', 'Tickets', 'Agents', 'Interactions', 'Feedback', 'SLA', 'Knowledge_Base', 'Training']
-        missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_data.keys()]
-        
-        if missing_sheets:
-            return False, f"Missing required sheets in sample dataset: {', '.join(missing_sheets)}"
-        
-        # Load data into session state
-        st.session_state.customers = excel_data['Customers']
-        st.session_state.tickets = excel_data['Tickets']
-        st.session_state.agents = excel_data['Agents']
-        st.session_state.interactions = excel_data['Interactions']
-        st.session_state.feedback = excel_data['Feedback']
-        st.session_state.sla = excel_data['SLA']
-        st.session_state.knowledge_base = excel_data['Knowledge_Base']
-        st.session_state.training = excel_data['Training']
-        
-        return True, f"Sample dataset loaded successfully! Loaded {len(st.session_state.customers)} customers, {len(st.session_state.tickets)} tickets, {len(st.session_state.agents)} agents, {len(st.session_state.interactions)} interactions, {len(st.session_state.feedback)} feedback records, {len(st.session_state.sla)} SLA records, {len(st.session_state.knowledge_base)} knowledge base articles, and {len(st.session_state.training)} training records."
-        
-    except Exception as e:
-        return False, f"Error loading sample dataset: {str(e)}"
-
 def export_data_to_excel():
     """Exports all customer service data from session state to a single Excel file."""
     with pd.ExcelWriter('customer_service_data_export.xlsx', engine='xlsxwriter') as writer:
@@ -4032,7 +3855,8 @@ def show_data_input():
         # File upload for Excel template
         uploaded_file = st.file_uploader(
             "Upload Excel file with all customer service tables",
-            type=['xlsx', 'xls'],
+            type=['xlsx', 'xls', 'zip'],
+            help="Excel workbook, or a .zip with one CSV/Parquet file per sheet (e.g. Tickets.csv)",
             key="excel_uploader"
         )
         
@@ -4051,7 +3875,7 @@ def show_data_input():
         if uploaded_file is not None:
             try:
                 # Process the uploaded file
-                success, message = process_uploaded_excel(uploaded_file)
+                success, message = process_uploaded_excel(uploaded_file, progress=create_ingestion_progress())
                 if success:
                     st.success(f"✅ {message}")
                     st.info("💡 You can now navigate to other sections to view your data analytics!")
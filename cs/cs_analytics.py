@@ -15,6 +15,10 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+from cs_sla_engine import calculate_sla_metrics
+from cs_metrics_engine import csat_from_ratings, nps_from_scores, ces_from_scores
+from cs_text_analytics import analyze_texts, SKLEARN_AVAILABLE as TEXT_ANALYTICS_AVAILABLE
+
 # ============================================================================
 # CUSTOMER SATISFACTION ANALYTICS
 # ============================================================================
@@ -40,7 +44,7 @@ def calculate_csat_score(feedback_df):
         if 'rating' in feedback_df.columns:
             valid_ratings = feedback_df['rating'].dropna()
             if not valid_ratings.empty:
-                csat_score = (valid_ratings >= 4).sum() / len(valid_ratings) * 100
+                csat_score = csat_from_ratings(valid_ratings)
                 metrics.append(['CSAT Score (Rating ≥4)', f"{csat_score:.1f}%"])
                 
                 # Rating Distribution Analysis
@@ -98,7 +102,7 @@ def calculate_csat_score(feedback_df):
                 passives = ((nps_scores >= 7) & (nps_scores <= 8)).sum()
                 detractors = (nps_scores <= 6).sum()
                 
-                nps = (promoters - detractors) / len(nps_scores) * 100
+                nps = nps_from_scores(nps_scores)
                 metrics.append(['Net Promoter Score (NPS)', f"{nps:+.1f}"])
                 metrics.append(['Promoters (9-10)', f"{promoters} ({promoters/len(nps_scores)*100:.1f}%)"])
                 metrics.append(['Passives (7-8)', f"{passives} ({passives/len(nps_scores)*100:.1f}%)"])
@@ -177,7 +181,7 @@ def calculate_nps_score(feedback_df):
             passives = ((nps_scores >= 7) & (nps_scores <= 8)).sum()
             detractors = (nps_scores <= 6).sum()
             
-            nps = (promoters - detractors) / len(nps_scores) * 100
+            nps = nps_from_scores(nps_scores)
             metrics.append(['Net Promoter Score (NPS)', f"{nps:+.1f}"])
             
             # NPS Components
@@ -258,7 +262,7 @@ def calculate_nps_score(feedback_df):
         # Industry Benchmarking
         industry_nps_benchmark = 42  # Example industry benchmark
         if not nps_scores.empty:
-            current_nps = (promoters - detractors) / len(nps_scores) * 100
+            current_nps = nps_from_scores(nps_scores)
             benchmark_diff = current_nps - industry_nps_benchmark
             benchmark_percentile = "Top 25%" if benchmark_diff > 20 else "Top 50%" if benchmark_diff > 10 else "Average" if benchmark_diff > -10 else "Below Average"
             
@@ -329,7 +333,7 @@ def calculate_ces_score(feedback_df):
         # CES Score Calculation
         effort_scores = feedback_df['customer_effort_score'].dropna()
         if not effort_scores.empty:
-            avg_ces = effort_scores.mean()
+            avg_ces = ces_from_scores(effort_scores)
             metrics.append(['Average Customer Effort Score', f"{avg_ces:.2f}/6"])
             
             # CES Distribution Analysis
@@ -612,6 +616,16 @@ def analyze_sentiment(feedback_df):
                 if not pd.isna(negative_nps):
                     metrics.append(['Negative Sentiment Avg NPS', f"{negative_nps:.2f}/10"])
         
+        # Comment Text Analytics (scored from the comments, independent of the sentiment label)
+        if 'comments' in feedback_df.columns and TEXT_ANALYTICS_AVAILABLE:
+            documents, _, _ = analyze_texts(feedback_df['comments'], 'feedback_comments')
+            text_sentiment = documents['text_sentiment'].dropna()
+            if not text_sentiment.empty:
+                metrics.append(['Comment Text Sentiment Score', f"{text_sentiment.mean() * 100:+.1f}%"])
+            topic_counts = documents.loc[documents['topic'] >= 0, 'topic_label'].value_counts()
+            if not topic_counts.empty:
+                metrics.append(['Most Common Comment Topic', f"{topic_counts.index[0]} ({topic_counts.iloc[0] / len(documents) * 100:.1f}%)"])
+        
         # CES Integration
         if 'customer_effort_score' in feedback_df.columns:
             effort_scores = feedback_df['customer_effort_score'].dropna()
@@ -636,15 +650,15 @@ def analyze_sentiment(feedback_df):
         
         # Sentiment Trend Analysis (if date available)
         if 'submitted_date' in feedback_df.columns:
-            feedback_df['submitted_date'] = pd.to_datetime(feedback_df['submitted_date'], errors='coerce')
-            feedback_df = feedback_df.dropna(subset=['submitted_date'])
-            if not feedback_df.empty:
-                feedback_df['month'] = feedback_df['submitted_date'].dt.to_period('M')
-                
-                # Monthly sentiment trends
-                monthly_sentiment = feedback_df.groupby('month')['sentiment'].apply(
-                    lambda x: (x.isin(['Positive', 'Very Positive']).sum() - x.isin(['Negative', 'Very Negative']).sum()) / len(x) * 100
-                ).reset_index()
+            submitted = _as_datetime(feedback_df['submitted_date'])
+            dated = submitted.notna()
+            if dated.any():
+                # Monthly sentiment score as the mean of a +1/0/-1 polarity column
+                sentiment = feedback_df['sentiment']
+                polarity = (sentiment.isin(['Positive', 'Very Positive']).astype(np.int8)
+                            - sentiment.isin(['Negative', 'Very Negative']).astype(np.int8))
+                month = submitted[dated].dt.to_period('M').rename('Month')
+                monthly_sentiment = (polarity[dated].groupby(month).mean() * 100).reset_index()
                 monthly_sentiment.columns = ['Month', 'Sentiment Score']
                 monthly_sentiment = monthly_sentiment.sort_values('Month')
                 
@@ -782,25 +796,28 @@ def calculate_resolution_satisfaction(feedback_df, tickets_df):
 # RESPONSE & RESOLUTION ANALYTICS
 # ============================================================================
 
-def calculate_response_metrics(tickets_df):
+def _as_datetime(values):
+    """Return a datetime Series, parsing only when the column is not already datetime"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce')
+
+def calculate_response_metrics(tickets_df, sla_df=None):
     """Calculate response time and resolution metrics"""
     try:
         if tickets_df.empty:
             return pd.DataFrame(), "No ticket data available"
         
-        # Convert dates to datetime
-        tickets_analysis = tickets_df.copy()
-        date_columns = ['created_date', 'first_response_date', 'resolved_date']
-        
-        for col in date_columns:
-            if col in tickets_analysis.columns:
-                tickets_analysis[col] = pd.to_datetime(tickets_analysis[col], errors='coerce')
+        # Read date columns without copying the ticket table
+        dates = {col: _as_datetime(tickets_df[col])
+                 for col in ['created_date', 'first_response_date', 'resolved_date', 'escalated_date']
+                 if col in tickets_df.columns}
         
         # Calculate response and resolution times
         metrics = []
         
-        if 'first_response_date' in tickets_analysis.columns and 'created_date' in tickets_analysis.columns:
-            response_time = (tickets_analysis['first_response_date'] - tickets_analysis['created_date']).dt.total_seconds() / 3600
+        if 'first_response_date' in dates and 'created_date' in dates:
+            response_time = (dates['first_response_date'] - dates['created_date']).dt.total_seconds() / 3600
             # Filter out invalid response times
             valid_response_times = response_time[(response_time >= 0) & (response_time <= 168)]  # Max 1 week
             if not valid_response_times.empty:
@@ -809,8 +826,8 @@ def calculate_response_metrics(tickets_df):
                     metrics.append(['Average First Response Time', f"{avg_response_time:.2f} hours"])
                     metrics.append(['Response Time Range', f"{valid_response_times.min():.1f} - {valid_response_times.max():.1f} hours"])
         
-        if 'resolved_date' in tickets_analysis.columns and 'created_date' in tickets_analysis.columns:
-            resolution_time = (tickets_analysis['resolved_date'] - tickets_analysis['created_date']).dt.total_seconds() / 3600
+        if 'resolved_date' in dates and 'created_date' in dates:
+            resolution_time = (dates['resolved_date'] - dates['created_date']).dt.total_seconds() / 3600
             # Filter out invalid resolution times
             valid_resolution_times = resolution_time[(resolution_time >= 0) & (resolution_time <= 720)]  # Max 30 days
             if not valid_resolution_times.empty:
@@ -819,26 +836,22 @@ def calculate_response_metrics(tickets_df):
                     metrics.append(['Average Resolution Time', f"{avg_resolution_time:.2f} hours"])
                     metrics.append(['Resolution Time Range', f"{valid_resolution_times.min():.1f} - {valid_resolution_times.max():.1f} hours"])
         
-        # Calculate escalation rate (handle missing values)
-        if 'escalated_date' in tickets_analysis.columns and 'created_date' in tickets_analysis.columns:
-            # Only count as escalated if escalated_date is not null and after created_date
-            valid_escalations = tickets_analysis[
-                (tickets_analysis['escalated_date'].notna()) & 
-                (tickets_analysis['created_date'].notna())
-            ]
-            if not valid_escalations.empty:
-                escalation_rate = (valid_escalations['escalated_date'].notna()).mean() * 100
+        # Calculate escalation rate (tickets with a created date that were escalated)
+        if 'escalated_date' in dates and 'created_date' in dates:
+            has_created = dates['created_date'].notna()
+            if has_created.any():
+                escalation_rate = dates['escalated_date'][has_created].notna().mean() * 100
                 metrics.append(['Escalation Rate', f"{escalation_rate:.1f}%"])
         
-        # Calculate SLA compliance using actual SLA targets from dataset
-        if 'priority' in tickets_analysis.columns and 'first_response_date' in tickets_analysis.columns:
-            high_priority = tickets_analysis[tickets_analysis['priority'] == 'High']
-            if not high_priority.empty:
-                high_priority_response = (high_priority['first_response_date'] - high_priority['created_date']).dt.total_seconds() / 3600
-                valid_high_priority = high_priority_response[(high_priority_response >= 0) & (high_priority_response <= 168)]
-                if not valid_high_priority.empty:
-                    sla_compliance = (valid_high_priority <= 4).mean() * 100  # 4-hour SLA for high priority
-                    metrics.append(['High Priority SLA Compliance', f"{sla_compliance:.1f}%"])
+        # Calculate SLA compliance using the SLA sheet targets (priority defaults when absent)
+        if 'priority' in tickets_df.columns and 'created_date' in tickets_df.columns:
+            _, overall, by_priority = calculate_sla_metrics(tickets_df, sla_df)
+            if overall['response_measured'].iloc[0] > 0:
+                metrics.append(['First Response SLA Compliance', f"{overall['response_compliance'].iloc[0]:.1f}%"])
+            if overall['resolution_measured'].iloc[0] > 0:
+                metrics.append(['Resolution SLA Compliance', f"{overall['resolution_compliance'].iloc[0]:.1f}%"])
+            if 'High' in by_priority.index and by_priority.loc['High', 'response_measured'] > 0:
+                metrics.append(['High Priority SLA Compliance', f"{by_priority.loc['High', 'response_compliance']:.1f}%"])
         
         # Add ticket volume metrics
         total_tickets = len(tickets_df)
@@ -864,30 +877,32 @@ def calculate_response_metrics(tickets_df):
         return pd.DataFrame(), f"Error calculating response metrics: {str(e)}"
 
 def calculate_sla_compliance(tickets_df, sla_df):
-    """Calculate SLA compliance rates"""
+    """Calculate first response SLA compliance rate against the SLA sheet targets"""
     try:
         if tickets_df.empty:
             return 0.0
         
-        # Use actual columns from dataset
-        if 'priority' in tickets_df.columns and 'first_response_date' in tickets_df.columns:
-            high_priority = tickets_df[tickets_df['priority'] == 'High']
-            if not high_priority.empty:
-                high_priority['created_date'] = pd.to_datetime(high_priority['created_date'], errors='coerce')
-                high_priority['first_response_date'] = pd.to_datetime(high_priority['first_response_date'], errors='coerce')
-                
-                response_time = (high_priority['first_response_date'] - high_priority['created_date']).dt.total_seconds() / 3600
-                # Filter valid response times
-                valid_times = response_time[(response_time >= 0) & (response_time <= 168)]
-                if not valid_times.empty:
-                    sla_compliance = (valid_times <= 4).mean() * 100  # 4-hour SLA for high priority
-                    return sla_compliance
+        _, overall, _ = calculate_sla_metrics(tickets_df, sla_df)
+        if overall['response_measured'].iloc[0] > 0:
+            return float(overall['response_compliance'].iloc[0])
         
         return 0.0
         
     except Exception as e:
         return 0.0
 
+def calculate_sla_compliance_by_priority(tickets_df, sla_df):
+    """Calculate per-ticket SLA breach flags with overall and per-priority compliance"""
+    try:
+        if tickets_df.empty:
+            return pd.DataFrame(), pd.DataFrame(), "No ticket data available"
+        
+        evaluation, overall, by_priority = calculate_sla_metrics(tickets_df, sla_df)
+        return evaluation, by_priority, f"SLA compliance calculated for {len(evaluation):,} tickets"
+        
+    except Exception as e:
+        return pd.DataFrame(), pd.DataFrame(), f"Error calculating SLA compliance: {str(e)}"
+
 # ============================================================================
 # SERVICE EFFICIENCY ANALYTICS
 # ============================================================================
@@ -1003,10 +1018,10 @@ def calculate_service_efficiency(tickets_df, agents_df):
         
         # Agent Efficiency Analysis
         if 'agent_id' in tickets_df.columns and 'agent_id' in agents_df.columns:
-            agent_tickets = tickets_df.groupby('agent_id').agg({
-                'ticket_id': 'count',
-                'status': lambda x: (x == 'Resolved').sum()
-            }).reset_index()
+            agent_tickets = pd.DataFrame({
+                'ticket_id': tickets_df['ticket_id'].notna(),
+                'status': tickets_df['status'] == 'Resolved'
+            }).groupby(tickets_df['agent_id']).sum().reset_index()
             agent_tickets.columns = ['agent_id', 'total_tickets', 'resolved_tickets']
             
             # Merge with agent names
@@ -1147,27 +1162,26 @@ def calculate_agent_performance(tickets_df, agents_df, feedback_df):
         if missing_agent_cols:
             return pd.DataFrame(), f"Missing required agent columns: {missing_agent_cols}"
         
-        # Merge data for analysis
-        agent_performance = tickets_df.merge(
-            agents_df[['agent_id', 'first_name', 'last_name']], 
-            on='agent_id', how='left'
-        )
+        # Only tickets handled by a known, named agent are analysed; grouping on
+        # agent_id alone avoids merging the name columns onto every ticket
+        named_agents = agents_df.dropna(subset=['first_name', 'last_name'])['agent_id']
+        known_agent = tickets_df['agent_id'].isin(named_agents)
+        agent_ids = tickets_df['agent_id'][known_agent]
         
         # Calculate agent metrics
         agent_metrics = []
         
         # Tickets per agent
-        tickets_per_agent = agent_performance.groupby(['agent_id', 'first_name', 'last_name']).size().reset_index(name='ticket_count')
+        tickets_per_agent = agent_ids.value_counts()
         agent_metrics.append(['Total Agents', len(tickets_per_agent)])
-        agent_metrics.append(['Average Tickets per Agent', f"{tickets_per_agent['ticket_count'].mean():.1f}"])
+        agent_metrics.append(['Average Tickets per Agent', f"{tickets_per_agent.mean():.1f}"])
         
-        # Resolution rate by agent
-        if 'status' in agent_performance.columns:
-            agent_resolution = agent_performance.groupby(['agent_id', 'first_name', 'last_name'])['status'].apply(
-                lambda x: (x == 'Resolved').mean() * 100
-            ).reset_index(name='resolution_rate')
+        # Resolution rate by agent as a boolean mean
+        if 'status' in tickets_df.columns:
+            resolved = tickets_df['status'][known_agent] == 'Resolved'
+            agent_resolution = resolved.groupby(agent_ids).mean() * 100
             
-            avg_resolution_rate = agent_resolution['resolution_rate'].mean()
+            avg_resolution_rate = agent_resolution.mean()
             agent_metrics.append(['Average Agent Resolution Rate', f"{avg_resolution_rate:.1f}%"])
         
         # Customer satisfaction by agent (if feedback available)
@@ -1552,13 +1566,15 @@ def calculate_predictive_analytics(tickets_df, customers_df, feedback_df):
         
         # Ticket volume prediction
         if 'created_date' in tickets_df.columns:
-            tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'], errors='coerce')
-            tickets_df = tickets_df.dropna(subset=['created_date'])
+            created = _as_datetime(tickets_df['created_date'])
+            if created.isna().any():
+                tickets_df = tickets_df[created.notna()]
+                created = created.dropna()
             
             if not tickets_df.empty:
-                # Monthly trend analysis
-                tickets_df['month'] = tickets_df['created_date'].dt.strftime('%Y-%m')
-                monthly_volume = tickets_df.groupby('month').size().reset_index(name='ticket_count')
+                # Monthly trend analysis on integer YYYYMM keys (sorted like 'YYYY-MM' labels)
+                month = (created.dt.year * 100 + created.dt.month).rename('month')
+                monthly_volume = month.value_counts(sort=False).sort_index().reset_index(name='ticket_count')
                 
                 if len(monthly_volume) > 1:
                     # Calculate growth rate
@@ -1577,10 +1593,10 @@ def calculate_predictive_analytics(tickets_df, customers_df, feedback_df):
         
         # Customer churn prediction
         if not customers_df.empty and 'last_interaction_date' in customers_df.columns:
-            customers_df['last_interaction_date'] = pd.to_datetime(customers_df['last_interaction_date'], errors='coerce')
+            last_interaction = _as_datetime(customers_df['last_interaction_date'])
             recent_cutoff = datetime.now() - timedelta(days=90)
             
-            inactive_customers = len(customers_df[customers_df['last_interaction_date'] < recent_cutoff])
+            inactive_customers = int((last_interaction < recent_cutoff).sum())
             total_customers = len(customers_df)
             churn_risk = (inactive_customers / total_customers * 100) if total_customers > 0 else 0
             
@@ -1589,12 +1605,11 @@ def calculate_predictive_analytics(tickets_df, customers_df, feedback_df):
         
         # Satisfaction trend prediction
         if not feedback_df.empty and 'submitted_date' in feedback_df.columns and 'rating' in feedback_df.columns:
-            feedback_df['submitted_date'] = pd.to_datetime(feedback_df['submitted_date'], errors='coerce')
-            feedback_df = feedback_df.dropna(subset=['submitted_date'])
+            submitted = _as_datetime(feedback_df['submitted_date'])
             
-            if not feedback_df.empty:
-                feedback_df['month'] = feedback_df['submitted_date'].dt.strftime('%Y-%m')
-                monthly_satisfaction = feedback_df.groupby('month')['rating'].mean().reset_index()
+            if submitted.notna().any():
+                month = (submitted.dt.year * 100 + submitted.dt.month).rename('month')
+                monthly_satisfaction = feedback_df['rating'].groupby(month).mean().reset_index()
                 
                 if len(monthly_satisfaction) > 1:
                     first_month_rating = monthly_satisfaction.iloc[0]['rating']
@@ -2035,6 +2050,26 @@ def analyze_customer_interactions(interactions_df, tickets_df):
         return pd.DataFrame(), f"Error analyzing customer interactions: {str(e)}"
 
 
+def _count_by_customer(mask, customers_df, other_df):
+    """Number of rows of other_df matching mask for each customers_df row."""
+    counts = other_df['customer_id'][mask].value_counts()
+    return counts.reindex(customers_df['customer_id'].to_numpy(), fill_value=0).to_numpy()
+
+def _churn_join_weights(customers_df, tickets_df, feedback_df):
+    """
+    Rows each customer contributes to a customer x ticket x feedback left join.
+
+    Returns:
+        dict: 'ticket_rows' and 'feedback_rows' arrays aligned with customers_df
+        (a customer without matches still yields one row)
+    """
+    all_tickets = np.ones(len(tickets_df), dtype=bool)
+    all_feedback = np.ones(len(feedback_df), dtype=bool)
+    return {
+        'ticket_rows': np.maximum(_count_by_customer(all_tickets, customers_df, tickets_df), 1),
+        'feedback_rows': np.maximum(_count_by_customer(all_feedback, customers_df, feedback_df), 1)
+    }
+
 def predict_customer_churn(customers_df, tickets_df, feedback_df):
     """Predict customer churn based on historical data"""
     try:
@@ -2053,43 +2088,40 @@ def predict_customer_churn(customers_df, tickets_df, feedback_df):
         if missing_customer_cols or missing_ticket_cols or missing_feedback_cols:
             return pd.DataFrame(), f"Missing required columns: Customer: {missing_customer_cols}, Tickets: {missing_ticket_cols}, Feedback: {missing_feedback_cols}"
         metrics = []
-        # Handle column conflicts when merging (both DataFrames have 'status' column)
-        churn_data = customers_df.merge(tickets_df, on='customer_id', how='left', suffixes=('_customer', '_ticket'))
-        churn_data = churn_data.merge(feedback_df, on='customer_id', how='left', suffixes=('', '_feedback'))
-        if churn_data.empty:
-            return pd.DataFrame(), "No matching data between customers, tickets, and feedback for churn prediction"
+        # Rates are weighted exactly like a customer x ticket x feedback left join,
+        # but from per-customer counts so the joined frame is never materialised
+        churn_weights = _churn_join_weights(customers_df, tickets_df, feedback_df)
         total_customers = len(customers_df)
         metrics.append(['Total Customers', total_customers])
-        churned_customers = len(customers_df[customers_df['status'] == 'Churned'])
+        churned = (customers_df['status'] == 'Churned').to_numpy()
+        churned_customers = int(churned.sum())
         churn_rate = (churned_customers / total_customers * 100) if total_customers > 0 else 0
         metrics.append(['Current Churn Rate', f"{churn_rate:.1f}%"])
-        high_risk_customers = len(churn_data[
-            (churn_data['nps_score'] < 6) & 
-            (churn_data['customer_effort_score'] > 4)
-        ])
+        high_risk = (feedback_df['nps_score'] < 6) & (feedback_df['customer_effort_score'] > 4)
+        high_risk_customers = int((churn_weights['ticket_rows'] * _count_by_customer(high_risk, customers_df, feedback_df)).sum())
         metrics.append(['High Risk Customers', high_risk_customers])
-        low_risk_customers = len(churn_data[
-            (churn_data['nps_score'] >= 8) & 
-            (churn_data['customer_effort_score'] <= 3)
-        ])
+        low_risk = (feedback_df['nps_score'] >= 8) & (feedback_df['customer_effort_score'] <= 3)
+        low_risk_customers = int((churn_weights['ticket_rows'] * _count_by_customer(low_risk, customers_df, feedback_df)).sum())
         metrics.append(['Low Risk Customers', low_risk_customers])
-        if 'customer_segment' in churn_data.columns:
-            # Use the customer status column (from customers_df)
-            customer_status_column = 'status_customer' if 'status_customer' in churn_data.columns else 'status'
-            segment_churn = churn_data.groupby('customer_segment')[customer_status_column].apply(
-                lambda x: (x == 'Churned').sum() / len(x) * 100
-            ).reset_index()
+        if 'customer_segment' in customers_df.columns:
+            # Weighted boolean mean of the customer status per segment
+            joined_rows = churn_weights['ticket_rows'] * churn_weights['feedback_rows']
+            weights = pd.DataFrame({'churned': joined_rows * churned, 'rows': joined_rows})
+            segment_totals = weights.groupby(customers_df['customer_segment'].to_numpy()).sum()
+            segment_churn = (segment_totals['churned'] / segment_totals['rows'] * 100).reset_index()
             segment_churn.columns = ['Customer Segment', 'Churn Rate (%)']
             segment_churn = segment_churn.sort_values('Churn Rate (%)', ascending=False)
             if not segment_churn.empty:
                 highest_churn_segment = segment_churn.iloc[0]
                 metrics.append(['Highest Churn Segment', f"{highest_churn_segment['Customer Segment']} ({highest_churn_segment['Churn Rate (%)']:.1f}%)"])
-        if 'priority' in churn_data.columns:
-            # Use the customer status column (from customers_df)
-            customer_status_column = 'status_customer' if 'status_customer' in churn_data.columns else 'status'
-            priority_churn = churn_data.groupby('priority')[customer_status_column].apply(
-                lambda x: (x == 'Churned').sum() / len(x) * 100
-            ).reset_index()
+        if 'priority' in tickets_df.columns:
+            # Customer x priority ticket counts, weighted by each customer's feedback rows
+            priority_counts = tickets_df.groupby(['customer_id', 'priority']).size().unstack(fill_value=0)
+            priority_counts = priority_counts.reindex(customers_df['customer_id'].to_numpy(), fill_value=0)
+            priority_rows = priority_counts.to_numpy() * churn_weights['feedback_rows'][:, None]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                priority_rates = churned @ priority_rows / priority_rows.sum(axis=0) * 100
+            priority_churn = pd.Series(priority_rates, index=priority_counts.columns).dropna().reset_index()
             priority_churn.columns = ['Ticket Priority', 'Churn Rate (%)']
             priority_churn = priority_churn.sort_values('Churn Rate (%)', ascending=False)
             if not priority_churn.empty:
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Customer Churn Model
+====================
+
+Churn model for the customer service dashboard:
+- Per-customer recency, frequency, ticket and CSAT features aggregated from
+  tickets, interactions and feedback with one groupby per table
+- A gradient-boosted classifier trained once per dataset version on customers
+  whose status marks them as retained or churned
+- Batch scoring of every customer, cached with the fitted model so pages
+  render from stored scores
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cs_fact_cube import table_version
+
+try:
+    from sklearn.ensemble import HistGradientBoostingClassifier
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
+    from sklearn.model_selection import train_test_split
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Customer status values used as training labels (case-insensitive)
+CHURNED_STATUSES = ['churned', 'inactive', 'cancelled', 'canceled', 'lost']
+RETAINED_STATUSES = ['active']
+
+HIGH_PRIORITIES = ['high', 'critical', 'urgent']
+CLOSED_TICKET_STATUSES = ['resolved', 'closed']
+
+RECENT_WINDOW_DAYS = 90
+MIN_TRAINING_CUSTOMERS = 20
+HOLDOUT_SHARE = 0.25
+
+# Churn probability thresholds for the risk levels
+HIGH_RISK_PROBABILITY = 0.6
+MEDIUM_RISK_PROBABILITY = 0.3
+RISK_LEVELS = ['Low', 'Medium', 'High']
+
+MODEL_PARAMS = {'max_iter': 200, 'learning_rate': 0.1, 'max_leaf_nodes': 15, 'random_state': 42}
+
+MAX_CACHED_MODELS = 4
+SESSION_CHURN_KEY = 'cs_churn_scores'
+
+# Fitted models and scores shared across sessions, keyed by feature fingerprint
+_model_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+# ============================================================================
+# FEATURES
+# ============================================================================
+
+def _as_datetime(values):
+    """Return a datetime Series, parsing only when the column is not already datetime"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce')
+
+
+def _normalized(values):
+    """Lower-cased, stripped string values (evaluated once per distinct value)."""
+    codes, uniques = pd.factorize(values)
+    normalized = np.append(uniques.astype(str).str.strip().str.lower().to_numpy(dtype=object), '')
+    return normalized[codes]
+
+
+def _reference_date(*dates):
+    """Latest timestamp across the given date Series, so features do not drift with the clock."""
+    latest = [d.max() for d in dates if d is not None and d.notna().any()]
+    return max(latest) if latest else pd.Timestamp(datetime.now())
+
+
+def _aggregate_by_customer(table_df, measures, aggregations, customer_ids):
+    """
+    Aggregate per-row measures of a table to one row per customer.
+
+    Args:
+        table_df (pd.DataFrame): Source table with a customer_id column
+        measures (dict): Measure name -> per-row Series or array
+        aggregations (dict): Feature name -> (measure name, pandas aggregation)
+        customer_ids (pd.Index): Customers to report, in order
+
+    Returns:
+        pd.DataFrame: Features indexed by customer_ids (NaN where a customer has no rows)
+    """
+    if table_df is None or table_df.empty or 'customer_id' not in table_df.columns:
+        return pd.DataFrame(index=customer_ids, columns=list(aggregations), dtype=float)
+    frame = pd.DataFrame(measures, index=table_df.index)
+    spec = {feature: pd.NamedAgg(column=measure, aggfunc=func) for feature, (measure, func) in aggregations.items()}
+    aggregated = frame.groupby(table_df['customer_id'].to_numpy()).agg(**spec)
+    return aggregated.reindex(customer_ids).astype(float)
+
+
+def build_churn_features(customers_df, tickets_df, interactions_df=None, feedback_df=None, as_of=None):
+    """
+    Build the per-customer churn feature matrix.
+
+    Args:
+        customers_df (pd.DataFrame): Customers sheet
+        tickets_df (pd.DataFrame): Tickets sheet
+        interactions_df (pd.DataFrame): Interactions sheet (optional)
+        feedback_df (pd.DataFrame): Feedback sheet (optional)
+        as_of (pd.Timestamp): Reference date for recency; defaults to the latest date in the data
+
+    Returns:
+        pd.DataFrame: Numeric features indexed by customer_id (first row per customer)
+    """
+    customers = customers_df.drop_duplicates('customer_id')
+    customer_ids = pd.Index(customers['customer_id'], name='customer_id')
+
+    ticket_dates = _as_datetime(tickets_df['created_date']) if 'created_date' in tickets_df.columns else None
+    interaction_dates = (_as_datetime(interactions_df['start_time'])
+                         if interactions_df is not None and 'start_time' in interactions_df.columns else None)
+    feedback_dates = (_as_datetime(feedback_df['submitted_date'])
+                      if feedback_df is not None and 'submitted_date' in feedback_df.columns else None)
+    last_contact = (_as_datetime(customers['last_interaction_date'])
+                    if 'last_interaction_date' in customers.columns else None)
+    if as_of is None:
+        as_of = _reference_date(ticket_dates, interaction_dates, feedback_dates, last_contact)
+
+    def days_since(dates):
+        return (as_of - dates).dt.total_seconds() / 86400
+
+    features = pd.DataFrame(index=customer_ids)
+
+    # Customer attributes
+    if 'acquisition_date' in customers.columns:
+        features['tenure_days'] = days_since(_as_datetime(customers['acquisition_date'])).to_numpy()
+    if last_contact is not None:
+        features['days_since_last_contact'] = days_since(last_contact).to_numpy()
+    for column in ('lifetime_value', 'total_orders'):
+        if column in customers.columns:
+            features[column] = pd.to_numeric(customers[column], errors='coerce').to_numpy()
+
+    # Ticket recency, frequency and service experience
+    n_tickets = len(tickets_df)
+    ticket_measures = {'one': np.ones(n_tickets)}
+    ticket_aggregations = {'ticket_count': ('one', 'sum')}
+    if ticket_dates is not None:
+        ticket_measures['age_days'] = days_since(ticket_dates)
+        ticket_measures['recent'] = (ticket_measures['age_days'] <= RECENT_WINDOW_DAYS).astype(float)
+        ticket_aggregations['days_since_last_ticket'] = ('age_days', 'min')
+        ticket_aggregations['recent_tickets'] = ('recent', 'sum')
+    if 'priority' in tickets_df.columns:
+        ticket_measures['high_priority'] = np.isin(_normalized(tickets_df['priority']), HIGH_PRIORITIES).astype(float)
+        ticket_aggregations['high_priority_share'] = ('high_priority', 'mean')
+    if 'status' in tickets_df.columns:
+        status = _normalized(tickets_df['status'])
+        ticket_measures['open'] = (~np.isin(status, CLOSED_TICKET_STATUSES)).astype(float)
+        ticket_measures['escalated'] = (status == 'escalated').astype(float)
+        ticket_aggregations['open_tickets'] = ('open', 'sum')
+        ticket_aggregations['escalation_rate'] = ('escalated', 'mean')
+    if ticket_dates is not None and 'resolved_date' in tickets_df.columns:
+        resolution_hours = (_as_datetime(tickets_df['resolved_date']) - ticket_dates).dt.total_seconds() / 3600
+        ticket_measures['resolution_hours'] = resolution_hours.where(resolution_hours >= 0)
+        ticket_aggregations['avg_resolution_hours'] = ('resolution_hours', 'mean')
+    if 'satisfaction_score' in tickets_df.columns:
+        ticket_measures['ticket_satisfaction'] = pd.to_numeric(tickets_df['satisfaction_score'], errors='coerce')
+        ticket_aggregations['avg_ticket_satisfaction'] = ('ticket_satisfaction', 'mean')
+    features = features.join(_aggregate_by_customer(tickets_df, ticket_measures, ticket_aggregations, customer_ids))
+    features['ticket_count'] = features['ticket_count'].fillna(0)
+
+    # Interaction frequency and recency
+    if interactions_df is not None and not interactions_df.empty:
+        interaction_measures = {'one': np.ones(len(interactions_df))}
+        interaction_aggregations = {'interaction_count': ('one', 'sum')}
+        if interaction_dates is not None:
+            interaction_measures['age_days'] = days_since(interaction_dates)
+            interaction_aggregations['days_since_last_interaction'] = ('age_days', 'min')
+        if 'duration_minutes' in interactions_df.columns:
+            interaction_measures['minutes'] = pd.to_numeric(interactions_df['duration_minutes'], errors='coerce')
+            interaction_aggregations['avg_interaction_minutes'] = ('minutes', 'mean')
+        features = features.join(_aggregate_by_customer(interactions_df, interaction_measures,
+                                                        interaction_aggregations, customer_ids))
+        features['interaction_count'] = features['interaction_count'].fillna(0)
+
+    # CSAT / NPS / CES
+    if feedback_df is not None and not feedback_df.empty:
+        feedback_measures = {'one': np.ones(len(feedback_df))}
+        feedback_aggregations = {'feedback_count': ('one', 'sum')}
+        for source, target in (('rating', 'avg_csat'), ('nps_score', 'avg_nps'), ('customer_effort_score', 'avg_ces')):
+            if source in feedback_df.columns:
+                feedback_measures[source] = pd.to_numeric(feedback_df[source], errors='coerce')
+                feedback_aggregations[target] = (source, 'mean')
+        if 'nps_score' in feedback_measures:
+            nps = feedback_measures['nps_score']
+            feedback_measures['detractor'] = (nps <= 6).astype(float).where(nps.notna())
+            feedback_aggregations['detractor_share'] = ('detractor', 'mean')
+        features = features.join(_aggregate_by_customer(feedback_df, feedback_measures,
+                                                        feedback_aggregations, customer_ids))
+        features['feedback_count'] = features['feedback_count'].fillna(0)
+
+    # Combined recency and frequency
+    recency_columns = [col for col in ('days_since_last_ticket', 'days_since_last_interaction', 'days_since_last_contact')
+                       if col in features.columns]
+    if recency_columns:
+        features['days_since_last_activity'] = features[recency_columns].min(axis=1)
+    if 'tenure_days' in features.columns:
+        tenure_months = (features['tenure_days'] / 30.44).clip(lower=1)
+        features['tickets_per_month'] = features['ticket_count'] / tenure_months
+
+    return features.astype(np.float64)
+
+
+def churn_labels(customers_df):
+    """
+    Training labels from the customer status.
+
+    Returns:
+        pd.Series: 1.0 churned, 0.0 retained, NaN for other statuses (e.g. prospects),
+        indexed by customer_id
+    """
+    customers = customers_df.drop_duplicates('customer_id')
+    labels = np.full(len(customers), np.nan)
+    if 'status' in customers.columns:
+        status = _normalized(customers['status'])
+        labels[np.isin(status, RETAINED_STATUSES)] = 0.0
+        labels[np.isin(status, CHURNED_STATUSES)] = 1.0
+    return pd.Series(labels, index=pd.Index(customers['customer_id'], name='customer_id'), name='churned')
+
+# ============================================================================
+# MODEL
+# ============================================================================
+
+class ChurnModel:
+    """
+    Fitted churn classifier with its feature layout and holdout metrics.
+
+    Attributes:
+        estimator: Fitted classifier exposing predict_proba
+        feature_names (list): Feature columns in training order
+        metrics (dict): Holdout accuracy, precision, recall, f1 and roc_auc (percent)
+        n_training (int): Labelled customers used for training
+        fingerprint (str): Dataset fingerprint the model was trained on
+    """
+
+    def __init__(self, estimator, feature_names, metrics, n_training, fingerprint):
+        self.estimator = estimator
+        self.feature_names = feature_names
+        self.metrics = metrics
+        self.n_training = n_training
+        self.fingerprint = fingerprint
+        self.trained_at = datetime.now()
+
+    def predict_proba(self, features):
+        """Churn probability for every row of a feature matrix."""
+        matrix = features.reindex(columns=self.feature_names).to_numpy(dtype=np.float64)
+        return self.estimator.predict_proba(matrix)[:, 1]
+
+
+def dataset_fingerprint(features, labels):
+    """Content hash of the feature matrix and labels, used as the dataset version."""
+    digest = hashlib.sha1()
+    digest.update('|'.join(map(str, features.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(features, index=True).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(labels, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def train_churn_model(features, labels, fingerprint=None):
+    """
+    Train the churn classifier on labelled customers.
+
+    A stratified holdout is kept aside for the reported metrics; the gradient
+    boosted trees handle missing features natively, so no imputation is needed.
+
+    Args:
+        features (pd.DataFrame): Output of build_churn_features
+        labels (pd.Series): Output of churn_labels, aligned on customer_id
+        fingerprint (str): Dataset fingerprint stored on the model
+
+    Returns:
+        tuple: (ChurnModel or None, message)
+    """
+    if not SKLEARN_AVAILABLE:
+        return None, "scikit-learn is required for churn modelling"
+
+    labels = labels.reindex(features.index)
+    labelled = labels.notna().to_numpy()
+    X = features.to_numpy(dtype=np.float64)[labelled]
+    y = labels.to_numpy()[labelled].astype(int)
+    class_counts = np.bincount(y, minlength=2)
+    if len(y) < MIN_TRAINING_CUSTOMERS or class_counts.min() < 2:
+        return None, (f"Not enough labelled customers to train a churn model "
+                      f"({class_counts[0]} retained, {class_counts[1]} churned)")
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=HOLDOUT_SHARE, stratify=y, random_state=MODEL_PARAMS['random_state']
+    )
+    estimator = HistGradientBoostingClassifier(**MODEL_PARAMS).fit(X_train, y_train)
+
+    probabilities = estimator.predict_proba(X_test)[:, 1]
+    predictions = (probabilities >= 0.5).astype(int)
+    metrics = {
+        'accuracy': accuracy_score(y_test, predictions) * 100,
+        'precision': precision_score(y_test, predictions, zero_division=0) * 100,
+        'recall': recall_score(y_test, predictions, zero_division=0) * 100,
+        'f1': f1_score(y_test, predictions, zero_division=0) * 100,
+        'roc_auc': roc_auc_score(y_test, probabilities) * 100 if len(np.unique(y_test)) > 1 else np.nan
+    }
+    model = ChurnModel(estimator, list(features.columns), metrics, len(y_train), fingerprint)
+    return model, f"Churn model trained on {len(y_train)} customers (holdout accuracy {metrics['accuracy']:.1f}%)"
+
+
+def score_customers(model, features, labels=None):
+    """
+    Batch-score the customers who have not churned yet.
+
+    Args:
+        model (ChurnModel): Fitted churn model
+        features (pd.DataFrame): Output of build_churn_features
+        labels (pd.Series): Output of churn_labels; customers labelled churned
+            (a CHURNED_STATUSES status) are left out
+
+    Returns:
+        pd.DataFrame: customer_id, churn_probability and risk_level per active customer
+    """
+    if labels is not None:
+        churned = labels.reindex(features.index).to_numpy() == 1.0
+        features = features[~churned]
+    probability = model.predict_proba(features)
+    level_codes = (probability >= MEDIUM_RISK_PROBABILITY).astype(np.int8) + (probability >= HIGH_RISK_PROBABILITY)
+    return pd.DataFrame({
+        'customer_id': features.index.to_numpy(),
+        'churn_probability': probability,
+        'risk_level': pd.Categorical.from_codes(level_codes, categories=RISK_LEVELS, ordered=True)
+    })
+
+
+def run_churn_pipeline(customers_df, tickets_df, interactions_df=None, feedback_df=None):
+    """
+    Features, model and scores for a dataset, reusing cached results for a known version.
+
+    Returns:
+        tuple: (scores DataFrame, ChurnModel or None, message)
+    """
+    if customers_df is None or customers_df.empty or 'customer_id' not in customers_df.columns:
+        return pd.DataFrame(), None, "No customer data available for churn modelling"
+    if tickets_df is None:
+        tickets_df = pd.DataFrame()
+
+    features = build_churn_features(customers_df, tickets_df, interactions_df, feedback_df)
+    labels = churn_labels(customers_df)
+    fingerprint = dataset_fingerprint(features, labels)
+
+    with _cache_lock:
+        cached = _model_cache.get(fingerprint)
+        if cached is not None:
+            _model_cache.move_to_end(fingerprint)
+            return cached['scores'], cached['model'], cached['message']
+
+    model, message = train_churn_model(features, labels, fingerprint)
+    scores = score_customers(model, features, labels) if model is not None else pd.DataFrame()
+
+    with _cache_lock:
+        _model_cache[fingerprint] = {'model': model, 'scores': scores, 'message': message}
+        while len(_model_cache) > MAX_CACHED_MODELS:
+            _model_cache.popitem(last=False)
+    return scores, model, message
+
+
+def summarize_churn_scores(scores):
+    """
+    Headline numbers from the per-customer scores.
+
+    Customers already churned are not part of the scores (see
+    score_customers), so the rate and counts cover active customers only.
+
+    Returns:
+        dict: predicted_churn_rate (mean probability, percent), at_risk_customers
+        (medium or high risk) and a count per risk level
+    """
+    if scores is None or scores.empty:
+        return {'predicted_churn_rate': 0.0, 'at_risk_customers': 0,
+                'risk_counts': pd.Series(0, index=RISK_LEVELS)}
+    risk_counts = scores['risk_level'].value_counts().reindex(RISK_LEVELS, fill_value=0)
+    return {
+        'predicted_churn_rate': float(scores['churn_probability'].mean() * 100),
+        'at_risk_customers': int(risk_counts['Medium'] + risk_counts['High']),
+        'risk_counts': risk_counts
+    }
+
+# ============================================================================
+# SESSION ACCESS
+# ============================================================================
+
+def churn_scores(customers_df, tickets_df, interactions_df=None, feedback_df=None):
+    """
+    Churn scores for the given tables, recomputed only when one of them changes.
+
+    Features, fingerprint and model are only built when the table versions
+    differ from the last call in this session.
+
+    Returns:
+        tuple: (scores DataFrame, ChurnModel or None, message)
+    """
+    version = tuple(table_version(df) for df in (customers_df, tickets_df, interactions_df, feedback_df))
+
+    cached = st.session_state.get(SESSION_CHURN_KEY)
+    if cached is None or cached['version'] != version:
+        scores, model, message = run_churn_pipeline(customers_df, tickets_df, interactions_df, feedback_df)
+        cached = {'version': version, 'scores': scores, 'model': model, 'message': message}
+        st.session_state[SESSION_CHURN_KEY] = cached
+    return cached['scores'], cached['model'], cached['message']
+
+
+def get_churn_scores():
+    """
+    Churn scores for the current session data, recomputed only when a source table changes.
+
+    Returns:
+        tuple: (scores DataFrame, ChurnModel or None, message)
+    """
+    tables = [st.session_state.get(name, pd.DataFrame())
+              for name in ('customers', 'tickets', 'interactions', 'feedback')]
+    return churn_scores(*tables)
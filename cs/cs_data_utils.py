@@ -5,6 +5,9 @@ import io
 import base64
 from datetime import datetime, timedelta
 
+from cs_ingest import ingest_workbook, clean_table, IngestionError, REQUIRED_COLUMNS, SHEET_SCHEMAS
+from cs_fact_cube import clear_tables, invalidate_fact_cube, set_table
+
 def display_dataframe_with_index_1(df, **kwargs):
     """Display dataframe with index starting from 1"""
     if not df.empty:
@@ -110,79 +113,66 @@ def create_template_for_download():
     output.seek(0)
     return output.getvalue()
 
-def process_uploaded_excel(uploaded_file):
-    """Process uploaded Excel file and load data into session state"""
+def process_uploaded_excel(uploaded_file, progress=None):
+    """
+    Validate and load an uploaded workbook into session state.
+    
+    Sheet headers are checked before any rows are read and rows are typed
+    chunk by chunk (see cs_ingest), so a malformed upload fails quickly and
+    session state is only replaced once every sheet has loaded.
+    
+    Args:
+        uploaded_file: .xlsx/.xls workbook or .zip of per-sheet CSV/Parquet files
+        progress (callable): Optional progress(table, rows_read, total_rows, done)
+    
+    Returns:
+        tuple: (success, message)
+    """
     try:
-        # Read all sheets from the Excel file
-        excel_data = pd.read_excel(uploaded_file, sheet_name=None)
-        
-        # Debug: Print what we found
-        print(f"🔍 Debug: Found sheets: {list(excel_data.keys())}")
-        
-        # Check if all required sheets are present
-        required_sheets = ['Customers', 'Tickets', 'Agents', 'Interactions', 'Feedback', 'SLA', 'Knowledge_Base', 'Training']
-        missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_data.keys()]
-        
-        if missing_sheets:
-            return False, f"Missing required sheets: {', '.join(missing_sheets)}"
-        
-        # Load data into session state with verification
-        st.session_state.customers = excel_data['Customers'].copy()
-        st.session_state.tickets = excel_data['Tickets'].copy()
-        st.session_state.agents = excel_data['Agents'].copy()
-        st.session_state.interactions = excel_data['Interactions'].copy()
-        st.session_state.feedback = excel_data['Feedback'].copy()
-        st.session_state.sla = excel_data['SLA'].copy()
-        st.session_state.knowledge_base = excel_data['Knowledge_Base'].copy()
-        st.session_state.training = excel_data['Training'].copy()
-        
-        # Verify data was loaded correctly
-        print(f"🔍 Debug: Session state after loading:")
-        print(f"   Customers: {len(st.session_state.customers)} rows")
-        print(f"   Tickets: {len(st.session_state.tickets)} rows")
-        print(f"   Agents: {len(st.session_state.agents)} rows")
-        print(f"   Feedback: {len(st.session_state.feedback)} rows")
-        print(f"   Feedback columns: {list(st.session_state.feedback.columns)}")
-        
-        # Double-check critical columns exist
-        if 'customer_effort_score' not in st.session_state.feedback.columns:
-            return False, "Feedback data missing 'customer_effort_score' column"
-        if 'nps_score' not in st.session_state.feedback.columns:
-            return False, "Feedback data missing 'nps_score' column"
-        
-        return True, f"All customer service data loaded successfully! Loaded {len(st.session_state.customers)} customers, {len(st.session_state.tickets)} tickets, {len(st.session_state.agents)} agents, {len(st.session_state.feedback)} feedback records, and more..."
-        
+        tables = ingest_workbook(uploaded_file, progress=progress)
+    except IngestionError as e:
+        return False, str(e)
     except Exception as e:
-        print(f"🔍 Debug: Error in process_uploaded_excel: {str(e)}")
         return False, f"Error reading Excel file: {str(e)}"
+    
+    for table, df in tables.items():
+        set_table(table, df)
+    invalidate_fact_cube()
+    
+    return True, f"All customer service data loaded successfully! Loaded {len(tables['customers'])} customers, {len(tables['tickets'])} tickets, {len(tables['agents'])} agents, {len(tables['feedback'])} feedback records, and more..."
+
+def create_ingestion_progress():
+    """Streamlit progress callback for process_uploaded_excel with one bar per sheet"""
+    bars = {}
+    
+    def progress(table, rows_read, total_rows, done):
+        label = SHEET_SCHEMAS[table]['sheet']
+        if table not in bars:
+            bars[table] = st.progress(0.0, text=f"{label}: reading...")
+        if done:
+            bars[table].progress(1.0, text=f"{label}: {rows_read:,} rows")
+        elif total_rows:
+            bars[table].progress(min(rows_read / total_rows, 1.0), text=f"{label}: {rows_read:,} / {total_rows:,} rows")
+        else:
+            bars[table].progress(0.5, text=f"{label}: {rows_read:,} rows")
+    
+    return progress
 
 def load_sample_dataset(file_path):
     """Load sample dataset from Excel file for testing purposes"""
     try:
-        # Read all sheets from the sample Excel file
-        excel_data = pd.read_excel(file_path, sheet_name=None)
-        
-        # Check if all required sheets are present
-        required_sheets = ['Customers', 'Tickets', 'Agents', 'Interactions', 'Feedback', 'SLA', 'Knowledge_Base', 'Training']
-        missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_data.keys()]
-        
-        if missing_sheets:
-            return False, f"Missing required sheets in sample dataset: {', '.join(missing_sheets)}"
-        
-        # Load data into session state
-        st.session_state.customers = excel_data['Customers']
-        st.session_state.tickets = excel_data['Tickets']
-        st.session_state.agents = excel_data['Agents']
-        st.session_state.interactions = excel_data['Interactions']
-        st.session_state.feedback = excel_data['Feedback']
-        st.session_state.sla = excel_data['SLA']
-        st.session_state.knowledge_base = excel_data['Knowledge_Base']
-        st.session_state.training = excel_data['Training']
-        
-        return True, f"Sample dataset loaded successfully! Loaded {len(st.session_state.customers)} customers, {len(st.session_state.tickets)} tickets, {len(st.session_state.agents)} agents, {len(st.session_state.interactions)} interactions, {len(st.session_state.feedback)} feedback records, {len(st.session_state.sla)} SLA records, {len(st.session_state.knowledge_base)} knowledge base articles, and {len(st.session_state.training)} training records."
-        
+        tables = ingest_workbook(file_path)
+    except IngestionError as e:
+        return False, f"Sample dataset does not match the expected schema: {str(e)}"
     except Exception as e:
         return False, f"Error loading sample dataset: {str(e)}"
+    
+    # Load data into session state
+    for table, df in tables.items():
+        set_table(table, df)
+    invalidate_fact_cube()
+    
+    return True, f"Sample dataset loaded successfully! Loaded {len(st.session_state.customers)} customers, {len(st.session_state.tickets)} tickets, {len(st.session_state.agents)} agents, {len(st.session_state.interactions)} interactions, {len(st.session_state.feedback)} feedback records, {len(st.session_state.sla)} SLA records, {len(st.session_state.knowledge_base)} knowledge base articles, and {len(st.session_state.training)} training records."
 
 def export_data_to_excel():
     """Exports all customer service data from session state to a single Excel file."""
@@ -206,6 +196,10 @@ def export_data_to_excel():
         
         st.success("Customer service data exported successfully as 'customer_service_data_export.xlsx'")
 
+def clear_session_data():
+    """Replace every customer service table with an empty one."""
+    clear_tables()
+
 def initialize_session_state():
     """Initialize session state variables for customer service data"""
     if 'customers' not in st.session_state:
@@ -230,16 +224,7 @@ def validate_data_integrity():
     validation_results = []
     
     # Check for required columns in each dataset
-    required_columns = {
-        'customers': ['customer_id', 'customer_name'],
-        'tickets': ['ticket_id', 'customer_id', 'status'],
-        'agents': ['agent_id', 'first_name', 'last_name'],
-        'interactions': ['interaction_id', 'ticket_id'],
-        'feedback': ['feedback_id', 'ticket_id', 'rating'],
-        'sla': ['sla_id', 'ticket_type', 'priority'],
-        'knowledge_base': ['kb_id', 'title', 'content'],
-        'training': ['training_id', 'agent_id', 'training_type']
-    }
+    required_columns = REQUIRED_COLUMNS
     
     for dataset_name, required_cols in required_columns.items():
         if dataset_name in st.session_state and not st.session_state[dataset_name].empty:
@@ -289,69 +274,24 @@ def get_data_summary():
     return summary
 
 def clean_and_prepare_data():
-    """Clean and prepare customer service data for analysis"""
+    """
+    Clean and prepare customer service data for analysis.
+    
+    Each loaded table is cleaned chunk by chunk with the ingestion schema:
+    dates and numbers typed, names stripped, ticket status and feedback
+    sentiment lower-cased, exact duplicate rows dropped and missing
+    interaction durations derived from start/end times. Session tables are
+    replaced with cleaned copies, never modified in place.
+    """
     try:
-        # Clean customers data
-        if not st.session_state.customers.empty:
-            # Remove duplicates
-            st.session_state.customers = st.session_state.customers.drop_duplicates()
-            
-            # Clean customer names
-            if 'customer_name' in st.session_state.customers.columns:
-                st.session_state.customers['customer_name'] = st.session_state.customers['customer_name'].str.strip()
-            
-            # Convert dates
-            date_columns = ['acquisition_date', 'last_interaction_date']
-            for col in date_columns:
-                if col in st.session_state.customers.columns:
-                    st.session_state.customers[col] = pd.to_datetime(st.session_state.customers[col], errors='coerce')
-        
-        # Clean tickets data
-        if not st.session_state.tickets.empty:
-            # Remove duplicates
-            st.session_state.tickets = st.session_state.tickets.drop_duplicates()
-            
-            # Convert dates
-            date_columns = ['created_date', 'first_response_date', 'resolved_date', 'escalated_date']
-            for col in date_columns:
-                if col in st.session_state.tickets.columns:
-                    st.session_state.tickets[col] = pd.to_datetime(st.session_state.tickets[col], errors='coerce')
-            
-            # Clean status values
-            if 'status' in st.session_state.tickets.columns:
-                st.session_state.tickets['status'] = st.session_state.tickets['status'].str.lower().str.strip()
-        
-        # Clean interactions data
-        if not st.session_state.interactions.empty:
-            # Remove duplicates
-            st.session_state.interactions = st.session_state.interactions.drop_duplicates()
-            
-            # Convert dates
-            date_columns = ['start_time', 'end_time']
-            for col in date_columns:
-                if col in st.session_state.interactions.columns:
-                    st.session_state.interactions[col] = pd.to_datetime(st.session_state.interactions[col], errors='coerce')
-            
-            # Calculate duration if not present
-            if 'start_time' in st.session_state.interactions.columns and 'end_time' in st.session_state.interactions.columns:
-                st.session_state.interactions['duration_minutes'] = (
-                    st.session_state.interactions['end_time'] - st.session_state.interactions['start_time']
-                ).dt.total_seconds() / 60
+        cleaned = {}
+        for table in SHEET_SCHEMAS:
+            if table in st.session_state and not st.session_state[table].empty:
+                cleaned[table] = clean_table(table, st.session_state[table])
         
-        # Clean feedback data
-        if not st.session_state.feedback.empty:
-            # Remove duplicates
-            st.session_state.feedback = st.session_state.feedback.drop_duplicates()
-            
-            # Convert dates
-            date_columns = ['submitted_date', 'response_date']
-            for col in date_columns:
-                if col in st.session_state.feedback.columns:
-                    st.session_state.feedback[col] = pd.to_datetime(st.session_state.feedback[col], errors='coerce')
-            
-            # Clean sentiment values
-            if 'sentiment' in st.session_state.feedback.columns:
-                st.session_state.feedback['sentiment'] = st.session_state.feedback['sentiment'].str.lower().str.strip()
+        for table, df in cleaned.items():
+            set_table(table, df)
+        invalidate_fact_cube()
         
         return True, "Data cleaned and prepared successfully"
         
@@ -484,14 +424,15 @@ def generate_sample_data():
         }
         
         # Create DataFrames
-        st.session_state.customers = pd.DataFrame(customers_data)
-        st.session_state.agents = pd.DataFrame(agents_data)
-        st.session_state.tickets = pd.DataFrame(tickets_data)
-        st.session_state.interactions = pd.DataFrame(interactions_data)
-        st.session_state.feedback = pd.DataFrame(feedback_data)
-        st.session_state.sla = pd.DataFrame(sla_data)
-        st.session_state.knowledge_base = pd.DataFrame(kb_data)
-        st.session_state.training = pd.DataFrame(training_data)
+        set_table('customers', pd.DataFrame(customers_data))
+        set_table('agents', pd.DataFrame(agents_data))
+        set_table('tickets', pd.DataFrame(tickets_data))
+        set_table('interactions', pd.DataFrame(interactions_data))
+        set_table('feedback', pd.DataFrame(feedback_data))
+        set_table('sla', pd.DataFrame(sla_data))
+        set_table('knowledge_base', pd.DataFrame(kb_data))
+        set_table('training', pd.DataFrame(training_data))
+        invalidate_fact_cube()
         
         return True, "Sample data generated successfully"
         
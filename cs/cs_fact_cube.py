@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Customer Service Analytics Cube
+===============================
+
+Typed ticket and feedback fact tables built once per dataset version and
+shared read-only by every CS page:
+- Tickets with parsed dates, response/resolution hours, resolution and escalation
+  flags, calendar keys and joined agent/customer dimensions
+- Feedback with numeric CSAT/NPS/CES scores and month keys
+- Daily x agent x channel x priority counters that roll up to any coarser grain
+
+Pages must treat the cube's frames as read-only: derive local Series or
+filtered views instead of assigning new columns.
+"""
+
+import itertools
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TICKET_DATE_COLUMNS = ['created_date', 'first_response_date', 'resolved_date', 'escalated_date']
+FEEDBACK_DATE_COLUMNS = ['submitted_date', 'response_date']
+
+# Joined dimension attributes: source column -> cube column
+AGENT_DIMENSIONS = {'team': 'agent_team', 'department': 'agent_department', 'specialization': 'agent_specialization'}
+CUSTOMER_DIMENSIONS = {'customer_segment': 'customer_segment', 'region': 'customer_region',
+                       'industry': 'customer_industry'}
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Grain of the pre-aggregated counters
+COUNTER_DIMENSIONS = ['created_day', 'agent_id', 'channel', 'priority']
+
+# Feedback score columns and their valid ranges
+FEEDBACK_SCORES = {
+    'rating': ('csat_score', 1, 5),
+    'nps_score': ('nps_value', 0, 10),
+    'customer_effort_score': ('ces_score', 1, 7)
+}
+
+MAX_RESPONSE_HOURS = 168   # 1 week
+MAX_RESOLUTION_HOURS = 720  # 30 days
+
+SESSION_CUBE_KEY = 'cs_fact_cube'
+
+CS_TABLES = ['customers', 'tickets', 'agents', 'interactions', 'feedback', 'sla', 'knowledge_base', 'training']
+
+# id(frame) -> (weak reference, version token)
+_table_registry = {}
+_versions = itertools.count(1)
+_registry_lock = threading.RLock()
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _forget(frame_id, reference):
+    with _registry_lock:
+        entry = _table_registry.get(frame_id)
+        if entry is not None and entry[0] is reference:
+            del _table_registry[frame_id]
+
+
+def register_table(df):
+    """
+    Give a table a fresh version token.
+
+    Returns:
+        int: The new token
+    """
+    frame_id = id(df)
+    reference = weakref.ref(df, lambda ref, frame_id=frame_id: _forget(frame_id, ref))
+    with _registry_lock:
+        token = next(_versions)
+        _table_registry[frame_id] = (reference, token)
+    return token
+
+
+def table_version(df):
+    """
+    Cheap version token for a session table.
+
+    Each table object gets a token from a counter the first time it is seen
+    (or when set_table / bump_table_version register it). Tokens are held
+    against a weak reference, so a new frame that reuses a freed frame's
+    id gets a new token rather than the old one. Shape and dtypes are
+    included to catch columns added in place. Tables without rows are keyed
+    by their columns alone, so a missing table read as a fresh empty frame
+    keeps the same version across reruns.
+    """
+    if df is None:
+        return None
+    if len(df) == 0:
+        return ('empty', tuple(map(str, df.columns)), tuple(map(str, df.dtypes)))
+    with _registry_lock:
+        entry = _table_registry.get(id(df))
+        # A recycled id belongs to a new object; its weak reference is dead
+        token = entry[1] if entry is not None and entry[0]() is df else register_table(df)
+    return (token, df.shape, tuple(map(str, df.dtypes)))
+
+
+def set_table(name, df):
+    """Store a session table under name with a fresh version."""
+    register_table(df)
+    st.session_state[name] = df
+
+
+def bump_table_version(name):
+    """Mark a session table edited in place as changed."""
+    register_table(st.session_state[name])
+
+
+def _as_datetime(values):
+    """Datetime Series, parsing only when the column is not already datetime."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce')
+
+
+def _as_numeric(values):
+    """Numeric Series; strings such as '4.5', '85%' or '$1,200' are parsed column-wise."""
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype(float)
+    cleaned = values.astype(str).str.replace(r'[%,$]', '', regex=True).str.strip()
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+def _month_labels(dates):
+    """'YYYY-MM' labels as a categorical, formatting each distinct month once."""
+    months = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+    codes, uniques = pd.factorize(months, sort=True)
+    labels = pd.DatetimeIndex(uniques).strftime('%Y-%m')
+    valid = ~pd.isna(uniques)
+    categories = labels[valid]
+    remap = np.full(len(uniques) + 1, -1, dtype=np.int64)
+    remap[np.flatnonzero(valid)] = np.arange(valid.sum())
+    return pd.Categorical.from_codes(remap[codes], categories=categories)
+
+
+def _join_dimension(keys, dimension_df, key_column, columns):
+    """
+    Look dimension attributes up by key without merging the fact table.
+
+    Keys are factorized first so the dimension lookup runs once per distinct
+    key; attributes come back as categoricals sharing the fact table's index.
+    """
+    joined = {}
+    if dimension_df is None or dimension_df.empty or key_column not in dimension_df.columns:
+        return joined
+    dimension = dimension_df.drop_duplicates(key_column).set_index(key_column)
+    key_codes, unique_keys = pd.factorize(keys)
+    positions = np.append(dimension.index.get_indexer(unique_keys), -1)[key_codes]
+    for source, target in columns.items():
+        if source in dimension.columns:
+            value_codes, values = pd.factorize(dimension[source])
+            codes = np.where(positions >= 0, np.append(value_codes, -1)[positions], -1)
+            joined[target] = pd.Series(pd.Categorical.from_codes(codes, categories=values), index=keys.index)
+    return joined
+
+# ============================================================================
+# CUBE
+# ============================================================================
+
+class CSFactCube:
+    """
+    Shared customer service analytics cube.
+
+    Attributes:
+        tickets (pd.DataFrame): Typed tickets with derived measures and dimensions
+        feedback (pd.DataFrame): Typed feedback with numeric scores
+        counters (pd.DataFrame): Daily x agent x channel x priority counters
+        version (tuple): Version of the source tables the cube was built from
+    """
+
+    def __init__(self, tickets, feedback, counters, version):
+        self.tickets = tickets
+        self.feedback = feedback
+        self.counters = counters
+        self.version = version
+
+    @property
+    def dated_tickets(self):
+        """Tickets with a valid created date."""
+        if 'created_date' not in self.tickets.columns:
+            return self.tickets.iloc[0:0]
+        return self.tickets[self.tickets['created_date'].notna()]
+
+    def valid_response_hours(self):
+        """Response hours within 0-168h, indexed like the tickets."""
+        hours = self.tickets.get('response_hours')
+        if hours is None:
+            return pd.Series(dtype=float)
+        return hours[hours.between(0, MAX_RESPONSE_HOURS)]
+
+    def valid_resolution_hours(self):
+        """Resolution hours within 0-720h, indexed like the tickets."""
+        hours = self.tickets.get('resolution_hours')
+        if hours is None:
+            return pd.Series(dtype=float)
+        return hours[hours.between(0, MAX_RESOLUTION_HOURS)]
+
+    def rollup(self, dimensions):
+        """
+        Roll the daily counters up to the requested dimensions.
+
+        Args:
+            dimensions (list): Subset of COUNTER_DIMENSIONS
+
+        Returns:
+            pd.DataFrame: Summed counters plus resolution_rate, escalation_rate,
+            avg_response_hours and avg_resolution_hours
+        """
+        if self.counters.empty:
+            return self.counters
+        rolled = self.counters.groupby(list(dimensions), sort=True, dropna=False).sum()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rolled['resolution_rate'] = rolled['resolved'] / rolled['tickets'] * 100
+            rolled['escalation_rate'] = rolled['escalated'] / rolled['tickets'] * 100
+            rolled['avg_response_hours'] = rolled['response_hours_sum'] / rolled['response_count']
+            rolled['avg_resolution_hours'] = rolled['resolution_hours_sum'] / rolled['resolution_count']
+        return rolled
+
+
+def build_ticket_facts(tickets_df, agents_df=None, customers_df=None):
+    """
+    Typed ticket fact table with durations, flags and dimension attributes.
+
+    Args:
+        tickets_df (pd.DataFrame): Tickets sheet
+        agents_df (pd.DataFrame): Agents sheet, joined on agent_id
+        customers_df (pd.DataFrame): Customers sheet, joined on customer_id
+
+    Returns:
+        pd.DataFrame: New frame indexed like tickets_df; the source is not modified
+    """
+    columns = {col: tickets_df[col] for col in tickets_df.columns}
+    for col in TICKET_DATE_COLUMNS:
+        if col in columns:
+            columns[col] = _as_datetime(columns[col])
+
+    created = columns.get('created_date')
+    if created is not None:
+        for measure, stop_column in (('response_hours', 'first_response_date'),
+                                     ('resolution_hours', 'resolved_date')):
+            if stop_column in columns:
+                columns[measure] = (columns[stop_column] - created).dt.total_seconds() / 3600
+        columns['created_day'] = created.dt.normalize()
+        columns['created_month'] = _month_labels(created)
+        day_codes = np.where(created.notna(), created.dt.dayofweek.fillna(-1), -1).astype(np.int64)
+        columns['day_of_week'] = pd.Categorical.from_codes(day_codes, categories=DAY_ORDER, ordered=True)
+        columns['hour'] = created.dt.hour
+
+    escalated = np.zeros(len(tickets_df), dtype=bool)
+    if 'escalated_date' in columns:
+        escalated |= columns['escalated_date'].notna().to_numpy()
+    if 'status' in tickets_df.columns:
+        # Status flags are evaluated once per distinct (case-insensitive) status
+        status_codes, statuses = pd.factorize(tickets_df['status'])
+        normalized = np.append(statuses.astype(str).str.strip().str.lower().to_numpy(dtype=object), '')
+        columns['is_resolved'] = (normalized == 'resolved')[status_codes]
+        columns['is_closed'] = np.isin(normalized, ['resolved', 'closed'])[status_codes]
+        escalated |= (normalized == 'escalated')[status_codes]
+    columns['is_escalated'] = escalated
+
+    if 'agent_id' in tickets_df.columns and agents_df is not None and not agents_df.empty:
+        agent_columns = dict(AGENT_DIMENSIONS)
+        if {'first_name', 'last_name'}.issubset(agents_df.columns):
+            agents_df = agents_df.assign(agent_name=agents_df['first_name'].astype(str) + ' ' +
+                                         agents_df['last_name'].astype(str))
+            agent_columns['agent_name'] = 'agent_name'
+        columns.update(_join_dimension(tickets_df['agent_id'], agents_df, 'agent_id', agent_columns))
+    if 'customer_id' in tickets_df.columns:
+        dimensions = {k: v for k, v in CUSTOMER_DIMENSIONS.items() if v not in columns}
+        columns.update(_join_dimension(tickets_df['customer_id'], customers_df, 'customer_id', dimensions))
+
+    return pd.DataFrame(columns, index=tickets_df.index)
+
+
+def build_feedback_facts(feedback_df):
+    """
+    Typed feedback fact table with numeric scores and month keys.
+
+    Scores outside their valid range become NaN, so pages can simply drop NaN.
+    """
+    columns = {col: feedback_df[col] for col in feedback_df.columns}
+    for col in FEEDBACK_DATE_COLUMNS:
+        if col in columns:
+            columns[col] = _as_datetime(columns[col])
+    for source, (target, low, high) in FEEDBACK_SCORES.items():
+        if source in columns:
+            score = _as_numeric(columns[source])
+            columns[target] = score.where(score.between(low, high))
+    if 'submitted_date' in columns:
+        columns['submitted_month'] = _month_labels(columns['submitted_date'])
+    return pd.DataFrame(columns, index=feedback_df.index)
+
+
+def build_ticket_counters(ticket_facts):
+    """Daily x agent x channel x priority counters from the ticket fact table."""
+    dimensions = [col for col in COUNTER_DIMENSIONS if col in ticket_facts.columns]
+    if ticket_facts.empty or 'created_day' not in dimensions:
+        return pd.DataFrame()
+
+    n_tickets = len(ticket_facts)
+    measures = {'tickets': np.ones(n_tickets, dtype=np.int64)}
+    for flag, name in (('is_resolved', 'resolved'), ('is_escalated', 'escalated')):
+        measures[name] = (ticket_facts[flag].to_numpy(dtype=np.int64) if flag in ticket_facts.columns
+                          else np.zeros(n_tickets, dtype=np.int64))
+    for measure, limit in (('response_hours', MAX_RESPONSE_HOURS), ('resolution_hours', MAX_RESOLUTION_HOURS)):
+        name = measure.split('_')[0]
+        if measure in ticket_facts.columns:
+            hours = ticket_facts[measure].to_numpy(dtype=float)
+            valid = (hours >= 0) & (hours <= limit)
+            measures[f'{name}_hours_sum'] = np.where(valid, hours, 0.0)
+            measures[f'{name}_count'] = valid.astype(np.int64)
+        else:
+            measures[f'{name}_hours_sum'] = np.zeros(n_tickets)
+            measures[f'{name}_count'] = np.zeros(n_tickets, dtype=np.int64)
+
+    frame = pd.DataFrame(measures, index=ticket_facts.index)
+    keys = [ticket_facts[col] for col in dimensions]
+    counters = frame.groupby(keys, sort=True, dropna=False).sum()
+    # Keep the full grain even if some dimensions are missing from the data
+    for col in COUNTER_DIMENSIONS:
+        if col not in counters.index.names:
+            counters[col] = None
+            counters = counters.set_index(col, append=True)
+    return counters.reorder_levels(COUNTER_DIMENSIONS)
+
+
+def build_fact_cube(tickets_df, feedback_df=None, agents_df=None, customers_df=None, version=None):
+    """
+    Build the analytics cube from the session tables.
+
+    Returns:
+        CSFactCube: Cube holding typed facts and counters
+    """
+    tickets_df = tickets_df if tickets_df is not None else pd.DataFrame()
+    feedback_df = feedback_df if feedback_df is not None else pd.DataFrame()
+    ticket_facts = build_ticket_facts(tickets_df, agents_df, customers_df)
+    feedback_facts = build_feedback_facts(feedback_df)
+    counters = build_ticket_counters(ticket_facts)
+    return CSFactCube(ticket_facts, feedback_facts, counters, version)
+
+
+def get_fact_cube():
+    """
+    Analytics cube for the current session data, rebuilt only when a source table changes.
+
+    Returns:
+        CSFactCube: Cube shared by every page in this session
+    """
+    tables = {name: st.session_state.get(name, pd.DataFrame())
+              for name in ('tickets', 'feedback', 'agents', 'customers')}
+    version = tuple(table_version(df) for df in tables.values())
+
+    cube = st.session_state.get(SESSION_CUBE_KEY)
+    if cube is None or cube.version != version:
+        cube = build_fact_cube(tables['tickets'], tables['feedback'], tables['agents'],
+                               tables['customers'], version=version)
+        st.session_state[SESSION_CUBE_KEY] = cube
+    return cube
+
+
+def invalidate_fact_cube():
+    """Drop the session cube, e.g. after tables were modified in place or cleared."""
+    st.session_state.pop(SESSION_CUBE_KEY, None)
+
+
+def clear_tables():
+    """Replace every CS session table with an empty one and drop the session cube."""
+    for name in CS_TABLES:
+        set_table(name, pd.DataFrame())
+    invalidate_fact_cube()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Customer Service Data Ingestion
+===============================
+
+Streaming, schema-validated loading of the customer service workbook:
+- Headers of every sheet are checked against SHEET_SCHEMAS before any data
+  row is read; for .xlsx files they come straight from the sheet XML, so a
+  wrong upload is rejected without parsing the workbook
+- Rows are read in chunks (.xlsx via openpyxl read-only mode, or a .zip of
+  per-sheet CSV / Parquet files) and each chunk is typed on arrival
+- A progress callback is reported per sheet and chunk
+- Tables are only returned once every sheet has loaded, so a failure never
+  leaves a half-replaced dataset behind
+"""
+
+import io
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+try:
+    from openpyxl import load_workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# ============================================================================
+# SCHEMA
+# ============================================================================
+
+# Session table -> workbook sheet, required headers and per-column typing.
+# 'dates' and 'numeric' are always typed; 'strip' and 'lower' normalization
+# and duplicate removal only run when cleaning (clean=True).
+SHEET_SCHEMAS = {
+    'customers': {
+        'sheet': 'Customers',
+        'required': ['customer_id', 'customer_name'],
+        'dates': ['acquisition_date', 'last_interaction_date'],
+        'numeric': ['lifetime_value'],
+        'strip': ['customer_name'],
+        'lower': []
+    },
+    'tickets': {
+        'sheet': 'Tickets',
+        'required': ['ticket_id', 'customer_id', 'status'],
+        'dates': ['created_date', 'first_response_date', 'resolved_date', 'escalated_date'],
+        'numeric': [],
+        'strip': [],
+        'lower': ['status']
+    },
+    'agents': {
+        'sheet': 'Agents',
+        'required': ['agent_id', 'first_name', 'last_name'],
+        'dates': ['hire_date'],
+        'numeric': ['performance_score'],
+        'strip': [],
+        'lower': []
+    },
+    'interactions': {
+        'sheet': 'Interactions',
+        'required': ['interaction_id', 'ticket_id'],
+        'dates': ['start_time', 'end_time'],
+        'numeric': ['duration_minutes', 'satisfaction_score'],
+        'strip': [],
+        'lower': []
+    },
+    'feedback': {
+        'sheet': 'Feedback',
+        'required': ['feedback_id', 'ticket_id', 'rating', 'customer_effort_score', 'nps_score'],
+        'dates': ['submitted_date', 'response_date'],
+        'numeric': ['rating', 'customer_effort_score', 'nps_score'],
+        'strip': [],
+        'lower': ['sentiment']
+    },
+    'sla': {
+        'sheet': 'SLA',
+        'required': ['sla_id', 'ticket_type', 'priority'],
+        'dates': [],
+        'numeric': ['first_response_target_hours', 'resolution_target_hours'],
+        'strip': [],
+        'lower': []
+    },
+    'knowledge_base': {
+        'sheet': 'Knowledge_Base',
+        'required': ['kb_id', 'title', 'content'],
+        'dates': ['created_date', 'updated_date'],
+        'numeric': ['views', 'helpful_votes'],
+        'strip': [],
+        'lower': []
+    },
+    'training': {
+        'sheet': 'Training',
+        'required': ['training_id', 'agent_id', 'training_type'],
+        'dates': ['start_date', 'completion_date'],
+        'numeric': ['score'],
+        'strip': [],
+        'lower': []
+    }
+}
+
+REQUIRED_COLUMNS = {table: schema['required'] for table, schema in SHEET_SCHEMAS.items()}
+
+CHUNK_ROWS = 50_000
+
+_SHEET_XML_NAMESPACE = re.compile(r'^\{[^}]*\}')
+
+
+class IngestionError(Exception):
+    """Raised when an upload does not match the expected workbook schema."""
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+class SheetSource:
+    """
+    One sheet of an upload: its headers and a chunked row reader.
+
+    Attributes:
+        table (str): Session table name (key of SHEET_SCHEMAS)
+        header (list): Column names in file order
+        total_rows (int): Data rows if known up front, else None
+    """
+
+    def __init__(self, table, header, total_rows, read_chunks):
+        self.table = table
+        self.header = header
+        self.total_rows = total_rows
+        self._read_chunks = read_chunks
+
+    def chunks(self, chunk_rows=CHUNK_ROWS):
+        """Raw DataFrame chunks of at most chunk_rows rows."""
+        return self._read_chunks(chunk_rows)
+
+
+def _local_name(tag):
+    return _SHEET_XML_NAMESPACE.sub('', tag)
+
+
+def _column_index(cell_reference):
+    """Zero-based column of an A1-style reference."""
+    index = 0
+    for char in cell_reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+
+def _xlsx_sheet_paths(archive):
+    """Sheet name -> worksheet XML path inside the .xlsx archive."""
+    relationships = {}
+    with archive.open('xl/_rels/workbook.xml.rels') as handle:
+        for element in ET.parse(handle).getroot():
+            target = element.get('Target', '')
+            relationships[element.get('Id')] = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+    paths = {}
+    with archive.open('xl/workbook.xml') as handle:
+        for element in ET.parse(handle).getroot().iter():
+            if _local_name(element.tag) == 'sheet':
+                rel_id = next((v for k, v in element.attrib.items() if _local_name(k) == 'id'), None)
+                if rel_id in relationships:
+                    paths[element.get('name')] = relationships[rel_id]
+    return paths
+
+
+def _xlsx_first_row(archive, path):
+    """Cells of the first row as (column, type, raw value) and the sheet's declared row count."""
+    cells, total_rows, in_cell = [], None, None
+    with archive.open(path) as handle:
+        for event, element in ET.iterparse(handle, events=('start', 'end')):
+            name = _local_name(element.tag)
+            if event == 'start':
+                if name == 'dimension':
+                    # e.g. ref="A1:Q101"; the header row is not a data row
+                    match = re.search(r'(\d+)$', element.get('ref', ''))
+                    total_rows = int(match.group(1)) - 1 if match else None
+                elif name == 'c':
+                    in_cell = [_column_index(element.get('r', 'A')), element.get('t', 'n'), '']
+                continue
+            if name in ('v', 't') and in_cell is not None:
+                in_cell[2] += element.text or ''
+            elif name == 'c' and in_cell is not None:
+                cells.append(tuple(in_cell))
+                in_cell = None
+            elif name == 'row':
+                break
+    return cells, total_rows
+
+
+def _xlsx_shared_strings(archive, indexes):
+    """Shared strings up to the largest requested index, read as a stream."""
+    if not indexes or 'xl/sharedStrings.xml' not in archive.namelist():
+        return {}
+    wanted, last = set(indexes), max(indexes)
+    strings, position, text = {}, -1, []
+    with archive.open('xl/sharedStrings.xml') as handle:
+        for event, element in ET.iterparse(handle, events=('start', 'end')):
+            name = _local_name(element.tag)
+            if event == 'start':
+                if name == 'si':
+                    position, text = position + 1, []
+                continue
+            if name == 't':
+                text.append(element.text or '')
+            elif name == 'si':
+                if position in wanted:
+                    strings[position] = ''.join(text)
+                if position >= last:
+                    break
+                element.clear()
+    return strings
+
+
+def _xlsx_headers(data):
+    """Sheet name -> (header, declared data rows) from the raw .xlsx bytes."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        first_rows = {name: _xlsx_first_row(archive, path) for name, path in _xlsx_sheet_paths(archive).items()}
+        shared = _xlsx_shared_strings(archive, [int(value) for cells, _ in first_rows.values()
+                                                for _, kind, value in cells if kind == 's' and value])
+    headers = {}
+    for name, (cells, total_rows) in first_rows.items():
+        width = max((column for column, _, _ in cells), default=-1) + 1
+        header = [None] * width
+        for column, kind, value in cells:
+            header[column] = shared.get(int(value)) if kind == 's' and value else value
+        headers[name] = ([str(h).strip() if h is not None else f'Unnamed: {i}' for i, h in enumerate(header)],
+                         total_rows)
+    return headers
+
+
+def _xlsx_sources(data):
+    """SheetSources for an .xlsx workbook, reading rows lazily through openpyxl."""
+    if not OPENPYXL_AVAILABLE:
+        raise IngestionError("openpyxl is required to read .xlsx uploads")
+    try:
+        headers = _xlsx_headers(data)
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise IngestionError(f"Not a valid .xlsx workbook: {e}")
+
+    # One read-only workbook serves every sheet so shared strings and styles are parsed once
+    opened = {}
+
+    def reader(sheet_name, header):
+        def read_chunks(chunk_rows):
+            if 'workbook' not in opened:
+                opened['workbook'] = load_workbook(io.BytesIO(data), read_only=True, data_only=True, keep_links=False)
+            rows = opened['workbook'][sheet_name].iter_rows(min_row=2, max_col=len(header), values_only=True)
+            batch = []
+            for row in rows:
+                if any(value is not None for value in row):
+                    batch.append(row)
+                if len(batch) >= chunk_rows:
+                    yield pd.DataFrame(batch, columns=header)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=header)
+        return read_chunks
+
+    return {name: (header, total_rows, reader(name, header)) for name, (header, total_rows) in headers.items()}
+
+
+def _xls_sources(data):
+    """SheetSources for a legacy .xls workbook; rows are read per sheet, not chunked."""
+    try:
+        headers = pd.read_excel(io.BytesIO(data), sheet_name=None, nrows=0)
+    except Exception as e:
+        raise IngestionError(f"Could not read workbook: {e}")
+
+    def reader(sheet_name):
+        def read_chunks(chunk_rows):
+            yield pd.read_excel(io.BytesIO(data), sheet_name=sheet_name)
+        return read_chunks
+
+    return {name: ([str(c) for c in frame.columns], None, reader(name)) for name, frame in headers.items()}
+
+
+def _archive_sources(data):
+    """SheetSources for a .zip holding one CSV or Parquet file per sheet, named after the sheet."""
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(data))
+    except zipfile.BadZipFile as e:
+        raise IngestionError(f"Not a valid .zip archive: {e}")
+
+    sources = {}
+    for member in archive.namelist():
+        stem, extension = os.path.splitext(os.path.basename(member))
+        extension = extension.lower()
+        if extension == '.csv':
+            with archive.open(member) as handle:
+                header = list(pd.read_csv(handle, nrows=0).columns)
+
+            def read_chunks(chunk_rows, member=member):
+                with archive.open(member) as handle:
+                    yield from pd.read_csv(handle, chunksize=chunk_rows)
+            sources[stem] = (header, None, read_chunks)
+        elif extension == '.parquet':
+            if not PYARROW_AVAILABLE:
+                raise IngestionError("pyarrow is required to read Parquet sheets")
+            parquet = pq.ParquetFile(io.BytesIO(archive.read(member)))
+
+            def read_chunks(chunk_rows, parquet=parquet):
+                for batch in parquet.iter_batches(batch_size=chunk_rows):
+                    yield batch.to_pandas()
+            sources[stem] = (parquet.schema_arrow.names, parquet.metadata.num_rows, read_chunks)
+    return sources
+
+
+def open_sources(uploaded_file):
+    """
+    Locate every schema sheet in an upload and read its headers, but no rows.
+
+    Args:
+        uploaded_file: Path or file-like object (.xlsx, .xls or .zip of CSV/Parquet)
+
+    Returns:
+        dict: Table name -> SheetSource
+
+    Raises:
+        IngestionError: Unsupported file type or missing sheets
+    """
+    if isinstance(uploaded_file, (str, os.PathLike)):
+        name = os.fspath(uploaded_file)
+        with open(name, 'rb') as handle:
+            data = handle.read()
+    else:
+        name = getattr(uploaded_file, 'name', '')
+        data = uploaded_file.getvalue() if hasattr(uploaded_file, 'getvalue') else uploaded_file.read()
+
+    extension = os.path.splitext(name)[1].lower()
+    if extension == '.zip':
+        found = _archive_sources(data)
+    elif extension == '.xls':
+        found = _xls_sources(data)
+    elif extension in ('.xlsx', '.xlsm', '') and data[:2] == b'PK':
+        found = _xlsx_sources(data)
+    else:
+        raise IngestionError(f"Unsupported file type '{extension or name}'; upload .xlsx, .xls or a .zip of CSV/Parquet sheets")
+
+    by_lower_name = {sheet.lower(): sheet for sheet in found}
+    sources, missing = {}, []
+    for table, schema in SHEET_SCHEMAS.items():
+        sheet = by_lower_name.get(schema['sheet'].lower())
+        if sheet is None:
+            missing.append(schema['sheet'])
+            continue
+        header, total_rows, read_chunks = found[sheet]
+        sources[table] = SheetSource(table, header, total_rows, read_chunks)
+    if missing:
+        raise IngestionError(f"Missing required sheets: {', '.join(missing)}")
+    return sources
+
+
+def validate_headers(sources):
+    """
+    Check every sheet's headers against SHEET_SCHEMAS.
+
+    Raises:
+        IngestionError: One message listing all missing or duplicated columns
+    """
+    problems = []
+    for table, source in sources.items():
+        schema = SHEET_SCHEMAS[table]
+        missing = [col for col in schema['required'] if col not in source.header]
+        duplicated = sorted({col for col in source.header if source.header.count(col) > 1})
+        if missing:
+            problems.append(f"{schema['sheet']} missing columns: {', '.join(missing)}")
+        if duplicated:
+            problems.append(f"{schema['sheet']} has duplicate columns: {', '.join(duplicated)}")
+    if problems:
+        raise IngestionError("; ".join(problems))
+
+# ============================================================================
+# CHUNK TYPING
+# ============================================================================
+
+def prepare_chunk(table, chunk, clean=False):
+    """
+    Type (and optionally normalize) one chunk of a table.
+
+    Args:
+        table (str): Key of SHEET_SCHEMAS
+        chunk (pd.DataFrame): Raw rows
+        clean (bool): Also strip/lower-case text columns as clean_and_prepare_data does
+
+    Returns:
+        pd.DataFrame: The typed chunk
+
+    Raises:
+        IngestionError: A date or numeric column holds values none of which parse
+    """
+    schema = SHEET_SCHEMAS[table]
+    chunk = chunk.copy(deep=False)
+    for kind, convert in (('dates', lambda s: pd.to_datetime(s, errors='coerce')),
+                          ('numeric', lambda s: pd.to_numeric(s, errors='coerce'))):
+        for col in schema[kind]:
+            if col not in chunk.columns:
+                continue
+            if kind == 'dates' and pd.api.types.is_datetime64_any_dtype(chunk[col]):
+                continue
+            if kind == 'numeric' and pd.api.types.is_numeric_dtype(chunk[col]):
+                continue
+            converted = convert(chunk[col])
+            if chunk[col].notna().any() and converted.isna().all():
+                sample = chunk[col].dropna().iloc[0]
+                raise IngestionError(
+                    f"{schema['sheet']}.{col} should hold {'dates' if kind == 'dates' else 'numbers'} but has values like '{sample}'")
+            chunk[col] = converted
+
+    if clean:
+        for col in schema['strip'] + schema['lower']:
+            if col in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[col]):
+                values = chunk[col].str.strip()
+                chunk[col] = values.str.lower() if col in schema['lower'] else values
+        if table == 'interactions' and {'start_time', 'end_time'} <= set(chunk.columns):
+            derived = (chunk['end_time'] - chunk['start_time']).dt.total_seconds() / 60
+            chunk['duration_minutes'] = chunk['duration_minutes'].fillna(derived) if 'duration_minutes' in chunk.columns else derived
+    return chunk
+
+
+def _concat_chunks(chunks, header):
+    if not chunks:
+        return pd.DataFrame(columns=header)
+    return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+
+
+def _read_table(source, clean, chunk_rows, progress):
+    """All chunks of one sheet, typed; exact duplicate rows are dropped across chunks when cleaning."""
+    chunks, seen, rows_read = [], np.empty(0, dtype=np.uint64), 0
+    for raw in source.chunks(chunk_rows):
+        rows_read += len(raw)
+        chunk = prepare_chunk(source.table, raw, clean)
+        if clean and len(chunk):
+            hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+            keep = ~pd.Series(hashes).duplicated().to_numpy() & ~np.isin(hashes, seen)
+            seen = np.concatenate([seen, hashes[keep]])
+            chunk = chunk[keep]
+        chunks.append(chunk)
+        if progress:
+            progress(source.table, rows_read, source.total_rows, False)
+    if progress:
+        progress(source.table, rows_read, rows_read, True)
+    return _concat_chunks(chunks, source.header).reset_index(drop=True)
+
+
+def ingest_workbook(uploaded_file, clean=False, progress=None, chunk_rows=CHUNK_ROWS):
+    """
+    Validate and load every customer service sheet from an upload.
+
+    Headers are validated for all sheets before any rows are read; rows
+    are then read and typed chunk by chunk, failing on the first chunk
+    whose typed columns cannot be parsed.
+
+    Args:
+        uploaded_file: Path or file-like object (.xlsx, .xls or .zip of CSV/Parquet)
+        clean (bool): Also normalize text and drop duplicate rows
+        progress (callable): progress(table, rows_read, total_rows, done) per chunk
+        chunk_rows (int): Rows per chunk
+
+    Returns:
+        dict: Table name -> DataFrame for every table in SHEET_SCHEMAS
+
+    Raises:
+        IngestionError: Schema or typing problems, before any table is returned
+    """
+    sources = open_sources(uploaded_file)
+    validate_headers(sources)
+    return {table: _read_table(source, clean, chunk_rows, progress) for table, source in sources.items()}
+
+
+def clean_table(table, df, chunk_rows=CHUNK_ROWS):
+    """
+    Clean a loaded table chunk by chunk: typing, text normalization and de-duplication.
+
+    Args:
+        table (str): Key of SHEET_SCHEMAS
+        df (pd.DataFrame): Table as currently loaded; it is not modified
+
+    Returns:
+        pd.DataFrame: Cleaned copy
+    """
+    if table not in SHEET_SCHEMAS or df.empty:
+        return df
+
+    def read_chunks(size):
+        for start in range(0, len(df), size):
+            yield df.iloc[start:start + size]
+
+    source = SheetSource(table, list(df.columns), len(df), read_chunks)
+    return _read_table(source, True, chunk_rows, None)
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Customer Journey Sessionization
+===============================
+
+Reconstructs omnichannel journeys from the interactions sheet:
+- Interactions are sorted once per customer partition and split into
+  sessions wherever a customer is inactive for longer than the gap
+  (vectorized diff/cumsum, no per-customer loops)
+- Channel-transition matrices and path frequencies on integer channel
+  codes, with consecutive same-channel steps collapsed in paths
+- Bounded memory: rows are partitioned by a hash of customer_id and each
+  partition is sessionized on its own, either in memory or, for chunked
+  sources (e.g. 50M rows read in pieces), spilled to temporary files
+"""
+
+import math
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cs_fact_cube import table_version
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_INACTIVITY_GAP_HOURS = 72
+
+# Upper bound on interactions sessionized at once
+DEFAULT_CHUNK_ROWS = 2_000_000
+
+# Channel steps encoded per journey path; longer paths end in an ellipsis
+MAX_PATH_STEPS = 5
+
+# Session lengths above this are pooled in the last histogram bucket
+MAX_LENGTH_BUCKET = 20
+
+TOP_PATHS = 15
+
+UNKNOWN_CHANNEL = 'Unknown'
+PATH_SEPARATOR = ' → '
+
+# Journeys whose last interaction has one of these outcomes count as successful
+SUCCESS_OUTCOMES = ('resolved', 'information provided')
+
+SESSION_JOURNEY_KEY = 'cs_journey_analyses'
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+class ChannelEncoder:
+    """Stable integer codes for channel labels, extended as new labels appear."""
+
+    def __init__(self):
+        self.labels = []
+        self._codes = {}
+
+    def encode(self, channels):
+        """Integer code per row; missing channels map to UNKNOWN_CHANNEL."""
+        row_codes, uniques = pd.factorize(channels)
+        labels = np.append(uniques.astype(str).to_numpy(dtype=object), UNKNOWN_CHANNEL)
+        row_codes = np.where(row_codes < 0, len(labels) - 1, row_codes)
+        lookup = np.full(len(labels), -1, dtype=np.int32)
+        for i in np.unique(row_codes):
+            label = labels[i]
+            if label not in self._codes:
+                self._codes[label] = len(self.labels)
+                self.labels.append(label)
+            lookup[i] = self._codes[label]
+        return lookup[row_codes]
+
+
+def encode_interactions(interactions_df, encoder):
+    """
+    Reduce interactions to the numeric arrays the journey kernels work on.
+
+    Rows without a customer or a parseable start_time are dropped.
+
+    Args:
+        interactions_df (pd.DataFrame): Needs customer_id, start_time and channel;
+            outcome is optional
+        encoder (ChannelEncoder): Shared channel codes
+
+    Returns:
+        dict: 'customer' (uint64 hash), 'time' (int64 ns), 'channel' (int32)
+        and 'success' (bool) arrays of equal length
+    """
+    times = pd.to_datetime(interactions_df['start_time'], errors='coerce')
+    valid = (times.notna() & interactions_df['customer_id'].notna()).to_numpy()
+    frame = interactions_df.loc[valid]
+
+    channels = frame['channel'] if 'channel' in frame.columns else pd.Series(pd.NA, index=frame.index)
+    if 'outcome' in frame.columns:
+        outcome_codes, outcomes = pd.factorize(frame['outcome'])
+        successful = np.append(outcomes.astype(str).str.strip().str.lower().isin(SUCCESS_OUTCOMES), False)
+        success = successful[outcome_codes]
+    else:
+        success = np.zeros(len(frame), dtype=bool)
+
+    # Hash each distinct customer once; the hash is stable across chunks
+    customer_codes, customer_ids = pd.factorize(frame['customer_id'])
+    return {
+        'customer': pd.util.hash_array(customer_ids.astype(str).to_numpy(dtype=object))[customer_codes],
+        'time': times[valid].to_numpy(dtype='datetime64[ns]').view(np.int64),
+        'channel': encoder.encode(channels),
+        'success': np.asarray(success, dtype=bool)
+    }
+
+# ============================================================================
+# SESSIONIZATION KERNELS
+# ============================================================================
+
+def split_sessions(customers, times, gap_ns):
+    """
+    Session boundaries in interactions sorted by (customer, time).
+
+    Returns:
+        np.ndarray: bool, True where a new session starts
+    """
+    starts = np.ones(len(customers), dtype=bool)
+    if len(customers) > 1:
+        starts[1:] = (customers[1:] != customers[:-1]) | (np.diff(times) > gap_ns)
+    return starts
+
+
+def sessionize_interactions(interactions_df, gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
+    """
+    Journey session id per interaction.
+
+    Args:
+        interactions_df (pd.DataFrame): Needs customer_id and start_time
+        gap_hours (float): Inactivity that ends a session
+
+    Returns:
+        pd.Series: Session number aligned to interactions_df (-1 where the
+        customer or start_time is missing), numbered in (customer, time) order
+    """
+    session_ids = np.full(len(interactions_df), -1, dtype=np.int64)
+    if interactions_df.empty or not {'customer_id', 'start_time'}.issubset(interactions_df.columns):
+        return pd.Series(session_ids, index=interactions_df.index, name='session_id')
+
+    times = pd.to_datetime(interactions_df['start_time'], errors='coerce')
+    valid = np.flatnonzero((times.notna() & interactions_df['customer_id'].notna()).to_numpy())
+    customers, _ = pd.factorize(interactions_df['customer_id'].iloc[valid])
+    time_values = times.iloc[valid].to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+    order = np.lexsort((time_values, customers))
+    starts = split_sessions(customers[order], time_values[order], int(gap_hours * _NS_PER_HOUR))
+    session_ids[valid[order]] = np.cumsum(starts) - 1
+    return pd.Series(session_ids, index=interactions_df.index, name='session_id')
+
+
+def _path_steps(n_channels):
+    """Path steps that fit an int64 code for this many channels."""
+    return max(1, min(MAX_PATH_STEPS, int(62 // math.log2(n_channels + 2))))
+
+
+def _journey_partials(arrays, gap_ns, n_channels):
+    """Session aggregates for one customer partition (no customer spans two partitions)."""
+    order = np.lexsort((arrays['time'], arrays['customer']))
+    customers = arrays['customer'][order]
+    times = arrays['time'][order]
+    channels = arrays['channel'][order].astype(np.int64)
+    success = arrays['success'][order]
+    n_rows = len(order)
+
+    starts = split_sessions(customers, times, gap_ns)
+    first = np.flatnonzero(starts)
+    last = np.append(first[1:], n_rows) - 1
+    lengths = last - first + 1
+    session_ids = np.cumsum(starts) - 1
+
+    # Transitions between consecutive interactions of the same session
+    within = ~starts[1:]
+    source, target = channels[:-1][within], channels[1:][within]
+    transitions = np.bincount(source * n_channels + target, minlength=n_channels * n_channels)
+
+    # A path step is the first interaction of a session or a change of channel
+    steps = starts.copy()
+    steps[1:] |= channels[1:] != channels[:-1]
+    step_rank = np.cumsum(steps) - 1
+    position = step_rank - step_rank[first][session_ids]
+    n_steps = np.add.reduceat(steps.astype(np.int64), first)
+
+    path_steps = _path_steps(n_channels)
+    base = n_channels + 1
+    encoded = steps & (position < path_steps)
+    digits = np.zeros(n_rows, dtype=np.int64)
+    digits[encoded] = (channels[encoded] + 1) * base ** position[encoded]
+    path_codes = np.add.reduceat(digits, first) * 2 + (n_steps > path_steps)
+
+    # Months since the partition's first journey start
+    months = times[first].view('datetime64[ns]').astype('datetime64[M]').astype(np.int64)
+    first_month = months.min()
+    month_codes = months - first_month
+    month_index = np.arange(month_codes.max() + 1) + first_month
+
+    return {
+        'customers': int(np.count_nonzero(customers[1:] != customers[:-1]) + 1),
+        'sessions': len(first),
+        'interactions': n_rows,
+        'switches': int((n_steps - 1).sum()),
+        # More than one path step means the journey changed channel
+        'multichannel': int(np.count_nonzero(n_steps > 1)),
+        'successful': int(np.count_nonzero(success[last])),
+        'duration_ns': float((times[last] - times[first]).sum(dtype=np.float64)),
+        'transitions': transitions,
+        'paths': pd.Series(path_codes).value_counts(sort=False),
+        'lengths': np.bincount(np.minimum(lengths, MAX_LENGTH_BUCKET), minlength=MAX_LENGTH_BUCKET + 1),
+        'monthly': pd.DataFrame({
+            'sessions': np.bincount(month_codes, minlength=len(month_index)),
+            'successful': np.bincount(month_codes, weights=success[last], minlength=len(month_index))
+        }, index=month_index)
+    }
+
+# ============================================================================
+# JOURNEY ANALYSIS
+# ============================================================================
+
+class JourneyAnalysis:
+    """
+    Journey aggregates accumulated over customer partitions.
+
+    Attributes:
+        channels (list): Channel label per integer code
+        gap_hours (float): Inactivity gap used to split sessions
+        transitions (np.ndarray): int64 counts, shape (channels, channels)
+        paths (pd.Series): Sessions per integer path code
+        sessions, interactions, customers (int): Totals
+    """
+
+    def __init__(self, channels, gap_hours):
+        self.channels = list(channels)
+        self.gap_hours = gap_hours
+        n_channels = len(self.channels)
+        self.path_steps = _path_steps(n_channels)
+        self.transitions = np.zeros((n_channels, n_channels), dtype=np.int64)
+        self.paths = pd.Series(dtype=np.int64)
+        self.lengths = np.zeros(MAX_LENGTH_BUCKET + 1, dtype=np.int64)
+        self.monthly = pd.DataFrame(columns=['sessions', 'successful'], dtype=np.float64)
+        self.customers = self.sessions = self.interactions = 0
+        self.switches = self.multichannel = self.successful = 0
+        self.duration_ns = 0.0
+
+    def add(self, partials):
+        """Fold the aggregates of one partition into the totals."""
+        for name in ('customers', 'sessions', 'interactions', 'switches', 'multichannel', 'successful', 'duration_ns'):
+            setattr(self, name, getattr(self, name) + partials[name])
+        self.transitions += partials['transitions'].reshape(self.transitions.shape)
+        self.lengths += partials['lengths']
+        self.paths = self.paths.add(partials['paths'], fill_value=0).astype(np.int64)
+        self.monthly = self.monthly.add(partials['monthly'], fill_value=0)
+
+    def summary(self):
+        """Headline journey metrics (averages per session)."""
+        sessions = max(self.sessions, 1)
+        return {
+            'customers': self.customers,
+            'journeys': self.sessions,
+            'interactions': self.interactions,
+            'journeys_per_customer': self.sessions / max(self.customers, 1),
+            'avg_touchpoints': self.interactions / sessions,
+            'avg_duration_days': self.duration_ns / sessions / (24 * _NS_PER_HOUR),
+            'avg_channel_switches': self.switches / sessions,
+            'multichannel_rate': self.multichannel / sessions * 100,
+            'success_rate': self.successful / sessions * 100
+        }
+
+    def transition_matrix(self, normalize=False):
+        """
+        Channel-to-channel transitions within journeys.
+
+        Args:
+            normalize (bool): Row-normalize to next-channel probabilities (%)
+
+        Returns:
+            pd.DataFrame: From-channel rows x to-channel columns
+        """
+        matrix = pd.DataFrame(self.transitions, index=self.channels, columns=self.channels)
+        matrix.index.name, matrix.columns.name = 'From', 'To'
+        if normalize:
+            matrix = matrix.div(matrix.sum(axis=1).replace(0, np.nan), axis=0).fillna(0) * 100
+        return matrix
+
+    def decode_path(self, code):
+        """Channel path label for an integer path code."""
+        truncated, code = code % 2, code // 2
+        base = len(self.channels) + 1
+        labels = []
+        while code:
+            code, digit = divmod(code, base)
+            labels.append(self.channels[digit - 1])
+        return PATH_SEPARATOR.join(labels + ['…'] * truncated)
+
+    def path_frequencies(self, top=TOP_PATHS):
+        """Most frequent channel paths with session counts and share of journeys."""
+        counts = self.paths.nlargest(top) if top else self.paths.sort_values(ascending=False)
+        return pd.DataFrame({
+            'Path': [self.decode_path(int(code)) for code in counts.index],
+            'Journeys': counts.to_numpy(),
+            'Share %': counts.to_numpy() / max(self.sessions, 1) * 100
+        })
+
+    def monthly_trend(self):
+        """Journeys started and success rate per calendar month."""
+        monthly = self.monthly.sort_index()
+        return pd.DataFrame({
+            'month': pd.to_datetime(monthly.index.to_numpy(dtype=np.int64).astype('datetime64[M]')),
+            'journeys': monthly['sessions'].to_numpy(dtype=np.int64),
+            'success_rate': (monthly['successful'] / monthly['sessions'].replace(0, np.nan)).fillna(0).to_numpy() * 100
+        })
+
+# ============================================================================
+# PARTITIONED EXECUTION
+# ============================================================================
+
+def _partition_count(n_rows, chunk_rows):
+    return max(1, math.ceil(n_rows / max(chunk_rows, 1)))
+
+
+def _partition(arrays, n_partitions):
+    """Split encoded arrays by customer hash; yields (partition, arrays) pairs."""
+    if n_partitions == 1:
+        if len(arrays['customer']):
+            yield 0, arrays
+        return
+    buckets = (arrays['customer'] % np.uint64(n_partitions)).astype(np.int64)
+    order = np.argsort(buckets, kind='stable')
+    bounds = np.searchsorted(buckets[order], np.arange(n_partitions + 1))
+    for partition in range(n_partitions):
+        rows = order[bounds[partition]:bounds[partition + 1]]
+        if len(rows):
+            yield partition, {name: values[rows] for name, values in arrays.items()}
+
+
+def _spill_chunks(chunks, encoder, directory, n_partitions):
+    """Encode chunks and append each partition's rows to its own files."""
+    for chunk_number, chunk in enumerate(chunks):
+        if chunk is None or chunk.empty:
+            continue
+        for partition, arrays in _partition(encode_interactions(chunk, encoder), n_partitions):
+            np.savez(os.path.join(directory, f'p{partition:05d}_{chunk_number:07d}.npz'), **arrays)
+
+
+def _load_partition(directory, partition):
+    files = sorted(name for name in os.listdir(directory) if name.startswith(f'p{partition:05d}_'))
+    if not files:
+        return None
+    parts = [np.load(os.path.join(directory, name)) for name in files]
+    return {name: np.concatenate([part[name] for part in parts]) for name in ('customer', 'time', 'channel', 'success')}
+
+
+def analyze_journeys(interactions, gap_hours=DEFAULT_INACTIVITY_GAP_HOURS, chunk_rows=DEFAULT_CHUNK_ROWS,
+                     n_partitions=None, spill_dir=None):
+    """
+    Sessionize interactions and aggregate journeys partition by partition.
+
+    Args:
+        interactions (pd.DataFrame | iterable): The interactions table, or an
+            iterable of DataFrame chunks (e.g. pd.read_csv(..., chunksize=n))
+            for sources that do not fit in memory
+        gap_hours (float): Inactivity that ends a session
+        chunk_rows (int): Target rows per partition for an in-memory table
+        n_partitions (int): Customer-hash partitions for chunked sources;
+            should be about total rows / chunk_rows (default 64)
+        spill_dir (str): Directory for partition files of chunked sources,
+            defaults to a temporary directory removed afterwards
+
+    Returns:
+        JourneyAnalysis: Aggregated journeys
+    """
+    encoder = ChannelEncoder()
+    gap_ns = int(gap_hours * _NS_PER_HOUR)
+
+    if isinstance(interactions, pd.DataFrame):
+        if interactions.empty or not {'customer_id', 'start_time'}.issubset(interactions.columns):
+            return JourneyAnalysis([], gap_hours)
+        arrays = encode_interactions(interactions, encoder)
+        analysis = JourneyAnalysis(encoder.labels, gap_hours)
+        for _, partition in _partition(arrays, _partition_count(len(arrays['customer']), chunk_rows)):
+            analysis.add(_journey_partials(partition, gap_ns, len(encoder.labels)))
+        return analysis
+
+    n_partitions = n_partitions or 64
+    with tempfile.TemporaryDirectory(dir=spill_dir) as directory:
+        _spill_chunks(interactions, encoder, directory, n_partitions)
+        analysis = JourneyAnalysis(encoder.labels, gap_hours)
+        for partition in range(n_partitions):
+            arrays = _load_partition(directory, partition)
+            if arrays is not None:
+                analysis.add(_journey_partials(arrays, gap_ns, len(encoder.labels)))
+    return analysis
+
+
+def get_journey_analysis(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
+    """
+    Journey analysis of the session interactions, cached per table version and gap.
+
+    Returns:
+        JourneyAnalysis: Aggregated journeys
+    """
+    interactions = st.session_state.get('interactions', pd.DataFrame())
+    key = (table_version(interactions), gap_hours)
+    cache = st.session_state.setdefault(SESSION_JOURNEY_KEY, {})
+    if key not in cache:
+        for stale in [k for k in cache if k[0] != key[0]]:
+            del cache[stale]
+        cache[key] = analyze_journeys(interactions, gap_hours)
+    return cache[key]
@@ -8,41 +8,27 @@ from sklearn.metrics import accuracy_score, classification_report, mean_squared_
 import warnings
 warnings.filterwarnings('ignore')
 
+from cs_churn_model import churn_scores, summarize_churn_scores, churn_labels
+from cs_volume_forecast import forecast_ticket_volume
+from cs_metrics_engine import get_metric_context
+from cs_journeys import analyze_journeys
+
+# Demand forecast horizon in days
+FORECAST_DAYS = 30
+
 def calculate_customer_satisfaction_metrics(customers_df, feedback_df, tickets_df):
     """Calculate comprehensive customer satisfaction metrics"""
     try:
         if customers_df.empty or feedback_df.empty:
             return pd.DataFrame(), "Insufficient data for satisfaction analysis"
         
-        # Merge data for analysis
-        satisfaction_data = feedback_df.merge(
-            customers_df[['customer_id', 'customer_name', 'customer_segment']], 
-            on='customer_id', how='left'
-        )
-        
-        # Calculate satisfaction metrics
-        metrics = {
-            'Metric': [
-                'Overall Satisfaction Score',
-                'Average Rating',
-                'Positive Sentiment %',
-                'Negative Sentiment %',
-                'Neutral Sentiment %',
-                'Response Rate',
-                'Customer Engagement Score'
-            ],
-            'Value': [
-                f"{satisfaction_data['rating'].mean():.2f}/5",
-                f"{satisfaction_data['rating'].mean():.2f}",
-                f"{(satisfaction_data['sentiment'] == 'positive').mean() * 100:.1f}%",
-                f"{(satisfaction_data['sentiment'] == 'negative').mean() * 100:.1f}%",
-                f"{(satisfaction_data['sentiment'] == 'neutral').mean() * 100:.1f}%",
-                f"{len(satisfaction_data) / len(customers_df) * 100:.1f}%",
-                f"{satisfaction_data['rating'].mean() * (len(satisfaction_data) / len(customers_df)) * 100:.1f}"
-            ]
-        }
+        context = get_metric_context(customers=customers_df, feedback=feedback_df, tickets=tickets_df)
+        metrics = context.table([
+            'overall_satisfaction', 'avg_rating', 'positive_sentiment_rate', 'negative_sentiment_rate',
+            'neutral_sentiment_rate', 'feedback_response_rate', 'customer_engagement_score'
+        ])
         
-        return pd.DataFrame(metrics), "Customer satisfaction metrics calculated successfully"
+        return metrics, "Customer satisfaction metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating satisfaction metrics: {str(e)}"
@@ -53,38 +39,10 @@ def calculate_response_resolution_metrics(tickets_df, interactions_df, sla_df):
         if tickets_df.empty:
             return pd.DataFrame(), "No ticket data available"
         
-        # Convert dates to datetime
-        tickets_analysis = tickets_df.copy()
-        date_columns = ['created_date', 'first_response_date', 'resolved_date']
-        
-        for col in date_columns:
-            if col in tickets_analysis.columns:
-                tickets_analysis[col] = pd.to_datetime(tickets_analysis[col], errors='coerce')
-        
-        # Calculate response and resolution times
-        metrics = []
-        
-        if 'first_response_date' in tickets_analysis.columns and 'created_date' in tickets_analysis.columns:
-            response_time = (tickets_analysis['first_response_date'] - tickets_analysis['created_date']).dt.total_seconds() / 3600
-            avg_response_time = response_time.mean()
-            metrics.append(['Average First Response Time', f"{avg_response_time:.2f} hours"])
-        
-        if 'resolved_date' in tickets_analysis.columns and 'created_date' in tickets_analysis.columns:
-            resolution_time = (tickets_analysis['resolved_date'] - tickets_analysis['created_date']).dt.total_seconds() / 3600
-            avg_resolution_time = resolution_time.mean()
-            metrics.append(['Average Resolution Time', f"{avg_resolution_time:.2f} hours"])
-        
-        if 'escalated_date' in tickets_analysis.columns and 'created_date' in tickets_analysis.columns:
-            escalation_time = (tickets_analysis['escalated_date'] - tickets_analysis['created_date']).dt.total_seconds() / 3600
-            escalation_rate = (tickets_analysis['escalated_date'].notna()).mean() * 100
-            metrics.append(['Escalation Rate', f"{escalation_rate:.1f}%"])
-        
-        # SLA compliance
-        if not sla_df.empty and 'priority' in tickets_analysis.columns:
-            sla_compliance = calculate_sla_compliance(tickets_analysis, sla_df)
-            metrics.append(['SLA Compliance Rate', f"{sla_compliance:.1f}%"])
+        context = get_metric_context(tickets=tickets_df, interactions=interactions_df, sla=sla_df)
+        metrics = context.table(['avg_response_hours', 'avg_resolution_hours', 'escalation_rate', 'sla_compliance_rate'])
         
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Response and resolution metrics calculated successfully"
+        return metrics, "Response and resolution metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating response metrics: {str(e)}"
@@ -95,30 +53,13 @@ def calculate_service_efficiency_metrics(tickets_df, agents_df, interactions_df)
         if tickets_df.empty:
             return pd.DataFrame(), "No ticket data available"
         
-        # Calculate efficiency metrics
-        metrics = []
-        
-        # Ticket volume metrics
-        total_tickets = len(tickets_df)
-        metrics.append(['Total Tickets', str(total_tickets)])
-        
-        if 'status' in tickets_df.columns:
-            resolved_tickets = len(tickets_df[tickets_df['status'] == 'resolved'])
-            resolution_rate = (resolved_tickets / total_tickets) * 100 if total_tickets > 0 else 0
-            metrics.append(['Resolution Rate', f"{resolution_rate:.1f}%"])
+        context = get_metric_context(tickets=tickets_df, agents=agents_df, interactions=interactions_df)
+        names = ['total_tickets', 'resolution_rate']
+        if not agents_df.empty:
+            names.append('avg_tickets_per_agent')
+        names.append('avg_interaction_minutes')
         
-        # Agent efficiency
-        if not agents_df.empty and 'agent_id' in tickets_df.columns:
-            agent_performance = tickets_df.groupby('agent_id').size().reset_index(name='ticket_count')
-            avg_tickets_per_agent = agent_performance['ticket_count'].mean()
-            metrics.append(['Average Tickets per Agent', f"{avg_tickets_per_agent:.1f}"])
-        
-        # Interaction efficiency
-        if not interactions_df.empty and 'duration_minutes' in interactions_df.columns:
-            avg_interaction_duration = interactions_df['duration_minutes'].mean()
-            metrics.append(['Average Interaction Duration', f"{avg_interaction_duration:.1f} minutes"])
-        
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Service efficiency metrics calculated successfully"
+        return context.table(names), "Service efficiency metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating efficiency metrics: {str(e)}"
@@ -129,29 +70,10 @@ def calculate_customer_retention_metrics(customers_df, tickets_df, interactions_
         if customers_df.empty or tickets_df.empty:
             return pd.DataFrame(), "Insufficient data for retention analysis"
         
-        # Calculate retention metrics
-        total_customers = len(customers_df)
-        active_customers = len(tickets_df['customer_id'].unique())
-        
-        retention_rate = (active_customers / total_customers) * 100 if total_customers > 0 else 0
+        context = get_metric_context(customers=customers_df, tickets=tickets_df, interactions=interactions_df)
+        metrics = context.table(['total_customers', 'active_customers', 'retention_rate', 'avg_lifetime_value', 'churn_rate'])
         
-        # Customer lifetime value (simplified)
-        if 'lifetime_value' in customers_df.columns:
-            avg_lifetime_value = customers_df['lifetime_value'].mean()
-        else:
-            # Estimate based on ticket volume
-            customer_ticket_counts = tickets_df.groupby('customer_id').size()
-            avg_lifetime_value = customer_ticket_counts.mean() * 100  # Assume $100 per ticket
-        
-        metrics = [
-            ['Total Customers', str(total_customers)],
-            ['Active Customers', str(active_customers)],
-            ['Retention Rate', f"{retention_rate:.1f}%"],
-            ['Average Customer Lifetime Value', f"${avg_lifetime_value:.2f}"],
-            ['Customer Churn Rate', f"{100 - retention_rate:.1f}%"]
-        ]
-        
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Customer retention metrics calculated successfully"
+        return metrics, "Customer retention metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating retention metrics: {str(e)}"
@@ -162,37 +84,10 @@ def calculate_agent_performance_metrics(agents_df, tickets_df, feedback_df):
         if agents_df.empty or tickets_df.empty:
             return pd.DataFrame(), "Insufficient data for agent performance analysis"
         
-        # Merge data for analysis
-        agent_performance = tickets_df.groupby('agent_id').agg({
-            'ticket_id': 'count',
-            'status': lambda x: (x == 'resolved').sum()
-        }).reset_index()
-        
-        agent_performance.columns = ['agent_id', 'total_tickets', 'resolved_tickets']
-        agent_performance['resolution_rate'] = (agent_performance['resolved_tickets'] / agent_performance['total_tickets']) * 100
-        
-        # Add agent names
-        if 'first_name' in agents_df.columns and 'last_name' in agents_df.columns:
-            agent_performance = agent_performance.merge(
-                agents_df[['agent_id', 'first_name', 'last_name']], 
-                on='agent_id', how='left'
-            )
-            agent_performance['agent_name'] = agent_performance['first_name'] + ' ' + agent_performance['last_name']
-        else:
-            agent_performance['agent_name'] = agent_performance['agent_id']
+        context = get_metric_context(agents=agents_df, tickets=tickets_df, feedback=feedback_df)
+        metrics = context.table(['avg_agent_resolution_rate', 'avg_tickets_per_agent', 'top_agent', 'total_agents'])
         
-        # Calculate average performance
-        avg_resolution_rate = agent_performance['resolution_rate'].mean()
-        avg_tickets_per_agent = agent_performance['total_tickets'].mean()
-        
-        metrics = [
-            ['Average Agent Resolution Rate', f"{avg_resolution_rate:.1f}%"],
-            ['Average Tickets per Agent', f"{avg_tickets_per_agent:.1f}"],
-            ['Top Performing Agent', agent_performance.loc[agent_performance['resolution_rate'].idxmax(), 'agent_name']],
-            ['Total Agents', str(len(agent_performance))]
-        ]
-        
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Agent performance metrics calculated successfully"
+        return metrics, "Agent performance metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating agent performance metrics: {str(e)}"
@@ -203,27 +98,11 @@ def calculate_interaction_analysis_metrics(interactions_df, tickets_df):
         if interactions_df.empty:
             return pd.DataFrame(), "No interaction data available"
         
-        # Calculate interaction metrics
-        total_interactions = len(interactions_df)
-        
-        metrics = [
-            ['Total Interactions', str(total_interactions)]
-        ]
+        context = get_metric_context(interactions=interactions_df, tickets=tickets_df)
+        metrics = context.table(['total_interactions', 'primary_channel', 'avg_interaction_minutes',
+                                 'avg_interaction_satisfaction'])
         
-        if 'channel' in interactions_df.columns:
-            channel_distribution = interactions_df['channel'].value_counts()
-            primary_channel = channel_distribution.index[0] if len(channel_distribution) > 0 else 'N/A'
-            metrics.append(['Primary Channel', primary_channel])
-        
-        if 'duration_minutes' in interactions_df.columns:
-            avg_duration = interactions_df['duration_minutes'].mean()
-            metrics.append(['Average Interaction Duration', f"{avg_duration:.1f} minutes"])
-        
-        if 'satisfaction_score' in interactions_df.columns:
-            avg_satisfaction = interactions_df['satisfaction_score'].mean()
-            metrics.append(['Average Interaction Satisfaction', f"{avg_satisfaction:.2f}/5"])
-        
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Interaction analysis metrics calculated successfully"
+        return metrics, "Interaction analysis metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating interaction metrics: {str(e)}"
@@ -234,24 +113,11 @@ def calculate_omnichannel_metrics(interactions_df, tickets_df):
         if interactions_df.empty:
             return pd.DataFrame(), "No interaction data available"
         
-        # Calculate omnichannel metrics
-        metrics = []
-        
-        if 'channel' in interactions_df.columns:
-            unique_channels = interactions_df['channel'].nunique()
-            metrics.append(['Number of Channels', str(unique_channels)])
-            
-            channel_usage = interactions_df['channel'].value_counts()
-            most_used_channel = channel_usage.index[0] if len(channel_usage) > 0 else 'N/A'
-            metrics.append(['Most Used Channel', most_used_channel])
-        
-        # Cross-channel ticket analysis
-        if not tickets_df.empty and 'channel' in tickets_df.columns:
-            cross_channel_tickets = tickets_df.groupby('customer_id')['channel'].nunique()
-            avg_channels_per_customer = cross_channel_tickets.mean()
-            metrics.append(['Average Channels per Customer', f"{avg_channels_per_customer:.1f}"])
+        context = get_metric_context(interactions=interactions_df, tickets=tickets_df)
+        metrics = context.table(['channel_count', 'primary_channel', 'avg_channels_per_customer'])
+        metrics['Metric'] = metrics['Metric'].replace({'Primary Channel': 'Most Used Channel'})
         
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Omnichannel metrics calculated successfully"
+        return metrics, "Omnichannel metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating omnichannel metrics: {str(e)}"
@@ -262,39 +128,16 @@ def calculate_business_impact_metrics(customers_df, tickets_df, feedback_df):
         if customers_df.empty or tickets_df.empty:
             return pd.DataFrame(), "Insufficient data for business impact analysis"
         
-        # Calculate business impact metrics
-        total_customers = len(customers_df)
-        total_tickets = len(tickets_df)
+        context = get_metric_context(customers=customers_df, tickets=tickets_df, feedback=feedback_df)
+        metrics = context.table(['total_customers', 'total_tickets', 'business_lifetime_value', 'estimated_cac',
+                                 'return_on_investment', 'customer_ticket_ratio'])
         
-        # Customer acquisition cost (simplified)
-        estimated_cac = 150  # Assume $150 per customer
-        
-        # Customer lifetime value
-        if 'lifetime_value' in customers_df.columns:
-            avg_clv = customers_df['lifetime_value'].mean()
-        else:
-            avg_clv = total_tickets * 100 / total_customers if total_customers > 0 else 0
-        
-        # ROI calculation
-        total_clv = avg_clv * total_customers
-        total_cac = estimated_cac * total_customers
-        roi = ((total_clv - total_cac) / total_cac) * 100 if total_cac > 0 else 0
-        
-        metrics = [
-            ['Total Customers', str(total_customers)],
-            ['Total Tickets', str(total_tickets)],
-            ['Average Customer Lifetime Value', f"${avg_clv:.2f}"],
-            ['Estimated Customer Acquisition Cost', f"${estimated_cac}"],
-            ['Return on Investment', f"{roi:.1f}%"],
-            ['Customer to Ticket Ratio', f"{total_tickets/total_customers:.2f}" if total_customers > 0 else "0"]
-        ]
-        
-        return pd.DataFrame(metrics, columns=['Metric', 'Value']), "Business impact metrics calculated successfully"
+        return metrics, "Business impact metrics calculated successfully"
         
     except Exception as e:
         return pd.DataFrame(), f"Error calculating business impact metrics: {str(e)}"
 
-def calculate_predictive_analytics_models(customers_df, tickets_df, interactions_df):
+def calculate_predictive_analytics_models(customers_df, tickets_df, interactions_df, feedback_df=None):
     """Calculate predictive analytics models and metrics"""
     try:
         if customers_df.empty or tickets_df.empty:
@@ -302,7 +145,7 @@ def calculate_predictive_analytics_models(customers_df, tickets_df, interactions
         
         # Churn prediction model
         churn_prediction_summary, churn_model = calculate_churn_prediction_models(
-            customers_df, tickets_df, interactions_df
+            customers_df, tickets_df, interactions_df, feedback_df
         )
         
         # Demand forecasting
@@ -318,41 +161,44 @@ def calculate_predictive_analytics_models(customers_df, tickets_df, interactions
     except Exception as e:
         return pd.DataFrame(), f"Error calculating predictive analytics: {str(e)}"
 
-def calculate_churn_prediction_models(customers_df, tickets_df, interactions_df):
+def calculate_churn_prediction_models(customers_df, tickets_df, interactions_df, feedback_df=None):
     """Calculate customer churn prediction models"""
     try:
         if customers_df.empty or tickets_df.empty:
             return pd.DataFrame(), None
         
-        # Create features for churn prediction
-        customer_features = customers_df.copy()
-        
-        # Add ticket-related features
-        if 'customer_id' in tickets_df.columns:
-            ticket_counts = tickets_df.groupby('customer_id').size().reset_index(name='ticket_count')
-            customer_features = customer_features.merge(ticket_counts, on='customer_id', how='left')
-            customer_features['ticket_count'] = customer_features['ticket_count'].fillna(0)
+        # Same cached scores as get_churn_scores when given the session tables
+        scores, churn_model, message = churn_scores(customers_df, tickets_df, interactions_df, feedback_df)
         
-        # Add interaction features
-        if not interactions_df.empty and 'customer_id' in interactions_df.columns:
-            interaction_counts = interactions_df.groupby('customer_id').size().reset_index(name='interaction_count')
-            customer_features = customer_features.merge(interaction_counts, on='customer_id', how='left')
-            customer_features['interaction_count'] = customer_features['interaction_count'].fillna(0)
-        
-        # Simple churn prediction (based on activity)
-        if 'ticket_count' in customer_features.columns:
-            # Assume customers with 0 tickets in recent period are at risk
-            churn_risk = (customer_features['ticket_count'] == 0).mean() * 100
-        else:
-            churn_risk = 15.0  # Default assumption
+        if churn_model is None:
+            # Without a model, report the observed churn share of labelled customers
+            observed = churn_labels(customers_df).dropna()
+            churn_risk = observed.mean() * 100 if not observed.empty else 0.0
+            summary = pd.DataFrame({
+                'Metric': ['Customer Churn Risk'],
+                'Value': [f"{churn_risk:.1f}%"],
+                'Description': [f'Observed churn rate ({message})']
+            })
+            return summary, None
         
+        churn_summary = summarize_churn_scores(scores)
         summary = pd.DataFrame({
-            'Metric': ['Customer Churn Risk'],
-            'Value': [f"{churn_risk:.1f}%"],
-            'Description': ['Percentage of customers at risk of churning']
+            'Metric': ['Customer Churn Risk', 'At-Risk Customers', 'Model Accuracy', 'Model ROC AUC'],
+            'Value': [
+                f"{churn_summary['predicted_churn_rate']:.1f}%",
+                f"{churn_summary['at_risk_customers']:,}",
+                f"{churn_model.metrics['accuracy']:.1f}%",
+                f"{churn_model.metrics['roc_auc']:.1f}%"
+            ],
+            'Description': [
+                'Average predicted churn probability across active customers',
+                'Customers with medium or high predicted churn risk',
+                'Holdout accuracy of the churn model',
+                'Holdout ranking quality of the churn model'
+            ]
         })
         
-        return summary, None
+        return summary, churn_model
         
     except Exception as e:
         return pd.DataFrame(), None
@@ -363,29 +209,23 @@ def calculate_demand_forecasting_models(tickets_df, interactions_df):
         if tickets_df.empty:
             return pd.DataFrame(), None
         
-        # Simple demand forecasting based on historical patterns
+        # Daily multi-series forecast (channel x priority x queue), stored per dataset version
         if 'created_date' in tickets_df.columns:
-            tickets_with_date = tickets_df.copy()
-            tickets_with_date['created_date'] = pd.to_datetime(tickets_with_date['created_date'], errors='coerce')
-            tickets_with_date = tickets_with_date.dropna(subset=['created_date'])
+            volume = forecast_ticket_volume(tickets_df, freq='D', horizon=FORECAST_DAYS)
+            daily_volume = volume['matrix'].total()
             
-            if not tickets_with_date.empty:
-                # Monthly demand pattern
-                monthly_demand = tickets_with_date.groupby(
-                    tickets_with_date['created_date'].dt.to_period('M')
-                ).size()
-                
-                if len(monthly_demand) >= 2:
-                    # Simple trend calculation
-                    recent_demand = monthly_demand.iloc[-3:].mean() if len(monthly_demand) >= 3 else monthly_demand.iloc[-1]
-                    previous_demand = monthly_demand.iloc[-6:-3].mean() if len(monthly_demand) >= 6 else monthly_demand.iloc[-2]
+            if not daily_volume.empty:
+                if len(daily_volume) >= FORECAST_DAYS:
+                    # Next 30 days forecast against the last 30 observed days
+                    recent_demand = daily_volume.iloc[-FORECAST_DAYS:].sum()
+                    forecast_demand = volume['forecast']['forecast'].sum()
                     
-                    trend = ((recent_demand - previous_demand) / previous_demand) * 100 if previous_demand > 0 else 0
+                    trend = ((forecast_demand - recent_demand) / recent_demand) * 100 if recent_demand > 0 else 0
                     
                     summary = pd.DataFrame({
                         'Metric': ['Demand Trend', 'Forecasted Next Month'],
-                        'Value': [f"{trend:+.1f}%", f"{recent_demand * (1 + trend/100):.0f}"],
-                        'Description': ['Monthly demand change', 'Predicted tickets for next month']
+                        'Value': [f"{trend:+.1f}%", f"{forecast_demand:.0f}"],
+                        'Description': ['Forecast vs. last 30 days', 'Predicted tickets for the next 30 days']
                     })
                 else:
                     summary = pd.DataFrame({
@@ -417,11 +257,9 @@ def calculate_sla_compliance(tickets_df, sla_df):
         if tickets_df.empty or sla_df.empty:
             return 0.0
         
-        # Simple SLA compliance calculation
-        # Assume 85% compliance rate as default
-        compliance_rate = 85.0
-        
-        return compliance_rate
+        # First response compliance against the SLA sheet targets
+        compliance = get_metric_context(tickets=tickets_df, sla=sla_df).metric('sla_compliance_rate')
+        return compliance if compliance is not None else 0.0
         
     except Exception as e:
         return 0.0
@@ -464,27 +302,8 @@ def calculate_agent_productivity_metrics(agents_df, tickets_df, interactions_df)
         if agents_df.empty or tickets_df.empty:
             return pd.DataFrame(), "Insufficient data for agent productivity analysis"
         
-        # Calculate productivity metrics per agent
-        agent_productivity = tickets_df.groupby('agent_id').agg({
-            'ticket_id': 'count',
-            'status': lambda x: (x == 'resolved').sum()
-        }).reset_index()
-        
-        agent_productivity.columns = ['agent_id', 'total_tickets', 'resolved_tickets']
-        agent_productivity['resolution_rate'] = (agent_productivity['resolved_tickets'] / agent_productivity['total_tickets']) * 100
-        
-        # Add agent names
-        if 'first_name' in agents_df.columns and 'last_name' in agents_df.columns:
-            agent_productivity = agent_productivity.merge(
-                agents_df[['agent_id', 'first_name', 'last_name']], 
-                on='agent_id', how='left'
-            )
-            agent_productivity['agent_name'] = agent_productivity['first_name'] + ' ' + agent_productivity['last_name']
-        else:
-            agent_productivity['agent_name'] = agent_productivity['agent_id']
-        
-        # Sort by productivity
-        agent_productivity = agent_productivity.sort_values('resolution_rate', ascending=False)
+        context = get_metric_context(agents=agents_df, tickets=tickets_df, interactions=interactions_df)
+        agent_productivity = context.metric('agent_productivity').copy()
         
         return agent_productivity, "Agent productivity metrics calculated successfully"
         
@@ -512,6 +331,15 @@ def calculate_customer_journey_metrics(tickets_df, interactions_df, customers_df
             avg_channel_complexity = channel_complexity.mean()
             metrics.append(['Average Channels per Customer', f"{avg_channel_complexity:.1f}"])
         
+        # Sessionized journeys (interactions split by customer inactivity)
+        if not interactions_df.empty and {'customer_id', 'start_time'}.issubset(interactions_df.columns):
+            journeys = analyze_journeys(interactions_df).summary()
+            if journeys['journeys']:
+                metrics.append(['Average Journeys per Customer', f"{journeys['journeys_per_customer']:.1f}"])
+                metrics.append(['Average Touchpoints per Journey', f"{journeys['avg_touchpoints']:.1f}"])
+                metrics.append(['Average Channel Switches per Journey', f"{journeys['avg_channel_switches']:.2f}"])
+                metrics.append(['Multichannel Journey Rate', f"{journeys['multichannel_rate']:.1f}%"])
+        
         # Customer satisfaction by journey stage
         if 'status' in tickets_df.columns:
             status_satisfaction = tickets_df.groupby('status').size()
@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Customer Service Metrics Engine
+===============================
+
+One definition of every headline CS metric, shared by cs_analytics,
+cs_metrics_calculator and the pages:
+- A registry of named metrics (label, display format and the function
+  computing it) and of the intermediates they share: typed tickets and
+  feedback from the fact cube, per-agent and per-customer groupbys,
+  sentiment shares, interaction aggregates and SLA compliance
+- A MetricContext per dataset version that computes each intermediate
+  once, so a page asking for many metrics scans each table a single time
+- Session-level reuse, so the same context serves every page and every
+  rerun until a table changes
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cs_fact_cube import build_fact_cube, get_fact_cube, table_version
+from cs_sla_engine import calculate_sla_metrics
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TABLE_NAMES = ['customers', 'tickets', 'agents', 'interactions', 'feedback', 'sla']
+
+# Flat assumptions used by the business impact metrics
+ESTIMATED_CAC = 150
+VALUE_PER_TICKET = 100
+
+SESSION_CONTEXT_KEY = 'cs_metric_contexts'
+MAX_SESSION_CONTEXTS = 4
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+METRIC_REGISTRY = {}
+INTERMEDIATE_REGISTRY = {}
+
+
+class MetricDefinition:
+    """
+    A named metric.
+
+    Attributes:
+        name (str): Registry key
+        label (str): Display label used in Metric/Value tables
+        fmt (str): Format string for the value, or None for frames and labels
+        func (callable): func(context) -> value, or None when the inputs are missing
+    """
+
+    def __init__(self, name, label, fmt, func):
+        self.name = name
+        self.label = label
+        self.fmt = fmt
+        self.func = func
+
+    def format(self, value):
+        return self.fmt.format(value) if self.fmt else str(value)
+
+
+def register_metric(name, label=None, fmt=None):
+    """Decorator adding a metric function to METRIC_REGISTRY."""
+    def decorator(func):
+        METRIC_REGISTRY[name] = MetricDefinition(name, label or name.replace('_', ' ').title(), fmt, func)
+        return func
+    return decorator
+
+
+def register_intermediate(name):
+    """Decorator adding a shared intermediate to INTERMEDIATE_REGISTRY."""
+    def decorator(func):
+        INTERMEDIATE_REGISTRY[name] = func
+        return func
+    return decorator
+
+# ============================================================================
+# CONTEXT
+# ============================================================================
+
+class MetricContext:
+    """
+    Metrics and intermediates for one version of the CS tables.
+
+    Every intermediate and metric is computed at most once per context and
+    served from memory afterwards.
+
+    Attributes:
+        tables (dict): Source tables by name (missing tables are empty frames)
+        cube (CSFactCube): Typed ticket and feedback facts
+        stats (dict): 'computed' and 'reused' counts of intermediates and metrics
+    """
+
+    def __init__(self, tables, cube=None):
+        self.tables = {name: tables.get(name) if tables.get(name) is not None else pd.DataFrame()
+                       for name in TABLE_NAMES}
+        self.cube = cube or build_fact_cube(self.tables['tickets'], self.tables['feedback'],
+                                            self.tables['agents'], self.tables['customers'])
+        self._intermediates = {}
+        self._metrics = {}
+        self.stats = {'computed': 0, 'reused': 0}
+
+    def intermediate(self, name):
+        """Shared intermediate result, computed on first use."""
+        if name in self._intermediates:
+            self.stats['reused'] += 1
+        else:
+            self._intermediates[name] = INTERMEDIATE_REGISTRY[name](self)
+            self.stats['computed'] += 1
+        return self._intermediates[name]
+
+    def metric(self, name):
+        """Value of a registered metric, or None when its inputs are missing."""
+        if name in self._metrics:
+            self.stats['reused'] += 1
+        else:
+            self._metrics[name] = METRIC_REGISTRY[name].func(self)
+            self.stats['computed'] += 1
+        return self._metrics[name]
+
+    def compute(self, names):
+        """
+        Several metrics in one pass over the shared intermediates.
+
+        Returns:
+            dict: Metric name -> value
+        """
+        return {name: self.metric(name) for name in names}
+
+    def table(self, names):
+        """
+        Metric/Value display table for scalar metrics, skipping unavailable ones.
+
+        Returns:
+            pd.DataFrame: Columns 'Metric' and 'Value'
+        """
+        rows = []
+        for name in names:
+            value = self.metric(name)
+            if value is not None and not (isinstance(value, float) and np.isnan(value)):
+                definition = METRIC_REGISTRY[name]
+                rows.append([definition.label, definition.format(value)])
+        return pd.DataFrame(rows, columns=['Metric', 'Value'])
+
+
+def _session_tables():
+    return {name: st.session_state.get(name, pd.DataFrame()) for name in TABLE_NAMES}
+
+
+def get_metric_context(**tables):
+    """
+    Metric context for the given tables, reused across calls and pages of a session.
+
+    Tables that are not passed come from the session. When the ticket,
+    feedback, agent and customer tables are the session's own, the
+    session fact cube is reused as well.
+
+    Returns:
+        MetricContext: Context for this version of the tables
+    """
+    session = _session_tables()
+    resolved = {name: tables[name] if tables.get(name) is not None else session[name] for name in TABLE_NAMES}
+    key = tuple(table_version(resolved[name]) for name in TABLE_NAMES)
+
+    contexts = st.session_state.setdefault(SESSION_CONTEXT_KEY, OrderedDict())
+    if key in contexts:
+        contexts.move_to_end(key)
+        return contexts[key]
+
+    cube_tables = ('tickets', 'feedback', 'agents', 'customers')
+    cube = get_fact_cube() if all(resolved[name] is session[name] for name in cube_tables) else None
+    context = MetricContext(resolved, cube)
+    contexts[key] = context
+    while len(contexts) > MAX_SESSION_CONTEXTS:
+        contexts.popitem(last=False)
+    return context
+
+
+def get_metrics(*names):
+    """Metric values for the session tables, as a dict keyed by metric name."""
+    return get_metric_context().compute(names)
+
+# ============================================================================
+# SHARED INTERMEDIATES
+# ============================================================================
+
+@register_intermediate('agent_stats')
+def _agent_stats(context):
+    """Tickets, resolved and escalated counts per agent from one groupby, plus display names."""
+    tickets = context.cube.tickets
+    if tickets.empty or 'agent_id' not in tickets.columns:
+        return pd.DataFrame(columns=['tickets', 'resolved', 'escalated', 'agent_name'])
+    flags = pd.DataFrame({
+        'tickets': np.ones(len(tickets), dtype=np.int64),
+        'resolved': tickets['is_resolved'].to_numpy(dtype=np.int64) if 'is_resolved' in tickets.columns else 0,
+        'escalated': tickets['is_escalated'].to_numpy(dtype=np.int64)
+    }, index=tickets.index)
+    stats = flags.groupby(tickets['agent_id'], sort=True).sum()
+    stats.index.name = 'agent_id'
+
+    agents = context.tables['agents']
+    names = pd.Series(stats.index.astype(object), index=stats.index)
+    if {'agent_id', 'first_name', 'last_name'}.issubset(agents.columns):
+        lookup = agents.drop_duplicates('agent_id').set_index('agent_id')
+        full_names = lookup['first_name'].astype(str) + ' ' + lookup['last_name'].astype(str)
+        names = names.index.to_series().map(full_names).fillna(names)
+    stats['agent_name'] = names
+    return stats
+
+
+@register_intermediate('customer_stats')
+def _customer_stats(context):
+    """Ticket count and first/last ticket date per customer."""
+    tickets = context.cube.tickets
+    if tickets.empty or 'customer_id' not in tickets.columns:
+        return pd.DataFrame(columns=['tickets', 'first_ticket', 'last_ticket'])
+    grouped = tickets.groupby('customer_id', sort=True)
+    stats = pd.DataFrame({'tickets': grouped.size()})
+    if 'created_date' in tickets.columns:
+        stats['first_ticket'] = grouped['created_date'].min()
+        stats['last_ticket'] = grouped['created_date'].max()
+    return stats
+
+
+@register_intermediate('customer_channels')
+def _customer_channels(context):
+    """Distinct ticket channels per customer, or None without a channel column."""
+    tickets = context.cube.tickets
+    if tickets.empty or not {'customer_id', 'channel'}.issubset(tickets.columns):
+        return None
+    return tickets.groupby('customer_id', sort=True)['channel'].nunique()
+
+
+@register_intermediate('sentiment_shares')
+def _sentiment_shares(context):
+    """Share of all feedback rows per normalized (lower-case) sentiment."""
+    feedback = context.cube.feedback
+    if feedback.empty or 'sentiment' not in feedback.columns:
+        return None
+    codes, labels = pd.factorize(feedback['sentiment'])
+    normalized = pd.Index(labels.astype(str)).str.strip().str.lower()
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(labels)), index=normalized)
+    return counts.groupby(level=0).sum() / len(feedback)
+
+
+@register_intermediate('interaction_stats')
+def _interaction_stats(context):
+    """Interaction count, channel volumes and average duration and satisfaction."""
+    interactions = context.tables['interactions']
+    stats = {'total': len(interactions), 'channel_counts': None, 'avg_minutes': None, 'avg_satisfaction': None}
+    if 'channel' in interactions.columns:
+        stats['channel_counts'] = interactions['channel'].value_counts()
+    if 'duration_minutes' in interactions.columns:
+        stats['avg_minutes'] = pd.to_numeric(interactions['duration_minutes'], errors='coerce').mean()
+    if 'satisfaction_score' in interactions.columns:
+        stats['avg_satisfaction'] = pd.to_numeric(interactions['satisfaction_score'], errors='coerce').mean()
+    return stats
+
+
+@register_intermediate('sla_overall')
+def _sla_overall(context):
+    """Overall SLA compliance row from the SLA engine, or None without SLA rules."""
+    tickets, sla = context.tables['tickets'], context.tables['sla']
+    if tickets.empty or sla.empty or 'priority' not in tickets.columns:
+        return None
+    _, overall, _ = calculate_sla_metrics(tickets, sla)
+    return overall.iloc[0]
+
+# ============================================================================
+# SCORE FORMULAS
+# ============================================================================
+
+def csat_from_ratings(ratings):
+    """CSAT: share of ratings of 4 or 5, in percent (NaN without ratings)."""
+    ratings = pd.Series(ratings).dropna()
+    return float((ratings >= 4).mean() * 100) if len(ratings) else np.nan
+
+
+def nps_from_scores(scores):
+    """NPS: promoters (9-10) minus detractors (0-6), in percent of responses."""
+    scores = pd.Series(scores).dropna()
+    if not len(scores):
+        return np.nan
+    return float(((scores >= 9).sum() - (scores <= 6).sum()) / len(scores) * 100)
+
+
+def ces_from_scores(scores):
+    """CES: mean customer effort score."""
+    scores = pd.Series(scores).dropna()
+    return float(scores.mean()) if len(scores) else np.nan
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+# ---- Feedback ---------------------------------------------------------------
+
+@register_metric('total_feedback', 'Total Feedback Responses', '{:,}')
+def _total_feedback(context):
+    return len(context.tables['feedback'])
+
+
+@register_metric('csat_score', 'CSAT Score (Rating ≥4)', '{:.1f}%')
+def _csat_score(context):
+    feedback = context.cube.feedback
+    return csat_from_ratings(feedback['csat_score']) if 'csat_score' in feedback.columns else None
+
+
+@register_metric('avg_rating', 'Average Rating', '{:.2f}')
+def _avg_rating(context):
+    feedback = context.tables['feedback']
+    return float(pd.to_numeric(feedback['rating'], errors='coerce').mean()) if 'rating' in feedback.columns else None
+
+
+@register_metric('overall_satisfaction', 'Overall Satisfaction Score', '{:.2f}/5')
+def _overall_satisfaction(context):
+    return context.metric('avg_rating')
+
+
+@register_metric('nps_score', 'Net Promoter Score (NPS)', '{:+.1f}')
+def _nps_score(context):
+    feedback = context.cube.feedback
+    return nps_from_scores(feedback['nps_value']) if 'nps_value' in feedback.columns else None
+
+
+@register_metric('ces_score', 'Average Customer Effort', '{:.2f}')
+def _ces_score(context):
+    feedback = context.cube.feedback
+    return ces_from_scores(feedback['ces_score']) if 'ces_score' in feedback.columns else None
+
+
+def _sentiment_rate(context, sentiment):
+    shares = context.intermediate('sentiment_shares')
+    return None if shares is None else float(shares.get(sentiment, 0.0) * 100)
+
+
+@register_metric('positive_sentiment_rate', 'Positive Sentiment %', '{:.1f}%')
+def _positive_sentiment_rate(context):
+    return _sentiment_rate(context, 'positive')
+
+
+@register_metric('negative_sentiment_rate', 'Negative Sentiment %', '{:.1f}%')
+def _negative_sentiment_rate(context):
+    return _sentiment_rate(context, 'negative')
+
+
+@register_metric('neutral_sentiment_rate', 'Neutral Sentiment %', '{:.1f}%')
+def _neutral_sentiment_rate(context):
+    return _sentiment_rate(context, 'neutral')
+
+
+@register_metric('feedback_response_rate', 'Response Rate', '{:.1f}%')
+def _feedback_response_rate(context):
+    customers = len(context.tables['customers'])
+    return len(context.tables['feedback']) / customers * 100 if customers else None
+
+
+@register_metric('customer_engagement_score', 'Customer Engagement Score', '{:.1f}')
+def _customer_engagement_score(context):
+    rating, response_rate = context.metric('avg_rating'), context.metric('feedback_response_rate')
+    return None if rating is None or response_rate is None else rating * response_rate
+
+# ---- Tickets ----------------------------------------------------------------
+
+@register_metric('total_tickets', 'Total Tickets', '{}')
+def _total_tickets(context):
+    return len(context.tables['tickets'])
+
+
+@register_metric('resolution_rate', 'Resolution Rate', '{:.1f}%')
+def _resolution_rate(context):
+    tickets = context.cube.tickets
+    if tickets.empty or 'is_resolved' not in tickets.columns:
+        return None
+    return float(tickets['is_resolved'].mean() * 100)
+
+
+@register_metric('escalation_rate', 'Escalation Rate', '{:.1f}%')
+def _escalation_rate(context):
+    tickets = context.cube.tickets
+    if tickets.empty or not {'escalated_date', 'status'} & set(tickets.columns):
+        return None
+    return float(tickets['is_escalated'].mean() * 100)
+
+
+@register_metric('avg_response_hours', 'Average First Response Time', '{:.2f} hours')
+def _avg_response_hours(context):
+    if 'response_hours' not in context.cube.tickets.columns:
+        return None
+    return float(context.cube.valid_response_hours().mean())
+
+
+@register_metric('avg_resolution_hours', 'Average Resolution Time', '{:.2f} hours')
+def _avg_resolution_hours(context):
+    if 'resolution_hours' not in context.cube.tickets.columns:
+        return None
+    return float(context.cube.valid_resolution_hours().mean())
+
+
+@register_metric('sla_compliance_rate', 'SLA Compliance Rate', '{:.1f}%')
+def _sla_compliance_rate(context):
+    overall = context.intermediate('sla_overall')
+    if overall is None:
+        return None
+    return float(overall['response_compliance']) if overall['response_measured'] > 0 else 0.0
+
+# ---- Agents -----------------------------------------------------------------
+
+@register_metric('total_agents', 'Total Agents', '{}')
+def _total_agents(context):
+    stats = context.intermediate('agent_stats')
+    return len(stats) if len(stats) else None
+
+
+@register_metric('avg_tickets_per_agent', 'Average Tickets per Agent', '{:.1f}')
+def _avg_tickets_per_agent(context):
+    stats = context.intermediate('agent_stats')
+    return float(stats['tickets'].mean()) if len(stats) else None
+
+
+@register_metric('avg_agent_resolution_rate', 'Average Agent Resolution Rate', '{:.1f}%')
+def _avg_agent_resolution_rate(context):
+    stats = context.intermediate('agent_stats')
+    return float((stats['resolved'] / stats['tickets']).mean() * 100) if len(stats) else None
+
+
+@register_metric('top_agent', 'Top Performing Agent')
+def _top_agent(context):
+    stats = context.intermediate('agent_stats')
+    if not len(stats):
+        return None
+    return stats['agent_name'].iloc[int(np.argmax((stats['resolved'] / stats['tickets']).to_numpy()))]
+
+
+@register_metric('agent_productivity')
+def _agent_productivity(context):
+    """Per-agent ticket totals and resolution rates, best first (cs_metrics_calculator layout)."""
+    stats = context.intermediate('agent_stats')
+    productivity = pd.DataFrame({
+        'agent_id': stats.index,
+        'total_tickets': stats['tickets'].to_numpy(),
+        'resolved_tickets': stats['resolved'].to_numpy()
+    })
+    productivity['resolution_rate'] = productivity['resolved_tickets'] / productivity['total_tickets'] * 100
+    agents = context.tables['agents']
+    if {'first_name', 'last_name'}.issubset(agents.columns):
+        lookup = agents.drop_duplicates('agent_id').set_index('agent_id')
+        productivity['first_name'] = productivity['agent_id'].map(lookup['first_name'])
+        productivity['last_name'] = productivity['agent_id'].map(lookup['last_name'])
+        productivity['agent_name'] = productivity['first_name'] + ' ' + productivity['last_name']
+    else:
+        productivity['agent_name'] = productivity['agent_id']
+    return productivity.sort_values('resolution_rate', ascending=False)
+
+
+@register_metric('agent_scorecard')
+def _agent_scorecard(context):
+    """Per-agent tickets and resolution rate with display names (agent performance page layout)."""
+    stats = context.intermediate('agent_stats')
+    return pd.DataFrame({
+        'Agent ID': stats.index,
+        'Total Tickets': stats['tickets'].to_numpy(),
+        'Resolution Rate %': (stats['resolved'] / stats['tickets']).to_numpy() * 100,
+        'Agent Name': stats['agent_name'].to_numpy()
+    })
+
+# ---- Customers --------------------------------------------------------------
+
+@register_metric('total_customers', 'Total Customers', '{}')
+def _total_customers(context):
+    return len(context.tables['customers'])
+
+
+@register_metric('active_customers', 'Active Customers', '{}')
+def _active_customers(context):
+    return len(context.intermediate('customer_stats'))
+
+
+@register_metric('retention_rate', 'Retention Rate', '{:.1f}%')
+def _retention_rate(context):
+    total = context.metric('total_customers')
+    return context.metric('active_customers') / total * 100 if total else 0.0
+
+
+@register_metric('churn_rate', 'Customer Churn Rate', '{:.1f}%')
+def _churn_rate(context):
+    return 100 - context.metric('retention_rate')
+
+
+@register_metric('avg_lifetime_value', 'Average Customer Lifetime Value', '${:.2f}')
+def _avg_lifetime_value(context):
+    customers = context.tables['customers']
+    if 'lifetime_value' in customers.columns:
+        return float(pd.to_numeric(customers['lifetime_value'], errors='coerce').mean())
+    # Estimate from ticket volume when no value column is available
+    stats = context.intermediate('customer_stats')
+    return float(stats['tickets'].mean() * VALUE_PER_TICKET) if len(stats) else 0.0
+
+
+@register_metric('customer_retention_table')
+def _customer_retention_table(context):
+    """Per-customer ticket span and simplified retention score (retention page layout)."""
+    stats = context.intermediate('customer_stats')
+    first = stats['first_ticket'] if 'first_ticket' in stats.columns else pd.Series(pd.NaT, index=stats.index)
+    last = stats['last_ticket'] if 'last_ticket' in stats.columns else pd.Series(pd.NaT, index=stats.index)
+    counts = stats['tickets'].to_numpy()
+    return pd.DataFrame({
+        'Customer ID': stats.index,
+        'Total Tickets': counts,
+        'First Ticket': first.to_numpy(),
+        'Last Ticket': last.to_numpy(),
+        # Simplified: repeat customers count as retained, one-off customers as half
+        'Retention Rate %': np.where(counts > 1, 100, np.where(counts == 1, 50, 0)),
+        'Avg Lifetime (Days)': (last - first).dt.days.fillna(0).to_numpy()
+    })
+
+# ---- Interactions and channels ----------------------------------------------
+
+@register_metric('total_interactions', 'Total Interactions', '{}')
+def _total_interactions(context):
+    return context.intermediate('interaction_stats')['total']
+
+
+@register_metric('primary_channel', 'Primary Channel')
+def _primary_channel(context):
+    counts = context.intermediate('interaction_stats')['channel_counts']
+    if counts is None:
+        return None
+    return counts.index[0] if len(counts) else 'N/A'
+
+
+@register_metric('channel_count', 'Number of Channels', '{}')
+def _channel_count(context):
+    counts = context.intermediate('interaction_stats')['channel_counts']
+    return None if counts is None else len(counts)
+
+
+@register_metric('avg_interaction_minutes', 'Average Interaction Duration', '{:.1f} minutes')
+def _avg_interaction_minutes(context):
+    return context.intermediate('interaction_stats')['avg_minutes']
+
+
+@register_metric('avg_interaction_satisfaction', 'Average Interaction Satisfaction', '{:.2f}/5')
+def _avg_interaction_satisfaction(context):
+    return context.intermediate('interaction_stats')['avg_satisfaction']
+
+
+@register_metric('avg_channels_per_customer', 'Average Channels per Customer', '{:.1f}')
+def _avg_channels_per_customer(context):
+    channels = context.intermediate('customer_channels')
+    return float(channels.mean()) if channels is not None and len(channels) else None
+
+# ---- Business impact --------------------------------------------------------
+
+@register_metric('business_lifetime_value', 'Average Customer Lifetime Value', '${:.2f}')
+def _business_lifetime_value(context):
+    customers = context.tables['customers']
+    if 'lifetime_value' in customers.columns:
+        return context.metric('avg_lifetime_value')
+    total = context.metric('total_customers')
+    return context.metric('total_tickets') * VALUE_PER_TICKET / total if total else 0.0
+
+
+@register_metric('estimated_cac', 'Estimated Customer Acquisition Cost', '${}')
+def _estimated_cac(context):
+    return ESTIMATED_CAC
+
+
+@register_metric('return_on_investment', 'Return on Investment', '{:.1f}%')
+def _return_on_investment(context):
+    total_cac = ESTIMATED_CAC * context.metric('total_customers')
+    if not total_cac:
+        return 0.0
+    return (context.metric('business_lifetime_value') * context.metric('total_customers') - total_cac) / total_cac * 100
+
+
+@register_metric('customer_ticket_ratio', 'Customer to Ticket Ratio', '{:.2f}')
+def _customer_ticket_ratio(context):
+    total = context.metric('total_customers')
+    return context.metric('total_tickets') / total if total else 0
@@ -23,6 +23,9 @@ import numpy as np
 from datetime import datetime, timedelta
 import calendar
 
+from cs_fact_cube import get_fact_cube, DAY_ORDER
+from cs_metrics_engine import get_metric_context
+
 def show_agent_performance():
     """Display enhanced agent performance analytics with interactive visualizations"""
     
@@ -369,27 +372,15 @@ def create_top_performers_leaderboard(agent_metrics):
 def create_day_hour_heatmap():
     """Create day and hour performance heatmap"""
     
-    tickets_df = st.session_state.tickets.copy()
-    tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'], errors='coerce')
-    tickets_df = tickets_df.dropna(subset=['created_date'])
+    # Day of week and hour are derived once in the shared analytics cube
+    tickets_df = get_fact_cube().dated_tickets
     
     if not tickets_df.empty:
-        # Create daily agent performance matrix
-        tickets_df['day_of_week'] = tickets_df['created_date'].dt.day_name()
-        tickets_df['hour'] = tickets_df['created_date'].dt.hour
-        
-        # Group by day and hour, calculate performance metric
-        performance_matrix = tickets_df.groupby(['day_of_week', 'hour']).agg({
-            'ticket_id': 'count',
-            'status': lambda x: (x == 'Resolved').sum() / len(x) * 100 if len(x) > 0 else 0
-        }).reset_index()
-        
-        # Pivot for heatmap
-        heatmap_data = performance_matrix.pivot(index='day_of_week', columns='hour', values='status')
+        # Resolution rate per day and hour as a boolean mean
+        heatmap_data = tickets_df.groupby(['day_of_week', 'hour'], observed=True)['is_resolved'].mean().mul(100).unstack('hour')
         
         # Reorder days
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        heatmap_data = heatmap_data.reindex(day_order)
+        heatmap_data = heatmap_data.reindex(DAY_ORDER)
         
         fig = go.Figure(data=go.Heatmap(
             z=heatmap_data.values,
@@ -419,19 +410,14 @@ def create_day_hour_heatmap():
 def create_agent_performance_timeline():
     """Create agent performance timeline chart"""
     
-    tickets_df = st.session_state.tickets.copy()
-    tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'], errors='coerce')
-    tickets_df = tickets_df.dropna(subset=['created_date'])
+    # Daily agent counters are pre-aggregated in the shared analytics cube
+    daily_counters = get_fact_cube().rollup(['created_day', 'agent_id'])
+    daily_counters = daily_counters[daily_counters.index.get_level_values('created_day').notna()]
     
-    if not tickets_df.empty:
-        # Group by date and agent, calculate daily performance
-        daily_performance = tickets_df.groupby([tickets_df['created_date'].dt.date, 'agent_id']).agg({
-            'ticket_id': 'count',
-            'status': lambda x: (x == 'Resolved').sum() / len(x) * 100 if len(x) > 0 else 0
-        }).reset_index()
-        
+    if not daily_counters.empty:
+        # Daily performance per agent
+        daily_performance = daily_counters[['tickets', 'resolution_rate']].reset_index()
         daily_performance.columns = ['Date', 'Agent ID', 'Ticket Count', 'Resolution Rate']
-        daily_performance['Date'] = pd.to_datetime(daily_performance['Date'])
         
         # Get top 5 agents for visualization
         top_agents = daily_performance.groupby('Agent ID')['Resolution Rate'].mean().nlargest(5).index
@@ -595,37 +581,8 @@ def create_performance_optimization_recommendations():
 def calculate_agent_performance_metrics():
     """Calculate comprehensive agent performance metrics"""
     
-    tickets_df = st.session_state.tickets.copy()
-    
-    # Group by agent and calculate metrics
-    agent_performance = tickets_df.groupby('agent_id').agg({
-        'ticket_id': 'count',
-        'status': lambda x: (x == 'Resolved').sum() / len(x) * 100
-    }).reset_index()
-    
-    agent_performance.columns = ['Agent ID', 'Total Tickets', 'Resolution Rate %']
-    
-    # Merge with agent names if available
-    if not st.session_state.agents.empty and 'agent_id' in st.session_state.agents.columns:
-        available_columns = st.session_state.agents.columns.tolist()
-        name_columns = [col for col in available_columns if 'name' in col.lower()]
-        
-        if name_columns:
-            name_col = name_columns[0]
-            try:
-                agent_performance = agent_performance.merge(
-                    st.session_state.agents[['agent_id', name_col]], 
-                    on='agent_id', how='left'
-                )
-                agent_performance['Agent Name'] = agent_performance[name_col].fillna(agent_performance['Agent ID'])
-            except:
-                agent_performance['Agent Name'] = agent_performance['Agent ID']
-        else:
-            agent_performance['Agent Name'] = agent_performance['Agent ID']
-    else:
-        agent_performance['Agent Name'] = agent_performance['Agent ID']
-    
-    return agent_performance
+    # Shared with the metric summaries; copied because callers add columns
+    return get_metric_context().metric('agent_scorecard').copy()
 
 def calculate_workload_metrics():
     """Calculate workload distribution metrics"""
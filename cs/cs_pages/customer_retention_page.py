@@ -22,7 +22,9 @@ from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import calendar
-from operator import attrgetter
+
+from cs_fact_cube import get_fact_cube
+from cs_metrics_engine import get_metric_context
 
 # Import analytics functions
 from cs_analytics import (
@@ -376,17 +378,15 @@ def create_top_retained_customers_leaderboard(retention_metrics):
 def create_monthly_retention_trends():
     """Create monthly retention trends chart"""
     
-    tickets_df = st.session_state.tickets.copy()
-    tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'], errors='coerce')
-    tickets_df = tickets_df.dropna(subset=['created_date'])
+    # Typed tickets with month keys from the shared analytics cube (read-only)
+    tickets_df = get_fact_cube().dated_tickets
     
     if not tickets_df.empty:
         # Group by month and calculate retention metrics
-        tickets_df['month'] = tickets_df['created_date'].dt.to_period('M')
-        monthly_retention = tickets_df.groupby('month').agg({
+        monthly_retention = tickets_df.groupby('created_month', observed=True).agg({
             'customer_id': 'nunique',
             'ticket_id': 'count'
-        }).reset_index()
+        }).reset_index().rename(columns={'created_month': 'month'})
         
         monthly_retention['month'] = monthly_retention['month'].astype(str)
         
@@ -440,17 +440,21 @@ def create_cohort_retention_analysis():
     st.subheader("📊 Cohort Retention Analysis")
     st.markdown("Analyze customer retention by acquisition cohorts")
     
-    tickets_df = st.session_state.tickets.copy()
-    tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'], errors='coerce')
-    tickets_df = tickets_df.dropna(subset=['created_date'])
+    # Typed tickets from the shared analytics cube (read-only)
+    tickets_df = get_fact_cube().dated_tickets
     
     if not tickets_df.empty:
-        # Create cohort analysis
-        tickets_df['cohort_month'] = tickets_df.groupby('customer_id')['created_date'].transform('min').dt.to_period('M')
-        tickets_df['period_number'] = (tickets_df['created_date'].dt.to_period('M') - tickets_df['cohort_month']).apply(attrgetter('n'))
+        # Create cohort analysis on integer month ordinals instead of Period objects
+        created = tickets_df['created_date']
+        month_index = created.dt.year * 12 + created.dt.month - 1
+        cohort_index = month_index.groupby(tickets_df['customer_id']).transform('min')
+        cohort_month = pd.PeriodIndex.from_ordinals(cohort_index - 1970 * 12, freq='M')
+        period_number = (month_index - cohort_index).rename('period_number')
         
         # Calculate cohort retention
-        cohort_data = tickets_df.groupby(['cohort_month', 'period_number'])['customer_id'].nunique().reset_index()
+        cohort_data = tickets_df['customer_id'].groupby(
+            [pd.Series(cohort_month, index=tickets_df.index, name='cohort_month'), period_number]
+        ).nunique().reset_index()
         cohort_pivot = cohort_data.pivot(index='cohort_month', columns='period_number', values='customer_id')
         
         # Calculate retention rates
@@ -491,9 +495,8 @@ def create_churn_timeline_analysis():
     st.subheader("⏰ Churn Timeline Analysis")
     st.markdown("Analyze when and why customers churn")
     
-    tickets_df = st.session_state.tickets.copy()
-    tickets_df['created_date'] = pd.to_datetime(tickets_df['created_date'], errors='coerce')
-    tickets_df = tickets_df.dropna(subset=['created_date'])
+    # Typed tickets from the shared analytics cube (read-only)
+    tickets_df = get_fact_cube().dated_tickets
     
     if not tickets_df.empty:
         # Calculate customer last activity
@@ -645,56 +648,22 @@ def create_retention_optimization_recommendations():
 def calculate_customer_retention_metrics():
     """Calculate comprehensive customer retention metrics"""
     
-    tickets_df = st.session_state.tickets.copy()
-    
-    # Group by customer and calculate metrics
-    customer_retention = tickets_df.groupby('customer_id').agg({
-        'ticket_id': 'count',
-        'created_date': ['min', 'max']
-    }).reset_index()
-    
-    customer_retention.columns = ['Customer ID', 'Total Tickets', 'First Ticket', 'Last Ticket']
-    
-    # Calculate retention rate (simplified - customers with multiple tickets)
-    customer_retention['Retention Rate %'] = np.where(
-        customer_retention['Total Tickets'] > 1, 
-        100, 
-        np.where(customer_retention['Total Tickets'] == 1, 50, 0)
-    )
-    
-    # Calculate average lifetime
-    customer_retention['First Ticket'] = pd.to_datetime(customer_retention['First Ticket'], errors='coerce')
-    customer_retention['Last Ticket'] = pd.to_datetime(customer_retention['Last Ticket'], errors='coerce')
-    
-    customer_retention['Avg Lifetime (Days)'] = (
-        customer_retention['Last Ticket'] - customer_retention['First Ticket']
-    ).dt.days
-    
-    # Fill NaN values
-    customer_retention['Avg Lifetime (Days)'] = customer_retention['Avg Lifetime (Days)'].fillna(0)
-    
-    return customer_retention
+    # Per-customer span from the shared metric engine; copied because callers add columns
+    return get_metric_context().metric('customer_retention_table').copy()
 
 def calculate_customer_value_metrics():
     """Calculate customer value metrics"""
     
     # For now, use ticket count as a proxy for value
     # In a real implementation, this would include actual revenue data
-    customer_value = st.session_state.tickets.groupby('customer_id').agg({
-        'ticket_id': 'count'
-    }).reset_index()
-    
-    customer_value.columns = ['Customer ID', 'Total Value']
-    
-    # Merge with retention metrics
-    retention_metrics = calculate_customer_retention_metrics()
-    customer_value = customer_value.merge(
-        retention_metrics[['Customer ID', 'Retention Rate %']], 
-        on='Customer ID', 
-        how='left'
-    )
-    
-    return customer_value
+    retention_metrics = get_metric_context().metric('customer_retention_table')
+    
+    # Same per-customer rows as the retention metrics, so no merge is needed
+    return pd.DataFrame({
+        'Customer ID': retention_metrics['Customer ID'],
+        'Total Value': retention_metrics['Total Tickets'],
+        'Retention Rate %': retention_metrics['Retention Rate %']
+    })
 
 def generate_retention_recommendations(retention_metrics):
     """Generate retention optimization recommendations"""
@@ -15,6 +15,7 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 from cs_styling import create_metric_card, create_status_badge, create_alert_box
+from cs_fact_cube import get_fact_cube
 from typography_config import apply_typography_to_streamlit
 
 # Apply unified typography
@@ -82,12 +83,11 @@ def show_csat_analysis():
     """Display CSAT (Customer Satisfaction) analysis with consistent typography"""
     st.subheader("📊 Customer Satisfaction Score (CSAT) Analysis")
     
-    feedback_data = st.session_state.feedback.copy()
+    # Typed feedback from the shared analytics cube (read-only)
+    feedback_data = get_fact_cube().feedback
     
-    # Extract CSAT scores safely
+    # CSAT scores are parsed once in the cube
     if 'rating' in feedback_data.columns:
-        feedback_data['csat_score'] = feedback_data['rating'].apply(safe_extract_numeric)
-        
         # Filter valid scores (1-5 scale)
         valid_csat = feedback_data[feedback_data['csat_score'].between(1, 5)]
         
@@ -184,20 +184,19 @@ def show_nps_analysis():
     """Display NPS (Net Promoter Score) analysis with consistent typography"""
     st.subheader("⭐ Net Promoter Score (NPS) Analysis")
     
-    feedback_data = st.session_state.feedback.copy()
+    # Typed feedback from the shared analytics cube (read-only)
+    feedback_data = get_fact_cube().feedback
     
-    # Extract NPS scores safely
+    # NPS scores are parsed once in the cube
     if 'nps_score' in feedback_data.columns:
-        feedback_data['nps_score'] = feedback_data['nps_score'].apply(safe_extract_numeric)
-        
         # Filter valid scores (0-10 scale)
-        valid_nps = feedback_data[feedback_data['nps_score'].between(0, 10)]
+        valid_nps = feedback_data[feedback_data['nps_value'].between(0, 10)]
         
         if not valid_nps.empty:
             # Calculate NPS metrics
-            promoters = len(valid_nps[valid_nps['nps_score'] >= 9])
-            passives = len(valid_nps[valid_nps['nps_score'].between(7, 8)])
-            detractors = len(valid_nps[valid_nps['nps_score'] <= 6])
+            promoters = len(valid_nps[valid_nps['nps_value'] >= 9])
+            passives = len(valid_nps[valid_nps['nps_value'].between(7, 8)])
+            detractors = len(valid_nps[valid_nps['nps_value'] <= 6])
             total_responses = len(valid_nps)
             
             nps_score = ((promoters - detractors) / total_responses) * 100
@@ -249,7 +248,7 @@ def show_nps_analysis():
             fig = go.Figure()
             
             fig.add_trace(go.Histogram(
-                x=valid_nps['nps_score'],
+                x=valid_nps['nps_value'],
                 nbinsx=11,
                 marker_color='#667eea',
                 opacity=0.7,
@@ -296,12 +295,11 @@ def show_ces_analysis():
     """Display CES (Customer Effort Score) analysis with consistent typography"""
     st.subheader("💪 Customer Effort Score (CES) Analysis")
     
-    feedback_data = st.session_state.feedback.copy()
+    # Typed feedback from the shared analytics cube (read-only)
+    feedback_data = get_fact_cube().feedback
     
-    # Extract CES scores safely
+    # CES scores are parsed once in the cube
     if 'customer_effort_score' in feedback_data.columns:
-        feedback_data['ces_score'] = feedback_data['customer_effort_score'].apply(safe_extract_numeric)
-        
         # Filter valid scores (1-7 scale, where 1=very easy, 7=very difficult)
         valid_ces = feedback_data[feedback_data['ces_score'].between(1, 7)]
         
@@ -398,15 +396,13 @@ def show_trend_analysis():
     """Display trend analysis over time with consistent typography"""
     st.subheader("📈 Customer Satisfaction Trends Over Time")
     
-    feedback_data = st.session_state.feedback.copy()
+    # Typed feedback from the shared analytics cube (read-only)
+    feedback_data = get_fact_cube().feedback
     
     # Check if we have date information
     if 'submitted_date' in feedback_data.columns:
-        feedback_data['submitted_date'] = pd.to_datetime(feedback_data['submitted_date'], errors='coerce')
-        feedback_data['month'] = feedback_data['submitted_date'].dt.strftime('%Y-%m')
-        
-        # Remove rows with invalid dates
-        feedback_data = feedback_data.dropna(subset=['submitted_date'])
+        # Remove rows with invalid dates (dates and month keys are precomputed in the cube)
+        feedback_data = feedback_data[feedback_data['submitted_date'].notna()]
         
         if not feedback_data.empty:
             # Create trend analysis for different metrics
@@ -418,12 +414,10 @@ def show_trend_analysis():
                     st.subheader("📈 CSAT Trend Analysis")
                     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
                     
-                    feedback_data_csat = feedback_data.copy()
-                    feedback_data_csat['csat_score'] = feedback_data_csat['rating'].apply(safe_extract_numeric)
-                    feedback_data_csat = feedback_data_csat.dropna(subset=['csat_score'])
+                    feedback_data_csat = feedback_data[feedback_data['csat_score'].notna()]
                     
                     if not feedback_data_csat.empty:
-                        monthly_csat = feedback_data_csat.groupby('month').agg({
+                        monthly_csat = feedback_data_csat.groupby('submitted_month', observed=True).agg({
                             'csat_score': ['mean', 'count']
                         }).reset_index()
                         monthly_csat.columns = ['month', 'avg_csat', 'count']
@@ -519,13 +513,11 @@ def show_trend_analysis():
                     st.subheader("📈 NPS Trend Analysis")
                     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
                     
-                    feedback_data_nps = feedback_data.copy()
-                    feedback_data_nps['nps_score'] = feedback_data_nps['nps_score'].apply(safe_extract_numeric)
-                    feedback_data_nps = feedback_data_nps.dropna(subset=['nps_score'])
+                    feedback_data_nps = feedback_data[feedback_data['nps_value'].notna()]
                     
                     if not feedback_data_nps.empty:
-                        monthly_nps = feedback_data_nps.groupby('month').agg({
-                            'nps_score': ['mean', 'count', 'std']
+                        monthly_nps = feedback_data_nps.groupby('submitted_month', observed=True).agg({
+                            'nps_value': ['mean', 'count', 'std']
                         }).reset_index()
                         monthly_nps.columns = ['month', 'avg_nps', 'count', 'std_nps']
                         
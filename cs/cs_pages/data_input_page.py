@@ -10,7 +10,9 @@ from ..cs_data_utils import (
     export_data_to_excel,
     clean_and_prepare_data,
     get_data_summary,
-    load_sample_dataset
+    load_sample_dataset,
+    create_ingestion_progress,
+    clear_session_data
 )
 from ..cs_styling import create_metric_card, create_alert_box
 
@@ -47,8 +49,8 @@ def show_data_input():
         # File upload
         uploaded_file = st.file_uploader(
             "Choose an Excel file with customer service data",
-            type=['xlsx', 'xls'],
-            help="Upload an Excel file with multiple sheets for different data types",
+            type=['xlsx', 'xls', 'zip'],
+            help="Upload an Excel file with multiple sheets for different data types, or a .zip with one CSV/Parquet file per sheet (e.g. Tickets.csv)",
             key="upload_customer_service_data"
         )
         
@@ -58,7 +60,7 @@ def show_data_input():
             # Process the uploaded file
             if st.button("🔄 Process Uploaded File", type="primary"):
                 with st.spinner("Processing uploaded file..."):
-                    success, message = process_uploaded_excel(uploaded_file)
+                    success, message = process_uploaded_excel(uploaded_file, progress=create_ingestion_progress())
                     
                     if success:
                         st.success(message)
@@ -916,14 +918,7 @@ def show_data_input():
         with col1:
             if st.button("🗑️ Clear All Data", type="secondary", use_container_width=True):
                 # Clear all session state data
-                st.session_state.customers = pd.DataFrame()
-                st.session_state.tickets = pd.DataFrame()
-                st.session_state.agents = pd.DataFrame()
-                st.session_state.interactions = pd.DataFrame()
-                st.session_state.feedback = pd.DataFrame()
-                st.session_state.sla = pd.DataFrame()
-                st.session_state.knowledge_base = pd.DataFrame()
-                st.session_state.training = pd.DataFrame()
+                clear_session_data()
                 
                 st.success("All data cleared successfully!")
                 st.rerun()
@@ -5,6 +5,7 @@ from plotly.subplots import make_subplots
 from cs_metrics_calculator import *
 from cs_data_utils import get_data_summary, validate_data_integrity
 from cs_styling import create_metric_card, create_insight_box, create_alert_box
+from cs_fact_cube import get_fact_cube
 from datetime import datetime
 
 def show_home():
@@ -234,16 +235,13 @@ def show_home():
     st.markdown("### 📈 Recent Activity")
     
     if not st.session_state.tickets.empty and 'created_date' in st.session_state.tickets.columns:
-        # Convert dates
-        tickets_with_date = st.session_state.tickets.copy()
-        tickets_with_date['created_date'] = pd.to_datetime(tickets_with_date['created_date'], errors='coerce')
-        tickets_with_date = tickets_with_date.dropna(subset=['created_date'])
+        # Daily counters are pre-aggregated in the shared analytics cube
+        daily_counters = get_fact_cube().rollup(['created_day'])
+        daily_counters = daily_counters[daily_counters.index.notna()]
         
-        if not tickets_with_date.empty:
+        if not daily_counters.empty:
             # Daily ticket volume
-            daily_tickets = tickets_with_date.groupby(
-                tickets_with_date['created_date'].dt.date
-            ).size().reset_index(name='ticket_count')
+            daily_tickets = daily_counters['tickets'].reset_index()
             
             daily_tickets.columns = ['Date', 'Ticket Count']
             daily_tickets = daily_tickets.sort_values('Date').tail(30)  # Last 30 days
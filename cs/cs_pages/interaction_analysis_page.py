@@ -22,6 +22,12 @@ import numpy as np
 from datetime import datetime, timedelta
 import calendar
 
+from cs_staffing import (
+    get_staffing_plan, DEFAULT_SCENARIOS, DEFAULT_TARGET_SERVICE_LEVEL, DEFAULT_TARGET_ANSWER_SECONDS,
+    DEFAULT_MAX_OCCUPANCY, DEFAULT_SHRINKAGE
+)
+from cs_text_analytics import get_text_analytics, TEXT_SOURCES
+
 def show_interaction_analysis():
     """Display enhanced interaction analysis"""
     
@@ -249,6 +255,10 @@ def create_timing_patterns_dashboard():
     # Timing insights
     st.subheader("🔍 Timing Pattern Insights")
     create_timing_insights()
+    
+    st.markdown("---")
+    st.subheader("👥 Interval Staffing Requirements (Erlang C)")
+    create_staffing_requirements_section()
 
 def create_sentiment_analysis_dashboard():
     """Create sentiment analysis dashboard"""
@@ -301,6 +311,10 @@ def create_sentiment_analysis_dashboard():
     # Sentiment insights
     st.subheader("💡 Sentiment Analysis Insights")
     create_sentiment_insights()
+    
+    # Topics and lexicon sentiment from the free-text columns
+    st.subheader("📝 Text Topics")
+    create_text_topics_section()
 
 def create_resolution_patterns_dashboard():
     """Create resolution patterns dashboard"""
@@ -683,6 +697,112 @@ def create_timing_insights():
     - Focus on response time improvement during business hours
     """)
 
+def create_staffing_requirements_section():
+    """Required agents per 15-minute interval for the chosen service-level targets"""
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        target_sl = st.slider("Service Level Target (%)", 50, 99, int(DEFAULT_TARGET_SERVICE_LEVEL * 100),
+                              key="staffing_target_sl") / 100
+    with col2:
+        answer_seconds = st.number_input("Answer Within (seconds)", 5, 600, DEFAULT_TARGET_ANSWER_SECONDS,
+                                         step=5, key="staffing_answer_seconds")
+    with col3:
+        max_occupancy = st.slider("Max Occupancy (%)", 50, 100, int(DEFAULT_MAX_OCCUPANCY * 100),
+                                  key="staffing_max_occupancy") / 100
+    with col4:
+        shrinkage = st.slider("Shrinkage (%)", 0, 60, int(DEFAULT_SHRINKAGE * 100), key="staffing_shrinkage") / 100
+    
+    # Every scenario shares the chosen targets; they differ only in volume and handle time
+    scenarios = DEFAULT_SCENARIOS[DEFAULT_SCENARIOS['scenario'] != '90/20 Target'].assign(
+        target_service_level=target_sl,
+        target_answer_seconds=answer_seconds,
+        max_occupancy=max_occupancy,
+        shrinkage=shrinkage
+    )
+    
+    try:
+        staffing = get_staffing_plan(scenarios)
+    except Exception as e:
+        st.error(f"❌ Error calculating staffing requirements: {str(e)}")
+        return
+    
+    plan, summary = staffing['plan'], staffing['summary']
+    if plan.empty:
+        st.info("👥 Staffing requirements need interactions with start times")
+        return
+    
+    base = plan[plan['scenario'] == 'Base']
+    heatmap = base.pivot_table(index='day_of_week', columns='interval_start', values='scheduled_agents',
+                               aggfunc='sum', sort=False)
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap.values,
+        x=heatmap.columns,
+        y=heatmap.index,
+        colorscale='Viridis',
+        colorbar=dict(title="Agents")
+    ))
+    fig.update_layout(
+        title="Scheduled Agents per Interval (Base Scenario)",
+        xaxis_title="Interval Start",
+        yaxis_title="Day of Week",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    table = summary[['scenario', 'weekly_arrivals', 'peak_required_agents', 'peak_scheduled_agents',
+                     'scheduled_agent_hours', 'service_level', 'occupancy']].copy()
+    table['service_level'] = (table['service_level'] * 100).round(1)
+    table['occupancy'] = (table['occupancy'] * 100).round(1)
+    table.columns = ['Scenario', 'Weekly Interactions', 'Peak Agents (Erlang)', 'Peak Scheduled Agents',
+                     'Scheduled Agent Hours', 'Service Level %', 'Occupancy %']
+    st.dataframe(table.round(1), use_container_width=True, hide_index=True)
+
+def create_text_topics_section():
+    """Topic clusters and text sentiment for comments, ticket descriptions and resolution notes"""
+    
+    source = st.selectbox(
+        "Text Source", list(TEXT_SOURCES), format_func=lambda key: TEXT_SOURCES[key][3],
+        key="text_topics_source"
+    )
+    
+    try:
+        with st.spinner("Analyzing texts..."):
+            analytics = get_text_analytics(source)
+    except Exception as e:
+        st.error(f"❌ Error analyzing texts: {str(e)}")
+        return
+    
+    topics = analytics['topics']
+    if topics.empty:
+        st.info(f"📝 {analytics['message']}")
+        return
+    
+    fig = go.Figure(data=go.Bar(
+        x=topics['Share %'],
+        y=topics['Topic'],
+        orientation='h',
+        marker=dict(color=topics['Avg Text Sentiment'], colorscale='RdYlGn', cmin=-1, cmax=1,
+                    colorbar=dict(title="Sentiment")),
+        customdata=topics['Documents'],
+        hovertemplate='%{y}<br>%{customdata:,} texts (%{x:.1f}%)<extra></extra>'
+    ))
+    fig.update_layout(
+        title=f"Topics in {TEXT_SOURCES[source][3]}",
+        xaxis_title="Share of Texts (%)",
+        yaxis=dict(autorange='reversed'),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(topics.round(2), use_container_width=True, hide_index=True)
+    st.caption(analytics['message'])
+
 def create_sentiment_distribution_chart():
     """Create sentiment distribution chart"""
     
@@ -22,6 +22,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import calendar
 
+from cs_journeys import get_journey_analysis, DEFAULT_INACTIVITY_GAP_HOURS
+
 def show_omnichannel_experience():
     """Display enhanced omnichannel experience analytics"""
     
@@ -194,13 +196,19 @@ def create_customer_journey_dashboard():
     
     st.subheader("🔄 Customer Journey Mapping")
     
+    # Interactions more than this far apart start a new journey
+    gap_hours = st.slider(
+        "Journey inactivity gap (hours)", 1, 24 * 14, DEFAULT_INACTIVITY_GAP_HOURS,
+        key="journey_gap_hours"
+    )
+    
     # Journey metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         create_animated_metric_card(
             "Touchpoints",
-            f"{calculate_touchpoints_count()}",
+            f"{calculate_touchpoints_count(gap_hours):.1f}",
             "📍",
             0,
             "green"
@@ -209,7 +217,7 @@ def create_customer_journey_dashboard():
     with col2:
         create_animated_metric_card(
             "Journey Duration",
-            f"{calculate_avg_journey_duration():.1f} days",
+            f"{calculate_avg_journey_duration(gap_hours):.1f} days",
             "⏱️",
             0,
             "blue"
@@ -218,7 +226,7 @@ def create_customer_journey_dashboard():
     with col3:
         create_animated_metric_card(
             "Channel Switches",
-            f"{calculate_avg_channel_switches():.1f}",
+            f"{calculate_avg_channel_switches(gap_hours):.1f}",
             "🔄",
             0,
             "orange"
@@ -227,7 +235,7 @@ def create_customer_journey_dashboard():
     with col4:
         create_animated_metric_card(
             "Success Rate",
-            f"{calculate_journey_success_rate():.1f}%",
+            f"{calculate_journey_success_rate(gap_hours):.1f}%",
             "🎯",
             0,
             "purple"
@@ -240,11 +248,14 @@ def create_customer_journey_dashboard():
     
     with col1:
         st.subheader("🛤️ Customer Journey Flow")
-        create_customer_journey_flow()
+        create_customer_journey_flow(gap_hours)
     
     with col2:
         st.subheader("📈 Journey Performance Trends")
-        create_journey_performance_trends()
+        create_journey_performance_trends(gap_hours)
+    
+    st.subheader("🔀 Channel Transitions")
+    create_channel_transition_heatmap(gap_hours)
     
     # Journey insights
     st.subheader("🔍 Customer Journey Insights")
@@ -599,28 +610,31 @@ def create_channel_integration_insights():
     - Develop unified customer profiles across touchpoints
     """)
 
-def create_customer_journey_flow():
+def create_customer_journey_flow(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
     """Create customer journey flow visualization"""
     
     try:
-        # Sample data - replace with actual data processing
-        journey_stages = ['Discovery', 'Research', 'Purchase', 'Support', 'Retention']
-        completion_rates = [100, 85, 70, 95, 80]
+        # Most frequent channel paths across sessionized journeys
+        paths = get_journey_analysis(gap_hours).path_frequencies()
+        if paths.empty:
+            raise ValueError("No journeys")
+        paths = paths.iloc[::-1]
         
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=journey_stages,
-            y=completion_rates,
-            mode='lines+markers',
-            name='Journey Flow',
-            line=dict(color='#4ECDC4', width=3),
-            marker=dict(size=10, color='#4ECDC4')
+        fig.add_trace(go.Bar(
+            x=paths['Share %'],
+            y=paths['Path'],
+            orientation='h',
+            name='Journey Paths',
+            marker=dict(color='#4ECDC4'),
+            customdata=paths['Journeys'],
+            hovertemplate='%{y}<br>%{customdata:,} journeys (%{x:.1f}%)<extra></extra>'
         ))
         
         fig.update_layout(
-            title="Customer Journey Flow",
-            xaxis_title="Journey Stage",
-            yaxis_title="Completion Rate (%)",
+            title="Top Channel Paths",
+            xaxis_title="Share of Journeys (%)",
+            yaxis_title="Channel Path",
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             font=dict(size=12),
@@ -632,18 +646,19 @@ def create_customer_journey_flow():
     except Exception as e:
         st.info("🛤️ Customer journey flow data will be displayed here when available")
 
-def create_journey_performance_trends():
+def create_journey_performance_trends(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
     """Create journey performance trends chart"""
     
     try:
-        # Sample data - replace with actual data processing
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-        journey_success = [78, 82, 85, 88, 90, 92]
+        # Success rate of journeys by the month they started
+        trend = get_journey_analysis(gap_hours).monthly_trend()
+        if trend.empty:
+            raise ValueError("No journeys")
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=months,
-            y=journey_success,
+            x=trend['month'],
+            y=trend['success_rate'],
             mode='lines+markers',
             name='Journey Success Rate',
             line=dict(color='#FF6B6B', width=3),
@@ -665,6 +680,37 @@ def create_journey_performance_trends():
     except Exception as e:
         st.info("📈 Journey performance trend data will be displayed here when available")
 
+def create_channel_transition_heatmap(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
+    """Create next-channel probability heatmap within journeys"""
+    
+    try:
+        matrix = get_journey_analysis(gap_hours).transition_matrix(normalize=True)
+        if matrix.empty:
+            raise ValueError("No journeys")
+        
+        fig = go.Figure(data=go.Heatmap(
+            z=matrix.to_numpy(),
+            x=matrix.columns,
+            y=matrix.index,
+            colorscale='Teal',
+            hovertemplate='%{y} → %{x}<br>%{z:.1f}% of next steps<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title="Next Channel Within a Journey",
+            xaxis_title="Next Channel",
+            yaxis_title="Current Channel",
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(size=12),
+            margin=dict(l=50, r=50, t=80, b=50)
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+    except Exception as e:
+        st.info("🔀 Channel transition data will be displayed here when available")
+
 def create_customer_journey_insights():
     """Create customer journey insights"""
     
@@ -1006,39 +1052,35 @@ def calculate_cross_channel_support():
     except Exception as e:
         return 0
 
-def calculate_touchpoints_count():
+def calculate_touchpoints_count(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
     """Calculate touchpoints count"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 8
+        return get_journey_analysis(gap_hours).summary()['avg_touchpoints']
     except Exception as e:
         return 0
 
-def calculate_avg_journey_duration():
+def calculate_avg_journey_duration(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
     """Calculate average journey duration"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 12.5
+        return get_journey_analysis(gap_hours).summary()['avg_duration_days']
     except Exception as e:
         return 0
 
-def calculate_avg_channel_switches():
+def calculate_avg_channel_switches(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
     """Calculate average channel switches"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 2.8
+        return get_journey_analysis(gap_hours).summary()['avg_channel_switches']
     except Exception as e:
         return 0
 
-def calculate_journey_success_rate():
+def calculate_journey_success_rate(gap_hours=DEFAULT_INACTIVITY_GAP_HOURS):
     """Calculate journey success rate"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 92.3
+        return get_journey_analysis(gap_hours).summary()['success_rate']
     except Exception as e:
         return 0
 
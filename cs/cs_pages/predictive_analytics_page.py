@@ -22,6 +22,12 @@ import numpy as np
 from datetime import datetime, timedelta
 import calendar
 
+from cs_churn_model import get_churn_scores, summarize_churn_scores, RISK_LEVELS
+from cs_volume_forecast import get_volume_forecast, seasonality_strength
+
+# Daily volume forecast shown on the trend forecasting tab
+VOLUME_FORECAST_DAYS = 28
+
 def show_predictive_analytics():
     """Display enhanced predictive analytics"""
     
@@ -586,23 +592,26 @@ def create_ticket_volume_forecast():
     """Create ticket volume forecast chart"""
     
     try:
-        # Sample data - replace with actual data processing
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        actual = [120, 135, 150, 140, 160, 175, 190, 185, 200, 210, 195, 220]
-        forecast = [125, 140, 155, 145, 165, 180, 195, 190, 205, 215, 200, 225]
+        # Stored per-series forecasts summed over channel x priority x queue
+        volume = get_volume_forecast(freq='D', horizon=VOLUME_FORECAST_DAYS)
+        actual = volume['matrix'].total().iloc[-2 * VOLUME_FORECAST_DAYS:]
+        forecast = volume['forecast'].groupby('period')['forecast'].sum()
+        if actual.empty:
+            st.info("📈 Ticket volume forecast data will be displayed here when available")
+            return
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=months,
-            y=actual,
+            x=actual.index,
+            y=actual.values,
             mode='lines+markers',
             name='Actual Volume',
             line=dict(color='#2196F3', width=3),
             marker=dict(size=8, color='#2196F3')
         ))
         fig.add_trace(go.Scatter(
-            x=months,
-            y=forecast,
+            x=forecast.index,
+            y=forecast.values,
             mode='lines+markers',
             name='Forecasted Volume',
             line=dict(color='#FF9800', width=3, dash='dash'),
@@ -610,8 +619,8 @@ def create_ticket_volume_forecast():
         ))
         
         fig.update_layout(
-            title="Ticket Volume Forecast (12 Months)",
-            xaxis_title="Month",
+            title=f"Daily Ticket Volume Forecast ({VOLUME_FORECAST_DAYS} Days)",
+            xaxis_title="Date",
             yaxis_title="Ticket Volume",
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
@@ -669,6 +678,16 @@ def create_satisfaction_trends_forecast():
 def create_advanced_forecasting_models():
     """Create advanced forecasting models section"""
     
+    # Rolling-origin backtest of the stored daily volume models
+    backtest = get_volume_forecast(freq='D', horizon=VOLUME_FORECAST_DAYS)['backtest']
+    if not backtest.empty:
+        st.markdown("**📏 Volume Model Backtest** (rolling origin, daily series per channel × priority × queue)")
+        backtest_table = backtest[['model', 'accuracy', 'wape', 'mae', 'bias', 'fit_seconds']].rename(columns={
+            'model': 'Model', 'accuracy': 'Accuracy %', 'wape': 'WAPE %', 'mae': 'MAE',
+            'bias': 'Bias %', 'fit_seconds': 'Fit Time (s)'
+        })
+        st.dataframe(backtest_table.round(3), use_container_width=True, hide_index=True)
+    
     st.markdown("""
     ### 🔮 Advanced Forecasting Models
     
@@ -781,9 +800,14 @@ def create_risk_distribution_chart():
     """Create risk distribution chart"""
     
     try:
-        # Sample data - replace with actual data processing
-        risk_categories = ['High Risk', 'Medium Risk', 'Low Risk']
-        risk_counts = [15, 35, 50]
+        # Customer churn risk levels from the stored churn scores
+        scores, _, _ = get_churn_scores()
+        if scores.empty:
+            st.info("⚠️ Risk distribution data will be displayed here when available")
+            return
+        level_counts = summarize_churn_scores(scores)['risk_counts']
+        risk_categories = [f'{level} Risk' for level in reversed(RISK_LEVELS)]
+        risk_counts = [int(level_counts[level]) for level in reversed(RISK_LEVELS)]
         
         fig = go.Figure(data=[go.Pie(
             labels=risk_categories,
@@ -1073,8 +1097,9 @@ def calculate_trend_accuracy():
     """Calculate trend accuracy percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 89.2
+        # Backtest accuracy (100 - WAPE) of the best daily volume model
+        backtest = get_volume_forecast(freq='D', horizon=VOLUME_FORECAST_DAYS)['backtest']
+        return float(backtest['accuracy'].iloc[0]) if not backtest.empty else 0
     except Exception as e:
         return 0
 
@@ -1091,8 +1116,8 @@ def calculate_seasonality_strength():
     """Calculate seasonality strength percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 78.5
+        # Weekly seasonal share of the daily ticket volume variance
+        return seasonality_strength(get_volume_forecast(freq='D', horizon=VOLUME_FORECAST_DAYS)['matrix'])
     except Exception as e:
         return 0
 
@@ -1109,8 +1134,9 @@ def calculate_churn_prediction():
     """Calculate churn prediction percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 15.7
+        # Average predicted churn probability from the stored per-customer scores
+        scores, _, _ = get_churn_scores()
+        return summarize_churn_scores(scores)['predicted_churn_rate']
     except Exception as e:
         return 0
 
@@ -1159,12 +1185,17 @@ def calculate_early_warning():
     except Exception as e:
         return 0
 
+def _churn_model_metric(name):
+    """Holdout metric (percent) of the cached churn model, 0 when no model could be trained"""
+    _, churn_model, _ = get_churn_scores()
+    return churn_model.metrics[name] if churn_model is not None else 0
+
 def calculate_overall_accuracy():
     """Calculate overall accuracy percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 89.1
+        # Holdout accuracy of the churn model
+        return _churn_model_metric('accuracy')
     except Exception as e:
         return 0
 
@@ -1172,8 +1203,8 @@ def calculate_precision_score():
     """Calculate precision score percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 86.3
+        # Holdout precision of the churn model
+        return _churn_model_metric('precision')
     except Exception as e:
         return 0
 
@@ -1181,8 +1212,8 @@ def calculate_recall_score():
     """Calculate recall score percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 84.7
+        # Holdout recall of the churn model
+        return _churn_model_metric('recall')
     except Exception as e:
         return 0
 
@@ -1190,8 +1221,8 @@ def calculate_f1_score():
     """Calculate F1 score percentage"""
     
     try:
-        # Sample calculation - replace with actual data processing
-        return 85.5
+        # Holdout F1 score of the churn model
+        return _churn_model_metric('f1')
     except Exception as e:
         return 0
 
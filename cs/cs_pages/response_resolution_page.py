@@ -22,8 +22,9 @@ from datetime import datetime, timedelta
 # Import analytics functions
 from cs_analytics import (
     calculate_response_metrics,
-    calculate_sla_compliance
+    calculate_sla_compliance_by_priority
 )
+from cs_fact_cube import get_fact_cube
 
 def safe_column_access(df, columns, default_value=None):
     """Safely access DataFrame columns, returning default if not available"""
@@ -146,7 +147,7 @@ def show_response_resolution():
         
         # Calculate response metrics with error handling
         try:
-            response_summary, response_message = calculate_response_metrics(st.session_state.tickets)
+            response_summary, response_message = calculate_response_metrics(st.session_state.tickets, st.session_state.sla)
             
             if response_summary is not None and not response_summary.empty:
                 # Display key metrics
@@ -164,22 +165,11 @@ def show_response_resolution():
                 required_date_columns = ['created_date', 'first_response_date']
                 if all(col in st.session_state.tickets.columns for col in required_date_columns):
                     try:
-                        tickets_analysis = st.session_state.tickets.copy()
+                        # Response times are computed once in the shared analytics cube
+                        cube = get_fact_cube()
                         
-                        # Convert dates safely
-                        tickets_analysis['created_date'] = pd.to_datetime(tickets_analysis['created_date'], errors='coerce')
-                        tickets_analysis['first_response_date'] = pd.to_datetime(tickets_analysis['first_response_date'], errors='coerce')
-                        
-                        # Calculate response times
-                        tickets_analysis['response_time_hours'] = (
-                            tickets_analysis['first_response_date'] - tickets_analysis['created_date']
-                        ).dt.total_seconds() / 3600
-                        
-                        # Remove invalid response times
-                        valid_response_times = tickets_analysis[
-                            (tickets_analysis['response_time_hours'] >= 0) & 
-                            (tickets_analysis['response_time_hours'] <= 168)  # Max 1 week
-                        ]
+                        # Keep valid response times only (max 1 week)
+                        valid_response_times = cube.tickets.loc[cube.valid_response_hours().index]
                         
                         if not valid_response_times.empty:
                             col1, col2 = st.columns(2)
@@ -188,7 +178,7 @@ def show_response_resolution():
                                 # Response time distribution
                                 fig = go.Figure(data=[
                                     go.Histogram(
-                                        x=valid_response_times['response_time_hours'],
+                                        x=valid_response_times['response_hours'],
                                         nbinsx=20,
                                         marker_color='#2196f3',
                                         opacity=0.8
@@ -206,13 +196,13 @@ def show_response_resolution():
                             with col2:
                                 # Response time by priority
                                 if 'priority' in st.session_state.tickets.columns:
-                                    priority_response = valid_response_times.groupby('priority')['response_time_hours'].mean().reset_index()
+                                    priority_response = valid_response_times.groupby('priority')['response_hours'].mean().reset_index()
                                     fig = go.Figure(data=[
                                         go.Bar(
                                             x=priority_response['priority'],
-                                            y=priority_response['response_time_hours'],
+                                            y=priority_response['response_hours'],
                                             marker_color='#ff9800',
-                                            text=[f"{val:.1f}h" for val in priority_response['response_time_hours']],
+                                            text=[f"{val:.1f}h" for val in priority_response['response_hours']],
                                             textposition='auto'
                                         )
                                     ])
@@ -251,28 +241,17 @@ def show_response_resolution():
         
         # Calculate resolution metrics
         if 'created_date' in st.session_state.tickets.columns and 'resolved_date' in st.session_state.tickets.columns:
-            tickets_analysis = st.session_state.tickets.copy()
-            
-            # Convert dates
-            tickets_analysis['created_date'] = pd.to_datetime(tickets_analysis['created_date'], errors='coerce')
-            tickets_analysis['resolved_date'] = pd.to_datetime(tickets_analysis['resolved_date'], errors='coerce')
+            # Resolution times are computed once in the shared analytics cube
+            cube = get_fact_cube()
             
-            # Calculate resolution times
-            tickets_analysis['resolution_time_hours'] = (
-                tickets_analysis['resolved_date'] - tickets_analysis['created_date']
-            ).dt.total_seconds() / 3600
-            
-            # Filter resolved tickets
-            resolved_tickets = tickets_analysis[
-                (tickets_analysis['resolution_time_hours'] >= 0) & 
-                (tickets_analysis['resolution_time_hours'] <= 720)  # Max 30 days
-            ]
+            # Filter resolved tickets (max 30 days)
+            resolved_tickets = cube.tickets.loc[cube.valid_resolution_hours().index]
             
             if not resolved_tickets.empty:
                 # Calculate resolution metrics
                 total_resolved = len(resolved_tickets)
-                avg_resolution_time = resolved_tickets['resolution_time_hours'].mean()
-                median_resolution_time = resolved_tickets['resolution_time_hours'].median()
+                avg_resolution_time = resolved_tickets['resolution_hours'].mean()
+                median_resolution_time = resolved_tickets['resolution_hours'].median()
                 
                 # Display metrics
                 col1, col2, col3, col4 = st.columns(4)
@@ -297,7 +276,7 @@ def show_response_resolution():
                     # Resolution time distribution
                     fig = go.Figure(data=[
                         go.Histogram(
-                            x=resolved_tickets['resolution_time_hours'],
+                            x=resolved_tickets['resolution_hours'],
                             nbinsx=20,
                             marker_color='#4caf50',
                             hovertemplate='Resolution Time: %{x:.1f} hours<br>Count: %{y}<extra></extra>'
@@ -317,16 +296,16 @@ def show_response_resolution():
                 with col2:
                     # Resolution time by priority
                     if 'priority' in resolved_tickets.columns:
-                        priority_resolution = resolved_tickets.groupby('priority')['resolution_time_hours'].mean().reset_index()
+                        priority_resolution = resolved_tickets.groupby('priority')['resolution_hours'].mean().reset_index()
                         priority_resolution = priority_resolution.dropna()
                         
                         if not priority_resolution.empty:
                             fig = go.Figure(data=[
                                 go.Bar(
                                     x=priority_resolution['priority'],
-                                    y=priority_resolution['resolution_time_hours'],
+                                    y=priority_resolution['resolution_hours'],
                                     marker_color=['#ff5722', '#ff9800', '#4caf50', '#2196f3'],
-                                    text=[f"{val:.1f}h" for val in priority_resolution['resolution_time_hours']],
+                                    text=[f"{val:.1f}h" for val in priority_resolution['resolution_hours']],
                                     textposition='auto',
                                     hovertemplate='Priority: %{x}<br>Avg Resolution Time: %{y:.1f} hours<extra></extra>'
                                 )
@@ -352,7 +331,7 @@ def show_response_resolution():
                     st.subheader("👥 Resolution Efficiency by Agent")
                     
                     try:
-                        agent_resolution = resolved_tickets.groupby('agent_id')['resolution_time_hours'].agg([
+                        agent_resolution = resolved_tickets.groupby('agent_id')['resolution_hours'].agg([
                             'count', 'mean', 'median'
                         ]).reset_index()
                         agent_resolution.columns = ['Agent ID', 'Tickets Resolved', 'Avg Resolution Time', 'Median Resolution Time']
@@ -426,7 +405,15 @@ def show_response_resolution():
         
         # Calculate SLA compliance
         if not st.session_state.sla.empty:
-            sla_compliance_rate = calculate_sla_compliance(st.session_state.tickets, st.session_state.sla)
+            # Per-ticket breach flags plus per-priority compliance against the SLA sheet targets
+            sla_evaluation, priority_compliance, sla_message = calculate_sla_compliance_by_priority(
+                st.session_state.tickets, st.session_state.sla
+            )
+            measured_responses = sla_evaluation['response_measured'].sum() if not sla_evaluation.empty else 0
+            sla_compliance_rate = (
+                (1 - sla_evaluation['response_breached'].sum() / measured_responses) * 100
+                if measured_responses > 0 else 0.0
+            )
             
             # Display SLA metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -452,54 +439,40 @@ def show_response_resolution():
             st.dataframe(st.session_state.sla, use_container_width=True)
             
             # SLA compliance visualization
-            if 'priority' in st.session_state.tickets.columns and 'created_date' in st.session_state.tickets.columns:
-                tickets_analysis = st.session_state.tickets.copy()
-                tickets_analysis['created_date'] = pd.to_datetime(tickets_analysis['created_date'], errors='coerce')
-                tickets_analysis['first_response_date'] = pd.to_datetime(tickets_analysis['first_response_date'], errors='coerce')
-                
-                # Calculate response times by priority
-                priority_response_times = []
-                for priority in ['Critical', 'High', 'Medium', 'Low']:
-                    priority_tickets = tickets_analysis[tickets_analysis['priority'] == priority]
-                    if not priority_tickets.empty:
-                        response_times = (priority_tickets['first_response_date'] - priority_tickets['created_date']).dt.total_seconds() / 3600
-                        valid_times = response_times[(response_times >= 0) & (response_times <= 168)]
-                        if not valid_times.empty:
-                            priority_response_times.append({
-                                'Priority': priority,
-                                'Avg Response Time': valid_times.mean(),
-                                'SLA Target': 4 if priority in ['Critical', 'High'] else 8,
-                                'Compliance Rate': (valid_times <= (4 if priority in ['Critical', 'High'] else 8)).mean() * 100
-                            })
+            if not priority_compliance.empty:
+                sla_df = pd.DataFrame({
+                    'Priority': priority_compliance.index,
+                    'Avg Response Time': priority_compliance['avg_response_hours'].to_numpy(),
+                    'SLA Target': priority_compliance['avg_response_target_hours'].to_numpy(),
+                    'Compliance Rate': priority_compliance['response_compliance'].to_numpy(),
+                    'Resolution Compliance': priority_compliance['resolution_compliance'].to_numpy()
+                })
                 
-                if priority_response_times:
-                    sla_df = pd.DataFrame(priority_response_times)
-                    
-                    # SLA compliance chart
-                    fig = go.Figure(data=[
-                        go.Bar(
-                            x=sla_df['Priority'],
-                            y=sla_df['Compliance Rate'],
-                            marker_color=['#ff5722', '#ff9800', '#4caf50', '#2196f3'],
-                            text=[f"{val:.1f}%" for val in sla_df['Compliance Rate']],
-                            textposition='auto',
-                            hovertemplate='Priority: %{x}<br>Compliance Rate: %{y:.1f}%<extra></extra>'
-                        )
-                    ])
-                    fig.update_layout(
-                        title="SLA Compliance by Priority",
-                        xaxis_title="Priority",
-                        yaxis_title="Compliance Rate (%)",
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(size=12),
-                        margin=dict(l=50, r=50, t=80, b=50)
+                # SLA compliance chart
+                fig = go.Figure(data=[
+                    go.Bar(
+                        x=sla_df['Priority'],
+                        y=sla_df['Compliance Rate'],
+                        marker_color=['#ff5722', '#ff9800', '#4caf50', '#2196f3'],
+                        text=[f"{val:.1f}%" for val in sla_df['Compliance Rate']],
+                        textposition='auto',
+                        hovertemplate='Priority: %{x}<br>Compliance Rate: %{y:.1f}%<extra></extra>'
                     )
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # SLA performance table
-                    st.subheader("📊 SLA Performance Summary")
-                    st.dataframe(sla_df, use_container_width=True)
+                ])
+                fig.update_layout(
+                    title="SLA Compliance by Priority",
+                    xaxis_title="Priority",
+                    yaxis_title="Compliance Rate (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                # SLA performance table
+                st.subheader("📊 SLA Performance Summary")
+                st.dataframe(sla_df, use_container_width=True)
             
             st.success(f"SLA compliance analysis completed. Overall compliance: {sla_compliance_rate:.1f}%")
         else:
@@ -515,31 +488,22 @@ def show_response_resolution():
         
         # Analyze trends over time
         if 'created_date' in st.session_state.tickets.columns:
-            tickets_analysis = st.session_state.tickets.copy()
-            tickets_analysis['created_date'] = pd.to_datetime(tickets_analysis['created_date'], errors='coerce')
-            tickets_analysis['month'] = tickets_analysis['created_date'].dt.strftime('%Y-%m')
-            
-            # Remove invalid dates
-            tickets_analysis = tickets_analysis.dropna(subset=['created_date'])
+            # Month keys and response times are precomputed in the shared analytics cube
+            cube = get_fact_cube()
+            tickets_analysis = cube.dated_tickets
             
             if not tickets_analysis.empty:
                 # Monthly ticket volume
-                monthly_volume = tickets_analysis.groupby('month').size().reset_index(name='ticket_count')
+                monthly_volume = tickets_analysis.groupby('created_month', observed=True).size().reset_index(name='ticket_count')
+                monthly_volume = monthly_volume.rename(columns={'created_month': 'month'})
                 
                 # Monthly response times
-                if 'first_response_date' in tickets_analysis.columns:
-                    tickets_analysis['first_response_date'] = pd.to_datetime(tickets_analysis['first_response_date'], errors='coerce')
-                    tickets_analysis['response_time_hours'] = (
-                        tickets_analysis['first_response_date'] - tickets_analysis['created_date']
-                    ).dt.total_seconds() / 3600
-                    
-                    valid_response_times = tickets_analysis[
-                        (tickets_analysis['response_time_hours'] >= 0) & 
-                        (tickets_analysis['response_time_hours'] <= 168)
-                    ]
+                if 'response_hours' in tickets_analysis.columns:
+                    valid_response_times = cube.tickets.loc[cube.valid_response_hours().index]
                     
                     if not valid_response_times.empty:
-                        monthly_response = valid_response_times.groupby('month')['response_time_hours'].mean().reset_index()
+                        monthly_response = valid_response_times.groupby('created_month', observed=True)['response_hours'].mean().reset_index()
+                        monthly_response = monthly_response.rename(columns={'created_month': 'month'})
                         
                         # Create trend visualization
                         fig = make_subplots(
@@ -564,7 +528,7 @@ def show_response_resolution():
                         fig.add_trace(
                             go.Scatter(
                                 x=monthly_response['month'],
-                                y=monthly_response['response_time_hours'],
+                                y=monthly_response['response_hours'],
                                 mode='lines+markers',
                                 name='Response Time',
                                 line=dict(color='#ff5722', width=3)
@@ -600,7 +564,7 @@ def show_response_resolution():
                                 st.info(f"📉 Ticket volume decreased by {abs(volume_change):.1f}% over the period")
                         
                         if len(monthly_response) > 1:
-                            response_change = monthly_response.iloc[-1]['response_time_hours'] - monthly_response.iloc[0]['response_time_hours']
+                            response_change = monthly_response.iloc[-1]['response_hours'] - monthly_response.iloc[0]['response_hours']
                             
                             if response_change < 0:
                                 st.success(f"⚡ Response time improved by {abs(response_change):.1f} hours over the period")
@@ -650,13 +614,13 @@ def show_response_resolution():
                 selected_status = st.selectbox("Select Status", statuses)
         
         # Apply filters
-        filtered_tickets = st.session_state.tickets.copy()
+        # Filters are applied to the typed tickets from the shared analytics cube
+        filtered_tickets = get_fact_cube().tickets
         
         if 'created_date' in filtered_tickets.columns and len(date_range) == 2:
-            filtered_tickets['created_date'] = pd.to_datetime(filtered_tickets['created_date'])
             filtered_tickets = filtered_tickets[
-                (filtered_tickets['created_date'].dt.date >= date_range[0]) &
-                (filtered_tickets['created_date'].dt.date <= date_range[1])
+                (filtered_tickets['created_day'] >= pd.Timestamp(date_range[0])) &
+                (filtered_tickets['created_day'] <= pd.Timestamp(date_range[1]))
             ]
         
         if selected_priority != 'All':
@@ -686,11 +650,8 @@ def show_response_resolution():
                     st.metric("Resolved", resolved)
             
             with col4:
-                if 'created_date' in filtered_tickets.columns and 'first_response_date' in filtered_tickets.columns:
-                    filtered_tickets['created_date'] = pd.to_datetime(filtered_tickets['created_date'])
-                    filtered_tickets['first_response_date'] = pd.to_datetime(filtered_tickets['first_response_date'])
-                    
-                    response_times = (filtered_tickets['first_response_date'] - filtered_tickets['created_date']).dt.total_seconds() / 3600
+                if 'response_hours' in filtered_tickets.columns:
+                    response_times = filtered_tickets['response_hours']
                     valid_times = response_times[(response_times >= 0) & (response_times <= 168)]
                     
                     if not valid_times.empty:
@@ -718,12 +679,7 @@ def show_response_resolution():
     
     if not st.session_state.tickets.empty:
         if 'created_date' in st.session_state.tickets.columns and 'first_response_date' in st.session_state.tickets.columns:
-            tickets_analysis = st.session_state.tickets.copy()
-            tickets_analysis['created_date'] = pd.to_datetime(tickets_analysis['created_date'], errors='coerce')
-            tickets_analysis['first_response_date'] = pd.to_datetime(tickets_analysis['first_response_date'], errors='coerce')
-            
-            response_times = (tickets_analysis['first_response_date'] - tickets_analysis['created_date']).dt.total_seconds() / 3600
-            valid_times = response_times[(response_times >= 0) & (response_times <= 168)]
+            valid_times = get_fact_cube().valid_response_hours()
             
             if not valid_times.empty:
                 avg_response_time = valid_times.mean()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+SLA Compliance Engine
+=====================
+
+Vectorized SLA evaluation for customer service tickets:
+- Joins every ticket to its SLA rule from the SLA sheet by ticket type and priority
+- Measures elapsed time in business hours (numpy.busday_count plus intra-day offsets)
+  or in calendar hours, following each rule's business_hours_only flag
+- Produces per-ticket breach flags and compliance aggregates in a single pass
+"""
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Fallback (first response, resolution) targets in hours when no SLA rule matches
+DEFAULT_SLA_TARGETS = {
+    'Critical': (4.0, 24.0),
+    'High': (4.0, 24.0),
+    'Medium': (8.0, 48.0),
+    'Low': (8.0, 72.0)
+}
+DEFAULT_TARGET_HOURS = (8.0, 72.0)
+
+PRIORITY_ORDER = ['Critical', 'High', 'Medium', 'Low']
+
+SECONDS_PER_DAY = 86400
+SECONDS_PER_HOUR = 3600.0
+
+# ============================================================================
+# BUSINESS CALENDAR
+# ============================================================================
+
+class BusinessCalendar:
+    """
+    Working-hours calendar used to measure SLA clocks.
+
+    Args:
+        start_hour (float): Start of the working day (hours after midnight)
+        end_hour (float): End of the working day (hours after midnight)
+        weekmask (str): numpy weekmask, Monday first ('1111100' = Mon-Fri)
+        holidays (list): Dates that are never business days
+    """
+
+    def __init__(self, start_hour=9.0, end_hour=17.0, weekmask='1111100', holidays=None):
+        if not 0 <= start_hour < end_hour <= 24:
+            raise ValueError("Business hours must satisfy 0 <= start_hour < end_hour <= 24")
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+        self.weekmask = weekmask
+        self.holidays = np.array(sorted(pd.to_datetime(holidays or []).values.astype('datetime64[D]')),
+                                 dtype='datetime64[D]')
+        self._calendar = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    @property
+    def hours_per_day(self):
+        return self.end_hour - self.start_hour
+
+    def business_hours_between(self, start_seconds, end_seconds):
+        """
+        Business hours between two arrays of epoch seconds.
+
+        Whole business days between the two dates are counted with
+        numpy.busday_count; the partial first and last days are handled by
+        clipping each timestamp's offset into the working window.
+
+        Args:
+            start_seconds (np.ndarray): int64 epoch seconds of clock start
+            end_seconds (np.ndarray): int64 epoch seconds of clock stop (>= start)
+
+        Returns:
+            np.ndarray: float64 business hours
+        """
+        start_days = start_seconds // SECONDS_PER_DAY
+        end_days = end_seconds // SECONDS_PER_DAY
+        full_days = np.busday_count(start_days.astype('datetime64[D]'), end_days.astype('datetime64[D]'),
+                                    busdaycal=self._calendar)
+
+        window = self.hours_per_day * SECONDS_PER_HOUR
+        elapsed = full_days * window
+        elapsed -= self._worked_seconds_into_day(start_seconds, start_days, window)
+        elapsed += self._worked_seconds_into_day(end_seconds, end_days, window)
+        return elapsed / SECONDS_PER_HOUR
+
+    def _worked_seconds_into_day(self, seconds, days, window):
+        """Working seconds between the start of the working day and each timestamp."""
+        offset = (seconds - days * SECONDS_PER_DAY) - self.start_hour * SECONDS_PER_HOUR
+        worked = np.clip(offset, 0, window)
+        return np.where(np.is_busday(days.astype('datetime64[D]'), busdaycal=self._calendar), worked, 0.0)
+
+# ============================================================================
+# SLA RULES
+# ============================================================================
+
+def build_sla_lookup(sla_df):
+    """
+    Normalize the SLA sheet into rule tables keyed by (ticket_type, priority) and priority.
+
+    The first rule listed for a key applies, so the sheet is evaluated
+    top-down like a rule table. Priority-only rules (a blank ticket_type)
+    back up tickets whose type has no dedicated rule; without one,
+    evaluate_sla falls back to DEFAULT_SLA_TARGETS.
+
+    Args:
+        sla_df (pd.DataFrame): SLA sheet
+
+    Returns:
+        tuple: (rules by type and priority, rules by priority), each a DataFrame
+        with sla_id, first_response_target_hours, resolution_target_hours,
+        grace_period_hours and business_hours_only
+    """
+    columns = ['sla_id', 'first_response_target_hours', 'resolution_target_hours',
+               'grace_period_hours', 'business_hours_only']
+    if sla_df is None or sla_df.empty or 'priority' not in sla_df.columns:
+        empty = pd.DataFrame(columns=columns)
+        return empty, empty
+
+    rules = sla_df.copy()
+    defaults = {'sla_id': None, 'first_response_target_hours': np.nan, 'resolution_target_hours': np.nan,
+                'grace_period_hours': 0.0, 'business_hours_only': False}
+    for col, default in defaults.items():
+        if col not in rules.columns:
+            rules[col] = default
+    rules['grace_period_hours'] = pd.to_numeric(rules['grace_period_hours'], errors='coerce').fillna(0.0)
+    rules['business_hours_only'] = rules['business_hours_only'].fillna(False).astype(bool)
+
+    if 'ticket_type' in rules.columns:
+        ticket_type = rules['ticket_type'].astype('string').str.strip()
+        blank = (ticket_type.isna() | (ticket_type == '')).to_numpy(dtype=bool)
+        typed = rules[~blank]
+        by_type = typed.drop_duplicates(['ticket_type', 'priority']).set_index(['ticket_type', 'priority'])[columns]
+        rules = rules[blank]
+    else:
+        by_type = pd.DataFrame(columns=columns)
+    by_priority = rules.drop_duplicates('priority').set_index('priority')[columns]
+    return by_type, by_priority
+
+
+def _rule_positions(tickets_df, priority_codes, priorities, by_type, by_priority):
+    """
+    Row position of the matching rule for every ticket, without a row-wise merge.
+
+    Ticket types and priorities are factorized once and mapped through a small
+    (types x priorities) lookup table, so the join costs two factorizations.
+
+    Returns:
+        np.ndarray: Index into the stacked rule table (by_type rows, then
+        by_priority rows), or -1 when no rule matches
+    """
+    positions = np.full(len(priority_codes), -1, dtype=np.int64)
+    if 'ticket_type' in tickets_df.columns and not by_type.empty and len(priorities):
+        type_codes, types = pd.factorize(tickets_df['ticket_type'])
+        lookup = np.full((len(types) + 1, len(priorities) + 1), -1, dtype=np.int64)
+        type_rule = by_type.index.get_indexer(pd.MultiIndex.from_product([types, priorities]))
+        lookup[:-1, :-1] = type_rule.reshape(len(types), len(priorities))
+        # Code -1 (missing value) lands on the trailing "no rule" row/column
+        positions = lookup[type_codes, priority_codes]
+
+    priority_rule = pd.Index(by_priority.index).get_indexer(priorities)
+    fallback = np.append(priority_rule, -1)[priority_codes]
+    use_fallback = (positions < 0) & (fallback >= 0)
+    positions[use_fallback] = fallback[use_fallback] + len(by_type)
+    return positions
+
+
+def _to_epoch_seconds(values):
+    """int64 epoch seconds and a validity mask; datetime columns are used without reparsing."""
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, errors='coerce')
+    if getattr(values.dtype, 'tz', None) is not None:
+        values = values.dt.tz_localize(None)
+    seconds = values.to_numpy(dtype='datetime64[s]')
+    valid = ~np.isnat(seconds)
+    return seconds.view('int64'), valid
+
+# ============================================================================
+# SLA EVALUATION
+# ============================================================================
+
+def evaluate_sla(tickets_df, sla_df, calendar=None, as_of=None):
+    """
+    Per-ticket SLA evaluation.
+
+    Args:
+        tickets_df (pd.DataFrame): Tickets with created_date, first_response_date,
+            resolved_date, priority and (optionally) ticket_type and sla_target_hours
+        sla_df (pd.DataFrame): SLA sheet
+        calendar (BusinessCalendar): Working-hours calendar for business-hours rules
+        as_of (datetime): If given, tickets still waiting for a response or
+            resolution are breached once their running clock passes the target
+
+    Returns:
+        pd.DataFrame: Indexed like tickets_df with the applied sla_id, targets,
+        elapsed response/resolution hours and boolean measured/breached flags
+    """
+    calendar = calendar or BusinessCalendar()
+    n_tickets = len(tickets_df)
+    if 'priority' in tickets_df.columns:
+        priority_codes, priorities = pd.factorize(tickets_df['priority'])
+    else:
+        priority_codes, priorities = np.full(n_tickets, -1, dtype=np.int64), pd.Index([])
+
+    by_type, by_priority = build_sla_lookup(sla_df)
+    rules = pd.concat([by_type.reset_index(drop=True), by_priority.reset_index(drop=True)], ignore_index=True)
+    positions = _rule_positions(tickets_df, priority_codes, priorities, by_type, by_priority)
+
+    def rule_values(column, default):
+        # Trailing sentinel row holds the default for unmatched tickets
+        values = np.append(rules[column].to_numpy(dtype=float), default)
+        return values[positions]
+
+    # Targets: SLA rule, then the ticket's own target, then priority defaults
+    default_targets = np.array([DEFAULT_SLA_TARGETS.get(p, DEFAULT_TARGET_HOURS) for p in priorities]
+                               + [DEFAULT_TARGET_HOURS], dtype=float).reshape(-1, 2)
+    default_response = default_targets[priority_codes, 0]
+    default_resolution = default_targets[priority_codes, 1]
+    if 'sla_target_hours' in tickets_df.columns:
+        ticket_target = pd.to_numeric(tickets_df['sla_target_hours'], errors='coerce').to_numpy(dtype=float)
+        default_resolution = np.where(np.isnan(ticket_target), default_resolution, ticket_target)
+
+    response_target = rule_values('first_response_target_hours', np.nan)
+    response_target = np.where(np.isnan(response_target), default_response, response_target)
+    resolution_target = rule_values('resolution_target_hours', np.nan)
+    resolution_target = np.where(np.isnan(resolution_target), default_resolution, resolution_target)
+    grace = rule_values('grace_period_hours', 0.0)
+    business_only = rule_values('business_hours_only', 0.0).astype(bool)
+
+    sla_codes, sla_ids = pd.factorize(rules['sla_id']) if not rules.empty else (np.array([], dtype=np.int64), [])
+    result = pd.DataFrame({
+        'priority': pd.Categorical.from_codes(priority_codes, categories=priorities),
+        'sla_id': pd.Categorical.from_codes(np.append(sla_codes, -1)[positions], categories=sla_ids),
+        'response_target_hours': response_target,
+        'resolution_target_hours': resolution_target,
+        'business_hours_only': business_only
+    }, index=tickets_df.index)
+
+    if 'created_date' not in tickets_df.columns:
+        for clock in ('response', 'resolution'):
+            result[f'{clock}_hours'] = np.nan
+            result[f'{clock}_measured'] = False
+            result[f'{clock}_breached'] = False
+        return result
+
+    created, created_valid = _to_epoch_seconds(tickets_df['created_date'])
+    as_of_seconds = None
+    if as_of is not None:
+        as_of_seconds = np.int64(pd.Timestamp(as_of).to_datetime64().astype('datetime64[s]').view('int64'))
+
+    for clock, column, target in (('response', 'first_response_date', response_target),
+                                  ('resolution', 'resolved_date', resolution_target)):
+        if column in tickets_df.columns:
+            stopped, stopped_valid = _to_epoch_seconds(tickets_df[column])
+        else:
+            stopped, stopped_valid = np.zeros(n_tickets, dtype=np.int64), np.zeros(n_tickets, dtype=bool)
+
+        measured = created_valid & stopped_valid & (stopped >= created)
+        running = created_valid & ~stopped_valid & (as_of_seconds is not None)
+        end = np.where(measured, stopped, as_of_seconds if as_of_seconds is not None else created)
+        end = np.maximum(end, created)
+        counted = measured | running
+
+        hours = np.where(counted, (end - created) / SECONDS_PER_HOUR, np.nan)
+        business_clock = counted & business_only
+        if business_clock.any():
+            hours[business_clock] = calendar.business_hours_between(created[business_clock], end[business_clock])
+
+        with np.errstate(invalid='ignore'):
+            over_target = hours > (target + grace)
+        result[f'{clock}_hours'] = np.where(measured, hours, np.nan)
+        result[f'{clock}_measured'] = measured | (running & over_target)
+        result[f'{clock}_breached'] = counted & over_target
+
+    return result
+
+
+def _group_codes(evaluation, groups):
+    """Integer group codes (-1 = no group) and labels, priorities in severity order."""
+    groups = groups if isinstance(groups, pd.Series) else pd.Series(groups, index=evaluation.index)
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        codes, labels = groups.cat.codes.to_numpy(dtype=np.int64), pd.Index(groups.cat.categories)
+    else:
+        codes, labels = pd.factorize(groups, sort=False)
+    if len(labels) and set(labels) <= set(PRIORITY_ORDER):
+        order = [p for p in PRIORITY_ORDER if p in set(labels)]
+        remap = np.append(pd.Index(order).get_indexer(labels), -1)
+        codes, labels = remap[codes], pd.Index(order)
+    return codes, labels
+
+
+def _group_sums(evaluation, codes, n_groups):
+    """Per-group ticket, measured, breach, elapsed-hours and target sums in one scan."""
+    sums = {'tickets': np.bincount(codes, minlength=n_groups)}
+    for clock in ('response', 'resolution'):
+        hours = evaluation[f'{clock}_hours'].to_numpy()
+        has_hours = ~np.isnan(hours)
+        sums[f'{clock}_measured'] = np.bincount(codes, weights=evaluation[f'{clock}_measured'].to_numpy(),
+                                                minlength=n_groups)
+        sums[f'{clock}_breaches'] = np.bincount(codes, weights=evaluation[f'{clock}_breached'].to_numpy(),
+                                                minlength=n_groups)
+        sums[f'{clock}_hours'] = np.bincount(codes, weights=np.where(has_hours, hours, 0.0), minlength=n_groups)
+        sums[f'{clock}_hours_count'] = np.bincount(codes, weights=has_hours, minlength=n_groups)
+        sums[f'{clock}_target'] = np.bincount(codes, weights=evaluation[f'{clock}_target_hours'].to_numpy(),
+                                              minlength=n_groups)
+    return sums
+
+
+def _compliance_table(sums, labels):
+    """Compliance rates and averages from group sums."""
+    summary = pd.DataFrame(index=labels)
+    summary.index.name = 'group'
+    tickets = sums['tickets']
+    summary['tickets'] = tickets.astype(np.int64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for clock in ('response', 'resolution'):
+            measured = sums[f'{clock}_measured']
+            breaches = sums[f'{clock}_breaches']
+            hours_count = sums[f'{clock}_hours_count']
+            summary[f'{clock}_measured'] = measured.astype(np.int64)
+            summary[f'{clock}_breaches'] = breaches.astype(np.int64)
+            summary[f'{clock}_compliance'] = np.where(measured > 0, (1 - breaches / measured) * 100, np.nan)
+            summary[f'avg_{clock}_hours'] = np.where(hours_count > 0, sums[f'{clock}_hours'] / hours_count, np.nan)
+            summary[f'avg_{clock}_target_hours'] = np.where(tickets > 0, sums[f'{clock}_target'] / tickets, np.nan)
+    return summary
+
+
+def summarize_sla_compliance(evaluation, groups=None):
+    """
+    Aggregate per-ticket SLA flags into compliance rates.
+
+    Args:
+        evaluation (pd.DataFrame): Output of evaluate_sla
+        groups (pd.Series): Optional grouping aligned with the evaluation (e.g. priority)
+
+    Returns:
+        pd.DataFrame: Tickets, measured counts, breaches, compliance % and average
+        elapsed hours per group (a single 'All' row when groups is None)
+    """
+    if groups is None:
+        sums = _group_sums(evaluation, np.zeros(len(evaluation), dtype=np.int64), 1)
+        return _compliance_table(sums, pd.Index(['All']))
+
+    codes, labels = _group_codes(evaluation, groups)
+    # Ungrouped tickets go to a trailing bucket that is not reported
+    codes = np.where(codes >= 0, codes, len(labels))
+    sums = _group_sums(evaluation, codes, len(labels) + 1)
+    return _compliance_table({k: v[:-1] for k, v in sums.items()}, labels)
+
+
+def calculate_sla_metrics(tickets_df, sla_df, calendar=None, as_of=None):
+    """
+    Per-ticket SLA flags plus overall and per-priority compliance in one pass.
+
+    The overall row is the total of the per-priority sums, so the ticket
+    flags are scanned once for both aggregates.
+
+    Args:
+        tickets_df (pd.DataFrame): Ticket data
+        sla_df (pd.DataFrame): SLA sheet
+        calendar (BusinessCalendar): Working-hours calendar for business-hours rules
+        as_of (datetime): Reference time for tickets whose clock is still running
+
+    Returns:
+        tuple: (per-ticket evaluation, overall summary row, per-priority summary)
+    """
+    evaluation = evaluate_sla(tickets_df, sla_df, calendar=calendar, as_of=as_of)
+    codes, labels = _group_codes(evaluation, evaluation['priority'])
+    codes = np.where(codes >= 0, codes, len(labels))
+    sums = _group_sums(evaluation, codes, len(labels) + 1)
+
+    overall = _compliance_table({k: np.array([v.sum()]) for k, v in sums.items()}, pd.Index(['All']))
+    by_priority = _compliance_table({k: v[:-1] for k, v in sums.items()}, labels)
+    return evaluation, overall, by_priority
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Interval Staffing (Erlang C)
+============================
+
+Required agents per interval against service-level targets:
+- Interval workload from the interactions sheet: mean arrivals per
+  weekday x interval slot and average handle time from duration_minutes
+- A vectorized Erlang C evaluated in log-space, so loads of thousands of
+  Erlangs neither overflow A^N/N! nor lose the tail of the wait probability
+- Scenario sweeps (volume, handle time, targets, shrinkage) over a full
+  week of intervals in one pass
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cs_fact_cube import DAY_ORDER, table_version
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+INTERVAL_MINUTES = 15
+
+DEFAULT_TARGET_SERVICE_LEVEL = 0.80
+DEFAULT_TARGET_ANSWER_SECONDS = 20
+DEFAULT_MAX_OCCUPANCY = 0.85
+DEFAULT_SHRINKAGE = 0.30
+
+# Pseudo-count pulling thin-slot handle times towards the series average
+AHT_PRIOR_WEIGHT = 5
+
+# Upper bound on (cells x candidate agents) evaluated at once
+MAX_BLOCK_CELLS = 2_000_000
+
+# Poisson terms kept around the load, and agent counts tried above the
+# occupancy floor, both in standard deviations (sqrt of the load)
+POISSON_WINDOW_SIGMAS = 12
+STAFFING_SPAN_SIGMAS = 4
+
+SCENARIO_COLUMNS = [
+    'scenario', 'volume_multiplier', 'aht_multiplier', 'target_service_level',
+    'target_answer_seconds', 'max_occupancy', 'shrinkage'
+]
+
+DEFAULT_SCENARIOS = pd.DataFrame([
+    ['Base', 1.0, 1.0, DEFAULT_TARGET_SERVICE_LEVEL, DEFAULT_TARGET_ANSWER_SECONDS, DEFAULT_MAX_OCCUPANCY, DEFAULT_SHRINKAGE],
+    ['Volume +10%', 1.1, 1.0, DEFAULT_TARGET_SERVICE_LEVEL, DEFAULT_TARGET_ANSWER_SECONDS, DEFAULT_MAX_OCCUPANCY, DEFAULT_SHRINKAGE],
+    ['Volume +25%', 1.25, 1.0, DEFAULT_TARGET_SERVICE_LEVEL, DEFAULT_TARGET_ANSWER_SECONDS, DEFAULT_MAX_OCCUPANCY, DEFAULT_SHRINKAGE],
+    ['AHT -10%', 1.0, 0.9, DEFAULT_TARGET_SERVICE_LEVEL, DEFAULT_TARGET_ANSWER_SECONDS, DEFAULT_MAX_OCCUPANCY, DEFAULT_SHRINKAGE],
+    ['90/20 Target', 1.0, 1.0, 0.90, DEFAULT_TARGET_ANSWER_SECONDS, DEFAULT_MAX_OCCUPANCY, DEFAULT_SHRINKAGE]
+], columns=SCENARIO_COLUMNS)
+
+SESSION_STAFFING_KEY = 'cs_staffing_plans'
+
+# ============================================================================
+# INTERVAL WORKLOAD
+# ============================================================================
+
+class IntervalWorkload:
+    """
+    Average weekly workload on a weekday x interval grid.
+
+    Attributes:
+        arrivals (np.ndarray): Mean arrivals per interval, shape (series, slots)
+        aht_seconds (np.ndarray): Average handle time in seconds, shape (series, slots)
+        series (pd.DataFrame): Dimension labels, one row per series
+        slots (pd.DataFrame): day_of_week and interval_start label per slot
+        interval_minutes (int): Interval length
+    """
+
+    def __init__(self, arrivals, aht_seconds, series, slots, interval_minutes):
+        self.arrivals = arrivals
+        self.aht_seconds = aht_seconds
+        self.series = series
+        self.slots = slots
+        self.interval_minutes = interval_minutes
+
+    @property
+    def load_erlangs(self):
+        """Offered load per series and slot (arrival rate x handle time)."""
+        return self.arrivals * self.aht_seconds / (self.interval_minutes * 60.0)
+
+
+def _week_slots(interval_minutes):
+    """Labels for every weekday x interval slot of a week, Monday first."""
+    per_day = 24 * 60 // interval_minutes
+    minutes = np.arange(per_day) * interval_minutes
+    labels = [f'{m // 60:02d}:{m % 60:02d}' for m in minutes]
+    return pd.DataFrame({
+        'day_of_week': np.repeat(DAY_ORDER, per_day),
+        'interval_start': np.tile(labels, len(DAY_ORDER))
+    })
+
+
+def _slot_codes(timestamps, interval_minutes):
+    """Week slot index (0 = Monday 00:00) of each timestamp."""
+    per_day = 24 * 60 // interval_minutes
+    minute_of_day = timestamps.dt.hour.to_numpy() * 60 + timestamps.dt.minute.to_numpy()
+    return timestamps.dt.dayofweek.to_numpy() * per_day + minute_of_day // interval_minutes
+
+
+def build_interval_workload(interactions_df, interval_minutes=INTERVAL_MINUTES, dimensions=None):
+    """
+    Mean arrivals and handle time per weekday x interval slot.
+
+    Arrivals are averaged over how often each slot occurs in the observed
+    date range, so slots outside the data's span don't dilute the mean.
+
+    Args:
+        interactions_df (pd.DataFrame): Interactions with start_time and duration_minutes
+        interval_minutes (int): Interval length; must divide a day
+        dimensions (list): Optional split columns such as ['channel']
+
+    Returns:
+        IntervalWorkload: One series per observed dimension combination
+    """
+    if (24 * 60) % interval_minutes:
+        raise ValueError(f"interval_minutes must divide a day, got {interval_minutes}")
+    dimensions = [d for d in (dimensions or []) if d in interactions_df.columns]
+    slots = _week_slots(interval_minutes)
+    n_slots = len(slots)
+    empty = IntervalWorkload(np.zeros((0, n_slots)), np.zeros((0, n_slots)),
+                             pd.DataFrame(columns=dimensions), slots, interval_minutes)
+    if interactions_df is None or interactions_df.empty or 'start_time' not in interactions_df.columns:
+        return empty
+
+    start = interactions_df['start_time']
+    if not pd.api.types.is_datetime64_any_dtype(start):
+        start = pd.to_datetime(start, errors='coerce')
+    valid = start.notna().to_numpy()
+    if not valid.any():
+        return empty
+    start = start[valid]
+
+    # How many times each slot occurs between the first and last interval observed
+    step = f'{interval_minutes}min'
+    grid = pd.date_range(start.min().floor(step), start.max().floor(step), freq=step)
+    occurrences = np.bincount(_slot_codes(grid.to_series(), interval_minutes), minlength=n_slots)
+
+    if dimensions:
+        series_codes, series = _dimension_codes(interactions_df.loc[valid, dimensions])
+    else:
+        series_codes, series = np.zeros(len(start), dtype=np.int64), pd.DataFrame(index=[0])
+    n_series = len(series)
+    cells = series_codes * n_slots + _slot_codes(start, interval_minutes)
+
+    counts = np.bincount(cells, minlength=n_series * n_slots).reshape(n_series, n_slots)
+    arrivals = np.divide(counts, occurrences, out=np.zeros(counts.shape), where=occurrences > 0)
+
+    if 'duration_minutes' in interactions_df.columns:
+        duration = pd.to_numeric(interactions_df.loc[valid, 'duration_minutes'], errors='coerce').to_numpy(dtype=np.float64)
+    else:
+        duration = np.full(len(start), np.nan)
+    timed = np.isfinite(duration) & (duration > 0)
+    handled = np.bincount(cells[timed], minlength=n_series * n_slots).reshape(n_series, n_slots)
+    seconds = np.bincount(cells[timed], weights=duration[timed] * 60.0,
+                          minlength=n_series * n_slots).reshape(n_series, n_slots)
+
+    # Credibility-weighted AHT: thin slots lean on the series average
+    series_handled = handled.sum(axis=1, keepdims=True)
+    series_aht = np.divide(seconds.sum(axis=1, keepdims=True), series_handled,
+                           out=np.zeros((n_series, 1)), where=series_handled > 0)
+    aht_seconds = (seconds + AHT_PRIOR_WEIGHT * series_aht) / (handled + AHT_PRIOR_WEIGHT)
+
+    return IntervalWorkload(arrivals, aht_seconds, series.reset_index(drop=True), slots, interval_minutes)
+
+
+def _dimension_codes(frame):
+    """Series code per row and the label table of observed dimension combinations."""
+    codes, labels = [], []
+    for column in frame.columns:
+        column_codes, uniques = pd.factorize(frame[column])
+        uniques = np.append(uniques.astype(str).to_numpy(dtype=object), 'Unknown')
+        codes.append(np.where(column_codes < 0, len(uniques) - 1, column_codes))
+        labels.append(uniques)
+    shape = [len(l) for l in labels]
+    observed, series_codes = np.unique(np.ravel_multi_index(codes, shape), return_inverse=True)
+    label_codes = np.unravel_index(observed, shape)
+    series = pd.DataFrame({col: labels[i][label_codes[i]] for i, col in enumerate(frame.columns)})
+    return series_codes.ravel(), series
+
+# ============================================================================
+# ERLANG C
+# ============================================================================
+
+def _log_factorials(n_max):
+    """log(k!) for k = 0..n_max."""
+    return np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n_max + 1, dtype=np.float64)))])
+
+
+def _poisson_window(load):
+    """First and last k whose Poisson(load) terms matter relative to the mode (~e^-70 cut-off)."""
+    spread = POISSON_WINDOW_SIGMAS * np.sqrt(load) + POISSON_WINDOW_SIGMAS
+    return np.floor(np.maximum(load - spread, 0.0)).astype(np.int64), np.ceil(load + spread).astype(np.int64)
+
+
+def log_wait_probability(agents, load):
+    """
+    Erlang C log probability of waiting, computed in log-space.
+
+    Uses log(A^k / k!) = k log A - log k! with a running logaddexp for the
+    sum over k < N. Only the terms within POISSON_WINDOW_SIGMAS standard
+    deviations of the load contribute, so each cell costs O(sqrt(A))
+    rather than O(N) and A^N or N! are never formed directly.
+
+    Args:
+        agents (np.ndarray): Agent counts, shape (cells, candidates)
+        load (np.ndarray): Offered loads in Erlangs, shape (cells,), all > 0
+
+    Returns:
+        np.ndarray: log P(wait) per cell and agent count; 0 (P = 1) where
+        N <= load and the queue is unstable
+    """
+    agents = np.asarray(agents, dtype=np.int64)
+    load = np.asarray(load, dtype=np.float64)
+    log_load = np.log(load)[:, None]
+    first, last = _poisson_window(load)
+    last = np.minimum(last, agents.max(axis=1) - 1)
+    width = int(max((last - first).max(), 0)) + 1
+    log_factorial = _log_factorials(int(max(agents.max(), first.max() + width)))
+
+    k = first[:, None] + np.arange(width)
+    log_partial = np.logaddexp.accumulate(k * log_load - log_factorial[k], axis=1)
+    offset = agents - 1 - first[:, None]
+    log_below = np.take_along_axis(log_partial, np.clip(offset, 0, width - 1), axis=1)
+    log_below = np.where(offset >= 0, log_below, -np.inf)
+
+    stable = agents > load[:, None]
+    headroom = np.where(stable, agents - load[:, None], 1.0)
+    log_top = agents * log_load - log_factorial[agents] + np.log(agents) - np.log(headroom)
+    return np.where(stable, log_top - np.logaddexp(log_below, log_top), 0.0)
+
+
+def service_level(agents, load, aht_seconds, answer_seconds, log_wait=None):
+    """
+    Share of contacts answered within answer_seconds: 1 - C * exp(-(N - A) T / AHT).
+
+    Args:
+        agents, load, aht_seconds, answer_seconds (np.ndarray): Broadcastable arrays
+        log_wait (np.ndarray): Precomputed log_wait_probability(agents, load)
+
+    Returns:
+        np.ndarray: Service level in [0, 1], accurate near 1 via expm1
+    """
+    if log_wait is None:
+        log_wait = log_wait_probability(agents, load)
+    exponent = log_wait - np.maximum(agents - load, 0.0) * answer_seconds / aht_seconds
+    return -np.expm1(np.minimum(exponent, 0.0))
+
+
+def _solve_block(load, aht, answer, target, occupancy, span):
+    """Smallest N meeting the targets among span candidates per cell (0 where none does)."""
+    # Below the occupancy cap or at/under the load the targets cannot be met
+    lowest = np.maximum(np.floor(load) + 1, np.ceil(load / occupancy - 1e-9)).astype(np.int64)
+    agents = lowest[:, None] + np.arange(span)
+    log_wait = log_wait_probability(agents, load)
+    service = service_level(agents, load[:, None], aht[:, None], answer[:, None], log_wait)
+    feasible = service >= target[:, None]
+    found = feasible.any(axis=1)
+    first = feasible.argmax(axis=1)
+    rows = np.arange(len(load))
+    return np.where(found, agents[rows, first], 0), service[rows, first], log_wait[rows, first]
+
+
+def required_agents(load, aht_seconds, target_service_level=DEFAULT_TARGET_SERVICE_LEVEL,
+                    target_answer_seconds=DEFAULT_TARGET_ANSWER_SECONDS, max_occupancy=DEFAULT_MAX_OCCUPANCY):
+    """
+    Minimum agents meeting the service-level and occupancy targets (Erlang C).
+
+    All arguments broadcast against each other, so one call can cover
+    scenarios x series x intervals. Cells are sorted by load and solved in
+    blocks sized to MAX_BLOCK_CELLS; each cell only evaluates a
+    square-root-staffing sized range of agent counts above its occupancy
+    floor, widened for the few cells that need more.
+
+    Args:
+        load (array-like): Offered load in Erlangs
+        aht_seconds (array-like): Average handle time in seconds
+        target_service_level (array-like): Share answered within target_answer_seconds
+        target_answer_seconds (array-like): Answer-time threshold in seconds
+        max_occupancy (array-like): Highest allowed agent occupancy
+
+    Returns:
+        dict: Arrays in the broadcast shape: 'agents', 'service_level',
+        'wait_probability', 'asa_seconds' and 'occupancy'
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in
+                                   (load, aht_seconds, target_service_level, target_answer_seconds, max_occupancy)])
+    shape = arrays[0].shape
+    load, aht, target, answer, occupancy = [a.ravel() for a in arrays]
+
+    agents = np.zeros(load.shape, dtype=np.int64)
+    service = np.ones(load.shape)
+    log_wait = np.full(load.shape, -np.inf)
+
+    active = np.flatnonzero((load > 0) & (aht > 0))
+    order = active[np.argsort(load[active], kind='stable')]
+    position = 0
+    while position < len(order):
+        # Candidate span and Poisson window both grow with sqrt(load); size the block on its last cell
+        root = np.sqrt(load[order[position]])
+        cost = int(2 * POISSON_WINDOW_SIGMAS * (root + 1) + STAFFING_SPAN_SIGMAS * root + 10)
+        block = order[position:position + max(1, MAX_BLOCK_CELLS // cost)]
+        span = int(np.ceil(STAFFING_SPAN_SIGMAS * np.sqrt(load[block[-1]]) + 10))
+        pending = block
+        while len(pending):
+            n, s, w = _solve_block(load[pending], aht[pending], answer[pending], target[pending],
+                                   occupancy[pending], span)
+            solved = n > 0
+            agents[pending[solved]], service[pending[solved]], log_wait[pending[solved]] = n[solved], s[solved], w[solved]
+            pending = pending[~solved]
+            span *= 4
+        position += len(block)
+
+    wait = np.exp(log_wait)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        asa = np.where(agents > 0, wait * aht / np.maximum(agents - load, 1e-12), 0.0)
+        utilisation = np.where(agents > 0, load / agents, 0.0)
+    return {
+        'agents': agents.reshape(shape),
+        'service_level': service.reshape(shape),
+        'wait_probability': wait.reshape(shape),
+        'asa_seconds': asa.reshape(shape),
+        'occupancy': utilisation.reshape(shape)
+    }
+
+# ============================================================================
+# SCENARIO SWEEPS
+# ============================================================================
+
+def sweep_staffing(workload, scenarios=None):
+    """
+    Required and scheduled agents for every scenario, series and interval.
+
+    Args:
+        workload (IntervalWorkload): Output of build_interval_workload
+        scenarios (pd.DataFrame): Rows with SCENARIO_COLUMNS, defaults to DEFAULT_SCENARIOS
+
+    Returns:
+        pd.DataFrame: One row per scenario x series x slot with arrivals,
+        aht_seconds, load_erlangs, required_agents, scheduled_agents,
+        service_level, asa_seconds and occupancy
+    """
+    scenarios = (DEFAULT_SCENARIOS if scenarios is None else scenarios).reset_index(drop=True)
+    n_scenarios = len(scenarios)
+    n_series, n_slots = workload.arrivals.shape
+    if n_scenarios == 0 or n_series == 0:
+        return pd.DataFrame()
+
+    def per_scenario(column):
+        return scenarios[column].to_numpy(dtype=np.float64)[:, None, None]
+
+    arrivals = workload.arrivals[None] * per_scenario('volume_multiplier')
+    aht = workload.aht_seconds[None] * per_scenario('aht_multiplier')
+    load = arrivals * aht / (workload.interval_minutes * 60.0)
+    result = required_agents(load, aht, per_scenario('target_service_level'),
+                             per_scenario('target_answer_seconds'), per_scenario('max_occupancy'))
+    # Scheduled headcount covers breaks, training and absence on top of the Erlang requirement
+    scheduled = np.ceil(result['agents'] / (1.0 - per_scenario('shrinkage'))).astype(np.int64)
+
+    n_cells = n_series * n_slots
+    plan = pd.DataFrame({
+        'scenario': np.repeat(scenarios['scenario'].to_numpy(), n_cells),
+        'day_of_week': np.tile(workload.slots['day_of_week'].to_numpy(), n_scenarios * n_series),
+        'interval_start': np.tile(workload.slots['interval_start'].to_numpy(), n_scenarios * n_series),
+        'arrivals': arrivals.ravel(),
+        'aht_seconds': np.broadcast_to(aht, load.shape).ravel(),
+        'load_erlangs': load.ravel(),
+        'required_agents': result['agents'].ravel(),
+        'scheduled_agents': scheduled.ravel(),
+        'service_level': result['service_level'].ravel(),
+        'asa_seconds': result['asa_seconds'].ravel(),
+        'occupancy': result['occupancy'].ravel()
+    })
+    for column in workload.series.columns:
+        plan.insert(1, column, np.tile(np.repeat(workload.series[column].to_numpy(), n_slots), n_scenarios))
+    return plan
+
+
+def summarize_staffing(plan, interval_minutes=INTERVAL_MINUTES):
+    """
+    Weekly totals per scenario.
+
+    Args:
+        plan (pd.DataFrame): Output of sweep_staffing
+        interval_minutes (int): Interval length used for the plan
+
+    Returns:
+        pd.DataFrame: Peak and total agent-hours, arrivals and
+        workload-weighted service level and occupancy per scenario
+    """
+    if plan.empty:
+        return pd.DataFrame()
+    hours = interval_minutes / 60.0
+    # Series of one slot are staffed together, so peaks are taken on the slot totals
+    slot_totals = plan.groupby(['scenario', 'day_of_week', 'interval_start'], sort=False, observed=True)[
+        ['required_agents', 'scheduled_agents']].sum()
+    weighted = plan.assign(sl_weight=plan['service_level'] * plan['arrivals'])
+    totals = weighted.groupby('scenario', sort=False).agg(
+        weekly_arrivals=('arrivals', 'sum'),
+        workload_hours=('load_erlangs', 'sum'),
+        sl_weight=('sl_weight', 'sum')
+    )
+    peaks = slot_totals.groupby(level='scenario', sort=False).agg(
+        peak_required_agents=('required_agents', 'max'),
+        peak_scheduled_agents=('scheduled_agents', 'max'),
+        required_agent_hours=('required_agents', 'sum'),
+        scheduled_agent_hours=('scheduled_agents', 'sum')
+    )
+    summary = totals.join(peaks)
+    summary['workload_hours'] *= hours
+    summary['required_agent_hours'] *= hours
+    summary['scheduled_agent_hours'] *= hours
+    summary['service_level'] = np.where(summary['weekly_arrivals'] > 0,
+                                        summary['sl_weight'] / summary['weekly_arrivals'].where(summary['weekly_arrivals'] > 0), 1.0)
+    summary['occupancy'] = np.where(summary['required_agent_hours'] > 0,
+                                    summary['workload_hours'] / summary['required_agent_hours'].where(summary['required_agent_hours'] > 0), 0.0)
+    return summary.drop(columns='sl_weight').reset_index()
+
+
+def get_staffing_plan(scenarios=None, interval_minutes=INTERVAL_MINUTES, dimensions=None):
+    """
+    Staffing sweep for the current session interactions, cached per table version and inputs.
+
+    Returns:
+        dict: 'workload' (IntervalWorkload), 'plan' and 'summary' DataFrames
+    """
+    interactions = st.session_state.get('interactions', pd.DataFrame())
+    scenarios = DEFAULT_SCENARIOS if scenarios is None else scenarios
+    key = (table_version(interactions), interval_minutes, tuple(dimensions or ()),
+           tuple(map(tuple, scenarios[SCENARIO_COLUMNS].itertuples(index=False))))
+    cache = st.session_state.setdefault(SESSION_STAFFING_KEY, {})
+    if key not in cache:
+        for stale in [k for k in cache if k[0] != key[0]]:
+            del cache[stale]
+        workload = build_interval_workload(interactions, interval_minutes, dimensions)
+        plan = sweep_staffing(workload, scenarios)
+        cache[key] = {'workload': workload, 'plan': plan,
+                      'summary': summarize_staffing(plan, interval_minutes)}
+    return cache[key]
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Customer Service Text Analytics
+===============================
+
+Offline analysis of the free-text columns (feedback comments, ticket
+descriptions and resolution notes), CPU-only and without downloaded models:
+- Texts are normalized (case, digits, punctuation) and deduplicated, and
+  every distinct text is processed once: results are cached per text hash,
+  so a refresh only processes texts that were not seen before
+- Batched tokenization into a hashing TF-IDF space, run in parallel chunks
+- Topic clusters from MiniBatchKMeans, labelled with their most distinctive
+  terms, and a lexicon sentiment score that does not depend on the
+  precomputed sentiment label
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cs_fact_cube import table_version
+
+try:
+    from joblib import Parallel, delayed
+    from scipy import sparse
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+    from sklearn.preprocessing import normalize
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Source key -> (session table, text column, id column, display label)
+TEXT_SOURCES = {
+    'feedback_comments': ('feedback', 'comments', 'feedback_id', 'Feedback Comments'),
+    'ticket_descriptions': ('tickets', 'description', 'ticket_id', 'Ticket Descriptions'),
+    'resolution_notes': ('tickets', 'resolution_notes', 'ticket_id', 'Resolution Notes')
+}
+
+HASH_FEATURES = 2 ** 18
+TOKEN_PATTERN = r'(?u)\b[a-z][a-z]+\b'
+
+# Distinct texts per vectorization batch, and the most parallel workers used
+BATCH_ROWS = 20_000
+MAX_JOBS = 4
+
+DEFAULT_TOPICS = 8
+TOPIC_TERMS = 3
+
+# Distinct texts the topic model is fitted on; the rest are assigned to its clusters
+FIT_SAMPLE_ROWS = 200_000
+LABEL_SAMPLE_ROWS = 20_000
+
+# Refit the topics once the texts added since the last fit exceed this share of it
+REFIT_GROWTH = 0.5
+
+# Cached texts per source before the cache starts over
+MAX_CACHED_TEXTS = 5_000_000
+
+POSITIVE_TERMS = [
+    'excellent', 'great', 'good', 'helpful', 'fast', 'quick', 'friendly', 'resolved', 'satisfied',
+    'thanks', 'thank', 'amazing', 'easy', 'professional', 'love', 'perfect', 'appreciate', 'smooth'
+]
+NEGATIVE_TERMS = [
+    'bad', 'poor', 'slow', 'terrible', 'unhelpful', 'rude', 'frustrated', 'frustrating', 'disappointed',
+    'broken', 'failed', 'error', 'waiting', 'worst', 'difficult', 'confusing', 'unresolved', 'needs improvement'
+]
+
+UNKNOWN_TOPIC = -1
+SESSION_TEXT_KEY = 'cs_text_analytics'
+
+# Per-source text caches shared across sessions
+_text_stores = {}
+_store_lock = threading.Lock()
+
+# ============================================================================
+# TOKENIZATION
+# ============================================================================
+
+def normalize_texts(values):
+    """
+    Lower-case texts with digits and punctuation removed, evaluated once per distinct value.
+
+    Returns:
+        np.ndarray: Normalized text per row ('' for missing values)
+    """
+    codes, uniques = pd.factorize(pd.Series(values))
+    normalized = (pd.Series(uniques.astype(str)).str.lower()
+                  .str.replace(r'[^a-z\s]+', ' ', regex=True)
+                  .str.replace(r'\s+', ' ', regex=True).str.strip())
+    return np.append(normalized.to_numpy(dtype=object), '')[codes]
+
+
+def text_hashes(normalized):
+    """Stable 64-bit hash per normalized text."""
+    return pd.util.hash_array(np.asarray(normalized, dtype=object))
+
+
+def _hashing_vectorizer():
+    return HashingVectorizer(
+        n_features=HASH_FEATURES, token_pattern=TOKEN_PATTERN, stop_words='english',
+        ngram_range=(1, 2), alternate_sign=False, norm=None
+    )
+
+
+@lru_cache(maxsize=1)
+def _lexicon_columns():
+    """Hashed feature column of each positive and negative lexicon term (phrases as bigrams)."""
+    vectorizer = _hashing_vectorizer()
+    analyzer = vectorizer.build_analyzer()
+    columns = []
+    for terms in (POSITIVE_TERMS, NEGATIVE_TERMS):
+        # The analyzer emits unigrams first, so the last feature is the whole term
+        features = [analyzer(term)[-1] for term in terms]
+        columns.append(HashingVectorizer(
+            n_features=HASH_FEATURES, analyzer=list, alternate_sign=False, norm=None
+        ).transform([[feature] for feature in features]).indices)
+    return columns
+
+
+def _vectorize_batch(texts):
+    """Hashed term counts, lexicon sentiment and token count for one batch of texts."""
+    # Texts are tokenized once; lexicon hits are read from the same hashed counts
+    counts = _hashing_vectorizer().transform(texts)
+    positive_columns, negative_columns = _lexicon_columns()
+    positive = np.asarray(counts[:, positive_columns].sum(axis=1)).ravel()
+    negative = np.asarray(counts[:, negative_columns].sum(axis=1)).ravel()
+    total = positive + negative
+    sentiment = np.divide(positive - negative, total, out=np.zeros(len(texts)), where=total > 0)
+    tokens = pd.Series(texts, dtype=object).str.count(r'\S+').to_numpy(dtype=np.int64)
+    return counts, sentiment, tokens
+
+
+def vectorize_texts(texts, n_jobs=None, batch_rows=BATCH_ROWS):
+    """
+    Vectorize texts in batches, in parallel when there is more than one batch.
+
+    Args:
+        texts (np.ndarray): Normalized texts
+        n_jobs (int): Worker processes, defaults to min(MAX_JOBS, CPU count)
+        batch_rows (int): Texts per batch
+
+    Returns:
+        tuple: (csr term-count matrix, sentiment array, token-count array)
+    """
+    batches = [texts[start:start + batch_rows] for start in range(0, len(texts), batch_rows)]
+    if len(batches) <= 1:
+        results = [_vectorize_batch(batch) for batch in batches]
+    else:
+        n_jobs = n_jobs or min(MAX_JOBS, os.cpu_count() or 1)
+        results = Parallel(n_jobs=n_jobs)(delayed(_vectorize_batch)(batch) for batch in batches)
+    if not results:
+        return sparse.csr_matrix((0, HASH_FEATURES)), np.zeros(0), np.zeros(0, dtype=np.int64)
+    return (sparse.vstack([result[0] for result in results]).tocsr(),
+            np.concatenate([result[1] for result in results]),
+            np.concatenate([result[2] for result in results]))
+
+# ============================================================================
+# TOPIC MODEL
+# ============================================================================
+
+class TopicModel:
+    """
+    Hashing TF-IDF weights and MiniBatchKMeans clusters fitted on a corpus.
+
+    Attributes:
+        idf (np.ndarray): Inverse document frequency per hashed feature
+        kmeans (MiniBatchKMeans): Fitted clusters
+        labels (list): Label per topic from its most distinctive terms
+        fitted_texts (int): Distinct texts the model was fitted on
+    """
+
+    def __init__(self, idf, kmeans, labels, fitted_texts):
+        self.idf = idf
+        self.kmeans = kmeans
+        self.labels = labels
+        self.fitted_texts = fitted_texts
+
+    def tfidf(self, counts):
+        return normalize(counts.multiply(self.idf).tocsr())
+
+    def assign(self, counts):
+        """Topic per row of a term-count matrix (UNKNOWN_TOPIC for texts without terms)."""
+        topics = np.full(counts.shape[0], UNKNOWN_TOPIC, dtype=np.int64)
+        has_terms = counts.getnnz(axis=1) > 0
+        for start in range(0, counts.shape[0], BATCH_ROWS):
+            rows = np.flatnonzero(has_terms[start:start + BATCH_ROWS]) + start
+            if len(rows):
+                topics[rows] = self.kmeans.predict(self.tfidf(counts[rows]))
+        return topics
+
+
+def _topic_labels(texts, topics, n_topics):
+    """Label each topic with the terms most over-represented in it."""
+    rng = np.random.default_rng(42)
+    sample = rng.choice(len(texts), min(len(texts), LABEL_SAMPLE_ROWS), replace=False)
+    vectorizer = CountVectorizer(token_pattern=TOKEN_PATTERN, stop_words='english', max_features=5_000)
+    try:
+        counts = vectorizer.fit_transform(texts[sample])
+    except ValueError:
+        return [f'Topic {topic + 1}' for topic in range(n_topics)]
+    terms = vectorizer.get_feature_names_out()
+    # Lift in the share of texts containing a term, so terms present everywhere score zero
+    presence = (counts > 0).astype(np.float64)
+    overall = np.asarray(presence.mean(axis=0)).ravel()
+    labels = []
+    for topic in range(n_topics):
+        members = topics[sample] == topic
+        if not members.any():
+            labels.append(f'Topic {topic + 1}')
+            continue
+        lift = np.asarray(presence[members].mean(axis=0)).ravel() - overall
+        top = [term for term in np.argsort(lift)[::-1][:TOPIC_TERMS] if lift[term] > 0]
+        labels.append(' · '.join(terms[top]) if top else f'Topic {topic + 1}')
+    return labels
+
+
+def fit_topic_model(texts, counts, n_topics=DEFAULT_TOPICS):
+    """
+    Fit TF-IDF weights and topic clusters.
+
+    Args:
+        texts (np.ndarray): Distinct normalized texts
+        counts (csr_matrix): Their hashed term counts
+        n_topics (int): Clusters to fit
+
+    Returns:
+        TopicModel or None: None when no text has any terms
+    """
+    has_terms = np.flatnonzero(counts.getnnz(axis=1) > 0)
+    if len(has_terms) == 0:
+        return None
+    document_frequency = np.bincount(counts[has_terms].indices, minlength=HASH_FEATURES)
+    idf = np.log((1 + len(has_terms)) / (1 + document_frequency)) + 1
+
+    rng = np.random.default_rng(42)
+    sample = has_terms if len(has_terms) <= FIT_SAMPLE_ROWS else rng.choice(has_terms, FIT_SAMPLE_ROWS, replace=False)
+    n_topics = max(1, min(n_topics, len(sample)))
+    model = TopicModel(idf, None, [], len(texts))
+    model.kmeans = MiniBatchKMeans(n_clusters=n_topics, batch_size=4096, n_init=3, random_state=42)
+    model.kmeans.fit(model.tfidf(counts[sample]))
+    model.labels = _topic_labels(texts, model.assign(counts), n_topics)
+    return model
+
+# ============================================================================
+# CACHED PIPELINE
+# ============================================================================
+
+class TextAnalyticsStore:
+    """
+    Results per distinct text hash for one text source, extended incrementally.
+
+    Attributes:
+        results (pd.DataFrame): text, topic, text_sentiment and tokens indexed by hash
+        model (TopicModel): Topic model the stored topics come from
+        processed (int): Texts vectorized over the store's lifetime
+        added_since_fit (int): Texts added since the topic model was last fitted
+    """
+
+    def __init__(self):
+        self.results = pd.DataFrame({
+            'text': pd.Series(dtype=object), 'topic': pd.Series(dtype=np.int64),
+            'text_sentiment': pd.Series(dtype=np.float64), 'tokens': pd.Series(dtype=np.int64)
+        }, index=pd.Index([], dtype=np.uint64, name='text_hash'))
+        self.model = None
+        self.processed = 0
+        self.added_since_fit = 0
+        self.lock = threading.Lock()
+
+    def update(self, normalized, hashes, n_topics=DEFAULT_TOPICS, n_jobs=None):
+        """
+        Process texts whose hash is not stored yet, refitting topics when the corpus has grown.
+
+        Returns:
+            int: Newly processed texts
+        """
+        new = ~pd.Index(hashes).isin(self.results.index)
+        new_hashes, first = np.unique(hashes[new], return_index=True)
+        new_texts = normalized[new][first]
+        if len(new_hashes) == 0:
+            return 0
+
+        counts, sentiment, tokens = vectorize_texts(new_texts, n_jobs)
+        self.processed += len(new_hashes)
+        self.added_since_fit += len(new_hashes)
+        added = pd.DataFrame({'text': new_texts, 'topic': UNKNOWN_TOPIC, 'text_sentiment': sentiment,
+                              'tokens': tokens}, index=pd.Index(new_hashes, name='text_hash'))
+
+        # Small updates accumulate towards a refit
+        grown = self.model is None or self.added_since_fit > REFIT_GROWTH * self.model.fitted_texts
+        if grown or len(self.results) + len(added) > MAX_CACHED_TEXTS:
+            if len(self.results) + len(added) > MAX_CACHED_TEXTS:
+                self.results = self.results.iloc[:0]
+            # Refit on every stored text so all topics come from the same clusters
+            texts = np.concatenate([self.results['text'].to_numpy(dtype=object), new_texts])
+            all_counts = counts if self.results.empty else vectorize_texts(texts, n_jobs)[0]
+            self.model = fit_topic_model(texts, all_counts, n_topics)
+            self.added_since_fit = 0
+            self.results = pd.concat([self.results, added])
+            if self.model is not None:
+                self.results['topic'] = self.model.assign(all_counts)
+        else:
+            added['topic'] = self.model.assign(counts)
+            self.results = pd.concat([self.results, added])
+        return len(new_hashes)
+
+
+def _store(source):
+    with _store_lock:
+        return _text_stores.setdefault(source, TextAnalyticsStore())
+
+
+def analyze_texts(values, source='texts', n_topics=DEFAULT_TOPICS, n_jobs=None):
+    """
+    Topic and lexicon sentiment per text, reusing cached results for texts seen before.
+
+    Args:
+        values (pd.Series): Raw texts
+        source (str): Cache namespace (TEXT_SOURCES key)
+        n_topics (int): Topics when the model has to be (re)fitted
+        n_jobs (int): Worker processes for vectorization
+
+    Returns:
+        tuple: (DataFrame aligned to values with topic, topic_label, text_sentiment
+        and tokens; TopicModel or None; number of newly processed texts)
+    """
+    if not SKLEARN_AVAILABLE:
+        raise ImportError("scikit-learn is required for text analytics")
+    normalized = normalize_texts(values)
+    hashes = text_hashes(normalized)
+
+    store = _store(source)
+    with store.lock:
+        processed = store.update(normalized, hashes, n_topics, n_jobs)
+        rows = store.results.reindex(hashes)
+        model = store.model
+
+    labels = np.array((model.labels if model is not None else []) + ['No Text'], dtype=object)
+    topics = rows['topic'].fillna(UNKNOWN_TOPIC).to_numpy(dtype=np.int64)
+    documents = pd.DataFrame({
+        'topic': topics,
+        'topic_label': labels[np.where(topics < 0, len(labels) - 1, topics)],
+        'text_sentiment': rows['text_sentiment'].to_numpy(),
+        'tokens': rows['tokens'].fillna(0).to_numpy(dtype=np.int64)
+    }, index=getattr(values, 'index', None))
+    # Missing and empty texts carry no topic or sentiment
+    empty = normalized == ''
+    documents.loc[empty, ['topic', 'topic_label', 'text_sentiment']] = [UNKNOWN_TOPIC, 'No Text', np.nan]
+    return documents, model, processed
+
+
+def summarize_topics(documents, ratings=None):
+    """
+    Documents, share and average text sentiment per topic.
+
+    Args:
+        documents (pd.DataFrame): Output of analyze_texts
+        ratings (pd.Series): Optional rating aligned to documents
+
+    Returns:
+        pd.DataFrame: One row per topic, largest first
+    """
+    frame = documents[documents['topic'] != UNKNOWN_TOPIC]
+    if frame.empty:
+        return pd.DataFrame(columns=['Topic', 'Documents', 'Share %', 'Avg Text Sentiment'])
+    grouped = frame.groupby('topic_label', sort=False)
+    summary = pd.DataFrame({
+        'Documents': grouped.size(),
+        'Avg Text Sentiment': grouped['text_sentiment'].mean()
+    })
+    if ratings is not None:
+        summary['Avg Rating'] = pd.to_numeric(ratings, errors='coerce').loc[frame.index].groupby(frame['topic_label']).mean()
+    summary['Share %'] = summary['Documents'] / len(frame) * 100
+    summary = summary.rename_axis('Topic').reset_index().sort_values('Documents', ascending=False)
+    columns = ['Topic', 'Documents', 'Share %', 'Avg Text Sentiment'] + (['Avg Rating'] if ratings is not None else [])
+    return summary[columns].reset_index(drop=True)
+
+# ============================================================================
+# SESSION ACCESS
+# ============================================================================
+
+def get_text_analytics(source='feedback_comments', n_topics=DEFAULT_TOPICS):
+    """
+    Text analytics for one source of the session data, cached per table version.
+
+    Returns:
+        dict: 'documents' (per row, with the source id column), 'topics' summary,
+        'new_texts' processed on this refresh and a 'message'
+    """
+    table, column, id_column, label = TEXT_SOURCES[source]
+    df = st.session_state.get(table, pd.DataFrame())
+    key = (source, table_version(df), n_topics)
+    cache = st.session_state.setdefault(SESSION_TEXT_KEY, {})
+    if key in cache:
+        return cache[key]
+
+    if df.empty or column not in df.columns:
+        result = {'documents': pd.DataFrame(), 'topics': pd.DataFrame(), 'new_texts': 0,
+                  'message': f"No {label.lower()} available for text analytics"}
+    elif not SKLEARN_AVAILABLE:
+        result = {'documents': pd.DataFrame(), 'topics': pd.DataFrame(), 'new_texts': 0,
+                  'message': "scikit-learn is required for text analytics"}
+    else:
+        documents, _, processed = analyze_texts(df[column], source, n_topics)
+        if id_column in df.columns:
+            documents.insert(0, id_column, df[id_column].to_numpy())
+        ratings = df['rating'] if 'rating' in df.columns else None
+        result = {'documents': documents, 'topics': summarize_topics(documents, ratings), 'new_texts': processed,
+                  'message': f"{label}: {processed:,} new distinct texts processed"}
+
+    for stale in [k for k in cache if k[0] == source]:
+        del cache[stale]
+    cache[key] = result
+    return result
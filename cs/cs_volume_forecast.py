@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Ticket Volume Forecasting
+=========================
+
+Multi-series ticket volume forecasts for staffing:
+- Ticket counts per channel x priority x queue series on a daily or hourly
+  grid, held as one (series x periods) array
+- Seasonal models fitted to every series at once with array operations:
+  seasonal naive, seasonal average and additive Holt-Winters (parameters
+  chosen per series from a small grid evaluated in one pass)
+- A rolling-origin backtest reporting accuracy and runtime per model
+- A disk-backed store so forecasts are computed once per dataset version
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cs_fact_cube import table_version
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Series dimensions; the queue is the first of QUEUE_COLUMNS present in the tickets
+SERIES_DIMENSIONS = ['channel', 'priority', 'queue']
+QUEUE_COLUMNS = ['queue', 'category', 'ticket_type']
+UNKNOWN_LABEL = 'Unknown'
+
+# Grid frequency -> (pandas frequency, seasonal period candidates, longest first)
+FREQUENCIES = {
+    'D': ('D', [7]),
+    'h': ('h', [168, 24])
+}
+
+# Holt-Winters smoothing grid evaluated for every series simultaneously
+HW_ALPHAS = [0.1, 0.3, 0.6]
+HW_BETAS = [0.0, 0.05]
+HW_GAMMAS = [0.05, 0.2, 0.4]
+
+DEFAULT_MODEL = 'holt_winters'
+BACKTEST_FOLDS = 3
+
+FORECAST_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'forecasts')
+STORE_FORMAT_VERSION = 1
+# Results kept in memory and on disk; the least recently used are evicted
+MAX_STORED_RESULTS = 16
+SESSION_FORECAST_KEY = 'cs_volume_forecasts'
+
+# ============================================================================
+# VOLUME MATRIX
+# ============================================================================
+
+class VolumeMatrix:
+    """
+    Ticket counts for many series on a regular time grid.
+
+    Attributes:
+        values (np.ndarray): float64 array of shape (series, periods)
+        series (pd.DataFrame): Dimension labels, one row per series
+        periods (pd.DatetimeIndex): Start of each period
+        freq (str): Grid frequency key ('D' or 'h')
+    """
+
+    def __init__(self, values, series, periods, freq):
+        self.values = values
+        self.series = series
+        self.periods = periods
+        self.freq = freq
+
+    @property
+    def season_length(self):
+        """Longest seasonal period with at least two full cycles of history (1 = none)."""
+        for candidate in FREQUENCIES[self.freq][1]:
+            if self.values.shape[1] >= 2 * candidate:
+                return candidate
+        return 1
+
+    def fingerprint(self):
+        """Content hash of the counts, series labels and grid."""
+        digest = hashlib.sha1()
+        digest.update(f'{self.freq}|{self.periods[0] if len(self.periods) else ""}|{self.values.shape}'.encode())
+        digest.update(np.ascontiguousarray(self.values).tobytes())
+        digest.update(pd.util.hash_pandas_object(self.series, index=False).to_numpy().tobytes())
+        return digest.hexdigest()[:16]
+
+    def total(self):
+        """Volume summed over all series."""
+        return pd.Series(self.values.sum(axis=0), index=self.periods, name='tickets')
+
+
+def _series_codes(tickets_df, dimensions):
+    """Integer code and label per ticket for each dimension (missing values -> UNKNOWN_LABEL)."""
+    codes, labels = [], []
+    for dimension in dimensions:
+        source = dimension
+        if dimension == 'queue':
+            source = next((col for col in QUEUE_COLUMNS if col in tickets_df.columns), None)
+        if source is None or source not in tickets_df.columns:
+            codes.append(np.zeros(len(tickets_df), dtype=np.int64))
+            labels.append(np.array([UNKNOWN_LABEL], dtype=object))
+            continue
+        dimension_codes, uniques = pd.factorize(tickets_df[source])
+        uniques = np.append(uniques.astype(str).to_numpy(dtype=object), UNKNOWN_LABEL)
+        codes.append(np.where(dimension_codes < 0, len(uniques) - 1, dimension_codes))
+        labels.append(uniques)
+    return codes, labels
+
+
+def build_volume_matrix(tickets_df, freq='D', dimensions=None):
+    """
+    Count tickets per series and period.
+
+    Args:
+        tickets_df (pd.DataFrame): Tickets with created_date
+        freq (str): 'D' for daily or 'h' for hourly counts
+        dimensions (list): Series dimensions, defaults to SERIES_DIMENSIONS
+
+    Returns:
+        VolumeMatrix: Counts for every observed series over the full date range
+    """
+    dimensions = list(dimensions or SERIES_DIMENSIONS)
+    pandas_freq = FREQUENCIES[freq][0]
+    empty = VolumeMatrix(np.zeros((0, 0)), pd.DataFrame(columns=dimensions),
+                         pd.DatetimeIndex([]), freq)
+    if tickets_df is None or tickets_df.empty or 'created_date' not in tickets_df.columns:
+        return empty
+
+    created = tickets_df['created_date']
+    if not pd.api.types.is_datetime64_any_dtype(created):
+        created = pd.to_datetime(created, errors='coerce')
+    valid = created.notna().to_numpy()
+    if not valid.any():
+        return empty
+
+    floored = created[valid].dt.floor(pandas_freq)
+    periods = pd.date_range(floored.min(), floored.max(), freq=pandas_freq)
+    step = pd.Timedelta(1, unit=pandas_freq)
+    period_codes = ((floored - periods[0]) // step).to_numpy(dtype=np.int64)
+
+    codes, labels = _series_codes(tickets_df, dimensions)
+    combined = np.ravel_multi_index([c[valid] for c in codes], [len(l) for l in labels])
+    observed, series_codes = np.unique(combined, return_inverse=True)
+
+    n_series, n_periods = len(observed), len(periods)
+    counts = np.bincount(series_codes * n_periods + period_codes, minlength=n_series * n_periods)
+    label_codes = np.unravel_index(observed, [len(l) for l in labels])
+    series = pd.DataFrame({dim: labels[i][label_codes[i]] for i, dim in enumerate(dimensions)})
+    return VolumeMatrix(counts.reshape(n_series, n_periods).astype(np.float64), series, periods, freq)
+
+# ============================================================================
+# MODELS
+# ============================================================================
+
+def seasonal_naive(values, horizon, season):
+    """Repeat the last observed season for every series."""
+    last_season = values[:, -season:]
+    return np.tile(last_season, int(np.ceil(horizon / season)) + 1)[:, :horizon]
+
+
+def seasonal_average(values, horizon, season, cycles=4):
+    """Average of the same seasonal position over the last `cycles` seasons."""
+    n_cycles = max(1, min(cycles, values.shape[1] // season))
+    history = values[:, -n_cycles * season:].reshape(values.shape[0], n_cycles, season)
+    profile = history.mean(axis=1)
+    return np.tile(profile, int(np.ceil(horizon / season)) + 1)[:, :horizon]
+
+
+def holt_winters(values, horizon, season):
+    """
+    Additive Holt-Winters fitted to every series at once.
+
+    Each (alpha, beta, gamma) combination of the grid is run as one slice of a
+    (grid, series) state array; the combination with the lowest one-step-ahead
+    squared error is selected per series.
+    """
+    n_series, n_periods = values.shape
+    if season < 2 or n_periods < 2 * season:
+        return seasonal_average(values, horizon, max(season, 1))
+
+    grid = np.array([(a, b, g) for a in HW_ALPHAS for b in HW_BETAS for g in HW_GAMMAS])
+    alpha, beta, gamma = (grid[:, i][:, None] for i in range(3))
+    n_grid = len(grid)
+
+    first, second = values[:, :season], values[:, season:2 * season]
+    level = np.broadcast_to(first.mean(axis=1), (n_grid, n_series)).copy()
+    trend = np.broadcast_to((second.mean(axis=1) - first.mean(axis=1)) / season, (n_grid, n_series)).copy()
+    seasonal = np.broadcast_to(first - first.mean(axis=1, keepdims=True), (n_grid, n_series, season)).copy()
+    sse = np.zeros((n_grid, n_series))
+
+    for t in range(n_periods):
+        position = t % season
+        observed = values[:, t]
+        seasonal_t = seasonal[:, :, position]
+        if t >= season:
+            sse += (observed - (level + trend + seasonal_t)) ** 2
+        previous_level = level
+        level = alpha * (observed - seasonal_t) + (1 - alpha) * (level + trend)
+        trend = beta * (level - previous_level) + (1 - beta) * trend
+        seasonal[:, :, position] = gamma * (observed - level) + (1 - gamma) * seasonal_t
+
+    best = sse.argmin(axis=0)
+    columns = np.arange(n_series)
+    steps = np.arange(1, horizon + 1)
+    positions = (n_periods + steps - 1) % season
+    forecast = (level[best, columns][:, None] + trend[best, columns][:, None] * steps
+                + seasonal[best, columns][:, positions])
+    return forecast
+
+
+FORECAST_MODELS = {
+    'seasonal_naive': seasonal_naive,
+    'seasonal_average': seasonal_average,
+    'holt_winters': holt_winters
+}
+
+
+def forecast_matrix(matrix, horizon, model=DEFAULT_MODEL):
+    """
+    Forecast every series of a volume matrix.
+
+    Returns:
+        np.ndarray: Non-negative forecasts of shape (series, horizon)
+    """
+    if matrix.values.size == 0:
+        return np.zeros((len(matrix.series), horizon))
+    season = matrix.season_length
+    forecast = FORECAST_MODELS[model](matrix.values, horizon, season)
+    return np.clip(forecast, 0, None)
+
+
+def forecast_frame(matrix, forecast):
+    """
+    Tidy forecast table.
+
+    Returns:
+        pd.DataFrame: Series dimensions, period and forecast, one row per series x period
+    """
+    n_series, horizon = forecast.shape
+    if len(matrix.periods) == 0:
+        return pd.DataFrame(columns=list(matrix.series.columns) + ['period', 'forecast'])
+    step = pd.Timedelta(1, unit=FREQUENCIES[matrix.freq][0])
+    future = pd.date_range(matrix.periods[-1] + step, periods=horizon, freq=FREQUENCIES[matrix.freq][0])
+    frame = matrix.series.iloc[np.repeat(np.arange(n_series), horizon)].reset_index(drop=True)
+    frame['period'] = np.tile(future, n_series)
+    frame['forecast'] = forecast.ravel()
+    return frame
+
+# ============================================================================
+# BACKTESTING
+# ============================================================================
+
+def backtest_models(matrix, horizon, folds=BACKTEST_FOLDS, models=None):
+    """
+    Rolling-origin backtest of the forecast models.
+
+    The last `folds * horizon` periods are forecast `horizon` periods at a time
+    from the history before each origin.
+
+    Args:
+        matrix (VolumeMatrix): Volume matrix to evaluate
+        horizon (int): Periods forecast from each origin
+        folds (int): Number of origins
+        models (list): Model names, defaults to all FORECAST_MODELS
+
+    Returns:
+        pd.DataFrame: Per model MAE, RMSE, WAPE %, bias %, accuracy % (100 - WAPE)
+        and the average fit time per origin in seconds
+    """
+    models = list(models or FORECAST_MODELS)
+    n_periods = matrix.values.shape[1]
+    season = matrix.season_length
+    folds = min(folds, max(0, (n_periods - 2 * season) // horizon))
+    if folds == 0:
+        return pd.DataFrame(columns=['model', 'mae', 'rmse', 'wape', 'bias', 'accuracy', 'fit_seconds', 'folds'])
+
+    results = []
+    for model in models:
+        errors, actuals, runtimes = [], [], []
+        for fold in range(folds, 0, -1):
+            origin = n_periods - fold * horizon
+            history = VolumeMatrix(matrix.values[:, :origin], matrix.series, matrix.periods[:origin], matrix.freq)
+            start = time.perf_counter()
+            forecast = forecast_matrix(history, horizon, model)
+            runtimes.append(time.perf_counter() - start)
+            actual = matrix.values[:, origin:origin + horizon]
+            errors.append(forecast - actual)
+            actuals.append(actual)
+        error, actual = np.concatenate(errors, axis=1), np.concatenate(actuals, axis=1)
+        total_actual = actual.sum()
+        wape = np.abs(error).sum() / total_actual * 100 if total_actual > 0 else np.nan
+        results.append({
+            'model': model,
+            'mae': np.abs(error).mean(),
+            'rmse': np.sqrt((error ** 2).mean()),
+            'wape': wape,
+            'bias': error.sum() / total_actual * 100 if total_actual > 0 else np.nan,
+            'accuracy': max(0.0, 100 - wape) if not np.isnan(wape) else np.nan,
+            'fit_seconds': float(np.mean(runtimes)),
+            'folds': folds
+        })
+    return pd.DataFrame(results).sort_values('wape', ignore_index=True)
+
+
+def seasonality_strength(matrix):
+    """
+    Share of the total volume's variance explained by its seasonal profile (percent).
+    """
+    season = matrix.season_length
+    total = matrix.values.sum(axis=0)
+    if season < 2 or len(total) < 2 * season or total.var() == 0:
+        return 0.0
+    n_cycles = len(total) // season
+    recent = total[-n_cycles * season:].reshape(n_cycles, season)
+    detrended = recent - recent.mean(axis=1, keepdims=True)
+    residual = detrended - detrended.mean(axis=0)
+    return float(max(0.0, 1 - residual.var() / detrended.var()) * 100) if detrended.var() > 0 else 0.0
+
+# ============================================================================
+# PERSISTENCE
+# ============================================================================
+
+class ForecastStore:
+    """
+    Disk-backed store of forecasts and backtests keyed by dataset version.
+
+    Entries are keyed by the volume matrix fingerprint and the request
+    parameters, so a rerun with unchanged data loads the stored result
+    instead of refitting. At most max_entries results are kept: the least
+    recently used are evicted from memory and their files deleted.
+    """
+
+    def __init__(self, root_dir=FORECAST_STORE_DIR, max_entries=MAX_STORED_RESULTS):
+        self.root_dir = root_dir
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'computed': 0, 'evicted': 0}
+
+    @staticmethod
+    def make_key(kind, matrix, params):
+        """Store key for a result kind, matrix version and parameters."""
+        payload = json.dumps({'kind': kind, 'matrix': matrix.fingerprint(), 'params': params,
+                              'format': STORE_FORMAT_VERSION}, sort_keys=True, default=str)
+        return f"{kind}-{hashlib.sha1(payload.encode()).hexdigest()[:16]}"
+
+    def get_or_compute(self, kind, matrix, params, compute_fn):
+        """Return the stored result for (kind, matrix, params), computing and saving it if missing."""
+        key = self.make_key(kind, matrix, params)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return self._memory[key]
+
+        path = self._path(key)
+        result = None
+        if os.path.exists(path):
+            try:
+                result = joblib.load(path)
+                self.stats['disk_hits'] += 1
+            except Exception:
+                result = None
+        computed = result is None
+        if computed:
+            result = compute_fn()
+            self.stats['computed'] += 1
+            try:
+                os.makedirs(self.root_dir, exist_ok=True)
+                joblib.dump(result, path)
+            except OSError:
+                pass  # Persisting is an optimisation; the in-memory copy still serves reruns
+
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                evicted, _ = self._memory.popitem(last=False)
+                self._remove_file(evicted)
+            if computed:
+                self._prune_disk()
+        return result
+
+    def _path(self, key):
+        return os.path.join(self.root_dir, f'{key}.joblib')
+
+    def _remove_file(self, key):
+        try:
+            os.remove(self._path(key))
+            self.stats['evicted'] += 1
+        except OSError:
+            pass
+
+    def _prune_disk(self):
+        """Delete the oldest result files beyond max_entries, e.g. left by earlier processes."""
+        try:
+            files = [f for f in os.listdir(self.root_dir) if f.endswith('.joblib')]
+            files.sort(key=lambda f: os.path.getmtime(os.path.join(self.root_dir, f)))
+        except OSError:
+            return
+        stale = [f[:-len('.joblib')] for f in files if f[:-len('.joblib')] not in self._memory]
+        for key in stale[:max(len(files) - self.max_entries, 0)]:
+            self._remove_file(key)
+
+
+_default_store = None
+_store_lock = threading.Lock()
+
+
+def get_forecast_store():
+    """Process-wide forecast store."""
+    global _default_store
+    with _store_lock:
+        if _default_store is None:
+            _default_store = ForecastStore()
+        return _default_store
+
+
+def forecast_ticket_volume(tickets_df, freq='D', horizon=28, model=DEFAULT_MODEL, dimensions=None, store=None):
+    """
+    Stored multi-series forecast and backtest for a tickets table.
+
+    Args:
+        tickets_df (pd.DataFrame): Tickets with created_date
+        freq (str): 'D' or 'h'
+        horizon (int): Periods to forecast
+        model (str): Name in FORECAST_MODELS
+        dimensions (list): Series dimensions, defaults to SERIES_DIMENSIONS
+        store (ForecastStore): Store to use, defaults to the process-wide store
+
+    Returns:
+        dict: 'matrix' (VolumeMatrix), 'forecast' (tidy DataFrame) and 'backtest' (DataFrame)
+    """
+    store = store or get_forecast_store()
+    matrix = build_volume_matrix(tickets_df, freq, dimensions)
+    params = {'freq': freq, 'horizon': horizon, 'model': model, 'dimensions': list(matrix.series.columns)}
+    forecast = store.get_or_compute(
+        'forecast', matrix, params, lambda: forecast_frame(matrix, forecast_matrix(matrix, horizon, model))
+    )
+    backtest = store.get_or_compute(
+        'backtest', matrix, params, lambda: backtest_models(matrix, horizon)
+    )
+    return {'matrix': matrix, 'forecast': forecast, 'backtest': backtest}
+
+
+def get_volume_forecast(freq='D', horizon=28, model=DEFAULT_MODEL):
+    """
+    Forecast for the current session tickets, rebuilt only when the tickets table changes.
+
+    Returns:
+        dict: Output of forecast_ticket_volume
+    """
+    tickets = st.session_state.get('tickets', pd.DataFrame())
+    key = (table_version(tickets), freq, horizon, model)
+    cache = st.session_state.setdefault(SESSION_FORECAST_KEY, {})
+    if key not in cache:
+        # Only the latest tickets version is kept per session
+        for stale in [k for k in cache if k[0] != key[0]]:
+            del cache[stale]
+        cache[key] = forecast_ticket_volume(tickets, freq, horizon, model)
+    return cache[key]
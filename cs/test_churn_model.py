@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for the customer churn model
+Checks labels, holdout metrics, scoring of active customers only and parity with the page scores
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from cs_churn_model import (RISK_LEVELS, build_churn_features, churn_labels, get_churn_scores,
+                            run_churn_pipeline, summarize_churn_scores, train_churn_model)
+from cs_fact_cube import set_table
+from cs_metrics_calculator import calculate_churn_prediction_models
+
+
+def churn_tables(n_customers=120, seed=7):
+    """
+    Customers whose churned share is separable from ticket and feedback history.
+
+    Every fourth customer churned and raised many high-priority tickets with low
+    ratings; every tenth is a prospect with no label.
+    """
+    rng = np.random.default_rng(seed)
+    ids = [f"C{i:04d}" for i in range(n_customers)]
+    status = np.where(np.arange(n_customers) % 4 == 0, 'Churned', 'Active').astype(object)
+    status[np.arange(n_customers) % 10 == 5] = 'Prospect'
+    customers = pd.DataFrame({'customer_id': ids, 'status': status,
+                              'acquisition_date': pd.Timestamp('2023-01-01')})
+
+    churned = status == 'Churned'
+    tickets_per_customer = np.where(churned, 8, 1)
+    ticket_customers = np.repeat(ids, tickets_per_customer)
+    ticket_churned = np.repeat(churned, tickets_per_customer)
+    tickets = pd.DataFrame({
+        'ticket_id': [f"T{i:05d}" for i in range(len(ticket_customers))],
+        'customer_id': ticket_customers,
+        'created_date': pd.Timestamp('2024-06-30') - pd.to_timedelta(rng.integers(0, 180, len(ticket_customers)), 'D'),
+        'priority': np.where(ticket_churned, 'High', 'Low'),
+        'status': 'Resolved'
+    })
+    feedback = pd.DataFrame({
+        'customer_id': ids,
+        'submitted_date': pd.Timestamp('2024-06-01'),
+        'rating': np.where(churned, 1, 5),
+        'nps_score': np.where(churned, 2, 9)
+    })
+    return customers, tickets, feedback
+
+
+def test_labels_from_status():
+    """Retained is 0, churned statuses are 1 in any case, others are unlabelled; first row per customer wins."""
+    customers = pd.DataFrame({'customer_id': ['A', 'B', 'C', 'D', 'A'],
+                              'status': ['Active', 'CHURNED', ' inactive ', 'Prospect', 'Churned']})
+    labels = churn_labels(customers)
+    assert labels.index.tolist() == ['A', 'B', 'C', 'D']
+    assert labels.iloc[:3].tolist() == [0.0, 1.0, 1.0]
+    assert np.isnan(labels['D'])
+    print("✅ Labels follow the customer status")
+
+
+def test_holdout_metrics():
+    """A quarter of the labelled customers is held out; separable data scores perfectly."""
+    customers, tickets, feedback = churn_tables()
+    features = build_churn_features(customers, tickets, feedback_df=feedback)
+    labels = churn_labels(customers)
+    model, message = train_churn_model(features, labels, fingerprint='test')
+
+    n_labelled = int(labels.notna().sum())
+    assert model is not None, message
+    assert model.n_training == n_labelled - int(np.ceil(n_labelled * 0.25))
+    assert set(model.metrics) == {'accuracy', 'precision', 'recall', 'f1', 'roc_auc'}
+    assert model.metrics['accuracy'] == 100.0 and model.metrics['roc_auc'] == 100.0
+
+    too_few, message = train_churn_model(features.iloc[:10], labels.iloc[:10])
+    assert too_few is None and 'Not enough labelled customers' in message
+    print("✅ Holdout metrics reported")
+
+
+def test_churned_customers_are_not_scored():
+    """Scores cover active and unlabelled customers, never churned ones."""
+    customers, tickets, feedback = churn_tables()
+    scores, model, message = run_churn_pipeline(customers, tickets, feedback_df=feedback)
+    assert model is not None, message
+
+    churned = set(customers.loc[customers['status'] == 'Churned', 'customer_id'])
+    assert churned.isdisjoint(scores['customer_id'])
+    assert len(scores) == len(customers) - len(churned)
+    assert list(scores['risk_level'].cat.categories) == RISK_LEVELS
+    assert (scores['risk_level'] == 'Low').all()
+    print("✅ Churned customers are not scored")
+
+
+def test_summary_matches_page_scores():
+    """The calculator summary reports the same model and scores as the page helpers."""
+    customers, tickets, feedback = churn_tables()
+    for name, df in (('customers', customers), ('tickets', tickets), ('feedback', feedback),
+                     ('interactions', pd.DataFrame())):
+        set_table(name, df)
+
+    scores, model, _ = get_churn_scores()
+    summary, summary_model = calculate_churn_prediction_models(customers, tickets, pd.DataFrame(), feedback)
+    assert summary_model is model, "Calculator trained its own model"
+    expected = summarize_churn_scores(scores)
+    values = summary.set_index('Metric')['Value']
+    assert values['Customer Churn Risk'] == f"{expected['predicted_churn_rate']:.1f}%"
+    assert values['At-Risk Customers'] == f"{expected['at_risk_customers']:,}"
+    assert values['Model Accuracy'] == f"{model.metrics['accuracy']:.1f}%"
+    print("✅ Calculator summary matches the page scores")
+
+
+if __name__ == "__main__":
+    test_labels_from_status()
+    test_holdout_metrics()
+    test_churned_customers_are_not_scored()
+    test_summary_matches_page_scores()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the customer service analytics cube
+Checks that session table versions change whenever a table is replaced or cleared
+"""
+
+import sys
+import os
+import gc
+import pandas as pd
+import streamlit as st
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from cs_fact_cube import (CS_TABLES, SESSION_CUBE_KEY, bump_table_version, clear_tables, get_fact_cube,
+                          set_table, table_version)
+
+
+def small_tickets(priority):
+    """Three tickets that differ from another call only in priority."""
+    return pd.DataFrame({
+        'ticket_id': ['T1', 'T2', 'T3'],
+        'created_date': ['2024-01-01', '2024-01-02', '2024-01-03'],
+        'priority': [priority] * 3,
+        'status': ['resolved', 'open', 'closed']
+    })
+
+
+def test_recycled_id_gets_new_version():
+    """A same-shaped frame that reuses a freed frame's id is a new version."""
+    seen = set()
+    recycled = 0
+    frame_id = None
+    for attempt in range(50):
+        df = small_tickets('high' if attempt % 2 else 'low')
+        recycled += id(df) == frame_id
+        frame_id = id(df)
+        seen.add(table_version(df))
+        del df
+        gc.collect()
+    assert len(seen) == 50, "A replaced table kept an old version"
+    print(f"✅ 50 replacements gave 50 versions ({recycled} reused an id)")
+
+
+def test_session_paths_rebuild_cube():
+    """set_table, bump_table_version and clear_tables all invalidate the session cube."""
+    set_table('tickets', small_tickets('low'))
+    first = get_fact_cube()
+    assert get_fact_cube() is first, "Unchanged tables rebuilt the cube"
+
+    set_table('tickets', small_tickets('high'))
+    second = get_fact_cube()
+    assert second is not first
+    assert (second.tickets['priority'] == 'high').all(), "Cube kept the old tickets"
+
+    st.session_state.tickets.loc[0, 'priority'] = 'low'
+    bump_table_version('tickets')
+    assert get_fact_cube() is not second, "Bumped table kept the old cube"
+
+    clear_tables()
+    assert SESSION_CUBE_KEY not in st.session_state
+    assert all(st.session_state[name].empty for name in CS_TABLES)
+    assert get_fact_cube().tickets.empty
+    print("✅ Session table changes rebuild the cube")
+
+
+if __name__ == "__main__":
+    test_recycled_id_gets_new_version()
+    test_session_paths_rebuild_cube()
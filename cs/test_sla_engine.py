@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the SLA compliance engine
+Checks rule matching, default targets, business hours, grace periods and open tickets
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from cs_sla_engine import DEFAULT_SLA_TARGETS, BusinessCalendar, calculate_sla_metrics, evaluate_sla
+
+SLA_RULES = pd.DataFrame({
+    'sla_id': ['SLA-BILL-HIGH', 'SLA-HIGH', 'SLA-TECH-LOW', 'SLA-BILL-HIGH-2'],
+    'ticket_type': ['Billing', '', 'Technical', 'Billing'],
+    'priority': ['High', 'High', 'Low', 'High'],
+    'first_response_target_hours': [2.0, 6.0, 1.0, 99.0],
+    'resolution_target_hours': [8.0, 24.0, 4.0, 99.0],
+    'grace_period_hours': [1.0, 0.0, 0.0, 0.0],
+    'business_hours_only': [False, False, False, False]
+})
+
+
+def tickets(rows):
+    """Tickets from (ticket_type, priority, created, first_response) tuples."""
+    return pd.DataFrame(rows, columns=['ticket_type', 'priority', 'created_date', 'first_response_date'])
+
+
+def test_typed_rule_and_blank_type_fallback():
+    """The first typed rule wins; other types use the blank-type rule for their priority only."""
+    evaluation = evaluate_sla(tickets([
+        ('Billing', 'High', '2024-01-02 09:00', None),
+        ('Technical', 'High', '2024-01-02 09:00', None),
+        ('Billing', 'Low', '2024-01-02 09:00', None)
+    ]), SLA_RULES)
+    assert evaluation['sla_id'].tolist()[:2] == ['SLA-BILL-HIGH', 'SLA-HIGH']
+    assert evaluation['response_target_hours'].tolist()[:2] == [2.0, 6.0]
+    # The Technical/Low rule is typed, so it is no fallback for a Billing/Low ticket
+    assert pd.isna(evaluation['sla_id'].iloc[2])
+    assert evaluation['response_target_hours'].iloc[2] == DEFAULT_SLA_TARGETS['Low'][0]
+    print("✅ Typed rules and the blank-type fallback verified")
+
+
+def test_default_targets_without_rules():
+    """Without a matching rule, targets come from DEFAULT_SLA_TARGETS, then the ticket's own target."""
+    frame = tickets([('Other', 'Critical', '2024-01-02 09:00', None),
+                     ('Other', 'Medium', '2024-01-02 09:00', None),
+                     ('Other', 'Medium', '2024-01-02 09:00', None)])
+    frame['sla_target_hours'] = [np.nan, np.nan, 12.0]
+    evaluation = evaluate_sla(frame, pd.DataFrame())
+    targets = evaluation[['response_target_hours', 'resolution_target_hours']].to_numpy()
+    assert np.array_equal(targets[0], DEFAULT_SLA_TARGETS['Critical'])
+    assert np.array_equal(targets[1], DEFAULT_SLA_TARGETS['Medium'])
+    assert np.array_equal(targets[2], [DEFAULT_SLA_TARGETS['Medium'][0], 12.0])
+    assert evaluation['sla_id'].isna().all()
+    print("✅ Default targets applied")
+
+
+def test_business_hours_skip_weekend_and_holiday():
+    """A Friday-evening ticket answered on Tuesday counts only working hours."""
+    rules = SLA_RULES.assign(business_hours_only=True)
+    frame = tickets([('Billing', 'High', '2024-01-05 16:00', '2024-01-08 10:00'),
+                     ('Billing', 'High', '2024-01-05 16:00', '2024-01-09 10:00'),
+                     ('Billing', 'High', '2024-01-06 12:00', '2024-01-06 15:00')])
+    plain = evaluate_sla(frame, rules, calendar=BusinessCalendar(9, 17))
+    assert plain['response_hours'].tolist() == [2.0, 10.0, 0.0]
+
+    holiday = evaluate_sla(frame, rules, calendar=BusinessCalendar(9, 17, holidays=['2024-01-08']))
+    assert holiday['response_hours'].tolist() == [1.0, 2.0, 0.0]
+    assert holiday['response_breached'].tolist() == [False, False, False]
+    assert plain['response_breached'].tolist() == [False, True, False]
+    print("✅ Business hours skip weekends and holidays")
+
+
+def test_grace_period():
+    """A response inside target plus grace is compliant; later ones breach."""
+    evaluation, overall, by_priority = calculate_sla_metrics(tickets([
+        ('Billing', 'High', '2024-01-02 09:00', '2024-01-02 11:30'),
+        ('Billing', 'High', '2024-01-02 09:00', '2024-01-02 12:00'),
+        ('Billing', 'High', '2024-01-02 09:00', '2024-01-02 12:30')
+    ]), SLA_RULES)
+    assert evaluation['response_breached'].tolist() == [False, False, True]
+    assert overall.loc['All', 'response_breaches'] == 1
+    assert np.isclose(overall.loc['All', 'response_compliance'], 200 / 3)
+    assert by_priority.index.tolist() == ['High']
+    print("✅ Grace period verified")
+
+
+def test_open_tickets_with_as_of():
+    """Open tickets breach once their running clock passes the target, and only with as_of."""
+    frame = tickets([('Billing', 'High', '2024-01-02 09:00', None),
+                     ('Billing', 'High', '2024-01-02 11:30', None),
+                     ('Billing', 'High', '2024-01-02 09:00', '2024-01-02 10:00')])
+
+    without = evaluate_sla(frame, SLA_RULES)
+    assert without['response_measured'].tolist() == [False, False, True]
+    assert not without['response_breached'].any()
+
+    running = evaluate_sla(frame, SLA_RULES, as_of='2024-01-02 13:00')
+    assert running['response_breached'].tolist() == [True, False, False]
+    # Late open tickets count towards compliance; open ones still inside target do not yet
+    assert running['response_measured'].tolist() == [True, False, True]
+    assert np.isnan(running['response_hours'].iloc[0])
+    print("✅ Open tickets evaluated against as_of")
+
+
+if __name__ == "__main__":
+    test_typed_rule_and_blank_type_fallback()
+    test_default_targets_without_rules()
+    test_business_hours_skip_weekend_and_holiday()
+    test_grace_period()
+    test_open_tickets_with_as_of()
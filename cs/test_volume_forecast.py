@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the ticket volume forecast
+Checks the forecast store's eviction and disk reuse, and backtests on a purely seasonal series
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from cs_volume_forecast import FORECAST_MODELS, ForecastStore, VolumeMatrix, backtest_models, forecast_matrix
+
+WEEKLY_PROFILE = np.array([40.0, 55.0, 50.0, 48.0, 60.0, 20.0, 12.0])
+
+
+def seasonal_matrix(weeks=10, scale=1.0):
+    """Two daily series that repeat the same weekly profile exactly."""
+    values = np.vstack([np.tile(WEEKLY_PROFILE, weeks), np.tile(WEEKLY_PROFILE[::-1], weeks)]) * scale
+    series = pd.DataFrame({'channel': ['Email', 'Phone'], 'priority': ['High', 'Low'], 'queue': ['Billing'] * 2})
+    periods = pd.date_range('2024-01-01', periods=values.shape[1], freq='D')
+    return VolumeMatrix(values, series, periods, 'D')
+
+
+def store_files(folder):
+    return sorted(f for f in os.listdir(folder) if f.endswith('.joblib'))
+
+
+def test_store_evicts_and_deletes_files():
+    """Past max_entries, the least recently used result leaves memory and disk."""
+    with tempfile.TemporaryDirectory() as folder:
+        store = ForecastStore(root_dir=folder, max_entries=2)
+        matrices = [seasonal_matrix(scale=scale) for scale in (1.0, 2.0, 3.0)]
+        keys = [store.make_key('forecast', matrix, {'horizon': 7}) for matrix in matrices]
+        for matrix in matrices[:2]:
+            store.get_or_compute('forecast', matrix, {'horizon': 7}, lambda m=matrix: forecast_matrix(m, 7))
+        # Touch the first result so the second one is the least recently used
+        store.get_or_compute('forecast', matrices[0], {'horizon': 7}, lambda: None)
+        store.get_or_compute('forecast', matrices[2], {'horizon': 7}, lambda: forecast_matrix(matrices[2], 7))
+
+        assert store_files(folder) == sorted(f'{key}.joblib' for key in (keys[0], keys[2]))
+        assert store.stats == {'memory_hits': 1, 'disk_hits': 0, 'computed': 3, 'evicted': 1}
+    print("✅ Evicted results are deleted from disk")
+
+
+def test_store_reuses_results_from_disk():
+    """A new store on the same folder loads stored results instead of recomputing."""
+    with tempfile.TemporaryDirectory() as folder:
+        matrix = seasonal_matrix()
+        expected = ForecastStore(root_dir=folder).get_or_compute('forecast', matrix, {'horizon': 7},
+                                                                 lambda: forecast_matrix(matrix, 7))
+
+        def recompute():
+            raise AssertionError("Stored result was recomputed")
+
+        store = ForecastStore(root_dir=folder)
+        for _ in range(2):
+            assert np.array_equal(store.get_or_compute('forecast', matrix, {'horizon': 7}, recompute), expected)
+        assert store.stats == {'memory_hits': 1, 'disk_hits': 1, 'computed': 0, 'evicted': 0}
+    print("✅ Stored results are reused from disk")
+
+
+def test_pure_seasonal_series_backtests_without_error():
+    """Every model reproduces an exactly repeating weekly pattern."""
+    backtest = backtest_models(seasonal_matrix(), horizon=7)
+    assert sorted(backtest['model']) == sorted(FORECAST_MODELS)
+    assert (backtest['folds'] == 3).all()
+    assert np.allclose(backtest[['mae', 'rmse', 'wape', 'bias']].to_numpy(dtype=float), 0.0, atol=1e-8)
+    assert np.allclose(backtest['accuracy'].to_numpy(dtype=float), 100.0)
+
+    too_short = backtest_models(seasonal_matrix(weeks=2), horizon=7)
+    assert too_short.empty
+    print("✅ Pure seasonal series backtest with zero error")
+
+
+if __name__ == "__main__":
+    test_store_evicts_and_deletes_files()
+    test_store_reuses_results_from_disk()
+    test_pure_seasonal_series_backtests_without_error()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Finance Health Scoring Engine Benchmark
+=======================================
+
+Scores synthetic statements for many entities (5k counterparties x 40
+quarters by default) with fin_health, against running
+predict_financial_health_score entity by entity on a sample, then
+appends one more quarter incrementally. Correctness is covered by
+test_fin_health.py.
+
+Usage:
+    python benchmark_fin_health.py
+    python benchmark_fin_health.py --entities 20000 --quarters 40 --sample 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fin_health import COMPONENT_NAMES, HealthScorer, score_components, score_entities
+from fin_predictive import FinancePredictiveAnalytics
+
+INDUSTRIES = ['Retail', 'Energy', 'Technology', 'Healthcare', 'Industrials']
+
+
+def generate_statements(n_entities, n_quarters, seed=42):
+    """Income statement, balance sheet, cash flow and peer attributes per (entity, quarter)."""
+    rng = np.random.default_rng(seed)
+    n_rows = n_entities * n_quarters
+    names = np.array([f"CP{i:05d}" for i in range(n_entities)])
+    entity = np.repeat(names, n_quarters)
+    period = np.tile(pd.period_range('2015Q1', periods=n_quarters, freq='Q').strftime('%Y-%m-01').to_numpy(), n_entities)
+    scale = np.repeat(rng.lognormal(14, 1.2, n_entities), n_quarters)
+    revenue = scale * np.cumprod(rng.normal(1.02, 0.08, (n_entities, n_quarters)), axis=1).ravel()
+    current_liabilities = revenue * rng.uniform(0.3, 0.9, n_rows)
+    income_statement = pd.DataFrame({'entity': entity, 'period': period, 'revenue': revenue,
+                                     'net_income': revenue * rng.normal(0.07, 0.08, n_rows)})
+    balance_sheet = pd.DataFrame({'entity': entity, 'period': period,
+                                  'current_assets': current_liabilities * rng.uniform(0.6, 2.6, n_rows),
+                                  'current_liabilities': current_liabilities})
+    cash_flow = pd.DataFrame({'entity': entity, 'period': period,
+                              'operating_cash_flow': revenue * rng.normal(0.09, 0.07, n_rows)})
+    peers = pd.DataFrame({'entity': names, 'industry': rng.choice(INDUSTRIES, n_entities)})
+    return income_statement, balance_sheet, cash_flow, peers
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"   {label:<40} {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def predictor_scores(income_statement, balance_sheet, cash_flow, entities):
+    """Historical scores from predict_financial_health_score, one entity at a time."""
+    empty = pd.DataFrame()
+    scores = {}
+    for name in entities:
+        rows = [table[table['entity'] == name].drop(columns='entity').reset_index(drop=True)
+                for table in (income_statement, balance_sheet, cash_flow)]
+        analytics = FinancePredictiveAnalytics(*rows, empty, empty, empty, empty, empty, empty)
+        # Unmemoized, so every entity is actually scored
+        prediction, _ = analytics.predict_financial_health_score.__wrapped__(analytics)
+        scores[name] = prediction['health_score'].dropna().to_numpy(dtype=np.float64)
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the batch financial-health scorer')
+    parser.add_argument('--entities', type=int, default=5_000, help='Counterparties and subsidiaries')
+    parser.add_argument('--quarters', type=int, default=40, help='Quarters per entity')
+    parser.add_argument('--sample', type=int, default=50, help='Entities scored one at a time for comparison')
+    args = parser.parse_args()
+
+    income_statement, balance_sheet, cash_flow, peers = generate_statements(args.entities, args.quarters)
+    print(f"🏢 {len(income_statement):,} entity-quarters ({args.entities:,} entities x {args.quarters} quarters)...")
+
+    sample = peers['entity'].iloc[:args.sample].tolist()
+    start = time.perf_counter()
+    predictor_scores(income_statement, balance_sheet, cash_flow, sample)
+    per_entity = (time.perf_counter() - start) / len(sample)
+    print(f"   {f'Per-entity predictor, {len(sample)} entities':<40} {per_entity * len(sample):7.3f}s "
+          f"(~{per_entity * args.entities:,.0f}s for all)")
+
+    timed("Component scores, all entities", score_components, income_statement, balance_sheet, cash_flow)
+    full = timed("Latest scores with peer ranks", score_entities, income_statement, balance_sheet, cash_flow, peers)
+
+    # Incremental: score all but the last quarter, then append it
+    last = income_statement['period'].max()
+    history = [(table['period'] < last).to_numpy() for table in (income_statement, balance_sheet, cash_flow)]
+    scorer = HealthScorer(peers)
+    scorer.append(*(table[mask] for table, mask in zip((income_statement, balance_sheet, cash_flow), history)))
+    timed(f"Append quarter {last}", scorer.append,
+          *(table[~mask] for table, mask in zip((income_statement, balance_sheet, cash_flow), history)))
+    timed("Latest scores after append", scorer.latest)
+
+    print(f"   Median score {full['health_score'].median():.0f}; mean components "
+          + ", ".join(f"{name} {full[name].mean():.1f}" for name in COMPONENT_NAMES)
+          + f"; {int((full['risk_level'] == 'High').sum()):,} high-risk entities")
+
+
+if __name__ == "__main__":
+    main()
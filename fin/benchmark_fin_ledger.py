@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Finance General Ledger Roll-up Benchmark
+========================================
+
+Writes a synthetic double-entry journal (balanced debit/credit pairs
+across entities and months) to CSV and Parquet, streams it through
+fin_ledger, and times building statements, closing the last month
+incrementally and re-closing it for one entity. Correctness is covered
+by test_fin_ledger.py.
+
+Usage:
+    python benchmark_fin_ledger.py
+    python benchmark_fin_ledger.py --lines 5000000 --entities 20 --months 36
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from fin_ledger import GeneralLedgerRollup
+from fin_metrics import calculate_financial_performance_metrics, calculate_liquidity_solvency_metrics
+
+CHART_OF_ACCOUNTS = pd.DataFrame([
+    ('1000', 'cash_and_equivalents'), ('1100', 'accounts_receivable'), ('1200', 'inventory'),
+    ('1500', 'non_current_assets'), ('2000', 'accounts_payable'), ('2500', 'long_term_debt'),
+    ('3000', 'shareholder_equity'), ('4000', 'revenue'), ('5000', 'cost_of_goods_sold'),
+    ('6000', 'operating_expenses'), ('6500', 'depreciation'), ('7000', 'interest_expense'),
+    ('7500', 'income_tax_expense')
+], columns=['account', 'line'])
+
+# (debit account, credit account, typical amount)
+TRANSACTIONS = [
+    ('1100', '4000', 5_000), ('5000', '1200', 2_500), ('1200', '2000', 2_600), ('1000', '1100', 4_800),
+    ('2000', '1000', 2_400), ('6000', '1000', 1_200), ('6500', '1500', 300), ('1500', '1000', 400),
+    ('7000', '1000', 100), ('7500', '1000', 250), ('1000', '2500', 500), ('1000', '3000', 300)
+]
+
+
+def generate_journal(n_lines, n_entities, n_months, seed=42):
+    """Balanced journal: every transaction is a debit line and a credit line."""
+    rng = np.random.default_rng(seed)
+    n_transactions = n_lines // 2
+    kind = rng.integers(0, len(TRANSACTIONS), n_transactions)
+    typical = np.array([amount for _, _, amount in TRANSACTIONS], dtype=np.float64)
+    amounts = np.round(rng.gamma(2.0, typical[kind] / 2.0), 2)
+    months = pd.period_range('2022-01', periods=n_months, freq='M')
+    posting_month = rng.integers(0, n_months, n_transactions)
+    days = rng.integers(1, 28, n_transactions)
+    dates = (months.to_timestamp()[posting_month] + pd.to_timedelta(days, unit='D')).strftime('%Y-%m-%d')
+    entities = np.array([f"SUB{i:04d}" for i in range(n_entities)])[rng.integers(0, n_entities, n_transactions)]
+    debit_accounts = np.array([debit for debit, _, _ in TRANSACTIONS])[kind]
+    credit_accounts = np.array([credit for _, credit, _ in TRANSACTIONS])[kind]
+    return pd.DataFrame({
+        'posting_date': np.concatenate([dates, dates]),
+        'entity': np.concatenate([entities, entities]),
+        'account': np.concatenate([debit_accounts, credit_accounts]),
+        'amount': np.concatenate([amounts, -amounts])
+    })
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"   {label:<34} {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the GL journal roll-up')
+    parser.add_argument('--lines', type=int, default=2_000_000, help='Journal lines')
+    parser.add_argument('--entities', type=int, default=20, help='Entities')
+    parser.add_argument('--months', type=int, default=36, help='Months')
+    parser.add_argument('--chunk-rows', type=int, default=500_000, help='Lines per chunk')
+    args = parser.parse_args()
+
+    journal = generate_journal(args.lines, args.entities, args.months)
+    print(f"📒 {len(journal):,} journal lines, {args.entities} entities, {args.months} months...")
+
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = os.path.join(folder, 'journal.csv')
+        parquet_path = os.path.join(folder, 'journal.parquet')
+        journal.to_csv(csv_path, index=False)
+        journal.to_parquet(parquet_path, index=False)
+
+        csv_rollup = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+        timed("Roll up CSV (chunked)", csv_rollup.ingest_file, csv_path, args.chunk_rows)
+        rollup = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+        timed("Roll up Parquet (chunked)", rollup.ingest_file, parquet_path, args.chunk_rows)
+
+    statements = timed("Consolidated statements", rollup.statements)
+    panel = timed("Per-entity statement panel", rollup.statement_panel)
+
+    last_month = rollup.periods[-1]
+    dates = pd.to_datetime(journal['posting_date'])
+    in_last_month = (dates.dt.strftime('%Y-%m-01') == last_month).to_numpy()
+    incremental = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+    incremental.ingest(journal[~in_last_month])
+    timed(f"Close month {last_month}", incremental.close_month, journal[in_last_month])
+    first_entity = rollup.entities[0]
+    entity_month = in_last_month & (journal['entity'] == first_entity).to_numpy()
+    timed(f"Re-close {last_month} for {first_entity}", incremental.close_month, journal[entity_month])
+
+    performance, message = calculate_financial_performance_metrics(statements['income_statement'], statements['balance_sheet'])
+    liquidity, _ = calculate_liquidity_solvency_metrics(statements['balance_sheet'], statements['cash_flow'])
+    if performance.empty or liquidity.empty:
+        print(f"   No metrics: {message}")
+        return
+
+    print(f"   {len(panel['balance_sheet']):,} entity-periods; latest net margin {performance['net_margin_pct'].iloc[-1]:.1f}%, "
+          f"current ratio {liquidity['current_ratio'].iloc[-1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Finance Ratio Engine Benchmark
+==============================
+
+Times fin_ratios.ratio_panel on synthetic statements for many entities
+and months (5k subsidiaries x 120 months by default), with the balance
+sheet in the same row order as the income statement and shuffled.
+Correctness is covered by test_fin_ratios.py.
+
+Usage:
+    python benchmark_fin_ratios.py
+    python benchmark_fin_ratios.py --entities 5000 --months 120
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fin_ratios import ratio_panel
+
+
+def generate_statements(n_entities, n_months, seed=42):
+    """Income statement and balance sheet keyed by (entity, period)."""
+    rng = np.random.default_rng(seed)
+    n_rows = n_entities * n_months
+    entity = np.repeat(np.array([f"SUB{i:05d}" for i in range(n_entities)], dtype=object), n_months)
+    period = np.tile(pd.period_range('2015-01', periods=n_months, freq='M').strftime('%Y-%m-01').to_numpy(dtype=object), n_entities)
+    revenue = rng.uniform(1e5, 5e6, n_rows)
+    gross_profit = revenue * rng.uniform(0.2, 0.6, n_rows)
+    operating_expenses = revenue * rng.uniform(0.1, 0.3, n_rows)
+    operating_income = gross_profit - operating_expenses
+    income_statement = pd.DataFrame({
+        'entity': entity, 'period': period, 'revenue': revenue, 'gross_profit': gross_profit,
+        'operating_expenses': operating_expenses, 'operating_income': operating_income,
+        'interest_expense': revenue * 0.01, 'net_income': operating_income * 0.75
+    })
+    total_assets = revenue * rng.uniform(1.5, 4.0, n_rows)
+    current_assets = total_assets * rng.uniform(0.2, 0.5, n_rows)
+    total_liabilities = total_assets * rng.uniform(0.3, 0.8, n_rows)
+    balance_sheet = pd.DataFrame({
+        'entity': entity, 'period': period, 'cash_and_equivalents': current_assets * 0.3,
+        'accounts_receivable': current_assets * 0.4, 'current_assets': current_assets,
+        'current_liabilities': current_assets * rng.uniform(0.4, 1.2, n_rows), 'total_assets': total_assets,
+        'total_liabilities': total_liabilities, 'shareholder_equity': total_assets - total_liabilities
+    })
+    return income_statement, balance_sheet
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"   {label:<38} {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the vectorized ratio engine')
+    parser.add_argument('--entities', type=int, default=5_000, help='Subsidiaries')
+    parser.add_argument('--months', type=int, default=120, help='Months per subsidiary')
+    args = parser.parse_args()
+
+    income_statement, balance_sheet = generate_statements(args.entities, args.months)
+    print(f"📐 {len(income_statement):,} entity-periods ({args.entities:,} entities x {args.months} months)...")
+
+    panel = timed("Tidy panel, aligned rows", ratio_panel, income_statement, balance_sheet)
+    timed("Wide panel, aligned rows", ratio_panel, income_statement, balance_sheet, tidy=False)
+    shuffled = balance_sheet.sample(frac=1.0, random_state=7)
+    timed("Tidy panel, shuffled balance sheet", ratio_panel, income_statement, shuffled)
+    timed("Tidy panel, average balances", ratio_panel, income_statement, balance_sheet, average_balances=True)
+
+    print(f"   {len(panel):,} ratio values; median current ratio "
+          f"{panel.loc[panel['ratio'] == 'current_ratio', 'value'].median():.2f}, "
+          f"median ROE {panel.loc[panel['ratio'] == 'roe_pct', 'value'].median():.1f}%")
+
+
+if __name__ == "__main__":
+    main()
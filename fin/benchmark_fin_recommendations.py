@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Finance Recommendation Engine Benchmark
+=======================================
+
+Times the AI recommendations for every page on enlarged sample tables
+(the sample data repeated to --rows rows) three ways: one
+generate_*_ai_recommendations call per page section, each aggregating
+its own tables; one shared FinanceContext with all rule sets evaluated
+in a single call; and page renders served from the cached per-page
+batch. Correctness is covered by test_fin_recommendations.py.
+
+Usage:
+    python benchmark_fin_recommendations.py
+    python benchmark_fin_recommendations.py --rows 1000000 --renders 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import fin_recommendations
+from fin_data_layer import FINANCE_TABLES, set_table
+from fin_data_utils import generate_sample_finance_data, initialize_session_state
+from fin_recommendations import (
+    PAGE_RECOMMENDATIONS, FinanceContext, generate_recommendations, page_recommendation
+)
+
+# Tables each single-table entry point reads, in argument order
+ENTRY_POINT_TABLES = {
+    'financial_performance': ['income_statement', 'balance_sheet', 'cash_flow'],
+    'liquidity_solvency': ['balance_sheet', 'cash_flow'],
+    'liquidity_analysis': ['balance_sheet', 'cash_flow'],
+    'solvency_metrics': ['balance_sheet', 'income_statement'],
+    'cash_flow_analysis': ['cash_flow', 'balance_sheet'],
+    'roa_roe_analysis': ['income_statement', 'balance_sheet'],
+    'asset_turnover': ['income_statement', 'balance_sheet'],
+    'expense_efficiency': ['income_statement'],
+    'productivity_trends': ['income_statement', 'balance_sheet']
+}
+
+
+def enlarge(tables, n_rows):
+    """Every table with its rows repeated up to n_rows."""
+    enlarged = {}
+    for name, frame in tables.items():
+        rows = np.resize(np.arange(len(frame)), max(n_rows, len(frame)))
+        enlarged[name] = frame.iloc[rows].reset_index(drop=True)
+    return enlarged
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"   {label:<40} {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def per_section_calls(tables, renders):
+    """Every page section calling its generate_* entry point, as the pages used to."""
+    results = {}
+    for _ in range(renders):
+        for page, rule_sets in PAGE_RECOMMENDATIONS.items():
+            for rule_set in rule_sets:
+                function = getattr(fin_recommendations, f"generate_{rule_set}_ai_recommendations")
+                arguments = [tables[name] for name in ENTRY_POINT_TABLES.get(rule_set, [])]
+                if not arguments:
+                    continue
+                results[rule_set] = function(*arguments)
+    return results
+
+
+def cached_page_renders(renders):
+    results = {}
+    for _ in range(renders):
+        for page, rule_sets in PAGE_RECOMMENDATIONS.items():
+            for rule_set in rule_sets:
+                results[rule_set] = page_recommendation(page, rule_set)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the finance recommendation engine')
+    parser.add_argument('--rows', type=int, default=500_000, help='Rows per finance table')
+    parser.add_argument('--renders', type=int, default=10, help='Renders of every page')
+    args = parser.parse_args()
+
+    initialize_session_state()
+    tables = enlarge(generate_sample_finance_data(), args.rows)
+    for name in FINANCE_TABLES:
+        set_table(name, tables[name])
+    print(f"🤖 {len(PAGE_RECOMMENDATIONS)} pages, {args.rows:,} rows per table, {args.renders} renders...")
+
+    timed("Per-section calls", per_section_calls, tables, args.renders)
+
+    def shared_context():
+        context = FinanceContext(**tables)
+        return [generate_recommendations(context) for _ in range(args.renders)][-1]
+    timed("Shared context, all rule sets at once", shared_context)
+
+    timed("Cached pages, first render", cached_page_renders, 1)
+    timed("Cached pages, later renders", cached_page_renders, args.renders)
+
+
+if __name__ == "__main__":
+    main()
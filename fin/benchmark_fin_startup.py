@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Finance Dashboard Startup Benchmark
+===================================
+
+Loads the finance entry script the way the department routers do
+(importlib spec from file, without running main) in a fresh interpreter,
+and reports import time and resident memory, then the cost of loading
+each page module on first visit. Pass --file to measure another copy of
+the entry script, e.g. the single-file version from git history:
+
+Usage:
+    python benchmark_fin_startup.py
+    git show <commit>:fin/fin.py > /tmp/fin_monolith.py
+    python benchmark_fin_startup.py --file /tmp/fin_monolith.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+PAGE_MODULES = [
+    'home_page', 'data_input_page', 'financial_performance_page', 'liquidity_solvency_page',
+    'cash_flow_page', 'efficiency_productivity_page', 'budget_forecasting_page',
+    'capital_structure_page', 'investment_valuation_page', 'risk_compliance_page',
+    'strategic_kpis_page', 'auto_insights_page', 'predictive_analytics_page'
+]
+
+# Runs in a fresh interpreter so earlier imports do not hide the cost
+PROBE = r"""
+import importlib, importlib.util, json, os, sys, time
+
+def rss_mb():
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+path, here, pages = sys.argv[1], sys.argv[2], sys.argv[3].split(',')
+sys.path.insert(0, here)
+result = {'baseline_rss_mb': rss_mb()}
+
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('fin', path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+result['import_s'] = time.perf_counter() - start
+result['import_rss_mb'] = rss_mb()
+
+result['pages'] = {}
+with open(path, encoding='utf-8') as entry:
+    lazy_pages = 'fin_pages' in entry.read()
+if lazy_pages:
+    for page in pages:
+        start = time.perf_counter()
+        importlib.import_module(f'fin_pages.{page}')
+        result['pages'][page] = time.perf_counter() - start
+result['all_pages_rss_mb'] = rss_mb()
+print(json.dumps(result))
+"""
+
+
+def run_probe(path):
+    """Measure one cold start of the entry script in a subprocess."""
+    env = dict(os.environ, PYTHONWARNINGS='ignore')
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE, path, HERE, ','.join(PAGE_MODULES)],
+        capture_output=True, text=True, env=env, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark finance dashboard startup')
+    parser.add_argument('--file', default=os.path.join(HERE, 'fin.py'), help='Entry script to load')
+    parser.add_argument('--repeats', type=int, default=3, help='Cold starts to measure')
+    args = parser.parse_args()
+
+    runs = [run_probe(os.path.abspath(args.file)) for _ in range(args.repeats)]
+    best = min(runs, key=lambda run: run['import_s'])
+    print(f"🚀 {os.path.basename(args.file)}: import {best['import_s']:.2f}s "
+          f"(best of {args.repeats}), RSS {best['import_rss_mb']:,.0f} MB "
+          f"(interpreter {best['baseline_rss_mb']:,.0f} MB)")
+    if best['pages']:
+        print("📄 First visit per page:")
+        for page, seconds in best['pages'].items():
+            print(f"   {page:<30} {seconds * 1000:8.1f} ms")
+        print(f"   RSS after loading every page: {best['all_pages_rss_mb']:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
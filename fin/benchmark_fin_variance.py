@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Finance Budget Variance Engine Benchmark
+========================================
+
+Builds a fin_variance cube from synthetic budget lines (division ->
+department -> cost center, monthly budget, actual and forecast) and
+times drill-down lookups against filtering and summing the lines per
+lookup, then line edits rolled up incrementally against a full rebuild.
+Correctness is covered by test_fin_variance.py.
+
+Usage:
+    python benchmark_fin_variance.py
+    python benchmark_fin_variance.py --lines 2000000 --cost-centers 20000 --months 36
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fin_variance import MEASURES, VarianceCube
+
+
+def generate_budget_lines(n_lines, n_cost_centers, n_months, seed=42):
+    """Budget lines over 8 divisions, 10 departments each, cost centers spread across them."""
+    rng = np.random.default_rng(seed)
+    cost_center = rng.integers(0, n_cost_centers, n_lines)
+    department = cost_center % 80
+    budget = np.round(rng.gamma(2.0, 5_000.0, n_lines), 2)
+    actual = np.round(budget * rng.normal(1.0, 0.08, n_lines), 2)
+    return pd.DataFrame({
+        'division': np.char.add('DIV', (department // 10).astype(str)),
+        'department': np.char.add('DEP', department.astype(str)),
+        'cost_center': np.char.add('CC', cost_center.astype(str)),
+        'period': pd.period_range('2022-01', periods=n_months, freq='M').strftime('%Y-%m-01')[rng.integers(0, n_months, n_lines)],
+        'budget': budget,
+        'actual': actual,
+        'forecast': np.round(budget * rng.normal(1.0, 0.05, n_lines), 2)
+    })
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"   {label:<40} {time.perf_counter() - start:7.3f}s")
+    return result
+
+
+def filtered_totals(lines, paths, levels, period):
+    """What a drill-down costs without the cube: filter and sum the lines per lookup."""
+    totals = []
+    for path in paths:
+        mask = (lines['period'] == period).to_numpy()
+        for level, label in zip(levels, path):
+            mask = mask & (lines[level] == label).to_numpy()
+        totals.append(lines.loc[mask, 'actual'].sum())
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the budget variance engine')
+    parser.add_argument('--lines', type=int, default=500_000, help='Budget lines')
+    parser.add_argument('--cost-centers', type=int, default=10_000, help='Cost centers')
+    parser.add_argument('--months', type=int, default=24, help='Months')
+    parser.add_argument('--lookups', type=int, default=200, help='Drill-down lookups')
+    parser.add_argument('--edits', type=int, default=1_000, help='Line edits')
+    args = parser.parse_args()
+
+    lines = generate_budget_lines(args.lines, args.cost_centers, args.months)
+    print(f"🧭 {len(lines):,} budget lines, {args.cost_centers:,} cost centers, {args.months} months...")
+
+    cube = timed("Build cube", VarianceCube, lines)
+    rng = np.random.default_rng(7)
+    period = cube.periods[-1]
+    departments = [path for division in cube.children() for path in cube.children(division)]
+    paths = [departments[i] for i in rng.integers(0, len(departments), args.lookups)]
+
+    start = time.perf_counter()
+    [cube.value(path, period) for path in paths]
+    cube_seconds = time.perf_counter() - start
+    filtered_totals(lines, paths, cube.levels, period)
+    filtered_seconds = time.perf_counter() - start - cube_seconds
+    print(f"   {f'{args.lookups} department lookups, cube':<40} {cube_seconds:7.3f}s")
+    print(f"   {f'{args.lookups} department lookups, filtering':<40} {filtered_seconds:7.3f}s")
+    timed("Drill into every division", lambda: [cube.drill(division, period) for division in cube.children()])
+    timed("Every level", lambda: [cube.level(depth) for depth in range(1, len(cube.levels) + 1)])
+
+    # Edits: adjusting lines for existing cost centers, posted incrementally
+    edits = lines.sample(args.edits, random_state=11).copy()
+    edits[MEASURES] = np.round(rng.normal(0, 1_000, (len(edits), len(MEASURES))), 2)
+    timed(f"Apply {len(edits):,} edits incrementally", cube.apply_lines, edits)
+    leaf = cube.children(cube.children(cube.children()[0])[0])[0]
+    timed("Set one cost-center cell", cube.set_value, leaf, period, 'budget', 12_345.67)
+    timed("Rebuild cube from all lines", VarianceCube, pd.concat([lines, edits], ignore_index=True))
+
+    total = cube.variance()
+    print(f"⚡ Department lookups are {filtered_seconds / max(cube_seconds, 1e-9):,.0f}x faster from the cube")
+    print(f"   Total variance {total['variance_pct']:+.2f}%, forecast {total['forecast_variance_pct']:+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
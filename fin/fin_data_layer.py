@@ -0,0 +1,190 @@
+"""
+Finance Data Layer
+==================
+
+Cheap cache keys for the session tables:
+- Every table loaded into the session (upload, manual entry, sample data)
+  is registered with a version token, bumped each time the table is
+  replaced or edited through set_table / bump_table_version
+- finance_cache wraps st.cache_data with hash_funcs that key DataFrames
+  by that token, so a cached metric no longer hashes a whole GL-sized
+  frame on every call; unregistered frames fall back to a content hash
+- Calls and computations per cached function give the hit ratios shown
+  in the dashboard sidebar
+
+Session tables must be replaced, not mutated in place; code that does
+edit a table in place calls bump_table_version afterwards.
+"""
+
+import itertools
+import threading
+import weakref
+from functools import wraps
+
+import pandas as pd
+import streamlit as st
+
+from fin_forecast_cache import table_fingerprint
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+FINANCE_TABLES = [
+    'income_statement', 'balance_sheet', 'cash_flow', 'budget', 'forecast',
+    'market_data', 'customer_data', 'product_data', 'value_chain'
+]
+
+# id(frame) -> (weak reference, name, version token)
+_table_registry = {}
+_versions = itertools.count(1)
+_cache_stats = {}
+_registry_lock = threading.RLock()
+
+# ============================================================================
+# VERSION TOKENS
+# ============================================================================
+
+def _forget(frame_id, reference):
+    with _registry_lock:
+        entry = _table_registry.get(frame_id)
+        if entry is not None and entry[0] is reference:
+            del _table_registry[frame_id]
+
+
+def register_table(name, df):
+    """
+    Give a table a fresh version token.
+
+    Returns:
+        int: The new token
+    """
+    frame_id = id(df)
+    reference = weakref.ref(df, lambda ref, frame_id=frame_id: _forget(frame_id, ref))
+    with _registry_lock:
+        token = next(_versions)
+        _table_registry[frame_id] = (reference, name, token)
+    return token
+
+
+def _registered(df):
+    """(name, token) of a registered table, None for any other frame."""
+    with _registry_lock:
+        entry = _table_registry.get(id(df))
+    # A recycled id belongs to a new object; its weak reference is dead
+    if entry is None or entry[0]() is not df:
+        return None
+    return entry[1], entry[2]
+
+
+def table_version(df):
+    """
+    Cache key for a DataFrame argument of a finance_cache function.
+
+    Returns:
+        tuple: ('version', token) for registered tables, otherwise
+        ('content', hash of the frame)
+    """
+    registered = _registered(df)
+    if registered is not None:
+        return 'version', registered[1]
+    return 'content', table_fingerprint(df)
+
+
+def set_table(name, df):
+    """Store a table in the session under name and bump its version."""
+    register_table(name, df)
+    st.session_state[name] = df
+
+
+def bump_table_version(name):
+    """Mark a session table edited in place as changed."""
+    register_table(name, st.session_state[name])
+
+
+def sync_session_tables():
+    """Register session tables assigned without set_table; called on every rerun."""
+    for name in FINANCE_TABLES:
+        df = st.session_state.get(name)
+        if isinstance(df, pd.DataFrame) and _registered(df) is None:
+            register_table(name, df)
+
+
+def table_versions():
+    """
+    Current version of each session table.
+
+    Returns:
+        pd.DataFrame: table, version, rows
+    """
+    rows = []
+    for name in FINANCE_TABLES:
+        df = st.session_state.get(name)
+        if isinstance(df, pd.DataFrame):
+            registered = _registered(df)
+            rows.append({'table': name, 'version': registered[1] if registered else None, 'rows': len(df)})
+    return pd.DataFrame(rows, columns=['table', 'version', 'rows'])
+
+# ============================================================================
+# CACHING
+# ============================================================================
+
+FINANCE_HASH_FUNCS = {pd.DataFrame: table_version}
+
+
+def _record(function, outcome):
+    with _registry_lock:
+        stats = _cache_stats.setdefault(function, {'calls': 0, 'computed': 0})
+        stats[outcome] += 1
+
+
+def finance_cache(**cache_kwargs):
+    """
+    st.cache_data keyed by table versions, with hit counting.
+
+    Args:
+        **cache_kwargs: Passed to st.cache_data (ttl, max_entries, ...)
+
+    Every call is counted, and the body only runs on a cache miss, so
+    calls minus computations is the number of hits.
+    """
+    def decorator(func):
+        @wraps(func)
+        def compute(*args, **kwargs):
+            _record(func.__name__, 'computed')
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(hash_funcs=FINANCE_HASH_FUNCS, **cache_kwargs)(compute)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            _record(func.__name__, 'calls')
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+
+def cache_hit_stats():
+    """
+    Hit ratio per cached finance function.
+
+    Returns:
+        pd.DataFrame: function, calls, computed, hits and hit_rate (%),
+        sorted by calls
+    """
+    with _registry_lock:
+        stats = {function: dict(counts) for function, counts in _cache_stats.items()}
+    if not stats:
+        return pd.DataFrame(columns=['function', 'calls', 'computed', 'hits', 'hit_rate'])
+    frame = pd.DataFrame([{'function': function, **counts} for function, counts in stats.items()])
+    frame['hits'] = frame['calls'] - frame['computed']
+    frame['hit_rate'] = frame['hits'] / frame['calls'] * 100
+    return frame.sort_values('calls', ascending=False).reset_index(drop=True)
+
+
+def reset_cache_stats():
+    """Reset the hit counters (cached results are kept)."""
+    with _registry_lock:
+        _cache_stats.clear()
@@ -0,0 +1,549 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import io
+
+# --- Utility Functions: Variable Detection ---
+def get_numeric_columns(df):
+    """Return a list of numeric columns, excluding 'supplier'."""
+    return [col for col in df.select_dtypes(include=['number']).columns if col != 'supplier']
+
+def get_categorical_columns(df):
+    """Return a list of categorical/object columns, excluding 'supplier'."""
+    return [col for col in df.select_dtypes(include=['object']).columns if col != 'supplier']
+
+# --- Utility Functions ---
+def get_variable_list(df):
+    """Get list of variables for analysis."""
+    return [col for col in df.columns if col not in ['supplier', 'period', 'date']]
+
+def normalize_column(col, minimize=False):
+    """Normalize a column to 0-1 scale."""
+    if minimize:
+        return (col.max() - col) / (col.max() - col.min())
+    else:
+        return (col - col.min()) / (col.max() - col.min())
+
+def get_weights(variables, scenario):
+    """Get weights for different scenarios."""
+    if scenario == "balanced":
+        return {var: 1/len(variables) for var in variables}
+    elif scenario == "cost_focused":
+        return {var: 0.6 if 'cost' in var.lower() or 'price' in var.lower() else 0.4/(len(variables)-1) for var in variables}
+    elif scenario == "quality_focused":
+        return {var: 0.6 if 'quality' in var.lower() or 'score' in var.lower() else 0.4/(len(variables)-1) for var in variables}
+    else:
+        return {var: 1/len(variables) for var in variables}
+
+def get_column_name(merged_data, column_name):
+    """Helper function to get the correct column name after merge operations."""
+    if column_name in merged_data.columns:
+        return column_name
+    
+    # Check for common suffixes that pandas adds during merges
+    possible_names = [
+        column_name,
+        f"{column_name}_x",
+        f"{column_name}_y",
+        f"{column_name}_1",
+        f"{column_name}_2"
+    ]
+    
+    # For specific columns, add additional possible names
+    if column_name == 'unit_price':
+        possible_names.extend(['price', 'unit_cost'])
+    elif column_name == 'supplier_id':
+        possible_names.extend(['supplier', 'vendor_id'])
+    elif column_name == 'item_name':
+        possible_names.extend(['name', 'product_name'])
+    
+    return next((name for name in possible_names if name in merged_data.columns), None)
+
+def get_unit_price_column(merged_data):
+    """Helper function to get the correct unit price column name after merge operations."""
+    return get_column_name(merged_data, 'unit_price')
+
+def check_data_quality(po_df, items_data, suppliers):
+    """Check data quality and provide recommendations."""
+    issues = []
+    recommendations = []
+    
+    # Check for missing data
+    if po_df.empty:
+        issues.append("No purchase order data found")
+        recommendations.append("Upload purchase order data")
+    
+    if items_data.empty:
+        issues.append("No items data found")
+        recommendations.append("Upload items data")
+    
+    if suppliers.empty:
+        issues.append("No suppliers data found")
+        recommendations.append("Upload suppliers data")
+    
+    # Check for required columns
+    required_po_cols = ['supplier_id', 'item_id', 'quantity', 'unit_price']
+    missing_po_cols = [col for col in required_po_cols if col not in po_df.columns]
+    if missing_po_cols:
+        issues.append(f"Missing required columns in purchase orders: {', '.join(missing_po_cols)}")
+        recommendations.append("Ensure all required columns are present in purchase order data")
+    
+    # Check for data consistency
+    if not po_df.empty and not items_data.empty:
+        po_items = set(po_df['item_id'].unique())
+        available_items = set(items_data['item_id'].unique())
+        missing_items = po_items - available_items
+        if missing_items:
+            issues.append(f"Purchase orders reference {len(missing_items)} items not found in items data")
+            recommendations.append("Ensure all items in purchase orders exist in items data")
+    
+    return issues, recommendations
+
+def display_dataframe_with_index_1(df, **kwargs):
+    """Display dataframe with index starting from 1"""
+    if not df.empty:
+        df_display = df.reset_index(drop=True)
+        df_display.index = df_display.index + 1
+        return st.dataframe(df_display, **kwargs)
+    else:
+        return st.dataframe(df, **kwargs)
+
+def safe_calculate_variance(actual, budget, metric_name="metric"):
+    """Safely calculate variance with error handling"""
+    try:
+        if budget > 0:
+            return ((actual - budget) / budget * 100)
+        else:
+            return 0
+    except (TypeError, ValueError, ZeroDivisionError):
+        st.warning(f"⚠️ Unable to calculate {metric_name} variance due to data issues")
+        return 0
+
+def create_template_for_download():
+    """Create an Excel template with all required Finance data schema and make it downloadable"""
+    
+    # Create empty DataFrames with the correct Finance schema
+    income_statement_template = pd.DataFrame(columns=[
+        'period', 'revenue', 'cost_of_goods_sold', 'gross_profit', 'operating_expenses',
+        'operating_income', 'interest_expense', 'income_tax_expense', 'net_income'
+    ])
+    
+    balance_sheet_template = pd.DataFrame(columns=[
+        'period', 'cash_and_equivalents', 'accounts_receivable', 'inventory', 'current_assets',
+        'total_assets', 'accounts_payable', 'current_liabilities', 'total_liabilities',
+        'shareholder_equity', 'shares_outstanding'
+    ])
+    
+    cash_flow_template = pd.DataFrame(columns=[
+        'period', 'net_income', 'depreciation', 'working_capital_change', 'operating_cash_flow',
+        'capital_expenditures', 'free_cash_flow', 'initial_investment', 'cash_flow', 'nopat'
+    ])
+    
+    budget_template = pd.DataFrame(columns=[
+        'period', 'revenue', 'expenses', 'profit', 'category'
+    ])
+    
+    forecast_template = pd.DataFrame(columns=[
+        'period', 'revenue', 'expenses', 'profit', 'confidence_level'
+    ])
+    
+    market_template = pd.DataFrame(columns=[
+        'period', 'market_price', 'dividends_per_share', 'volume', 'market_cap'
+    ])
+    
+    customer_template = pd.DataFrame(columns=[
+        'customer_id', 'customer_name', 'revenue', 'profit_margin', 'profitability', 
+        'costs_to_serve', 'segment', 'region', 'lifetime_value'
+    ])
+    
+    product_template = pd.DataFrame(columns=[
+        'product_id', 'product_name', 'revenue', 'cost', 'total_costs', 'direct_costs', 
+        'allocated_costs', 'margin', 'category', 'lifecycle_stage'
+    ])
+    
+    value_chain_template = pd.DataFrame(columns=[
+        'function', 'cost', 'percentage', 'period'
+    ])
+    
+    # Create Excel file in memory
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        # Write each template to a separate sheet
+        income_statement_template.to_excel(writer, sheet_name='Income_Statement', index=False)
+        balance_sheet_template.to_excel(writer, sheet_name='Balance_Sheet', index=False)
+        cash_flow_template.to_excel(writer, sheet_name='Cash_Flow', index=False)
+        budget_template.to_excel(writer, sheet_name='Budget', index=False)
+        forecast_template.to_excel(writer, sheet_name='Forecast', index=False)
+        market_template.to_excel(writer, sheet_name='Market_Data', index=False)
+        customer_template.to_excel(writer, sheet_name='Customer_Data', index=False)
+        product_template.to_excel(writer, sheet_name='Product_Data', index=False)
+        value_chain_template.to_excel(writer, sheet_name='Value_Chain', index=False)
+        
+        # Add instructions sheet
+        instructions_data = {
+            'Sheet Name': ['Income_Statement', 'Balance_Sheet', 'Cash_Flow', 'Budget', 'Forecast', 'Market_Data', 'Customer_Data', 'Product_Data', 'Value_Chain'],
+            'Required Fields': [
+                'period, revenue, cost_of_goods_sold, gross_profit, operating_expenses, operating_income, interest_expense, income_tax_expense, net_income',
+                'period, cash_and_equivalents, accounts_receivable, inventory, current_assets, total_assets, accounts_payable, current_liabilities, total_liabilities, shareholder_equity, shares_outstanding',
+                'period, net_income, depreciation, working_capital_change, operating_cash_flow, capital_expenditures, free_cash_flow, initial_investment, cash_flow, nopat',
+                'period, revenue, expenses, profit, category',
+                'period, revenue, expenses, profit, confidence_level',
+                'period, market_price, dividends_per_share, volume, market_cap',
+                'customer_id, customer_name, revenue, profit_margin, profitability, costs_to_serve, segment, region, lifetime_value',
+                'product_id, product_name, revenue, cost, total_costs, direct_costs, allocated_costs, margin, category, lifecycle_stage',
+                'function, cost, percentage, period'
+            ],
+            'Data Types': [
+                'Date, Number, Number, Number, Number, Number, Number, Number, Number',
+                'Date, Number, Number, Number, Number, Number, Number, Number, Number, Number, Number',
+                'Date, Number, Number, Number, Number, Number, Number, Number, Number, Number, Number',
+                'Date, Number, Number, Number, Text',
+                'Date, Number, Number, Number, Number',
+                'Date, Number, Number, Number, Number',
+                'Text, Text, Number, Number, Number, Number, Text, Text, Number',
+                'Text, Text, Number, Number, Number, Number, Number, Number, Text, Text',
+                'Text, Number, Number, Date'
+            ],
+            'Description': [
+                'Income statement with revenue, costs, and profitability metrics',
+                'Balance sheet with assets, liabilities, and equity',
+                'Cash flow statement with operating, investing, and financing activities',
+                'Budget data for variance analysis',
+                'Forecast data for accuracy measurement',
+                'Market data including stock prices and dividends',
+                'Customer profitability analysis',
+                'Product/service profitability analysis',
+                'Value chain cost analysis by function'
+            ]
+        }
+        
+        instructions_df = pd.DataFrame(instructions_data)
+        instructions_df.to_excel(writer, sheet_name='Instructions', index=False)
+        
+        # Format the instructions sheet
+        worksheet = writer.sheets['Instructions']
+        for i, col in enumerate(instructions_df.columns):
+            worksheet.set_column(i, i, 30)
+    
+    output.seek(0)
+    return output
+
+def export_data_to_excel():
+    """Export all Finance data to Excel file"""
+    if (st.session_state.income_statement.empty and st.session_state.balance_sheet.empty and 
+        st.session_state.cash_flow.empty and st.session_state.budget.empty and
+        st.session_state.forecast.empty and st.session_state.market_data.empty and
+        st.session_state.customer_data.empty and st.session_state.product_data.empty and
+        st.session_state.value_chain.empty):
+        st.warning("No data to export. Please add data first.")
+        return None
+    
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        # Write each DataFrame to a separate sheet
+        st.session_state.income_statement.to_excel(writer, sheet_name='Income_Statement', index=False)
+        st.session_state.balance_sheet.to_excel(writer, sheet_name='Balance_Sheet', index=False)
+        st.session_state.cash_flow.to_excel(writer, sheet_name='Cash_Flow', index=False)
+        st.session_state.budget.to_excel(writer, sheet_name='Budget', index=False)
+        st.session_state.forecast.to_excel(writer, sheet_name='Forecast', index=False)
+        st.session_state.market_data.to_excel(writer, sheet_name='Market_Data', index=False)
+        st.session_state.customer_data.to_excel(writer, sheet_name='Customer_Data', index=False)
+        st.session_state.product_data.to_excel(writer, sheet_name='Product_Data', index=False)
+        st.session_state.value_chain.to_excel(writer, sheet_name='Value_Chain', index=False)
+    
+    output.seek(0)
+    return output
+
+def initialize_session_state():
+    """Initialize session state with the Finance table schemas"""
+    if 'income_statement' not in st.session_state:
+        st.session_state.income_statement = pd.DataFrame(columns=[
+            'period', 'revenue', 'cost_of_goods_sold', 'gross_profit', 'operating_expenses',
+            'operating_income', 'interest_expense', 'income_tax_expense', 'net_income'
+        ])
+
+    if 'balance_sheet' not in st.session_state:
+        st.session_state.balance_sheet = pd.DataFrame(columns=[
+            'period', 'cash_and_equivalents', 'accounts_receivable', 'inventory', 'current_assets',
+            'total_assets', 'accounts_payable', 'current_liabilities', 'total_liabilities',
+            'shareholder_equity', 'shares_outstanding'
+        ])
+
+    if 'cash_flow' not in st.session_state:
+        st.session_state.cash_flow = pd.DataFrame(columns=[
+            'period', 'net_income', 'depreciation', 'working_capital_change', 'operating_cash_flow',
+            'capital_expenditures', 'free_cash_flow', 'initial_investment', 'cash_flow', 'nopat'
+        ])
+
+    if 'budget' not in st.session_state:
+        st.session_state.budget = pd.DataFrame(columns=[
+            'period', 'revenue', 'expenses', 'profit', 'category'
+        ])
+
+    if 'forecast' not in st.session_state:
+        st.session_state.forecast = pd.DataFrame(columns=[
+            'period', 'revenue', 'expenses', 'profit', 'confidence_level'
+        ])
+
+    if 'market_data' not in st.session_state:
+        st.session_state.market_data = pd.DataFrame(columns=[
+            'period', 'market_price', 'dividends_per_share', 'volume', 'market_cap'
+        ])
+
+    if 'customer_data' not in st.session_state:
+        st.session_state.customer_data = pd.DataFrame(columns=[
+            'customer_id', 'customer_name', 'revenue', 'costs_to_serve', 'profitability'
+        ])
+
+    if 'product_data' not in st.session_state:
+        st.session_state.product_data = pd.DataFrame(columns=[
+            'product_id', 'product_name', 'revenue', 'direct_costs', 'allocated_costs', 'total_costs'
+        ])
+
+    if 'value_chain' not in st.session_state:
+        st.session_state.value_chain = pd.DataFrame(columns=[
+            'function', 'cost', 'percentage', 'period'
+        ])
+
+def get_data_summary():
+    """Get summary of loaded financial data"""
+    summary = {}
+    
+    if not st.session_state.income_statement.empty:
+        summary['Income Statement'] = len(st.session_state.income_statement)
+    if not st.session_state.balance_sheet.empty:
+        summary['Balance Sheet'] = len(st.session_state.balance_sheet)
+    if not st.session_state.cash_flow.empty:
+        summary['Cash Flow'] = len(st.session_state.cash_flow)
+    if not st.session_state.budget.empty:
+        summary['Budget'] = len(st.session_state.budget)
+    if not st.session_state.forecast.empty:
+        summary['Forecast'] = len(st.session_state.forecast)
+    if not st.session_state.market_data.empty:
+        summary['Market Data'] = len(st.session_state.market_data)
+    if not st.session_state.customer_data.empty:
+        summary['Customer Data'] = len(st.session_state.customer_data)
+    if not st.session_state.product_data.empty:
+        summary['Product Data'] = len(st.session_state.product_data)
+    if not st.session_state.value_chain.empty:
+        summary['Value Chain'] = len(st.session_state.value_chain)
+    
+    return summary
+
+def validate_data_integrity():
+    """Validate the integrity of loaded financial data"""
+    validation_results = []
+    
+    # Check if any data is loaded
+    total_records = sum([
+        len(st.session_state.income_statement),
+        len(st.session_state.balance_sheet),
+        len(st.session_state.cash_flow),
+        len(st.session_state.budget),
+        len(st.session_state.forecast),
+        len(st.session_state.market_data),
+        len(st.session_state.customer_data),
+        len(st.session_state.product_data),
+        len(st.session_state.value_chain)
+    ])
+    
+    if total_records == 0:
+        validation_results.append("⚠️ No financial data loaded. Please upload data to begin analysis.")
+        return validation_results
+    
+    # Check income statement data
+    if not st.session_state.income_statement.empty:
+        required_cols = ['revenue', 'cost_of_goods_sold', 'gross_profit', 'operating_income', 'net_income']
+        missing_cols = [col for col in required_cols if col not in st.session_state.income_statement.columns]
+        if missing_cols:
+            validation_results.append(f"⚠️ Income Statement missing columns: {', '.join(missing_cols)}")
+        else:
+            validation_results.append("✅ Income Statement data structure is valid")
+    
+    # Check balance sheet data
+    if not st.session_state.balance_sheet.empty:
+        required_cols = ['total_assets', 'total_liabilities', 'total_equity']
+        missing_cols = [col for col in required_cols if col not in st.session_state.balance_sheet.columns]
+        if missing_cols:
+            validation_results.append(f"⚠️ Balance Sheet missing columns: {', '.join(missing_cols)}")
+        else:
+            validation_results.append("✅ Balance Sheet data structure is valid")
+    
+    # Check cash flow data
+    if not st.session_state.cash_flow.empty:
+        required_cols = ['operating_cash_flow', 'investing_cash_flow', 'financing_cash_flow']
+        missing_cols = [col for col in required_cols if col not in st.session_state.cash_flow.columns]
+        if missing_cols:
+            validation_results.append(f"⚠️ Cash Flow missing columns: {', '.join(missing_cols)}")
+        else:
+            validation_results.append("✅ Cash Flow data structure is valid")
+    
+    # Check for data consistency
+    if not st.session_state.income_statement.empty and not st.session_state.balance_sheet.empty:
+        if 'period' in st.session_state.income_statement.columns and 'period' in st.session_state.balance_sheet.columns:
+            income_periods = set(st.session_state.income_statement['period'])
+            balance_periods = set(st.session_state.balance_sheet['period'])
+            if income_periods != balance_periods:
+                validation_results.append("⚠️ Period mismatch between Income Statement and Balance Sheet")
+            else:
+                validation_results.append("✅ Period consistency verified across financial statements")
+    
+    return validation_results
+
+def generate_sample_finance_data():
+    """Generate comprehensive sample finance data for testing"""
+    np.random.seed(42)
+    
+    # Generate periods with proper datetime format for forecasting
+    periods = []
+    for year in range(2020, 2024):
+        for quarter in range(1, 5):
+            # Create proper datetime for each quarter
+            month = (quarter - 1) * 3 + 1  # Q1=Jan, Q2=Apr, Q3=Jul, Q4=Oct
+            periods.append(f"{year}-{month:02d}-01")
+    
+    # Ensure we have at least 8 periods for forecasting
+    if len(periods) < 8:
+        # Add more periods if needed
+        for year in range(2024, 2026):
+            for quarter in range(1, 5):
+                month = (quarter - 1) * 3 + 1
+                periods.append(f"{year}-{month:02d}-01")
+    
+    # Income Statement Data - Ensure we have enough periods for forecasting
+    # Generate more periods if needed for forecasting
+    if len(periods) < 12:  # Ensure at least 12 periods for robust forecasting
+        additional_periods = []
+        for year in range(2024, 2027):  # Add more years
+            for quarter in range(1, 5):
+                month = (quarter - 1) * 3 + 1
+                additional_periods.append(f"{year}-{month:02d}-01")
+        periods.extend(additional_periods)
+    
+    # Create realistic revenue trends with some seasonality
+    base_revenue = 2000000
+    revenue_trend = []
+    for i, period in enumerate(periods):
+        # Add trend and seasonality
+        trend = base_revenue * (1 + 0.05 * i)  # 5% growth per period
+        seasonality = 1 + 0.1 * np.sin(2 * np.pi * i / 4)  # Quarterly seasonality
+        noise = np.random.uniform(0.9, 1.1)  # Random noise
+        revenue_trend.append(trend * seasonality * noise)
+    
+    income_statement = pd.DataFrame({
+        'period': periods,
+        'revenue': revenue_trend,
+        'cost_of_goods_sold': [rev * np.random.uniform(0.5, 0.7) for rev in revenue_trend],
+        'gross_profit': [rev * np.random.uniform(0.3, 0.5) for rev in revenue_trend],
+        'operating_expenses': [rev * np.random.uniform(0.15, 0.25) for rev in revenue_trend],
+        'operating_income': [rev * np.random.uniform(0.1, 0.2) for rev in revenue_trend],
+        'interest_expense': [rev * np.random.uniform(0.02, 0.05) for rev in revenue_trend],
+        'income_tax_expense': [rev * np.random.uniform(0.02, 0.04) for rev in revenue_trend],
+        'net_income': [rev * np.random.uniform(0.08, 0.15) for rev in revenue_trend]
+    })
+    
+    # Balance Sheet Data
+    balance_sheet = pd.DataFrame({
+        'period': periods,
+        'total_assets': [rev * np.random.uniform(2.5, 4.0) for rev in revenue_trend],
+        'current_assets': [rev * np.random.uniform(1.0, 2.0) for rev in revenue_trend],
+        'cash_and_equivalents': [rev * np.random.uniform(0.2, 0.5) for rev in revenue_trend],
+        'accounts_receivable': [rev * np.random.uniform(0.15, 0.3) for rev in revenue_trend],
+        'inventory': [rev * np.random.uniform(0.1, 0.4) for rev in revenue_trend],
+        'accounts_payable': [rev * np.random.uniform(0.1, 0.3) for rev in revenue_trend],
+        'current_liabilities': [rev * np.random.uniform(0.4, 1.0) for rev in revenue_trend],
+        'total_liabilities': [rev * np.random.uniform(1.0, 2.5) for rev in revenue_trend],
+        'shareholder_equity': [rev * np.random.uniform(1.5, 3.0) for rev in revenue_trend],
+        'shares_outstanding': [1000000] * len(periods)
+    })
+    
+    # Cash Flow Data
+    cash_flow = pd.DataFrame({
+        'period': periods,
+        'net_income': [rev * np.random.uniform(0.08, 0.15) for rev in revenue_trend],
+        'depreciation': [rev * np.random.uniform(0.02, 0.05) for rev in revenue_trend],
+        'working_capital_change': [rev * np.random.uniform(-0.1, 0.1) for rev in revenue_trend],
+        'operating_cash_flow': [rev * np.random.uniform(0.08, 0.15) for rev in revenue_trend],
+        'capital_expenditures': [rev * np.random.uniform(-0.3, -0.1) for rev in revenue_trend],
+        'free_cash_flow': [rev * np.random.uniform(0.05, 0.12) for rev in revenue_trend],
+        'initial_investment': [1000000 if i == 0 else 0 for i in range(len(periods))],
+        'cash_flow': [rev * np.random.uniform(-0.1, 0.2) for rev in revenue_trend],
+        'nopat': [rev * np.random.uniform(0.06, 0.12) for rev in revenue_trend]
+    })
+    
+    # Budget Data
+    budget = pd.DataFrame({
+        'period': periods,
+        'revenue': [rev * np.random.uniform(0.9, 1.1) for rev in revenue_trend],
+        'expenses': [rev * np.random.uniform(0.6, 0.8) for rev in revenue_trend],
+        'profit': [rev * np.random.uniform(0.1, 0.2) for rev in revenue_trend],
+        'category': np.random.choice(['Budget', 'Forecast'], len(periods))
+    })
+    
+    # Forecast Data - Use overlapping periods with income statement for testing
+    # Use the last 8 periods from income statement to create forecast data
+    forecast_periods = periods[-8:]  # Last 8 periods from income statement
+    
+    forecast = pd.DataFrame({
+        'period': forecast_periods,
+        'revenue': np.random.uniform(1200000, 6000000, len(forecast_periods)),
+        'expenses': np.random.uniform(800000, 4000000, len(forecast_periods)),
+        'profit': np.random.uniform(200000, 1800000, len(forecast_periods)),
+        'confidence_level': np.random.uniform(0.6, 0.95, len(forecast_periods))
+    })
+    
+    # Market Data
+    market_data = pd.DataFrame({
+        'period': periods,
+        'market_price': np.random.uniform(50, 200, len(periods)),
+        'dividends_per_share': np.random.uniform(1, 5, len(periods)),
+        'volume': np.random.uniform(1000000, 5000000, len(periods)),
+        'market_cap': np.random.uniform(10000000, 50000000, len(periods))
+    })
+    
+    # Customer Data
+    customer_data = pd.DataFrame({
+        'customer_id': [f'CUST{i:03d}' for i in range(1, 51)],
+        'customer_name': [f'Customer {i}' for i in range(1, 51)],
+        'revenue': np.random.uniform(50000, 500000, 50),
+        'profit_margin': np.random.uniform(10, 40, 50),
+        'profitability': np.random.uniform(5000, 200000, 50),  # Add profitability column
+        'costs_to_serve': np.random.uniform(10000, 100000, 50),  # Add costs to serve
+        'segment': np.random.choice(['Enterprise', 'Mid-Market', 'SMB'], 50),
+        'region': np.random.choice(['North America', 'Europe', 'Asia', 'Latin America'], 50),
+        'lifetime_value': np.random.uniform(100000, 2000000, 50)
+    })
+    
+    # Product Data
+    product_data = pd.DataFrame({
+        'product_id': [f'PROD{i:03d}' for i in range(1, 31)],
+        'product_name': [f'Product {i}' for i in range(1, 31)],
+        'revenue': np.random.uniform(100000, 1000000, 30),
+        'cost': np.random.uniform(50000, 500000, 30),
+        'total_costs': np.random.uniform(60000, 600000, 30),  # Add total_costs column
+        'direct_costs': np.random.uniform(40000, 400000, 30),  # Add direct_costs column
+        'allocated_costs': np.random.uniform(20000, 200000, 30),  # Add allocated_costs column
+        'margin': np.random.uniform(20, 60, 30),
+        'category': np.random.choice(['Software', 'Hardware', 'Services', 'Consulting'], 30),
+        'lifecycle_stage': np.random.choice(['Introduction', 'Growth', 'Maturity', 'Decline'], 30)
+    })
+    
+    # Value Chain Data
+    value_chain = pd.DataFrame({
+        'function': ['R&D', 'Design', 'Manufacturing', 'Marketing', 'Sales', 'Distribution', 'Customer Service'],
+        'cost': np.random.uniform(100000, 800000, 7),
+        'percentage': np.random.uniform(5, 25, 7),
+        'period': np.random.choice(periods, 7)
+    })
+    
+    return {
+        'income_statement': income_statement,
+        'balance_sheet': balance_sheet,
+        'cash_flow': cash_flow,
+        'budget': budget,
+        'forecast': forecast,
+        'market_data': market_data,
+        'customer_data': customer_data,
+        'product_data': product_data,
+        'value_chain': value_chain
+    }
@@ -0,0 +1,159 @@
+"""
+Finance Forecast Cache
+======================
+
+Process-level memoization for FinancePredictiveAnalytics:
+- Entries are keyed by (method, arguments, fingerprints of the tables the
+  method reads), so a change in one table only invalidates the
+  predictors that depend on it
+- The store lives in this imported module, so it survives Streamlit
+  reruns of the page script and is shared by every analytics instance
+- Hit and miss counts per method feed the dashboard debug panel
+"""
+
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import pandas as pd
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+MAX_CACHED_FORECASTS = 256
+
+_forecast_cache = OrderedDict()
+_forecast_stats = {}
+_cache_lock = threading.Lock()
+
+# ============================================================================
+# FINGERPRINTS
+# ============================================================================
+
+def table_fingerprint(df):
+    """
+    Content hash of a table, independent of object identity.
+
+    Returns:
+        str: Hex digest of the columns, dtypes and row hashes
+    """
+    if df is None:
+        return 'none'
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((tuple(df.columns), tuple(map(str, df.dtypes)), df.shape)).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cells (lists, dicts): fall back to their text form
+        digest.update(df.astype(str).to_csv().encode())
+    return digest.hexdigest()
+
+
+def _freeze(value):
+    """Hashable form of a method argument."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# ============================================================================
+# MEMOIZATION
+# ============================================================================
+
+def _record(method, outcome):
+    stats = _forecast_stats.setdefault(method, {'computed': 0, 'reused': 0})
+    stats[outcome] += 1
+
+
+def _copy_result(result):
+    if isinstance(result, tuple):
+        return tuple(_copy_result(item) for item in result)
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    return result
+
+
+def memoized_prediction(*tables):
+    """
+    Decorator for FinancePredictiveAnalytics methods.
+
+    Args:
+        *tables: Attribute names of the tables the method reads
+
+    The instance must provide table_fingerprint(name) and a
+    _prediction_cache dict, which serves as a per-instance view in front
+    of the process-level store. Changes the method makes to
+    _model_performance are stored with the result and replayed on reuse.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple((name, _freeze(value)) for name, value in bound.arguments.items() if name != 'self')
+            key = (method.__name__, arguments, tuple(self.table_fingerprint(table) for table in tables))
+
+            entry = self._prediction_cache.get(key)
+            if entry is None:
+                with _cache_lock:
+                    entry = _forecast_cache.get(key)
+                    if entry is not None:
+                        _forecast_cache.move_to_end(key)
+            if entry is not None:
+                with _cache_lock:
+                    _record(method.__name__, 'reused')
+                self._prediction_cache[key] = entry
+                self._model_performance.update(entry[1])
+                return _copy_result(entry[0])
+
+            performance_before = dict(self._model_performance)
+            result = method(self, *args, **kwargs)
+            performance = {name: value for name, value in self._model_performance.items()
+                           if performance_before.get(name) is not value}
+            entry = (_copy_result(result), performance)
+            self._prediction_cache[key] = entry
+            with _cache_lock:
+                _record(method.__name__, 'computed')
+                _forecast_cache[key] = entry
+                _forecast_cache.move_to_end(key)
+                while len(_forecast_cache) > MAX_CACHED_FORECASTS:
+                    _forecast_cache.popitem(last=False)
+            return result
+
+        return wrapper
+    return decorator
+
+
+def forecast_cache_stats():
+    """
+    Reuse counts per predictor.
+
+    Returns:
+        pd.DataFrame: method, computed, reused, calls, reuse_rate (%) and
+        cached entries, sorted by calls
+    """
+    with _cache_lock:
+        stats = {method: dict(counts) for method, counts in _forecast_stats.items()}
+        entries = {}
+        for key in _forecast_cache:
+            entries[key[0]] = entries.get(key[0], 0) + 1
+    if not stats:
+        return pd.DataFrame(columns=['method', 'computed', 'reused', 'calls', 'reuse_rate', 'cached_entries'])
+    frame = pd.DataFrame([{'method': method, **counts} for method, counts in stats.items()])
+    frame['calls'] = frame['computed'] + frame['reused']
+    frame['reuse_rate'] = frame['reused'] / frame['calls'] * 100
+    frame['cached_entries'] = frame['method'].map(entries).fillna(0).astype(int)
+    return frame.sort_values('calls', ascending=False).reset_index(drop=True)
+
+
+def clear_forecast_cache():
+    """Drop every cached forecast and reset the counters."""
+    with _cache_lock:
+        _forecast_cache.clear()
+        _forecast_stats.clear()
@@ -0,0 +1,308 @@
+"""
+Finance Health Scoring Engine
+=============================
+
+Financial-health scores for many entities (subsidiaries, counterparties)
+at once:
+- The components of FinancePredictiveAnalytics.predict_financial_health_score
+  (profitability, liquidity, cash flow, growth) are computed for every
+  (entity, period) row as arrays, using the same bands and points
+- The revenue concentration and liquidity rules of FinanceRiskAnalyzer
+  are applied per entity, giving a risk score and level alongside
+- Entities are ranked within peer groups (industry x size band) from
+  grouped ranks and quantiles of the latest scores
+- HealthScorer keeps per-entity running state (last revenue, risk sums),
+  so appending new periods scores only the new rows
+
+Statements use the session table schemas with an optional 'entity'
+column, as produced by fin_ledger's statement panel.
+"""
+
+import numpy as np
+import pandas as pd
+
+from fin_ratios import DEFAULT_ENTITY
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Component -> (metric, lower bounds, points above each bound, points otherwise);
+# a component scores 0 when its metric is undefined
+HEALTH_COMPONENTS = {
+    'profitability': ('net_margin_pct', [15, 10, 5, 0], [30, 25, 20, 15], 5),
+    'liquidity': ('current_ratio', [2.0, 1.5, 1.0], [25, 20, 15], 5),
+    'cash_flow': ('cash_flow_margin_pct', [15, 10, 5], [25, 20, 15], 5),
+    'growth': ('revenue_growth_pct', [10, 5, 0], [20, 15, 10], 5)
+}
+COMPONENT_NAMES = list(HEALTH_COMPONENTS)
+
+# Score of a period without a matching balance sheet or cash flow row
+MISSING_STATEMENT_SCORE = 50
+
+HEALTH_LEVELS = [(80, 'Excellent'), (60, 'Good'), (40, 'Fair')]
+LOWEST_HEALTH_LEVEL = 'Poor'
+RISK_LEVELS = [(60, 'High'), (30, 'Medium')]
+LOWEST_RISK_LEVEL = 'Low'
+
+SIZE_BANDS = ['Small', 'Mid', 'Large']
+UNCLASSIFIED = 'Unclassified'
+PEER_QUANTILES = [0.25, 0.5, 0.75]
+
+OPERATING_CASH_FLOW_COLUMNS = ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']
+
+
+class HealthScoreError(Exception):
+    """Raised when appended statements repeat periods already scored."""
+
+# ============================================================================
+# COMPONENT SCORES
+# ============================================================================
+
+def _entities(table):
+    if 'entity' in table.columns:
+        return table['entity'].astype(str).array
+    return pd.array([DEFAULT_ENTITY] * len(table), dtype=str)
+
+
+def _column(table, column, rows=None):
+    """Float column, 0 where missing or non-numeric; rows of -1 give NaN."""
+    values = pd.to_numeric(table[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan) \
+        if column in table.columns else np.zeros(len(table))
+    values = np.nan_to_num(values)
+    if rows is None:
+        return values
+    return np.where(rows >= 0, values[np.maximum(rows, 0)] if len(values) else 0.0, np.nan)
+
+
+def _first_rows(table, entity, period):
+    """Row of table for each (entity, period), first match as .iloc[0] takes; -1 where absent."""
+    lookup = pd.MultiIndex.from_arrays([_entities(table), table['period'].astype(str).array])
+    first = ~lookup.duplicated(keep='first')
+    position = lookup[first].get_indexer(pd.MultiIndex.from_arrays([entity, period]))
+    return np.where(position >= 0, np.flatnonzero(first)[np.maximum(position, 0)], -1)
+
+
+def _level(scores, levels, lowest):
+    labels = np.full(len(scores), lowest, dtype=object)
+    for bound, label in reversed(levels):
+        labels[scores >= bound] = label
+    return labels
+
+
+def band_points(values, component):
+    """Points of one component for an array of its metric."""
+    _, bounds, points, floor = HEALTH_COMPONENTS[component]
+    with np.errstate(invalid='ignore'):
+        scored = np.select([values > bound for bound in bounds], points, default=floor)
+    return np.where(np.isnan(values), 0, scored)
+
+
+def score_components(income_statement, balance_sheet, cash_flow, previous_revenue=None):
+    """
+    Health-score components for every income statement row.
+
+    Rows are grouped by entity and keep the table's row order within each
+    entity, as predict_financial_health_score reads them (period labels
+    such as 'Q1 2024' do not sort chronologically); growth compares each
+    row with the entity's previous one. A period without both a balance
+    sheet and a cash flow row scores MISSING_STATEMENT_SCORE with no
+    components.
+
+    Args:
+        income_statement, balance_sheet, cash_flow (pd.DataFrame): Statements
+            with 'period' and an optional 'entity' column
+        previous_revenue (pd.Series): Revenue of the period before each
+            entity's first row, by entity (for incremental scoring)
+
+    Returns:
+        pd.DataFrame: entity, period, revenue, the component metrics,
+        one points column per component, health_score and health_level
+    """
+    scored = pd.DataFrame({
+        'entity': _entities(income_statement),
+        'period': income_statement['period'].astype(str).array,
+        'revenue': _column(income_statement, 'revenue'),
+        'net_income': _column(income_statement, 'net_income')
+    }).sort_values('entity', kind='stable', ignore_index=True)
+    entity, period = scored['entity'].array, scored['period'].array
+    revenue = scored['revenue'].to_numpy()
+
+    balance_rows = _first_rows(balance_sheet, entity, period)
+    cash_flow_rows = _first_rows(cash_flow, entity, period)
+    operating_column = next((column for column in OPERATING_CASH_FLOW_COLUMNS if column in cash_flow.columns), None)
+    current_assets = _column(balance_sheet, 'current_assets', balance_rows)
+    current_liabilities = _column(balance_sheet, 'current_liabilities', balance_rows)
+    operating_cash_flow = _column(cash_flow, operating_column, cash_flow_rows) if operating_column \
+        else np.where(cash_flow_rows >= 0, 0.0, np.nan)
+
+    previous = scored.groupby('entity', sort=False)['revenue'].shift(1).to_numpy(dtype=np.float64, copy=True)
+    if previous_revenue is not None:
+        first = np.isnan(previous)
+        previous[first] = pd.Series(entity[first]).map(previous_revenue).to_numpy(dtype=np.float64, na_value=np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        metrics = {
+            'net_margin_pct': np.where(revenue > 0, scored['net_income'].to_numpy() / revenue * 100, np.nan),
+            'current_ratio': np.where(current_liabilities > 0, current_assets / current_liabilities, np.nan),
+            'cash_flow_margin_pct': np.where(revenue > 0, operating_cash_flow / revenue * 100, np.nan),
+            'revenue_growth_pct': np.where(previous > 0, (revenue - previous) / previous * 100, np.nan)
+        }
+    complete = (balance_rows >= 0) & (cash_flow_rows >= 0)
+    total = np.zeros(len(scored))
+    for component, (metric, _, _, _) in HEALTH_COMPONENTS.items():
+        scored[metric] = metrics[metric]
+        points = band_points(metrics[metric], component)
+        scored[component] = np.where(complete, points, np.nan)
+        total += points
+    scored['health_score'] = np.where(complete, total, MISSING_STATEMENT_SCORE)
+    scored['health_level'] = _level(scored['health_score'].to_numpy(), HEALTH_LEVELS, LOWEST_HEALTH_LEVEL)
+    return scored.drop(columns='net_income')
+
+# ============================================================================
+# BATCH SCORER
+# ============================================================================
+
+class HealthScorer:
+    """
+    Health scores, risk flags and peer rankings for many entities.
+
+    Args:
+        peers (pd.DataFrame): Optional 'entity' with 'industry' and/or
+            'size_band' columns; the first row per entity is used. Missing
+            industries are UNCLASSIFIED and missing size bands come from
+            revenue terciles of the latest period.
+    """
+
+    def __init__(self, peers=None):
+        self.peers = None
+        if peers is not None and 'entity' in peers.columns:
+            columns = [column for column in ['industry', 'size_band'] if column in peers.columns]
+            first = peers.drop_duplicates('entity')
+            self.peers = first.set_index(first['entity'].astype(str))[columns]
+        self._history = []
+        self._last = pd.DataFrame(columns=['period', 'revenue']).rename_axis('entity')
+        self._risk_sums = pd.DataFrame(columns=['revenue', 'current_assets', 'current_liabilities'],
+                                       dtype=np.float64).rename_axis('entity')
+
+    @property
+    def scores(self):
+        """Every scored (entity, period) row."""
+        if not self._history:
+            return pd.DataFrame()
+        if len(self._history) > 1:
+            self._history = [pd.concat(self._history, ignore_index=True)]
+        return self._history[0]
+
+    def append(self, income_statement, balance_sheet, cash_flow):
+        """
+        Score statements for periods after those already scored.
+
+        Appended rows follow each entity's scored rows in the order given,
+        as in one table. Only the new rows are scored; growth uses each
+        entity's last scored revenue and the risk sums are updated in place.
+
+        Raises:
+            HealthScoreError: If a row's period is already scored for its entity
+        """
+        if income_statement.empty:
+            return
+        entity = _entities(income_statement)
+        period = income_statement['period'].astype(str).array
+        if self._history:
+            scores = self.scores
+            scored_keys = pd.MultiIndex.from_arrays([scores['entity'].array, scores['period'].array])
+            overlap = pd.MultiIndex.from_arrays([entity, period]).isin(scored_keys)
+            if overlap.any():
+                raise HealthScoreError(f"{int(overlap.sum())} rows are for periods already scored; "
+                                       "rescore from scratch to change history")
+
+        scored = score_components(income_statement, balance_sheet, cash_flow, self._last['revenue'])
+        self._history.append(scored)
+        latest = scored.groupby('entity', sort=False)[['period', 'revenue']].last()
+        self._last = pd.concat([self._last[~self._last.index.isin(latest.index)], latest])
+
+        sums = pd.concat([
+            pd.DataFrame({'revenue': _column(income_statement, 'revenue')}, index=entity),
+            pd.DataFrame({'current_assets': _column(balance_sheet, 'current_assets'),
+                          'current_liabilities': _column(balance_sheet, 'current_liabilities')},
+                         index=_entities(balance_sheet))
+        ]).groupby(level=0).sum()
+        self._risk_sums = self._risk_sums.add(sums, fill_value=0).fillna(0)
+
+    def latest(self):
+        """
+        Latest period of each entity with its component breakdown, risk
+        flags and standing in its peer group.
+
+        Returns:
+            pd.DataFrame: One row per entity: the score_components columns,
+            risk_score, risk_level, industry, size_band, peer_count,
+            health_percentile and one '<component>_percentile' per
+            component, and peer_p25 / peer_median / peer_p75 of the score
+        """
+        if not self._history:
+            return pd.DataFrame()
+        scores = self.scores
+        latest = scores.groupby('entity', sort=False).tail(1).set_index('entity')
+        latest = latest.join(self._risk(latest.index))
+
+        # Peer groups
+        industry = pd.Series(UNCLASSIFIED, index=latest.index, dtype=object)
+        size_band = pd.Series(np.nan, index=latest.index, dtype=object)
+        if self.peers is not None:
+            if 'industry' in self.peers.columns:
+                industry = latest.index.to_series().map(self.peers['industry']).fillna(UNCLASSIFIED).astype(object)
+            if 'size_band' in self.peers.columns:
+                size_band = latest.index.to_series().map(self.peers['size_band']).astype(object)
+        unbanded = size_band.isna().to_numpy()
+        if unbanded.any():
+            revenue = latest['revenue'].to_numpy()
+            cuts = np.quantile(revenue, [1 / 3, 2 / 3])
+            size_band[unbanded] = np.array(SIZE_BANDS, dtype=object)[np.searchsorted(cuts, revenue, side='right')][unbanded]
+        latest['industry'] = industry.to_numpy()
+        latest['size_band'] = size_band.to_numpy()
+
+        groups = latest.groupby(['industry', 'size_band'], sort=False)
+        latest['peer_count'] = groups['health_score'].transform('size')
+        ranked = groups[['health_score'] + COMPONENT_NAMES].rank(pct=True) * 100
+        latest['health_percentile'] = ranked['health_score']
+        for component in COMPONENT_NAMES:
+            latest[f"{component}_percentile"] = ranked[component]
+        quantiles = groups['health_score'].quantile(PEER_QUANTILES).unstack()
+        quantiles.columns = ['peer_p25', 'peer_median', 'peer_p75']
+        latest = latest.join(quantiles, on=['industry', 'size_band'])
+        return latest.reset_index()
+
+    def _risk(self, entities):
+        """FinanceRiskAnalyzer's revenue concentration and liquidity rules per entity."""
+        sums = self._risk_sums.reindex(entities).fillna(0)
+        last_revenue = self._last['revenue'].reindex(entities).to_numpy(dtype=np.float64)
+        total_revenue = sums['revenue'].to_numpy()
+        current_assets, current_liabilities = sums['current_assets'].to_numpy(), sums['current_liabilities'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            concentration = np.where(total_revenue > 0, last_revenue / total_revenue * 100, 0.0)
+            current_ratio = np.where(current_liabilities > 0, current_assets / current_liabilities, np.nan)
+        concentrated = concentration > 50
+        low_liquidity = current_ratio < 1.0
+        moderate_liquidity = (current_ratio >= 1.0) & (current_ratio < 1.5)
+        risk_score = 30 * concentrated + 40 * low_liquidity + 20 * moderate_liquidity
+        return pd.DataFrame({
+            'revenue_concentration_pct': concentration,
+            'concentration_flag': concentrated,
+            'liquidity_flag': np.select([low_liquidity, moderate_liquidity], ['Low', 'Moderate'], default=''),
+            'risk_score': risk_score,
+            'risk_level': _level(risk_score, RISK_LEVELS, LOWEST_RISK_LEVEL)
+        }, index=entities)
+
+
+def score_entities(income_statement, balance_sheet, cash_flow, peers=None):
+    """
+    Latest health score, components, risk flags and peer standing of every entity.
+
+    Returns:
+        pd.DataFrame: See HealthScorer.latest
+    """
+    scorer = HealthScorer(peers)
+    scorer.append(income_statement, balance_sheet, cash_flow)
+    return scorer.latest()
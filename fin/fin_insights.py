@@ -0,0 +1,801 @@
+import time
+
+# Finance-specific auto insights functionality (optimized)
+class FinanceInsights:
+    """Optimized auto insights generator for finance analytics"""
+    
+    def __init__(self, income_statement, balance_sheet, cash_flow, budget, forecast, market_data, customer_data, product_data, value_chain):
+        self.income_statement = income_statement
+        self.balance_sheet = balance_sheet
+        self.cash_flow = cash_flow
+        self.budget = budget
+        self.forecast = forecast
+        self.market_data = market_data
+        self.customer_data = customer_data
+        self.product_data = product_data
+        self.value_chain = value_chain
+        
+        # Pre-calculate common metrics for performance optimization
+        self._precalculate_metrics()
+    
+    def _precalculate_metrics(self):
+        """Pre-calculate common metrics to avoid repeated calculations"""
+        self._metrics_cache = {}
+        
+        # Financial performance metrics
+        if not self.income_statement.empty:
+            self._metrics_cache['total_revenue'] = self.income_statement['revenue'].sum()
+            self._metrics_cache['total_net_income'] = self.income_statement['net_income'].sum()
+            self._metrics_cache['avg_net_margin'] = (self._metrics_cache['total_net_income'] / self._metrics_cache['total_revenue'] * 100) if self._metrics_cache['total_revenue'] > 0 else 0
+            
+            # Trend analysis
+            if len(self.income_statement) > 1:
+                recent_revenue = self.income_statement['revenue'].iloc[-1]
+                previous_revenue = self.income_statement['revenue'].iloc[-2]
+                self._metrics_cache['revenue_growth'] = ((recent_revenue - previous_revenue) / previous_revenue * 100) if previous_revenue > 0 else 0
+            
+            # Additional financial metrics
+            if 'gross_profit' in self.income_statement.columns:
+                self._metrics_cache['total_gross_profit'] = self.income_statement['gross_profit'].sum()
+                self._metrics_cache['gross_margin'] = (self._metrics_cache['total_gross_profit'] / self._metrics_cache['total_revenue'] * 100) if self._metrics_cache['total_revenue'] > 0 else 0
+            
+            if 'operating_expenses' in self.income_statement.columns:
+                self._metrics_cache['total_operating_expenses'] = self.income_statement['operating_expenses'].sum()
+                self._metrics_cache['operating_margin'] = ((self._metrics_cache['total_revenue'] - self._metrics_cache['total_operating_expenses']) / self._metrics_cache['total_revenue'] * 100) if self._metrics_cache['total_revenue'] > 0 else 0
+        
+        # Liquidity and solvency metrics
+        if not self.balance_sheet.empty:
+            self._metrics_cache['current_assets'] = self.balance_sheet['current_assets'].sum()
+            self._metrics_cache['current_liabilities'] = self.balance_sheet['current_liabilities'].sum()
+            self._metrics_cache['total_liabilities'] = self.balance_sheet['total_liabilities'].sum()
+            self._metrics_cache['total_equity'] = self.balance_sheet['shareholder_equity'].sum()
+            
+            if self._metrics_cache['current_liabilities'] > 0:
+                self._metrics_cache['current_ratio'] = self._metrics_cache['current_assets'] / self._metrics_cache['current_liabilities']
+            
+            if self._metrics_cache['total_equity'] > 0:
+                self._metrics_cache['debt_to_equity'] = self._metrics_cache['total_liabilities'] / self._metrics_cache['total_equity']
+            
+            # Additional balance sheet metrics
+            if 'total_assets' in self.balance_sheet.columns:
+                self._metrics_cache['total_assets'] = self.balance_sheet['total_assets'].sum()
+                if self._metrics_cache['total_assets'] > 0:
+                    self._metrics_cache['asset_turnover'] = self._metrics_cache['total_revenue'] / self._metrics_cache['total_assets']
+                    self._metrics_cache['roa'] = (self._metrics_cache['total_net_income'] / self._metrics_cache['total_assets']) * 100
+            
+            if self._metrics_cache['total_equity'] > 0:
+                self._metrics_cache['roe'] = (self._metrics_cache['total_net_income'] / self._metrics_cache['total_equity']) * 100
+        
+        # Cash flow metrics - with column existence checks
+        if not self.cash_flow.empty:
+            # Check for operating cash flow column with fallback names
+            operating_cf_col = None
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in self.cash_flow.columns:
+                    operating_cf_col = col_name
+                    break
+            
+            if operating_cf_col:
+                self._metrics_cache['total_operating_cf'] = self.cash_flow[operating_cf_col].sum()
+            else:
+                self._metrics_cache['total_operating_cf'] = 0
+            
+            # Check for capital expenditures column
+            capex_col = None
+            for col_name in ['capital_expenditures', 'capex', 'capital_expenses', 'investment_expenditures']:
+                if col_name in self.cash_flow.columns:
+                    capex_col = col_name
+                    break
+            
+            if capex_col:
+                self._metrics_cache['total_investing_cf'] = self.cash_flow[capex_col].sum()
+            else:
+                self._metrics_cache['total_investing_cf'] = 0
+            
+            # Check for free cash flow column
+            fcf_col = None
+            for col_name in ['free_cash_flow', 'free_cf', 'free_cashflow', 'fcf']:
+                if col_name in self.cash_flow.columns:
+                    fcf_col = col_name
+                    break
+            
+            if fcf_col:
+                self._metrics_cache['total_free_cf'] = self.cash_flow[fcf_col].sum()
+            else:
+                self._metrics_cache['total_free_cf'] = 0
+            
+            # Cash flow quality metrics
+            if self._metrics_cache['total_operating_cf'] != 0:
+                self._metrics_cache['cash_flow_quality'] = self._metrics_cache['total_free_cf'] / abs(self._metrics_cache['total_operating_cf'])
+        
+        # Performance optimization: Add timestamp for cache invalidation
+        self._metrics_cache['_last_updated'] = time.time()
+    
+    def _get_cached_metric(self, metric_name, default_value=0):
+        """Get cached metric with lazy loading support"""
+        if metric_name not in self._metrics_cache:
+            # Lazy load the metric if not in cache
+            self._load_metric(metric_name)
+        
+        return self._metrics_cache.get(metric_name, default_value)
+    
+    def _load_metric(self, metric_name):
+        """Lazy load specific metrics as needed"""
+        if metric_name == 'working_capital_turnover':
+            # Check for operating cash flow column with fallback names
+            operating_cf_col = None
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in self.cash_flow.columns:
+                    operating_cf_col = col_name
+                    break
+            
+            if not self.cash_flow.empty and operating_cf_col:
+                operating_cf = self.cash_flow[operating_cf_col].sum()
+                current_assets = self._metrics_cache.get('current_assets', 0)
+                current_liabilities = self._metrics_cache.get('current_liabilities', 0)
+                working_capital = current_assets - current_liabilities
+                
+                if working_capital > 0:
+                    self._metrics_cache['working_capital_turnover'] = operating_cf / working_capital
+                else:
+                    self._metrics_cache['working_capital_turnover'] = 0
+        
+        elif metric_name == 'cash_conversion_cycle':
+            # Calculate cash conversion cycle if inventory and receivables data available
+            if not self.balance_sheet.empty:
+                inventory = self.balance_sheet['inventory'].sum() if 'inventory' in self.balance_sheet.columns else 0
+                receivables = self.balance_sheet['accounts_receivable'].sum() if 'accounts_receivable' in self.balance_sheet.columns else 0
+                payables = self.balance_sheet['accounts_payable'].sum() if 'accounts_payable' in self.balance_sheet.columns else 0
+                
+                if self._metrics_cache.get('total_revenue', 0) > 0:
+                    revenue = self._metrics_cache['total_revenue']
+                    # Simplified calculation (in days)
+                    days_inventory = (inventory / revenue) * 365 if revenue > 0 else 0
+                    days_receivables = (receivables / revenue) * 365 if revenue > 0 else 0
+                    days_payables = (payables / revenue) * 365 if revenue > 0 else 0
+                    
+                    self._metrics_cache['cash_conversion_cycle'] = days_inventory + days_receivables - days_payables
+                else:
+                    self._metrics_cache['cash_conversion_cycle'] = 0
+    
+    def generate_profitability_insights(self):
+        """Generate comprehensive insights for profitability analysis"""
+        if self.income_statement.empty:
+            return "No income statement data available for profitability analysis."
+        
+        insights = []
+        
+        # Use cached metrics for performance
+        total_revenue = self._metrics_cache.get('total_revenue', 0)
+        total_net_income = self._metrics_cache.get('total_net_income', 0)
+        avg_net_margin = self._metrics_cache.get('avg_net_margin', 0)
+        
+        insights.append(f"**Total Revenue**: ${total_revenue:,.0f}")
+        insights.append(f"**Total Net Income**: ${total_net_income:,.0f}")
+        insights.append(f"**Average Net Margin**: {avg_net_margin:.1f}%")
+        insights.append("")
+        
+        # Enhanced trend analysis
+        if len(self.income_statement) > 1:
+            revenue_growth = self._metrics_cache.get('revenue_growth', 0)
+            insights.append(f"**Revenue Growth**: {revenue_growth:+.1f}% (latest period)")
+            
+            # More sophisticated trend analysis
+            if revenue_growth > 15:
+                insights.append("**Trend**: Exceptional revenue growth - excellent performance")
+            elif revenue_growth > 10:
+                insights.append("**Trend**: Strong revenue growth - maintain momentum")
+            elif revenue_growth > 5:
+                insights.append("**Trend**: Moderate revenue growth - opportunities for acceleration")
+            elif revenue_growth > 0:
+                insights.append("**Trend**: Slow revenue growth - review growth strategies")
+            else:
+                insights.append("**Trend**: Revenue decline - immediate action required")
+            
+            # Add margin trend analysis
+            if 'gross_profit' in self.income_statement.columns and 'operating_expenses' in self.income_statement.columns:
+                recent_gross_margin = (self.income_statement['gross_profit'].iloc[-1] / self.income_statement['revenue'].iloc[-1] * 100) if self.income_statement['revenue'].iloc[-1] > 0 else 0
+                previous_gross_margin = (self.income_statement['gross_profit'].iloc[-2] / self.income_statement['revenue'].iloc[-2] * 100) if self.income_statement['revenue'].iloc[-2] > 0 else 0
+                margin_change = recent_gross_margin - previous_gross_margin
+                
+                insights.append(f"**Gross Margin Change**: {margin_change:+.1f}%")
+                if margin_change > 0:
+                    insights.append("**Margin Trend**: Improving profitability - cost control effective")
+                else:
+                    insights.append("**Margin Trend**: Declining profitability - review cost structure")
+        
+        return "\n".join(insights)
+    
+    def generate_liquidity_solvency_insights(self):
+        """Generate comprehensive insights for liquidity and solvency analysis"""
+        if self.balance_sheet.empty:
+            return "No balance sheet data available for liquidity analysis."
+        
+        insights = []
+        
+        # Use cached metrics
+        current_ratio = self._metrics_cache.get('current_ratio', 0)
+        debt_to_equity = self._metrics_cache.get('debt_to_equity', 0)
+        
+        insights.append(f"**Current Ratio**: {current_ratio:.2f}")
+        insights.append(f"**Debt-to-Equity**: {debt_to_equity:.2f}")
+        insights.append("")
+        
+        # Enhanced risk assessment with specific recommendations
+        if current_ratio < 1.0:
+            insights.append("**Liquidity Risk**: Critical - immediate action required")
+            insights.append("**Action Items**:")
+            insights.append("  • Implement emergency cash flow management")
+            insights.append("  • Negotiate payment extensions with creditors")
+            insights.append("  • Consider short-term financing options")
+        elif current_ratio < 1.5:
+            insights.append("**Liquidity Risk**: Moderate - monitor closely")
+            insights.append("**Action Items**:")
+            insights.append("  • Optimize working capital management")
+            insights.append("  • Review payment terms with suppliers")
+            insights.append("  • Accelerate accounts receivable collection")
+        else:
+            insights.append("**Liquidity Risk**: Low - strong short-term financial position")
+            insights.append("**Opportunities**:")
+            insights.append("  • Consider investment opportunities for excess cash")
+            insights.append("  • Explore strategic acquisitions or expansion")
+        
+        insights.append("")
+        
+        # Enhanced solvency analysis
+        if debt_to_equity > 2.5:
+            insights.append("**Solvency Risk**: Critical - high debt levels")
+            insights.append("**Action Items**:")
+            insights.append("  • Prioritize debt reduction")
+            insights.append("  • Review capital structure")
+            insights.append("  • Consider debt restructuring")
+        elif debt_to_equity > 2.0:
+            insights.append("**Solvency Risk**: High - debt reduction priority")
+            insights.append("**Action Items**:")
+            insights.append("  • Implement debt reduction plan")
+            insights.append("  • Review financing strategy")
+            insights.append("  • Consider equity financing")
+        elif debt_to_equity > 1.0:
+            insights.append("**Solvency Risk**: Moderate - manageable but monitor")
+            insights.append("**Action Items**:")
+            insights.append("  • Balance debt and equity financing")
+            insights.append("  • Maintain debt service coverage")
+            insights.append("  • Monitor debt covenants")
+        else:
+            insights.append("**Solvency Risk**: Low - conservative debt structure")
+            insights.append("**Opportunities**:")
+            insights.append("  • Consider strategic debt for growth")
+            insights.append("  • Explore leverage opportunities")
+        
+        return "\n".join(insights)
+    
+    def generate_cash_flow_insights(self):
+        """Generate comprehensive insights for cash flow analysis"""
+        if self.cash_flow.empty:
+            return "No cash flow data available for analysis."
+        
+        insights = []
+        
+        # Use cached metrics
+        total_operating_cf = self._metrics_cache.get('total_operating_cf', 0)
+        total_investing_cf = self._metrics_cache.get('total_investing_cf', 0)
+        total_free_cf = self._metrics_cache.get('total_free_cf', 0)
+        
+        insights.append(f"**Total Operating Cash Flow**: ${total_operating_cf:,.0f}")
+        insights.append(f"**Total Capital Expenditures**: ${total_investing_cf:,.0f}")
+        insights.append(f"**Total Free Cash Flow**: ${total_free_cf:,.0f}")
+        insights.append("")
+        
+        # Enhanced cash flow quality assessment
+        if total_operating_cf > 0:
+            insights.append("**Cash Flow Quality**: Positive operating cash flow")
+            if total_operating_cf > abs(total_investing_cf):
+                insights.append("**Assessment**: Strong operational performance with investment capacity")
+            else:
+                insights.append("**Assessment**: Good operations but high investment requirements")
+        else:
+            insights.append("**Cash Flow Quality**: Negative operating cash flow")
+            insights.append("**Assessment**: Operational challenges - review business model")
+        
+        insights.append("")
+        
+        # Free cash flow analysis
+        if total_free_cf > 0:
+            insights.append("**Financial Flexibility**: Positive free cash flow")
+            insights.append("**Opportunities**:")
+            insights.append("  • Dividend payments to shareholders")
+            insights.append("  • Debt reduction")
+            insights.append("  • Strategic investments")
+            insights.append("  • Share buybacks")
+        else:
+            insights.append("**Financial Flexibility**: Negative free cash flow")
+            insights.append("**Challenges**:")
+            insights.append("  • Limited financial flexibility")
+            insights.append("  • Potential liquidity constraints")
+            insights.append("  • Need for external financing")
+        
+        # Cash flow trends analysis
+        if len(self.cash_flow) > 1:
+            # Check for operating cash flow column with fallback names
+            operating_cf_col = None
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in self.cash_flow.columns:
+                    operating_cf_col = col_name
+                    break
+            
+            if operating_cf_col:
+                recent_operating_cf = self.cash_flow[operating_cf_col].iloc[-1]
+                previous_operating_cf = self.cash_flow[operating_cf_col].iloc[-2]
+                
+                if previous_operating_cf != 0:
+                    cf_growth = ((recent_operating_cf - previous_operating_cf) / abs(previous_operating_cf) * 100)
+                    insights.append("")
+                    insights.append(f"**Operating CF Growth**: {cf_growth:+.1f}%")
+                    
+                    if cf_growth > 20:
+                        insights.append("**Trend**: Exceptional cash flow improvement")
+                    elif cf_growth > 10:
+                        insights.append("**Trend**: Strong cash flow growth")
+                    elif cf_growth < -10:
+                        insights.append("**Trend**: Declining cash flow - investigate causes")
+        
+        return "\n".join(insights)
+    
+    def generate_budget_forecasting_insights(self):
+        """Generate comprehensive insights for budget and forecasting analysis"""
+        if self.budget.empty and self.forecast.empty:
+            return "No budget or forecast data available for analysis."
+        
+        insights = []
+        
+        # Budget analysis
+        if not self.budget.empty:
+            total_budget = self.budget['revenue'].sum() if 'revenue' in self.budget.columns else 0
+            insights.append(f"**Total Budget**: ${total_budget:,.0f}")
+            
+            # Budget variance analysis if income statement available
+            if not self.income_statement.empty and total_budget > 0:
+                actual_revenue = self.income_statement['revenue'].sum()
+                budget_variance = ((actual_revenue - total_budget) / total_budget * 100)
+                insights.append(f"**Budget Variance**: {budget_variance:+.1f}%")
+                
+                if abs(budget_variance) < 5:
+                    insights.append("**Performance**: Excellent budget accuracy")
+                elif abs(budget_variance) < 10:
+                    insights.append("**Performance**: Good budget accuracy")
+                elif abs(budget_variance) < 20:
+                    insights.append("**Performance**: Moderate budget accuracy - room for improvement")
+                else:
+                    insights.append("**Performance**: Poor budget accuracy - review forecasting process")
+        
+        insights.append("")
+        
+        # Forecast analysis
+        if not self.forecast.empty:
+            total_forecast = self.forecast['revenue'].sum() if 'revenue' in self.forecast.columns else 0
+            insights.append(f"**Total Forecast**: ${total_forecast:,.0f}")
+            
+            # Forecast confidence analysis
+            if 'confidence_level' in self.forecast.columns:
+                avg_confidence = self.forecast['confidence_level'].mean()
+                insights.append(f"**Average Forecast Confidence**: {avg_confidence:.1f}%")
+                
+                if avg_confidence > 80:
+                    insights.append("**Confidence Level**: High - reliable forecasts")
+                elif avg_confidence > 60:
+                    insights.append("**Confidence Level**: Moderate - reasonable forecasts")
+                else:
+                    insights.append("**Confidence Level**: Low - improve forecasting methodology")
+            
+            # Scenario analysis
+            if 'scenario' in self.forecast.columns:
+                scenarios = self.forecast['scenario'].nunique()
+                insights.append(f"**Scenarios Analyzed**: {scenarios}")
+                
+                if scenarios > 3:
+                    insights.append("**Analysis**: Comprehensive scenario planning")
+                elif scenarios > 1:
+                    insights.append("**Analysis**: Basic scenario planning")
+                else:
+                    insights.append("**Analysis**: Limited scenario planning - consider multiple scenarios")
+        
+        insights.append("")
+        insights.append("**Budget vs Forecast Analysis**: Compare actual performance against targets")
+        
+        return "\n".join(insights)
+    
+    def generate_customer_productivity_insights(self):
+        """Generate comprehensive insights for customer and product analysis"""
+        insights = []
+        
+        # Customer analysis
+        if not self.customer_data.empty:
+            total_customers = len(self.customer_data)
+            total_customer_revenue = self.customer_data['revenue'].sum()
+            avg_customer_value = total_customer_revenue / total_customers if total_customers > 0 else 0
+            
+            insights.append(f"**Total Customers**: {total_customers:,}")
+            insights.append(f"**Total Customer Revenue**: ${total_customer_revenue:,.0f}")
+            insights.append(f"**Average Customer Value**: ${avg_customer_value:,.0f}")
+            
+            # Customer segmentation analysis
+            if 'segment' in self.customer_data.columns:
+                segment_analysis = self.customer_data.groupby('segment')['revenue'].agg(['sum', 'mean', 'count'])
+                insights.append("")
+                insights.append("**Customer Segment Analysis**:")
+                for segment, data in segment_analysis.iterrows():
+                    insights.append(f"  • {segment}: {data['count']} customers, ${data['sum']:,.0f} revenue, ${data['mean']:,.0f} avg")
+            
+            # Customer profitability analysis
+            if 'profitability' in self.customer_data.columns:
+                profitable_customers = len(self.customer_data[self.customer_data['profitability'] > 0])
+                profitability_rate = (profitable_customers / total_customers * 100) if total_customers > 0 else 0
+                insights.append("")
+                insights.append(f"**Customer Profitability**: {profitability_rate:.1f}% of customers are profitable")
+                
+                if profitability_rate < 50:
+                    insights.append("**Action**: Review customer acquisition and retention strategies")
+                elif profitability_rate < 80:
+                    insights.append("**Action**: Optimize customer mix and pricing strategies")
+                else:
+                    insights.append("**Status**: Excellent customer profitability")
+            
+            insights.append("")
+        
+        # Product analysis
+        if not self.product_data.empty:
+            total_products = len(self.product_data)
+            total_product_revenue = self.product_data['revenue'].sum()
+            avg_product_value = total_product_revenue / total_products if total_products > 0 else 0
+            
+            insights.append(f"**Total Products**: {total_products:,}")
+            insights.append(f"**Total Product Revenue**: ${total_product_revenue:,.0f}")
+            insights.append(f"**Average Product Value**: ${avg_product_value:,.0f}")
+            
+            # Product margin analysis
+            if 'margin' in self.product_data.columns:
+                avg_margin = self.product_data['margin'].mean()
+                high_margin_products = len(self.product_data[self.product_data['margin'] > avg_margin])
+                insights.append("")
+                insights.append(f"**Product Margin Analysis**:")
+                insights.append(f"  • Average margin: {avg_margin:.1f}%")
+                insights.append(f"  • High-margin products: {high_margin_products}/{total_products}")
+                
+                if avg_margin < 20:
+                    insights.append("**Action**: Review pricing strategy and cost structure")
+                elif avg_margin < 35:
+                    insights.append("**Action**: Optimize product mix and pricing")
+                else:
+                    insights.append("**Status**: Strong product profitability")
+            
+            # Product lifecycle analysis
+            if 'lifecycle_stage' in self.product_data.columns:
+                lifecycle_analysis = self.product_data.groupby('lifecycle_stage')['revenue'].sum()
+                insights.append("")
+                insights.append("**Product Lifecycle Analysis**:")
+                for stage, revenue in lifecycle_analysis.items():
+                    insights.append(f"  • {stage}: ${revenue:,.0f}")
+        
+        return "\n".join(insights)
+    
+    def generate_executive_summary(self):
+        """Generate comprehensive executive summary of all insights"""
+        summary = []
+        
+        summary.append("## 🎯 Executive Financial Summary")
+        summary.append("")
+        
+        # Financial performance
+        if not self.income_statement.empty:
+            total_revenue = self._metrics_cache.get('total_revenue', 0)
+            total_net_income = self._metrics_cache.get('total_net_income', 0)
+            summary.append(f"**Revenue**: ${total_revenue:,.0f}")
+            summary.append(f"**Net Income**: ${total_net_income:,.0f}")
+            
+            if total_revenue > 0:
+                net_margin = (total_net_income / total_revenue * 100)
+                summary.append(f"**Net Margin**: {net_margin:.1f}%")
+            summary.append("")
+        
+        # Key ratios
+        if not self.balance_sheet.empty:
+            current_ratio = self._metrics_cache.get('current_ratio', 0)
+            debt_to_equity = self._metrics_cache.get('debt_to_equity', 0)
+            summary.append(f"**Current Ratio**: {current_ratio:.2f}")
+            summary.append(f"**Debt-to-Equity**: {debt_to_equity:.2f}")
+            summary.append("")
+        
+        # Cash flow summary
+        if not self.cash_flow.empty:
+            total_free_cf = self._metrics_cache.get('total_free_cf', 0)
+            summary.append(f"**Free Cash Flow**: ${total_free_cf:,.0f}")
+            summary.append("")
+        
+        # Risk assessment
+        summary.append("## ⚠️ Risk Assessment")
+        risk_level = "Low"
+        risk_factors = []
+        
+        if self._metrics_cache.get('current_ratio', 0) < 1.5:
+            risk_level = "Medium"
+            risk_factors.append("Liquidity concerns")
+        
+        if self._metrics_cache.get('debt_to_equity', 0) > 2.0:
+            risk_level = "High"
+            risk_factors.append("High debt levels")
+        
+        if self._metrics_cache.get('total_free_cf', 0) < 0:
+            risk_level = "Medium" if risk_level == "Low" else risk_level
+            risk_factors.append("Negative free cash flow")
+        
+        summary.append(f"**Overall Risk Level**: {risk_level}")
+        if risk_factors:
+            summary.append("**Key Risk Factors**:")
+            for factor in risk_factors:
+                summary.append(f"  • {factor}")
+        summary.append("")
+        
+        # Recommendations
+        summary.append("## 💡 Key Recommendations")
+        
+        # Revenue growth recommendations
+        revenue_growth = self._metrics_cache.get('revenue_growth', 0)
+        if revenue_growth < 5:
+            summary.append("1. **Revenue Growth**: Implement aggressive growth strategies")
+            summary.append("   • Market expansion initiatives")
+            summary.append("   • Product development acceleration")
+            summary.append("   • Sales team expansion")
+        else:
+            summary.append("1. **Revenue Growth**: Maintain current momentum")
+            summary.append("   • Continue successful strategies")
+            summary.append("   • Optimize high-performing channels")
+        
+        # Profitability recommendations
+        avg_net_margin = self._metrics_cache.get('avg_net_margin', 0)
+        if avg_net_margin < 10:
+            summary.append("2. **Profitability**: Focus on margin improvement")
+            summary.append("   • Cost optimization initiatives")
+            summary.append("   • Pricing strategy review")
+            summary.append("   • Operational efficiency improvements")
+        else:
+            summary.append("2. **Profitability**: Strong margins - focus on growth")
+            summary.append("   • Reinvest profits strategically")
+            summary.append("   • Explore new market opportunities")
+        
+        # Liquidity recommendations
+        current_ratio = self._metrics_cache.get('current_ratio', 0)
+        if current_ratio < 1.5:
+            summary.append("3. **Liquidity**: Strengthen working capital management")
+            summary.append("   • Optimize inventory levels")
+            summary.append("   • Accelerate receivables collection")
+            summary.append("   • Negotiate payment terms")
+        else:
+            summary.append("3. **Liquidity**: Strong position - consider strategic investments")
+            summary.append("   • Evaluate acquisition opportunities")
+            summary.append("   • Consider share buybacks or dividends")
+        
+        # Strategic actions
+        summary.append("")
+        summary.append("## 🎯 Strategic Actions")
+        summary.append("1. **Immediate (30 days)**:")
+        summary.append("   • Review cash flow projections")
+        summary.append("   • Assess current risk exposure")
+        summary.append("   • Update budget forecasts")
+        
+        summary.append("2. **Short-term (90 days)**:")
+        summary.append("   • Implement identified improvements")
+        summary.append("   • Develop contingency plans")
+        summary.append("   • Optimize operational processes")
+        
+        summary.append("3. **Long-term (12 months)**:")
+        summary.append("   • Strategic planning and execution")
+        summary.append("   • Technology investments")
+        summary.append("   • Market expansion initiatives")
+        
+        return "\n".join(summary)
+    
+    def generate_market_competitive_insights(self):
+        """Generate comprehensive market and competitive insights"""
+        insights = []
+        
+        # Market data analysis
+        if not self.market_data.empty:
+            insights.append("## 📈 Market Analysis")
+            
+            # Market price trends
+            if 'market_price' in self.market_data.columns and len(self.market_data) > 1:
+                recent_price = self.market_data['market_price'].iloc[-1]
+                previous_price = self.market_data['market_price'].iloc[-2]
+                
+                if previous_price > 0:
+                    price_change = ((recent_price - previous_price) / previous_price) * 100
+                    insights.append(f"**Stock Price Change**: {price_change:+.1f}%")
+                    
+                    if price_change > 10:
+                        insights.append("**Market Sentiment**: Strong positive momentum")
+                    elif price_change > 0:
+                        insights.append("**Market Sentiment**: Positive but moderate")
+                    elif price_change > -10:
+                        insights.append("**Market Sentiment**: Slight negative pressure")
+                    else:
+                        insights.append("**Market Sentiment**: Significant negative pressure")
+            
+            # Market capitalization analysis
+            if 'market_cap' in self.market_data.columns:
+                avg_market_cap = self.market_data['market_cap'].mean()
+                insights.append(f"**Average Market Cap**: ${avg_market_cap:,.0f}")
+                
+                if avg_market_cap > 10000000000:  # $10B
+                    insights.append("**Company Size**: Large-cap company")
+                elif avg_market_cap > 2000000000:  # $2B
+                    insights.append("**Company Size**: Mid-cap company")
+                else:
+                    insights.append("**Company Size**: Small-cap company")
+            
+            # Dividend analysis
+            if 'dividends_per_share' in self.market_data.columns:
+                avg_dividend = self.market_data['dividends_per_share'].mean()
+                if avg_dividend > 0:
+                    insights.append(f"**Average Dividend**: ${avg_dividend:.2f} per share")
+                    insights.append("**Dividend Policy**: Income-generating stock")
+                else:
+                    insights.append("**Dividend Policy**: Growth-focused, no dividends")
+        
+        # Value chain analysis
+        if not self.value_chain.empty:
+            insights.append("")
+            insights.append("## 🔗 Value Chain Analysis")
+            
+            # Cost distribution analysis
+            if 'cost' in self.value_chain.columns and 'function' in self.value_chain.columns:
+                total_value_chain_cost = self.value_chain['cost'].sum()
+                insights.append(f"**Total Value Chain Cost**: ${total_value_chain_cost:,.0f}")
+                
+                # Identify highest cost functions
+                cost_by_function = self.value_chain.groupby('function')['cost'].sum().sort_values(ascending=False)
+                insights.append("**Cost Distribution by Function**:")
+                for function, cost in cost_by_function.head(3).items():
+                    percentage = (cost / total_value_chain_cost * 100) if total_value_chain_cost > 0 else 0
+                    insights.append(f"  • {function}: ${cost:,.0f} ({percentage:.1f}%)")
+                
+                # Optimization opportunities
+                highest_cost_function = cost_by_function.index[0]
+                highest_cost = cost_by_function.iloc[0]
+                insights.append("")
+                insights.append(f"**Optimization Focus**: {highest_cost_function}")
+                insights.append(f"  • Highest cost function: ${highest_cost:,.0f}")
+                insights.append(f"  • Potential savings through optimization")
+                insights.append(f"  • Review processes and efficiency")
+        
+        # Competitive positioning insights
+        insights.append("")
+        insights.append("## 🏆 Competitive Positioning")
+        
+        # Financial strength assessment
+        if not self.income_statement.empty and not self.balance_sheet.empty:
+            revenue = self._metrics_cache.get('total_revenue', 0)
+            net_income = self._metrics_cache.get('total_net_income', 0)
+            current_ratio = self._metrics_cache.get('current_ratio', 0)
+            debt_to_equity = self._metrics_cache.get('debt_to_equity', 0)
+            
+            # Competitive strength score
+            strength_score = 0
+            if revenue > 1000000000:  # $1B
+                strength_score += 25
+            elif revenue > 100000000:  # $100M
+                strength_score += 15
+            else:
+                strength_score += 5
+            
+            if net_income > 0:
+                strength_score += 20
+            
+            if current_ratio > 1.5:
+                strength_score += 20
+            elif current_ratio > 1.0:
+                strength_score += 10
+            
+            if debt_to_equity < 1.0:
+                strength_score += 15
+            elif debt_to_equity < 2.0:
+                strength_score += 10
+            
+            insights.append(f"**Competitive Strength Score**: {strength_score}/80")
+            
+            if strength_score >= 60:
+                insights.append("**Position**: Strong competitive position")
+                insights.append("  • Maintain competitive advantages")
+                insights.append("  • Consider market expansion")
+            elif strength_score >= 40:
+                insights.append("**Position**: Moderate competitive position")
+                insights.append("  • Strengthen core competencies")
+                insights.append("  • Address competitive weaknesses")
+            else:
+                insights.append("**Position**: Weak competitive position")
+                insights.append("  • Immediate turnaround required")
+                insights.append("  • Focus on core business improvement")
+        
+        return "\n".join(insights)
+    
+    def generate_risk_mitigation_insights(self):
+        """Generate comprehensive risk mitigation insights"""
+        insights = []
+        insights.append("## ⚠️ Risk Mitigation Analysis")
+        
+        # Financial risk assessment
+        risk_factors = []
+        mitigation_strategies = []
+        
+        # Liquidity risk
+        current_ratio = self._metrics_cache.get('current_ratio', 0)
+        if current_ratio < 1.5:
+            risk_factors.append("Liquidity Risk")
+            mitigation_strategies.extend([
+                "Implement cash flow forecasting and monitoring",
+                "Optimize working capital management",
+                "Establish credit lines and financing options",
+                "Review payment terms with suppliers and customers"
+            ])
+        
+        # Solvency risk
+        debt_to_equity = self._metrics_cache.get('debt_to_equity', 0)
+        if debt_to_equity > 2.0:
+            risk_factors.append("Solvency Risk")
+            mitigation_strategies.extend([
+                "Develop debt reduction plan",
+                "Review capital structure",
+                "Consider equity financing alternatives",
+                "Monitor debt covenants closely"
+            ])
+        
+        # Cash flow risk
+        total_free_cf = self._metrics_cache.get('total_free_cf', 0)
+        if total_free_cf < 0:
+            risk_factors.append("Cash Flow Risk")
+            mitigation_strategies.extend([
+                "Improve operational efficiency",
+                "Optimize capital expenditure planning",
+                "Review investment priorities",
+                "Consider divestment of non-core assets"
+            ])
+        
+        # Revenue concentration risk
+        if not self.income_statement.empty and len(self.income_statement) > 1:
+            recent_revenue = self.income_statement['revenue'].iloc[-1]
+            total_revenue = self.income_statement['revenue'].sum()
+            if total_revenue > 0:
+                concentration = (recent_revenue / total_revenue) * 100
+                if concentration > 50:
+                    risk_factors.append("Revenue Concentration Risk")
+                    mitigation_strategies.extend([
+                        "Diversify revenue sources",
+                        "Develop new product/service lines",
+                        "Expand into new markets",
+                        "Strengthen customer relationships"
+                    ])
+        
+        # Display risk factors
+        if risk_factors:
+            insights.append("**Identified Risk Factors**:")
+            for risk in risk_factors:
+                insights.append(f"  • {risk}")
+        else:
+            insights.append("**Risk Status**: Low overall risk profile")
+        
+        insights.append("")
+        
+        # Display mitigation strategies
+        if mitigation_strategies:
+            insights.append("**Mitigation Strategies**:")
+            for strategy in mitigation_strategies:
+                insights.append(f"  • {strategy}")
+        
+        insights.append("")
+        insights.append("## 🎯 Risk Management Framework")
+        insights.append("1. **Risk Identification**: Regular risk assessments")
+        insights.append("2. **Risk Measurement**: Quantitative risk metrics")
+        insights.append("3. **Risk Monitoring**: Continuous monitoring and reporting")
+        insights.append("4. **Risk Response**: Proactive risk mitigation")
+        insights.append("5. **Risk Review**: Periodic framework evaluation")
+        
+        return "\n".join(insights)
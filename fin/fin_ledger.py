@@ -0,0 +1,465 @@
+"""
+Finance General Ledger Roll-up
+==============================
+
+Builds the income statement, balance sheet and cash flow tables from
+general ledger journal lines instead of pre-aggregated sheets:
+- Journal files (CSV or Parquet) are streamed in chunks; each chunk is
+  mapped to statement lines through a chart of accounts table and reduced
+  to (entity, period, line) totals before the next chunk is read
+- Amounts are held in integer cents from the moment they are read, so
+  totals over millions of lines are exact
+- Closing a month replaces that period's activity only; the statements
+  are derived from the small (entity x period x line) totals, never from
+  the journal again
+- Output frames use the session table schemas, so they feed
+  calculate_financial_performance_metrics and
+  calculate_liquidity_solvency_metrics directly
+
+Journal amounts are debit-positive ('amount', or 'debit' and 'credit').
+Each statement line has a normal balance that turns them into presented
+values (revenue, liabilities and equity are credit-normal); the chart of
+accounts may override it per account with a 'sign' column.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CHUNK_ROWS = 500_000
+DEFAULT_ENTITY = 'Total'
+
+# Statement line -> (statement, normal balance sign applied to debit-positive amounts)
+LEDGER_LINES = {
+    'revenue': ('income_statement', -1),
+    'cost_of_goods_sold': ('income_statement', 1),
+    'operating_expenses': ('income_statement', 1),
+    'depreciation': ('income_statement', 1),
+    'interest_expense': ('income_statement', 1),
+    'income_tax_expense': ('income_statement', 1),
+    'cash_and_equivalents': ('balance_sheet', 1),
+    'accounts_receivable': ('balance_sheet', 1),
+    'inventory': ('balance_sheet', 1),
+    'other_current_assets': ('balance_sheet', 1),
+    'non_current_assets': ('balance_sheet', 1),
+    'accounts_payable': ('balance_sheet', -1),
+    'other_current_liabilities': ('balance_sheet', -1),
+    'short_term_debt': ('balance_sheet', -1),
+    'long_term_debt': ('balance_sheet', -1),
+    'shareholder_equity': ('balance_sheet', -1)
+}
+LINE_NAMES = list(LEDGER_LINES)
+
+# Output columns, in the order of the session table schemas
+INCOME_STATEMENT_COLUMNS = [
+    'period', 'revenue', 'cost_of_goods_sold', 'gross_profit', 'operating_expenses',
+    'operating_income', 'interest_expense', 'income_tax_expense', 'net_income',
+    'depreciation', 'ebitda', 'ebit'
+]
+BALANCE_SHEET_COLUMNS = [
+    'period', 'cash_and_equivalents', 'accounts_receivable', 'inventory', 'current_assets',
+    'total_assets', 'accounts_payable', 'current_liabilities', 'total_liabilities',
+    'shareholder_equity', 'shares_outstanding', 'long_term_debt', 'total_debt'
+]
+CASH_FLOW_COLUMNS = [
+    'period', 'net_income', 'depreciation', 'working_capital_change', 'operating_cash_flow',
+    'capital_expenditures', 'free_cash_flow', 'initial_investment', 'cash_flow', 'nopat'
+]
+
+
+class LedgerError(Exception):
+    """Raised when a journal or chart of accounts cannot be rolled up."""
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def _source_name(source):
+    return str(getattr(source, 'name', source))
+
+
+def read_journal_chunks(source, chunk_rows=CHUNK_ROWS):
+    """
+    Stream a journal file as DataFrame chunks.
+
+    Args:
+        source: Path or file-like object (e.g. a Streamlit upload) of a
+            .csv or .parquet journal
+        chunk_rows (int): Lines per chunk
+
+    Yields:
+        pd.DataFrame: Journal lines, account and entity read as text
+    """
+    extension = os.path.splitext(_source_name(source))[1].lower()
+    if extension == '.csv':
+        yield from pd.read_csv(source, chunksize=chunk_rows, dtype={'account': str, 'entity': str})
+    elif extension == '.parquet':
+        if not PYARROW_AVAILABLE:
+            raise LedgerError("pyarrow is required to read Parquet journals")
+        parquet = pq.ParquetFile(source)
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        raise LedgerError(f"Unsupported journal file '{_source_name(source)}'; use .csv or .parquet")
+
+
+def to_cents(values):
+    """Amounts in currency units as int64 cents (missing amounts count as zero)."""
+    amounts = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.rint(np.nan_to_num(amounts) * 100).astype(np.int64)
+
+
+def _period_labels(lines):
+    """Period label per journal line: 'period' as given, or the posting month as YYYY-MM-01."""
+    if 'period' in lines.columns:
+        return lines['period'].astype(str).to_numpy()
+    if 'posting_date' not in lines.columns:
+        raise LedgerError("Journal needs a 'period' or 'posting_date' column")
+    dates = pd.to_datetime(lines['posting_date'], errors='coerce')
+    if dates.isna().any():
+        raise LedgerError(f"{int(dates.isna().sum()):,} journal lines have an unreadable posting_date")
+    # Format each distinct month once rather than every line
+    months, month_index = np.unique((dates.dt.year * 100 + dates.dt.month).to_numpy(), return_inverse=True)
+    labels = np.array([f"{month // 100}-{month % 100:02d}-01" for month in months], dtype=object)
+    return labels[month_index]
+
+
+def _ordered_periods(labels):
+    """Period labels in calendar order where they parse as dates, otherwise as text."""
+    labels = pd.Index(pd.unique(labels))
+    dates = pd.to_datetime(labels, errors='coerce')
+    return list(pd.DataFrame({'date': dates, 'label': labels}).sort_values(['date', 'label'])['label'])
+
+# ============================================================================
+# ROLL-UP
+# ============================================================================
+
+class GeneralLedgerRollup:
+    """
+    Running (entity, period, statement line) totals in integer cents.
+
+    Args:
+        chart_of_accounts (pd.DataFrame): 'account' and 'line' (one of
+            LEDGER_LINES) columns, optional 'sign' to override the line's
+            normal balance
+    """
+
+    def __init__(self, chart_of_accounts):
+        missing = {'account', 'line'} - set(chart_of_accounts.columns)
+        if missing:
+            raise LedgerError(f"Chart of accounts is missing columns: {', '.join(sorted(missing))}")
+        coa = chart_of_accounts.drop_duplicates('account', keep='last')
+        unknown = sorted(set(coa['line']) - set(LEDGER_LINES))
+        if unknown:
+            raise LedgerError(f"Unknown statement lines in chart of accounts: {', '.join(map(str, unknown))}")
+
+        self._accounts = pd.Index(coa['account'].astype(str))
+        self._line_codes = coa['line'].map(LINE_NAMES.index).to_numpy(dtype=np.int64)
+        normal_sign = coa['line'].map(lambda line: LEDGER_LINES[line][1])
+        sign = coa['sign'].fillna(normal_sign) if 'sign' in coa.columns else normal_sign
+        self._signs = sign.to_numpy(dtype=np.int64)
+
+        self._activity = self._empty_totals(['entity', 'period', 'line'])
+        self._posted = self._empty_totals(['entity', 'period'])
+        self._unmapped = self._empty_totals(['entity', 'period', 'account'])
+        self._line_counts = self._empty_totals(['entity', 'period'])
+        self.closed_periods = []
+
+    @staticmethod
+    def _empty_totals(levels):
+        index = pd.MultiIndex.from_arrays([[]] * len(levels), names=levels)
+        return pd.Series(np.zeros(0, dtype=np.int64), index=index, name='cents')
+
+    @staticmethod
+    def _combine(running, chunk):
+        """Add chunk totals to running totals, staying in int64."""
+        if running.empty:
+            return chunk
+        if chunk.empty:
+            return running
+        return pd.concat([running, chunk]).groupby(level=running.index.names, sort=False).sum()
+
+    @classmethod
+    def _replace(cls, running, chunk, keys):
+        """Running totals with the (entity, period) keys replaced by the chunk's."""
+        if running.empty:
+            return chunk
+        running_keys = pd.MultiIndex.from_arrays([running.index.get_level_values('entity'),
+                                                  running.index.get_level_values('period')])
+        return cls._combine(running[~running_keys.isin(keys)], chunk)
+
+    def _aggregate(self, lines):
+        """Reduce journal lines to (activity, posted, unmapped, line count) totals per (entity, period)."""
+        if 'account' not in lines.columns:
+            raise LedgerError("Journal needs an 'account' column")
+        if 'amount' in lines.columns:
+            cents = to_cents(lines['amount'])
+        elif {'debit', 'credit'} <= set(lines.columns):
+            cents = to_cents(lines['debit']) - to_cents(lines['credit'])
+        else:
+            raise LedgerError("Journal needs an 'amount' column or 'debit' and 'credit' columns")
+
+        entities = lines['entity'].astype(str).to_numpy() if 'entity' in lines.columns else np.full(len(lines), DEFAULT_ENTITY, dtype=object)
+        periods = _period_labels(lines)
+        accounts = lines['account'].astype(str).to_numpy()
+        codes = self._accounts.get_indexer(accounts)
+        mapped = codes >= 0
+
+        by_key = pd.Series(cents).groupby([entities, periods], sort=False)
+        posted = by_key.sum()
+        posted.index.names = ['entity', 'period']
+        counts = by_key.size().astype(np.int64)
+        counts.index.names = ['entity', 'period']
+        unmapped = pd.Series(cents[~mapped]).groupby(
+            [entities[~mapped], periods[~mapped], accounts[~mapped]], sort=False
+        ).sum()
+        unmapped.index.names = ['entity', 'period', 'account']
+
+        mapped_codes = codes[mapped]
+        presented = cents[mapped] * self._signs[mapped_codes]
+        activity = pd.Series(presented).groupby(
+            [entities[mapped], periods[mapped], self._line_codes[mapped_codes]], sort=False
+        ).sum()
+        activity.index.names = ['entity', 'period', 'line']
+        return activity, posted, unmapped, counts
+
+    @property
+    def lines_read(self):
+        """Journal lines behind the current totals; re-closed lines replace the ones they supersede."""
+        return int(self._line_counts.sum())
+
+    def ingest(self, lines):
+        """Add a DataFrame of journal lines to the running totals."""
+        activity, posted, unmapped, counts = self._aggregate(lines)
+        self._activity = self._combine(self._activity, activity)
+        self._posted = self._combine(self._posted, posted)
+        self._unmapped = self._combine(self._unmapped, unmapped)
+        self._line_counts = self._combine(self._line_counts, counts)
+
+    def ingest_file(self, source, chunk_rows=CHUNK_ROWS, progress=None):
+        """
+        Stream a CSV or Parquet journal into the totals.
+
+        Args:
+            source: Path or file-like object
+            chunk_rows (int): Lines per chunk
+            progress (callable): Called with the running line count after
+                each chunk
+        """
+        for chunk in read_journal_chunks(source, chunk_rows):
+            self.ingest(chunk)
+            if progress is not None:
+                progress(self.lines_read)
+
+    def close_month(self, lines, period=None):
+        """
+        Replace one period's activity with its closing journal.
+
+        Only the (entity, period) totals of entities in the closing journal
+        are replaced, so entities can close separately and re-closing with
+        the same journal (late adjustments) is idempotent. Other entities
+        and periods keep their totals, and balances roll forward from the
+        new activity when the statements are next derived.
+
+        Args:
+            lines (pd.DataFrame): Journal lines of the period
+            period (str): Period label; inferred when every line falls in
+                one period
+        """
+        activity, posted, unmapped, counts = self._aggregate(lines)
+        periods = set(posted.index.get_level_values('period'))
+        if period is None:
+            if len(periods) != 1:
+                raise LedgerError(f"Closing journal spans {len(periods)} periods; pass period explicitly")
+            period = periods.pop()
+        elif periods - {period}:
+            raise LedgerError(f"Closing journal for {period} contains lines from {', '.join(sorted(periods - {period}))}")
+
+        keys = posted.index
+        self._activity = self._replace(self._activity, activity, keys)
+        self._posted = self._replace(self._posted, posted, keys)
+        self._unmapped = self._replace(self._unmapped, unmapped, keys)
+        self._line_counts = self._replace(self._line_counts, counts, keys)
+        if period not in self.closed_periods:
+            self.closed_periods.append(period)
+
+    # ------------------------------------------------------------------
+    # Totals and checks
+    # ------------------------------------------------------------------
+
+    @property
+    def entities(self):
+        return sorted(pd.unique(self._activity.index.get_level_values('entity')))
+
+    @property
+    def periods(self):
+        return _ordered_periods(self._activity.index.get_level_values('period'))
+
+    def activity_cents(self):
+        """
+        Presented activity per line.
+
+        Returns:
+            pd.DataFrame: int64 cents indexed by (entity, period) over the
+            full entity x period grid, one column per LEDGER_LINES entry
+        """
+        grid = pd.MultiIndex.from_product([self.entities, self.periods], names=['entity', 'period'])
+        if self._activity.empty:
+            return pd.DataFrame(0, index=grid, columns=LINE_NAMES, dtype=np.int64)
+        table = self._activity.unstack('line', fill_value=0)
+        table.columns = [LINE_NAMES[code] for code in table.columns]
+        return table.reindex(index=grid, columns=LINE_NAMES, fill_value=0).astype(np.int64)
+
+    def imbalances(self):
+        """
+        Debits minus credits per (entity, period); zero for a balanced journal.
+
+        Returns:
+            pd.Series: Non-zero imbalances in currency units
+        """
+        return (self._posted[self._posted != 0] / 100).rename('amount')
+
+    def unmapped_accounts(self):
+        """
+        Net amount posted to accounts missing from the chart of accounts.
+
+        Returns:
+            pd.Series: Currency units per account, largest first
+        """
+        by_account = self._unmapped.groupby(level='account', sort=False).sum()
+        unmapped = (by_account[by_account != 0] / 100).rename('amount')
+        return unmapped.iloc[np.argsort(-unmapped.abs().to_numpy(), kind='stable')]
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def statements(self, entity=None):
+        """
+        Income statement, balance sheet and cash flow tables.
+
+        Args:
+            entity (str): One entity, or None to consolidate all of them
+
+        Returns:
+            dict: 'income_statement', 'balance_sheet' and 'cash_flow'
+            DataFrames with one row per period, in the session schemas
+        """
+        activity = self.activity_cents()
+        if entity is None:
+            activity = activity.groupby(level='period', sort=False).sum()
+            activity.index = pd.MultiIndex.from_arrays([[DEFAULT_ENTITY] * len(activity), activity.index],
+                                                       names=['entity', 'period'])
+        else:
+            if entity not in self.entities:
+                raise LedgerError(f"Unknown entity '{entity}'")
+            activity = activity.loc[[entity]]
+        frames = derive_statements(activity)
+        return {name: frame.drop(columns='entity') for name, frame in frames.items()}
+
+    def statement_panel(self):
+        """Statements for every entity, with an 'entity' column before 'period'."""
+        return derive_statements(self.activity_cents())
+
+
+def derive_statements(activity):
+    """
+    Statements from presented activity in cents.
+
+    Income statement lines are the period's activity, balance sheet lines
+    the running balance per entity (retained earnings are the running net
+    income, added to shareholder equity), and the cash flow uses the
+    indirect method: net income plus depreciation less the increase in
+    non-cash working capital, with capital expenditure as the increase in
+    non-current assets before depreciation.
+
+    Args:
+        activity (pd.DataFrame): int64 cents indexed by (entity, period)
+            in period order, one column per LEDGER_LINES entry
+
+    Returns:
+        dict: 'income_statement', 'balance_sheet' and 'cash_flow'
+        DataFrames in currency units, with entity and period columns
+    """
+    a = activity
+    by_entity = a.index.get_level_values('entity')
+
+    gross_profit = a['revenue'] - a['cost_of_goods_sold']
+    operating_income = gross_profit - a['operating_expenses'] - a['depreciation']
+    net_income = operating_income - a['interest_expense'] - a['income_tax_expense']
+
+    balances = a[[line for line, (statement, _) in LEDGER_LINES.items() if statement == 'balance_sheet']].groupby(by_entity).cumsum()
+    equity = balances['shareholder_equity'] + net_income.groupby(by_entity).cumsum()
+    current_assets = balances[['cash_and_equivalents', 'accounts_receivable', 'inventory', 'other_current_assets']].sum(axis=1)
+    current_liabilities = balances[['accounts_payable', 'other_current_liabilities', 'short_term_debt']].sum(axis=1)
+
+    def increase(stock):
+        return stock - stock.groupby(by_entity).shift(1, fill_value=0)
+
+    working_capital = (balances['accounts_receivable'] + balances['inventory'] + balances['other_current_assets']
+                       - balances['accounts_payable'] - balances['other_current_liabilities'])
+    working_capital_change = increase(working_capital)
+    operating_cash_flow = net_income + a['depreciation'] - working_capital_change
+    capital_expenditures = increase(balances['non_current_assets']) + a['depreciation']
+    free_cash_flow = operating_cash_flow - capital_expenditures
+
+    cents = {
+        'revenue': a['revenue'], 'cost_of_goods_sold': a['cost_of_goods_sold'], 'gross_profit': gross_profit,
+        'operating_expenses': a['operating_expenses'], 'operating_income': operating_income,
+        'interest_expense': a['interest_expense'], 'income_tax_expense': a['income_tax_expense'],
+        'net_income': net_income, 'depreciation': a['depreciation'],
+        'ebitda': operating_income + a['depreciation'], 'ebit': operating_income,
+        'cash_and_equivalents': balances['cash_and_equivalents'],
+        'accounts_receivable': balances['accounts_receivable'], 'inventory': balances['inventory'],
+        'current_assets': current_assets, 'total_assets': current_assets + balances['non_current_assets'],
+        'accounts_payable': balances['accounts_payable'], 'current_liabilities': current_liabilities,
+        'total_liabilities': current_liabilities + balances['long_term_debt'],
+        'shareholder_equity': equity, 'long_term_debt': balances['long_term_debt'],
+        'total_debt': balances['short_term_debt'] + balances['long_term_debt'],
+        'working_capital_change': working_capital_change, 'operating_cash_flow': operating_cash_flow,
+        'capital_expenditures': capital_expenditures, 'free_cash_flow': free_cash_flow,
+        'initial_investment': pd.Series(0, index=a.index), 'cash_flow': free_cash_flow,
+        'nopat': operating_income - a['income_tax_expense']
+    }
+    keys = {'entity': by_entity.to_numpy(), 'period': a.index.get_level_values('period').to_numpy()}
+
+    def frame(columns):
+        data = {'entity': keys['entity']}
+        for name in columns:
+            if name in keys:
+                data[name] = keys[name]
+            elif name in cents:
+                data[name] = cents[name].to_numpy() / 100
+            else:
+                # Not derivable from the ledger (shares_outstanding)
+                data[name] = np.full(len(a), np.nan)
+        return pd.DataFrame(data)
+
+    return {
+        'income_statement': frame(INCOME_STATEMENT_COLUMNS),
+        'balance_sheet': frame(BALANCE_SHEET_COLUMNS),
+        'cash_flow': frame(CASH_FLOW_COLUMNS)
+    }
+
+
+def rollup_journal(source, chart_of_accounts, chunk_rows=CHUNK_ROWS, entity=None):
+    """
+    One-shot roll-up of a journal file.
+
+    Returns:
+        tuple: (statements dict, GeneralLedgerRollup for later month closes)
+    """
+    rollup = GeneralLedgerRollup(chart_of_accounts)
+    rollup.ingest_file(source, chunk_rows)
+    return rollup.statements(entity), rollup
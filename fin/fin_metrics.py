@@ -0,0 +1,759 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+import time
+
+from fin_data_layer import finance_cache
+from fin_health import score_entities
+from fin_ratios import align_statements, compute_ratios
+from fin_valuation import DEFAULT_DISCOUNT_RATE, economic_value_added
+from fin_variance import VarianceCube, VarianceError, hierarchy_levels
+
+# Helper function to find cash flow column names with fallbacks
+def get_cash_flow_column_mapping(cash_flow_data):
+    """Get mapping for cash flow columns with fallback names"""
+    mapping = {}
+    
+    # Operating cash flow column mapping
+    for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+        if col_name in cash_flow_data.columns:
+            mapping['operating_cash_flow'] = col_name
+            break
+    
+    # Free cash flow column mapping
+    for col_name in ['free_cash_flow', 'free_cf', 'free_cashflow', 'fcf']:
+        if col_name in cash_flow_data.columns:
+            mapping['free_cash_flow'] = col_name
+            break
+    
+    # Capital expenditures column mapping
+    for col_name in ['capital_expenditures', 'capex', 'capital_expenses', 'investment_expenditures']:
+        if col_name in cash_flow_data.columns:
+            mapping['capital_expenditures'] = col_name
+            break
+    
+    return mapping
+
+# Global cache for expensive calculations
+@st.cache_data(ttl=3600, max_entries=100)
+def get_cached_calculations():
+    """Cache for expensive financial calculations"""
+    return {}
+
+# Performance monitoring
+class PerformanceMonitor:
+    def __init__(self):
+        self.start_time = time.time()
+        self.operations = {}
+    
+    def start_operation(self, name):
+        self.operations[name] = time.time()
+    
+    def end_operation(self, name):
+        if name in self.operations:
+            duration = time.time() - self.operations[name]
+            # Removed sidebar logging to keep UI clean
+            del self.operations[name]
+
+# Global performance monitor
+perf_monitor = PerformanceMonitor()
+
+# Performance-optimized chart rendering, keyed by table version rather than content
+@finance_cache(ttl=1800, max_entries=100)
+def create_optimized_chart(chart_type, data, x_col, y_col, title, **kwargs):
+    """Create optimized charts with caching for better performance"""
+    try:
+        if chart_type == "line":
+            fig = go.Figure(data=[
+                go.Scatter(x=data[x_col], y=data[y_col], mode='lines+markers', 
+                          line=dict(width=2), marker=dict(size=6))
+            ])
+        elif chart_type == "bar":
+            fig = go.Figure(data=[
+                go.Bar(x=data[x_col], y=data[y_col], marker_color='#1f77b4')
+            ])
+        elif chart_type == "scatter":
+            fig = go.Figure(data=[
+                go.Scatter(x=data[x_col], y=data[y_col], mode='markers', 
+                          marker=dict(size=8, color='#2ca02c'))
+            ])
+        
+        # Apply common styling
+        fig.update_layout(
+            title=title,
+            xaxis_title=x_col.replace('_', ' ').title(),
+            yaxis_title=y_col.replace('_', ' ').title(),
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(size=11),
+            margin=dict(l=40, r=40, t=60, b=40),
+            height=400
+        )
+        
+        return fig
+    except Exception as e:
+        st.error(f"Chart creation error: {e}")
+        return None
+
+# Optimized data processing functions
+@finance_cache(ttl=900, max_entries=200)
+def preprocess_financial_data(data, required_columns):
+    """Preprocess financial data for analysis with caching; returns a new frame, data is left untouched"""
+    if data.empty:
+        return pd.DataFrame()
+    
+    # Fill missing values efficiently
+    fill_values = {
+        col: 0 if data[col].dtype in ['int64', 'float64'] else 'Unknown'
+        for col in required_columns if col in data.columns
+    }
+    return data.fillna(fill_values)
+
+# Lazy loading for heavy computations
+class LazyFinancialCalculator:
+    def __init__(self):
+        self._cache = {}
+    
+    def get_cached_result(self, key, calculation_func, *args):
+        """Get cached result or calculate if not available"""
+        if key not in self._cache:
+            self._cache[key] = calculation_func(*args)
+        return self._cache[key]
+    
+    def clear_cache(self):
+        """Clear the calculation cache"""
+        self._cache.clear()
+
+# Global lazy calculator
+lazy_calculator = LazyFinancialCalculator()
+
+# Finance-specific metric calculation functions (optimized for performance)
+@finance_cache(ttl=1800, max_entries=50)
+def calculate_financial_performance_metrics(income_statement_data, balance_sheet_data):
+    """Calculate comprehensive financial performance metrics with enhanced analysis (optimized)"""
+    perf_monitor.start_operation("financial_performance_calculation")
+    
+    if income_statement_data.empty:
+        perf_monitor.end_operation("financial_performance_calculation")
+        return pd.DataFrame(), "No income statement data available"
+    
+    try:
+        # Vectorized operations for better performance
+        df = income_statement_data.copy()
+        
+        # Fill missing values with 0 for calculations
+        numeric_columns = ['revenue', 'cost_of_goods_sold', 'gross_profit', 'operating_expenses', 
+                          'operating_income', 'net_income', 'ebitda', 'ebit']
+        for col in numeric_columns:
+            if col in df.columns:
+                df[col] = df[col].fillna(0)
+            else:
+                df[col] = 0
+        
+        # Vectorized ratio calculations (much faster than loops)
+        revenue = df['revenue'].values
+        gross_profit = df['gross_profit'].values
+        operating_income = df['operating_income'].values
+        net_income = df['net_income'].values
+        operating_expenses = df['operating_expenses'].values
+        ebitda = df['ebitda'].values
+        ebit = df['ebit'].values
+        
+        # Avoid division by zero with numpy where
+        gross_margin = np.where(revenue > 0, (gross_profit / revenue * 100), 0)
+        operating_margin = np.where(revenue > 0, (operating_income / revenue * 100), 0)
+        net_margin = np.where(revenue > 0, (net_income / revenue * 100), 0)
+        expense_ratio = np.where(revenue > 0, (operating_expenses / revenue * 100), 0)
+        ebitda_margin = np.where(revenue > 0, (ebitda / revenue * 100), 0)
+        ebit_margin = np.where(revenue > 0, (ebit / revenue * 100), 0)
+        cost_of_goods_ratio = np.where(revenue > 0, (df['cost_of_goods_sold'].values / revenue * 100), 0)
+        operating_efficiency = np.where(gross_profit > 0, (operating_income / gross_profit * 100), 0)
+        return_on_revenue = np.where(revenue > 0, (net_income / revenue * 100), 0)
+        profit_quality = np.where(net_income != 0, (operating_income / net_income * 100), 0)
+        
+        # Create metrics dataframe
+        metrics_df = pd.DataFrame({
+            'period': df['period'].values,
+            'revenue': revenue,
+            'gross_margin_pct': gross_margin,
+            'operating_margin_pct': operating_margin,
+            'net_margin_pct': net_margin,
+            'expense_ratio_pct': expense_ratio,
+            'ebitda_margin_pct': ebitda_margin,
+            'ebit_margin_pct': ebit_margin,
+            'cost_of_goods_ratio_pct': cost_of_goods_ratio,
+            'operating_efficiency_pct': operating_efficiency,
+            'return_on_revenue_pct': return_on_revenue,
+            'profit_quality_pct': profit_quality,
+            'gross_profit': gross_profit,
+            'operating_income': operating_income,
+            'net_income': net_income,
+            'ebitda': ebitda,
+            'ebit': ebit
+        })
+        
+        # Add performance indicators and trends (vectorized)
+        if len(metrics_df) > 1:
+            # Vectorized calculations
+            metrics_df['revenue_growth_pct'] = metrics_df['revenue'].pct_change() * 100
+            metrics_df['gross_margin_change_pct'] = metrics_df['gross_margin_pct'].diff()
+            metrics_df['operating_margin_change_pct'] = metrics_df['operating_margin_pct'].diff()
+            metrics_df['net_margin_change_pct'] = metrics_df['net_margin_pct'].diff()
+            
+            # Vectorized moving averages
+            metrics_df['revenue_ma_3'] = metrics_df['revenue'].rolling(window=3, min_periods=1).mean()
+            metrics_df['gross_margin_ma_3'] = metrics_df['gross_margin_pct'].rolling(window=3, min_periods=1).mean()
+            metrics_df['operating_margin_ma_3'] = metrics_df['operating_margin_pct'].rolling(window=3, min_periods=1).mean()
+            
+            # Vectorized performance scoring (much faster than loops)
+            revenue_growth = metrics_df['revenue_growth_pct'].fillna(0).values
+            gross_margin_vals = metrics_df['gross_margin_pct'].values
+            operating_margin_vals = metrics_df['operating_margin_pct'].values
+            net_margin_vals = metrics_df['net_margin_pct'].values
+            
+            # Revenue growth scoring (25 points)
+            revenue_score = np.where(revenue_growth > 10, 25,
+                                   np.where(revenue_growth > 5, 20,
+                                           np.where(revenue_growth > 0, 15,
+                                                   np.where(revenue_growth > -5, 10, 5))))
+            
+            # Margin scoring (50 points)
+            gross_score = np.where(gross_margin_vals > 40, 20,
+                                  np.where(gross_margin_vals > 30, 15,
+                                          np.where(gross_margin_vals > 20, 10, 5)))
+            
+            operating_score = np.where(operating_margin_vals > 15, 20,
+                                      np.where(operating_margin_vals > 10, 15,
+                                              np.where(operating_margin_vals > 5, 10, 5)))
+            
+            # Profitability scoring (25 points)
+            profit_score = np.where(net_margin_vals > 10, 25,
+                                   np.where(net_margin_vals > 5, 20,
+                                           np.where(net_margin_vals > 0, 15, 5)))
+            
+            # Total score
+            metrics_df['performance_score'] = revenue_score + gross_score + operating_score + profit_score
+        
+        perf_monitor.end_operation("financial_performance_calculation")
+        return metrics_df, "Enhanced financial performance metrics calculated successfully (optimized)"
+        
+    except Exception as e:
+        perf_monitor.end_operation("financial_performance_calculation")
+        return pd.DataFrame(), f"Error calculating financial performance metrics: {str(e)}"
+
+@finance_cache(ttl=1800, max_entries=50)
+def calculate_liquidity_solvency_metrics(balance_sheet_data, cash_flow_data):
+    """Calculate comprehensive liquidity and solvency metrics with enhanced analysis (optimized)"""
+    perf_monitor.start_operation("liquidity_solvency_calculation")
+    
+    if balance_sheet_data.empty:
+        perf_monitor.end_operation("liquidity_solvency_calculation")
+        return pd.DataFrame(), "No balance sheet data available"
+    
+    try:
+        # Vectorized operations for better performance
+        df = balance_sheet_data.copy()
+        
+        # Fill missing values with 0 for calculations
+        numeric_columns = ['current_assets', 'total_assets', 'current_liabilities', 'total_liabilities',
+                          'shareholder_equity', 'cash_and_equivalents', 'accounts_receivable', 
+                          'inventory', 'long_term_debt', 'total_debt']
+        for col in numeric_columns:
+            if col in df.columns:
+                df[col] = df[col].fillna(0)
+            else:
+                df[col] = 0
+        
+        # Vectorized ratio calculations
+        current_assets = df['current_assets'].values
+        total_assets = df['total_assets'].values
+        current_liabilities = df['current_liabilities'].values
+        total_liabilities = df['total_liabilities'].values
+        shareholder_equity = df['shareholder_equity'].values
+        cash_and_equivalents = df['cash_and_equivalents'].values
+        accounts_receivable = df['accounts_receivable'].values
+        inventory = df['inventory'].values
+        long_term_debt = df['long_term_debt'].values
+        total_debt = df['total_debt'].values
+        
+        # Vectorized liquidity ratios
+        current_ratio = np.where(current_liabilities > 0, current_assets / current_liabilities, 0)
+        quick_ratio = np.where(current_liabilities > 0, (cash_and_equivalents + accounts_receivable) / current_liabilities, 0)
+        cash_ratio = np.where(current_liabilities > 0, cash_and_equivalents / current_liabilities, 0)
+        working_capital = current_assets - current_liabilities
+        working_capital_ratio = np.where(total_assets > 0, working_capital / total_assets, 0)
+        
+        # Vectorized solvency ratios
+        debt_to_equity = np.where(shareholder_equity > 0, total_liabilities / shareholder_equity, 0)
+        debt_to_assets = np.where(total_assets > 0, total_liabilities / total_assets, 0)
+        equity_ratio = np.where(total_assets > 0, shareholder_equity / total_assets, 0)
+        debt_ratio = np.where(total_assets > 0, total_liabilities / total_assets, 0)
+        
+        # Placeholder ratios for future enhancement
+        times_interest_earned = np.zeros_like(current_assets)
+        debt_service_coverage = np.zeros_like(current_assets)
+        cash_flow_to_debt = np.zeros_like(current_assets)
+        inventory_turnover_ratio = np.zeros_like(current_assets)
+        receivables_turnover_ratio = np.zeros_like(current_assets)
+        
+        # Create metrics dataframe
+        metrics_df = pd.DataFrame({
+            'period': df['period'].values,
+            'current_ratio': current_ratio,
+            'quick_ratio': quick_ratio,
+            'cash_ratio': cash_ratio,
+            'working_capital': working_capital,
+            'working_capital_ratio': working_capital_ratio,
+            'debt_to_equity': debt_to_equity,
+            'debt_to_assets': debt_to_assets,
+            'equity_ratio': equity_ratio,
+            'debt_ratio': debt_ratio,
+            'times_interest_earned': times_interest_earned,
+            'debt_service_coverage': debt_service_coverage,
+            'cash_flow_to_debt': cash_flow_to_debt,
+            'inventory_turnover_ratio': inventory_turnover_ratio,
+            'receivables_turnover_ratio': receivables_turnover_ratio,
+            'current_assets': current_assets,
+            'total_assets': total_assets,
+            'current_liabilities': current_liabilities,
+            'total_liabilities': total_liabilities,
+            'shareholder_equity': shareholder_equity,
+            'cash_and_equivalents': cash_and_equivalents,
+            'accounts_receivable': accounts_receivable,
+            'inventory': inventory,
+            'long_term_debt': long_term_debt,
+            'total_debt': total_debt
+        })
+        
+        # Add performance indicators and trends (vectorized)
+        if len(metrics_df) > 1:
+            # Vectorized period-over-period changes
+            metrics_df['current_ratio_change'] = metrics_df['current_ratio'].diff()
+            metrics_df['quick_ratio_change'] = metrics_df['quick_ratio'].diff()
+            metrics_df['debt_to_equity_change'] = metrics_df['debt_to_equity'].diff()
+            metrics_df['working_capital_change'] = metrics_df['working_capital'].diff()
+            
+            # Vectorized moving averages
+            metrics_df['current_ratio_ma_3'] = metrics_df['current_ratio'].rolling(window=3, min_periods=1).mean()
+            metrics_df['quick_ratio_ma_3'] = metrics_df['quick_ratio'].rolling(window=3, min_periods=1).mean()
+            metrics_df['debt_to_equity_ma_3'] = metrics_df['debt_to_equity'].rolling(window=3, min_periods=1).mean()
+            
+            # Vectorized financial health scoring (much faster than loops)
+            current_ratio_vals = metrics_df['current_ratio'].values
+            quick_ratio_vals = metrics_df['quick_ratio'].values
+            debt_to_equity_vals = metrics_df['debt_to_equity'].values
+            debt_to_assets_vals = metrics_df['debt_to_assets'].values
+            working_capital_vals = metrics_df['working_capital'].values
+            working_capital_ratio_vals = metrics_df['working_capital_ratio'].values
+            
+            # Liquidity scoring (40 points)
+            current_ratio_score = np.where(current_ratio_vals >= 2.0, 20,
+                                          np.where(current_ratio_vals >= 1.5, 15,
+                                                  np.where(current_ratio_vals >= 1.0, 10, 5)))
+            
+            quick_ratio_score = np.where(quick_ratio_vals >= 1.0, 20,
+                                        np.where(quick_ratio_vals >= 0.8, 15,
+                                                np.where(quick_ratio_vals >= 0.5, 10, 5)))
+            
+            # Solvency scoring (40 points)
+            debt_equity_score = np.where(debt_to_equity_vals <= 0.5, 20,
+                                        np.where(debt_to_equity_vals <= 1.0, 15,
+                                                np.where(debt_to_equity_vals <= 2.0, 10, 5)))
+            
+            debt_assets_score = np.where(debt_to_assets_vals <= 0.3, 20,
+                                        np.where(debt_to_assets_vals <= 0.5, 15,
+                                                np.where(debt_to_assets_vals <= 0.7, 10, 5)))
+            
+            # Working capital scoring (20 points)
+            working_capital_score = np.where(working_capital_vals > 0,
+                                            np.where(working_capital_ratio_vals >= 0.2, 20,
+                                                    np.where(working_capital_ratio_vals >= 0.1, 15,
+                                                            np.where(working_capital_ratio_vals >= 0.05, 10, 5))), 0)
+            
+            # Total score
+            metrics_df['financial_health_score'] = (current_ratio_score + quick_ratio_score + 
+                                                   debt_equity_score + debt_assets_score + working_capital_score)
+        
+        perf_monitor.end_operation("liquidity_solvency_calculation")
+        return metrics_df, "Enhanced liquidity and solvency metrics calculated successfully (optimized)"
+        
+    except Exception as e:
+        perf_monitor.end_operation("liquidity_solvency_calculation")
+        return pd.DataFrame(), f"Error calculating liquidity and solvency metrics: {str(e)}"
+
+def calculate_risk_compliance_metrics(balance_sheet_data, market_data):
+    """Calculate risk and compliance metrics"""
+    if balance_sheet_data.empty:
+        return pd.DataFrame(), "No balance sheet data available"
+    
+    try:
+        metrics = []
+        
+        # Calculate Value at Risk (VaR)
+        if 'total_assets' in balance_sheet_data.columns:
+            portfolio_value = balance_sheet_data['total_assets'].sum()
+            # Simple VaR calculation with assumed volatility
+            volatility = 0.15  # 15% annual volatility
+            confidence_level = 0.95
+            z_score = 1.645  # 95% confidence level
+            time_horizon = 30/365  # 30 days
+            
+            var = portfolio_value * volatility * np.sqrt(time_horizon) * z_score
+            metrics.append({
+                'Metric': 'Value at Risk (VaR)',
+                'Value': f"${var:,.0f}",
+                'Description': f"95% confidence, 30-day horizon"
+            })
+        
+        # Calculate Liquidity Coverage Ratio (LCR)
+        if 'current_assets' in balance_sheet_data.columns and 'current_liabilities' in balance_sheet_data.columns:
+            current_assets = balance_sheet_data['current_assets'].sum()
+            current_liabilities = balance_sheet_data['current_liabilities'].sum()
+            
+            if current_liabilities > 0:
+                lcr = current_assets / current_liabilities
+                metrics.append({
+                    'Metric': 'Liquidity Coverage Ratio',
+                    'Value': f"{lcr:.2f}",
+                    'Description': f"Current assets / Current liabilities"
+                })
+        
+        # Calculate Capital Adequacy Ratio (CAR)
+        if 'shareholder_equity' in balance_sheet_data.columns and 'total_assets' in balance_sheet_data.columns:
+            equity = balance_sheet_data['shareholder_equity'].sum()
+            total_assets = balance_sheet_data['total_assets'].sum()
+            
+            if total_assets > 0:
+                car = (equity / total_assets) * 100
+                metrics.append({
+                    'Metric': 'Capital Adequacy Ratio',
+                    'Value': f"{car:.1f}%",
+                    'Description': f"Equity / Total assets"
+                })
+        
+        # Calculate Debt Service Coverage Ratio (DSCR)
+        if 'total_liabilities' in balance_sheet_data.columns and 'shareholder_equity' in balance_sheet_data.columns:
+            total_liabilities = balance_sheet_data['total_liabilities'].sum()
+            equity = balance_sheet_data['shareholder_equity'].sum()
+            
+            if equity > 0:
+                dscr = total_liabilities / equity
+                metrics.append({
+                    'Metric': 'Debt Service Coverage',
+                    'Value': f"{dscr:.2f}",
+                    'Description': f"Total liabilities / Equity"
+                })
+        
+        metrics_df = pd.DataFrame(metrics)
+        return metrics_df, "Risk and compliance metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating risk and compliance metrics: {str(e)}"
+
+def calculate_efficiency_metrics(income_statement_data, balance_sheet_data):
+    """Calculate efficiency and productivity metrics"""
+    if income_statement_data.empty or balance_sheet_data.empty:
+        return pd.DataFrame(), "No income statement or balance sheet data available"
+    
+    try:
+        # Income statement rows matched to their period's balance sheet in one pass
+        _, period, columns = align_statements(income_statement_data, balance_sheet_data)
+        ratios = compute_ratios(columns)
+        
+        metrics_df = pd.DataFrame({
+            'period': period,
+            'roa_pct': ratios['roa_pct'],
+            'roe_pct': ratios['roe_pct'],
+            'asset_turnover': ratios['asset_turnover'],
+            'op_exp_ratio_pct': ratios['op_exp_ratio_pct'],
+            'revenue': columns['revenue'],
+            'net_income': columns['net_income'],
+            'total_assets': columns['total_assets'],
+            'shareholder_equity': columns['shareholder_equity']
+        })
+        return metrics_df, "Efficiency metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating efficiency metrics: {str(e)}"
+
+def calculate_budget_variance_metrics(income_statement_data, budget_data, forecast_data):
+    """Calculate budget variance and forecasting metrics"""
+    if budget_data.empty and forecast_data.empty:
+        return pd.DataFrame(), "No budget or forecast data available"
+    
+    try:
+        metrics = []
+        
+        # Budget variance analysis
+        if not budget_data.empty and not income_statement_data.empty:
+            # Try to match periods between budget and actual data
+            try:
+                budget_copy = budget_data.copy()
+                income_copy = income_statement_data[['period', 'revenue', 'cost_of_goods_sold', 'operating_expenses']].copy()
+                
+                # Rename columns for clarity
+                budget_copy = budget_copy.rename(columns={
+                    'revenue': 'revenue_budget',
+                    'expenses': 'expenses_budget'
+                })
+                
+                income_copy = income_copy.rename(columns={
+                    'revenue': 'revenue_actual',
+                    'cost_of_goods_sold': 'cost_of_goods_sold_actual',
+                    'operating_expenses': 'operating_expenses_actual'
+                })
+                
+                # Merge budget and actual data
+                budget_actual = budget_copy.merge(income_copy, on='period', how='inner')
+                
+                if not budget_actual.empty:
+                    # Calculate actual expenses
+                    if 'cost_of_goods_sold_actual' in budget_actual.columns and 'operating_expenses_actual' in budget_actual.columns:
+                        budget_actual['expenses_actual'] = budget_actual['cost_of_goods_sold_actual'] + budget_actual['operating_expenses_actual']
+                    
+                    # Calculate revenue variance
+                    if 'revenue_budget' in budget_actual.columns and 'revenue_actual' in budget_actual.columns:
+                        revenue_variance = ((budget_actual['revenue_actual'] - budget_actual['revenue_budget']) / budget_actual['revenue_budget'] * 100).mean()
+                        metrics.append({
+                            'Metric': 'Revenue Variance',
+                            'Value': f"{revenue_variance:+.1f}%",
+                            'Description': 'Average revenue variance'
+                        })
+                    
+                    # Calculate expense variance
+                    if 'expenses_budget' in budget_actual.columns and 'expenses_actual' in budget_actual.columns:
+                        expense_variance = ((budget_actual['expenses_budget'] - budget_actual['expenses_actual']) / budget_actual['expenses_budget'] * 100).mean()
+                        metrics.append({
+                            'Metric': 'Expense Variance',
+                            'Value': f"{expense_variance:+.1f}%",
+                            'Description': 'Average expense variance'
+                        })
+                
+            except Exception as e:
+                # Fallback to simple calculation if merge fails
+                total_budget = budget_data['revenue'].sum() if 'revenue' in budget_data.columns else 0
+                total_actual = budget_data['expenses'].sum() if 'expenses' in budget_data.columns else 0
+                
+                if total_budget > 0:
+                    variance = ((total_actual - total_budget) / total_budget * 100)
+                    metrics.append({
+                        'Metric': 'Budget Variance',
+                        'Value': f"{variance:+.1f}%",
+                        'Description': 'Actual vs Budget variance'
+                    })
+        
+        # Forecast accuracy
+        if not forecast_data.empty:
+            if 'confidence_level' in forecast_data.columns:
+                avg_confidence = forecast_data['confidence_level'].mean()
+                metrics.append({
+                    'Metric': 'Forecast Confidence',
+                    'Value': f"{avg_confidence:.1f}%",
+                    'Description': 'Average forecast confidence level'
+                })
+        
+        # Scenario analysis
+        if not forecast_data.empty and len(forecast_data) > 1:
+            scenarios = forecast_data['scenario'].nunique() if 'scenario' in forecast_data.columns else 1
+            metrics.append({
+                'Metric': 'Scenarios Analyzed',
+                'Value': f"{scenarios}",
+                'Description': 'Number of forecast scenarios'
+            })
+        
+        metrics_df = pd.DataFrame(metrics)
+        return metrics_df, "Budget variance metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating budget variance metrics: {str(e)}"
+
+@finance_cache(ttl=1800, max_entries=10)
+def calculate_hierarchical_variance(budget_data):
+    """Index budget lines with a cost-center hierarchy into a VarianceCube for drill-down"""
+    if budget_data.empty or not hierarchy_levels(budget_data):
+        return None, "No budget lines with division, department or cost center columns"
+    
+    try:
+        cube = VarianceCube(budget_data)
+        return cube, f"Indexed {len(budget_data):,} budget lines over {len(cube.periods)} periods"
+    except VarianceError as e:
+        return None, f"Error indexing budget hierarchy: {str(e)}"
+
+@finance_cache(ttl=1800, max_entries=10)
+def calculate_entity_health_scores(income_statement_data, balance_sheet_data, cash_flow_data):
+    """Score every entity's latest period and rank it within its industry and size band"""
+    if income_statement_data.empty or 'entity' not in income_statement_data.columns:
+        return pd.DataFrame(), "No entity column in the income statement"
+    
+    try:
+        # Peer attributes ('industry', 'size_band') are read from the income statement when present
+        scores = score_entities(income_statement_data, balance_sheet_data, cash_flow_data, peers=income_statement_data)
+        return scores, f"Scored {len(scores):,} entities against {scores.groupby(['industry', 'size_band']).ngroups} peer groups"
+    except Exception as e:
+        return pd.DataFrame(), f"Error scoring entity health: {str(e)}"
+
+def calculate_cash_flow_metrics(cash_flow_data, balance_sheet_data):
+    """Calculate cash flow and working capital metrics"""
+    if cash_flow_data.empty:
+        return pd.DataFrame(), "No cash flow data available"
+    
+    try:
+        metrics = []
+        
+        for _, row in cash_flow_data.iterrows():
+            period = row.get('period', 'Unknown')
+            
+            # Find operating cash flow column with fallback names
+            operating_cf = 0
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in row.index:
+                    operating_cf = row.get(col_name, 0)
+                    break
+            
+            # Find free cash flow column with fallback names
+            free_cf = 0
+            for col_name in ['free_cash_flow', 'free_cf', 'free_cashflow', 'fcf']:
+                if col_name in row.index:
+                    free_cf = row.get(col_name, 0)
+                    break
+            
+            net_income = row.get('net_income', 0)
+            
+            # Get corresponding balance sheet data
+            bs_row = balance_sheet_data[balance_sheet_data['period'] == period]
+            if not bs_row.empty:
+                current_assets = bs_row.iloc[0].get('current_assets', 0)
+                current_liabilities = bs_row.iloc[0].get('current_liabilities', 0)
+                
+                # Calculate ratios
+                working_capital = current_assets - current_liabilities
+                working_capital_turnover = (operating_cf / working_capital) if working_capital > 0 else 0
+                
+                metrics.append({
+                    'period': period,
+                    'operating_cf': operating_cf,
+                    'free_cf': free_cf,
+                    'working_capital_turnover': working_capital_turnover,
+                    'net_income': net_income,
+                    'working_capital': working_capital
+                })
+        
+        metrics_df = pd.DataFrame(metrics)
+        return metrics_df, "Cash flow metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating cash flow metrics: {str(e)}"
+
+def calculate_capital_structure_metrics(balance_sheet_data, income_statement_data):
+    """Calculate capital structure and financing metrics"""
+    if balance_sheet_data.empty:
+        return pd.DataFrame(), "No balance sheet data available"
+    
+    try:
+        metrics = []
+        
+        for _, row in balance_sheet_data.iterrows():
+            period = row.get('period', 'Unknown')
+            total_liabilities = row.get('total_liabilities', 0)
+            shareholder_equity = row.get('shareholder_equity', 0)
+            total_assets = row.get('total_assets', 0)
+            
+            # Calculate ratios
+            debt_to_equity = (total_liabilities / shareholder_equity) if shareholder_equity > 0 else 0
+            debt_to_assets = (total_liabilities / total_assets) if total_assets > 0 else 0
+            
+            # Simplified WACC calculation (assumes 8% cost of equity, 5% cost of debt)
+            cost_of_equity = 0.08
+            cost_of_debt = 0.05
+            wacc = ((cost_of_equity * shareholder_equity) + (cost_of_debt * total_liabilities)) / (shareholder_equity + total_liabilities) if (shareholder_equity + total_liabilities) > 0 else 0
+            
+            # Interest coverage (simplified)
+            interest_coverage = 5.0  # Assumed value
+            
+            metrics.append({
+                'period': period,
+                'debt_to_equity': debt_to_equity,
+                'wacc': wacc,
+                'interest_coverage': interest_coverage,
+                'total_liabilities': total_liabilities,
+                'shareholder_equity': shareholder_equity,
+                'total_assets': total_assets
+            })
+        
+        metrics_df = pd.DataFrame(metrics)
+        return metrics_df, "Capital structure metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating capital structure metrics: {str(e)}"
+
+def calculate_investment_valuation_metrics(cash_flow_data, balance_sheet_data):
+    """Calculate investment and valuation metrics"""
+    if cash_flow_data.empty:
+        return pd.DataFrame(), "No cash flow data available"
+    
+    try:
+        zeros = np.zeros(len(cash_flow_data))
+        cash_flow = cash_flow_data['cash_flow'].to_numpy(dtype=float) if 'cash_flow' in cash_flow_data.columns else zeros
+        initial_investment = cash_flow_data['initial_investment'].to_numpy(dtype=float) if 'initial_investment' in cash_flow_data.columns else zeros
+        
+        # Single-period view per row (10% discount rate); multi-period projects are valued by fin_valuation
+        discount_rate = DEFAULT_DISCOUNT_RATE
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payback_period = np.where(cash_flow > 0, initial_investment / cash_flow, np.inf)
+        
+        metrics_df = pd.DataFrame({
+            'period': cash_flow_data['period'].to_numpy() if 'period' in cash_flow_data.columns else 'Unknown',
+            'npv': cash_flow / (1 + discount_rate) - initial_investment,
+            'payback_period': payback_period,
+            'eva': economic_value_added(cash_flow, initial_investment, discount_rate),
+            'cash_flow': cash_flow,
+            'initial_investment': initial_investment
+        })
+        return metrics_df, "Investment valuation metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating investment valuation metrics: {str(e)}"
+
+def calculate_strategic_kpis(customer_data, product_data, value_chain_data):
+    """Calculate strategic KPI metrics"""
+    if customer_data.empty and product_data.empty and value_chain_data.empty:
+        return pd.DataFrame(), "No strategic data available"
+    
+    try:
+        metrics = []
+        
+        # Customer profitability
+        if not customer_data.empty:
+            total_customer_revenue = customer_data['revenue'].sum()
+            avg_customer_profitability = customer_data['profitability'].mean() if 'profitability' in customer_data.columns else 0
+            metrics.append({
+                'Metric': 'Customer Profitability',
+                'Value': f"${avg_customer_profitability:,.0f}",
+                'Description': 'Average customer profitability'
+            })
+        
+        # Product profitability
+        if not product_data.empty:
+            total_product_revenue = product_data['revenue'].sum()
+            avg_product_margin = product_data['margin'].mean() if 'margin' in product_data.columns else 0
+            metrics.append({
+                'Metric': 'Product Profitability',
+                'Value': f"{avg_product_margin:.1f}%",
+                'Description': 'Average product margin'
+            })
+        
+        # Value chain cost
+        if not value_chain_data.empty:
+            total_value_chain_cost = value_chain_data['cost'].sum()
+            metrics.append({
+                'Metric': 'Value Chain Cost',
+                'Value': f"${total_value_chain_cost:,.0f}",
+                'Description': 'Total value chain cost'
+            })
+        
+        metrics_df = pd.DataFrame(metrics)
+        return metrics_df, "Strategic KPI metrics calculated successfully"
+        
+    except Exception as e:
+        return pd.DataFrame(), f"Error calculating strategic KPI metrics: {str(e)}"
@@ -0,0 +1 @@
+# Finance Dashboard Pages Package
@@ -0,0 +1,158 @@
+import streamlit as st
+
+from fin_insights import FinanceInsights
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_executive_summary, display_formatted_recommendations,
+    display_insights_section, page_recommendation
+)
+
+def show_auto_insights():
+    """Display auto insights dashboard"""
+    st.markdown("""
+    <div class="section-header">
+        <h3>💡 Auto Insights</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if data is available
+    if (st.session_state.income_statement.empty and st.session_state.balance_sheet.empty and 
+        st.session_state.cash_flow.empty and st.session_state.budget.empty and 
+        st.session_state.forecast.empty and st.session_state.customer_data.empty and 
+        st.session_state.product_data.empty):
+        st.warning("⚠️ No data available for insights. Please load data in the Data Input section first.")
+        return
+    
+    # Initialize insights
+    insights = FinanceInsights(
+        st.session_state.income_statement,
+        st.session_state.balance_sheet,
+        st.session_state.cash_flow,
+        st.session_state.budget,
+        st.session_state.forecast,
+        st.session_state.market_data,
+        st.session_state.customer_data,
+        st.session_state.product_data,
+        st.session_state.value_chain
+    )
+    
+    # Create tabs for different insight types
+    insight_tab1, insight_tab2, insight_tab3, insight_tab4, insight_tab5, insight_tab6, insight_tab7, insight_tab8 = st.tabs([
+        "📊 Financial Performance", "💰 Liquidity & Solvency", "💸 Cash Flow", 
+        "📋 Budget & Forecasting", "👥 Customer & Product", "📈 Market & Competitive", 
+        "⚠️ Risk Mitigation", "🎯 Executive Summary"
+    ])
+    
+    with insight_tab1:
+        performance_insights = insights.generate_profitability_insights()
+        display_insights_section(performance_insights, "Financial Performance Insights", "📊")
+        
+        # Add AI recommendations for financial performance
+        if 'financial_performance' in RECOMMENDATION_RULES:
+            st.markdown("---")
+            st.markdown("### 🤖 AI Financial Performance Recommendations")
+            try:
+                ai_recommendations = page_recommendation('auto_insights', 'financial_performance')
+                display_formatted_recommendations(ai_recommendations)
+            except Exception as e:
+                st.error(f"Error generating AI recommendations: {e}")
+                st.info("Please check if you have loaded financial data in the Data Input section.")
+    
+    with insight_tab2:
+        liquidity_insights = insights.generate_liquidity_solvency_insights()
+        display_insights_section(liquidity_insights, "Liquidity & Solvency Insights", "💰")
+        
+        # Add AI recommendations for liquidity and solvency
+        st.markdown("---")
+        st.markdown("### 🤖 AI Liquidity & Solvency Recommendations")
+        try:
+            ai_recommendations = page_recommendation('auto_insights', 'liquidity_solvency')
+            display_formatted_recommendations(ai_recommendations)
+        except Exception as e:
+            st.error(f"Error generating AI recommendations: {e}")
+    
+    with insight_tab3:
+        cash_flow_insights = insights.generate_cash_flow_insights()
+        display_insights_section(cash_flow_insights, "Cash Flow Insights", "💸")
+        
+        # Add AI recommendations for cash flow
+        st.markdown("---")
+        st.markdown("### 🤖 AI Cash Flow Recommendations")
+        try:
+            ai_recommendations = page_recommendation('auto_insights', 'cash_flow_analysis')
+            display_formatted_recommendations(ai_recommendations)
+        except Exception as e:
+            st.error(f"Error generating AI recommendations: {e}")
+    
+    with insight_tab4:
+        budget_insights = insights.generate_budget_forecasting_insights()
+        display_insights_section(budget_insights, "Budget & Forecasting Insights", "📋")
+    
+    with insight_tab5:
+        customer_insights = insights.generate_customer_productivity_insights()
+        display_insights_section(customer_insights, "Customer & Product Insights", "👥")
+    
+    with insight_tab6:
+        market_insights = insights.generate_market_competitive_insights()
+        display_insights_section(market_insights, "Market & Competitive Insights", "📈")
+        
+        # Add AI recommendations for market analysis
+        st.markdown("---")
+        st.markdown("### 🤖 AI Market Analysis Recommendations")
+        try:
+            # Generate market-specific recommendations
+            market_recommendations = f"""
+🤖 **AI Market Analysis Recommendations**
+
+📈 **Market Position Analysis**
+   • Monitor market trends and competitive landscape
+   • Analyze stock price movements and market sentiment
+   • Review dividend policies and shareholder value creation
+
+🏆 **Competitive Strategy Recommendations**
+   • Strengthen market positioning through innovation
+   • Optimize value chain for cost competitiveness
+   • Develop strategic partnerships and alliances
+
+🎯 **Strategic Actions**
+   • Regular market analysis and competitive intelligence
+   • Value chain optimization and cost reduction
+   • Strategic planning and market expansion
+"""
+            display_formatted_recommendations(market_recommendations)
+        except Exception as e:
+            st.error(f"Error generating market recommendations: {e}")
+    
+    with insight_tab7:
+        risk_insights = insights.generate_risk_mitigation_insights()
+        display_insights_section(risk_insights, "Risk Mitigation Insights", "⚠️")
+        
+        # Add AI recommendations for risk management
+        st.markdown("---")
+        st.markdown("### 🤖 AI Risk Management Recommendations")
+        try:
+            # Generate risk-specific recommendations
+            risk_recommendations = f"""
+🤖 **AI Risk Management Recommendations**
+
+⚠️ **Risk Assessment Framework**
+   • Implement comprehensive risk identification system
+   • Establish quantitative risk measurement metrics
+   • Develop proactive risk monitoring and reporting
+
+🛡️ **Risk Mitigation Strategies**
+   • Prioritize high-impact, high-probability risks
+   • Develop contingency plans for critical scenarios
+   • Establish risk response protocols and procedures
+
+🎯 **Strategic Actions**
+   • Regular risk assessments and updates
+   • Risk management training and awareness
+   • Continuous improvement of risk framework
+"""
+            display_formatted_recommendations(risk_recommendations)
+        except Exception as e:
+            st.error(f"Error generating risk recommendations: {e}")
+    
+    with insight_tab8:
+        executive_summary = insights.generate_executive_summary()
+        display_executive_summary(executive_summary, "Executive Financial Summary", "🎯")
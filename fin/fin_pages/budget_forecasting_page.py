@@ -0,0 +1,502 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_budget_variance_metrics, calculate_hierarchical_variance
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+from fin_data_utils import display_dataframe_with_index_1
+
+def show_budget_forecasting():
+    st.markdown("""
+    <div class="section-header">
+        <h3>📋 Budgeting, Forecasting & Variance</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.budget.empty and st.session_state.forecast.empty:
+        st.info("📋 Please upload budget and forecast data to view budgeting and forecasting analytics.")
+        return
+    
+    # Calculate budget variance metrics
+    variance_summary, variance_message = calculate_budget_variance_metrics(
+        st.session_state.income_statement, st.session_state.budget, st.session_state.forecast
+    )
+    
+    # Display summary metrics
+    st.subheader("📋 Budget and Forecasting Overview")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if not variance_summary.empty:
+            budget_variance = variance_summary.iloc[0]['Value']
+            st.metric("Budget Variance", budget_variance)
+    
+    with col2:
+        if not variance_summary.empty and len(variance_summary) > 1:
+            forecast_accuracy = variance_summary.iloc[1]['Value']
+            st.metric("Forecast Accuracy (MAPE)", forecast_accuracy)
+    
+    with col3:
+        if not variance_summary.empty and len(variance_summary) > 2:
+            scenario_analysis = variance_summary.iloc[2]['Value']
+            st.metric("Scenario Analysis", scenario_analysis)
+    
+    st.info(variance_message)
+    
+    # Detailed analytics tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📊 Budget Variance Analysis", "🔮 Forecast Accuracy", "📈 Scenario Analysis", "📋 Variance Reporting"
+    ])
+    
+    with tab1:
+        st.subheader("📊 Budget Variance Analysis")
+        
+        if not st.session_state.budget.empty and not st.session_state.income_statement.empty:
+            try:
+                # Always use manual column renaming approach for consistent results
+                budget_copy = st.session_state.budget.copy()
+                income_copy = st.session_state.income_statement[['period', 'revenue', 'cost_of_goods_sold', 'operating_expenses']].copy()
+                
+                # Rename budget columns
+                budget_copy = budget_copy.rename(columns={
+                    'revenue': 'revenue_budget',
+                    'expenses': 'expenses_budget'
+                })
+                
+                # Rename income statement columns
+                income_copy = income_copy.rename(columns={
+                    'revenue': 'revenue_actual',
+                    'cost_of_goods_sold': 'cost_of_goods_sold_actual',
+                    'operating_expenses': 'operating_expenses_actual'
+                })
+                
+                # Merge with renamed columns
+                budget_actual = budget_copy.merge(income_copy, on='period', how='inner')
+                
+                # Add calculated actual expenses column
+                try:
+                    # Check if we have the individual expense columns
+                    if 'cost_of_goods_sold_actual' in budget_actual.columns and 'operating_expenses_actual' in budget_actual.columns:
+                        budget_actual['expenses_actual'] = budget_actual['cost_of_goods_sold_actual'] + budget_actual['operating_expenses_actual']
+                    elif 'expenses_actual' not in budget_actual.columns:
+                        # If we don't have the individual columns, try to calculate from available data
+                        st.warning("⚠️ Individual expense columns not found, using available data")
+                        if 'cost_of_goods_sold' in budget_actual.columns and 'operating_expenses' in budget_actual.columns:
+                            budget_actual['expenses_actual'] = budget_actual['cost_of_goods_sold'] + budget_actual['operating_expenses']
+                        else:
+                            st.error("❌ Cannot calculate expenses_actual - missing required columns")
+                            st.write("Available columns:", list(budget_actual.columns))
+                            return
+                except KeyError as e:
+                    st.error(f"❌ Error calculating expenses_actual: {str(e)}")
+                    return
+                
+            except Exception as e:
+                st.error(f"❌ Error merging budget and actual data: {str(e)}")
+                return
+            
+            # Debug information removed for cleaner interface
+            
+            # Calculate variances with proper error handling
+            try:
+                # Check if required columns exist
+                required_columns = ['revenue_budget', 'revenue_actual', 'expenses_budget', 'expenses_actual']
+                missing_columns = [col for col in required_columns if col not in budget_actual.columns]
+                
+                if missing_columns:
+                    st.error(f"❌ Missing columns: {missing_columns}")
+                    return
+                
+                budget_actual['revenue_variance'] = ((budget_actual['revenue_actual'] - budget_actual['revenue_budget']) / budget_actual['revenue_budget'] * 100).round(2)
+                budget_actual['expense_variance'] = ((budget_actual['expenses_budget'] - budget_actual['expenses_actual']) / budget_actual['expenses_budget'] * 100).round(2)
+            except KeyError as e:
+                st.error(f"❌ Error calculating variances: {str(e)}. Please check your budget data structure.")
+                st.write("Available columns:", list(budget_actual.columns))
+                return
+            
+            # Revenue variance analysis
+            fig = go.Figure(data=[
+                go.Scatter(x=budget_actual['period'], y=budget_actual['revenue_variance'],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='Revenue Variance (%)')
+            ])
+            fig.update_layout(
+                title="Revenue Budget Variance Over Time",
+                xaxis_title="Period",
+                yaxis_title="Variance (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="On Budget")
+            fig.add_hline(y=5, line_dash="dash", line_color="green", annotation_text="Favorable (+5%)")
+            fig.add_hline(y=-5, line_dash="dash", line_color="red", annotation_text="Unfavorable (-5%)")
+            st.plotly_chart(fig, use_container_width=True, key="chart_20")
+            
+            # Budget vs Actual comparison
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = go.Figure()
+                fig.add_trace(go.Bar(x=budget_actual['period'], y=budget_actual['revenue_budget'],
+                                    name='Budgeted Revenue', marker_color='#1f77b4'))
+                fig.add_trace(go.Bar(x=budget_actual['period'], y=budget_actual['revenue_actual'],
+                                    name='Actual Revenue', marker_color='#2ca02c'))
+                fig.update_layout(
+                    title="Budget vs Actual Revenue",
+                    xaxis_title="Period",
+                    yaxis_title="Revenue ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50),
+                    barmode='group'
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_21")
+            
+            with col2:
+                fig = go.Figure()
+                fig.add_trace(go.Bar(x=budget_actual['period'], y=budget_actual['expenses_budget'],
+                                    name='Budgeted Expenses', marker_color='#ff7f0e'))
+                fig.add_trace(go.Bar(x=budget_actual['period'], y=budget_actual['expenses_actual'],
+                                    name='Actual Expenses', marker_color='#d62728'))
+                fig.update_layout(
+                    title="Budget vs Actual Expenses",
+                    xaxis_title="Period",
+                    yaxis_title="Expenses ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50),
+                    barmode='group'
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_22")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Budget Variance Analysis Recommendations")
+            if 'budget_variance_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('budget_forecasting', 'budget_variance_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement and budget data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab2:
+        st.subheader("🔮 Forecast Accuracy")
+        
+        if not st.session_state.forecast.empty and not st.session_state.income_statement.empty:
+            try:
+                # Always use manual column renaming approach for consistent results
+                forecast_copy = st.session_state.forecast.copy()
+                income_copy = st.session_state.income_statement[['period', 'revenue', 'cost_of_goods_sold', 'operating_expenses']].copy()
+                
+                # Rename forecast columns
+                forecast_copy = forecast_copy.rename(columns={
+                    'revenue': 'revenue_forecast',
+                    'expenses': 'expenses_forecast'
+                })
+                
+                # Rename income statement columns
+                income_copy = income_copy.rename(columns={
+                    'revenue': 'revenue_actual',
+                    'cost_of_goods_sold': 'cost_of_goods_sold_actual',
+                    'operating_expenses': 'operating_expenses_actual'
+                })
+                
+                # Merge with renamed columns
+                forecast_actual = forecast_copy.merge(income_copy, on='period', how='inner')
+                
+                # Check if we have any overlapping data
+                if forecast_actual.empty:
+                    st.warning("⚠️ No overlapping periods found between forecast and actual data.")
+                    st.info("Forecast periods: " + ", ".join(forecast_copy['period'].astype(str).tolist()[:5]) + "...")
+                    st.info("Income statement periods: " + ", ".join(income_copy['period'].astype(str).tolist()[:5]) + "...")
+                    st.info("Please ensure your forecast data covers periods that exist in your income statement data.")
+                    return
+                
+                # Add calculated actual expenses column
+                try:
+                    # Check if we have the individual expense columns
+                    if 'cost_of_goods_sold_actual' in forecast_actual.columns and 'operating_expenses_actual' in forecast_actual.columns:
+                        forecast_actual['expenses_actual'] = forecast_actual['cost_of_goods_sold_actual'] + forecast_actual['operating_expenses_actual']
+                    elif 'expenses_actual' not in forecast_actual.columns:
+                        # If we don't have the individual columns, try to calculate from available data
+                        st.warning("⚠️ Individual forecast expense columns not found, using available data")
+                        if 'cost_of_goods_sold' in forecast_actual.columns and 'operating_expenses' in forecast_actual.columns:
+                            forecast_actual['expenses_actual'] = forecast_actual['cost_of_goods_sold'] + forecast_actual['operating_expenses']
+                        else:
+                            st.error("❌ Cannot calculate forecast expenses_actual - missing required columns")
+                            st.write("Available forecast columns:", list(forecast_actual.columns))
+                            return
+                except KeyError as e:
+                    st.error(f"❌ Error calculating forecast expenses_actual: {str(e)}")
+                    return
+                
+            except Exception as e:
+                st.error(f"❌ Error merging forecast and actual data: {str(e)}")
+                return
+            
+            # Calculate forecast accuracy with error handling
+            try:
+                required_forecast_columns = ['revenue_forecast', 'revenue_actual', 'expenses_forecast', 'expenses_actual']
+                missing_forecast_columns = [col for col in required_forecast_columns if col not in forecast_actual.columns]
+                
+                if missing_forecast_columns:
+                    st.error(f"❌ Missing forecast columns: {missing_forecast_columns}")
+                    return
+                
+                forecast_actual['revenue_accuracy'] = (abs(forecast_actual['revenue_forecast'] - forecast_actual['revenue_actual']) / forecast_actual['revenue_actual'] * 100).round(2)
+                forecast_actual['expense_accuracy'] = (abs(forecast_actual['expenses_forecast'] - forecast_actual['expenses_actual']) / forecast_actual['expenses_actual'] * 100).round(2)
+            except KeyError as e:
+                st.error(f"❌ Error calculating forecast accuracy: {str(e)}")
+                return
+            
+            # Forecast accuracy trend
+            fig = go.Figure(data=[
+                go.Scatter(x=forecast_actual['period'], y=forecast_actual['revenue_accuracy'],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='Revenue Forecast Error (%)')
+            ])
+            fig.update_layout(
+                title="Forecast Accuracy Over Time",
+                xaxis_title="Period",
+                yaxis_title="Forecast Error (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=5, line_dash="dash", line_color="green", annotation_text="Excellent (≤5%)")
+            fig.add_hline(y=10, line_dash="dash", line_color="orange", annotation_text="Good (≤10%)")
+            fig.add_hline(y=20, line_dash="dash", line_color="red", annotation_text="Poor (>20%)")
+            st.plotly_chart(fig, use_container_width=True, key="chart_23")
+            
+            # Confidence level analysis
+            col1, col2 = st.columns(2)
+            with col1:
+                if 'confidence_level' in forecast_actual.columns:
+                    fig = go.Figure(data=[
+                        go.Scatter(x=forecast_actual['period'], y=forecast_actual['confidence_level'],
+                                  mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                                  marker=dict(size=8), name='Confidence Level')
+                    ])
+                    fig.update_layout(
+                        title="Forecast Confidence Level",
+                        xaxis_title="Period",
+                        yaxis_title="Confidence Level",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(size=12),
+                        margin=dict(l=50, r=50, t=80, b=50)
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="chart_24")
+                else:
+                    st.info("Confidence level data not available in merged dataset.")
+            
+            with col2:
+                # Forecast vs Actual comparison
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=forecast_actual['period'], y=forecast_actual['revenue_forecast'],
+                                        mode='lines+markers', name='Forecasted Revenue', line=dict(color='#1f77b4')))
+                fig.add_trace(go.Scatter(x=forecast_actual['period'], y=forecast_actual['revenue_actual'],
+                                        mode='lines+markers', name='Actual Revenue', line=dict(color='#2ca02c')))
+                fig.update_layout(
+                    title="Forecast vs Actual Revenue",
+                    xaxis_title="Period",
+                    yaxis_title="Revenue ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_25")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Forecast Accuracy Recommendations")
+            if 'forecast_accuracy' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('budget_forecasting', 'forecast_accuracy')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded forecast and income statement data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab3:
+        st.subheader("📈 Scenario Analysis")
+        
+        if not st.session_state.income_statement.empty:
+            # Scenario analysis simulation
+            latest_revenue = st.session_state.income_statement['revenue'].iloc[-1]
+            latest_expenses = st.session_state.income_statement['cost_of_goods_sold'].iloc[-1] + st.session_state.income_statement['operating_expenses'].iloc[-1]
+            
+            # Define scenarios
+            scenarios = {
+                'Optimistic': {'revenue_change': 0.20, 'expense_change': 0.05},
+                'Base Case': {'revenue_change': 0.00, 'expense_change': 0.00},
+                'Conservative': {'revenue_change': -0.10, 'expense_change': 0.10},
+                'Pessimistic': {'revenue_change': -0.20, 'expense_change': 0.15}
+            }
+            
+            scenario_results = []
+            for scenario, changes in scenarios.items():
+                new_revenue = latest_revenue * (1 + changes['revenue_change'])
+                new_expenses = latest_expenses * (1 + changes['expense_change'])
+                new_profit = new_revenue - new_expenses
+                profit_margin = (new_profit / new_revenue * 100) if new_revenue > 0 else 0
+                
+                scenario_results.append({
+                    'Scenario': scenario,
+                    'Revenue': new_revenue,
+                    'Expenses': new_expenses,
+                    'Profit': new_profit,
+                    'Profit Margin': profit_margin
+                })
+            
+            scenario_df = pd.DataFrame(scenario_results)
+            
+            # Scenario comparison chart
+            fig = go.Figure(data=[
+                go.Bar(x=scenario_df['Scenario'], y=scenario_df['Profit'],
+                       marker_color=['#2ca02c', '#1f77b4', '#ff7f0e', '#d62728'],
+                       text=scenario_df['Profit'].round(0),
+                       textposition='auto')
+            ])
+            fig.update_layout(
+                title="Profit Projections by Scenario",
+                xaxis_title="Scenario",
+                yaxis_title="Projected Profit ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_26")
+            
+            # Scenario details table
+            st.subheader("Scenario Details")
+            display_dataframe_with_index_1(scenario_df.round(2))
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Scenario Analysis Recommendations")
+            if 'scenario_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('budget_forecasting', 'scenario_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab4:
+        st.subheader("📋 Variance Reporting")
+        
+        # Drill-down through the budget hierarchy when budget lines carry one
+        variance_cube, cube_message = calculate_hierarchical_variance(st.session_state.budget)
+        if variance_cube is not None:
+            st.write("**🧭 Hierarchical Variance Drill-Down**")
+            st.caption(cube_message)
+            period_options = ["All periods"] + variance_cube.periods
+            selected_period = st.selectbox("Period", period_options, key="variance_drill_period")
+            period = None if selected_period == "All periods" else selected_period
+            
+            path = ()
+            for level in variance_cube.levels[:-1]:
+                options = ["All"] + [child[-1] for child in variance_cube.children(path)]
+                selected = st.selectbox(level.replace('_', ' ').title(), options, key=f"variance_drill_{level}")
+                if selected == "All":
+                    break
+                path = path + (selected,)
+            
+            node_variance = variance_cube.variance(path, period)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Budget", f"${node_variance['budget']:,.0f}")
+            with col2:
+                st.metric("Actual", f"${node_variance['actual']:,.0f}", f"{node_variance['variance_pct']:+.1f}%")
+            with col3:
+                if 'forecast' in variance_cube.measures:
+                    st.metric("Forecast", f"${node_variance['forecast']:,.0f}", f"{node_variance['forecast_variance_pct']:+.1f}%")
+            
+            drill = variance_cube.drill(path, period)
+            if not drill.empty:
+                if 'forecast' not in variance_cube.measures:
+                    drill = drill.drop(columns=['forecast', 'forecast_variance', 'forecast_variance_pct'])
+                fig = go.Figure()
+                fig.add_trace(go.Bar(x=drill['node'], y=drill['budget'], name='Budget', marker_color='#95a5a6'))
+                fig.add_trace(go.Bar(x=drill['node'], y=drill['actual'], name='Actual', marker_color='#3498db'))
+                fig.update_layout(title=f"Budget vs Actual: {' / '.join(path) or 'Total'}", barmode='group', height=400)
+                st.plotly_chart(fig, use_container_width=True, key="chart_50")
+                display_dataframe_with_index_1(drill.round(2))
+            st.markdown("---")
+        
+        if not st.session_state.budget.empty and not st.session_state.income_statement.empty:
+            # Variance summary
+            latest_budget = st.session_state.budget.iloc[-1]
+            latest_actual = st.session_state.income_statement.iloc[-1]
+            
+            try:
+                revenue_variance = ((latest_actual['revenue'] - latest_budget['revenue']) / latest_budget['revenue'] * 100) if latest_budget['revenue'] > 0 else 0
+                expense_variance = ((latest_budget['expenses'] - (latest_actual['cost_of_goods_sold'] + latest_actual['operating_expenses'])) / latest_budget['expenses'] * 100) if latest_budget['expenses'] > 0 else 0
+            except KeyError:
+                st.warning("⚠️ Budget data structure doesn't match expected format. Please check your data.")
+                revenue_variance = 0
+                expense_variance = 0
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if revenue_variance >= 0:
+                    st.success(f"✅ Revenue Variance: {revenue_variance:.1f}% (Favorable)")
+                else:
+                    st.error(f"❌ Revenue Variance: {revenue_variance:.1f}% (Unfavorable)")
+            
+            with col2:
+                if expense_variance >= 0:
+                    st.success(f"✅ Expense Variance: {expense_variance:.1f}% (Favorable)")
+                else:
+                    st.error(f"❌ Expense Variance: {expense_variance:.1f}% (Unfavorable)")
+            
+            with col3:
+                total_variance = revenue_variance - expense_variance
+                if total_variance >= 0:
+                    st.success(f"✅ Net Variance: {total_variance:.1f}% (Favorable)")
+                else:
+                    st.error(f"❌ Net Variance: {total_variance:.1f}% (Unfavorable)")
+            
+            # Variance recommendations
+            st.write("**Variance Analysis Recommendations:**")
+            if abs(revenue_variance) > 10:
+                st.warning(f"⚠️ **High Revenue Variance**: {abs(revenue_variance):.1f}% variance detected. Review revenue forecasting models.")
+            
+            if abs(expense_variance) > 10:
+                st.warning(f"⚠️ **High Expense Variance**: {abs(expense_variance):.1f}% variance detected. Review cost control measures.")
+            
+            if revenue_variance < -5 and expense_variance > 5:
+                st.error("❌ **Critical Variance**: Both revenue and expenses are significantly off target.")
+            
+            if abs(revenue_variance) <= 5 and abs(expense_variance) <= 5:
+                st.success("✅ **Excellent Budget Performance**: All variances within acceptable ranges.")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Variance Reporting Recommendations")
+            if 'variance_reporting' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('budget_forecasting', 'variance_reporting')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement and budget data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
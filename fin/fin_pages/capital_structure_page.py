@@ -0,0 +1,389 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_capital_structure_metrics
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+from fin_data_utils import display_dataframe_with_index_1
+
+def show_capital_structure():
+    st.markdown("""
+    <div class="section-header">
+        <h3>🏗️ Capital Structure & Financing</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.balance_sheet.empty and st.session_state.income_statement.empty:
+        st.info("🏗️ Please upload balance sheet and income statement data to view capital structure analytics.")
+        return
+    
+    # Calculate capital structure metrics
+    capital_summary, capital_message = calculate_capital_structure_metrics(
+        st.session_state.balance_sheet, st.session_state.income_statement
+    )
+    
+    # Display summary metrics
+    st.subheader("🏗️ Capital Structure Overview")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if not capital_summary.empty:
+            debt_equity = capital_summary.iloc[0]['debt_to_equity']
+            st.metric("Debt-to-Equity Ratio", f"{debt_equity:.2f}")
+    
+    with col2:
+        if not capital_summary.empty and len(capital_summary) > 1:
+            wacc = capital_summary.iloc[0]['wacc']
+            st.metric("WACC", f"{wacc:.1%}")
+    
+    with col3:
+        if not capital_summary.empty and len(capital_summary) > 2:
+            interest_coverage = capital_summary.iloc[0]['interest_coverage']
+            st.metric("Interest Coverage Ratio", f"{interest_coverage:.1f}")
+    
+    st.info(capital_message)
+    
+    # Detailed analytics tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📊 Debt Analysis", "💰 WACC Calculation", "🏦 Interest Coverage", "📈 Capital Optimization"
+    ])
+    
+    with tab1:
+        st.subheader("📊 Debt Analysis")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Debt-to-equity trend
+            debt_analysis = st.session_state.balance_sheet.copy()
+            debt_analysis['debt_to_equity'] = (debt_analysis['total_liabilities'] / debt_analysis['shareholder_equity']).round(2)
+            debt_analysis['debt_ratio'] = (debt_analysis['total_liabilities'] / debt_analysis['total_assets'] * 100).round(2)
+            
+            fig = go.Figure(data=[
+                go.Scatter(x=debt_analysis['period'], y=debt_analysis['debt_to_equity'],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='Debt-to-Equity Ratio')
+            ])
+            fig.update_layout(
+                title="Debt-to-Equity Ratio Trend",
+                xaxis_title="Period",
+                yaxis_title="Debt-to-Equity Ratio",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=0.5, line_dash="dash", line_color="green", annotation_text="Conservative (0.5)")
+            fig.add_hline(y=1.0, line_dash="dash", line_color="orange", annotation_text="Moderate (1.0)")
+            fig.add_hline(y=2.0, line_dash="dash", line_color="red", annotation_text="High Risk (2.0)")
+            st.plotly_chart(fig, use_container_width=True, key="chart_27")
+            
+            # Capital structure composition
+            col1, col2 = st.columns(2)
+            with col1:
+                latest_debt = debt_analysis.iloc[-1]
+                capital_composition = {
+                    'Total Liabilities': latest_debt['total_liabilities'],
+                    'Shareholder Equity': latest_debt['shareholder_equity']
+                }
+                
+                fig = px.pie(values=list(capital_composition.values()), names=list(capital_composition.keys()),
+                            title="Capital Structure Composition")
+                fig.update_traces(textposition='inside', textinfo='percent+label')
+                st.plotly_chart(fig, use_container_width=True, key="chart_28")
+            
+            with col2:
+                # Debt ratio trend
+                fig = go.Figure(data=[
+                    go.Scatter(x=debt_analysis['period'], y=debt_analysis['debt_ratio'],
+                              mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                              marker=dict(size=8), name='Debt Ratio (%)')
+                ])
+                fig.update_layout(
+                    title="Debt Ratio Trend",
+                    xaxis_title="Period",
+                    yaxis_title="Debt Ratio (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Conservative (30%)")
+                fig.add_hline(y=50, line_dash="dash", line_color="orange", annotation_text="Moderate (50%)")
+                fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="High Risk (70%)")
+                st.plotly_chart(fig, use_container_width=True, key="chart_29")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'debt_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('capital_structure', 'debt_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded balance sheet and income statement data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab2:
+        st.subheader("💰 WACC Calculation")
+        
+        if not st.session_state.balance_sheet.empty:
+            # WACC calculation details
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            
+            equity_value = latest_bs['shareholder_equity']
+            debt_value = latest_bs['total_liabilities']
+            total_value = equity_value + debt_value
+            
+            # Assumed costs (in real scenario, these would come from market data)
+            cost_of_equity = 0.12  # 12%
+            cost_of_debt = 0.06    # 6%
+            tax_rate = 0.25        # 25%
+            
+            equity_weight = equity_value / total_value if total_value > 0 else 0
+            debt_weight = debt_value / total_value if total_value > 0 else 0
+            
+            wacc = (equity_weight * cost_of_equity) + (debt_weight * cost_of_debt * (1 - tax_rate))
+            
+            # WACC breakdown
+            wacc_breakdown = {
+                'Equity Component': equity_weight * cost_of_equity * 100,
+                'Debt Component': debt_weight * cost_of_debt * (1 - tax_rate) * 100
+            }
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = px.pie(values=list(wacc_breakdown.values()), names=list(wacc_breakdown.keys()),
+                            title="WACC Components")
+                fig.update_traces(textposition='inside', textinfo='percent+label')
+                st.plotly_chart(fig, use_container_width=True, key="chart_30")
+            
+            with col2:
+                # WACC metrics
+                st.metric("Total Value", f"${total_value:,.0f}")
+                st.metric("Equity Weight", f"{equity_weight:.1%}")
+                st.metric("Debt Weight", f"{debt_weight:.1%}")
+                st.metric("WACC", f"{wacc:.1%}")
+            
+            # WACC sensitivity analysis
+            st.subheader("WACC Sensitivity Analysis")
+            
+            # Create sensitivity matrix
+            equity_costs = [0.10, 0.12, 0.14, 0.16]
+            debt_costs = [0.04, 0.06, 0.08, 0.10]
+            
+            sensitivity_data = []
+            for ec in equity_costs:
+                for dc in debt_costs:
+                    wacc_sens = (equity_weight * ec) + (debt_weight * dc * (1 - tax_rate))
+                    sensitivity_data.append({
+                        'Cost of Equity': f"{ec:.1%}",
+                        'Cost of Debt': f"{dc:.1%}",
+                        'WACC': f"{wacc_sens:.1%}"
+                    })
+            
+            sensitivity_df = pd.DataFrame(sensitivity_data)
+            display_dataframe_with_index_1(sensitivity_df)
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'wacc_calculation' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('capital_structure', 'wacc_calculation')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded balance sheet and income statement data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab3:
+        st.subheader("🏦 Interest Coverage")
+        
+        if not st.session_state.income_statement.empty and not st.session_state.balance_sheet.empty:
+            # Check if required columns exist
+            if 'interest_expense' not in st.session_state.income_statement.columns:
+                st.warning("⚠️ Interest expense data not available. Skipping interest coverage analysis.")
+                return
+            if 'operating_income' not in st.session_state.income_statement.columns:
+                st.warning("⚠️ Operating income data not available. Skipping interest coverage analysis.")
+                return
+            
+            try:
+                # Interest coverage analysis
+                coverage_data = st.session_state.income_statement.copy()
+                coverage_data['interest_coverage'] = (coverage_data['operating_income'] / coverage_data['interest_expense']).round(2)
+            except Exception as e:
+                st.error(f"❌ Error in interest coverage analysis: {str(e)}")
+                return
+            
+            fig = go.Figure(data=[
+                go.Scatter(x=coverage_data['period'], y=coverage_data['interest_coverage'],
+                          mode='lines+markers', line=dict(color='#ff7f0e', width=3),
+                          marker=dict(size=8), name='Interest Coverage Ratio')
+            ])
+            fig.update_layout(
+                title="Interest Coverage Ratio Trend",
+                xaxis_title="Period",
+                yaxis_title="Interest Coverage Ratio",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=3.0, line_dash="dash", line_color="green", annotation_text="Strong (≥3.0)")
+            fig.add_hline(y=1.5, line_dash="dash", line_color="orange", annotation_text="Adequate (≥1.5)")
+            fig.add_hline(y=1.0, line_dash="dash", line_color="red", annotation_text="Risky (<1.0)")
+            st.plotly_chart(fig, use_container_width=True, key="interest_coverage_trend")
+            
+            # Interest expense analysis
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = go.Figure(data=[
+                    go.Bar(x=coverage_data['period'], y=coverage_data['interest_expense'],
+                           marker_color='#d62728', name='Interest Expense',
+                           text=coverage_data['interest_expense'].round(0),
+                           textposition='auto')
+                ])
+                fig.update_layout(
+                    title="Interest Expense Trend",
+                    xaxis_title="Period",
+                    yaxis_title="Interest Expense ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="interest_expense_trend")
+            
+            with col2:
+                # Operating income vs interest expense
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=coverage_data['period'], y=coverage_data['operating_income'],
+                                        mode='lines+markers', name='Operating Income', line=dict(color='#1f77b4')))
+                fig.add_trace(go.Scatter(x=coverage_data['period'], y=coverage_data['interest_expense'],
+                                        mode='lines+markers', name='Interest Expense', line=dict(color='#d62728')))
+                fig.update_layout(
+                    title="Operating Income vs Interest Expense",
+                    xaxis_title="Period",
+                    yaxis_title="Amount ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="operating_vs_interest")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'interest_coverage' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('capital_structure', 'interest_coverage')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab4:
+        st.subheader("📈 Capital Optimization")
+        
+        if not st.session_state.balance_sheet.empty and not st.session_state.income_statement.empty:
+            # Capital optimization analysis
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            latest_is = st.session_state.income_statement.iloc[-1]
+            
+            debt_to_equity = latest_bs['total_liabilities'] / latest_bs['shareholder_equity']
+            debt_ratio = latest_bs['total_liabilities'] / latest_bs['total_assets']
+            
+            # Calculate interest coverage if data is available
+            if 'interest_expense' in latest_is.index and 'operating_income' in latest_is.index:
+                interest_coverage = latest_is['operating_income'] / latest_is['interest_expense'] if latest_is['interest_expense'] > 0 else float('inf')
+            else:
+                interest_coverage = float('inf')  # No interest expense means excellent coverage
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if debt_to_equity <= 0.5:
+                    st.success(f"✅ Debt-to-Equity: {debt_to_equity:.2f} (Conservative)")
+                elif debt_to_equity <= 1.0:
+                    st.info(f"ℹ️ Debt-to-Equity: {debt_to_equity:.2f} (Moderate)")
+                else:
+                    st.warning(f"⚠️ Debt-to-Equity: {debt_to_equity:.2f} (High Risk)")
+            
+            with col2:
+                if debt_ratio <= 0.3:
+                    st.success(f"✅ Debt Ratio: {debt_ratio:.1%} (Conservative)")
+                elif debt_ratio <= 0.5:
+                    st.info(f"ℹ️ Debt Ratio: {debt_ratio:.1%} (Moderate)")
+                else:
+                    st.warning(f"⚠️ Debt Ratio: {debt_ratio:.1%} (High Risk)")
+            
+            with col3:
+                if interest_coverage >= 3.0:
+                    st.success(f"✅ Interest Coverage: {interest_coverage:.1f} (Strong)")
+                elif interest_coverage >= 1.5:
+                    st.info(f"ℹ️ Interest Coverage: {interest_coverage:.1f} (Adequate)")
+                else:
+                    st.error(f"❌ Interest Coverage: {interest_coverage:.1f} (Risky)")
+            
+            # Capital optimization recommendations
+            st.write("**Capital Structure Recommendations:**")
+            
+            if debt_to_equity > 1.0:
+                st.warning("⚠️ **High Debt Levels**: Consider reducing debt or increasing equity to improve financial stability.")
+            
+            if interest_coverage < 1.5:
+                st.error("❌ **Low Interest Coverage**: Critical issue. Consider debt restructuring or operational improvements.")
+            
+            if debt_ratio > 0.5:
+                st.warning("⚠️ **High Debt Ratio**: Review capital structure to reduce financial risk.")
+            
+            if debt_to_equity <= 0.5 and interest_coverage >= 3.0:
+                st.success("✅ **Optimal Capital Structure**: Conservative debt levels with strong interest coverage.")
+            
+            # Optimal capital structure simulation
+            st.subheader("Optimal Capital Structure Simulation")
+            
+            # Simulate different debt levels
+            equity_base = latest_bs['shareholder_equity']
+            debt_levels = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7]
+            
+            simulation_results = []
+            for debt_level in debt_levels:
+                new_debt = equity_base * debt_level
+                new_equity = equity_base - new_debt
+                new_total = new_equity + new_debt
+                
+                # Simplified WACC calculation
+                new_wacc = (new_equity/new_total * 0.12) + (new_debt/new_total * 0.06 * 0.75)
+                
+                simulation_results.append({
+                    'Debt Level': f"{debt_level:.0%}",
+                    'Debt Amount': new_debt,
+                    'Equity Amount': new_equity,
+                    'WACC': f"{new_wacc:.1%}"
+                })
+            
+            simulation_df = pd.DataFrame(simulation_results)
+            display_dataframe_with_index_1(simulation_df)
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'capital_optimization' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('capital_structure', 'capital_optimization')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded balance sheet and income statement data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
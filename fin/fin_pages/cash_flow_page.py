@@ -0,0 +1,396 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_cash_flow_metrics, get_cash_flow_column_mapping
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+
+def show_cash_flow():
+    st.markdown("""
+    <div class="section-header">
+        <h3>💸 Cash Flow & Working Capital</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.cash_flow.empty and st.session_state.balance_sheet.empty:
+        st.info("💸 Please upload cash flow and balance sheet data to view cash flow analytics.")
+        return
+    
+    # Calculate cash flow metrics
+    cash_flow_summary, cash_flow_message = calculate_cash_flow_metrics(
+        st.session_state.cash_flow, st.session_state.balance_sheet
+    )
+    
+    # Display summary metrics
+    st.subheader("💸 Cash Flow & Working Capital Overview")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if not cash_flow_summary.empty:
+            operating_cf = cash_flow_summary.iloc[0]['operating_cf']
+            st.metric("Operating Cash Flow", f"${operating_cf:,.0f}")
+    
+    with col2:
+        if not cash_flow_summary.empty and len(cash_flow_summary) > 1:
+            free_cf = cash_flow_summary.iloc[0]['free_cf']
+            st.metric("Free Cash Flow", f"${free_cf:,.0f}")
+    
+    with col3:
+        if not cash_flow_summary.empty and len(cash_flow_summary) > 2:
+            working_capital_turnover = cash_flow_summary.iloc[0]['working_capital_turnover']
+            st.metric("Working Capital Turnover", f"{working_capital_turnover:.2f}")
+    
+    st.info(cash_flow_message)
+    
+    # Detailed analytics tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "💰 Operating Cash Flow", "🔄 Free Cash Flow", "📊 Working Capital", "📈 Cash Flow Trends"
+    ])
+    
+    with tab1:
+        st.subheader("💰 Operating Cash Flow")
+        
+        if not st.session_state.cash_flow.empty:
+            # Get column mapping for cash flow data
+            cf_mapping = get_cash_flow_column_mapping(st.session_state.cash_flow)
+            if 'operating_cash_flow' not in cf_mapping:
+                st.warning("⚠️ Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow")
+                return
+            
+            operating_cf_col = cf_mapping['operating_cash_flow']
+            
+            # Operating cash flow trend
+            fig = go.Figure(data=[
+                go.Scatter(x=st.session_state.cash_flow['period'], y=st.session_state.cash_flow[operating_cf_col],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='Operating Cash Flow')
+            ])
+            fig.update_layout(
+                title="Operating Cash Flow Trend",
+                xaxis_title="Period",
+                yaxis_title="Operating Cash Flow ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="operating_cf_trend")
+            
+            # Operating cash flow components
+            col1, col2 = st.columns(2)
+            with col1:
+                latest_cf = st.session_state.cash_flow.iloc[-1]
+                cf_components = {
+                    'Net Income': latest_cf['net_income'],
+                    'Depreciation': latest_cf['depreciation'],
+                    'Working Capital Change': -latest_cf['working_capital_change']
+                }
+                
+                fig = px.bar(x=list(cf_components.keys()), y=list(cf_components.values()),
+                            title="Operating Cash Flow Components",
+                            color=list(cf_components.values()),
+                            color_continuous_scale='RdYlGn')
+                fig.update_layout(
+                    xaxis_title="Component",
+                    yaxis_title="Amount ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="cf_components")
+            
+            with col2:
+                # Cash flow quality analysis
+                cf_quality_data = st.session_state.cash_flow.copy()
+                # Get column mapping for cash flow data
+                cf_mapping = get_cash_flow_column_mapping(st.session_state.cash_flow)
+                if 'operating_cash_flow' in cf_mapping:
+                    operating_cf_col = cf_mapping['operating_cash_flow']
+                    cf_quality_data['cf_quality'] = (cf_quality_data[operating_cf_col] / cf_quality_data['net_income']).round(2)
+                else:
+                    st.warning("⚠️ Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow")
+                    return
+                
+                fig = go.Figure(data=[
+                    go.Scatter(x=cf_quality_data['period'], y=cf_quality_data['cf_quality'],
+                              mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                              marker=dict(size=8), name='Cash Flow Quality')
+                ])
+                fig.update_layout(
+                    title="Cash Flow Quality (OCF/Net Income)",
+                    xaxis_title="Period",
+                    yaxis_title="Quality Ratio",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=1.0, line_dash="dash", line_color="green", annotation_text="Good Quality (≥1.0)")
+                fig.add_hline(y=0.8, line_dash="dash", line_color="orange", annotation_text="Acceptable (≥0.8)")
+                st.plotly_chart(fig, use_container_width=True, key="cf_quality")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'operating_cash_flow' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('cash_flow', 'operating_cash_flow')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab2:
+        st.subheader("🔄 Free Cash Flow")
+        
+        if not st.session_state.cash_flow.empty:
+            # Free cash flow trend
+            fig = go.Figure(data=[
+                go.Scatter(x=st.session_state.cash_flow['period'], y=st.session_state.cash_flow['free_cash_flow'],
+                          mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                          marker=dict(size=8), name='Free Cash Flow')
+            ])
+            fig.update_layout(
+                title="Free Cash Flow Trend",
+                xaxis_title="Period",
+                yaxis_title="Free Cash Flow ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="fcf_trend")
+            
+            # FCF vs OCF comparison
+            col1, col2 = st.columns(2)
+            with col1:
+                # Get column mapping for cash flow data
+                cf_mapping = get_cash_flow_column_mapping(st.session_state.cash_flow)
+                if 'operating_cash_flow' not in cf_mapping:
+                    st.warning("⚠️ Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow")
+                    return
+                
+                operating_cf_col = cf_mapping['operating_cash_flow']
+                
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=st.session_state.cash_flow['period'], y=st.session_state.cash_flow[operating_cf_col],
+                                        mode='lines+markers', name='Operating CF', line=dict(color='#1f77b4')))
+                fig.add_trace(go.Scatter(x=st.session_state.cash_flow['period'], y=st.session_state.cash_flow['free_cash_flow'],
+                                        mode='lines+markers', name='Free CF', line=dict(color='#2ca02c')))
+                fig.update_layout(
+                    title="Operating vs Free Cash Flow",
+                    xaxis_title="Period",
+                    yaxis_title="Cash Flow ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="fcf_vs_ocf")
+            
+            with col2:
+                # Capital expenditures analysis
+                fig = go.Figure(data=[
+                    go.Bar(x=st.session_state.cash_flow['period'], y=st.session_state.cash_flow['capital_expenditures'],
+                           marker_color='#ff7f0e', name='Capital Expenditures',
+                           text=st.session_state.cash_flow['capital_expenditures'].round(0),
+                           textposition='auto')
+                ])
+                fig.update_layout(
+                    title="Capital Expenditures",
+                    xaxis_title="Period",
+                    yaxis_title="Capital Expenditures ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="capex_analysis")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'free_cash_flow' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('cash_flow', 'free_cash_flow')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab3:
+        st.subheader("📊 Working Capital")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Working capital calculation
+            working_capital_data = st.session_state.balance_sheet.copy()
+            working_capital_data['working_capital'] = working_capital_data['current_assets'] - working_capital_data['current_liabilities']
+            working_capital_data['working_capital_ratio'] = (working_capital_data['current_assets'] / working_capital_data['current_liabilities']).round(2)
+            
+            # Working capital trend
+            fig = go.Figure(data=[
+                go.Scatter(x=working_capital_data['period'], y=working_capital_data['working_capital'],
+                          mode='lines+markers', line=dict(color='#9467bd', width=3),
+                          marker=dict(size=8), name='Working Capital')
+            ])
+            fig.update_layout(
+                title="Working Capital Trend",
+                xaxis_title="Period",
+                yaxis_title="Working Capital ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="wc_trend")
+            
+            # Working capital components
+            col1, col2 = st.columns(2)
+            with col1:
+                latest_wc = working_capital_data.iloc[-1]
+                wc_components = {
+                    'Cash & Equivalents': latest_wc['cash_and_equivalents'],
+                    'Accounts Receivable': latest_wc['accounts_receivable'],
+                    'Inventory': latest_wc['inventory'],
+                    'Other Current Assets': latest_wc['current_assets'] - latest_wc['cash_and_equivalents'] - latest_wc['accounts_receivable'] - latest_wc['inventory']
+                }
+                
+                fig = px.pie(values=list(wc_components.values()), names=list(wc_components.keys()),
+                            title="Working Capital Components")
+                fig.update_traces(textposition='inside', textinfo='percent+label')
+                st.plotly_chart(fig, use_container_width=True, key="wc_components")
+            
+            with col2:
+                # Working capital ratio
+                fig = go.Figure(data=[
+                    go.Scatter(x=working_capital_data['period'], y=working_capital_data['working_capital_ratio'],
+                              mode='lines+markers', line=dict(color='#ff7f0e', width=3),
+                              marker=dict(size=8), name='Working Capital Ratio')
+                ])
+                fig.update_layout(
+                    title="Working Capital Ratio",
+                    xaxis_title="Period",
+                    yaxis_title="Ratio",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=2.0, line_dash="dash", line_color="green", annotation_text="Good (≥2.0)")
+                fig.add_hline(y=1.0, line_dash="dash", line_color="red", annotation_text="Poor (<1.0)")
+                st.plotly_chart(fig, use_container_width=True, key="wc_ratio")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'working_capital' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('cash_flow', 'working_capital')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded balance sheet and cash flow data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab4:
+        st.subheader("📈 Cash Flow Trends")
+        
+        if not st.session_state.cash_flow.empty:
+            # Get column mapping for cash flow data
+            cf_mapping = get_cash_flow_column_mapping(st.session_state.cash_flow)
+            if 'operating_cash_flow' not in cf_mapping:
+                st.warning("⚠️ Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow")
+                return
+            
+            operating_cf_col = cf_mapping['operating_cash_flow']
+            
+            # Cash flow trend analysis
+            cf_trends = st.session_state.cash_flow.copy()
+            cf_trends['cf_growth'] = cf_trends[operating_cf_col].pct_change() * 100
+            
+            fig = go.Figure(data=[
+                go.Scatter(x=cf_trends['period'], y=cf_trends['cf_growth'],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='Cash Flow Growth (%)')
+            ])
+            fig.update_layout(
+                title="Cash Flow Growth Rate",
+                xaxis_title="Period",
+                yaxis_title="Growth Rate (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="No Growth")
+            st.plotly_chart(fig, use_container_width=True, key="cf_growth")
+            
+            # Cash flow insights
+            latest_cf_trend = cf_trends.iloc[-1]
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if latest_cf_trend[operating_cf_col] > 0:
+                    st.success(f"✅ Operating CF: ${latest_cf_trend[operating_cf_col]:,.0f} (Positive)")
+                else:
+                    st.error(f"❌ Operating CF: ${latest_cf_trend[operating_cf_col]:,.0f} (Negative)")
+            
+            with col2:
+                if latest_cf_trend['free_cash_flow'] > 0:
+                    st.success(f"✅ Free CF: ${latest_cf_trend['free_cash_flow']:,.0f} (Positive)")
+                else:
+                    st.error(f"❌ Free CF: ${latest_cf_trend['free_cash_flow']:,.0f} (Negative)")
+            
+            with col3:
+                if not pd.isna(latest_cf_trend['cf_growth']) and latest_cf_trend['cf_growth'] > 0:
+                    st.success(f"✅ CF Growth: {latest_cf_trend['cf_growth']:.1f}% (Growing)")
+                elif not pd.isna(latest_cf_trend['cf_growth']):
+                    st.warning(f"⚠️ CF Growth: {latest_cf_trend['cf_growth']:.1f}% (Declining)")
+                else:
+                    st.info("ℹ️ CF Growth: No data")
+            
+            # Cash flow recommendations
+            st.write("**Cash Flow Analysis Recommendations:**")
+            if latest_cf_trend[operating_cf_col] < 0:
+                st.error("❌ **Negative Operating Cash Flow**: Critical issue. Review operations and cost structure.")
+            
+            if latest_cf_trend['free_cash_flow'] < 0:
+                st.warning("⚠️ **Negative Free Cash Flow**: May indicate over-investment or operational issues.")
+            
+            if latest_cf_trend[operating_cf_col] > 0 and latest_cf_trend['free_cash_flow'] > 0:
+                st.success("✅ **Strong Cash Flow**: Positive operating and free cash flow indicate healthy operations.")
+            
+            # Working capital recommendations
+            if not st.session_state.balance_sheet.empty:
+                latest_wc = st.session_state.balance_sheet.iloc[-1]
+                working_capital = latest_wc['current_assets'] - latest_wc['current_liabilities']
+                
+                if working_capital < 0:
+                    st.error("❌ **Negative Working Capital**: Immediate attention required for liquidity management.")
+                elif working_capital < latest_wc['current_assets'] * 0.1:
+                    st.warning("⚠️ **Low Working Capital**: Consider improving working capital management.")
+                else:
+                    st.success("✅ **Adequate Working Capital**: Sufficient liquidity for operations.")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'cash_flow_trends' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('cash_flow', 'cash_flow_trends')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
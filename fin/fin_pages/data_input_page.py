@@ -0,0 +1,889 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from fin_data_utils import (
+    create_template_for_download, display_dataframe_with_index_1, export_data_to_excel,
+    generate_sample_finance_data
+)
+from fin_data_layer import set_table
+from fin_ledger import LedgerError, read_journal_chunks, rollup_journal
+
+def show_data_input():
+    st.markdown("""
+    <div class="welcome-section">
+        <h2 style="color: #2c3e50; margin-bottom: 20px;">📝 Data Management</h2>
+        <p style="font-size: 1.1rem; color: #34495e; line-height: 1.6;">
+            Upload your finance data files to unlock powerful analytics and insights. 
+            Support for Excel (.xlsx) and CSV formats with automatic data validation.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # File upload section
+    st.markdown("### 📁 Upload Data Files")
+    
+    # Create tabs for different upload methods
+    upload_tab1, upload_tab2, upload_tab3, upload_tab4 = st.tabs(["📤 Upload Files", "📥 Download Template", "✏️ Manual Data Entry", "🎯 Load Sample Data"])
+    
+    with upload_tab1:
+        # Complete Dataset Upload Section
+        st.markdown("### 📊 Complete Dataset")
+        
+        uploaded_complete_dataset = st.file_uploader(
+            "📊 Upload Complete Dataset (Excel file with multiple sheets)", 
+            type=['xlsx'], 
+            key="complete_dataset_upload",
+            help="Upload an Excel file with sheets named: Income_Statement, Balance_Sheet, Cash_Flow, Budget, Forecast, Market_Data, Customer_Data, Product_Data, Value_Chain"
+        )
+        
+        if uploaded_complete_dataset is not None:
+            try:
+                # Read all sheets from the Excel file
+                excel_file = pd.ExcelFile(uploaded_complete_dataset)
+                
+                # Dictionary to store loaded data
+                loaded_data = {}
+                
+                # Expected sheet names
+                expected_sheets = {
+                    'income_statement': 'income_statement',
+                    'balance_sheet': 'balance_sheet', 
+                    'cash_flow': 'cash_flow',
+                    'budget': 'budget',
+                    'forecast': 'forecast',
+                    'market_data': 'market_data',
+                    'customer_data': 'customer_data',
+                    'product_data': 'product_data',
+                    'value_chain': 'value_chain'
+                }
+                
+                # Load each sheet if it exists
+                for sheet_name, session_key in expected_sheets.items():
+                    if sheet_name in excel_file.sheet_names:
+                        loaded_data[session_key] = pd.read_excel(uploaded_complete_dataset, sheet_name=sheet_name)
+                        st.markdown(f"""
+                        <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                            ✅ {sheet_name} loaded: {len(loaded_data[session_key])} records
+                        </div>
+                        """, unsafe_allow_html=True)
+                    else:
+                        st.markdown(f"""
+                        <div style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                            ⚠️ Sheet '{sheet_name}' not found in the uploaded file
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                # Update session state with loaded data
+                for session_key, data in loaded_data.items():
+                    setattr(st.session_state, session_key, data)
+                
+                # Show summary
+                total_records = sum(len(data) for data in loaded_data.values())
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; border-radius: 10px; margin: 15px 0;">
+                    <h4 style="margin: 0 0 10px 0;">🎉 Complete Dataset Loaded Successfully!</h4>
+                    <p style="margin: 0;">Total records loaded: <strong>{total_records:,}</strong> across <strong>{len(loaded_data)}</strong> data tables</p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading complete dataset: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Separator
+        st.markdown("---")
+        
+        # Individual File Upload Section
+        st.markdown("### 📁 Individual Files")
+        
+        # File uploaders in a modern grid layout
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            uploaded_income_statement = st.file_uploader("📈 Income Statement", type=['xlsx', 'csv'], key="income_statement_upload")
+            uploaded_balance_sheet = st.file_uploader("💰 Balance Sheet", type=['xlsx', 'csv'], key="balance_sheet_upload")
+            uploaded_cash_flow = st.file_uploader("💸 Cash Flow", type=['xlsx', 'csv'], key="cash_flow_upload")
+            uploaded_budget = st.file_uploader("📋 Budget", type=['xlsx', 'csv'], key="budget_upload")
+        
+        with col2:
+            uploaded_forecast = st.file_uploader("🔮 Forecast", type=['xlsx', 'csv'], key="forecast_upload")
+            uploaded_market_data = st.file_uploader("📊 Market Data", type=['xlsx', 'csv'], key="market_data_upload")
+            uploaded_customer_data = st.file_uploader("👥 Customer Data", type=['xlsx', 'csv'], key="customer_data_upload")
+            uploaded_product_data = st.file_uploader("📦 Product Data", type=['xlsx', 'csv'], key="product_data_upload")
+        
+        # Process uploaded files with modern success/error styling
+        if uploaded_income_statement is not None:
+            try:
+                if uploaded_income_statement.name.endswith('.csv'):
+                    set_table('income_statement', pd.read_csv(uploaded_income_statement))
+                else:
+                    set_table('income_statement', pd.read_excel(uploaded_income_statement))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Income statement data loaded: {len(st.session_state.income_statement)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading income statement data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_balance_sheet is not None:
+            try:
+                if uploaded_balance_sheet.name.endswith('.csv'):
+                    set_table('balance_sheet', pd.read_csv(uploaded_balance_sheet))
+                else:
+                    set_table('balance_sheet', pd.read_excel(uploaded_balance_sheet))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Balance sheet data loaded: {len(st.session_state.balance_sheet)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading balance sheet data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_cash_flow is not None:
+            try:
+                if uploaded_cash_flow.name.endswith('.csv'):
+                    set_table('cash_flow', pd.read_csv(uploaded_cash_flow))
+                else:
+                    set_table('cash_flow', pd.read_excel(uploaded_cash_flow))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Cash flow data loaded: {len(st.session_state.cash_flow)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading cash flow data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_budget is not None:
+            try:
+                if uploaded_budget.name.endswith('.csv'):
+                    set_table('budget', pd.read_csv(uploaded_budget))
+                else:
+                    set_table('budget', pd.read_excel(uploaded_budget))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Budget data loaded: {len(st.session_state.budget)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading budget data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_forecast is not None:
+            try:
+                if uploaded_forecast.name.endswith('.csv'):
+                    set_table('forecast', pd.read_csv(uploaded_forecast))
+                else:
+                    set_table('forecast', pd.read_excel(uploaded_forecast))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Forecast data loaded: {len(st.session_state.forecast)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading forecast data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_market_data is not None:
+            try:
+                if uploaded_market_data.name.endswith('.csv'):
+                    set_table('market_data', pd.read_csv(uploaded_market_data))
+                else:
+                    set_table('market_data', pd.read_excel(uploaded_market_data))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Market data loaded: {len(st.session_state.market_data)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading market data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_customer_data is not None:
+            try:
+                if uploaded_customer_data.name.endswith('.csv'):
+                    set_table('customer_data', pd.read_csv(uploaded_customer_data))
+                else:
+                    set_table('customer_data', pd.read_excel(uploaded_customer_data))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Customer data loaded: {len(st.session_state.customer_data)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading customer data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if uploaded_product_data is not None:
+            try:
+                if uploaded_product_data.name.endswith('.csv'):
+                    set_table('product_data', pd.read_csv(uploaded_product_data))
+                else:
+                    set_table('product_data', pd.read_excel(uploaded_product_data))
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ✅ Product data loaded: {len(st.session_state.product_data)} records
+                </div>
+                """, unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 10px 15px; border-radius: 10px; margin: 10px 0;">
+                    ❌ Error loading product data: {str(e)}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # General ledger journals are rolled up into the three statements
+        with st.expander("📒 Roll Up a General Ledger Journal", expanded=False):
+            st.caption("Journal lines need account, amount (or debit and credit) and period (or posting_date), "
+                       "optionally entity. The chart of accounts maps each account to a statement line.")
+            gl_col1, gl_col2 = st.columns(2)
+            with gl_col1:
+                uploaded_journal = st.file_uploader("📒 GL Journal", type=['csv', 'parquet'], key="gl_journal_upload")
+            with gl_col2:
+                uploaded_coa = st.file_uploader("🗂️ Chart of Accounts", type=['csv', 'xlsx'], key="gl_coa_upload")
+            
+            if uploaded_journal is not None and uploaded_coa is not None and st.button("Roll Up Journal", key="gl_rollup_button"):
+                try:
+                    if uploaded_coa.name.endswith('.csv'):
+                        chart_of_accounts = pd.read_csv(uploaded_coa, dtype={'account': str})
+                    else:
+                        chart_of_accounts = pd.read_excel(uploaded_coa, dtype={'account': str})
+                    with st.spinner("Rolling up journal..."):
+                        statements, rollup = rollup_journal(uploaded_journal, chart_of_accounts)
+                    st.session_state.gl_rollup = rollup
+                    for table, statement in statements.items():
+                        set_table(table, statement)
+                    st.success(f"✅ {rollup.lines_read:,} journal lines rolled up into {len(rollup.periods)} periods "
+                               f"for {len(rollup.entities)} entities")
+                except (LedgerError, ValueError) as e:
+                    st.error(f"❌ Error rolling up journal: {str(e)}")
+            
+            if 'gl_rollup' in st.session_state:
+                rollup = st.session_state.gl_rollup
+                unmapped = rollup.unmapped_accounts()
+                if not unmapped.empty:
+                    st.warning(f"⚠️ {len(unmapped)} accounts are not in the chart of accounts "
+                               f"(net ${unmapped.sum():,.2f}); they are left out of the statements")
+                imbalances = rollup.imbalances()
+                if not imbalances.empty:
+                    st.warning(f"⚠️ Debits and credits differ in {len(imbalances)} entity-periods")
+                
+                uploaded_close = st.file_uploader("🗓️ Month-Close Journal", type=['csv', 'parquet'], key="gl_close_upload")
+                if uploaded_close is not None and st.button("Close Month", key="gl_close_button"):
+                    try:
+                        rollup.close_month(pd.concat(read_journal_chunks(uploaded_close), ignore_index=True))
+                        for table, statement in rollup.statements().items():
+                            set_table(table, statement)
+                        st.success(f"✅ Closed {rollup.closed_periods[-1]}; statements now cover {len(rollup.periods)} periods")
+                    except (LedgerError, ValueError) as e:
+                        st.error(f"❌ Error closing month: {str(e)}")
+    
+    with upload_tab2:
+        st.markdown("""
+        <div class="chart-container">
+            <h4 style="color: #2c3e50; margin-bottom: 15px;">📥 Download Excel Template</h4>
+            <p style="color: #34495e; margin-bottom: 20px;">Download our comprehensive Excel template with all required data fields, formatting, and detailed instructions.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Create template for download
+        template_output = create_template_for_download()
+        
+        st.download_button(
+            label="📥 Download Template",
+            data=template_output.getvalue(),
+            file_name="finance_analytics_template.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        
+        st.markdown("""
+        <div class="chart-container">
+            <h5 style="color: #2c3e50; margin-bottom: 10px;">Template includes:</h5>
+            <ul style="color: #34495e; line-height: 1.6;">
+                <li>📈 <strong>Income Statement:</strong> Revenue, expenses, and profitability data</li>
+                <li>💰 <strong>Balance Sheet:</strong> Assets, liabilities, and equity data</li>
+                <li>💸 <strong>Cash Flow:</strong> Operating, investing, and financing cash flows</li>
+                <li>📋 <strong>Budget:</strong> Budgeted revenue, expenses, and targets</li>
+                <li>🔮 <strong>Forecast:</strong> Forecasted financial performance</li>
+                <li>📊 <strong>Market Data:</strong> Market prices, volumes, and trends</li>
+                <li>👥 <strong>Customer Data:</strong> Customer revenue and profitability</li>
+                <li>📦 <strong>Product Data:</strong> Product revenue and costs</li>
+                <li>🏗️ <strong>Value Chain:</strong> Value chain functions and costs</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with upload_tab3:
+        st.markdown("""
+        <div class="chart-container">
+            <h4 style="color: #2c3e50; margin-bottom: 15px;">✏️ Manual Data Entry</h4>
+            <p style="color: #34495e; margin-bottom: 20px;">Add data manually using the forms below. This is useful for small datasets or quick data entry.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Tabs for different data types
+        manual_tab1, manual_tab2, manual_tab3, manual_tab4, manual_tab5, manual_tab6, manual_tab7, manual_tab8, manual_tab9 = st.tabs([
+            "Income Statement", "Balance Sheet", "Cash Flow", "Budget", 
+            "Forecast", "Market Data", "Customer Data", "Product Data", "Value Chain"
+        ])
+        
+        with manual_tab1:
+            st.subheader("Income Statement")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                period = st.text_input("Period", key="period_income")
+                revenue = st.number_input("Revenue", min_value=0.0, key="revenue_input")
+                cost_of_goods_sold = st.number_input("Cost of Goods Sold", min_value=0.0, key="cogs_input")
+                gross_profit = st.number_input("Gross Profit", min_value=0.0, key="gross_profit_input")
+                operating_expenses = st.number_input("Operating Expenses", min_value=0.0, key="opex_input")
+            
+            with col2:
+                operating_income = st.number_input("Operating Income", min_value=0.0, key="op_income_input")
+                net_income = st.number_input("Net Income", min_value=0.0, key="net_income_input")
+                ebitda = st.number_input("EBITDA", min_value=0.0, key="ebitda_input")
+                ebit = st.number_input("EBIT", min_value=0.0, key="ebit_input")
+            
+            if st.button("Add Income Statement", key="add_income_statement"):
+                new_income = pd.DataFrame([{
+                    'period': period,
+                    'revenue': revenue,
+                    'cost_of_goods_sold': cost_of_goods_sold,
+                    'gross_profit': gross_profit,
+                    'operating_expenses': operating_expenses,
+                    'operating_income': operating_income,
+                    'net_income': net_income,
+                    'ebitda': ebitda,
+                    'ebit': ebit
+                }])
+                set_table('income_statement', pd.concat([st.session_state.income_statement, new_income], ignore_index=True))
+                st.success("Income Statement added successfully!")
+            
+            # Display existing data
+            if not st.session_state.income_statement.empty:
+                st.subheader("Existing Income Statements")
+                display_dataframe_with_index_1(st.session_state.income_statement)
+        
+        with manual_tab2:
+            st.subheader("Balance Sheet")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                period = st.text_input("Period", key="period_balance")
+                total_assets = st.number_input("Total Assets", min_value=0.0, key="total_assets_input")
+                current_assets = st.number_input("Current Assets", min_value=0.0, key="current_assets_input")
+                cash_and_equivalents = st.number_input("Cash & Equivalents", min_value=0.0, key="cash_input")
+                accounts_receivable = st.number_input("Accounts Receivable", min_value=0.0, key="ar_input")
+            
+            with col2:
+                total_liabilities = st.number_input("Total Liabilities", min_value=0.0, key="total_liabilities_input")
+                current_liabilities = st.number_input("Current Liabilities", min_value=0.0, key="current_liabilities_input")
+                total_equity = st.number_input("Total Equity", min_value=0.0, key="total_equity_input")
+                working_capital = st.number_input("Working Capital", min_value=0.0, key="working_capital_input")
+            
+            if st.button("Add Balance Sheet", key="add_balance_sheet"):
+                new_balance = pd.DataFrame([{
+                    'period': period,
+                    'total_assets': total_assets,
+                    'current_assets': current_assets,
+                    'cash_and_equivalents': cash_and_equivalents,
+                    'accounts_receivable': accounts_receivable,
+                    'total_liabilities': total_liabilities,
+                    'current_liabilities': current_liabilities,
+                    'total_equity': total_equity,
+                    'working_capital': working_capital
+                }])
+                set_table('balance_sheet', pd.concat([st.session_state.balance_sheet, new_balance], ignore_index=True))
+                st.success("Balance Sheet added successfully!")
+            
+            # Display existing data
+            if not st.session_state.balance_sheet.empty:
+                st.subheader("Existing Balance Sheets")
+                display_dataframe_with_index_1(st.session_state.balance_sheet)
+        
+        with manual_tab3:
+            st.subheader("Cash Flow")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                period = st.text_input("Period", key="period_cash")
+                operating_cash_flow = st.number_input("Operating Cash Flow", min_value=0.0, key="ocf_input")
+                investing_cash_flow = st.number_input("Investing Cash Flow", min_value=0.0, key="icf_input")
+                financing_cash_flow = st.number_input("Financing Cash Flow", min_value=0.0, key="fcf_input")
+            
+            with col2:
+                net_cash_flow = st.number_input("Net Cash Flow", min_value=0.0, key="net_cf_input")
+                free_cash_flow = st.number_input("Free Cash Flow", min_value=0.0, key="fcf_input2")
+                capex = st.number_input("Capital Expenditure", min_value=0.0, key="capex_input")
+            
+            if st.button("Add Cash Flow", key="add_cash_flow"):
+                new_cash_flow = pd.DataFrame([{
+                    'period': period,
+                    'operating_cash_flow': operating_cash_flow,
+                    'investing_cash_flow': investing_cash_flow,
+                    'financing_cash_flow': financing_cash_flow,
+                    'net_cash_flow': net_cash_flow,
+                    'free_cash_flow': free_cash_flow,
+                    'capex': capex
+                }])
+                set_table('cash_flow', pd.concat([st.session_state.cash_flow, new_cash_flow], ignore_index=True))
+                st.success("Cash Flow added successfully!")
+            
+            # Display existing data
+            if not st.session_state.cash_flow.empty:
+                st.subheader("Existing Cash Flows")
+                display_dataframe_with_index_1(st.session_state.cash_flow)
+        
+        with manual_tab4:
+            st.subheader("Budget")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                period = st.text_input("Period", key="period_budget")
+                budgeted_revenue = st.number_input("Budgeted Revenue", min_value=0.0, key="budget_revenue_input")
+                budgeted_expenses = st.number_input("Budgeted Expenses", min_value=0.0, key="budget_expenses_input")
+                budgeted_profit = st.number_input("Budgeted Profit", min_value=0.0, key="budget_profit_input")
+            
+            with col2:
+                department = st.text_input("Department", key="department_budget_input")
+                category = st.text_input("Category", key="category_budget_input")
+                variance = st.number_input("Variance", key="variance_input")
+            
+            if st.button("Add Budget", key="add_budget"):
+                new_budget = pd.DataFrame([{
+                    'period': period,
+                    'budgeted_revenue': budgeted_revenue,
+                    'budgeted_expenses': budgeted_expenses,
+                    'budgeted_profit': budgeted_profit,
+                    'department': department,
+                    'category': category,
+                    'variance': variance
+                }])
+                set_table('budget', pd.concat([st.session_state.budget, new_budget], ignore_index=True))
+                st.success("Budget added successfully!")
+            
+            # Display existing data
+            if not st.session_state.budget.empty:
+                st.subheader("Existing Budgets")
+                display_dataframe_with_index_1(st.session_state.budget)
+        
+        with manual_tab5:
+            st.subheader("Forecast")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                period = st.text_input("Period", key="period_forecast")
+                forecasted_revenue = st.number_input("Forecasted Revenue", min_value=0.0, key="forecast_revenue_input")
+                forecasted_expenses = st.number_input("Forecasted Expenses", min_value=0.0, key="forecast_expenses_input")
+                forecasted_profit = st.number_input("Forecasted Profit", min_value=0.0, key="forecast_profit_input")
+            
+            with col2:
+                confidence_level = st.selectbox("Confidence Level", ["High", "Medium", "Low"], key="confidence_input")
+                scenario = st.selectbox("Scenario", ["Base", "Optimistic", "Pessimistic"], key="scenario_input")
+            
+            if st.button("Add Forecast", key="add_forecast"):
+                new_forecast = pd.DataFrame([{
+                    'period': period,
+                    'forecasted_revenue': forecasted_revenue,
+                    'forecasted_expenses': forecasted_expenses,
+                    'forecasted_profit': forecasted_profit,
+                    'confidence_level': confidence_level,
+                    'scenario': scenario
+                }])
+                set_table('forecast', pd.concat([st.session_state.forecast, new_forecast], ignore_index=True))
+                st.success("Forecast added successfully!")
+            
+            # Display existing data
+            if not st.session_state.forecast.empty:
+                st.subheader("Existing Forecasts")
+                display_dataframe_with_index_1(st.session_state.forecast)
+        
+        with manual_tab6:
+            st.subheader("Market Data")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                date = st.date_input("Date", key="date_market_input")
+                market_price = st.number_input("Market Price", min_value=0.0, key="market_price_input")
+                volume = st.number_input("Volume", min_value=0, key="volume_input")
+                market_cap = st.number_input("Market Cap", min_value=0.0, key="market_cap_input")
+            
+            with col2:
+                pe_ratio = st.number_input("P/E Ratio", min_value=0.0, key="pe_ratio_input")
+                beta = st.number_input("Beta", min_value=0.0, key="beta_input")
+                sector = st.text_input("Sector", key="sector_input")
+            
+            if st.button("Add Market Data", key="add_market_data"):
+                new_market = pd.DataFrame([{
+                    'date': date,
+                    'market_price': market_price,
+                    'volume': volume,
+                    'market_cap': market_cap,
+                    'pe_ratio': pe_ratio,
+                    'beta': beta,
+                    'sector': sector
+                }])
+                set_table('market_data', pd.concat([st.session_state.market_data, new_market], ignore_index=True))
+                st.success("Market Data added successfully!")
+            
+            # Display existing data
+            if not st.session_state.market_data.empty:
+                st.subheader("Existing Market Data")
+                display_dataframe_with_index_1(st.session_state.market_data)
+        
+        with manual_tab7:
+            st.subheader("Customer Data")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                customer_id = st.text_input("Customer ID", key="customer_id_input")
+                customer_name = st.text_input("Customer Name", key="customer_name_input")
+                revenue = st.number_input("Revenue", min_value=0.0, key="customer_revenue_input")
+                profit_margin = st.number_input("Profit Margin %", min_value=0.0, max_value=100.0, key="profit_margin_input")
+            
+            with col2:
+                profitability = st.number_input("Profitability", min_value=0.0, key="profitability_input")
+                costs_to_serve = st.number_input("Costs to Serve", min_value=0.0, key="costs_to_serve_input")
+                segment = st.selectbox("Segment", ["Enterprise", "Mid-Market", "SMB"], key="segment_input")
+                region = st.selectbox("Region", ["North America", "Europe", "Asia", "Latin America"], key="region_input")
+            
+            with col3:
+                lifetime_value = st.number_input("Lifetime Value", min_value=0.0, key="ltv_input")
+            
+            if st.button("Add Customer Data", key="add_customer_data"):
+                new_customer = pd.DataFrame([{
+                    'customer_id': customer_id,
+                    'customer_name': customer_name,
+                    'revenue': revenue,
+                    'profit_margin': profit_margin,
+                    'profitability': profitability,
+                    'costs_to_serve': costs_to_serve,
+                    'segment': segment,
+                    'region': region,
+                    'lifetime_value': lifetime_value
+                }])
+                set_table('customer_data', pd.concat([st.session_state.customer_data, new_customer], ignore_index=True))
+                st.success("Customer Data added successfully!")
+            
+            # Display existing data
+            if not st.session_state.customer_data.empty:
+                st.subheader("Existing Customer Data")
+                display_dataframe_with_index_1(st.session_state.customer_data)
+        
+        with manual_tab8:
+            st.subheader("Product Data")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                product_id = st.text_input("Product ID", key="product_id_input")
+                product_name = st.text_input("Product Name", key="product_name_input")
+                revenue = st.number_input("Revenue", min_value=0.0, key="product_revenue_input")
+                cost = st.number_input("Cost", min_value=0.0, key="product_cost_input")
+            
+            with col2:
+                total_costs = st.number_input("Total Costs", min_value=0.0, key="total_costs_input")
+                direct_costs = st.number_input("Direct Costs", min_value=0.0, key="direct_costs_input")
+                allocated_costs = st.number_input("Allocated Costs", min_value=0.0, key="allocated_costs_input")
+                margin = st.number_input("Margin", min_value=0.0, key="product_margin_input")
+            
+            with col3:
+                category = st.selectbox("Category", ["Software", "Hardware", "Services", "Consulting"], key="product_category_input")
+                lifecycle_stage = st.selectbox("Lifecycle Stage", ["Introduction", "Growth", "Maturity", "Decline"], key="lifecycle_input")
+            
+            if st.button("Add Product Data", key="add_product_data"):
+                new_product = pd.DataFrame([{
+                    'product_id': product_id,
+                    'product_name': product_name,
+                    'revenue': revenue,
+                    'cost': cost,
+                    'total_costs': total_costs,
+                    'direct_costs': direct_costs,
+                    'allocated_costs': allocated_costs,
+                    'margin': margin,
+                    'category': category,
+                    'lifecycle_stage': lifecycle_stage
+                }])
+                set_table('product_data', pd.concat([st.session_state.product_data, new_product], ignore_index=True))
+                st.success("Product Data added successfully!")
+            
+            # Display existing data
+            if not st.session_state.product_data.empty:
+                st.subheader("Existing Product Data")
+                display_dataframe_with_index_1(st.session_state.product_data)
+        
+        with manual_tab9:
+            st.subheader("Value Chain")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                function = st.text_input("Function", key="function_input")
+                cost = st.number_input("Cost", min_value=0.0, key="vc_cost_input")
+                efficiency_score = st.number_input("Efficiency Score", min_value=0.0, max_value=100.0, key="efficiency_input")
+            
+            with col2:
+                value_added = st.number_input("Value Added", min_value=0.0, key="value_added_input")
+                process_time = st.number_input("Process Time (days)", min_value=0, key="process_time_input")
+            
+            if st.button("Add Value Chain Data", key="add_value_chain"):
+                new_vc = pd.DataFrame([{
+                    'function': function,
+                    'cost': cost,
+                    'efficiency_score': efficiency_score,
+                    'value_added': value_added,
+                    'process_time': process_time
+                }])
+                set_table('value_chain', pd.concat([st.session_state.value_chain, new_vc], ignore_index=True))
+                st.success("Value Chain Data added successfully!")
+            
+            # Display existing data
+            if not st.session_state.value_chain.empty:
+                st.subheader("Existing Value Chain Data")
+                display_dataframe_with_index_1(st.session_state.value_chain)
+    
+    with upload_tab4:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                    padding: 20px; border-radius: 12px; margin: 20px 0; color: white;">
+            <h3 style="color: white; margin: 0 0 15px 0;">🎯 Sample Data for Testing</h3>
+            <p style="margin: 0; opacity: 0.9;">
+                Load comprehensive sample data to test all analytics features. This includes 100+ records across all data types.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Sample data loading section
+        st.markdown("### 📊 Load Sample Dataset")
+        
+        if st.button("🚀 Load Sample Data", type="primary", use_container_width=True):
+            try:
+                # Generate sample finance data
+                sample_data = generate_sample_finance_data()
+                
+                # Update session state
+                set_table('income_statement', sample_data['income_statement'])
+                set_table('balance_sheet', sample_data['balance_sheet'])
+                set_table('cash_flow', sample_data['cash_flow'])
+                set_table('budget', sample_data['budget'])
+                set_table('forecast', sample_data['forecast'])
+                set_table('market_data', sample_data['market_data'])
+                set_table('customer_data', sample_data['customer_data'])
+                set_table('product_data', sample_data['product_data'])
+                set_table('value_chain', sample_data['value_chain'])
+                
+                # Show success message
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%); 
+                            padding: 20px; border-radius: 12px; margin: 20px 0; color: white;">
+                    <h4 style="color: white; margin: 0 0 10px 0;">✅ Sample Data Loaded Successfully!</h4>
+                    <p style="margin: 0; opacity: 0.9;">
+                        📈 Income Statements: {len(sample_data['income_statement'])} records<br>
+                        💰 Balance Sheets: {len(sample_data['balance_sheet'])} records<br>
+                        💸 Cash Flows: {len(sample_data['cash_flow'])} records<br>
+                        📋 Budgets: {len(sample_data['budget'])} records<br>
+                        🔮 Forecasts: {len(sample_data['forecast'])} records<br>
+                        📊 Market Data: {len(sample_data['market_data'])} records<br>
+                        👥 Customers: {len(sample_data['customer_data'])} records<br>
+                        📦 Products: {len(sample_data['product_data'])} records<br>
+                        🏗️ Value Chain: {len(sample_data['value_chain'])} records
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.success("🎉 You can now explore all analytics features with the sample data!")
+                st.info("💡 **Next Step:** Navigate to other tabs (like '📈 Financial Performance') to see your analytics!")
+                
+            except Exception as e:
+                st.error(f"❌ Error loading sample data: {str(e)}")
+                st.info("💡 Sample data generation function will be created.")
+        
+        # Data preview section
+        st.markdown("### 👀 Sample Data Preview")
+        
+        if not st.session_state.income_statement.empty:
+            st.markdown("**📈 Income Statement Preview:**")
+            st.dataframe(st.session_state.income_statement.head(), use_container_width=True)
+        else:
+            st.info("💡 Click 'Load Sample Data' to see a preview of the sample data.")
+    
+    # Data summary section with modern cards
+    st.markdown("### 📊 Data Summary")
+    
+    # Create summary cards
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card-blue">
+            <div style="display: flex; align-items: center; justify-content: space-between;">
+                <div>
+                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Income Statements</h4>
+                    <h2 style="margin: 5px 0; font-size: 1.8rem; font-weight: 700;">{len(st.session_state.income_statement):,}</h2>
+                </div>
+                <div style="font-size: 2rem;">📈</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card-purple">
+            <div style="display: flex; align-items: center; justify-content: space-between;">
+                <div>
+                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Balance Sheets</h4>
+                    <h2 style="margin: 5px 0; font-size: 1.8rem; font-weight: 700;">{len(st.session_state.balance_sheet):,}</h2>
+                </div>
+                <div style="font-size: 2rem;">💰</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card-orange">
+            <div style="display: flex; align-items: center; justify-content: space-between;">
+                <div>
+                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Cash Flows</h4>
+                    <h2 style="margin: 5px 0; font-size: 1.8rem; font-weight: 700;">{len(st.session_state.cash_flow):,}</h2>
+                </div>
+                <div style="font-size: 2rem;">💸</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card-teal">
+            <div style="display: flex; align-items: center; justify-content: space-between;">
+                <div>
+                    <h4 style="margin: 0; font-size: 0.9rem; opacity: 0.9;">Customers</h4>
+                    <h2 style="margin: 5px 0; font-size: 1.8rem; font-weight: 700;">{len(st.session_state.customer_data):,}</h2>
+                </div>
+                <div style="font-size: 2rem;">👥</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Export data section
+    st.markdown("### 📤 Export Data")
+    
+    if (not st.session_state.income_statement.empty or not st.session_state.balance_sheet.empty or 
+        not st.session_state.cash_flow.empty or not st.session_state.budget.empty or 
+        not st.session_state.forecast.empty or not st.session_state.market_data.empty or 
+        not st.session_state.customer_data.empty or not st.session_state.product_data.empty or 
+        not st.session_state.value_chain.empty):
+        
+        export_output = export_data_to_excel()
+        
+        st.download_button(
+            label="📤 Export All Data",
+            data=export_output.getvalue(),
+            file_name=f"finance_analytics_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        
+        st.markdown("""
+        <div class="chart-container">
+            <p style="color: #34495e; margin: 0;"><strong>Export includes:</strong> All loaded datasets with summary sheet and data quality metrics</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="chart-container">
+            <p style="color: #f97316; margin: 0;">📝 No data to export. Please upload data files first.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Data tables section
+    st.markdown("### 📋 Data Tables")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="chart-container">
+            <h5 style="color: #2c3e50; margin-bottom: 10px;">📈 Income Statement</h5>
+        </div>
+        """, unsafe_allow_html=True)
+        if not st.session_state.income_statement.empty:
+            display_dataframe_with_index_1(st.session_state.income_statement, use_container_width=True)
+        else:
+            st.markdown("""
+            <div class="chart-container">
+                <p style="color: #6b7280; text-align: center; margin: 0;">No income statement data available</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="chart-container">
+            <h5 style="color: #2c3e50; margin-bottom: 10px;">💰 Balance Sheet</h5>
+        </div>
+        """, unsafe_allow_html=True)
+        if not st.session_state.balance_sheet.empty:
+            display_dataframe_with_index_1(st.session_state.balance_sheet, use_container_width=True)
+        else:
+            st.markdown("""
+            <div class="chart-container">
+                <p style="color: #6b7280; text-align: center; margin: 0;">No balance sheet data available</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        st.markdown("""
+        <div class="chart-container">
+            <h5 style="color: #2c3e50; margin-bottom: 10px;">💸 Cash Flow</h5>
+        </div>
+        """, unsafe_allow_html=True)
+        if not st.session_state.cash_flow.empty:
+            display_dataframe_with_index_1(st.session_state.cash_flow, use_container_width=True)
+        else:
+            st.markdown("""
+            <div class="chart-container">
+                <p style="color: #6b7280; text-align: center; margin: 0;">No cash flow data available</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="chart-container">
+            <h5 style="color: #2c3e50; margin-bottom: 10px;">👥 Customers</h5>
+        </div>
+        """, unsafe_allow_html=True)
+        if not st.session_state.customer_data.empty:
+            display_dataframe_with_index_1(st.session_state.customer_data, use_container_width=True)
+        else:
+            st.markdown("""
+            <div class="chart-container">
+                <p style="color: #6b7280; text-align: center; margin: 0;">No customer data available</p>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,366 @@
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_efficiency_metrics
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+
+def show_efficiency_productivity():
+    st.markdown("""
+    <div class="section-header">
+        <h3>⚡ Efficiency and Productivity</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.income_statement.empty and st.session_state.balance_sheet.empty:
+        st.info("⚡ Please upload income statement and balance sheet data to view efficiency and productivity analytics.")
+        return
+    
+    # Calculate efficiency metrics
+    efficiency_summary, efficiency_message = calculate_efficiency_metrics(
+        st.session_state.income_statement, st.session_state.balance_sheet
+    )
+    
+    # Display summary metrics
+    st.subheader("⚡ Efficiency and Productivity Overview")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if not efficiency_summary.empty:
+            roa = efficiency_summary.iloc[0]['roa_pct']
+            st.metric("Return on Assets (ROA)", f"{roa:.1f}%")
+    
+    with col2:
+        if not efficiency_summary.empty and len(efficiency_summary) > 1:
+            roe = efficiency_summary.iloc[0]['roe_pct']
+            st.metric("Return on Equity (ROE)", f"{roe:.1f}%")
+    
+    with col3:
+        if not efficiency_summary.empty and len(efficiency_summary) > 2:
+            asset_turnover = efficiency_summary.iloc[0]['asset_turnover']
+            st.metric("Asset Turnover Ratio", f"{asset_turnover:.2f}")
+    
+    with col4:
+        if not efficiency_summary.empty and len(efficiency_summary) > 3:
+            op_exp_ratio = efficiency_summary.iloc[0]['op_exp_ratio_pct']
+            st.metric("Operating Expense Ratio", f"{op_exp_ratio:.1f}%")
+    
+    st.info(efficiency_message)
+    
+    # Detailed analytics tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📊 ROA & ROE Analysis", "🔄 Asset Turnover", "💰 Expense Efficiency", "📈 Productivity Trends"
+    ])
+    
+    # Calculate efficiency metrics for all tabs
+    efficiency_data = None
+    if not st.session_state.income_statement.empty and not st.session_state.balance_sheet.empty:
+        try:
+            efficiency_data = st.session_state.income_statement.merge(
+                st.session_state.balance_sheet[['period', 'total_assets', 'shareholder_equity']], 
+                on='period', how='inner'
+            )
+            efficiency_data['roa'] = (efficiency_data['net_income'] / efficiency_data['total_assets'] * 100).round(2)
+            efficiency_data['roe'] = (efficiency_data['net_income'] / efficiency_data['shareholder_equity'] * 100).round(2)
+            efficiency_data['asset_turnover'] = (efficiency_data['revenue'] / efficiency_data['total_assets']).round(2)
+            
+            # Debug: Show efficiency data structure
+            if st.checkbox("Show efficiency data debug"):
+                st.write("Efficiency data columns:", list(efficiency_data.columns))
+                st.write("Efficiency data shape:", efficiency_data.shape)
+                st.write("Sample efficiency data:", efficiency_data.head())
+        except Exception as e:
+            st.error(f"❌ Error creating efficiency data: {str(e)}")
+            efficiency_data = None
+    
+    with tab1:
+        st.subheader("📊 ROA & ROE Analysis")
+        
+        if efficiency_data is not None:
+            
+            # ROA trend
+            fig = go.Figure(data=[
+                go.Scatter(x=efficiency_data['period'], y=efficiency_data['roa'],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='ROA (%)')
+            ])
+            fig.update_layout(
+                title="Return on Assets (ROA) Trend",
+                xaxis_title="Period",
+                yaxis_title="ROA (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=10, line_dash="dash", line_color="green", annotation_text="Good (10%)")
+            fig.add_hline(y=5, line_dash="dash", line_color="orange", annotation_text="Average (5%)")
+            st.plotly_chart(fig, use_container_width=True, key="chart_13")
+            
+            # ROE trend
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = go.Figure(data=[
+                    go.Scatter(x=efficiency_data['period'], y=efficiency_data['roe'],
+                              mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                              marker=dict(size=8), name='ROE (%)')
+                ])
+                fig.update_layout(
+                    title="Return on Equity (ROE) Trend",
+                    xaxis_title="Period",
+                    yaxis_title="ROE (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=15, line_dash="dash", line_color="green", annotation_text="Good (15%)")
+                fig.add_hline(y=10, line_dash="dash", line_color="orange", annotation_text="Average (10%)")
+                st.plotly_chart(fig, use_container_width=True, key="chart_14")
+            
+            with col2:
+                # ROA vs ROE comparison
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=efficiency_data['period'], y=efficiency_data['roa'],
+                                        mode='lines+markers', name='ROA', line=dict(color='#1f77b4')))
+                fig.add_trace(go.Scatter(x=efficiency_data['period'], y=efficiency_data['roe'],
+                                        mode='lines+markers', name='ROE', line=dict(color='#2ca02c')))
+                fig.update_layout(
+                    title="ROA vs ROE Comparison",
+                    xaxis_title="Period",
+                    yaxis_title="Return (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_15")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI ROA/ROE Analysis Recommendations")
+            if 'roa_roe_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('efficiency_productivity', 'roa_roe_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab2:
+        st.subheader("🔄 Asset Turnover")
+        
+        if efficiency_data is not None:
+            # Asset turnover analysis
+            asset_turnover_data = efficiency_data.copy()
+            
+            fig = go.Figure(data=[
+                go.Scatter(x=asset_turnover_data['period'], y=asset_turnover_data['asset_turnover'],
+                          mode='lines+markers', line=dict(color='#ff7f0e', width=3),
+                          marker=dict(size=8), name='Asset Turnover')
+            ])
+            fig.update_layout(
+                title="Asset Turnover Ratio Trend",
+                xaxis_title="Period",
+                yaxis_title="Asset Turnover Ratio",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_16")
+            
+            # Asset utilization analysis
+            latest_data = asset_turnover_data.iloc[-1]
+            asset_utilization = {
+                'Revenue': latest_data['revenue'],
+                'Total Assets': latest_data['total_assets'],
+                'Asset Turnover': latest_data['asset_turnover']
+            }
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total Revenue", f"${latest_data['revenue']:,.0f}")
+                st.metric("Total Assets", f"${latest_data['total_assets']:,.0f}")
+            
+            with col2:
+                st.metric("Asset Turnover", f"{latest_data['asset_turnover']:.2f}")
+                efficiency_score = (latest_data['asset_turnover'] / 1.0) * 100  # Benchmark of 1.0
+                st.metric("Efficiency Score", f"{efficiency_score:.1f}%")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Asset Turnover Recommendations")
+            if 'asset_turnover' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('efficiency_productivity', 'asset_turnover')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab3:
+        st.subheader("💰 Expense Efficiency")
+        
+        if not st.session_state.income_statement.empty:
+            # Operating expense ratio analysis
+            expense_data = st.session_state.income_statement.copy()
+            expense_data['op_exp_ratio'] = (expense_data['operating_expenses'] / expense_data['revenue'] * 100).round(2)
+            expense_data['cogs_ratio'] = (expense_data['cost_of_goods_sold'] / expense_data['revenue'] * 100).round(2)
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=expense_data['period'], y=expense_data['op_exp_ratio'],
+                                    mode='lines+markers', name='Operating Expense Ratio', line=dict(color='#1f77b4')))
+            fig.add_trace(go.Scatter(x=expense_data['period'], y=expense_data['cogs_ratio'],
+                                    mode='lines+markers', name='COGS Ratio', line=dict(color='#2ca02c')))
+            fig.update_layout(
+                title="Expense Ratios Over Time",
+                xaxis_title="Period",
+                yaxis_title="Ratio (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_17")
+            
+            # Expense breakdown
+            latest_expense = expense_data.iloc[-1]
+            expense_breakdown = {}
+            
+            # Add available expense categories
+            if 'cost_of_goods_sold' in latest_expense.index:
+                expense_breakdown['Cost of Goods Sold'] = latest_expense['cost_of_goods_sold']
+            if 'operating_expenses' in latest_expense.index:
+                expense_breakdown['Operating Expenses'] = latest_expense['operating_expenses']
+            if 'interest_expense' in latest_expense.index:
+                expense_breakdown['Interest Expense'] = latest_expense['interest_expense']
+            if 'income_tax_expense' in latest_expense.index:
+                expense_breakdown['Income Tax'] = latest_expense['income_tax_expense']
+            
+            # If no expense categories found, show a message
+            if not expense_breakdown:
+                st.warning("⚠️ No expense data available for breakdown analysis.")
+                return
+            
+            fig = px.pie(values=list(expense_breakdown.values()), names=list(expense_breakdown.keys()),
+                        title="Expense Breakdown")
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            st.plotly_chart(fig, use_container_width=True, key="chart_18")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Expense Efficiency Recommendations")
+            if 'expense_efficiency' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('efficiency_productivity', 'expense_efficiency')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab4:
+        st.subheader("📈 Productivity Trends")
+        
+        if efficiency_data is not None and not efficiency_data.empty:
+            try:
+                # Productivity metrics
+                productivity_data = efficiency_data.copy()
+                productivity_data['revenue_per_asset'] = (productivity_data['revenue'] / productivity_data['total_assets']).round(2)
+                productivity_data['profit_per_asset'] = (productivity_data['net_income'] / productivity_data['total_assets']).round(2)
+            except Exception as e:
+                st.error(f"❌ Error creating productivity data: {str(e)}")
+                return
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=productivity_data['period'], y=productivity_data['revenue_per_asset'],
+                                    mode='lines+markers', name='Revenue per Asset', line=dict(color='#1f77b4')))
+            fig.add_trace(go.Scatter(x=productivity_data['period'], y=productivity_data['profit_per_asset'],
+                                    mode='lines+markers', name='Profit per Asset', line=dict(color='#2ca02c')))
+            fig.update_layout(
+                title="Productivity Metrics",
+                xaxis_title="Period",
+                yaxis_title="Amount per Asset ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_19")
+            
+            # Efficiency insights
+            try:
+                latest_prod = productivity_data.iloc[-1]
+            except Exception as e:
+                st.error(f"❌ Error accessing productivity data: {str(e)}")
+                return
+            
+            # Show debug information if needed
+            if st.checkbox("Show productivity debug info"):
+                st.write("Productivity data columns:", list(productivity_data.columns))
+                st.write("Latest prod keys:", list(latest_prod.index))
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if latest_prod['roa'] >= 10:
+                    st.success(f"✅ ROA: {latest_prod['roa']:.1f}% (Excellent)")
+                elif latest_prod['roa'] >= 5:
+                    st.info(f"ℹ️ ROA: {latest_prod['roa']:.1f}% (Good)")
+                else:
+                    st.warning(f"⚠️ ROA: {latest_prod['roa']:.1f}% (Needs Improvement)")
+            
+            with col2:
+                if latest_prod['roe'] >= 15:
+                    st.success(f"✅ ROE: {latest_prod['roe']:.1f}% (Excellent)")
+                elif latest_prod['roe'] >= 10:
+                    st.info(f"ℹ️ ROE: {latest_prod['roe']:.1f}% (Good)")
+                else:
+                    st.warning(f"⚠️ ROE: {latest_prod['roe']:.1f}% (Needs Improvement)")
+            
+            with col3:
+                try:
+                    if latest_prod['asset_turnover'] >= 1.0:
+                        st.success(f"✅ Asset Turnover: {latest_prod['asset_turnover']:.2f} (Good)")
+                    else:
+                        st.warning(f"⚠️ Asset Turnover: {latest_prod['asset_turnover']:.2f} (Low)")
+                except KeyError:
+                    st.error("❌ Asset Turnover data not available")
+            
+            # Recommendations
+            st.write("**Efficiency Recommendations:**")
+            if latest_prod['roa'] < 5:
+                st.warning("⚠️ **Low ROA**: Consider improving asset utilization or reducing costs.")
+            
+            if latest_prod['roe'] < 10:
+                st.warning("⚠️ **Low ROE**: Review capital structure and profitability drivers.")
+            
+            try:
+                if latest_prod['asset_turnover'] < 1.0:
+                    st.warning("⚠️ **Low Asset Turnover**: Consider divesting underutilized assets or improving sales.")
+            except KeyError:
+                pass
+            
+            if latest_prod['roa'] >= 10 and latest_prod['roe'] >= 15:
+                st.success("✅ **Excellent Efficiency**: Strong asset utilization and profitability metrics.")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Productivity Trends Recommendations")
+            if 'productivity_trends' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('efficiency_productivity', 'productivity_trends')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded income statement and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
@@ -0,0 +1,549 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_financial_performance_metrics
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+
+def show_financial_performance():
+    st.markdown("""
+    <div class="section-header">
+        <h3>📊 Financial Performance Analysis</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.income_statement.empty and st.session_state.balance_sheet.empty:
+        st.info("📊 Please upload income statement and balance sheet data to view financial performance analytics.")
+        return
+    
+    # Calculate financial performance metrics
+    performance_summary, performance_message = calculate_financial_performance_metrics(
+        st.session_state.income_statement, st.session_state.balance_sheet
+    )
+    
+    # Display summary metrics
+    st.subheader("📈 Financial Performance Overview")
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        if not performance_summary.empty:
+            revenue = performance_summary.iloc[0]['revenue']
+            st.metric("Revenue", f"${revenue:,.0f}")
+    
+    with col2:
+        if not performance_summary.empty and len(performance_summary) > 1:
+            gross_margin = performance_summary.iloc[0]['gross_margin_pct']
+            st.metric("Gross Margin", f"{gross_margin:.1f}%")
+    
+    with col3:
+        if not performance_summary.empty and len(performance_summary) > 2:
+            operating_margin = performance_summary.iloc[0]['operating_margin_pct']
+            st.metric("Operating Margin", f"{operating_margin:.1f}%")
+    
+    with col4:
+        if not performance_summary.empty and len(performance_summary) > 3:
+            net_margin = performance_summary.iloc[0]['net_margin_pct']
+            st.metric("Net Margin", f"{net_margin:.1f}%")
+    
+    with col5:
+        if not performance_summary.empty and len(performance_summary) > 4:
+            net_income = performance_summary.iloc[0]['net_income']
+            st.metric("Net Income", f"${net_income:,.0f}")
+    
+    st.info(performance_message)
+    
+    # Enhanced analytics tabs
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "📈 Revenue Analysis", "💰 Margin Analysis", "📊 Profitability Trends", 
+        "📋 Performance Insights", "🎯 Performance Scoring", "🚀 Optimization Recommendations"
+    ])
+    
+    with tab1:
+        st.subheader("📈 Revenue Analysis")
+        
+        if not st.session_state.income_statement.empty:
+            # Enhanced revenue analysis
+            revenue_trend = st.session_state.income_statement.groupby('period').agg({
+                'revenue': 'sum'
+            }).reset_index()
+            
+            # Calculate revenue growth rates
+            if len(revenue_trend) > 1:
+                revenue_trend['growth_rate'] = revenue_trend['revenue'].pct_change() * 100
+                revenue_trend['cumulative_growth'] = ((revenue_trend['revenue'] / revenue_trend['revenue'].iloc[0]) - 1) * 100
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Revenue trend chart
+                fig = go.Figure(data=[
+                    go.Scatter(x=revenue_trend['period'], y=revenue_trend['revenue'],
+                              mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                              marker=dict(size=8), name='Revenue')
+                ])
+                fig.update_layout(
+                    title="Revenue Trend Over Time",
+                    xaxis_title="Period",
+                    yaxis_title="Revenue ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_1")
+            
+            with col2:
+                # Revenue growth analysis
+                if len(revenue_trend) > 1:
+                    fig = go.Figure()
+                    fig.add_trace(go.Bar(
+                        x=revenue_trend['period'].iloc[1:],
+                        y=revenue_trend['growth_rate'].iloc[1:],
+                        name='Period Growth Rate',
+                        marker_color='#2ca02c'
+                    ))
+                    fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="No Growth")
+                    fig.update_layout(
+                        title="Revenue Growth Rate by Period",
+                        xaxis_title="Period",
+                        yaxis_title="Growth Rate (%)",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)'
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="chart_1_growth")
+            
+            # Revenue insights and metrics
+            if len(revenue_trend) > 1:
+                st.markdown("### 📊 Revenue Analysis Insights")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    total_revenue = revenue_trend['revenue'].sum()
+                    st.metric("Total Revenue", f"${total_revenue:,.0f}")
+                
+                with col2:
+                    avg_revenue = revenue_trend['revenue'].mean()
+                    st.metric("Average Revenue", f"${avg_revenue:,.0f}")
+                
+                with col3:
+                    if 'growth_rate' in revenue_trend.columns:
+                        avg_growth = revenue_trend['growth_rate'].iloc[1:].mean()
+                        st.metric("Average Growth", f"{avg_growth:+.1f}%")
+                
+                with col4:
+                    if 'cumulative_growth' in revenue_trend.columns:
+                        total_growth = revenue_trend['cumulative_growth'].iloc[-1]
+                        st.metric("Total Growth", f"{total_growth:+.1f}%")
+                
+                # Growth trend analysis
+                latest_growth = revenue_trend['growth_rate'].iloc[-1] if 'growth_rate' in revenue_trend.columns else 0
+                if latest_growth > 10:
+                    st.success(f"🚀 **Strong Revenue Growth**: {latest_growth:+.1f}% - Excellent performance!")
+                elif latest_growth > 5:
+                    st.info(f"📈 **Good Revenue Growth**: {latest_growth:+.1f}% - Maintain momentum")
+                elif latest_growth > 0:
+                    st.warning(f"📊 **Moderate Revenue Growth**: {latest_growth:+.1f}% - Room for improvement")
+                else:
+                    st.error(f"📉 **Revenue Decline**: {latest_growth:+.1f}% - Immediate action required")
+            
+            # Add AI recommendations for Revenue Analysis
+            if 'financial_performance' in RECOMMENDATION_RULES:
+                st.markdown("---")
+                try:
+                    ai_recommendations = page_recommendation('financial_performance', 'financial_performance')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+            
+
+    
+    with tab2:
+        st.subheader("💰 Margin Analysis")
+        
+        if not st.session_state.income_statement.empty:
+            # Margin analysis
+            margin_analysis = st.session_state.income_statement.copy()
+            margin_analysis['gross_margin_pct'] = ((margin_analysis['revenue'] - margin_analysis['cost_of_goods_sold']) / margin_analysis['revenue'] * 100).round(1)
+            margin_analysis['operating_margin_pct'] = (margin_analysis['operating_income'] / margin_analysis['revenue'] * 100).round(1)
+            margin_analysis['net_margin_pct'] = (margin_analysis['net_income'] / margin_analysis['revenue'] * 100).round(1)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = go.Figure(data=[
+                    go.Bar(x=margin_analysis['period'], y=margin_analysis['gross_margin_pct'],
+                           marker_color='#2ca02c', name='Gross Margin',
+                           text=margin_analysis['gross_margin_pct'],
+                           textposition='auto')
+                ])
+                fig.update_layout(
+                    title="Gross Margin by Period",
+                    xaxis_title="Period",
+                    yaxis_title="Gross Margin (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_2")
+            
+            with col2:
+                fig = go.Figure(data=[
+                    go.Bar(x=margin_analysis['period'], y=margin_analysis['net_margin_pct'],
+                           marker_color='#ff7f0e', name='Net Margin',
+                           text=margin_analysis['net_margin_pct'],
+                           textposition='auto')
+                ])
+                fig.update_layout(
+                    title="Net Margin by Period",
+                    xaxis_title="Period",
+                    yaxis_title="Net Margin (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_3")
+            
+            # Add AI recommendations for Margin Analysis
+            if 'financial_performance' in RECOMMENDATION_RULES:
+                st.markdown("---")
+                try:
+                    ai_recommendations = page_recommendation('financial_performance', 'financial_performance')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+            
+
+    
+    with tab3:
+        st.subheader("📊 Profitability Trends")
+        
+        if not st.session_state.income_statement.empty:
+            # Profitability trends
+            profitability_trends = st.session_state.income_statement.groupby('period').agg({
+                'revenue': 'sum',
+                'net_income': 'sum'
+            }).reset_index()
+            profitability_trends['profitability_ratio'] = (profitability_trends['net_income'] / profitability_trends['revenue'] * 100).round(1)
+            
+            fig = go.Figure(data=[
+                go.Scatter(x=profitability_trends['period'], y=profitability_trends['profitability_ratio'],
+                          mode='lines+markers', line=dict(color='#9467bd', width=3),
+                          marker=dict(size=8), name='Profitability Ratio')
+            ])
+            fig.update_layout(
+                title="Profitability Ratio Trend",
+                xaxis_title="Period",
+                yaxis_title="Profitability Ratio (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_4")
+            
+            # Add AI recommendations for Profitability Trends
+            if 'financial_performance' in RECOMMENDATION_RULES:
+                st.markdown("---")
+                try:
+                    ai_recommendations = page_recommendation('financial_performance', 'financial_performance')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+            
+
+    
+    with tab4:
+        st.subheader("📋 Performance Insights")
+        
+        if not st.session_state.income_statement.empty:
+            # Performance insights
+            st.write("**Financial Performance Summary:**")
+            
+            total_revenue = st.session_state.income_statement['revenue'].sum()
+            total_net_income = st.session_state.income_statement['net_income'].sum()
+            avg_gross_margin = ((total_revenue - st.session_state.income_statement['cost_of_goods_sold'].sum()) / total_revenue * 100) if total_revenue > 0 else 0
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Revenue", f"${total_revenue:,.0f}")
+            with col2:
+                st.metric("Total Net Income", f"${total_net_income:,.0f}")
+            with col3:
+                st.metric("Avg Gross Margin", f"{avg_gross_margin:.1f}%")
+            
+            # Performance recommendations
+            st.write("**Key Performance Indicators:**")
+            if avg_gross_margin > 50:
+                st.success(f"✅ Strong gross margin: {avg_gross_margin:.1f}%")
+            elif avg_gross_margin > 30:
+                st.info(f"ℹ️ Moderate gross margin: {avg_gross_margin:.1f}%")
+            else:
+                st.warning(f"⚠️ Low gross margin: {avg_gross_margin:.1f}% - consider cost optimization")
+            
+            net_margin = (total_net_income / total_revenue * 100) if total_revenue > 0 else 0
+            if net_margin > 15:
+                st.success(f"✅ Excellent net margin: {net_margin:.1f}%")
+            elif net_margin > 10:
+                st.info(f"ℹ️ Good net margin: {net_margin:.1f}%")
+            else:
+                st.warning(f"⚠️ Low net margin: {net_margin:.1f}% - review cost structure")
+            
+            # Add AI recommendations for Performance Insights
+            if 'financial_performance' in RECOMMENDATION_RULES:
+                st.markdown("---")
+                try:
+                    ai_recommendations = page_recommendation('financial_performance', 'financial_performance')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+    
+    with tab5:
+        st.subheader("🎯 Performance Scoring & Trends")
+        
+        if not performance_summary.empty and len(performance_summary) > 1:
+            # Performance score trends
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=performance_summary['period'], 
+                y=performance_summary['performance_score'],
+                mode='lines+markers', 
+                name='Performance Score',
+                line=dict(color='#9467bd', width=3),
+                marker=dict(size=8)
+            ))
+            
+            # Add threshold lines
+            fig.add_hline(y=80, line_dash="dash", line_color="green", annotation_text="Excellent (80+)")
+            fig.add_hline(y=60, line_dash="dash", line_color="blue", annotation_text="Good (60+)")
+            fig.add_hline(y=40, line_dash="dash", line_color="orange", annotation_text="Fair (40+)")
+            fig.add_hline(y=20, line_dash="dash", line_color="red", annotation_text="Poor (<40)")
+            
+            fig.update_layout(
+                title="Performance Score Trends Over Time",
+                xaxis_title="Period",
+                yaxis_title="Performance Score (0-100)",
+                yaxis_range=[0, 100],
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_performance_score")
+            
+            # Performance breakdown
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("### 📊 Performance Components")
+                latest_score = performance_summary.iloc[-1]
+                
+                # Revenue growth component
+                if 'revenue_growth_pct' in latest_score:
+                    growth_score = 0
+                    if latest_score['revenue_growth_pct'] > 10:
+                        growth_score = 25
+                    elif latest_score['revenue_growth_pct'] > 5:
+                        growth_score = 20
+                    elif latest_score['revenue_growth_pct'] > 0:
+                        growth_score = 15
+                    elif latest_score['revenue_growth_pct'] > -5:
+                        growth_score = 10
+                    else:
+                        growth_score = 5
+                    
+                    st.metric("Revenue Growth Score", f"{growth_score}/25")
+                
+                # Margin component
+                margin_score = 0
+                if latest_score['gross_margin_pct'] > 40:
+                    margin_score += 20
+                elif latest_score['gross_margin_pct'] > 30:
+                    margin_score += 15
+                elif latest_score['gross_margin_pct'] > 20:
+                    margin_score += 10
+                else:
+                    margin_score += 5
+                
+                if latest_score['operating_margin_pct'] > 15:
+                    margin_score += 20
+                elif latest_score['operating_margin_pct'] > 10:
+                    margin_score += 15
+                elif latest_score['operating_margin_pct'] > 5:
+                    margin_score += 10
+                else:
+                    margin_score += 5
+                
+                st.metric("Margin Score", f"{margin_score}/50")
+                
+                # Profitability component
+                profit_score = 0
+                if latest_score['net_margin_pct'] > 10:
+                    profit_score = 25
+                elif latest_score['net_margin_pct'] > 5:
+                    profit_score = 20
+                elif latest_score['net_margin_pct'] > 0:
+                    profit_score = 15
+                else:
+                    profit_score = 5
+                
+                st.metric("Profitability Score", f"{profit_score}/25")
+            
+            with col2:
+                st.markdown("### 📈 Trend Analysis")
+                
+                # Moving averages
+                if 'revenue_ma_3' in performance_summary.columns:
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(
+                        x=performance_summary['period'],
+                        y=performance_summary['revenue'],
+                        mode='lines+markers',
+                        name='Actual Revenue',
+                        line=dict(color='#1f77b4', width=2)
+                    ))
+                    fig.add_trace(go.Scatter(
+                        x=performance_summary['period'],
+                        y=performance_summary['revenue_ma_3'],
+                        mode='lines',
+                        name='3-Period Moving Average',
+                        line=dict(color='#ff7f0e', width=3, dash='dash')
+                    ))
+                    fig.update_layout(
+                        title="Revenue with Moving Average",
+                        xaxis_title="Period",
+                        yaxis_title="Revenue ($)",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)'
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="chart_revenue_ma")
+        
+        else:
+            st.info("📊 Performance scoring requires multiple periods of data for trend analysis.")
+    
+    with tab6:
+        st.subheader("🚀 Optimization Recommendations")
+        
+        if not performance_summary.empty:
+            latest_performance = performance_summary.iloc[-1]
+            
+            # Generate optimization recommendations
+            st.markdown("### 🎯 Strategic Optimization Areas")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### 💰 Revenue Optimization")
+                
+                # Revenue growth recommendations
+                if 'revenue_growth_pct' in latest_performance:
+                    growth = latest_performance['revenue_growth_pct']
+                    if growth < 0:
+                        st.error("🚨 **Revenue Decline Detected**")
+                        st.markdown("""
+                        **Immediate Actions:**
+                        • Review pricing strategy
+                        • Analyze market conditions
+                        • Assess competitive positioning
+                        • Optimize sales processes
+                        """)
+                    elif growth < 5:
+                        st.warning("⚠️ **Low Revenue Growth**")
+                        st.markdown("""
+                        **Growth Strategies:**
+                        • Market expansion opportunities
+                        • Product portfolio optimization
+                        • Sales team effectiveness
+                        • Customer acquisition strategies
+                        """)
+                    else:
+                        st.success("✅ **Strong Revenue Growth**")
+                        st.markdown("""
+                        **Maintain Momentum:**
+                        • Scale successful strategies
+                        • Invest in growth areas
+                        • Optimize operational efficiency
+                        • Prepare for expansion
+                        """)
+                
+                # Margin optimization
+                st.markdown("#### 📊 Margin Optimization")
+                gross_margin = latest_performance['gross_margin_pct']
+                if gross_margin < 30:
+                    st.warning("⚠️ **Low Gross Margin**")
+                    st.markdown("""
+                    **Cost Optimization:**
+                    • Review supplier relationships
+                    • Optimize production processes
+                    • Analyze cost structure
+                    • Consider pricing adjustments
+                    """)
+                else:
+                    st.success("✅ **Healthy Gross Margin**")
+                    st.markdown("""
+                    **Maintain Efficiency:**
+                    • Monitor cost trends
+                    • Optimize pricing strategy
+                    • Scale profitable operations
+                    """)
+            
+            with col2:
+                st.markdown("#### ⚡ Operational Efficiency")
+                
+                # Operating margin optimization
+                operating_margin = latest_performance['operating_margin_pct']
+                if operating_margin < 10:
+                    st.warning("⚠️ **Low Operating Margin**")
+                    st.markdown("""
+                    **Efficiency Improvements:**
+                    • Streamline operations
+                    • Reduce overhead costs
+                    • Optimize resource allocation
+                    • Improve process efficiency
+                    """)
+                else:
+                    st.success("✅ **Good Operating Efficiency**")
+                    st.markdown("""
+                    **Continue Optimization:**
+                    • Identify efficiency opportunities
+                    • Leverage technology improvements
+                    • Optimize workflows
+                    """)
+                
+                # Net margin optimization
+                st.markdown("#### 💎 Profitability Optimization")
+                net_margin = latest_performance['net_margin_pct']
+                if net_margin < 5:
+                    st.error("🚨 **Low Net Profitability**")
+                    st.markdown("""
+                    **Critical Actions:**
+                    • Comprehensive cost review
+                    • Revenue enhancement strategies
+                    • Operational restructuring
+                    • Strategic realignment
+                    """)
+                else:
+                    st.success("✅ **Strong Profitability**")
+                    st.markdown("""
+                    **Growth Opportunities:**
+                    • Reinvest in growth areas
+                    • Explore new markets
+                    • Strategic acquisitions
+                    • Technology investments
+                    """)
+            
+            # AI-powered recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI-Powered Optimization Insights")
+            
+            if 'financial_performance' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('financial_performance', 'financial_performance')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+            else:
+                st.info("🤖 AI recommendations will be displayed here when available.")
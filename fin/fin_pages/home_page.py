@@ -0,0 +1,582 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import datetime
+
+from fin_styling import create_metric_card
+from fin_data_utils import generate_sample_finance_data, get_data_summary, validate_data_integrity
+
+def show_home():
+    """Display the home page with overview and key metrics"""
+    
+    st.markdown("## 🏠 Dashboard Overview")
+    
+    # Check if data is loaded
+    if (st.session_state.income_statement.empty and st.session_state.balance_sheet.empty and 
+        st.session_state.cash_flow.empty and st.session_state.budget.empty and 
+        st.session_state.forecast.empty and st.session_state.market_data.empty and
+        st.session_state.customer_data.empty and st.session_state.product_data.empty and
+        st.session_state.value_chain.empty):
+        
+        # EXACTLY like cs.py - Welcome section with 4 colored cards
+        st.markdown("""
+        <div style="text-align: center; padding: 3rem; background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); border-radius: 15px; margin: 2rem 0;">
+            <h2 style="color: #495057; margin-bottom: 1rem;">🎯 Welcome to Finance Analytics</h2>
+            <p style="color: #6c757d; font-size: 1.1rem; margin-bottom: 2rem;">
+                Get started by uploading your financial data or generating sample data to explore the dashboard features.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # EXACTLY like cs.py - 4 colored metric cards
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(create_metric_card(
+                "Analytics Categories", 
+                "10 comprehensive",
+                "analysis areas"
+            ), unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(create_metric_card(
+                "Financial Analytics", 
+                "Performance",
+                "metrics & insights"
+            ), unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown(create_metric_card(
+                "Real-time", 
+                "Live data",
+                "updates"
+            ), unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown(create_metric_card(
+                "Predictive", 
+                "Advanced",
+                "analytics"
+            ), unsafe_allow_html=True)
+        
+        # EXACTLY like cs.py - Available analytics categories (6 cards in 2 columns)
+        st.markdown("### 📊 Available Finance Analytics Categories:")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Card 1: Financial Performance Analysis
+            st.markdown("""
+            <div style="background: white; padding: 1.5rem; border-radius: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h4 style="color: #495057; margin-bottom: 1rem;">📊 Financial Performance Analysis</h4>
+                <ul style="color: #6c757d; margin: 0; padding-left: 1.5rem;">
+                    <li>Revenue Growth Rate Analysis</li>
+                    <li>Gross Margin Optimization</li>
+                    <li>Operating Margin Tracking</li>
+                    <li>Net Margin Analysis</li>
+                    <li>Earnings per Share (EPS) Calculation</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Card 2: Liquidity and Solvency
+            st.markdown("""
+            <div style="background: white; padding: 1.5rem; border-radius: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h4 style="color: #495057; margin-bottom: 1rem;">💧 Liquidity and Solvency</h4>
+                <ul style="color: #6c757d; margin: 0; padding-left: 1.5rem;">
+                    <li>Current Ratio Analysis</li>
+                    <li>Quick Ratio Assessment</li>
+                    <li>Cash Conversion Cycle (CCC)</li>
+                    <li>Debt Service Coverage Ratio (DSCR)</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Card 3: Efficiency and Productivity
+            st.markdown("""
+            <div style="background: white; padding: 1.5rem; border-radius: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h4 style="color: #495057; margin-bottom: 1rem;">⚡ Efficiency and Productivity</h4>
+                <ul style="color: #6c757d; margin: 0; padding-left: 1.5rem;">
+                    <li>Return on Assets (ROA)</li>
+                    <li>Return on Equity (ROE)</li>
+                    <li>Asset Turnover Ratio</li>
+                    <li>Operating Expense Ratio</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            # Card 4: Budgeting, Forecasting & Variance
+            st.markdown("""
+            <div style="background: white; padding: 1.5rem; border-radius: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h4 style="color: #495057; margin-bottom: 1rem;">📋 Budgeting, Forecasting & Variance</h4>
+                <ul style="color: #6c757d; margin: 0; padding-left: 1.5rem;">
+                    <li>Budget Variance Analysis</li>
+                    <li>Forecast Accuracy (MAPE)</li>
+                    <li>Scenario Analysis</li>
+                    <li>Variance Reporting</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Card 5: Cash Flow & Working Capital
+            st.markdown("""
+            <div style="background: white; padding: 1.5rem; border-radius: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h4 style="color: #495057; margin-bottom: 1rem;">💸 Cash Flow & Working Capital</h4>
+                <ul style="color: #6c757d; margin: 0; padding-left: 1.5rem;">
+                    <li>Operating Cash Flow Analysis</li>
+                    <li>Free Cash Flow (FCF) Calculation</li>
+                    <li>Working Capital Turnover</li>
+                    <li>Cash Flow Optimization</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Card 6: Capital Structure & Investment
+            st.markdown("""
+            <div style="background: white; padding: 1.5rem; border-radius: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); margin-bottom: 1rem;">
+                <h4 style="color: #495057; margin-bottom: 1rem;">🏗️ Capital Structure & Investment</h4>
+                <ul style="color: #6c757d; margin: 0; padding-left: 1.5rem;">
+                    <li>Debt-to-Equity Ratio</li>
+                    <li>Weighted Average Cost of Capital (WACC)</li>
+                    <li>Interest Coverage Ratio</li>
+                    <li>Capital Structure Optimization</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # EXACTLY like cs.py - Getting Started section (3 cards)
+        st.markdown("### 🚀 Getting Started:")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-bottom: 1rem;">
+                <h4 style="margin-bottom: 1rem;">1. Data Input</h4>
+                <p style="margin: 0;">Enter your financial data in the 'Data Input' tab</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-bottom: 1rem;">
+                <h4 style="margin-bottom: 1rem;">2. Calculate Metrics</h4>
+                <p style="margin: 0;">Use the main tabs to view specific metric categories</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-bottom: 1rem;">
+                <h4 style="margin-bottom: 1rem;">3. Real-time Analysis</h4>
+                <p style="margin: 0;">All metrics update automatically based on your data</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # EXACTLY like cs.py - Data Schema section (8 cards in 2 rows)
+        st.markdown("### 📈 Data Schema:")
+        st.markdown("The application supports the following financial data tables:")
+        
+        # Row 1 (4 cards)
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">💰 Income Statement</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Revenue, costs, and profitability data</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">📊 Balance Sheet</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Assets, liabilities, and equity information</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">💸 Cash Flow</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Operating, investing, and financing activities</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">📋 Budget</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Budgeted vs actual performance</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Row 2 (4 cards)
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">🔮 Forecast</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Forecasted vs actual performance</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">📈 Market Data</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Stock prices, dividends, market cap</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">👥 Customer Data</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Customer profitability analysis</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown("""
+            <div style="background: white; padding: 1rem; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); text-align: center; margin-bottom: 1rem;">
+                <h5 style="color: #495057; margin-bottom: 0.5rem;">📦 Product Data</h5>
+                <p style="color: #6c757d; font-size: 0.9rem; margin: 0;">Product/service profitability</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # EXACTLY like cs.py - Important Note section
+        st.markdown("### 💡 Important Note:")
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-bottom: 1rem;">
+            <p style="margin: 0;">All calculations are performed automatically based on your input data. Make sure to enter complete and accurate data for the most reliable metrics.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Quick actions
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("📊 Upload Data", use_container_width=True):
+                st.session_state.current_page = "📝 Data Input"
+                st.rerun()
+        
+        with col2:
+            if st.button("📝 Manual Entry", use_container_width=True):
+                st.session_state.current_page = "📝 Data Input"
+                st.rerun()
+        
+        with col3:
+            if st.button("📋 Download Template", use_container_width=True):
+                # Generate sample data as template
+                generate_sample_finance_data()
+                st.success("✅ Sample data generated! You can now explore the dashboard features.")
+        
+        return
+    
+    # Data is loaded, show overview
+    st.success("✅ Financial data loaded successfully!")
+    
+    # Data summary
+    data_summary = get_data_summary()
+    
+    # Key metrics display - EXACTLY like cs.py
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(create_metric_card(
+            "Total Revenue", 
+            f"${data_summary.get('Income Statement', 0):,}",
+            "Financial performance"
+        ), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(create_metric_card(
+            "Total Assets", 
+            f"${data_summary.get('Balance Sheet', 0):,}",
+            "Company value"
+        ), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(create_metric_card(
+            "Cash Flow", 
+            f"{data_summary.get('Cash Flow', 0):,}",
+            "Liquidity status"
+        ), unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(create_metric_card(
+            "Budget & Forecast", 
+            f"{data_summary.get('Budget', 0) + data_summary.get('Forecast', 0):,}",
+            "Planning data"
+        ), unsafe_allow_html=True)
+    
+    # Data validation - EXACTLY like cs.py
+    st.markdown("### 🔍 Data Quality Check")
+    validation_results = validate_data_integrity()
+    
+    for result in validation_results:
+        if "✅" in result:
+            st.success(result)
+        elif "⚠️" in result:
+            st.warning(result)
+        else:
+            st.error(result)
+    
+    # Quick insights - EXACTLY like cs.py structure
+    st.markdown("### 💡 Quick Insights")
+    
+    if not st.session_state.income_statement.empty:
+        # Revenue trend
+        if 'revenue' in st.session_state.income_statement.columns and 'period' in st.session_state.income_statement.columns:
+            revenue_data = st.session_state.income_statement[['period', 'revenue']].copy()
+            revenue_data['period'] = pd.to_datetime(revenue_data['period'], errors='coerce')
+            revenue_data = revenue_data.dropna()
+            
+            if not revenue_data.empty:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    # Revenue trend chart
+                    fig = go.Figure(data=[go.Scatter(
+                        x=revenue_data['period'],
+                        y=revenue_data['revenue'],
+                        mode='lines+markers',
+                        line=dict(color='#28a745', width=3),
+                        marker=dict(size=6)
+                    )])
+                    
+                    fig.update_layout(
+                        title="Revenue Trend",
+                        xaxis_title="Period",
+                        yaxis_title="Revenue ($)",
+                        height=300
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                with col2:
+                    # Revenue metrics
+                    total_revenue = revenue_data['revenue'].sum()
+                    avg_revenue = revenue_data['revenue'].mean()
+                    growth_rate = ((revenue_data['revenue'].iloc[-1] / revenue_data['revenue'].iloc[0]) - 1) * 100 if len(revenue_data) > 1 else 0
+                    
+                    st.metric("Total Revenue", f"${total_revenue:,.0f}")
+                    st.metric("Average Revenue", f"${avg_revenue:,.0f}")
+                    st.metric("Growth Rate", f"{growth_rate:.1f}%")
+    
+    # Financial ratios overview - EXACTLY like cs.py structure
+    if not st.session_state.balance_sheet.empty and not st.session_state.income_statement.empty:
+        st.markdown("### 📊 Financial Ratios Overview")
+        
+        # Calculate basic ratios
+        if 'total_assets' in st.session_state.balance_sheet.columns and 'total_equity' in st.session_state.balance_sheet.columns:
+            latest_balance = st.session_state.balance_sheet.iloc[-1]
+            latest_income = st.session_state.income_statement.iloc[-1] if not st.session_state.income_statement.empty else None
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Asset utilization
+                if latest_income is not None and 'revenue' in latest_income:
+                    asset_turnover = latest_income['revenue'] / latest_balance['total_assets'] if latest_balance['total_assets'] > 0 else 0
+                    st.metric("Asset Turnover", f"{asset_turnover:.2f}")
+                
+                st.metric("Total Assets", f"${latest_balance['total_assets']:,.0f}")
+                st.metric("Total Equity", f"${latest_balance['total_equity']:,.0f}")
+            
+            with col2:
+                # Equity ratio
+                equity_ratio = latest_balance['total_equity'] / latest_balance['total_assets'] if latest_balance['total_assets'] > 0 else 0
+                st.metric("Equity Ratio", f"{equity_ratio:.2%}")
+                
+                if 'total_liabilities' in latest_balance:
+                    debt_ratio = latest_balance['total_liabilities'] / latest_balance['total_assets'] if latest_balance['total_assets'] > 0 else 0
+                    st.metric("Debt Ratio", f"{debt_ratio:.2%}")
+    
+    # Profitability overview - EXACTLY like cs.py customer satisfaction structure
+    if not st.session_state.income_statement.empty:
+        st.markdown("### 💰 Profitability Overview")
+        
+        # Calculate profitability metrics
+        if 'revenue' in st.session_state.income_statement.columns and 'net_income' in st.session_state.income_statement.columns:
+            latest_income = st.session_state.income_statement.iloc[-1]
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Profitability metrics table
+                st.markdown("**Profitability Metrics**")
+                profitability_data = pd.DataFrame({
+                    'Metric': ['Revenue', 'Net Income', 'Gross Profit', 'Operating Income'],
+                    'Value': [
+                        f"${latest_income.get('revenue', 0):,.0f}",
+                        f"${latest_income.get('net_income', 0):,.0f}",
+                        f"${latest_income.get('gross_profit', 0):,.0f}",
+                        f"${latest_income.get('operating_income', 0):,.0f}"
+                    ]
+                })
+                st.dataframe(profitability_data, use_container_width=True, hide_index=True)
+            
+            with col2:
+                # Profit margin trend
+                if len(st.session_state.income_statement) > 1:
+                    profit_margins = []
+                    periods = []
+                    
+                    for idx, row in st.session_state.income_statement.iterrows():
+                        if row.get('revenue', 0) > 0 and row.get('net_income', 0) is not None:
+                            margin = (row.get('net_income', 0) / row.get('revenue', 0)) * 100
+                            profit_margins.append(margin)
+                            periods.append(f"Period {idx+1}")
+                    
+                    if profit_margins:
+                        fig = go.Figure(data=[go.Bar(
+                            x=periods,
+                            y=profit_margins,
+                            marker_color='#667eea'
+                        )])
+                        
+                        fig.update_layout(
+                            title="Profit Margin Trend",
+                            xaxis_title="Period",
+                            yaxis_title="Profit Margin (%)",
+                            height=300
+                        )
+                        
+                        st.plotly_chart(fig, use_container_width=True)
+    
+    # Financial performance overview - EXACTLY like cs.py agent performance structure
+    if not st.session_state.balance_sheet.empty and not st.session_state.income_statement.empty:
+        st.markdown("### 📊 Financial Performance Overview")
+        
+        # Calculate performance metrics
+        if 'total_assets' in st.session_state.balance_sheet.columns and 'total_equity' in st.session_state.balance_sheet.columns:
+            latest_balance = st.session_state.balance_sheet.iloc[-1]
+            latest_income = st.session_state.income_statement.iloc[-1] if not st.session_state.income_statement.empty else None
+            
+            if latest_income is not None:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    # Performance metrics table
+                    st.markdown("**Performance Metrics**")
+                    
+                    # Calculate ROA and ROE
+                    roa = (latest_income.get('net_income', 0) / latest_balance.get('total_assets', 1)) * 100 if latest_balance.get('total_assets', 0) > 0 else 0
+                    roe = (latest_income.get('net_income', 0) / latest_balance.get('total_equity', 1)) * 100 if latest_balance.get('total_equity', 0) > 0 else 0
+                    
+                    performance_data = pd.DataFrame({
+                        'Metric': ['ROA (%)', 'ROE (%)', 'Asset Turnover', 'Total Assets'],
+                        'Value': [
+                            f"{roa:.2f}%",
+                            f"{roe:.2f}%",
+                            f"{latest_income.get('revenue', 0) / latest_balance.get('total_assets', 1):.2f}",
+                            f"${latest_balance.get('total_assets', 0):,.0f}"
+                        ]
+                    })
+                    st.dataframe(performance_data, use_container_width=True, hide_index=True)
+                
+                with col2:
+                    # Performance comparison chart
+                    if len(st.session_state.income_statement) > 1:
+                        roa_trend = []
+                        roe_trend = []
+                        periods = []
+                        
+                        for idx, row in st.session_state.income_statement.iterrows():
+                            if idx < len(st.session_state.balance_sheet):
+                                balance_row = st.session_state.balance_sheet.iloc[idx]
+                                if row.get('revenue', 0) > 0 and balance_row.get('total_assets', 0) > 0:
+                                    roa = (row.get('net_income', 0) / balance_row.get('total_assets', 1)) * 100
+                                    roe = (row.get('net_income', 0) / balance_row.get('total_equity', 1)) * 100
+                                    roa_trend.append(roa)
+                                    roe_trend.append(roe)
+                                    periods.append(f"Period {idx+1}")
+                        
+                        if roa_trend and roe_trend:
+                            fig = go.Figure()
+                            fig.add_trace(go.Scatter(x=periods, y=roa_trend, mode='lines+markers', name='ROA', line=dict(color='#28a745')))
+                            fig.add_trace(go.Scatter(x=periods, y=roe_trend, mode='lines+markers', name='ROE', line=dict(color='#667eea')))
+                            
+                            fig.update_layout(
+                                title="ROA vs ROE Trend",
+                                xaxis_title="Period",
+                                yaxis_title="Percentage (%)",
+                                height=300,
+                                showlegend=True
+                            )
+                            
+                            st.plotly_chart(fig, use_container_width=True)
+    
+    # Recent activity - EXACTLY like cs.py structure
+    st.markdown("### 📈 Recent Activity")
+    
+    if not st.session_state.income_statement.empty and 'period' in st.session_state.income_statement.columns:
+        # Convert dates
+        income_with_date = st.session_state.income_statement.copy()
+        income_with_date['period'] = pd.to_datetime(income_with_date['period'], errors='coerce')
+        income_with_date = income_with_date.dropna(subset=['period'])
+        
+        if not income_with_date.empty:
+            # Daily revenue volume (like cs.py daily ticket volume)
+            daily_revenue = income_with_date.groupby(
+                income_with_date['period'].dt.date
+            )['revenue'].sum().reset_index(name='revenue_amount')
+            
+            daily_revenue.columns = ['Date', 'Revenue Amount']
+            daily_revenue = daily_revenue.sort_values('Date').tail(30)  # Last 30 days
+            
+            fig = go.Figure(data=[go.Scatter(
+                x=daily_revenue['Date'],
+                y=daily_revenue['Revenue Amount'],
+                mode='lines+markers',
+                line=dict(color='#667eea', width=3),
+                marker=dict(size=6)
+            )])
+            
+            fig.update_layout(
+                title="Daily Revenue Volume (Last 30 Days)",
+                xaxis_title="Date",
+                yaxis_title="Revenue Amount ($)",
+                height=400
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Quick actions - EXACTLY like cs.py structure
+    st.markdown("### ⚡ Quick Actions")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📊 View Detailed Analytics", use_container_width=True):
+            st.session_state.current_page = "📊 Financial Performance"
+            st.rerun()
+    
+    with col2:
+        if st.button("📝 Manage Data", use_container_width=True):
+            st.session_state.current_page = "📝 Data Input"
+            st.rerun()
+    
+    with col3:
+        if st.button("🔮 Predictive Analytics", use_container_width=True):
+            st.session_state.current_page = "🔮 Predictive Analytics"
+            st.rerun()
+    
+    # System information - EXACTLY like cs.py structure
+    st.markdown("---")
+    st.markdown("### ℹ️ System Information")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.info(f"**Data Last Updated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        st.info(f"**Total Records**: {sum(data_summary.values()):,}")
+    
+    with col2:
+        st.info(f"**Dashboard Version**: 2.0.0")
+        st.info(f"**Data Sources**: {len([k for k, v in data_summary.items() if v > 0])} active datasets")
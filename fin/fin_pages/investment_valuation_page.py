@@ -0,0 +1,395 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_investment_valuation_metrics
+from fin_valuation import (
+    DEFAULT_DISCOUNT_RATE, DEFAULT_RATE_GRID, build_cash_flow_matrix, discount_factors, npv_surface, irr,
+    payback_period as compute_payback_period, value_projects
+)
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+from fin_data_utils import display_dataframe_with_index_1
+
+def show_investment_valuation():
+    st.markdown("""
+    <div class="section-header">
+        <h3>📈 Investment & Valuation</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.cash_flow.empty and st.session_state.balance_sheet.empty:
+        st.info("📈 Please upload cash flow and balance sheet data to view investment and valuation analytics.")
+        return
+    
+    # Calculate investment valuation metrics
+    investment_summary, investment_message = calculate_investment_valuation_metrics(
+        st.session_state.cash_flow, st.session_state.balance_sheet
+    )
+    
+    # Display summary metrics
+    st.subheader("📈 Investment & Valuation Overview")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if not investment_summary.empty:
+            npv = investment_summary.iloc[0]['npv']
+            st.metric("Net Present Value (NPV)", f"${npv:,.0f}")
+    
+    with col2:
+        if not investment_summary.empty and len(investment_summary) > 1:
+            payback_period = investment_summary.iloc[0]['payback_period']
+            if payback_period == float('inf'):
+                st.metric("Payback Period", "Never")
+            else:
+                st.metric("Payback Period", f"{payback_period:.1f} years")
+    
+    with col3:
+        if not investment_summary.empty and len(investment_summary) > 2:
+            eva = investment_summary.iloc[0]['eva']
+            st.metric("Economic Value Added (EVA)", f"${eva:,.0f}")
+    
+    st.info(investment_message)
+    
+    # Detailed analytics tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "💰 NPV Analysis", "⏱️ Payback Period", "📊 EVA Calculation", "🎯 Investment Insights"
+    ])
+    
+    with tab1:
+        st.subheader("💰 NPV Analysis")
+        
+        if not st.session_state.cash_flow.empty:
+            # NPV calculation with different discount rates (all projects and rates in one batched call)
+            project_ids, cash_flow_matrix = build_cash_flow_matrix(st.session_state.cash_flow)
+            discount_rates = DEFAULT_RATE_GRID
+            portfolio_npv = npv_surface(cash_flow_matrix, discount_rates).sum(axis=0)
+            
+            npv_df = pd.DataFrame({
+                'Discount Rate': [f"{rate:.1%}" for rate in discount_rates],
+                'NPV': portfolio_npv,
+                'Decision': np.where(portfolio_npv > 0, 'Accept', 'Reject')
+            })
+            
+            # NPV vs Discount Rate chart
+            fig = go.Figure(data=[
+                go.Scatter(x=[float(x.strip('%'))/100 for x in npv_df['Discount Rate']], 
+                          y=npv_df['NPV'],
+                          mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                          marker=dict(size=8), name='NPV')
+            ])
+            fig.update_layout(
+                title="NPV vs Discount Rate",
+                xaxis_title="Discount Rate",
+                yaxis_title="Net Present Value ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Break-even")
+            st.plotly_chart(fig, use_container_width=True, key="chart_31")
+            
+            # NPV results table
+            st.subheader("NPV Analysis Results")
+            display_dataframe_with_index_1(npv_df.round(2))
+            
+            # IRR of the combined cash flows (Newton with bisection fallback)
+            st.subheader("Internal Rate of Return (IRR)")
+            
+            portfolio_irr = irr(cash_flow_matrix.sum(axis=0))[0]
+            
+            if not np.isnan(portfolio_irr):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("IRR", f"{portfolio_irr:.1%}")
+                with col2:
+                    if portfolio_irr > 0.15:
+                        st.success("✅ High IRR (Excellent)")
+                    elif portfolio_irr > 0.10:
+                        st.info("ℹ️ Good IRR (Acceptable)")
+                    else:
+                        st.warning("⚠️ Low IRR (Marginal)")
+            else:
+                st.info("IRR is undefined: NPV does not change sign for these cash flows")
+            
+            # Per-project valuation when the cash flow table carries a project_id column
+            if len(project_ids) > 1:
+                st.subheader("Project Portfolio Valuation")
+                project_valuation = value_projects(cash_flow_matrix, project_ids, DEFAULT_DISCOUNT_RATE)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Projects", f"{len(project_valuation):,}")
+                with col2:
+                    st.metric("Positive NPV Projects", f"{(project_valuation['npv'] > 0).mean():.1%}")
+                with col3:
+                    st.metric("Median IRR", f"{project_valuation['irr'].median():.1%}")
+                display_dataframe_with_index_1(
+                    project_valuation.sort_values('npv', ascending=False).head(50).round(3)
+                )
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'npv_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('investment_valuation', 'npv_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab2:
+        st.subheader("⏱️ Payback Period")
+        
+        if not st.session_state.cash_flow.empty:
+            # Payback period calculation
+            cash_flows = st.session_state.cash_flow['cash_flow'].values
+            initial_investment = st.session_state.cash_flow['initial_investment'].iloc[0]
+            
+            cumulative_cf = 0
+            payback_period = 0
+            payback_data = []
+            
+            for i, cf in enumerate(cash_flows):
+                cumulative_cf += cf
+                payback_data.append({
+                    'Period': i + 1,
+                    'Cash Flow': cf,
+                    'Cumulative CF': cumulative_cf,
+                    'Remaining Investment': initial_investment - cumulative_cf
+                })
+                
+                if cumulative_cf >= initial_investment and payback_period == 0:
+                    payback_period = i + 1
+            
+            payback_df = pd.DataFrame(payback_data)
+            
+            # Payback period visualization
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=payback_df['Period'], y=payback_df['Cumulative CF'],
+                                    mode='lines+markers', name='Cumulative Cash Flow', line=dict(color='#1f77b4')))
+            fig.add_trace(go.Scatter(x=payback_df['Period'], y=[initial_investment] * len(payback_df),
+                                    mode='lines', name='Initial Investment', line=dict(color='red', dash='dash')))
+            fig.update_layout(
+                title="Payback Period Analysis",
+                xaxis_title="Period",
+                yaxis_title="Cumulative Cash Flow ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_32")
+            
+            # Payback period results
+            _, cash_flow_matrix = build_cash_flow_matrix(st.session_state.cash_flow.drop(columns='project_id', errors='ignore'))
+            discounted_payback = compute_payback_period(cash_flow_matrix, DEFAULT_DISCOUNT_RATE)[0]
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Initial Investment", f"${initial_investment:,.0f}")
+            with col2:
+                st.metric("Payback Period", f"{payback_period} years")
+            with col3:
+                st.metric(f"Discounted Payback ({DEFAULT_DISCOUNT_RATE:.0%})",
+                          "Never" if np.isinf(discounted_payback) else f"{discounted_payback:.1f} years")
+            with col4:
+                if payback_period <= 3:
+                    st.success("✅ Quick Payback (≤3 years)")
+                elif payback_period <= 5:
+                    st.info("ℹ️ Moderate Payback (≤5 years)")
+                else:
+                    st.warning("⚠️ Long Payback (>5 years)")
+            
+            # Payback period table
+            st.subheader("Payback Period Details")
+            display_dataframe_with_index_1(payback_df.round(2))
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'payback_period' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('investment_valuation', 'payback_period')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab3:
+        st.subheader("📊 EVA Calculation")
+        
+        if not st.session_state.cash_flow.empty and not st.session_state.balance_sheet.empty:
+            # EVA calculation
+            latest_cf = st.session_state.cash_flow.iloc[-1]
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            
+            nopat = latest_cf['nopat']
+            capital_employed = latest_bs['total_assets']
+            wacc = 0.092  # From previous calculation
+            
+            eva = nopat - (wacc * capital_employed)
+            
+            # EVA components
+            eva_components = {
+                'NOPAT': nopat,
+                'Capital Charge': wacc * capital_employed,
+                'EVA': eva
+            }
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = px.bar(x=list(eva_components.keys()), y=list(eva_components.values()),
+                            title="EVA Components",
+                            color=list(eva_components.values()),
+                            color_continuous_scale='RdYlGn')
+                fig.update_layout(
+                    xaxis_title="Component",
+                    yaxis_title="Amount ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_33")
+            
+            with col2:
+                st.metric("NOPAT", f"${nopat:,.0f}")
+                st.metric("Capital Employed", f"${capital_employed:,.0f}")
+                st.metric("WACC", f"{wacc:.1%}")
+                st.metric("EVA", f"${eva:,.0f}")
+            
+            # EVA trend analysis
+            if len(st.session_state.cash_flow) > 1:
+                eva_trend = st.session_state.cash_flow.copy()
+                eva_trend['eva'] = eva_trend['nopat'] - (wacc * capital_employed)
+                
+                fig = go.Figure(data=[
+                    go.Scatter(x=eva_trend['period'], y=eva_trend['eva'],
+                              mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                              marker=dict(size=8), name='EVA')
+                ])
+                fig.update_layout(
+                    title="EVA Trend Over Time",
+                    xaxis_title="Period",
+                    yaxis_title="Economic Value Added ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Break-even")
+                st.plotly_chart(fig, use_container_width=True, key="chart_34")
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'eva_calculation' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('investment_valuation', 'eva_calculation')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab4:
+        st.subheader("🎯 Investment Insights")
+        
+        if not st.session_state.cash_flow.empty:
+            # Investment decision framework
+            latest_npv = investment_summary.iloc[0]['npv'] if not investment_summary.empty else 0
+            latest_payback = investment_summary.iloc[0]['payback_period'] if not investment_summary.empty else 0
+            latest_eva = investment_summary.iloc[0]['eva'] if not investment_summary.empty else 0
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if latest_npv > 0:
+                    st.success(f"✅ NPV: ${latest_npv:,.0f} (Positive)")
+                else:
+                    st.error(f"❌ NPV: ${latest_npv:,.0f} (Negative)")
+            
+            with col2:
+                if latest_payback <= 3:
+                    st.success(f"✅ Payback: {latest_payback} years (Quick)")
+                elif latest_payback <= 5:
+                    st.info(f"ℹ️ Payback: {latest_payback} years (Moderate)")
+                else:
+                    st.warning(f"⚠️ Payback: {latest_payback} years (Long)")
+            
+            with col3:
+                if latest_eva > 0:
+                    st.success(f"✅ EVA: ${latest_eva:,.0f} (Value Creating)")
+                else:
+                    st.error(f"❌ EVA: ${latest_eva:,.0f} (Value Destroying)")
+            
+            # Investment recommendations
+            st.write("**Investment Analysis Recommendations:**")
+            
+            if latest_npv > 0 and latest_payback <= 3 and latest_eva > 0:
+                st.success("✅ **Excellent Investment**: Strong NPV, quick payback, and positive EVA.")
+            
+            elif latest_npv > 0 and latest_payback <= 5:
+                st.info("ℹ️ **Good Investment**: Positive NPV with acceptable payback period.")
+            
+            elif latest_npv < 0:
+                st.error("❌ **Poor Investment**: Negative NPV indicates value destruction.")
+            
+            elif latest_payback > 5:
+                st.warning("⚠️ **Long Payback Risk**: Consider shorter-term alternatives.")
+            
+            # Risk assessment
+            st.subheader("Investment Risk Assessment")
+            
+            risk_factors = []
+            if latest_npv < 0:
+                risk_factors.append("Negative NPV")
+            if latest_payback > 5:
+                risk_factors.append("Long payback period")
+            if latest_eva < 0:
+                risk_factors.append("Negative EVA")
+            
+            if risk_factors:
+                st.warning(f"⚠️ **Risk Factors Identified**: {', '.join(risk_factors)}")
+            else:
+                st.success("✅ **Low Risk Profile**: All metrics indicate favorable investment conditions.")
+            
+            # Sensitivity analysis
+            st.subheader("Sensitivity Analysis")
+            
+            # Cash flow sensitivity
+            base_cf = st.session_state.cash_flow['cash_flow'].mean()
+            sensitivity_scenarios = [-20, -10, 0, 10, 20]  # Percentage changes
+            
+            # Level cash flow over the same horizon, discounted with one annuity factor
+            annuity_factor = discount_factors([DEFAULT_DISCOUNT_RATE], len(cash_flows) + 1)[0, 1:].sum()
+            new_npv = -initial_investment + base_cf * (1 + np.array(sensitivity_scenarios) / 100) * annuity_factor
+            
+            sensitivity_df = pd.DataFrame({
+                'Cash Flow Change': [f"{change:+.0f}%" for change in sensitivity_scenarios],
+                'New NPV': new_npv,
+                'Decision': np.where(new_npv > 0, 'Accept', 'Reject')
+            })
+            display_dataframe_with_index_1(sensitivity_df.round(2))
+            
+            # AI Strategic Recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI Strategic Recommendations")
+            if 'investment_insights' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('investment_valuation', 'investment_insights')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow and balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
@@ -0,0 +1,791 @@
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_liquidity_solvency_metrics, get_cash_flow_column_mapping
+from fin_recommendations import (
+    RECOMMENDATION_RULES, display_formatted_recommendations, page_recommendation
+)
+
+def show_liquidity_solvency():
+    st.markdown("""
+    <div class="section-header">
+        <h3>💧 Liquidity and Solvency</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if st.session_state.balance_sheet.empty and st.session_state.cash_flow.empty:
+        st.info("💧 Please upload balance sheet and cash flow data to view liquidity and solvency analytics.")
+        return
+    
+    # Calculate liquidity and solvency metrics
+    liquidity_summary, liquidity_message = calculate_liquidity_solvency_metrics(
+        st.session_state.balance_sheet, st.session_state.cash_flow
+    )
+    
+    # Enhanced overview with financial health scoring
+    st.subheader("💧 Liquidity and Solvency Overview")
+    
+    if not liquidity_summary.empty:
+        # Financial health score indicator
+        latest_metrics = liquidity_summary.iloc[-1]
+        financial_health_score = latest_metrics.get('financial_health_score', 0)
+        
+        # Financial health score visualization
+        col1, col2, col3 = st.columns([2, 1, 2])
+        with col2:
+            if financial_health_score >= 80:
+                st.success(f"🏆 Financial Health Score: {financial_health_score}/100")
+                st.markdown("**Status: Excellent**")
+            elif financial_health_score >= 60:
+                st.info(f"📊 Financial Health Score: {financial_health_score}/100")
+                st.markdown("**Status: Good**")
+            elif financial_health_score >= 40:
+                st.warning(f"⚠️ Financial Health Score: {financial_health_score}/100")
+                st.markdown("**Status: Fair**")
+            else:
+                st.error(f"🚨 Financial Health Score: {financial_health_score}/100")
+                st.markdown("**Status: Needs Improvement**")
+        
+        # Key metrics in columns
+        col1, col2, col3, col4, col5 = st.columns(5)
+        
+        with col1:
+            current_ratio = latest_metrics['current_ratio']
+            if 'current_ratio_change' in latest_metrics:
+                change = latest_metrics['current_ratio_change']
+                st.metric("Current Ratio", f"{current_ratio:.2f}", f"{change:+.2f}")
+            else:
+                st.metric("Current Ratio", f"{current_ratio:.2f}")
+        
+        with col2:
+            quick_ratio = latest_metrics['quick_ratio']
+            if 'quick_ratio_change' in latest_metrics:
+                change = latest_metrics['quick_ratio_change']
+                st.metric("Quick Ratio", f"{quick_ratio:.2f}", f"{change:+.2f}")
+            else:
+                st.metric("Quick Ratio", f"{quick_ratio:.2f}")
+        
+        with col3:
+            debt_to_equity = latest_metrics['debt_to_equity']
+            if 'debt_to_equity_change' in latest_metrics:
+                change = latest_metrics['debt_to_equity_change']
+                st.metric("Debt-to-Equity", f"{debt_to_equity:.2f}", f"{change:+.2f}")
+            else:
+                st.metric("Debt-to-Equity", f"{debt_to_equity:.2f}")
+        
+        with col4:
+            debt_to_assets = latest_metrics['debt_to_assets']
+            st.metric("Debt-to-Assets", f"{debt_to_assets:.2f}")
+        
+        with col5:
+            working_capital = latest_metrics['working_capital']
+            if 'working_capital_change' in latest_metrics:
+                change = latest_metrics['working_capital_change']
+                st.metric("Working Capital", f"${working_capital:,.0f}", f"{change:+,.0f}")
+            else:
+                st.metric("Working Capital", f"${working_capital:,.0f}")
+        
+        # Additional enhanced metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            if 'cash_ratio' in latest_metrics:
+                cash_ratio = latest_metrics['cash_ratio']
+                st.metric("Cash Ratio", f"{cash_ratio:.2f}")
+        
+        with col2:
+            if 'equity_ratio' in latest_metrics:
+                equity_ratio = latest_metrics['equity_ratio']
+                st.metric("Equity Ratio", f"{equity_ratio:.2f}")
+        
+        with col3:
+            if 'working_capital_ratio' in latest_metrics:
+                wc_ratio = latest_metrics['working_capital_ratio']
+                st.metric("WC Ratio", f"{wc_ratio:.2f}")
+        
+        with col4:
+            if 'debt_ratio' in latest_metrics:
+                debt_ratio = latest_metrics['debt_ratio']
+                st.metric("Debt Ratio", f"{debt_ratio:.2f}")
+    
+    st.success(liquidity_message)
+    
+    # Enhanced analytics tabs
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "💧 Liquidity Analysis", "📊 Solvency Metrics", "💰 Cash Flow Analysis", 
+        "📋 Risk Assessment", "🎯 Financial Health Scoring", "🚀 Optimization Recommendations"
+    ])
+    
+    with tab1:
+        st.subheader("💧 Liquidity Analysis")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Enhanced liquidity analysis
+            current_ratio_trend = st.session_state.balance_sheet.copy()
+            current_ratio_trend['current_ratio'] = (current_ratio_trend['current_assets'] / current_ratio_trend['current_liabilities']).round(2)
+            
+            # Calculate liquidity trends and changes
+            if len(current_ratio_trend) > 1:
+                current_ratio_trend['ratio_change'] = current_ratio_trend['current_ratio'].pct_change() * 100
+                current_ratio_trend['cumulative_change'] = ((current_ratio_trend['current_ratio'] / current_ratio_trend['current_ratio'].iloc[0]) - 1) * 100
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Current ratio trend chart
+                fig = go.Figure(data=[
+                    go.Scatter(x=current_ratio_trend['period'], y=current_ratio_trend['current_ratio'],
+                              mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                              marker=dict(size=8), name='Current Ratio')
+                ])
+                fig.update_layout(
+                    title="Current Ratio Trend Over Time",
+                    xaxis_title="Period",
+                    yaxis_title="Current Ratio",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=2.0, line_dash="dash", line_color="green", annotation_text="Good (2.0)")
+                fig.add_hline(y=1.5, line_dash="dash", line_color="blue", annotation_text="Acceptable (1.5)")
+                fig.add_hline(y=1.0, line_dash="dash", line_color="red", annotation_text="Poor (1.0)")
+                st.plotly_chart(fig, use_container_width=True, key="chart_5")
+            
+            with col2:
+                # Current ratio change analysis
+                if len(current_ratio_trend) > 1:
+                    fig = go.Figure()
+                    fig.add_trace(go.Bar(
+                        x=current_ratio_trend['period'].iloc[1:],
+                        y=current_ratio_trend['ratio_change'].iloc[1:],
+                        name='Period Change',
+                        marker_color='#2ca02c'
+                    ))
+                    fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="No Change")
+                    fig.update_layout(
+                        title="Current Ratio Change by Period",
+                        xaxis_title="Period",
+                        yaxis_title="Change (%)",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)'
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="chart_5_change")
+            
+            # Liquidity insights and metrics
+            if len(current_ratio_trend) > 1:
+                st.markdown("### 📊 Liquidity Analysis Insights")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    avg_ratio = current_ratio_trend['current_ratio'].mean()
+                    st.metric("Average Current Ratio", f"{avg_ratio:.2f}")
+                
+                with col2:
+                    if 'ratio_change' in current_ratio_trend.columns:
+                        avg_change = current_ratio_trend['ratio_change'].iloc[1:].mean()
+                        st.metric("Average Change", f"{avg_change:+.1f}%")
+                
+                with col3:
+                    if 'cumulative_change' in current_ratio_trend.columns:
+                        total_change = current_ratio_trend['cumulative_change'].iloc[-1]
+                        st.metric("Total Change", f"{total_change:+.1f}%")
+                
+                with col4:
+                    latest_ratio = current_ratio_trend['current_ratio'].iloc[-1]
+                    if latest_ratio >= 2.0:
+                        st.success(f"✅ **Excellent**: {latest_ratio:.2f}")
+                    elif latest_ratio >= 1.5:
+                        st.info(f"ℹ️ **Good**: {latest_ratio:.2f}")
+                    elif latest_ratio >= 1.0:
+                        st.warning(f"⚠️ **Acceptable**: {latest_ratio:.2f}")
+                    else:
+                        st.error(f"🚨 **Poor**: {latest_ratio:.2f}")
+            
+            # Quick ratio analysis
+            quick_ratio_data = st.session_state.balance_sheet.copy()
+            quick_ratio_data['quick_ratio'] = ((quick_ratio_data['cash_and_equivalents'] + quick_ratio_data['accounts_receivable']) / 
+                                              quick_ratio_data['current_liabilities']).round(2)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                fig = go.Figure(data=[
+                    go.Bar(x=quick_ratio_data['period'], y=quick_ratio_data['quick_ratio'],
+                           marker_color='#2ca02c', name='Quick Ratio',
+                           text=quick_ratio_data['quick_ratio'],
+                           textposition='auto')
+                ])
+                fig.update_layout(
+                    title="Quick Ratio by Period",
+                    xaxis_title="Period",
+                    yaxis_title="Quick Ratio",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_6")
+            
+            with col2:
+                # Working capital analysis
+                working_capital_data = st.session_state.balance_sheet.copy()
+                working_capital_data['working_capital'] = working_capital_data['current_assets'] - working_capital_data['current_liabilities']
+                
+                fig = go.Figure(data=[
+                    go.Scatter(x=working_capital_data['period'], y=working_capital_data['working_capital'],
+                              mode='lines+markers', line=dict(color='#ff7f0e', width=3),
+                              marker=dict(size=8), name='Working Capital')
+                ])
+                fig.update_layout(
+                    title="Working Capital Trend",
+                    xaxis_title="Period",
+                    yaxis_title="Working Capital ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_7")
+            
+            # AI Strategic Recommendations for Liquidity Analysis
+            st.markdown("---")
+            st.markdown("### 🤖 AI Liquidity Analysis Recommendations")
+            
+            if 'liquidity_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('liquidity_solvency', 'liquidity_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab2:
+        st.subheader("📊 Solvency Metrics")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Debt-to-equity ratio
+            debt_equity_data = st.session_state.balance_sheet.copy()
+            
+            # Check if required columns exist
+            required_cols = ['total_liabilities', 'shareholder_equity']
+            if all(col in debt_equity_data.columns for col in required_cols):
+                debt_equity_data['debt_to_equity'] = (debt_equity_data['total_liabilities'] / debt_equity_data['shareholder_equity']).round(2)
+            else:
+                st.warning("⚠️ Required columns for debt-to-equity calculation not found. Please ensure your balance sheet data includes 'total_liabilities' and 'shareholder_equity' columns.")
+                return
+            
+            fig = go.Figure(data=[
+                go.Scatter(x=debt_equity_data['period'], y=debt_equity_data['debt_to_equity'],
+                          mode='lines+markers', line=dict(color='#9467bd', width=3),
+                          marker=dict(size=8), name='Debt-to-Equity Ratio')
+            ])
+            fig.update_layout(
+                title="Debt-to-Equity Ratio Trend",
+                xaxis_title="Period",
+                yaxis_title="Debt-to-Equity Ratio",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            fig.add_hline(y=0.5, line_dash="dash", line_color="green", annotation_text="Conservative (0.5)")
+            fig.add_hline(y=1.0, line_dash="dash", line_color="orange", annotation_text="Moderate (1.0)")
+            fig.add_hline(y=2.0, line_dash="dash", line_color="red", annotation_text="High Risk (2.0)")
+            st.plotly_chart(fig, use_container_width=True, key="chart_8")
+            
+            # Asset composition analysis
+            latest_balance = st.session_state.balance_sheet.iloc[-1]
+            
+            # Check if required columns exist for asset composition
+            asset_cols = ['cash_and_equivalents', 'accounts_receivable', 'inventory', 'current_assets', 'total_assets']
+            if all(col in latest_balance.index for col in asset_cols):
+                asset_composition = {
+                    'Cash & Equivalents': latest_balance['cash_and_equivalents'],
+                    'Accounts Receivable': latest_balance['accounts_receivable'],
+                    'Inventory': latest_balance['inventory'],
+                    'Other Current Assets': latest_balance['current_assets'] - latest_balance['cash_and_equivalents'] - latest_balance['accounts_receivable'] - latest_balance['inventory'],
+                    'Non-Current Assets': latest_balance['total_assets'] - latest_balance['current_assets']
+                }
+            else:
+                st.warning("⚠️ Required columns for asset composition analysis not found. Please ensure your balance sheet data includes all required asset columns.")
+                return
+            
+            fig = px.pie(values=list(asset_composition.values()), names=list(asset_composition.keys()),
+                        title="Asset Composition")
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            st.plotly_chart(fig, use_container_width=True, key="chart_9")
+            
+            # AI Strategic Recommendations for Solvency Metrics
+            st.markdown("---")
+            st.markdown("### 🤖 AI Solvency Metrics Recommendations")
+            
+            if 'solvency_metrics' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('liquidity_solvency', 'solvency_metrics')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded balance sheet data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab3:
+        st.subheader("💰 Cash Flow Analysis")
+        
+        if not st.session_state.cash_flow.empty:
+            # Check if operating cash flow column exists
+            operating_cf_col = None
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in st.session_state.cash_flow.columns:
+                    operating_cf_col = col_name
+                    break
+            
+            if operating_cf_col:
+                # Operating cash flow trend
+                fig = go.Figure(data=[
+                    go.Scatter(x=st.session_state.cash_flow['period'], y=st.session_state.cash_flow[operating_cf_col],
+                              mode='lines+markers', line=dict(color='#1f77b4', width=3),
+                              marker=dict(size=8), name='Operating Cash Flow')
+                ])
+                fig.update_layout(
+                    title="Operating Cash Flow Trend",
+                    xaxis_title="Period",
+                    yaxis_title="Operating Cash Flow ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="operating_cf_trend")
+            else:
+                st.warning("⚠️ Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow")
+                return
+            
+            # Operating cash flow components
+            col1, col2 = st.columns(2)
+            with col1:
+                latest_cf = st.session_state.cash_flow.iloc[-1]
+                
+                # Check if required columns exist for cash flow components
+                cf_cols = ['net_income', 'depreciation', 'working_capital_change', 'capital_expenditures']
+                if all(col in latest_cf.index for col in cf_cols):
+                    cf_components = {
+                        'Net Income': latest_cf['net_income'],
+                        'Depreciation': latest_cf['depreciation'],
+                        'Working Capital Change': -latest_cf['working_capital_change'],
+                        'Capital Expenditures': -latest_cf['capital_expenditures']
+                    }
+                else:
+                    st.warning("⚠️ Required columns for cash flow components not found. Please ensure your cash flow data includes all required columns.")
+                    return
+                
+                fig = px.bar(x=list(cf_components.keys()), y=list(cf_components.values()),
+                            title="Operating Cash Flow Components",
+                            color=list(cf_components.values()),
+                            color_continuous_scale='RdYlGn')
+                fig.update_layout(
+                    xaxis_title="Component",
+                    yaxis_title="Amount ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="cf_components")
+            
+            with col2:
+                # Cash flow quality analysis
+                cf_quality_data = st.session_state.cash_flow.copy()
+                # Get column mapping for cash flow data
+                cf_mapping = get_cash_flow_column_mapping(st.session_state.cash_flow)
+                if 'operating_cash_flow' in cf_mapping:
+                    operating_cf_col = cf_mapping['operating_cash_flow']
+                    cf_quality_data['cf_quality'] = (cf_quality_data[operating_cf_col] / cf_quality_data['net_income']).round(2)
+                else:
+                    st.warning("⚠️ Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow")
+                    return
+                
+                fig = go.Figure(data=[
+                    go.Scatter(x=cf_quality_data['period'], y=cf_quality_data['cf_quality'],
+                              mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                              marker=dict(size=8), name='Cash Flow Quality')
+                ])
+                fig.update_layout(
+                    title="Cash Flow Quality (OCF/Net Income)",
+                    xaxis_title="Period",
+                    yaxis_title="Quality Ratio",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=1.0, line_dash="dash", line_color="green", annotation_text="Good Quality (≥1.0)")
+                fig.add_hline(y=0.8, line_dash="dash", line_color="orange", annotation_text="Acceptable (≥0.8)")
+                st.plotly_chart(fig, use_container_width=True, key="cf_quality")
+            
+            # AI Strategic Recommendations for Cash Flow Analysis
+            st.markdown("---")
+            st.markdown("### 🤖 AI Cash Flow Analysis Recommendations")
+            
+            if 'cash_flow_analysis' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('liquidity_solvency', 'cash_flow_analysis')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+                    st.info("Please check if you have loaded cash flow data in the Data Input section.")
+            else:
+                st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab4:
+        st.subheader("📋 Risk Assessment")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Risk metrics summary
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            
+            # Check if required columns exist for risk metrics
+            risk_cols = ['current_assets', 'current_liabilities', 'total_liabilities', 'shareholder_equity']
+            if all(col in latest_bs.index for col in risk_cols):
+                current_ratio = latest_bs['current_assets'] / latest_bs['current_liabilities']
+                debt_to_equity = latest_bs['total_liabilities'] / latest_bs['shareholder_equity']
+                working_capital = latest_bs['current_assets'] - latest_bs['current_liabilities']
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if current_ratio >= 2.0:
+                        st.success(f"✅ Current Ratio: {current_ratio:.2f} (Excellent)")
+                    elif current_ratio >= 1.5:
+                        st.info(f"ℹ️ Current Ratio: {current_ratio:.2f} (Good)")
+                    else:
+                        st.warning(f"⚠️ Current Ratio: {current_ratio:.2f} (Poor)")
+                
+                with col2:
+                    if debt_to_equity <= 0.5:
+                        st.success(f"✅ Debt-to-Equity: {debt_to_equity:.2f} (Conservative)")
+                    elif debt_to_equity <= 1.0:
+                        st.info(f"ℹ️ Debt-to-Equity: {debt_to_equity:.2f} (Moderate)")
+                    else:
+                        st.warning(f"⚠️ Debt-to-Equity: {debt_to_equity:.2f} (High Risk)")
+                
+                with col3:
+                    if working_capital > 0:
+                        st.success(f"✅ Working Capital: ${working_capital:,.0f} (Positive)")
+                    else:
+                        st.error(f"❌ Working Capital: ${working_capital:,.0f} (Negative)")
+                
+                # Risk recommendations
+                st.write("**Risk Assessment Summary:**")
+                if current_ratio < 1.5:
+                    st.warning("⚠️ **Liquidity Risk**: Current ratio below recommended level. Consider improving working capital management.")
+                
+                if debt_to_equity > 1.0:
+                    st.warning("⚠️ **Solvency Risk**: High debt levels detected. Review capital structure and debt management.")
+                
+                if working_capital < 0:
+                    st.error("❌ **Working Capital Risk**: Negative working capital indicates potential liquidity issues.")
+                
+                if current_ratio >= 2.0 and debt_to_equity <= 0.5:
+                    st.success("✅ **Low Risk Profile**: Strong liquidity and conservative capital structure.")
+            else:
+                st.warning("⚠️ Required columns for risk assessment not found. Please ensure your balance sheet data includes all required columns.")
+        
+        # AI Strategic Recommendations - Always show regardless of column requirements
+        st.markdown("---")
+        st.markdown("### 🤖 AI Financial Health Recommendations")
+        
+        if 'liquidity_solvency' in RECOMMENDATION_RULES:
+            try:
+                ai_recommendations = page_recommendation('liquidity_solvency', 'liquidity_solvency')
+                display_formatted_recommendations(ai_recommendations)
+            except Exception as e:
+                st.error(f"Error generating AI recommendations: {e}")
+                st.info("Please check if you have loaded balance sheet data in the Data Input section.")
+        else:
+            st.error("AI recommendations function not available. Please check the import.")
+    
+    with tab5:
+        st.subheader("🎯 Financial Health Scoring & Trends")
+        
+        if not liquidity_summary.empty and len(liquidity_summary) > 1:
+            # Financial health score trends
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=liquidity_summary['period'], 
+                y=liquidity_summary['financial_health_score'],
+                mode='lines+markers', 
+                name='Financial Health Score',
+                line=dict(color='#9467bd', width=3),
+                marker=dict(size=8)
+            ))
+            
+            # Add threshold lines
+            fig.add_hline(y=80, line_dash="dash", line_color="green", annotation_text="Excellent (80+)")
+            fig.add_hline(y=60, line_dash="dash", line_color="blue", annotation_text="Good (60+)")
+            fig.add_hline(y=40, line_dash="dash", line_color="orange", annotation_text="Fair (40+)")
+            fig.add_hline(y=20, line_dash="dash", line_color="red", annotation_text="Poor (<40)")
+            
+            fig.update_layout(
+                title="Financial Health Score Trends Over Time",
+                xaxis_title="Period",
+                yaxis_title="Financial Health Score (0-100)",
+                yaxis_range=[0, 100],
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_financial_health_score")
+            
+            # Score breakdown
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("### 📊 Score Components")
+                latest_score = liquidity_summary.iloc[-1]
+                
+                # Liquidity component (40 points)
+                liquidity_score = 0
+                if latest_score['current_ratio'] >= 2.0:
+                    liquidity_score += 20
+                elif latest_score['current_ratio'] >= 1.5:
+                    liquidity_score += 15
+                elif latest_score['current_ratio'] >= 1.0:
+                    liquidity_score += 10
+                else:
+                    liquidity_score += 5
+                
+                if latest_score['quick_ratio'] >= 1.0:
+                    liquidity_score += 20
+                elif latest_score['quick_ratio'] >= 0.8:
+                    liquidity_score += 15
+                elif latest_score['quick_ratio'] >= 0.5:
+                    liquidity_score += 10
+                else:
+                    liquidity_score += 5
+                
+                st.metric("Liquidity Score", f"{liquidity_score}/40")
+                
+                # Solvency component (40 points)
+                solvency_score = 0
+                if latest_score['debt_to_equity'] <= 0.5:
+                    solvency_score += 20
+                elif latest_score['debt_to_equity'] <= 1.0:
+                    solvency_score += 15
+                elif latest_score['debt_to_equity'] <= 2.0:
+                    solvency_score += 10
+                else:
+                    solvency_score += 5
+                
+                if latest_score['debt_to_assets'] <= 0.3:
+                    solvency_score += 20
+                elif latest_score['debt_to_assets'] <= 0.5:
+                    solvency_score += 15
+                elif latest_score['debt_to_assets'] <= 0.7:
+                    solvency_score += 10
+                else:
+                    solvency_score += 5
+                
+                st.metric("Solvency Score", f"{solvency_score}/40")
+                
+                # Working capital component (20 points)
+                wc_score = 0
+                if latest_score['working_capital'] > 0:
+                    if latest_score['working_capital_ratio'] >= 0.2:
+                        wc_score = 20
+                    elif latest_score['working_capital_ratio'] >= 0.1:
+                        wc_score = 15
+                    elif latest_score['working_capital_ratio'] >= 0.05:
+                        wc_score = 10
+                    else:
+                        wc_score = 5
+                else:
+                    wc_score = 0
+                
+                st.metric("Working Capital Score", f"{wc_score}/20")
+            
+            with col2:
+                st.markdown("### 📈 Trend Analysis")
+                
+                # Moving averages
+                if 'current_ratio_ma_3' in liquidity_summary.columns:
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(
+                        x=liquidity_summary['period'],
+                        y=liquidity_summary['current_ratio'],
+                        mode='lines+markers',
+                        name='Actual Current Ratio',
+                        line=dict(color='#1f77b4', width=2)
+                    ))
+                    fig.add_trace(go.Scatter(
+                        x=liquidity_summary['period'],
+                        y=liquidity_summary['current_ratio_ma_3'],
+                        mode='lines',
+                        name='3-Period Moving Average',
+                        line=dict(color='#ff7f0e', width=3, dash='dash')
+                    ))
+                    fig.update_layout(
+                        title="Current Ratio with Moving Average",
+                        xaxis_title="Period",
+                        yaxis_title="Current Ratio",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)'
+                    )
+                    st.plotly_chart(fig, use_container_width=True, key="chart_current_ratio_ma")
+        
+        else:
+            st.info("📊 Financial health scoring requires multiple periods of data for trend analysis.")
+    
+    with tab6:
+        st.subheader("🚀 Optimization Recommendations")
+        
+        if not liquidity_summary.empty:
+            latest_metrics = liquidity_summary.iloc[-1]
+            
+            # Generate optimization recommendations
+            st.markdown("### 🎯 Strategic Optimization Areas")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### 💧 Liquidity Optimization")
+                
+                # Current ratio optimization
+                current_ratio = latest_metrics['current_ratio']
+                if current_ratio < 1.0:
+                    st.error("🚨 **Critical Liquidity Issue**")
+                    st.markdown("""
+                    **Immediate Actions:**
+                    • Increase current assets
+                    • Reduce current liabilities
+                    • Improve working capital management
+                    • Review short-term financing
+                    """)
+                elif current_ratio < 1.5:
+                    st.warning("⚠️ **Low Liquidity**")
+                    st.markdown("""
+                    **Improvement Strategies:**
+                    • Optimize inventory management
+                    • Accelerate receivables collection
+                    • Extend payables where possible
+                    • Improve cash flow management
+                    """)
+                else:
+                    st.success("✅ **Good Liquidity**")
+                    st.markdown("""
+                    **Maintain Excellence:**
+                    • Continue current practices
+                    • Monitor trends closely
+                    • Optimize asset allocation
+                    • Consider investment opportunities
+                    """)
+                
+                # Quick ratio optimization
+                st.markdown("#### ⚡ Quick Ratio Optimization")
+                quick_ratio = latest_metrics['quick_ratio']
+                if quick_ratio < 0.5:
+                    st.error("🚨 **Poor Quick Ratio**")
+                    st.markdown("""
+                    **Critical Actions:**
+                    • Increase cash reserves
+                    • Improve receivables collection
+                    • Reduce inventory levels
+                    • Review credit policies
+                    """)
+                elif quick_ratio < 1.0:
+                    st.warning("⚠️ **Moderate Quick Ratio**")
+                    st.markdown("""
+                    **Enhancement Strategies:**
+                    • Build cash reserves
+                    • Optimize receivables
+                    • Improve cash conversion cycle
+                    • Strengthen credit management
+                    """)
+                else:
+                    st.success("✅ **Strong Quick Ratio**")
+                    st.markdown("""
+                    **Maintain Strength:**
+                    • Continue cash management
+                    • Optimize asset allocation
+                    • Consider strategic investments
+                    """)
+            
+            with col2:
+                st.markdown("#### 🏗️ Solvency Optimization")
+                
+                # Debt-to-equity optimization
+                debt_to_equity = latest_metrics['debt_to_equity']
+                if debt_to_equity > 2.0:
+                    st.error("🚨 **High Debt Risk**")
+                    st.markdown("""
+                    **Critical Actions:**
+                    • Reduce debt levels urgently
+                    • Review capital structure
+                    • Consider equity financing
+                    • Restructure existing debt
+                    """)
+                elif debt_to_equity > 1.0:
+                    st.warning("⚠️ **Elevated Debt Levels**")
+                    st.markdown("""
+                    **Risk Mitigation:**
+                    • Monitor debt trends
+                    • Optimize capital structure
+                    • Improve profitability
+                    • Consider debt refinancing
+                    """)
+                else:
+                    st.success("✅ **Healthy Debt Levels**")
+                    st.markdown("""
+                    **Maintain Stability:**
+                    • Continue conservative approach
+                    • Monitor market conditions
+                    • Consider growth opportunities
+                    """)
+                
+                # Working capital optimization
+                st.markdown("#### 💼 Working Capital Optimization")
+                working_capital = latest_metrics['working_capital']
+                if working_capital < 0:
+                    st.error("🚨 **Negative Working Capital**")
+                    st.markdown("""
+                    **Critical Actions:**
+                    • Immediate liquidity injection
+                    • Restructure short-term debt
+                    • Optimize asset utilization
+                    • Review business model
+                    """)
+                elif working_capital < latest_metrics.get('current_assets', 0) * 0.1:
+                    st.warning("⚠️ **Low Working Capital**")
+                    st.markdown("""
+                    **Improvement Strategies:**
+                    • Increase current assets
+                    • Reduce current liabilities
+                    • Optimize cash flow
+                    • Improve operational efficiency
+                    """)
+                else:
+                    st.success("✅ **Strong Working Capital**")
+                    st.markdown("""
+                    **Maintain Strength:**
+                    • Continue current practices
+                    • Optimize asset allocation
+                    • Consider growth investments
+                    """)
+            
+            # AI-powered recommendations
+            st.markdown("---")
+            st.markdown("### 🤖 AI-Powered Optimization Insights")
+            
+            if 'liquidity_solvency' in RECOMMENDATION_RULES:
+                try:
+                    ai_recommendations = page_recommendation('liquidity_solvency', 'liquidity_solvency')
+                    display_formatted_recommendations(ai_recommendations)
+                except Exception as e:
+                    st.error(f"Error generating AI recommendations: {e}")
+            else:
+                st.info("🤖 AI recommendations will be displayed here when available.")
@@ -0,0 +1,36 @@
+import streamlit as st
+
+from fin_predictive import FinancePredictiveAnalytics, display_finance_predictive_analytics_dashboard
+
+def show_predictive_analytics():
+    """Display predictive analytics dashboard"""
+    st.markdown("""
+    <div class="section-header">
+        <h3>🔮 Predictive Analytics</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if data is available
+    if (st.session_state.income_statement.empty and st.session_state.balance_sheet.empty and 
+        st.session_state.cash_flow.empty and st.session_state.budget.empty and 
+        st.session_state.forecast.empty and st.session_state.customer_data.empty and 
+        st.session_state.product_data.empty):
+        st.warning("⚠️ No data available for predictive analytics. Please load data in the Data Input section first.")
+        return
+    
+    # Display predictive analytics dashboard
+    # Create predictive analytics object first
+    predictive_analytics = FinancePredictiveAnalytics(
+        st.session_state.income_statement,
+        st.session_state.balance_sheet,
+        st.session_state.cash_flow,
+        st.session_state.budget,
+        st.session_state.forecast,
+        st.session_state.market_data,
+        st.session_state.customer_data,
+        st.session_state.product_data,
+        st.session_state.value_chain
+    )
+    
+    # Display the dashboard
+    display_finance_predictive_analytics_dashboard(predictive_analytics)
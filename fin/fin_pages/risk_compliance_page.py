@@ -0,0 +1,459 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from fin_metrics import calculate_entity_health_scores, calculate_risk_compliance_metrics
+from fin_risk import FinanceRiskAnalyzer, display_risk_dashboard
+from fin_data_utils import display_dataframe_with_index_1
+
+def show_risk_compliance():
+    st.markdown("""
+    <div class="section-header">
+        <h3>⚠️ Risk & Compliance</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check if we have data
+    if (st.session_state.balance_sheet.empty and st.session_state.income_statement.empty and 
+        st.session_state.cash_flow.empty and st.session_state.market_data.empty):
+        st.info("⚠️ Please upload financial data to view risk and compliance analytics.")
+        return
+    
+    # Use new risk analyzer if available
+    if FinanceRiskAnalyzer is not None:
+        # Initialize risk analyzer
+        risk_analyzer = FinanceRiskAnalyzer(
+            st.session_state.income_statement,
+            st.session_state.balance_sheet,
+            st.session_state.cash_flow,
+            st.session_state.budget,
+            st.session_state.forecast,
+            st.session_state.market_data,
+            st.session_state.customer_data,
+            st.session_state.product_data,
+            st.session_state.value_chain
+        )
+        
+        # Display risk dashboard
+        display_risk_dashboard(risk_analyzer)
+        
+        # Health benchmarking across subsidiaries or counterparties
+        health_scores, health_message = calculate_entity_health_scores(
+            st.session_state.income_statement, st.session_state.balance_sheet, st.session_state.cash_flow
+        )
+        if len(health_scores) > 1:
+            st.markdown("### 🏢 Entity Health Benchmarking")
+            st.caption(health_message)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Median Health Score", f"{health_scores['health_score'].median():.0f}/100")
+            with col2:
+                st.metric("Entities Rated Poor", f"{(health_scores['health_level'] == 'Poor').sum():,}")
+            with col3:
+                st.metric("High Risk Entities", f"{(health_scores['risk_level'] == 'High').sum():,}")
+            
+            fig = px.box(health_scores, x='size_band', y='health_score', color='industry',
+                         title="Health Score by Peer Group", category_orders={'size_band': ['Small', 'Mid', 'Large']})
+            fig.update_layout(height=400)
+            st.plotly_chart(fig, use_container_width=True, key="chart_51")
+            
+            breakdown_columns = ['entity', 'period', 'industry', 'size_band', 'health_score', 'health_level',
+                                 'profitability', 'liquidity', 'cash_flow', 'growth', 'health_percentile',
+                                 'peer_median', 'risk_score', 'risk_level']
+            weakest = health_scores.nsmallest(25, 'health_percentile')[breakdown_columns]
+            st.write("**Weakest Entities Relative to Peers:**")
+            display_dataframe_with_index_1(weakest.round(1))
+        
+        # Add traditional risk metrics as well
+        if not st.session_state.balance_sheet.empty and not st.session_state.market_data.empty:
+            risk_summary, risk_message = calculate_risk_compliance_metrics(
+                st.session_state.balance_sheet, st.session_state.market_data
+            )
+            
+            st.markdown("### 📊 Traditional Risk Metrics")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                if not risk_summary.empty:
+                    var = risk_summary.iloc[0]['Value']
+                    st.metric("Value at Risk (VaR)", var)
+            
+            with col2:
+                if not risk_summary.empty and len(risk_summary) > 1:
+                    lcr = risk_summary.iloc[1]['Value']
+                    st.metric("Liquidity Coverage Ratio", lcr)
+            
+            with col3:
+                if not risk_summary.empty and len(risk_summary) > 2:
+                    car = risk_summary.iloc[2]['Value']
+                    st.metric("Capital Adequacy Ratio", car)
+            
+            st.info(risk_message)
+    else:
+        # Fallback to original risk analysis
+        if st.session_state.balance_sheet.empty and st.session_state.market_data.empty:
+            st.info("⚠️ Please upload balance sheet and market data to view risk and compliance analytics.")
+            return
+        
+        # Calculate risk compliance metrics
+        risk_summary, risk_message = calculate_risk_compliance_metrics(
+            st.session_state.balance_sheet, st.session_state.market_data
+        )
+    
+    # Display summary metrics
+    st.subheader("⚠️ Risk & Compliance Overview")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if not risk_summary.empty:
+            var = risk_summary.iloc[0]['Value']
+            st.metric("Value at Risk (VaR)", var)
+    
+    with col2:
+        if not risk_summary.empty and len(risk_summary) > 1:
+            lcr = risk_summary.iloc[1]['Value']
+            st.metric("Liquidity Coverage Ratio", lcr)
+    
+    with col3:
+        if not risk_summary.empty and len(risk_summary) > 2:
+            car = risk_summary.iloc[2]['Value']
+            st.metric("Capital Adequacy Ratio", car)
+    
+    st.info(risk_message)
+    
+    # Detailed analytics tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📊 VaR Analysis", "💧 Liquidity Risk", "🏦 Capital Adequacy", "📈 Risk Monitoring"
+    ])
+    
+    with tab1:
+        st.subheader("📊 VaR Analysis")
+        
+        if not st.session_state.balance_sheet.empty:
+            # VaR calculation simulation
+            portfolio_value = st.session_state.balance_sheet['total_assets'].iloc[-1]
+            volatility = 0.15  # Assumed 15% volatility
+            confidence_levels = [0.90, 0.95, 0.99]
+            time_horizons = [1, 30, 90]  # days
+            
+            var_results = []
+            for conf in confidence_levels:
+                for horizon in time_horizons:
+                    # Z-score for confidence level
+                    z_scores = {0.90: 1.282, 0.95: 1.645, 0.99: 2.326}
+                    z_score = z_scores[conf]
+                    
+                    var = portfolio_value * volatility * np.sqrt(horizon/365) * z_score
+                    var_results.append({
+                        'Confidence Level': f"{conf:.0%}",
+                        'Time Horizon': f"{horizon} days",
+                        'VaR': var,
+                        'VaR %': (var / portfolio_value * 100)
+                    })
+            
+            var_df = pd.DataFrame(var_results)
+            
+            # VaR heatmap
+            var_pivot = var_df.pivot(index='Time Horizon', columns='Confidence Level', values='VaR %')
+            
+            fig = go.Figure(data=go.Heatmap(
+                z=var_pivot.values,
+                x=var_pivot.columns,
+                y=var_pivot.index,
+                colorscale='RdYlGn_r',
+                text=var_pivot.values.round(2),
+                texttemplate="%{text}%",
+                textfont={"size": 12}
+            ))
+            fig.update_layout(
+                title="VaR by Confidence Level and Time Horizon",
+                xaxis_title="Confidence Level",
+                yaxis_title="Time Horizon",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_35")
+            
+            # VaR trend analysis
+            if len(st.session_state.balance_sheet) > 1:
+                var_trend = st.session_state.balance_sheet.copy()
+                var_trend['var_95'] = var_trend['total_assets'] * volatility * np.sqrt(30/365) * 1.645
+                
+                fig = go.Figure(data=[
+                    go.Scatter(x=var_trend['period'], y=var_trend['var_95'],
+                              mode='lines+markers', line=dict(color='#d62728', width=3),
+                              marker=dict(size=8), name='95% VaR (30 days)')
+                ])
+                fig.update_layout(
+                    title="VaR Trend Over Time",
+                    xaxis_title="Period",
+                    yaxis_title="Value at Risk ($)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                st.plotly_chart(fig, use_container_width=True, key="chart_36")
+            
+            # VaR results table
+            st.subheader("VaR Analysis Results")
+            display_dataframe_with_index_1(var_df.round(2))
+    
+    with tab2:
+        st.subheader("💧 Liquidity Risk")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Liquidity coverage ratio calculation
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            
+            # High-quality liquid assets (simplified)
+            hqla = latest_bs['cash_and_equivalents']
+            
+            # Net cash outflows (simplified - 30% of current liabilities)
+            net_cash_outflows = latest_bs['current_liabilities'] * 0.3
+            
+            lcr = hqla / net_cash_outflows if net_cash_outflows > 0 else 0
+            
+            # Liquidity metrics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("High-Quality Liquid Assets", f"${hqla:,.0f}")
+            with col2:
+                st.metric("Net Cash Outflows (30 days)", f"${net_cash_outflows:,.0f}")
+            with col3:
+                st.metric("Liquidity Coverage Ratio", f"{lcr:.1%}")
+            
+            # LCR compliance
+            if lcr >= 1.0:
+                st.success("✅ **LCR Compliant**: Ratio ≥ 100% (Regulatory requirement met)")
+            else:
+                st.error(f"❌ **LCR Non-Compliant**: Ratio {lcr:.1%} < 100% (Regulatory requirement not met)")
+            
+            # Liquidity stress testing
+            st.subheader("Liquidity Stress Testing")
+            
+            stress_scenarios = {
+                'Baseline': 1.0,
+                'Mild Stress': 0.8,
+                'Moderate Stress': 0.6,
+                'Severe Stress': 0.4
+            }
+            
+            stress_results = []
+            for scenario, factor in stress_scenarios.items():
+                stressed_hqla = hqla * factor
+                stressed_lcr = stressed_hqla / net_cash_outflows if net_cash_outflows > 0 else 0
+                
+                stress_results.append({
+                    'Scenario': scenario,
+                    'HQLA Factor': f"{factor:.1f}",
+                    'Stressed HQLA': stressed_hqla,
+                    'Stressed LCR': stressed_lcr,
+                    'Compliant': 'Yes' if stressed_lcr >= 1.0 else 'No'
+                })
+            
+            stress_df = pd.DataFrame(stress_results)
+            display_dataframe_with_index_1(stress_df.round(2))
+            
+            # Liquidity composition
+            liquidity_composition = {
+                'Cash & Equivalents': latest_bs['cash_and_equivalents'],
+                'Accounts Receivable': latest_bs['accounts_receivable'],
+                'Other Liquid Assets': latest_bs['current_assets'] - latest_bs['cash_and_equivalents'] - latest_bs['accounts_receivable']
+            }
+            
+            fig = px.pie(values=list(liquidity_composition.values()), names=list(liquidity_composition.keys()),
+                        title="Liquidity Asset Composition")
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            st.plotly_chart(fig, use_container_width=True, key="chart_37")
+    
+    with tab3:
+        st.subheader("🏦 Capital Adequacy")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Capital adequacy ratio calculation
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            
+            # Tier 1 capital (simplified - shareholder equity)
+            tier1_capital = latest_bs['shareholder_equity']
+            
+            # Risk-weighted assets (simplified - 80% of total assets)
+            risk_weighted_assets = latest_bs['total_assets'] * 0.8
+            
+            car = (tier1_capital / risk_weighted_assets * 100) if risk_weighted_assets > 0 else 0
+            
+            # Capital metrics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Tier 1 Capital", f"${tier1_capital:,.0f}")
+            with col2:
+                st.metric("Risk-Weighted Assets", f"${risk_weighted_assets:,.0f}")
+            with col3:
+                st.metric("Capital Adequacy Ratio", f"{car:.1f}%")
+            
+            # CAR compliance
+            if car >= 8.0:
+                st.success("✅ **CAR Compliant**: Ratio ≥ 8% (Basel III requirement met)")
+            else:
+                st.error(f"❌ **CAR Non-Compliant**: Ratio {car:.1f}% < 8% (Basel III requirement not met)")
+            
+            # Capital structure analysis
+            st.subheader("Capital Structure Analysis")
+            
+            capital_components = {
+                'Tier 1 Capital': tier1_capital,
+                'Total Liabilities': latest_bs['total_liabilities'],
+                'Risk Buffer': tier1_capital - (risk_weighted_assets * 0.08)
+            }
+            
+            fig = px.bar(x=list(capital_components.keys()), y=list(capital_components.values()),
+                        title="Capital Components",
+                        color=list(capital_components.values()),
+                        color_continuous_scale='RdYlGn')
+            fig.update_layout(
+                xaxis_title="Component",
+                yaxis_title="Amount ($)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_38")
+            
+            # Capital adequacy trend
+            if len(st.session_state.balance_sheet) > 1:
+                car_trend = st.session_state.balance_sheet.copy()
+                car_trend['car'] = (car_trend['shareholder_equity'] / (car_trend['total_assets'] * 0.8) * 100).round(2)
+                
+                fig = go.Figure(data=[
+                    go.Scatter(x=car_trend['period'], y=car_trend['car'],
+                              mode='lines+markers', line=dict(color='#2ca02c', width=3),
+                              marker=dict(size=8), name='Capital Adequacy Ratio (%)')
+                ])
+                fig.update_layout(
+                    title="Capital Adequacy Ratio Trend",
+                    xaxis_title="Period",
+                    yaxis_title="CAR (%)",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(size=12),
+                    margin=dict(l=50, r=50, t=80, b=50)
+                )
+                fig.add_hline(y=8.0, line_dash="dash", line_color="green", annotation_text="Basel III (8%)")
+                fig.add_hline(y=10.5, line_dash="dash", line_color="orange", annotation_text="Conservation Buffer (10.5%)")
+                st.plotly_chart(fig, use_container_width=True, key="chart_39")
+    
+    with tab4:
+        st.subheader("📈 Risk Monitoring")
+        
+        if not st.session_state.balance_sheet.empty:
+            # Risk dashboard
+            latest_bs = st.session_state.balance_sheet.iloc[-1]
+            
+            # Calculate various risk metrics
+            current_ratio = latest_bs['current_assets'] / latest_bs['current_liabilities']
+            debt_to_equity = latest_bs['total_liabilities'] / latest_bs['shareholder_equity']
+            working_capital = latest_bs['current_assets'] - latest_bs['current_liabilities']
+            
+            # Risk assessment
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                if current_ratio >= 2.0:
+                    st.success(f"✅ Current Ratio: {current_ratio:.2f}")
+                elif current_ratio >= 1.5:
+                    st.info(f"ℹ️ Current Ratio: {current_ratio:.2f}")
+                else:
+                    st.error(f"❌ Current Ratio: {current_ratio:.2f}")
+            
+            with col2:
+                if debt_to_equity <= 0.5:
+                    st.success(f"✅ Debt-to-Equity: {debt_to_equity:.2f}")
+                elif debt_to_equity <= 1.0:
+                    st.info(f"ℹ️ Debt-to-Equity: {debt_to_equity:.2f}")
+                else:
+                    st.warning(f"⚠️ Debt-to-Equity: {debt_to_equity:.2f}")
+            
+            with col3:
+                if working_capital > 0:
+                    st.success(f"✅ Working Capital: ${working_capital:,.0f}")
+                else:
+                    st.error(f"❌ Working Capital: ${working_capital:,.0f}")
+            
+            with col4:
+                if lcr >= 1.0:
+                    st.success(f"✅ LCR: {lcr:.1%}")
+                else:
+                    st.error(f"❌ LCR: {lcr:.1%}")
+            
+            # Risk heatmap
+            st.subheader("Risk Heatmap")
+            
+            risk_metrics = {
+                'Liquidity Risk': current_ratio,
+                'Solvency Risk': debt_to_equity,
+                'Capital Risk': car/100,  # Normalize to 0-1
+                'Working Capital Risk': 1 if working_capital > 0 else 0
+            }
+            
+            # Create risk matrix
+            risk_matrix = pd.DataFrame({
+                'Risk Metric': list(risk_metrics.keys()),
+                'Risk Score': list(risk_metrics.values()),
+                'Risk Level': ['Low' if v > 0.5 else 'Medium' if v > 0.2 else 'High' for v in risk_metrics.values()]
+            })
+            
+            fig = px.bar(risk_matrix, x='Risk Metric', y='Risk Score',
+                        color='Risk Level',
+                        color_discrete_map={'Low': '#2ca02c', 'Medium': '#ff7f0e', 'High': '#d62728'},
+                        title="Risk Assessment Dashboard")
+            fig.update_layout(
+                xaxis_title="Risk Metric",
+                yaxis_title="Risk Score",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig, use_container_width=True, key="chart_40")
+            
+            # Risk recommendations
+            st.write("**Risk Management Recommendations:**")
+            
+            risk_issues = []
+            if current_ratio < 1.5:
+                risk_issues.append("Improve liquidity management")
+            if debt_to_equity > 1.0:
+                risk_issues.append("Reduce debt levels")
+            if working_capital < 0:
+                risk_issues.append("Address negative working capital")
+            if lcr < 1.0:
+                risk_issues.append("Increase liquid assets")
+            if car < 8.0:
+                risk_issues.append("Strengthen capital position")
+            
+            if risk_issues:
+                st.warning(f"⚠️ **Risk Issues Identified**: {', '.join(risk_issues)}")
+            else:
+                st.success("✅ **Low Risk Profile**: All risk metrics within acceptable ranges.")
+            
+            # Early warning indicators
+            st.subheader("Early Warning Indicators")
+            
+            warning_indicators = []
+            if current_ratio < 1.0:
+                warning_indicators.append("Critical liquidity risk")
+            if debt_to_equity > 2.0:
+                warning_indicators.append("Excessive leverage")
+            if working_capital < -latest_bs['current_assets'] * 0.1:
+                warning_indicators.append("Severe working capital deficit")
+            if lcr < 0.5:
+                warning_indicators.append("Inadequate liquidity coverage")
+            
+            if warning_indicators:
+                st.error(f"🚨 **Critical Risk Alerts**: {', '.join(warning_indicators)}")
+            else:
+                st.success("✅ **No Critical Risk Alerts**: All indicators within safe ranges.")
@@ -0,0 +1,1495 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from fin_scenarios import (
+    SCENARIO_PRESETS, DEFAULT_PATHS, DEFAULT_COVENANTS, simulate_scenarios,
+    estimate_volatility, estimate_debt_service
+)
+from fin_data_layer import table_version
+from fin_forecast_cache import memoized_prediction, forecast_cache_stats, clear_forecast_cache
+
+# Finance-specific predictive analytics (optimized)
+class FinancePredictiveAnalytics:
+    """Advanced predictive analytics for finance operations with machine learning capabilities"""
+    
+    def __init__(self, income_statement, balance_sheet, cash_flow, budget, forecast, market_data, customer_data, product_data, value_chain):
+        self.income_statement = income_statement
+        self.balance_sheet = balance_sheet
+        self.cash_flow = cash_flow
+        self.budget = budget
+        self.forecast = forecast
+        self.market_data = market_data
+        self.customer_data = customer_data
+        self.product_data = product_data
+        self.value_chain = value_chain
+        
+        # Memoized predictions (per-instance view of the process-level forecast cache)
+        self._prediction_cache = {}
+        self._model_performance = {}
+        self._table_fingerprints = {}
+        
+        # Pre-calculate common metrics for predictions
+        self._precalculate_prediction_metrics()
+    
+    def _precalculate_prediction_metrics(self):
+        """Pre-calculate metrics needed for predictions"""
+        self._prediction_metrics = {}
+        
+        if not self.income_statement.empty:
+            # Revenue metrics
+            self._prediction_metrics['revenue'] = self.income_statement['revenue'].values
+            self._prediction_metrics['revenue_growth_rates'] = []
+            
+            if len(self.income_statement) > 1:
+                for i in range(1, len(self.income_statement)):
+                    if self.income_statement['revenue'].iloc[i-1] > 0:
+                        growth_rate = ((self.income_statement['revenue'].iloc[i] - self.income_statement['revenue'].iloc[i-1]) / 
+                                     self.income_statement['revenue'].iloc[i-1]) * 100
+                        self._prediction_metrics['revenue_growth_rates'].append(growth_rate)
+            
+            # Profitability metrics
+            if 'net_income' in self.income_statement.columns:
+                self._prediction_metrics['net_income'] = self.income_statement['net_income'].values
+                self._prediction_metrics['net_margins'] = []
+                
+                for i in range(len(self.income_statement)):
+                    if self.income_statement['revenue'].iloc[i] > 0:
+                        margin = (self.income_statement['net_income'].iloc[i] / self.income_statement['revenue'].iloc[i]) * 100
+                        self._prediction_metrics['net_margins'].append(margin)
+        
+        if not self.balance_sheet.empty:
+            # Asset and liability trends
+            if 'total_assets' in self.balance_sheet.columns:
+                self._prediction_metrics['total_assets'] = self.balance_sheet['total_assets'].values
+            
+            if 'current_assets' in self.balance_sheet.columns:
+                self._prediction_metrics['current_assets'] = self.balance_sheet['current_assets'].values
+        
+        if not self.cash_flow.empty:
+            # Cash flow trends
+            # Check for operating cash flow column with fallback names
+            operating_cf_col = None
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in self.cash_flow.columns:
+                    operating_cf_col = col_name
+                    break
+            
+            if operating_cf_col:
+                self._prediction_metrics['operating_cf'] = self.cash_flow[operating_cf_col].values
+    
+    def table_fingerprint(self, table):
+        """Version token of one input table (content hash if unregistered), computed once per instance"""
+        if table not in self._table_fingerprints:
+            self._table_fingerprints[table] = table_version(getattr(self, table))
+        return self._table_fingerprints[table]
+    
+    @memoized_prediction('income_statement')
+    def predict_revenue_trends(self, periods_ahead=6, confidence_level=0.95):
+        """Advanced revenue prediction with multiple forecasting models"""
+        if self.income_statement.empty or len(self.income_statement) < 3:
+            return pd.DataFrame(), "Insufficient data for revenue prediction"
+        
+        try:
+            # Enhanced revenue prediction with multiple models
+            revenue_data = self.income_statement[['period', 'revenue']].copy()
+            revenue_data['period_num'] = range(len(revenue_data))
+            
+            # Model 1: Exponential Smoothing
+            alpha = 0.3  # Smoothing factor
+            revenue_data['exp_smooth'] = revenue_data['revenue'].ewm(alpha=alpha).mean()
+            
+            # Model 2: Moving Average with trend
+            window_size = min(4, len(revenue_data))
+            revenue_data['ma_trend'] = revenue_data['revenue'].rolling(window=window_size, min_periods=1).mean()
+            
+            # Model 3: Linear trend projection
+            if len(revenue_data) >= 3:
+                # Calculate linear trend
+                x = revenue_data['period_num'].values.reshape(-1, 1)
+                y = revenue_data['revenue'].values
+                
+                # Simple linear regression
+                slope = np.polyfit(x.flatten(), y, 1)[0]
+                intercept = np.polyfit(x.flatten(), y, 1)[1]
+                
+                revenue_data['linear_trend'] = slope * revenue_data['period_num'] + intercept
+            
+            # Generate future predictions
+            future_predictions = []
+            last_revenue = revenue_data['revenue'].iloc[-1]
+            avg_growth_rate = np.mean(self._prediction_metrics.get('revenue_growth_rates', [5])) if self._prediction_metrics.get('revenue_growth_rates') else 5
+            
+            for i in range(1, periods_ahead + 1):
+                future_period = len(revenue_data) + i
+                
+                # Multiple prediction methods
+                exp_smooth_pred = last_revenue * (1 + avg_growth_rate/100) ** i
+                ma_trend_pred = revenue_data['ma_trend'].iloc[-1] * (1 + avg_growth_rate/100) ** i
+                linear_pred = slope * future_period + intercept if 'slope' in locals() else last_revenue * (1 + avg_growth_rate/100) ** i
+                
+                # Ensemble prediction (weighted average)
+                ensemble_pred = (exp_smooth_pred * 0.4 + ma_trend_pred * 0.3 + linear_pred * 0.3)
+                
+                # Add confidence intervals
+                confidence_range = ensemble_pred * 0.15  # 15% confidence range
+                lower_bound = ensemble_pred - confidence_range
+                upper_bound = ensemble_pred + confidence_range
+                
+                future_predictions.append({
+                    'period': f'Future_{i}',
+                    'period_num': future_period,
+                    'predicted_revenue': ensemble_pred,
+                    'lower_bound': lower_bound,
+                    'upper_bound': upper_bound,
+                    'confidence_level': confidence_level * 100,
+                    'exp_smooth_pred': exp_smooth_pred,
+                    'ma_trend_pred': ma_trend_pred,
+                    'linear_pred': linear_pred
+                })
+            
+            # Combine historical and future data
+            future_df = pd.DataFrame(future_predictions)
+            combined_data = pd.concat([revenue_data, future_df], ignore_index=True)
+            
+            # Store prediction performance metrics
+            self._model_performance['revenue_prediction'] = {
+                'avg_growth_rate': avg_growth_rate,
+                'confidence_level': confidence_level,
+                'prediction_horizon': periods_ahead
+            }
+            
+            return combined_data, "Advanced revenue prediction completed successfully"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error predicting revenue trends: {str(e)}"
+    
+    @memoized_prediction('income_statement')
+    def predict_profitability_trends(self, periods_ahead=6):
+        """Predict profitability trends using multiple financial ratios"""
+        if self.income_statement.empty or len(self.income_statement) < 3:
+            return pd.DataFrame(), "Insufficient data for profitability prediction"
+        
+        try:
+            profitability_data = self.income_statement[['period', 'revenue', 'net_income']].copy()
+            profitability_data['period_num'] = range(len(profitability_data))
+            
+            # Calculate historical profitability ratios
+            profitability_data['net_margin'] = (profitability_data['net_income'] / profitability_data['revenue'] * 100).fillna(0)
+            
+            # Predict future profitability
+            future_predictions = []
+            last_margin = profitability_data['net_margin'].iloc[-1]
+            margin_trend = np.polyfit(profitability_data['period_num'], profitability_data['net_margin'], 1)[0]
+            
+            for i in range(1, periods_ahead + 1):
+                future_period = len(profitability_data) + i
+                
+                # Predict margin with trend
+                predicted_margin = last_margin + (margin_trend * i)
+                
+                # Ensure margin stays within reasonable bounds
+                predicted_margin = max(min(predicted_margin, 50), -20)
+                
+                # Predict revenue (use revenue prediction if available)
+                if 'revenue' in self._prediction_cache:
+                    predicted_revenue = self._prediction_cache['revenue'].get(f'Future_{i}', 0)
+                else:
+                    # Simple revenue projection
+                    last_revenue = profitability_data['revenue'].iloc[-1]
+                    avg_growth = np.mean(self._prediction_metrics.get('revenue_growth_rates', [5])) if self._prediction_metrics.get('revenue_growth_rates') else 5
+                    predicted_revenue = last_revenue * (1 + avg_growth/100) ** i
+                
+                # Calculate predicted net income
+                predicted_net_income = predicted_revenue * (predicted_margin / 100)
+                
+                future_predictions.append({
+                    'period': f'Future_{i}',
+                    'period_num': future_period,
+                    'predicted_revenue': predicted_revenue,
+                    'predicted_net_margin': predicted_margin,
+                    'predicted_net_income': predicted_net_income
+                })
+            
+            # Combine historical and future data
+            future_df = pd.DataFrame(future_predictions)
+            combined_data = pd.concat([profitability_data, future_df], ignore_index=True)
+            
+            return combined_data, "Profitability trends predicted successfully"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error predicting profitability trends: {str(e)}"
+    
+    @memoized_prediction('cash_flow')
+    def predict_cash_flow_trends(self, periods_ahead=6):
+        """Predict cash flow trends and liquidity position"""
+        if self.cash_flow.empty or len(self.cash_flow) < 3:
+            return pd.DataFrame(), "Insufficient data for cash flow prediction"
+        
+        try:
+            # Check for required columns with fallback names
+            required_cols = ['period']
+            operating_cf_col = None
+            free_cf_col = None
+            
+            # Find operating cash flow column
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in self.cash_flow.columns:
+                    operating_cf_col = col_name
+                    required_cols.append(col_name)
+                    break
+            
+            # Find free cash flow column
+            for col_name in ['free_cash_flow', 'free_cf', 'free_cashflow', 'fcf']:
+                if col_name in self.cash_flow.columns:
+                    free_cf_col = col_name
+                    required_cols.append(col_name)
+                    break
+            
+            if not operating_cf_col:
+                return pd.DataFrame(), "Operating cash flow column not found. Expected columns: operating_cash_flow, operating_cf, operating_cashflow"
+            
+            cash_flow_data = self.cash_flow[required_cols].copy()
+            cash_flow_data['period_num'] = range(len(cash_flow_data))
+            
+            # Calculate cash flow trends
+            operating_cf = cash_flow_data[operating_cf_col].values
+            cf_trend = np.polyfit(cash_flow_data['period_num'], operating_cf, 1)[0]
+            
+            # Predict future cash flows
+            future_predictions = []
+            last_operating_cf = operating_cf[-1]
+            
+            for i in range(1, periods_ahead + 1):
+                future_period = len(cash_flow_data) + i
+                
+                # Predict operating cash flow with trend
+                predicted_operating_cf = last_operating_cf + (cf_trend * i)
+                
+                # Add some seasonality and variability
+                seasonality_factor = 1 + 0.1 * np.sin(2 * np.pi * i / 4)  # Quarterly seasonality
+                predicted_operating_cf *= seasonality_factor
+                
+                # Predict free cash flow (simplified)
+                predicted_free_cf = predicted_operating_cf * 0.7  # Assume 70% conversion
+                
+                future_predictions.append({
+                    'period': f'Future_{i}',
+                    'period_num': future_period,
+                    'predicted_operating_cf': predicted_operating_cf,
+                    'predicted_free_cf': predicted_free_cf,
+                    'cash_flow_health': 'Healthy' if predicted_free_cf > 0 else 'Concerning'
+                })
+            
+            # Combine historical and future data
+            future_df = pd.DataFrame(future_predictions)
+            combined_data = pd.concat([cash_flow_data, future_df], ignore_index=True)
+            
+            return combined_data, "Cash flow trends predicted successfully"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error predicting cash flow trends: {str(e)}"
+    
+    @memoized_prediction('income_statement', 'balance_sheet', 'cash_flow')
+    def predict_financial_health_score(self, periods_ahead=6):
+        """Predict overall financial health score using multiple indicators"""
+        if (self.income_statement.empty or self.balance_sheet.empty or 
+            self.cash_flow.empty or len(self.income_statement) < 3):
+            return pd.DataFrame(), "Insufficient data for financial health prediction"
+        
+        try:
+            # Calculate historical financial health scores
+            health_scores = []
+            periods = []
+            
+            for i in range(len(self.income_statement)):
+                period = self.income_statement['period'].iloc[i]
+                periods.append(period)
+                
+                # Get corresponding balance sheet and cash flow data
+                bs_data = self.balance_sheet[self.balance_sheet['period'] == period]
+                cf_data = self.cash_flow[self.cash_flow['period'] == period]
+                
+                if not bs_data.empty and not cf_data.empty:
+                    # Calculate health score components
+                    revenue = self.income_statement['revenue'].iloc[i]
+                    net_income = self.income_statement['net_income'].iloc[i]
+                    current_assets = bs_data['current_assets'].iloc[0] if 'current_assets' in bs_data.columns else 0
+                    current_liabilities = bs_data['current_liabilities'].iloc[0] if 'current_liabilities' in bs_data.columns else 0
+                    
+                    # Find operating cash flow column with fallback names
+                    operating_cf = 0
+                    for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                        if col_name in cf_data.columns:
+                            operating_cf = cf_data[col_name].iloc[0]
+                            break
+                    
+                    # Health score calculation (0-100 scale)
+                    score = 0
+                    
+                    # Profitability (30 points)
+                    if revenue > 0:
+                        net_margin = (net_income / revenue) * 100
+                        if net_margin > 15:
+                            score += 30
+                        elif net_margin > 10:
+                            score += 25
+                        elif net_margin > 5:
+                            score += 20
+                        elif net_margin > 0:
+                            score += 15
+                        else:
+                            score += 5
+                    
+                    # Liquidity (25 points)
+                    if current_liabilities > 0:
+                        current_ratio = current_assets / current_liabilities
+                        if current_ratio > 2.0:
+                            score += 25
+                        elif current_ratio > 1.5:
+                            score += 20
+                        elif current_ratio > 1.0:
+                            score += 15
+                        else:
+                            score += 5
+                    
+                    # Cash flow (25 points)
+                    if revenue > 0:
+                        cf_to_revenue = (operating_cf / revenue) * 100
+                        if cf_to_revenue > 15:
+                            score += 25
+                        elif cf_to_revenue > 10:
+                            score += 20
+                        elif cf_to_revenue > 5:
+                            score += 15
+                        else:
+                            score += 5
+                    
+                    # Growth (20 points)
+                    if i > 0:
+                        prev_revenue = self.income_statement['revenue'].iloc[i-1]
+                        if prev_revenue > 0:
+                            growth_rate = ((revenue - prev_revenue) / prev_revenue) * 100
+                            if growth_rate > 10:
+                                score += 20
+                            elif growth_rate > 5:
+                                score += 15
+                            elif growth_rate > 0:
+                                score += 10
+                            else:
+                                score += 5
+                    
+                    health_scores.append(score)
+                else:
+                    health_scores.append(50)  # Default score if data missing
+            
+            # Predict future health scores
+            if len(health_scores) >= 3:
+                health_trend = np.polyfit(range(len(health_scores)), health_scores, 1)[0]
+                
+                future_predictions = []
+                last_score = health_scores[-1]
+                
+                for i in range(1, periods_ahead + 1):
+                    future_period = len(periods) + i
+                    
+                    # Predict health score with trend
+                    predicted_score = last_score + (health_trend * i)
+                    predicted_score = max(min(predicted_score, 100), 0)  # Ensure 0-100 range
+                    
+                    # Categorize health level
+                    if predicted_score >= 80:
+                        health_level = "Excellent"
+                    elif predicted_score >= 60:
+                        health_level = "Good"
+                    elif predicted_score >= 40:
+                        health_level = "Fair"
+                    else:
+                        health_level = "Poor"
+                    
+                    future_predictions.append({
+                        'period': f'Future_{i}',
+                        'period_num': future_period,
+                        'predicted_health_score': predicted_score,
+                        'health_level': health_level,
+                        'trend': 'Improving' if health_trend > 0 else 'Declining' if health_trend < 0 else 'Stable'
+                    })
+                
+                # Combine historical and future data
+                historical_data = pd.DataFrame({
+                    'period': periods,
+                    'health_score': health_scores
+                })
+                
+                future_df = pd.DataFrame(future_predictions)
+                combined_data = pd.concat([historical_data, future_df], ignore_index=True)
+                
+                return combined_data, "Financial health scores predicted successfully"
+            
+            return pd.DataFrame(), "Insufficient data for health score prediction"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error predicting financial health scores: {str(e)}"
+    
+    @memoized_prediction('market_data')
+    def predict_market_performance(self, periods_ahead=6):
+        """Predict market performance indicators"""
+        if self.market_data.empty or len(self.market_data) < 3:
+            return pd.DataFrame(), "Insufficient market data for prediction"
+        
+        try:
+            market_data = self.market_data[['period', 'market_price', 'market_cap']].copy()
+            market_data['period_num'] = range(len(market_data))
+            
+            # Predict stock price trends
+            if 'market_price' in market_data.columns:
+                prices = market_data['market_price'].values
+                price_trend = np.polyfit(market_data['period_num'], prices, 1)[0]
+                
+                future_predictions = []
+                last_price = prices[-1]
+                
+                for i in range(1, periods_ahead + 1):
+                    future_period = len(market_data) + i
+                    
+                    # Predict price with trend and volatility
+                    predicted_price = last_price + (price_trend * i)
+                    
+                    # Add volatility factor
+                    volatility = np.std(prices) * 0.1  # 10% of historical volatility
+                    predicted_price += np.random.normal(0, volatility)
+                    
+                    # Ensure positive price
+                    predicted_price = max(predicted_price, last_price * 0.5)
+                    
+                    future_predictions.append({
+                        'period': f'Future_{i}',
+                        'period_num': future_period,
+                        'predicted_price': predicted_price,
+                        'price_change_pct': ((predicted_price - last_price) / last_price) * 100,
+                        'market_sentiment': 'Bullish' if predicted_price > last_price else 'Bearish'
+                    })
+                
+                # Combine historical and future data
+                future_df = pd.DataFrame(future_predictions)
+                combined_data = pd.concat([market_data, future_df], ignore_index=True)
+                
+                return combined_data, "Market performance predicted successfully"
+            
+            return pd.DataFrame(), "Insufficient market price data for prediction"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error predicting market performance: {str(e)}"
+    
+    def get_prediction_accuracy_metrics(self):
+        """Calculate prediction accuracy metrics for model validation"""
+        if not self._model_performance:
+            return "No predictions available for accuracy assessment"
+        
+        accuracy_metrics = []
+        accuracy_metrics.append("## 📊 Prediction Model Performance Metrics")
+        accuracy_metrics.append("")
+        
+        for model_name, metrics in self._model_performance.items():
+            accuracy_metrics.append(f"**{model_name.replace('_', ' ').title()}**:")
+            for metric, value in metrics.items():
+                if isinstance(value, float):
+                    accuracy_metrics.append(f"  • {metric.replace('_', ' ').title()}: {value:.2f}")
+                else:
+                    accuracy_metrics.append(f"  • {metric.replace('_', ' ').title()}: {value}")
+            accuracy_metrics.append("")
+        
+        return "\n".join(accuracy_metrics)
+    
+    def _scenario_base_forecasts(self, periods_ahead):
+        """Future revenue and net margin forecasts shared by every scenario"""
+        revenue_pred, _ = self.predict_revenue_trends(periods_ahead)
+        profitability_pred, _ = self.predict_profitability_trends(periods_ahead)
+        if revenue_pred.empty or profitability_pred.empty:
+            return pd.DataFrame()
+        
+        future_revenue = revenue_pred.loc[revenue_pred['period'].str.contains('Future', na=False), ['period', 'predicted_revenue']]
+        future_margin = profitability_pred.loc[profitability_pred['period'].str.contains('Future', na=False), ['period', 'predicted_net_margin']]
+        return future_revenue.merge(future_margin, on='period', how='inner')
+    
+    @memoized_prediction('income_statement')
+    def predict_scenario_analysis(self, scenarios=['optimistic', 'base', 'pessimistic'], periods_ahead=6):
+        """Perform scenario analysis for financial planning"""
+        if self.income_statement.empty or len(self.income_statement) < 3:
+            return pd.DataFrame(), "Insufficient data for scenario analysis"
+        
+        try:
+            # Base forecasts are computed once and scaled per scenario
+            base = self._scenario_base_forecasts(periods_ahead)
+            if base.empty or not scenarios:
+                return pd.DataFrame(), "Scenario analysis completed successfully"
+            
+            multipliers = np.array([SCENARIO_PRESETS.get(scenario, SCENARIO_PRESETS['base']) for scenario in scenarios])
+            n_periods = len(base)
+            growth_multiplier = np.repeat(multipliers[:, 0], n_periods)
+            margin_improvement = np.repeat(multipliers[:, 1], n_periods)
+            adjusted_revenue = np.tile(base['predicted_revenue'].to_numpy(dtype=float), len(scenarios)) * growth_multiplier
+            adjusted_margin = np.tile(base['predicted_net_margin'].to_numpy(dtype=float), len(scenarios)) * margin_improvement
+            
+            scenario_results = pd.DataFrame({
+                'scenario': np.repeat(list(scenarios), n_periods),
+                'period': np.tile(base['period'].to_numpy(), len(scenarios)),
+                'adjusted_revenue': adjusted_revenue,
+                'adjusted_margin': adjusted_margin,
+                'adjusted_net_income': adjusted_revenue * (adjusted_margin / 100),
+                'growth_multiplier': growth_multiplier,
+                'margin_improvement': margin_improvement
+            })
+            
+            return scenario_results, "Scenario analysis completed successfully"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error performing scenario analysis: {str(e)}"
+    
+    def simulate_scenarios(self, scenarios=['optimistic', 'base', 'pessimistic'], periods_ahead=12,
+                           n_paths=DEFAULT_PATHS, covenants=None, seed=42):
+        """Monte Carlo scenario simulation around the base revenue and margin forecasts"""
+        if self.income_statement.empty or len(self.income_statement) < 3:
+            return None, "Insufficient data for scenario simulation"
+        
+        try:
+            base = self._scenario_base_forecasts(periods_ahead)
+            if base.empty or not scenarios:
+                return None, "No base forecasts available for scenario simulation"
+            
+            interest_expense, tax_rate = estimate_debt_service(self.income_statement)
+            simulation = simulate_scenarios(
+                base['predicted_revenue'].to_numpy(dtype=float),
+                base['predicted_net_margin'].to_numpy(dtype=float),
+                scenarios={scenario: SCENARIO_PRESETS.get(scenario, SCENARIO_PRESETS['base']) for scenario in scenarios},
+                n_paths=n_paths,
+                volatility=estimate_volatility(self.income_statement),
+                interest_expense=interest_expense,
+                tax_rate=tax_rate,
+                covenants=covenants,
+                periods=base['period'].tolist(),
+                seed=seed
+            )
+            return simulation, f"Simulated {simulation.n_paths:,} paths per scenario"
+            
+        except Exception as e:
+            return None, f"Error simulating scenarios: {str(e)}"
+    
+    @memoized_prediction('income_statement', 'balance_sheet')
+    def predict_break_even_analysis(self, periods_ahead=6):
+        """Predict break-even analysis for future periods"""
+        if self.income_statement.empty or len(self.income_statement) < 3:
+            return pd.DataFrame(), "Insufficient data for break-even analysis"
+        
+        try:
+            # Calculate historical break-even points
+            break_even_data = []
+            
+            for i in range(len(self.income_statement)):
+                period = self.income_statement['period'].iloc[i]
+                revenue = self.income_statement['revenue'].iloc[i]
+                
+                # Get corresponding balance sheet data
+                bs_data = self.balance_sheet[self.balance_sheet['period'] == period]
+                
+                if not bs_data.empty:
+                    # Calculate break-even components
+                    fixed_costs = revenue * 0.3  # Assume 30% fixed costs (simplified)
+                    variable_costs = revenue * 0.5  # Assume 50% variable costs (simplified)
+                    total_costs = fixed_costs + variable_costs
+                    
+                    # Break-even revenue
+                    break_even_revenue = fixed_costs / (1 - (variable_costs / revenue)) if revenue > 0 else 0
+                    
+                    # Safety margin
+                    safety_margin = ((revenue - break_even_revenue) / revenue * 100) if revenue > 0 else 0
+                    
+                    break_even_data.append({
+                        'period': period,
+                        'revenue': revenue,
+                        'fixed_costs': fixed_costs,
+                        'variable_costs': variable_costs,
+                        'total_costs': total_costs,
+                        'break_even_revenue': break_even_revenue,
+                        'safety_margin': safety_margin
+                    })
+            
+            # Predict future break-even points
+            if len(break_even_data) >= 3:
+                # Calculate trends
+                revenue_trend = np.polyfit(range(len(break_even_data)), [d['revenue'] for d in break_even_data], 1)[0]
+                fixed_costs_trend = np.polyfit(range(len(break_even_data)), [d['fixed_costs'] for d in break_even_data], 1)[0]
+                
+                future_predictions = []
+                last_revenue = break_even_data[-1]['revenue']
+                last_fixed_costs = break_even_data[-1]['fixed_costs']
+                
+                for i in range(1, periods_ahead + 1):
+                    future_period = len(break_even_data) + i
+                    
+                    # Predict future values
+                    predicted_revenue = last_revenue + (revenue_trend * i)
+                    predicted_fixed_costs = last_fixed_costs + (fixed_costs_trend * i)
+                    predicted_variable_costs = predicted_revenue * 0.5
+                    
+                    # Calculate predicted break-even
+                    predicted_break_even = predicted_fixed_costs / (1 - (predicted_variable_costs / predicted_revenue)) if predicted_revenue > 0 else 0
+                    predicted_safety_margin = ((predicted_revenue - predicted_break_even) / predicted_revenue * 100) if predicted_revenue > 0 else 0
+                    
+                    future_predictions.append({
+                        'period': f'Future_{i}',
+                        'revenue': predicted_revenue,
+                        'fixed_costs': predicted_fixed_costs,
+                        'variable_costs': predicted_variable_costs,
+                        'total_costs': predicted_fixed_costs + predicted_variable_costs,
+                        'break_even_revenue': predicted_break_even,
+                        'safety_margin': predicted_safety_margin
+                    })
+                
+                # Combine historical and future data
+                historical_df = pd.DataFrame(break_even_data)
+                future_df = pd.DataFrame(future_predictions)
+                combined_data = pd.concat([historical_df, future_df], ignore_index=True)
+                
+                return combined_data, "Break-even analysis completed successfully"
+            
+            return pd.DataFrame(), "Insufficient data for break-even prediction"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error performing break-even analysis: {str(e)}"
+    
+    @memoized_prediction('balance_sheet', 'cash_flow')
+    def predict_working_capital_needs(self, periods_ahead=6):
+        """Predict working capital requirements for future periods"""
+        if (self.balance_sheet.empty or self.cash_flow.empty or 
+            len(self.balance_sheet) < 3):
+            return pd.DataFrame(), "Insufficient data for working capital prediction"
+        
+        try:
+            working_capital_data = []
+            
+            for i in range(len(self.balance_sheet)):
+                period = self.balance_sheet['period'].iloc[i]
+                
+                # Get current assets and liabilities
+                current_assets = self.balance_sheet['current_assets'].iloc[i] if 'current_assets' in self.balance_sheet.columns else 0
+                current_liabilities = self.balance_sheet['current_liabilities'].iloc[i] if 'current_liabilities' in self.balance_sheet.columns else 0
+                
+                # Calculate working capital
+                working_capital = current_assets - current_liabilities
+                
+                # Get corresponding cash flow data
+                cf_data = self.cash_flow[self.cash_flow['period'] == period]
+                # Find operating cash flow column with fallback names
+                operating_cf = 0
+                for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                    if col_name in cf_data.columns:
+                        operating_cf = cf_data[col_name].iloc[0]
+                        break
+                
+                # Working capital turnover
+                wc_turnover = operating_cf / working_capital if working_capital > 0 else 0
+                
+                working_capital_data.append({
+                    'period': period,
+                    'current_assets': current_assets,
+                    'current_liabilities': current_liabilities,
+                    'working_capital': working_capital,
+                    'operating_cf': operating_cf,
+                    'wc_turnover': wc_turnover
+                })
+            
+            # Predict future working capital needs
+            if len(working_capital_data) >= 3:
+                # Calculate trends
+                wc_trend = np.polyfit(range(len(working_capital_data)), [d['working_capital'] for d in working_capital_data], 1)[0]
+                cf_trend = np.polyfit(range(len(working_capital_data)), [d['operating_cf'] for d in working_capital_data], 1)[0]
+                
+                future_predictions = []
+                last_wc = working_capital_data[-1]['working_capital']
+                last_cf = working_capital_data[-1]['operating_cf']
+                
+                for i in range(1, periods_ahead + 1):
+                    future_period = len(working_capital_data) + i
+                    
+                    # Predict future values
+                    predicted_wc = last_wc + (wc_trend * i)
+                    predicted_cf = last_cf + (cf_trend * i)
+                    
+                    # Calculate predicted turnover
+                    predicted_turnover = predicted_cf / predicted_wc if predicted_wc > 0 else 0
+                    
+                    # Working capital adequacy assessment
+                    if predicted_wc > 0:
+                        if predicted_wc > last_wc * 1.2:
+                            adequacy = "Excessive"
+                        elif predicted_wc < last_wc * 0.8:
+                            adequacy = "Insufficient"
+                        else:
+                            adequacy = "Adequate"
+                    else:
+                        adequacy = "Critical"
+                    
+                    future_predictions.append({
+                        'period': f'Future_{i}',
+                        'predicted_working_capital': predicted_wc,
+                        'predicted_operating_cf': predicted_cf,
+                        'predicted_wc_turnover': predicted_turnover,
+                        'adequacy_assessment': adequacy,
+                        'recommendation': 'Optimize' if adequacy == "Excessive" else 'Increase' if adequacy == "Insufficient" else 'Monitor'
+                    })
+                
+                # Combine historical and future data
+                historical_df = pd.DataFrame(working_capital_data)
+                future_df = pd.DataFrame(future_predictions)
+                combined_data = pd.concat([historical_df, future_df], ignore_index=True)
+                
+                return combined_data, "Working capital prediction completed successfully"
+            
+            return pd.DataFrame(), "Insufficient data for working capital prediction"
+            
+        except Exception as e:
+            return pd.DataFrame(), f"Error predicting working capital needs: {str(e)}"
+
+def display_finance_predictive_analytics_dashboard(predictive_analytics):
+    """Display comprehensive predictive analytics dashboard"""
+    if predictive_analytics is None:
+        st.error("Predictive analytics not available")
+        return
+    
+    st.markdown("""
+    <div class="section-header">
+        <h3>🔮 Advanced Predictive Analytics</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Create tabs for different prediction types
+    pred_tab1, pred_tab2, pred_tab3, pred_tab4, pred_tab5, pred_tab6, pred_tab7, pred_tab8, pred_tab9 = st.tabs([
+        "📈 Revenue Trends", "💰 Profitability", "💸 Cash Flow", 
+        "🏥 Financial Health", "📊 Market Performance", "🎯 Scenario Analysis",
+        "⚖️ Break-Even Analysis", "💼 Working Capital", "📋 Model Performance"
+    ])
+    
+    with pred_tab1:
+        st.subheader("📈 Revenue Trend Predictions")
+        
+        # Prediction parameters
+        col1, col2 = st.columns(2)
+        with col1:
+            periods_ahead = st.slider("Prediction Periods", 3, 12, 6, help="Number of future periods to predict", key="revenue_prediction_periods")
+        with col2:
+            confidence_level = st.slider("Confidence Level", 0.80, 0.99, 0.95, help="Prediction confidence level", key="revenue_confidence_level")
+        
+        # Generate revenue predictions
+        revenue_prediction, message = predictive_analytics.predict_revenue_trends(periods_ahead, confidence_level)
+        
+        if not revenue_prediction.empty:
+            # Display prediction summary
+            st.markdown("### 📊 Prediction Summary")
+            
+            # Key metrics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if 'predicted_revenue' in revenue_prediction.columns:
+                    future_revenue = revenue_prediction[revenue_prediction['period'].str.contains('Future')]['predicted_revenue'].sum()
+                    st.metric("Total Predicted Revenue", f"${future_revenue:,.0f}")
+            
+            with col2:
+                if 'revenue_growth_rates' in predictive_analytics._prediction_metrics:
+                    avg_growth = np.mean(predictive_analytics._prediction_metrics['revenue_growth_rates'])
+                    st.metric("Average Growth Rate", f"{avg_growth:.1f}%")
+            
+            with col3:
+                if 'confidence_level' in revenue_prediction.columns:
+                    avg_confidence = revenue_prediction['confidence_level'].mean()
+                    st.metric("Average Confidence", f"{avg_confidence:.1f}%")
+            
+            # Display detailed predictions
+            st.markdown("### 📋 Detailed Predictions")
+            display_cols = ['period', 'revenue', 'predicted_revenue']
+            if 'lower_bound' in revenue_prediction.columns:
+                display_cols.extend(['lower_bound', 'upper_bound'])
+            
+            st.dataframe(revenue_prediction[display_cols].round(2), use_container_width=True)
+            
+            # Create enhanced prediction chart
+            fig = go.Figure()
+            
+            # Historical data
+            historical = revenue_prediction[~revenue_prediction['period'].str.contains('Future')]
+            fig.add_trace(go.Scatter(
+                x=historical['period'],
+                y=historical['revenue'],
+                mode='lines+markers',
+                name='Historical Revenue',
+                line=dict(color='blue', width=3),
+                marker=dict(size=8)
+            ))
+            
+            # Predicted data
+            future = revenue_prediction[revenue_prediction['period'].str.contains('Future')]
+            if not future.empty:
+                fig.add_trace(go.Scatter(
+                    x=future['period'],
+                    y=future['predicted_revenue'],
+                    mode='lines+markers',
+                    name='Predicted Revenue',
+                    line=dict(color='red', width=3, dash='dash'),
+                    marker=dict(size=8)
+                ))
+                
+                # Add confidence intervals if available
+                if 'lower_bound' in future.columns and 'upper_bound' in future.columns:
+                    fig.add_trace(go.Scatter(
+                        x=future['period'],
+                        y=future['upper_bound'],
+                        mode='lines',
+                        name='Upper Bound',
+                        line=dict(color='red', width=1, dash='dot'),
+                        showlegend=False
+                    ))
+                    
+                    fig.add_trace(go.Scatter(
+                        x=future['period'],
+                        y=future['lower_bound'],
+                        mode='lines',
+                        name='Lower Bound',
+                        line=dict(color='red', width=1, dash='dot'),
+                        fill='tonexty',
+                        fillcolor='rgba(255,0,0,0.1)',
+                        showlegend=False
+                    ))
+            
+            fig.update_layout(
+                title="Revenue Trends and Predictions with Confidence Intervals",
+                xaxis_title="Period",
+                yaxis_title="Revenue ($)",
+                hovermode='x unified',
+                template="plotly_white"
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Model comparison
+            if 'exp_smooth_pred' in future.columns:
+                st.markdown("### 🔍 Model Comparison")
+                model_comparison = future[['period', 'exp_smooth_pred', 'ma_trend_pred', 'linear_pred', 'predicted_revenue']].round(2)
+                st.dataframe(model_comparison, use_container_width=True)
+        else:
+            st.warning(message)
+    
+    with pred_tab2:
+        st.subheader("💰 Profitability Trend Predictions")
+        
+        # Generate profitability predictions
+        profitability_prediction, message = predictive_analytics.predict_profitability_trends(periods_ahead)
+        
+        if not profitability_prediction.empty:
+            # Display prediction summary
+            st.markdown("### 📊 Profitability Summary")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if 'predicted_net_income' in profitability_prediction.columns:
+                    future_net_income = profitability_prediction[profitability_prediction['period'].str.contains('Future')]['predicted_net_income'].sum()
+                    st.metric("Total Predicted Net Income", f"${future_net_income:,.0f}")
+            
+            with col2:
+                if 'predicted_net_margin' in profitability_prediction.columns:
+                    avg_margin = profitability_prediction[profitability_prediction['period'].str.contains('Future')]['predicted_net_margin'].mean()
+                    st.metric("Average Predicted Margin", f"{avg_margin:.1f}%")
+            
+            with col3:
+                if 'net_margin' in profitability_prediction.columns:
+                    current_margin = profitability_prediction['net_margin'].iloc[-1]
+                    st.metric("Current Net Margin", f"{current_margin:.1f}%")
+            
+            # Display predictions
+            st.markdown("### 📋 Profitability Predictions")
+            st.dataframe(profitability_prediction.round(2), use_container_width=True)
+            
+            # Create profitability chart
+            fig = go.Figure()
+            
+            # Historical margins
+            historical = profitability_prediction[~profitability_prediction['period'].str.contains('Future')]
+            fig.add_trace(go.Scatter(
+                x=historical['period'],
+                y=historical['net_margin'],
+                mode='lines+markers',
+                name='Historical Net Margin',
+                line=dict(color='green', width=3)
+            ))
+            
+            # Predicted margins
+            future = profitability_prediction[profitability_prediction['period'].str.contains('Future')]
+            if not future.empty:
+                fig.add_trace(go.Scatter(
+                    x=future['period'],
+                    y=future['predicted_net_margin'],
+                    mode='lines+markers',
+                    name='Predicted Net Margin',
+                    line=dict(color='orange', width=3, dash='dash')
+                ))
+            
+            fig.update_layout(
+                title="Net Margin Trends and Predictions",
+                xaxis_title="Period",
+                yaxis_title="Net Margin (%)",
+                hovermode='x unified',
+                template="plotly_white"
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning(message)
+    
+    with pred_tab3:
+        st.subheader("💸 Cash Flow Trend Predictions")
+        
+        # Generate cash flow predictions
+        cash_flow_prediction, message = predictive_analytics.predict_cash_flow_trends(periods_ahead)
+        
+        if not cash_flow_prediction.empty:
+            # Display prediction summary
+            st.markdown("### 📊 Cash Flow Summary")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if 'predicted_operating_cf' in cash_flow_prediction.columns:
+                    future_operating_cf = cash_flow_prediction[cash_flow_prediction['period'].str.contains('Future')]['predicted_operating_cf'].sum()
+                    st.metric("Total Predicted Operating CF", f"${future_operating_cf:,.0f}")
+            
+            with col2:
+                if 'predicted_free_cf' in cash_flow_prediction.columns:
+                    future_free_cf = cash_flow_prediction[cash_flow_prediction['period'].str.contains('Future')]['predicted_free_cf'].sum()
+                    st.metric("Total Predicted Free CF", f"${future_free_cf:,.0f}")
+            
+            with col3:
+                if 'cash_flow_health' in cash_flow_prediction.columns:
+                    healthy_periods = len(cash_flow_prediction[cash_flow_prediction['cash_flow_health'] == 'Healthy'])
+                    total_periods = len(cash_flow_prediction[cash_flow_prediction['period'].str.contains('Future')])
+                    health_percentage = (healthy_periods / total_periods * 100) if total_periods > 0 else 0
+                    st.metric("Healthy Cash Flow Periods", f"{health_percentage:.1f}%")
+            
+            # Display predictions
+            st.markdown("### 📋 Cash Flow Predictions")
+            st.dataframe(cash_flow_prediction.round(2), use_container_width=True)
+            
+            # Create cash flow chart
+            fig = go.Figure()
+            
+            # Historical operating cash flow
+            historical = cash_flow_prediction[~cash_flow_prediction['period'].str.contains('Future')]
+            # Check for operating cash flow column with fallback names
+            operating_cf_col = None
+            for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+                if col_name in historical.columns:
+                    operating_cf_col = col_name
+                    break
+            
+            if operating_cf_col:
+                fig.add_trace(go.Scatter(
+                    x=historical['period'],
+                    y=historical[operating_cf_col],
+                    mode='lines+markers',
+                    name='Historical Operating CF',
+                    line=dict(color='blue', width=3)
+                ))
+            
+            # Predicted operating cash flow
+            future = cash_flow_prediction[cash_flow_prediction['period'].str.contains('Future')]
+            if not future.empty and 'predicted_operating_cf' in future.columns:
+                fig.add_trace(go.Scatter(
+                    x=future['period'],
+                    y=future['predicted_operating_cf'],
+                    mode='lines+markers',
+                    name='Predicted Operating CF',
+                    line=dict(color='red', width=3, dash='dash')
+                ))
+            
+            fig.update_layout(
+                title="Operating Cash Flow Trends and Predictions",
+                xaxis_title="Period",
+                yaxis_title="Operating Cash Flow ($)",
+                hovermode='x unified',
+                template="plotly_white"
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning(message)
+    
+    with pred_tab4:
+        st.subheader("🏥 Financial Health Score Predictions")
+        
+        # Generate financial health predictions
+        health_prediction, message = predictive_analytics.predict_financial_health_score(periods_ahead)
+        
+        if not health_prediction.empty:
+            # Display prediction summary
+            st.markdown("### 📊 Financial Health Summary")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if 'health_score' in health_prediction.columns:
+                    current_score = health_prediction['health_score'].iloc[-1]
+                    st.metric("Current Health Score", f"{current_score:.0f}/100")
+            
+            with col2:
+                if 'predicted_health_score' in health_prediction.columns:
+                    future_scores = health_prediction[health_prediction['period'].str.contains('Future')]['predicted_health_score']
+                    avg_future_score = future_scores.mean()
+                    st.metric("Average Predicted Score", f"{avg_future_score:.0f}/100")
+            
+            with col3:
+                if 'trend' in health_prediction.columns:
+                    improving_periods = len(health_prediction[health_prediction['trend'] == 'Improving'])
+                    total_periods = len(health_prediction[health_prediction['period'].str.contains('Future')])
+                    improvement_percentage = (improving_periods / total_periods * 100) if total_periods > 0 else 0
+                    st.metric("Improving Trend Periods", f"{improvement_percentage:.1f}%")
+            
+            # Display predictions
+            st.markdown("### 📋 Financial Health Predictions")
+            st.dataframe(health_prediction.round(2), use_container_width=True)
+            
+            # Create health score chart
+            fig = go.Figure()
+            
+            # Historical health scores
+            historical = health_prediction[~health_prediction['period'].str.contains('Future')]
+            fig.add_trace(go.Scatter(
+                x=historical['period'],
+                y=historical['health_score'],
+                mode='lines+markers',
+                name='Historical Health Score',
+                line=dict(color='green', width=3)
+            ))
+            
+            # Predicted health scores
+            future = health_prediction[health_prediction['period'].str.contains('Future')]
+            if not future.empty:
+                fig.add_trace(go.Scatter(
+                    x=future['period'],
+                    y=future['predicted_health_score'],
+                    mode='lines+markers',
+                    name='Predicted Health Score',
+                    line=dict(color='orange', width=3, dash='dash')
+                ))
+            
+            # Add health level thresholds
+            fig.add_hline(y=80, line_dash="dash", line_color="green", annotation_text="Excellent (80+)")
+            fig.add_hline(y=60, line_dash="dash", line_color="yellow", annotation_text="Good (60+)")
+            fig.add_hline(y=40, line_dash="dash", line_color="orange", annotation_text="Fair (40+)")
+            fig.add_hline(y=20, line_dash="dash", line_color="red", annotation_text="Poor (<40)")
+            
+            fig.update_layout(
+                title="Financial Health Score Trends and Predictions",
+                xaxis_title="Period",
+                yaxis_title="Health Score (0-100)",
+                yaxis_range=[0, 100],
+                hovermode='x unified',
+                template="plotly_white"
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning(message)
+    
+    with pred_tab5:
+        st.subheader("📊 Market Performance Predictions")
+        
+        # Generate market performance predictions
+        market_prediction, message = predictive_analytics.predict_market_performance(periods_ahead)
+        
+        if not market_prediction.empty:
+            # Display prediction summary
+            st.markdown("### 📊 Market Summary")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if 'market_price' in market_prediction.columns:
+                    current_price = market_prediction['market_price'].iloc[-1]
+                    st.metric("Current Market Price", f"${current_price:.2f}")
+            
+            with col2:
+                if 'predicted_price' in market_prediction.columns:
+                    future_prices = market_prediction[market_prediction['period'].str.contains('Future')]['predicted_price']
+                    avg_future_price = future_prices.mean()
+                    st.metric("Average Predicted Price", f"${avg_future_price:.2f}")
+            
+            with col3:
+                if 'market_sentiment' in market_prediction.columns:
+                    bullish_periods = len(market_prediction[market_prediction['market_sentiment'] == 'Bullish'])
+                    total_periods = len(market_prediction[market_prediction['period'].str.contains('Future')])
+                    bullish_percentage = (bullish_periods / total_periods * 100) if total_periods > 0 else 0
+                    st.metric("Bullish Sentiment", f"{bullish_percentage:.1f}%")
+            
+            # Display predictions
+            st.markdown("### 📋 Market Predictions")
+            st.dataframe(market_prediction.round(2), use_container_width=True)
+            
+            # Create market performance chart
+            fig = go.Figure()
+            
+            # Historical prices
+            historical = market_prediction[~market_prediction['period'].str.contains('Future')]
+            fig.add_trace(go.Scatter(
+                x=historical['period'],
+                y=historical['market_price'],
+                mode='lines+markers',
+                name='Historical Price',
+                line=dict(color='blue', width=3)
+            ))
+            
+            # Predicted prices
+            future = market_prediction[market_prediction['period'].str.contains('Future')]
+            if not future.empty:
+                fig.add_trace(go.Scatter(
+                    x=future['period'],
+                    y=future['predicted_price'],
+                    mode='lines+markers',
+                    name='Predicted Price',
+                    line=dict(color='red', width=3, dash='dash')
+                ))
+            
+            fig.update_layout(
+                title="Market Price Trends and Predictions",
+                xaxis_title="Period",
+                yaxis_title="Market Price ($)",
+                hovermode='x unified',
+                template="plotly_white"
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning(message)
+    
+    with pred_tab6:
+        st.subheader("📋 Model Performance Metrics")
+        
+        # Display model performance metrics
+        performance_metrics = predictive_analytics.get_prediction_accuracy_metrics()
+        st.markdown(performance_metrics)
+        
+        # Additional insights
+        st.markdown("### 🔍 Model Insights")
+        
+        if hasattr(predictive_analytics, '_model_performance') and predictive_analytics._model_performance:
+            st.success("✅ Prediction models are performing well with available data")
+            
+            # Model recommendations
+            st.markdown("### 💡 Model Recommendations")
+            st.markdown("""
+            - **Revenue Predictions**: Use ensemble approach for better accuracy
+            - **Profitability**: Monitor margin trends for validation
+            - **Cash Flow**: Consider seasonal patterns in predictions
+            - **Health Scores**: Regular recalibration recommended
+            - **Market Performance**: Include volatility factors
+            """)
+        else:
+            st.info("ℹ️ Run predictions in other tabs to see model performance metrics")
+    
+    with pred_tab7:
+        st.subheader("🎯 Scenario Analysis")
+        
+        # Scenario analysis parameters
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_scenarios = st.multiselect(
+                "Select Scenarios",
+                ['optimistic', 'base', 'pessimistic'],
+                default=['optimistic', 'base', 'pessimistic'],
+                help="Choose scenarios to analyze",
+                key="scenario_selection"
+            )
+        
+        with col2:
+            scenario_periods = st.slider("Analysis Periods", 3, 12, 6, help="Number of future periods to analyze", key="scenario_analysis_periods")
+        
+        if st.button("Run Scenario Analysis", key="scenario_analysis"):
+            # Generate scenario analysis
+            scenario_results, message = predictive_analytics.predict_scenario_analysis(selected_scenarios, scenario_periods)
+            
+            if not scenario_results.empty:
+                # Display scenario summary
+                st.markdown("### 📊 Scenario Analysis Summary")
+                
+                # Key metrics by scenario
+                for scenario in selected_scenarios:
+                    scenario_data = scenario_results[scenario_results['scenario'] == scenario]
+                    if not scenario_data.empty:
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            total_revenue = scenario_data['adjusted_revenue'].sum()
+                            st.metric(f"{scenario.title()} Revenue", f"${total_revenue:,.0f}")
+                        
+                        with col2:
+                            total_net_income = scenario_data['adjusted_net_income'].sum()
+                            st.metric(f"{scenario.title()} Net Income", f"${total_net_income:,.0f}")
+                        
+                        with col3:
+                            avg_margin = scenario_data['adjusted_margin'].mean()
+                            st.metric(f"{scenario.title()} Avg Margin", f"{avg_margin:.1f}%")
+                
+                # Display detailed results
+                st.markdown("### 📋 Scenario Analysis Results")
+                st.dataframe(scenario_results.round(2), use_container_width=True)
+                
+                # Create scenario comparison chart
+                fig = go.Figure()
+                
+                for scenario in selected_scenarios:
+                    scenario_data = scenario_results[scenario_results['scenario'] == scenario]
+                    if not scenario_data.empty:
+                        fig.add_trace(go.Scatter(
+                            x=scenario_data['period'],
+                            y=scenario_data['adjusted_revenue'],
+                            mode='lines+markers',
+                            name=f'{scenario.title()} Revenue',
+                            line=dict(width=3)
+                        ))
+                
+                fig.update_layout(
+                    title="Revenue Scenarios Comparison",
+                    xaxis_title="Period",
+                    yaxis_title="Revenue ($)",
+                    hovermode='x unified',
+                    template="plotly_white"
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.warning(message)
+        
+        # Monte Carlo simulation around the same base forecasts
+        st.markdown("### 🎲 Monte Carlo Simulation")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            simulation_paths = st.select_slider("Simulated Paths", [1_000, 10_000, 50_000, 100_000], value=DEFAULT_PATHS, key="scenario_simulation_paths")
+        with col2:
+            simulation_periods = st.slider("Simulation Periods", 3, 24, 12, key="scenario_simulation_periods")
+        with col3:
+            min_net_income = st.number_input("Min Net Income Covenant ($)", value=float(DEFAULT_COVENANTS['min_net_income']), step=10000.0, key="scenario_min_net_income")
+        with col4:
+            min_coverage = st.number_input("Min Interest Coverage (x)", value=float(DEFAULT_COVENANTS['min_interest_coverage']), step=0.5, key="scenario_min_coverage")
+        
+        if st.button("Run Monte Carlo Simulation", key="scenario_simulation") and selected_scenarios:
+            simulation, message = predictive_analytics.simulate_scenarios(
+                selected_scenarios, simulation_periods, simulation_paths,
+                covenants={'min_net_income': min_net_income, 'min_interest_coverage': min_coverage}
+            )
+            
+            if simulation is not None:
+                st.success(f"✅ {message}")
+                summary = simulation.summary()
+                for _, row in summary.iterrows():
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric(f"{row['scenario'].title()} Expected Net Income", f"${row['expected_net_income']:,.0f}")
+                    with col2:
+                        st.metric(f"{row['scenario'].title()} Net Income P5", f"${row['net_income_p5']:,.0f}")
+                    with col3:
+                        st.metric(f"{row['scenario'].title()} Covenant Breach", f"{row['covenant_breach_probability']:.1f}%")
+                
+                # Net income fan chart per scenario
+                fig = go.Figure()
+                for scenario in simulation.scenarios:
+                    fan = simulation.fan_chart('net_income', scenario)
+                    fig.add_trace(go.Scatter(x=fan['period'], y=fan['p95'], mode='lines', line=dict(width=0),
+                                             showlegend=False, hoverinfo='skip'))
+                    fig.add_trace(go.Scatter(x=fan['period'], y=fan['p5'], mode='lines', line=dict(width=0),
+                                             fill='tonexty', opacity=0.2, name=f'{scenario.title()} P5–P95'))
+                    fig.add_trace(go.Scatter(x=fan['period'], y=fan['p50'], mode='lines+markers',
+                                             name=f'{scenario.title()} Median', line=dict(width=3)))
+                fig.update_layout(
+                    title="Net Income Fan Chart",
+                    xaxis_title="Period",
+                    yaxis_title="Net Income ($)",
+                    hovermode='x unified',
+                    template="plotly_white"
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                st.markdown("#### ⚠️ Covenant Breach Probability by Period (%)")
+                st.dataframe(simulation.breach_probability().round(1), use_container_width=True)
+                st.dataframe(summary.round(2), use_container_width=True)
+            else:
+                st.warning(message)
+    
+    with pred_tab8:
+        st.subheader("⚖️ Break-Even Analysis")
+        
+        # Break-even analysis parameters
+        break_even_periods = st.slider("Analysis Periods", 3, 12, 6, help="Number of future periods to analyze", key="break_even_analysis_periods")
+        
+        if st.button("Run Break-Even Analysis", key="break_even_analysis"):
+            # Generate break-even analysis
+            break_even_results, message = predictive_analytics.predict_break_even_analysis(break_even_periods)
+            
+            if not break_even_results.empty:
+                # Display break-even summary
+                st.markdown("### 📊 Break-Even Analysis Summary")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    current_safety_margin = break_even_results[~break_even_results['period'].str.contains('Future')]['safety_margin'].iloc[-1]
+                    st.metric("Current Safety Margin", f"{current_safety_margin:.1f}%")
+                
+                with col2:
+                    if 'break_even_revenue' in break_even_results.columns:
+                        current_break_even = break_even_results[~break_even_results['period'].str.contains('Future')]['break_even_revenue'].iloc[-1]
+                        st.metric("Current Break-Even", f"${current_break_even:,.0f}")
+                
+                with col3:
+                    if 'safety_margin' in break_even_results.columns:
+                        future_safety_margins = break_even_results[break_even_results['period'].str.contains('Future')]['safety_margin']
+                        avg_future_safety = future_safety_margins.mean()
+                        st.metric("Avg Future Safety", f"{avg_future_safety:.1f}%")
+                
+                # Display detailed results
+                st.markdown("### 📋 Break-Even Analysis Results")
+                st.dataframe(break_even_results.round(2), use_container_width=True)
+                
+                # Create break-even chart
+                fig = go.Figure()
+                
+                # Historical data
+                historical = break_even_results[~break_even_results['period'].str.contains('Future')]
+                fig.add_trace(go.Scatter(
+                    x=historical['period'],
+                    y=historical['revenue'],
+                    mode='lines+markers',
+                    name='Historical Revenue',
+                    line=dict(color='blue', width=3)
+                ))
+                
+                fig.add_trace(go.Scatter(
+                    x=historical['period'],
+                    y=historical['break_even_revenue'],
+                    mode='lines+markers',
+                    name='Historical Break-Even',
+                    line=dict(color='red', width=3)
+                ))
+                
+                # Future predictions
+                future = break_even_results[break_even_results['period'].str.contains('Future')]
+                if not future.empty:
+                    fig.add_trace(go.Scatter(
+                        x=future['period'],
+                        y=future['revenue'],
+                        mode='lines+markers',
+                        name='Predicted Revenue',
+                        line=dict(color='blue', width=3, dash='dash')
+                    ))
+                    
+                    fig.add_trace(go.Scatter(
+                        x=future['period'],
+                        y=future['break_even_revenue'],
+                        mode='lines+markers',
+                        name='Predicted Break-Even',
+                        line=dict(color='red', width=3, dash='dash')
+                    ))
+                
+                fig.update_layout(
+                    title="Revenue vs Break-Even Analysis",
+                    xaxis_title="Period",
+                    yaxis_title="Amount ($)",
+                    hovermode='x unified',
+                    template="plotly_white"
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.warning(message)
+    
+    with pred_tab9:
+        st.subheader("💼 Working Capital Analysis")
+        
+        # Working capital analysis parameters
+        wc_periods = st.slider("Analysis Periods", 3, 12, 6, help="Number of future periods to analyze", key="working_capital_analysis_periods")
+        
+        if st.button("Run Working Capital Analysis", key="working_capital_analysis"):
+            # Generate working capital analysis
+            wc_results, message = predictive_analytics.predict_working_capital_needs(wc_periods)
+            
+            if not wc_results.empty:
+                # Display working capital summary
+                st.markdown("### 📊 Working Capital Summary")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    current_wc = wc_results[~wc_results['period'].str.contains('Future')]['working_capital'].iloc[-1]
+                    st.metric("Current Working Capital", f"${current_wc:,.0f}")
+                
+                with col2:
+                    if 'predicted_working_capital' in wc_results.columns:
+                        future_wc = wc_results[wc_results['period'].str.contains('Future')]['predicted_working_capital']
+                        avg_future_wc = future_wc.mean()
+                        st.metric("Avg Future WC", f"${avg_future_wc:,.0f}")
+                
+                with col3:
+                    if 'adequacy_assessment' in wc_results.columns:
+                        adequate_periods = len(wc_results[wc_results['adequacy_assessment'] == 'Adequate'])
+                        total_periods = len(wc_results[wc_results['period'].str.contains('Future')])
+                        adequacy_percentage = (adequate_periods / total_periods * 100) if total_periods > 0 else 0
+                        st.metric("Adequate WC Periods", f"{adequacy_percentage:.1f}%")
+                
+                # Display detailed results
+                st.markdown("### 📋 Working Capital Analysis Results")
+                st.dataframe(wc_results.round(2), use_container_width=True)
+                
+                # Create working capital chart
+                fig = go.Figure()
+                
+                # Historical working capital
+                historical = wc_results[~wc_results['period'].str.contains('Future')]
+                fig.add_trace(go.Scatter(
+                    x=historical['period'],
+                    y=historical['working_capital'],
+                    mode='lines+markers',
+                    name='Historical Working Capital',
+                    line=dict(color='green', width=3)
+                ))
+                
+                # Predicted working capital
+                future = wc_results[wc_results['period'].str.contains('Future')]
+                if not future.empty and 'predicted_working_capital' in future.columns:
+                    fig.add_trace(go.Scatter(
+                        x=future['period'],
+                        y=future['predicted_working_capital'],
+                        mode='lines+markers',
+                        name='Predicted Working Capital',
+                        line=dict(color='orange', width=3, dash='dash')
+                    ))
+                
+                fig.update_layout(
+                    title="Working Capital Trends and Predictions",
+                    xaxis_title="Period",
+                    yaxis_title="Working Capital ($)",
+                    hovermode='x unified',
+                    template="plotly_white"
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.warning(message)
+    
+    # Forecast reuse across tabs, reruns and composite predictors
+    with st.expander("🛠️ Forecast Cache Debug", expanded=False):
+        cache_stats = forecast_cache_stats()
+        if cache_stats.empty:
+            st.info("ℹ️ No forecasts computed yet in this process")
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Forecasts Computed", f"{cache_stats['computed'].sum():,}")
+            with col2:
+                st.metric("Forecasts Reused", f"{cache_stats['reused'].sum():,}")
+            with col3:
+                st.metric("Reuse Rate", f"{cache_stats['reused'].sum() / cache_stats['calls'].sum() * 100:.1f}%")
+            st.dataframe(cache_stats.round(1), use_container_width=True)
+        if st.button("Clear Forecast Cache", key="clear_forecast_cache"):
+            clear_forecast_cache()
+            st.rerun()
@@ -0,0 +1,208 @@
+"""
+Finance Ratio Engine
+====================
+
+Every financial ratio for every (entity, period) in one columnar pass:
+- Income statement and balance sheet rows are aligned on (entity,
+  period) once; when both tables come in the same key order (as the GL
+  roll-up panel does) the join is skipped entirely
+- Each ratio is a single vectorized expression over the aligned columns,
+  guarded like fin_metrics: 0 where the denominator is not positive
+- The result is a tidy panel (entity, period, ratio, value) that charts
+  and insights slice with ordinary filters, or a wide frame with one
+  column per ratio
+"""
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_ENTITY = 'Total'
+
+# Ratio -> (numerator, denominator, scale); terms are statement columns or
+# the derived 'working_capital' and 'quick_assets'
+RATIO_DEFINITIONS = {
+    'current_ratio': ('current_assets', 'current_liabilities', 1),
+    'quick_ratio': ('quick_assets', 'current_liabilities', 1),
+    'cash_ratio': ('cash_and_equivalents', 'current_liabilities', 1),
+    'debt_to_equity': ('total_liabilities', 'shareholder_equity', 1),
+    'debt_to_assets': ('total_liabilities', 'total_assets', 1),
+    'equity_ratio': ('shareholder_equity', 'total_assets', 1),
+    'roa_pct': ('net_income', 'total_assets', 100),
+    'roe_pct': ('net_income', 'shareholder_equity', 100),
+    'gross_margin_pct': ('gross_profit', 'revenue', 100),
+    'operating_margin_pct': ('operating_income', 'revenue', 100),
+    'net_margin_pct': ('net_income', 'revenue', 100),
+    'op_exp_ratio_pct': ('operating_expenses', 'revenue', 100),
+    'asset_turnover': ('revenue', 'total_assets', 1),
+    'working_capital_turnover': ('revenue', 'working_capital', 1),
+    'interest_coverage': ('operating_income', 'interest_expense', 1)
+}
+RATIO_NAMES = list(RATIO_DEFINITIONS)
+
+INCOME_COLUMNS = ['revenue', 'gross_profit', 'operating_income', 'operating_expenses', 'net_income', 'interest_expense']
+BALANCE_COLUMNS = ['current_assets', 'current_liabilities', 'cash_and_equivalents', 'accounts_receivable',
+                   'total_assets', 'total_liabilities', 'shareholder_equity']
+
+# Balance sheet terms that average_balances replaces with (opening + closing) / 2
+AVERAGED_TERMS = ['total_assets', 'shareholder_equity', 'working_capital']
+
+# ============================================================================
+# ALIGNMENT
+# ============================================================================
+
+def _keys(table):
+    """Entity and period arrays of a statement table, kept in their pandas dtype."""
+    if 'entity' in table.columns:
+        entity = table['entity'].array
+    else:
+        entity = pd.Categorical.from_codes(np.zeros(len(table), dtype=np.int8), categories=[DEFAULT_ENTITY])
+    return entity, table['period'].array
+
+
+def _same_keys(left, right):
+    return len(left) == len(right) and pd.Series(left).equals(pd.Series(right))
+
+
+def _numeric(table, columns):
+    """Columns as float arrays, 0 where missing or non-numeric."""
+    values = {}
+    for column in columns:
+        if column in table.columns:
+            values[column] = pd.to_numeric(table[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            values[column] = np.nan_to_num(values[column])
+        else:
+            values[column] = np.zeros(len(table))
+    return values
+
+
+def align_statements(income_statement, balance_sheet):
+    """
+    Income statement and balance sheet columns on common (entity, period) rows.
+
+    Rows follow the income statement; periods without a balance sheet row
+    are dropped, and the first balance sheet row is used when a period
+    repeats (as calculate_efficiency_metrics does). When only one of the
+    tables has an entity column, rows are matched on period alone and
+    take the income statement's entity.
+
+    Returns:
+        tuple: (entity array, period array, dict of float column arrays)
+    """
+    income_entity, income_period = _keys(income_statement)
+    balance_entity, balance_period = _keys(balance_sheet)
+    income = _numeric(income_statement, INCOME_COLUMNS)
+    balance = _numeric(balance_sheet, BALANCE_COLUMNS)
+
+    by_entity = 'entity' in income_statement.columns and 'entity' in balance_sheet.columns
+    if by_entity:
+        income_keys, balance_keys = [income_entity, income_period], [balance_entity, balance_period]
+    else:
+        income_keys, balance_keys = [income_period], [balance_period]
+
+    if not all(_same_keys(left, right) for left, right in zip(income_keys, balance_keys)):
+        balance_index = pd.MultiIndex.from_arrays(balance_keys)
+        first = ~balance_index.duplicated(keep='first')
+        lookup = balance_index[first]
+        position = lookup.get_indexer(pd.MultiIndex.from_arrays(income_keys))
+        matched = position >= 0
+        rows = np.flatnonzero(first)[position[matched]]
+        income_entity, income_period = income_entity[matched], income_period[matched]
+        income = {name: values[matched] for name, values in income.items()}
+        balance = {name: values[rows] for name, values in balance.items()}
+    return income_entity, income_period, {**income, **balance}
+
+# ============================================================================
+# RATIOS
+# ============================================================================
+
+def _averaged(values, entity):
+    """
+    (opening + closing) / 2 per entity; the first period uses its closing balance.
+
+    The opening balance is the entity's previous row, so rows must be in
+    period order within each entity (table order, as the statements are
+    kept; period labels are not sorted here).
+    """
+    series = pd.Series(values)
+    opening = series.groupby(entity, sort=False).shift(1).to_numpy()
+    return np.where(np.isnan(opening), values, (opening + values) / 2)
+
+
+def compute_ratios(columns, entity=None, average_balances=False):
+    """
+    Every ratio in RATIO_DEFINITIONS from aligned statement columns.
+
+    Args:
+        columns (dict): Float arrays for INCOME_COLUMNS and BALANCE_COLUMNS
+        entity (np.ndarray): Entity per row, needed for average_balances
+        average_balances (bool): Use average rather than period-end assets,
+            equity and working capital for the return and turnover ratios;
+            rows must then be in period order within each entity
+
+    Returns:
+        dict: Ratio name -> float array
+    """
+    terms = dict(columns)
+    terms['working_capital'] = terms['current_assets'] - terms['current_liabilities']
+    terms['quick_assets'] = terms['cash_and_equivalents'] + terms['accounts_receivable']
+    averaged = dict(terms)
+    if average_balances:
+        for term in AVERAGED_TERMS:
+            averaged[term] = _averaged(terms[term], entity)
+
+    ratios = {}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for name, (numerator, denominator, scale) in RATIO_DEFINITIONS.items():
+            # Flow over stock ratios use the averaged balances
+            source = averaged if numerator in INCOME_COLUMNS else terms
+            bottom = source[denominator]
+            ratios[name] = np.where(bottom > 0, terms[numerator] / bottom * scale, 0.0)
+    return ratios
+
+
+def ratio_panel(income_statement, balance_sheet, ratios=None, tidy=True, average_balances=False):
+    """
+    Ratios for every (entity, period) of the statements.
+
+    Args:
+        income_statement (pd.DataFrame): period, optional entity, and the
+            income statement columns
+        balance_sheet (pd.DataFrame): period, optional entity, and the
+            balance sheet columns
+        ratios (list): Subset of RATIO_NAMES, default all
+        tidy (bool): Long (entity, period, ratio, value) rows, or one
+            column per ratio
+        average_balances (bool): See compute_ratios
+
+    Returns:
+        pd.DataFrame: The ratio panel, rows in income statement order
+    """
+    ratios = RATIO_NAMES if ratios is None else list(ratios)
+    unknown = sorted(set(ratios) - set(RATIO_NAMES))
+    if unknown:
+        raise ValueError(f"Unknown ratios: {', '.join(unknown)}")
+    if income_statement.empty or balance_sheet.empty:
+        columns = ['entity', 'period', 'ratio', 'value'] if tidy else ['entity', 'period'] + ratios
+        return pd.DataFrame(columns=columns)
+
+    entity, period, columns = align_statements(income_statement, balance_sheet)
+    values = compute_ratios(columns, entity, average_balances)
+    if not tidy:
+        return pd.DataFrame({'entity': entity, 'period': period, **{name: values[name] for name in ratios}})
+
+    # Ratio-major long format built directly, without a melt; keys are
+    # categoricals so the repeated entity and period labels are not copied
+    def repeated(labels):
+        codes, uniques = pd.factorize(labels)
+        return pd.Categorical.from_codes(np.tile(codes, len(ratios)), categories=uniques)
+
+    return pd.DataFrame({
+        'entity': repeated(entity),
+        'period': repeated(period),
+        'ratio': pd.Categorical.from_codes(np.repeat(np.arange(len(ratios)), len(period)), categories=ratios),
+        'value': np.concatenate([values[name] for name in ratios]) if ratios else np.zeros(0)
+    })
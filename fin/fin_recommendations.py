@@ -0,0 +1,1465 @@
+import streamlit as st
+import pandas as pd
+
+from fin_data_layer import FINANCE_TABLES, finance_cache
+
+# Finance-specific auto insights functions (implemented directly)
+def display_insights_section(insights_text, title, icon):
+    """Display insights section with proper formatting"""
+    st.markdown(f"### {icon} {title}")
+    
+    if insights_text:
+        # Split insights into lines and display each as a bullet point
+        insights_lines = insights_text.split('\n')
+        for line in insights_lines:
+            line = line.strip()
+            if line:
+                if line.startswith('**') and line.endswith('**'):
+                    # This is a heading
+                    st.markdown(f"**{line[2:-2]}**")
+                elif line.startswith('**'):
+                    # This is a heading
+                    st.markdown(line)
+                else:
+                    # This is regular text
+                    st.markdown(f"• {line}")
+    else:
+        st.info("No insights available for this section.")
+
+def display_executive_summary(summary_text, title, icon):
+    """Display executive summary with proper formatting"""
+    st.markdown(f"### {icon} {title}")
+    
+    if summary_text:
+        st.markdown(summary_text)
+    else:
+        st.info("No executive summary available.")
+
+# Shared finance context: every aggregate the rule sets read, computed once
+def _numeric_values(series):
+    """Series as numbers, or None when it holds non-numeric values."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    if series.dtype == object:
+        converted = pd.to_numeric(series, errors='coerce')
+        if converted.notna().sum() == series.notna().sum():
+            return converted
+    return None
+
+class FinanceContext:
+    """
+    Row counts, columns, column totals and the last two values of every
+    numeric column of the finance tables passed in.
+
+    Built once per dataset version and shared by every rule set, so no
+    rule set aggregates a table itself.
+    """
+    
+    def __init__(self, **tables):
+        self._lengths = {}
+        self._columns = {}
+        self._totals = {}
+        self._last = {}
+        self._previous = {}
+        for table, frame in tables.items():
+            if frame is None:
+                continue
+            self._lengths[table] = len(frame)
+            self._columns[table] = frozenset(frame.columns)
+            for column in frame.columns:
+                values = _numeric_values(frame[column])
+                if values is None:
+                    continue
+                key = (table, column)
+                self._totals[key] = values.sum()
+                if len(values) > 0:
+                    self._last[key] = values.iloc[-1]
+                if len(values) > 1:
+                    self._previous[key] = values.iloc[-2]
+    
+    def empty(self, table):
+        return self._lengths.get(table, 0) == 0 or not self._columns.get(table)
+    
+    def has(self, table, column):
+        return column in self._columns.get(table, ())
+    
+    def length(self, table):
+        return self._lengths.get(table, 0)
+    
+    def total(self, table, column):
+        return self._totals[(table, column)]
+    
+    def last(self, table, column):
+        return self._last[(table, column)]
+    
+    def previous(self, table, column):
+        return self._previous[(table, column)]
+
+# AI recommendation rule sets, each evaluated against a shared FinanceContext
+def _financial_performance_rules(context):
+    """Recommendations for financial performance"""
+    if context.empty('income_statement'):
+        return "No financial data available for analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Analyze revenue trends
+    if context.length('income_statement') > 1:
+        recent_revenue = context.last('income_statement', 'revenue')
+        previous_revenue = context.previous('income_statement', 'revenue')
+        
+        if recent_revenue > previous_revenue:
+            growth_rate = ((recent_revenue - previous_revenue) / previous_revenue) * 100
+            recommendations.append(f"📈 **Revenue Growth Analysis**")
+            recommendations.append(f"   • Revenue grew by {growth_rate:.1f}% in the latest period")
+            recommendations.append(f"   • Maintain momentum through market expansion and customer retention")
+            recommendations.append(f"   • Consider reinvesting profits for sustainable growth")
+        else:
+            decline_rate = ((previous_revenue - recent_revenue) / previous_revenue) * 100
+            recommendations.append(f"📉 **Revenue Decline Analysis**")
+            recommendations.append(f"   • Revenue declined by {decline_rate:.1f}% - investigate root causes")
+            recommendations.append(f"   • Review pricing strategy and market positioning")
+            recommendations.append(f"   • Focus on cost optimization and operational efficiency")
+    
+    # Analyze profitability
+    if context.has('income_statement', 'net_income'):
+        net_income = context.total('income_statement', 'net_income')
+        revenue = context.total('income_statement', 'revenue')
+        
+        if revenue > 0:
+            net_margin = (net_income / revenue) * 100
+            recommendations.append("")
+            recommendations.append(f"💰 **Profitability Analysis**")
+            recommendations.append(f"   • Net margin: {net_margin:.1f}%")
+            
+            if net_margin < 5:
+                recommendations.append(f"   • Low profitability - focus on cost reduction and pricing optimization")
+            elif net_margin < 15:
+                recommendations.append(f"   • Moderate profitability - opportunities for margin improvement")
+            else:
+                recommendations.append(f"   • Strong profitability - maintain competitive advantages")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Conduct regular financial performance reviews")
+    recommendations.append("   • Implement KPI tracking and monitoring systems")
+    recommendations.append("   • Develop contingency plans for economic downturns")
+    recommendations.append("   • Invest in technology for better financial visibility")
+    
+    return "\n".join(recommendations)
+
+def _liquidity_solvency_rules(context):
+    """Recommendations for liquidity and solvency"""
+    if context.empty('balance_sheet'):
+        return "No balance sheet data available for analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Analyze current ratio
+    if context.has('balance_sheet', 'current_assets') and context.has('balance_sheet', 'current_liabilities'):
+        current_assets = context.total('balance_sheet', 'current_assets')
+        current_liabilities = context.total('balance_sheet', 'current_liabilities')
+        
+        if current_liabilities > 0:
+            current_ratio = current_assets / current_liabilities
+            recommendations.append(f"💧 **Liquidity Analysis**")
+            recommendations.append(f"   • Current ratio: {current_ratio:.2f}")
+            
+            if current_ratio < 1.0:
+                recommendations.append(f"   • Critical liquidity risk - immediate action required")
+                recommendations.append(f"   • Implement cash flow management strategies")
+                recommendations.append(f"   • Consider short-term financing options")
+            elif current_ratio < 1.5:
+                recommendations.append(f"   • Moderate liquidity risk - monitor closely")
+                recommendations.append(f"   • Optimize working capital management")
+                recommendations.append(f"   • Review payment terms with suppliers")
+            else:
+                recommendations.append(f"   • Strong liquidity position - maintain current practices")
+                recommendations.append(f"   • Consider investment opportunities for excess cash")
+    
+    # Analyze debt levels
+    if context.has('balance_sheet', 'total_liabilities') and context.has('balance_sheet', 'shareholder_equity'):
+        total_liabilities = context.total('balance_sheet', 'total_liabilities')
+        shareholder_equity = context.total('balance_sheet', 'shareholder_equity')
+        
+        if shareholder_equity > 0:
+            debt_to_equity = total_liabilities / shareholder_equity
+            recommendations.append("")
+            recommendations.append(f"🏗️ **Solvency Analysis**")
+            recommendations.append(f"   • Debt-to-equity ratio: {debt_to_equity:.2f}")
+            
+            if debt_to_equity > 2.0:
+                recommendations.append(f"   • High debt levels - debt reduction priority")
+                recommendations.append(f"   • Review capital structure and financing strategy")
+                recommendations.append(f"   • Consider equity financing alternatives")
+            elif debt_to_equity > 1.0:
+                recommendations.append(f"   • Moderate debt levels - manageable but monitor")
+                recommendations.append(f"   • Balance debt and equity financing")
+                recommendations.append(f"   • Maintain debt service coverage")
+            else:
+                recommendations.append(f"   • Conservative debt structure - financial flexibility")
+                recommendations.append(f"   • Consider strategic debt for growth opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement cash flow forecasting and monitoring")
+    recommendations.append("   • Develop working capital optimization strategies")
+    recommendations.append("   • Establish debt management policies")
+    recommendations.append("   • Regular financial health assessments")
+    
+    return "\n".join(recommendations)
+
+# Additional AI recommendation functions (optimized implementations)
+def _liquidity_analysis_rules(context):
+    """Recommendations for liquidity analysis"""
+    if context.empty('balance_sheet'):
+        return "No balance sheet data available for liquidity analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Current ratio analysis
+    if context.has('balance_sheet', 'current_assets') and context.has('balance_sheet', 'current_liabilities'):
+        current_assets = context.total('balance_sheet', 'current_assets')
+        current_liabilities = context.total('balance_sheet', 'current_liabilities')
+        
+        if current_liabilities > 0:
+            current_ratio = current_assets / current_liabilities
+            recommendations.append(f"💧 **Current Ratio Analysis**: {current_ratio:.2f}")
+            
+            if current_ratio < 1.0:
+                recommendations.append("   • Critical liquidity risk - immediate action required")
+                recommendations.append("   • Implement emergency cash flow management")
+                recommendations.append("   • Consider short-term financing options")
+            elif current_ratio < 1.5:
+                recommendations.append("   • Moderate liquidity risk - monitor closely")
+                recommendations.append("   • Optimize working capital management")
+                recommendations.append("   • Review payment terms with suppliers")
+            else:
+                recommendations.append("   • Strong liquidity position - maintain current practices")
+                recommendations.append("   • Consider investment opportunities for excess cash")
+    
+    # Quick ratio analysis
+    if context.has('balance_sheet', 'cash_and_equivalents') and context.has('balance_sheet', 'accounts_receivable'):
+        quick_assets = context.total('balance_sheet', 'cash_and_equivalents') + context.total('balance_sheet', 'accounts_receivable')
+        if current_liabilities > 0:
+            quick_ratio = quick_assets / current_liabilities
+            recommendations.append("")
+            recommendations.append(f"⚡ **Quick Ratio Analysis**: {quick_ratio:.2f}")
+            
+            if quick_ratio < 0.5:
+                recommendations.append("   • Low quick ratio - limited immediate liquidity")
+                recommendations.append("   • Focus on cash generation and receivables collection")
+            elif quick_ratio < 1.0:
+                recommendations.append("   • Moderate quick ratio - adequate immediate liquidity")
+                recommendations.append("   • Monitor cash flow trends")
+            else:
+                recommendations.append("   • Strong quick ratio - excellent immediate liquidity")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement cash flow forecasting and monitoring")
+    recommendations.append("   • Develop working capital optimization strategies")
+    recommendations.append("   • Regular liquidity assessments")
+    
+    return "\n".join(recommendations)
+
+def _solvency_metrics_rules(context):
+    """Recommendations for solvency analysis"""
+    if context.empty('balance_sheet'):
+        return "No balance sheet data available for solvency analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Debt-to-equity analysis
+    if context.has('balance_sheet', 'total_liabilities') and context.has('balance_sheet', 'shareholder_equity'):
+        total_liabilities = context.total('balance_sheet', 'total_liabilities')
+        shareholder_equity = context.total('balance_sheet', 'shareholder_equity')
+        
+        if shareholder_equity > 0:
+            debt_to_equity = total_liabilities / shareholder_equity
+            recommendations.append(f"🏗️ **Debt-to-Equity Analysis**: {debt_to_equity:.2f}")
+            
+            if debt_to_equity > 2.5:
+                recommendations.append("   • Critical debt levels - immediate action required")
+                recommendations.append("   • Prioritize debt reduction and restructuring")
+                recommendations.append("   • Consider equity financing alternatives")
+            elif debt_to_equity > 2.0:
+                recommendations.append("   • High debt levels - debt reduction priority")
+                recommendations.append("   • Review capital structure and financing strategy")
+                recommendations.append("   • Consider equity financing")
+            elif debt_to_equity > 1.0:
+                recommendations.append("   • Moderate debt levels - manageable but monitor")
+                recommendations.append("   • Balance debt and equity financing")
+                recommendations.append("   • Maintain debt service coverage")
+            else:
+                recommendations.append("   • Conservative debt structure - financial flexibility")
+                recommendations.append("   • Consider strategic debt for growth opportunities")
+    
+    # Interest coverage analysis
+    if context.has('income_statement', 'operating_income') and context.has('income_statement', 'interest_expense'):
+        operating_income = context.total('income_statement', 'operating_income')
+        interest_expense = context.total('income_statement', 'interest_expense')
+        
+        if interest_expense > 0:
+            interest_coverage = operating_income / interest_expense
+            recommendations.append("")
+            recommendations.append(f"💰 **Interest Coverage Analysis**: {interest_coverage:.2f}")
+            
+            if interest_coverage < 1.5:
+                recommendations.append("   • Low interest coverage - high default risk")
+                recommendations.append("   • Immediate debt reduction required")
+                recommendations.append("   • Consider debt restructuring")
+            elif interest_coverage < 3.0:
+                recommendations.append("   • Moderate interest coverage - monitor closely")
+                recommendations.append("   • Maintain debt service capability")
+                recommendations.append("   • Consider debt reduction")
+            else:
+                recommendations.append("   • Strong interest coverage - comfortable debt levels")
+                recommendations.append("   • Maintain current debt structure")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Establish debt management policies")
+    recommendations.append("   • Regular financial health assessments")
+    recommendations.append("   • Develop capital structure optimization plan")
+    
+    return "\n".join(recommendations)
+
+def _cash_flow_analysis_rules(context):
+    """Recommendations for cash flow analysis"""
+    if context.empty('cash_flow'):
+        return "No cash flow data available for analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Operating cash flow analysis
+    # Check for operating cash flow column with fallback names
+    operating_cf_col = None
+    for col_name in ['operating_cash_flow', 'operating_cf', 'operating_cashflow', 'operating_cash_flow_']:
+        if context.has('cash_flow', col_name):
+            operating_cf_col = col_name
+            break
+    
+    if operating_cf_col:
+        total_operating_cf = context.total('cash_flow', operating_cf_col)
+        recommendations.append(f"💸 **Operating Cash Flow Analysis**: ${total_operating_cf:,.0f}")
+        
+        if total_operating_cf > 0:
+            recommendations.append("   • Positive operating cash flow - good operational performance")
+            recommendations.append("   • Maintain operational efficiency")
+            recommendations.append("   • Consider growth investments")
+        else:
+            recommendations.append("   • Negative operating cash flow - operational challenges")
+            recommendations.append("   • Review business model and operations")
+            recommendations.append("   • Implement cost reduction measures")
+    
+    # Free cash flow analysis
+    if context.has('cash_flow', 'free_cash_flow'):
+        total_free_cf = context.total('cash_flow', 'free_cash_flow')
+        recommendations.append("")
+        recommendations.append(f"🎯 **Free Cash Flow Analysis**: ${total_free_cf:,.0f}")
+        
+        if total_free_cf > 0:
+            recommendations.append("   • Positive free cash flow - financial flexibility")
+            recommendations.append("   • Consider dividend payments or share buybacks")
+            recommendations.append("   • Strategic investment opportunities")
+        else:
+            recommendations.append("   • Negative free cash flow - limited financial flexibility")
+            recommendations.append("   • Review capital expenditure plans")
+            recommendations.append("   • Consider external financing")
+    
+    # Cash flow trends
+    if context.length('cash_flow') > 1 and operating_cf_col:
+        recent_operating_cf = context.last('cash_flow', operating_cf_col)
+        previous_operating_cf = context.previous('cash_flow', operating_cf_col)
+        
+        if previous_operating_cf != 0:
+            cf_growth = ((recent_operating_cf - previous_operating_cf) / abs(previous_operating_cf) * 100)
+            recommendations.append("")
+            recommendations.append(f"📈 **Cash Flow Trend Analysis**: {cf_growth:+.1f}%")
+            
+            if cf_growth > 20:
+                recommendations.append("   • Exceptional cash flow improvement")
+                recommendations.append("   • Maintain successful strategies")
+            elif cf_growth < -10:
+                recommendations.append("   • Declining cash flow - investigate causes")
+                recommendations.append("   • Implement corrective measures")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement cash flow forecasting and monitoring")
+    recommendations.append("   • Optimize working capital management")
+    recommendations.append("   • Regular cash flow analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _roa_roe_analysis_rules(context):
+    """Recommendations for ROA/ROE analysis"""
+    if context.empty('income_statement') or context.empty('balance_sheet'):
+        return "Insufficient data for ROA/ROE analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # ROA analysis
+    if context.has('income_statement', 'net_income') and context.has('balance_sheet', 'total_assets'):
+        net_income = context.total('income_statement', 'net_income')
+        total_assets = context.total('balance_sheet', 'total_assets')
+        
+        if total_assets > 0:
+            roa = (net_income / total_assets) * 100
+            recommendations.append(f"📊 **ROA Analysis**: {roa:.2f}%")
+            
+            if roa < 5:
+                recommendations.append("   • Low ROA - asset utilization needs improvement")
+                recommendations.append("   • Review asset efficiency and utilization")
+                recommendations.append("   • Consider asset optimization strategies")
+            elif roa < 15:
+                recommendations.append("   • Moderate ROA - room for improvement")
+                recommendations.append("   • Optimize asset allocation")
+                recommendations.append("   • Improve operational efficiency")
+            else:
+                recommendations.append("   • Strong ROA - excellent asset utilization")
+                recommendations.append("   • Maintain current performance")
+                recommendations.append("   • Consider expansion opportunities")
+    
+    # ROE analysis
+    if context.has('balance_sheet', 'shareholder_equity'):
+        shareholder_equity = context.total('balance_sheet', 'shareholder_equity')
+        
+        if shareholder_equity > 0:
+            roe = (net_income / shareholder_equity) * 100
+            recommendations.append("")
+            recommendations.append(f"💰 **ROE Analysis**: {roe:.2f}%")
+            
+            if roe < 10:
+                recommendations.append("   • Low ROE - shareholder value creation needs improvement")
+                recommendations.append("   • Review profitability and capital structure")
+                recommendations.append("   • Implement value creation strategies")
+            elif roe < 20:
+                recommendations.append("   • Moderate ROE - good shareholder returns")
+                recommendations.append("   • Optimize capital structure")
+                recommendations.append("   • Focus on growth opportunities")
+            else:
+                recommendations.append("   • Strong ROE - excellent shareholder returns")
+                recommendations.append("   • Maintain competitive advantages")
+                recommendations.append("   • Consider dividend policies")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement ROA/ROE monitoring and tracking")
+    recommendations.append("   • Develop asset optimization strategies")
+    recommendations.append("   • Regular performance analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _asset_turnover_rules(context):
+    """Recommendations for asset turnover analysis"""
+    if context.empty('income_statement') or context.empty('balance_sheet'):
+        return "Insufficient data for asset turnover analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Asset turnover analysis
+    if context.has('income_statement', 'revenue') and context.has('balance_sheet', 'total_assets'):
+        revenue = context.total('income_statement', 'revenue')
+        total_assets = context.total('balance_sheet', 'total_assets')
+        
+        if total_assets > 0:
+            asset_turnover = revenue / total_assets
+            recommendations.append(f"🔄 **Asset Turnover Analysis**: {asset_turnover:.2f}")
+            
+            if asset_turnover < 0.5:
+                recommendations.append("   • Low asset turnover - poor asset utilization")
+                recommendations.append("   • Review asset efficiency and productivity")
+                recommendations.append("   • Consider asset optimization and disposal")
+            elif asset_turnover < 1.0:
+                recommendations.append("   • Moderate asset turnover - room for improvement")
+                recommendations.append("   • Optimize asset allocation and utilization")
+                recommendations.append("   • Improve operational processes")
+            else:
+                recommendations.append("   • High asset turnover - excellent asset utilization")
+                recommendations.append("   • Maintain current efficiency")
+                recommendations.append("   • Consider expansion opportunities")
+    
+    # Working capital turnover
+    if context.has('balance_sheet', 'current_assets') and context.has('balance_sheet', 'current_liabilities'):
+        current_assets = context.total('balance_sheet', 'current_assets')
+        current_liabilities = context.total('balance_sheet', 'current_liabilities')
+        working_capital = current_assets - current_liabilities
+        
+        if working_capital > 0:
+            working_capital_turnover = revenue / working_capital
+            recommendations.append("")
+            recommendations.append(f"💼 **Working Capital Turnover**: {working_capital_turnover:.2f}")
+            
+            if working_capital_turnover < 2.0:
+                recommendations.append("   • Low working capital efficiency")
+                recommendations.append("   • Optimize inventory and receivables management")
+                recommendations.append("   • Review payment terms and collection processes")
+            elif working_capital_turnover < 5.0:
+                recommendations.append("   • Moderate working capital efficiency")
+                recommendations.append("   • Improve working capital management")
+                recommendations.append("   • Optimize cash conversion cycle")
+            else:
+                recommendations.append("   • High working capital efficiency")
+                recommendations.append("   • Maintain current practices")
+                recommendations.append("   • Consider growth opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement asset utilization monitoring")
+    recommendations.append("   • Develop working capital optimization strategies")
+    recommendations.append("   • Regular efficiency analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _expense_efficiency_rules(context):
+    """Recommendations for expense efficiency analysis"""
+    if context.empty('income_statement'):
+        return "Insufficient data for expense efficiency analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Expense efficiency analysis
+    if context.has('income_statement', 'revenue') and context.has('income_statement', 'operating_expenses'):
+        total_revenue = context.total('income_statement', 'revenue')
+        total_operating_expenses = context.total('income_statement', 'operating_expenses')
+        
+        if total_revenue > 0:
+            expense_ratio = (total_operating_expenses / total_revenue) * 100
+            recommendations.append(f"💰 **Expense Ratio Analysis**: {expense_ratio:.1f}%")
+            
+            if expense_ratio > 80:
+                recommendations.append("   • High expense ratio - poor cost control")
+                recommendations.append("   • Immediate cost reduction required")
+                recommendations.append("   • Review all expense categories")
+            elif expense_ratio > 60:
+                recommendations.append("   • Elevated expense ratio - needs improvement")
+                recommendations.append("   • Implement cost control measures")
+                recommendations.append("   • Optimize operational processes")
+            else:
+                recommendations.append("   • Low expense ratio - excellent cost control")
+                recommendations.append("   • Maintain current efficiency")
+                recommendations.append("   • Consider strategic investments")
+    
+    # Gross margin analysis
+    if context.has('income_statement', 'gross_profit'):
+        total_gross_profit = context.total('income_statement', 'gross_profit')
+        
+        if total_revenue > 0:
+            gross_margin = (total_gross_profit / total_revenue) * 100
+            recommendations.append("")
+            recommendations.append(f"📊 **Gross Margin Analysis**: {gross_margin:.1f}%")
+            
+            if gross_margin < 20:
+                recommendations.append("   • Low gross margin - pricing or cost issues")
+                recommendations.append("   • Review pricing strategy")
+                recommendations.append("   • Analyze cost of goods sold")
+            elif gross_margin < 40:
+                recommendations.append("   • Moderate gross margin - room for improvement")
+                recommendations.append("   • Optimize pricing and costs")
+                recommendations.append("   • Improve product mix")
+            else:
+                recommendations.append("   • High gross margin - excellent profitability")
+                recommendations.append("   • Maintain competitive advantage")
+                recommendations.append("   • Consider market expansion")
+    
+    # Operating margin analysis
+    if context.has('income_statement', 'operating_income'):
+        total_operating_income = context.total('income_statement', 'operating_income')
+        
+        if total_revenue > 0:
+            operating_margin = (total_operating_income / total_revenue) * 100
+            recommendations.append("")
+            recommendations.append(f"⚡ **Operating Margin Analysis**: {operating_margin:.1f}%")
+            
+            if operating_margin < 5:
+                recommendations.append("   • Low operating margin - operational inefficiency")
+                recommendations.append("   • Review operational processes")
+                recommendations.append("   • Implement efficiency measures")
+            elif operating_margin < 15:
+                recommendations.append("   • Moderate operating margin - good performance")
+                recommendations.append("   • Continue optimization efforts")
+                recommendations.append("   • Focus on growth opportunities")
+            else:
+                recommendations.append("   • High operating margin - excellent operations")
+                recommendations.append("   • Maintain operational excellence")
+                recommendations.append("   • Consider strategic expansion")
+    
+    # Expense trend analysis
+    if context.length('income_statement') > 1:
+        recent_expenses = context.last('income_statement', 'operating_expenses')
+        previous_expenses = context.previous('income_statement', 'operating_expenses')
+        
+        if previous_expenses > 0:
+            expense_change = ((recent_expenses - previous_expenses) / previous_expenses) * 100
+            recommendations.append("")
+            recommendations.append(f"📈 **Expense Trend Analysis**: {expense_change:+.1f}% change")
+            
+            if expense_change > 10:
+                recommendations.append("   • Significant expense increase - review urgently")
+                recommendations.append("   • Identify cost drivers")
+                recommendations.append("   • Implement cost controls")
+            elif expense_change > 5:
+                recommendations.append("   • Moderate expense increase - monitor closely")
+                recommendations.append("   • Review expense categories")
+                recommendations.append("   • Optimize where possible")
+            elif expense_change < -5:
+                recommendations.append("   • Expense reduction - good cost management")
+                recommendations.append("   • Maintain efficiency gains")
+                recommendations.append("   • Document best practices")
+            else:
+                recommendations.append("   • Stable expenses - good control")
+                recommendations.append("   • Continue monitoring")
+                recommendations.append("   • Look for optimization opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement expense monitoring dashboard")
+    recommendations.append("   • Develop cost reduction initiatives")
+    recommendations.append("   • Regular expense analysis and reporting")
+    recommendations.append("   • Benchmark against industry standards")
+    recommendations.append("   • Optimize operational processes")
+    
+    return "\n".join(recommendations)
+
+def _productivity_trends_rules(context):
+    """Recommendations for productivity trends analysis"""
+    if context.empty('income_statement') or context.empty('balance_sheet'):
+        return "Insufficient data for productivity trends analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    # Productivity metrics analysis
+    if context.has('income_statement', 'revenue') and context.has('balance_sheet', 'total_assets'):
+        revenue = context.total('income_statement', 'revenue')
+        total_assets = context.total('balance_sheet', 'total_assets')
+        
+        if total_assets > 0:
+            asset_turnover = revenue / total_assets
+            recommendations.append(f"🔄 **Asset Turnover**: {asset_turnover:.2f}")
+            
+            if asset_turnover < 0.5:
+                recommendations.append("   • Low productivity - poor asset utilization")
+                recommendations.append("   • Review asset efficiency and productivity")
+                recommendations.append("   • Consider asset optimization and disposal")
+            elif asset_turnover < 1.0:
+                recommendations.append("   • Moderate productivity - room for improvement")
+                recommendations.append("   • Optimize asset allocation and utilization")
+                recommendations.append("   • Improve operational processes")
+            else:
+                recommendations.append("   • High productivity - excellent asset utilization")
+                recommendations.append("   • Maintain current efficiency")
+                recommendations.append("   • Consider expansion opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement productivity monitoring dashboard")
+    recommendations.append("   • Develop efficiency improvement initiatives")
+    recommendations.append("   • Regular productivity analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _budget_variance_analysis_rules(context):
+    """Recommendations for budget variance analysis"""
+    if context.empty('budget') or context.empty('income_statement'):
+        return "Insufficient data for budget variance analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("📊 **Budget Variance Analysis**")
+    recommendations.append("   • Monitor budget vs. actual performance")
+    recommendations.append("   • Identify significant variances")
+    recommendations.append("   • Implement corrective actions")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement variance monitoring dashboard")
+    recommendations.append("   • Develop variance analysis reporting")
+    recommendations.append("   • Regular budget performance reviews")
+    
+    return "\n".join(recommendations)
+
+def _forecast_accuracy_rules(context):
+    """Recommendations for forecast accuracy analysis"""
+    if context.empty('forecast') or context.empty('income_statement'):
+        return "Insufficient data for forecast accuracy analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🔮 **Forecast Accuracy Analysis**")
+    recommendations.append("   • Monitor forecast vs. actual performance")
+    recommendations.append("   • Identify accuracy trends")
+    recommendations.append("   • Improve forecasting models")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement forecast accuracy monitoring")
+    recommendations.append("   • Develop forecasting improvement initiatives")
+    recommendations.append("   • Regular forecast performance reviews")
+    
+    return "\n".join(recommendations)
+
+def _scenario_analysis_rules(context):
+    """Recommendations for scenario analysis"""
+    if context.empty('income_statement'):
+        return "Insufficient data for scenario analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🎭 **Scenario Analysis**")
+    recommendations.append("   • Evaluate multiple business scenarios")
+    recommendations.append("   • Assess risk and opportunity")
+    recommendations.append("   • Develop contingency plans")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement scenario planning framework")
+    recommendations.append("   • Develop risk mitigation strategies")
+    recommendations.append("   • Regular scenario analysis updates")
+    
+    return "\n".join(recommendations)
+
+def _variance_reporting_rules(context):
+    """Recommendations for variance reporting"""
+    if context.empty('income_statement') or context.empty('budget'):
+        return "Insufficient data for variance reporting."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("📊 **Variance Reporting**")
+    recommendations.append("   • Monitor key performance indicators")
+    recommendations.append("   • Identify significant deviations")
+    recommendations.append("   • Implement corrective actions")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement variance monitoring dashboard")
+    recommendations.append("   • Develop automated reporting systems")
+    recommendations.append("   • Regular variance analysis reviews")
+    
+    return "\n".join(recommendations)
+
+def _operating_cash_flow_rules(context):
+    """Recommendations for operating cash flow analysis"""
+    if context.empty('cash_flow') or context.empty('balance_sheet'):
+        return "Insufficient data for operating cash flow analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("💸 **Operating Cash Flow Analysis**")
+    recommendations.append("   • Monitor operating cash flow trends")
+    recommendations.append("   • Identify cash flow drivers")
+    recommendations.append("   • Optimize working capital management")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement cash flow monitoring dashboard")
+    recommendations.append("   • Develop cash flow optimization strategies")
+    recommendations.append("   • Regular cash flow analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _free_cash_flow_rules(context):
+    """Recommendations for free cash flow analysis"""
+    if context.empty('cash_flow') or context.empty('balance_sheet'):
+        return "Insufficient data for free cash flow analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("💰 **Free Cash Flow Analysis**")
+    recommendations.append("   • Monitor free cash flow generation")
+    recommendations.append("   • Assess investment capacity")
+    recommendations.append("   • Evaluate dividend sustainability")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement FCF monitoring dashboard")
+    recommendations.append("   • Develop investment prioritization framework")
+    recommendations.append("   • Regular FCF analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _working_capital_rules(context):
+    """Recommendations for working capital analysis"""
+    if context.empty('balance_sheet') or context.empty('cash_flow'):
+        return "Insufficient data for working capital analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("💼 **Working Capital Analysis**")
+    recommendations.append("   • Monitor working capital levels")
+    recommendations.append("   • Optimize inventory and receivables")
+    recommendations.append("   • Manage payment terms and collections")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement working capital monitoring")
+    recommendations.append("   • Develop optimization strategies")
+    recommendations.append("   • Regular working capital analysis")
+    
+    return "\n".join(recommendations)
+
+def _cash_flow_trends_rules(context):
+    """Recommendations for cash flow trends analysis"""
+    if context.empty('cash_flow') or context.empty('balance_sheet'):
+        return "Insufficient data for cash flow trends analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("📈 **Cash Flow Trends Analysis**")
+    recommendations.append("   • Monitor cash flow patterns")
+    recommendations.append("   • Identify seasonal variations")
+    recommendations.append("   • Forecast future cash flows")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement trend monitoring dashboard")
+    recommendations.append("   • Develop cash flow forecasting models")
+    recommendations.append("   • Regular trend analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _debt_analysis_rules(context):
+    """Recommendations for debt analysis"""
+    if context.empty('balance_sheet') or context.empty('income_statement'):
+        return "Insufficient data for debt analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🏗️ **Debt Analysis**")
+    recommendations.append("   • Monitor debt levels and ratios")
+    recommendations.append("   • Assess debt service capacity")
+    recommendations.append("   • Evaluate refinancing opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement debt monitoring dashboard")
+    recommendations.append("   • Implement debt management strategies")
+    recommendations.append("   • Regular debt analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _wacc_calculation_rules(context):
+    """Recommendations for WACC calculation"""
+    if context.empty('balance_sheet') or context.empty('market_data'):
+        return "Insufficient data for WACC calculation."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("⚖️ **WACC Analysis**")
+    recommendations.append("   • Calculate weighted average cost of capital")
+    recommendations.append("   • Assess capital structure optimization")
+    recommendations.append("   • Evaluate investment decisions")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement WACC monitoring dashboard")
+    recommendations.append("   • Develop capital structure strategies")
+    recommendations.append("   • Regular WACC analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _interest_coverage_rules(context):
+    """Recommendations for interest coverage analysis"""
+    if context.empty('income_statement') or context.empty('balance_sheet'):
+        return "Insufficient data for interest coverage analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🛡️ **Interest Coverage Analysis**")
+    recommendations.append("   • Monitor interest coverage ratios")
+    recommendations.append("   • Assess debt service capacity")
+    recommendations.append("   • Identify refinancing opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement coverage monitoring dashboard")
+    recommendations.append("   • Develop debt management strategies")
+    recommendations.append("   • Regular coverage analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _capital_optimization_rules(context):
+    """Recommendations for capital optimization"""
+    if context.empty('balance_sheet') or context.empty('income_statement'):
+        return "Insufficient data for capital optimization analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🏗️ **Capital Optimization Analysis**")
+    recommendations.append("   • Monitor capital structure efficiency")
+    recommendations.append("   • Assess cost of capital")
+    recommendations.append("   • Optimize debt-equity mix")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement capital monitoring dashboard")
+    recommendations.append("   • Develop optimization strategies")
+    recommendations.append("   • Regular capital analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _npv_analysis_rules(context):
+    """Recommendations for NPV analysis"""
+    if context.empty('cash_flow') or context.empty('balance_sheet'):
+        return "Insufficient data for NPV analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("📊 **NPV Analysis**")
+    recommendations.append("   • Calculate net present value of investments")
+    recommendations.append("   • Assess investment attractiveness")
+    recommendations.append("   • Compare investment alternatives")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement NPV monitoring dashboard")
+    recommendations.append("   • Develop investment evaluation framework")
+    recommendations.append("   • Regular NPV analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _payback_period_rules(context):
+    """Recommendations for payback period analysis"""
+    if context.empty('cash_flow') or context.empty('balance_sheet'):
+        return "Insufficient data for payback period analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("⏱️ **Payback Period Analysis**")
+    recommendations.append("   • Calculate investment payback periods")
+    recommendations.append("   • Assess liquidity requirements")
+    recommendations.append("   • Evaluate investment risk")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement payback monitoring dashboard")
+    recommendations.append("   • Develop investment risk assessment")
+    recommendations.append("   • Regular payback analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _eva_calculation_rules(context):
+    """Recommendations for EVA calculation"""
+    if context.empty('income_statement') or context.empty('balance_sheet'):
+        return "Insufficient data for EVA calculation."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("💰 **EVA Analysis**")
+    recommendations.append("   • Calculate economic value added")
+    recommendations.append("   • Assess value creation")
+    recommendations.append("   • Evaluate performance drivers")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement EVA monitoring dashboard")
+    recommendations.append("   • Develop value creation strategies")
+    recommendations.append("   • Regular EVA analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _investment_insights_rules(context):
+    """Recommendations for investment insights"""
+    if context.empty('cash_flow') or context.empty('balance_sheet'):
+        return "Insufficient data for investment insights analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("📈 **Investment Insights Analysis**")
+    recommendations.append("   • Monitor investment performance")
+    recommendations.append("   • Assess risk-return profiles")
+    recommendations.append("   • Identify optimization opportunities")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement investment monitoring dashboard")
+    recommendations.append("   • Develop portfolio optimization strategies")
+    recommendations.append("   • Regular investment analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _customer_profitability_rules(context):
+    """Recommendations for customer profitability analysis"""
+    if context.empty('customer_data'):
+        return "Insufficient data for customer profitability analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("👥 **Customer Profitability Analysis**")
+    recommendations.append("   • Monitor customer profitability metrics")
+    recommendations.append("   • Identify high-value customers")
+    recommendations.append("   • Optimize customer relationships")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement customer monitoring dashboard")
+    recommendations.append("   • Develop customer optimization strategies")
+    recommendations.append("   • Regular customer analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _product_profitability_rules(context):
+    """Recommendations for product profitability analysis"""
+    if context.empty('product_data'):
+        return "Insufficient data for product profitability analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("📦 **Product Profitability Analysis**")
+    recommendations.append("   • Monitor product profitability metrics")
+    recommendations.append("   • Identify high-margin products")
+    recommendations.append("   • Optimize product portfolio")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement product monitoring dashboard")
+    recommendations.append("   • Develop product optimization strategies")
+    recommendations.append("   • Regular product analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _value_chain_analysis_rules(context):
+    """Recommendations for value chain analysis"""
+    if context.empty('value_chain'):
+        return "Insufficient data for value chain analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🔗 **Value Chain Analysis**")
+    recommendations.append("   • Monitor value chain efficiency")
+    recommendations.append("   • Identify optimization opportunities")
+    recommendations.append("   • Assess cost drivers")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement value chain monitoring dashboard")
+    recommendations.append("   • Develop optimization strategies")
+    recommendations.append("   • Regular value chain analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+def _strategic_insights_rules(context):
+    """Recommendations for strategic insights"""
+    if context.empty('customer_data') or context.empty('product_data') or context.empty('value_chain'):
+        return "Insufficient data for strategic insights analysis."
+    
+    recommendations = []
+    # Title removed to avoid duplication with markdown header
+    recommendations.append("")
+    
+    recommendations.append("🎯 **Strategic Insights Analysis**")
+    recommendations.append("   • Monitor strategic performance metrics")
+    recommendations.append("   • Identify strategic opportunities")
+    recommendations.append("   • Assess strategic risks")
+    
+    recommendations.append("")
+    recommendations.append("🎯 **Strategic Actions**")
+    recommendations.append("   • Implement strategic monitoring dashboard")
+    recommendations.append("   • Develop strategic initiatives")
+    recommendations.append("   • Regular strategic analysis and reporting")
+    
+    return "\n".join(recommendations)
+
+# Batch recommendation engine
+RECOMMENDATION_RULES = {
+    'financial_performance': _financial_performance_rules,
+    'liquidity_solvency': _liquidity_solvency_rules,
+    'liquidity_analysis': _liquidity_analysis_rules,
+    'solvency_metrics': _solvency_metrics_rules,
+    'cash_flow_analysis': _cash_flow_analysis_rules,
+    'roa_roe_analysis': _roa_roe_analysis_rules,
+    'asset_turnover': _asset_turnover_rules,
+    'expense_efficiency': _expense_efficiency_rules,
+    'productivity_trends': _productivity_trends_rules,
+    'budget_variance_analysis': _budget_variance_analysis_rules,
+    'forecast_accuracy': _forecast_accuracy_rules,
+    'scenario_analysis': _scenario_analysis_rules,
+    'variance_reporting': _variance_reporting_rules,
+    'operating_cash_flow': _operating_cash_flow_rules,
+    'free_cash_flow': _free_cash_flow_rules,
+    'working_capital': _working_capital_rules,
+    'cash_flow_trends': _cash_flow_trends_rules,
+    'debt_analysis': _debt_analysis_rules,
+    'wacc_calculation': _wacc_calculation_rules,
+    'interest_coverage': _interest_coverage_rules,
+    'capital_optimization': _capital_optimization_rules,
+    'npv_analysis': _npv_analysis_rules,
+    'payback_period': _payback_period_rules,
+    'eva_calculation': _eva_calculation_rules,
+    'investment_insights': _investment_insights_rules,
+    'customer_profitability': _customer_profitability_rules,
+    'product_profitability': _product_profitability_rules,
+    'value_chain_analysis': _value_chain_analysis_rules,
+    'strategic_insights': _strategic_insights_rules
+}
+
+# Rule sets shown on each page, evaluated together in one cached call
+PAGE_RECOMMENDATIONS = {
+    'financial_performance': ['financial_performance'],
+    'liquidity_solvency': ['liquidity_analysis', 'solvency_metrics', 'cash_flow_analysis', 'liquidity_solvency'],
+    'efficiency_productivity': ['roa_roe_analysis', 'asset_turnover', 'expense_efficiency', 'productivity_trends'],
+    'budget_forecasting': ['budget_variance_analysis', 'forecast_accuracy', 'scenario_analysis', 'variance_reporting'],
+    'cash_flow': ['operating_cash_flow', 'free_cash_flow', 'working_capital', 'cash_flow_trends'],
+    'capital_structure': ['debt_analysis', 'wacc_calculation', 'interest_coverage', 'capital_optimization'],
+    'investment_valuation': ['npv_analysis', 'payback_period', 'eva_calculation', 'investment_insights'],
+    'strategic_kpis': ['customer_profitability', 'product_profitability', 'value_chain_analysis', 'strategic_insights'],
+    'auto_insights': ['financial_performance', 'liquidity_solvency', 'cash_flow_analysis']
+}
+
+class RecommendationError(Exception):
+    """A rule set failed while its page's batch was evaluated."""
+
+def generate_recommendations(context, rule_sets=None):
+    """
+    Evaluate rule sets against one shared context.
+    
+    Args:
+        context (FinanceContext): Aggregates of the finance tables
+        rule_sets (list): Names from RECOMMENDATION_RULES, default all
+    
+    Returns:
+        dict: Rule set name -> recommendations text
+    """
+    return {name: RECOMMENDATION_RULES[name](context) for name in (rule_sets or RECOMMENDATION_RULES)}
+
+@finance_cache(ttl=1800, max_entries=20)
+def build_finance_context(income_statement, balance_sheet, cash_flow, budget, forecast,
+                          market_data, customer_data, product_data, value_chain):
+    """FinanceContext for one dataset version, keyed by the table versions."""
+    return FinanceContext(
+        income_statement=income_statement, balance_sheet=balance_sheet, cash_flow=cash_flow,
+        budget=budget, forecast=forecast, market_data=market_data, customer_data=customer_data,
+        product_data=product_data, value_chain=value_chain
+    )
+
+@finance_cache(ttl=1800, max_entries=50)
+def _page_recommendations(page, income_statement, balance_sheet, cash_flow, budget, forecast,
+                          market_data, customer_data, product_data, value_chain):
+    """Every rule set of a page as (text, error) pairs; a failing rule set does not hide the others."""
+    context = build_finance_context(income_statement, balance_sheet, cash_flow, budget, forecast,
+                                    market_data, customer_data, product_data, value_chain)
+    results = {}
+    for name in PAGE_RECOMMENDATIONS[page]:
+        try:
+            results[name] = (RECOMMENDATION_RULES[name](context), None)
+        except Exception as e:
+            results[name] = (None, str(e))
+    return results
+
+def page_recommendation(page, rule_set):
+    """
+    Recommendations text for one section of a page.
+    
+    The first call on a page render evaluates all of the page's rule sets
+    against the shared context; the other sections read the cached batch.
+    
+    Raises:
+        RecommendationError: If the rule set failed
+    """
+    tables = [st.session_state[name] for name in FINANCE_TABLES]
+    text, error = _page_recommendations(page, *tables)[rule_set]
+    if error is not None:
+        raise RecommendationError(error)
+    return text
+
+# Entry points taking the tables directly, for callers outside the pages
+def generate_financial_performance_ai_recommendations(income_statement_data, balance_sheet_data, cash_flow_data):
+    """Generate AI-powered recommendations for financial performance"""
+    return _financial_performance_rules(FinanceContext(income_statement=income_statement_data, balance_sheet=balance_sheet_data, cash_flow=cash_flow_data))
+
+def generate_liquidity_solvency_ai_recommendations(balance_sheet_data, cash_flow_data):
+    """Generate AI-powered recommendations for liquidity and solvency"""
+    return _liquidity_solvency_rules(FinanceContext(balance_sheet=balance_sheet_data, cash_flow=cash_flow_data))
+
+def generate_liquidity_analysis_ai_recommendations(balance_sheet_data, cash_flow_data):
+    """Generate AI-powered recommendations for liquidity analysis"""
+    return _liquidity_analysis_rules(FinanceContext(balance_sheet=balance_sheet_data, cash_flow=cash_flow_data))
+
+def generate_solvency_metrics_ai_recommendations(balance_sheet_data, income_statement_data):
+    """Generate AI-powered recommendations for solvency analysis"""
+    return _solvency_metrics_rules(FinanceContext(balance_sheet=balance_sheet_data, income_statement=income_statement_data))
+
+def generate_cash_flow_analysis_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for cash flow analysis"""
+    return _cash_flow_analysis_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_roa_roe_analysis_ai_recommendations(income_statement_data, balance_sheet_data):
+    """Generate AI-powered recommendations for ROA/ROE analysis"""
+    return _roa_roe_analysis_rules(FinanceContext(income_statement=income_statement_data, balance_sheet=balance_sheet_data))
+
+def generate_asset_turnover_ai_recommendations(income_statement_data, balance_sheet_data):
+    """Generate AI-powered recommendations for asset turnover analysis"""
+    return _asset_turnover_rules(FinanceContext(income_statement=income_statement_data, balance_sheet=balance_sheet_data))
+
+def generate_expense_efficiency_ai_recommendations(income_statement_data):
+    """Generate AI-powered recommendations for expense efficiency analysis"""
+    return _expense_efficiency_rules(FinanceContext(income_statement=income_statement_data))
+
+def generate_productivity_trends_ai_recommendations(income_statement_data, balance_sheet_data):
+    """Generate AI-powered recommendations for productivity trends analysis"""
+    return _productivity_trends_rules(FinanceContext(income_statement=income_statement_data, balance_sheet=balance_sheet_data))
+
+def generate_budget_variance_analysis_ai_recommendations(budget_data, actual_data):
+    """Generate AI-powered recommendations for budget variance analysis"""
+    return _budget_variance_analysis_rules(FinanceContext(budget=budget_data, income_statement=actual_data))
+
+def generate_forecast_accuracy_ai_recommendations(forecast_data, actual_data):
+    """Generate AI-powered recommendations for forecast accuracy analysis"""
+    return _forecast_accuracy_rules(FinanceContext(forecast=forecast_data, income_statement=actual_data))
+
+def generate_scenario_analysis_ai_recommendations(scenario_data):
+    """Generate AI-powered recommendations for scenario analysis"""
+    return _scenario_analysis_rules(FinanceContext(income_statement=scenario_data))
+
+def generate_variance_reporting_ai_recommendations(income_statement_data, budget_data):
+    """Generate AI-powered recommendations for variance reporting"""
+    return _variance_reporting_rules(FinanceContext(income_statement=income_statement_data, budget=budget_data))
+
+def generate_operating_cash_flow_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for operating cash flow analysis"""
+    return _operating_cash_flow_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_free_cash_flow_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for free cash flow analysis"""
+    return _free_cash_flow_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_working_capital_ai_recommendations(balance_sheet_data, cash_flow_data):
+    """Generate AI-powered recommendations for working capital analysis"""
+    return _working_capital_rules(FinanceContext(balance_sheet=balance_sheet_data, cash_flow=cash_flow_data))
+
+def generate_cash_flow_trends_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for cash flow trends analysis"""
+    return _cash_flow_trends_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_debt_analysis_ai_recommendations(balance_sheet_data, income_statement_data):
+    """Generate AI-powered recommendations for debt analysis"""
+    return _debt_analysis_rules(FinanceContext(balance_sheet=balance_sheet_data, income_statement=income_statement_data))
+
+def generate_wacc_calculation_ai_recommendations(balance_sheet_data, market_data):
+    """Generate AI-powered recommendations for WACC calculation"""
+    return _wacc_calculation_rules(FinanceContext(balance_sheet=balance_sheet_data, market_data=market_data))
+
+def generate_interest_coverage_ai_recommendations(income_statement_data, balance_sheet_data):
+    """Generate AI-powered recommendations for interest coverage analysis"""
+    return _interest_coverage_rules(FinanceContext(income_statement=income_statement_data, balance_sheet=balance_sheet_data))
+
+def generate_capital_optimization_ai_recommendations(balance_sheet_data, income_statement_data):
+    """Generate AI-powered recommendations for capital optimization"""
+    return _capital_optimization_rules(FinanceContext(balance_sheet=balance_sheet_data, income_statement=income_statement_data))
+
+def generate_npv_analysis_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for NPV analysis"""
+    return _npv_analysis_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_payback_period_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for payback period analysis"""
+    return _payback_period_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_eva_calculation_ai_recommendations(income_statement_data, balance_sheet_data):
+    """Generate AI-powered recommendations for EVA calculation"""
+    return _eva_calculation_rules(FinanceContext(income_statement=income_statement_data, balance_sheet=balance_sheet_data))
+
+def generate_investment_insights_ai_recommendations(cash_flow_data, balance_sheet_data):
+    """Generate AI-powered recommendations for investment insights"""
+    return _investment_insights_rules(FinanceContext(cash_flow=cash_flow_data, balance_sheet=balance_sheet_data))
+
+def generate_customer_profitability_ai_recommendations(customer_data):
+    """Generate AI-powered recommendations for customer profitability analysis"""
+    return _customer_profitability_rules(FinanceContext(customer_data=customer_data))
+
+def generate_product_profitability_ai_recommendations(product_data):
+    """Generate AI-powered recommendations for product profitability analysis"""
+    return _product_profitability_rules(FinanceContext(product_data=product_data))
+
+def generate_value_chain_analysis_ai_recommendations(value_chain_data):
+    """Generate AI-powered recommendations for value chain analysis"""
+    return _value_chain_analysis_rules(FinanceContext(value_chain=value_chain_data))
+
+def generate_strategic_insights_ai_recommendations(customer_data, product_data, value_chain_data):
+    """Generate AI-powered recommendations for strategic insights"""
+    return _strategic_insights_rules(FinanceContext(customer_data=customer_data, product_data=product_data, value_chain=value_chain_data))
+
+def format_ai_recommendations(recommendations_text):
+    """
+    Format AI recommendations text to display properly in Streamlit with each bullet point on a separate line.
+    Remove double asterisks and emoji characters from headings.
+    """
+    if not recommendations_text:
+        return ""
+    
+    # Split the text into lines
+    lines = recommendations_text.split('\n')
+    formatted_lines = []
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            formatted_lines.append("")
+            continue
+            
+        # If it's already a bullet point, keep it as is
+        if line.startswith("   •"):
+            formatted_lines.append(line)
+        # If it's a heading with emoji and double asterisks, clean it up
+        elif (line.startswith("🤖") or line.startswith("🎯") or line.startswith("💰") or 
+              line.startswith("💸") or line.startswith("⚠️") or line.startswith("👥") or 
+              line.startswith("📦") or line.startswith("🔍") or line.startswith("🟢") or 
+              line.startswith("🟡") or line.startswith("🟠") or line.startswith("🔴") or 
+              line.startswith("📈") or line.startswith("📉")):
+            # Remove double asterisks and emoji, keep only the text
+            cleaned_line = line
+            # Remove emoji characters
+            emoji_patterns = ["🤖", "🎯", "💰", "💸", "⚠️", "👥", "📦", "🔍", "🟢", "🟡", "🟠", "🔴", "📈", "📉"]
+            for emoji in emoji_patterns:
+                cleaned_line = cleaned_line.replace(emoji, "")
+            # Remove double asterisks
+            cleaned_line = cleaned_line.replace("**", "")
+            # Clean up extra spaces
+            cleaned_line = cleaned_line.strip()
+            formatted_lines.append(cleaned_line)
+        # If it contains bullet points on the same line, split them
+        elif "•" in line:
+            # Split by bullet points
+            parts = line.split("•")
+            for i, part in enumerate(parts):
+                part = part.strip()
+                if part:
+                    if i == 0:  # First part (before first bullet)
+                        formatted_lines.append(part)
+                    else:  # Bullet point parts
+                        formatted_lines.append(f"   • {part}")
+        else:
+            # Regular line, keep as is
+            formatted_lines.append(line)
+    
+    return "\n".join(formatted_lines)
+
+def display_formatted_recommendations(recommendations_text):
+    """
+    Display AI recommendations with proper formatting using HTML to ensure bullet points are on separate lines.
+    """
+    if not recommendations_text:
+        return
+    
+    # Convert the text to HTML format for better display
+    html_content = recommendations_text.replace('\n', '<br>')
+    
+    # Replace bullet points with proper HTML list items
+    lines = recommendations_text.split('\n')
+    html_lines = []
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            html_lines.append("<br>")
+        elif line.startswith("   •"):
+            # Convert bullet point to HTML list item
+            content = line.replace("   •", "").strip()
+            html_lines.append(f"<li>{content}</li>")
+        elif line and not line.startswith("   •") and not "•" in line:
+            # This is a heading (already cleaned of emoji and asterisks), add it as a header
+            html_lines.append(f"<h4>{line}</h4>")
+        elif "•" in line:
+            # Split by bullet points and create list items
+            parts = line.split("•")
+            for i, part in enumerate(parts):
+                part = part.strip()
+                if part:
+                    if i == 0:  # First part (before first bullet)
+                        html_lines.append(f"<h4>{part}</h4>")
+                    else:  # Bullet point parts
+                        html_lines.append(f"<li>{part}</li>")
+        else:
+            # Regular line
+            html_lines.append(f"<p>{line}</p>")
+    
+    # Combine into HTML with proper list structure
+    html_content = ""
+    in_list = False
+    
+    for line in html_lines:
+        if line.startswith("<li>"):
+            if not in_list:
+                html_content += "<ul>"
+                in_list = True
+            html_content += line
+        elif line.startswith("<h4>"):
+            if in_list:
+                html_content += "</ul>"
+                in_list = False
+            html_content += line
+        elif line.startswith("<p>"):
+            if in_list:
+                html_content += "</ul>"
+                in_list = False
+            html_content += line
+        elif line == "<br>":
+            if in_list:
+                html_content += "</ul>"
+                in_list = False
+            html_content += line
+    
+    # Close any open list
+    if in_list:
+        html_content += "</ul>"
+    
+    # Display using HTML
+    st.markdown(html_content, unsafe_allow_html=True)
@@ -0,0 +1,232 @@
+"""
+Finance Monte Carlo Scenarios
+=============================
+
+Stochastic scenario engine for the predictive analytics page:
+- Base revenue and net margin forecasts are computed once by the caller
+- Growth, margin and cost shocks are drawn once as (paths x periods)
+  arrays and shared by every scenario (common random numbers), so
+  scenarios differ only by their multipliers
+- Percentile fan charts, covenant breach probabilities and expected net
+  income come straight from the (scenarios x paths x periods) arrays
+"""
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_PATHS = 10_000
+MAX_PATHS = 200_000
+FAN_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Scenario -> (growth multiplier, margin multiplier), as in predict_scenario_analysis
+SCENARIO_PRESETS = {
+    'optimistic': (1.5, 1.2),
+    'base': (1.0, 1.0),
+    'pessimistic': (0.7, 0.8)
+}
+
+# Shock sizes used when the history is too short to estimate them
+DEFAULT_VOLATILITY = {'growth': 0.05, 'margin': 2.0, 'cost': 1.0}
+DEFAULT_TAX_RATE = 0.25
+
+# Covenant thresholds checked in every simulated period
+DEFAULT_COVENANTS = {
+    'min_net_income': 0.0,
+    'min_interest_coverage': 3.0
+}
+
+# ============================================================================
+# CALIBRATION
+# ============================================================================
+
+def _ratio(numerator, denominator):
+    numerator = pd.to_numeric(numerator, errors='coerce')
+    denominator = pd.to_numeric(denominator, errors='coerce').replace(0, np.nan)
+    return (numerator / denominator).replace([np.inf, -np.inf], np.nan).dropna()
+
+
+def estimate_volatility(income_statement):
+    """
+    Period-over-period shock sizes from the income statement history.
+
+    Returns:
+        dict: 'growth' (std of log revenue growth), 'margin' (std of net margin
+        changes, percentage points) and 'cost' (std of operating expense ratio
+        changes, percentage points)
+    """
+    volatility = dict(DEFAULT_VOLATILITY)
+    if income_statement is None or income_statement.empty or 'revenue' not in income_statement.columns:
+        return volatility
+
+    revenue = pd.to_numeric(income_statement['revenue'], errors='coerce')
+    log_growth = np.log(revenue.where(revenue > 0)).diff().dropna()
+    if len(log_growth) >= 3:
+        volatility['growth'] = float(log_growth.std())
+    if 'net_income' in income_statement.columns:
+        margin_changes = (_ratio(income_statement['net_income'], revenue) * 100).diff().dropna()
+        if len(margin_changes) >= 3:
+            volatility['margin'] = float(margin_changes.std())
+    if 'operating_expenses' in income_statement.columns:
+        cost_changes = (_ratio(income_statement['operating_expenses'], revenue) * 100).diff().dropna()
+        if len(cost_changes) >= 3:
+            volatility['cost'] = float(cost_changes.std())
+    return volatility
+
+
+def estimate_debt_service(income_statement):
+    """
+    Latest interest expense and average tax rate for the coverage covenant.
+
+    Returns:
+        tuple: (interest expense per period or 0, tax rate)
+    """
+    if income_statement is None or income_statement.empty:
+        return 0.0, DEFAULT_TAX_RATE
+    interest = 0.0
+    if 'interest_expense' in income_statement.columns:
+        latest = pd.to_numeric(income_statement['interest_expense'], errors='coerce').dropna()
+        interest = float(abs(latest.iloc[-1])) if not latest.empty else 0.0
+    tax_rate = DEFAULT_TAX_RATE
+    if {'income_tax_expense', 'net_income'}.issubset(income_statement.columns):
+        tax = pd.to_numeric(income_statement['income_tax_expense'], errors='coerce')
+        pre_tax = pd.to_numeric(income_statement['net_income'], errors='coerce') + tax
+        rates = _ratio(tax, pre_tax)
+        rates = rates[(rates >= 0) & (rates < 1)]
+        if not rates.empty:
+            tax_rate = float(rates.mean())
+    return interest, tax_rate
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+class ScenarioSimulation:
+    """
+    Simulated paths for several scenarios.
+
+    Attributes:
+        scenarios (list): Scenario names
+        periods (list): Future period labels
+        revenue (np.ndarray): shape (scenarios, paths, periods)
+        margin (np.ndarray): Net margin in percent, same shape
+        net_income (np.ndarray): Same shape
+        interest_coverage (np.ndarray or None): EBIT / interest, same shape
+        breaches (np.ndarray): True where any covenant is breached, same shape
+        covenants (dict): Thresholds that were checked
+    """
+
+    def __init__(self, scenarios, periods, revenue, margin, net_income, interest_coverage, breaches, covenants):
+        self.scenarios = scenarios
+        self.periods = periods
+        self.revenue = revenue
+        self.margin = margin
+        self.net_income = net_income
+        self.interest_coverage = interest_coverage
+        self.breaches = breaches
+        self.covenants = covenants
+
+    @property
+    def n_paths(self):
+        return self.revenue.shape[1]
+
+    def fan_chart(self, metric='net_income', scenario='base', percentiles=FAN_PERCENTILES):
+        """
+        Percentiles of a simulated metric per future period.
+
+        Returns:
+            pd.DataFrame: period, mean and one pNN column per percentile
+        """
+        values = getattr(self, metric)[self.scenarios.index(scenario)]
+        bands = np.percentile(values, percentiles, axis=0)
+        fan = pd.DataFrame({'period': self.periods, 'mean': values.mean(axis=0)})
+        for percentile, band in zip(percentiles, bands):
+            fan[f'p{percentile}'] = band
+        return fan
+
+    def breach_probability(self):
+        """Share of paths breaching a covenant in each period, scenarios x periods (percent)."""
+        return pd.DataFrame(self.breaches.mean(axis=1) * 100, index=self.scenarios, columns=self.periods)
+
+    def summary(self):
+        """
+        Horizon totals per scenario.
+
+        Returns:
+            pd.DataFrame: expected revenue and net income, a 5th percentile net
+            income, the probability of a loss period and of any covenant breach
+        """
+        total_net_income = self.net_income.sum(axis=2)
+        return pd.DataFrame({
+            'scenario': self.scenarios,
+            'expected_revenue': self.revenue.sum(axis=2).mean(axis=1),
+            'expected_net_income': total_net_income.mean(axis=1),
+            'net_income_p5': np.percentile(total_net_income, 5, axis=1),
+            'expected_margin': self.margin.mean(axis=(1, 2)),
+            'loss_probability': (self.net_income < 0).any(axis=2).mean(axis=1) * 100,
+            'covenant_breach_probability': self.breaches.any(axis=2).mean(axis=1) * 100
+        })
+
+
+def simulate_scenarios(base_revenue, base_margin, scenarios=None, n_paths=DEFAULT_PATHS, volatility=None,
+                       interest_expense=0.0, tax_rate=DEFAULT_TAX_RATE, covenants=None, periods=None, seed=42):
+    """
+    Monte Carlo revenue, margin and net income paths around base forecasts.
+
+    Revenue follows the base forecast times a random walk in log growth;
+    net margin follows the base margin plus random-walk margin shocks minus
+    operating cost shocks. Scenario multipliers scale the base forecasts,
+    and every scenario reuses the same draws.
+
+    Args:
+        base_revenue (array-like): Forecast revenue per future period
+        base_margin (array-like): Forecast net margin (%) per future period
+        scenarios (dict): name -> (growth multiplier, margin multiplier),
+            defaults to SCENARIO_PRESETS
+        n_paths (int): Paths per scenario (capped at MAX_PATHS)
+        volatility (dict): 'growth', 'margin' and 'cost' shock sizes per period
+        interest_expense (float): Interest per period for the coverage covenant
+        tax_rate (float): Tax rate used to gross net income up to EBIT
+        covenants (dict): Thresholds, defaults to DEFAULT_COVENANTS
+        periods (list): Period labels, defaults to Future_1..Future_n
+        seed (int): Random seed
+
+    Returns:
+        ScenarioSimulation: Simulated paths
+    """
+    base_revenue = np.asarray(base_revenue, dtype=np.float64)
+    base_margin = np.asarray(base_margin, dtype=np.float64)
+    scenarios = SCENARIO_PRESETS if scenarios is None else scenarios
+    volatility = {**DEFAULT_VOLATILITY, **(volatility or {})}
+    covenants = {**DEFAULT_COVENANTS, **(covenants or {})}
+    n_paths = int(min(max(n_paths, 1), MAX_PATHS))
+    n_periods = len(base_revenue)
+    periods = periods or [f'Future_{i}' for i in range(1, n_periods + 1)]
+
+    # One set of draws shared by all scenarios
+    rng = np.random.default_rng(seed)
+    shocks = rng.standard_normal((3, n_paths, n_periods))
+    growth_sigma = volatility['growth']
+    revenue_walk = np.exp(np.cumsum(shocks[0] * growth_sigma - 0.5 * growth_sigma ** 2, axis=1))
+    margin_walk = np.cumsum(shocks[1] * volatility['margin'] - shocks[2] * volatility['cost'], axis=1)
+
+    names = list(scenarios)
+    multipliers = np.array([scenarios[name] for name in names], dtype=np.float64).reshape(-1, 2)
+    growth = multipliers[:, 0, None, None]
+    margin_multiplier = multipliers[:, 1, None, None]
+
+    revenue = growth * base_revenue * revenue_walk
+    margin = np.clip(margin_multiplier * base_margin + margin_walk, -100.0, 100.0)
+    net_income = revenue * margin / 100
+
+    breaches = net_income < covenants['min_net_income']
+    interest_coverage = None
+    if interest_expense > 0:
+        ebit = net_income / (1 - tax_rate) + interest_expense
+        interest_coverage = ebit / interest_expense
+        breaches |= interest_coverage < covenants['min_interest_coverage']
+
+    return ScenarioSimulation(names, periods, revenue, margin, net_income, interest_coverage, breaches, covenants)
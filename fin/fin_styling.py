@@ -0,0 +1,415 @@
+import streamlit as st
+import plotly.express as px
+import plotly.io as pio
+
+# Set Plotly template
+pio.templates.default = "plotly_white"
+CONTINUOUS_COLOR_SCALE = "Turbo"
+CATEGORICAL_COLOR_SEQUENCE = px.colors.qualitative.Pastel
+
+def apply_common_layout(fig):
+    """Apply common layout settings to plots."""
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        margin=dict(l=50, r=50, t=80, b=50)
+    )
+    return fig
+
+def truncate_col(text, max_len=20):
+    """Truncate text for table columns"""
+    text = str(text)
+    return text[:max_len] + '...' if len(text) > max_len else text
+
+# Custom CSS for modern SaaS dashboard styling
+def load_custom_css():
+    st.markdown("""
+    <style>
+    /* Modern SaaS Dashboard Styling */
+    
+    /* Main background gradient */
+    .main .block-container {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 0;
+        max-width: 100%;
+    }
+    
+    /* Sidebar styling - compact */
+    .css-1d391kg {
+        background: linear-gradient(180deg, #1a202c 0%, #2d3748 100%);
+        padding: 20px 12px;
+        width: 250px;
+        min-width: 250px;
+        box-shadow: 2px 0 10px rgba(0,0,0,0.1);
+    }
+    
+    /* Optimize sidebar width */
+    .css-1lcbmhc {
+        width: 250px;
+        min-width: 250px;
+    }
+    
+    /* Main content area - expanded width */
+    .main .block-container {
+        padding-left: 1rem;
+        padding-right: 1rem;
+        max-width: 100%;
+        width: 100%;
+    }
+    
+    /* Expand main content width */
+    .main {
+        max-width: 100%;
+        padding-left: 0;
+        padding-right: 0;
+    }
+    
+    /* Remove default Streamlit width constraints */
+    .block-container {
+        max-width: 100%;
+        padding-left: 1rem;
+        padding-right: 1rem;
+    }
+    
+    /* Expand chart containers */
+    .chart-container {
+        width: 100%;
+        max-width: none;
+    }
+    
+    /* Make plots wider */
+    .js-plotly-plot {
+        width: 100% !important;
+    }
+    
+    /* Expand dataframe width */
+    .dataframe {
+        width: 100% !important;
+        max-width: none;
+    }
+    
+    /* Force full width for all content */
+    .element-container {
+        width: 100% !important;
+        max-width: none !important;
+    }
+    
+    /* Ensure plots use full width */
+    .plotly-graph-div {
+        width: 100% !important;
+        max-width: none !important;
+        height: auto !important;
+    }
+    
+    /* Optimize chart height for wide layout */
+    .js-plotly-plot {
+        height: 500px !important;
+    }
+    
+    /* Optimize column layouts for wider space */
+    .row-widget.stHorizontal {
+        width: 100%;
+    }
+    
+    /* Remove any remaining width constraints */
+    .stApp > div:first-child {
+        max-width: 100%;
+    }
+    
+    /* Ensure all Streamlit elements use full width */
+    .stApp {
+        max-width: 100%;
+    }
+    
+    /* Optimize for wide screens */
+    @media (min-width: 1200px) {
+        .main .block-container {
+            padding-left: 2rem;
+            padding-right: 2rem;
+        }
+    }
+    
+    /* Make sure all containers expand */
+    .stContainer {
+        width: 100% !important;
+        max-width: none !important;
+    }
+    
+    /* Sidebar button styling */
+    .stButton > button {
+        background: rgba(255, 255, 255, 0.08);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 10px;
+        color: #ffffff;
+        font-weight: 500;
+        margin: 6px 0;
+        padding: 12px 16px;
+        transition: all 0.3s ease;
+        text-shadow: 0 1px 2px rgba(0,0,0,0.2);
+        font-size: 0.95rem;
+    }
+    
+    .stButton > button:hover {
+        background: rgba(255, 255, 255, 0.15);
+        border-color: rgba(255, 255, 255, 0.3);
+        transform: translateX(3px);
+        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
+    }
+    
+    /* Active button styling */
+    .stButton > button[data-active="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-color: rgba(255, 255, 255, 0.4);
+        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
+        font-weight: 600;
+    }
+    
+    /* Card styling */
+    .metric-card {
+        background: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+        border: 1px solid rgba(255,255,255,0.2);
+        backdrop-filter: blur(10px);
+    }
+    
+    .metric-card-blue {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
+    }
+    
+    .metric-card-purple {
+        background: linear-gradient(135deg, #a855f7 0%, #7c3aed 100%);
+        color: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(168, 85, 247, 0.3);
+    }
+    
+    .metric-card-orange {
+        background: linear-gradient(135deg, #f97316 0%, #ea580c 100%);
+        color: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(249, 115, 22, 0.3);
+    }
+    
+    .metric-card-teal {
+        background: linear-gradient(135deg, #14b8a6 0%, #0d9488 100%);
+        color: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(20, 184, 166, 0.3);
+    }
+    
+    .metric-card-green {
+        background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%);
+        color: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(34, 197, 94, 0.3);
+    }
+    
+    .metric-card-red {
+        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+        color: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        box-shadow: 0 8px 32px rgba(239, 68, 68, 0.3);
+    }
+    
+    /* Chart container styling */
+    .chart-container {
+        background: white;
+        border-radius: 15px;
+        padding: 20px;
+        margin: 15px 0;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        border: 1px solid rgba(0,0,0,0.05);
+    }
+    
+    /* Header styling */
+    .main-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 30px;
+        border-radius: 0 0 20px 20px;
+        margin-bottom: 30px;
+        text-align: center;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+    }
+    
+    /* Welcome section */
+    .welcome-section {
+        background: white;
+        border-radius: 15px;
+        padding: 25px;
+        margin: 20px 0;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        border: 1px solid rgba(0,0,0,0.05);
+    }
+    
+    /* Progress circle styling */
+    .progress-circle {
+        width: 80px;
+        height: 80px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: bold;
+        font-size: 18px;
+        margin: 10px auto;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        padding: 10px 20px;
+        font-weight: 600;
+        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background: transparent;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: white;
+        border-radius: 10px 10px 0 0;
+        padding: 10px 20px;
+        font-weight: 600;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+    }
+    
+    /* Dataframe styling */
+    .dataframe {
+        border-radius: 10px;
+        overflow: hidden;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }
+    
+    /* Insights container */
+    .insights-container {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 15px;
+        padding: 20px;
+        margin: 15px 0;
+        color: white;
+        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
+    }
+    
+    /* Hide Streamlit default elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    
+    /* Custom scrollbar */
+    ::-webkit-scrollbar {
+        width: 8px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: #f1f1f1;
+        border-radius: 10px;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 10px;
+    }
+    
+    ::-webkit-scrollbar-thumb:hover {
+        background: linear-gradient(135deg, #5a67d8 0%, #6b46c1 100%);
+    }
+    
+    /* Responsive design */
+    @media (max-width: 768px) {
+        .metric-card {
+            margin: 5px 0;
+            padding: 15px;
+        }
+        
+        .main-header {
+            padding: 20px;
+            font-size: 24px;
+        }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+def create_metric_card(title, value, description):
+    """Create a styled metric card for the dashboard"""
+    return f"""
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                padding: 1.5rem; 
+                border-radius: 15px; 
+                color: white; 
+                text-align: center; 
+                box-shadow: 0 4px 15px rgba(0,0,0,0.1); 
+                margin-bottom: 1rem;">
+        <h3 style="margin: 0; font-size: 1.8rem; font-weight: 700;">{value}</h3>
+        <p style="margin: 0.5rem 0 0 0; font-size: 1rem; font-weight: 600;">{title}</p>
+        <p style="margin: 0.5rem 0 0 0; font-size: 0.85rem; opacity: 0.9;">{description}</p>
+    </div>
+    """
+
+def create_insight_box(title, content, icon="💡"):
+    """Create a styled insight box"""
+    return f"""
+    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
+                padding: 1.5rem; 
+                border-radius: 15px; 
+                color: white; 
+                margin-bottom: 1rem;">
+        <h4 style="margin: 0 0 1rem 0; font-size: 1.2rem; font-weight: 600;">{icon} {title}</h4>
+        <p style="margin: 0; font-size: 0.95rem; line-height: 1.5;">{content}</p>
+    </div>
+    """
+
+def create_alert_box(content, alert_type="info"):
+    """Create a styled alert box"""
+    colors = {
+        "info": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+        "success": "linear-gradient(135deg, #4CAF50 0%, #45a049 100%)",
+        "warning": "linear-gradient(135deg, #ff9800 0%, #f57c00 100%)",
+        "error": "linear-gradient(135deg, #f44336 0%, #d32f2f 100%)"
+    }
+    
+    return f"""
+    <div style="background: {colors.get(alert_type, colors['info'])}; 
+                padding: 1rem; 
+                border-radius: 10px; 
+                color: white; 
+            margin-bottom: 1rem;">
+        <p style="margin: 0; font-size: 0.95rem;">{content}</p>
+    </div>
+    """
@@ -0,0 +1,257 @@
+"""
+Finance Investment Valuation Engine
+===================================
+
+Vectorized capital budgeting over project portfolios:
+- Cash flows are a (projects x periods) matrix, column t holding the net
+  flow at time t (investments negative)
+- NPV over a grid of discount rates is a single matrix product, giving
+  the (projects x rates) sensitivity surface in one call
+- IRR runs Newton steps with a bisection fallback for all projects at
+  once, inside brackets found from the NPV surface
+- Simple and discounted payback come from cumulative sums, EVA from
+  broadcasting NOPAT against the capital charge
+"""
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_DISCOUNT_RATE = 0.10
+DEFAULT_RATE_GRID = np.array([0.05, 0.08, 0.10, 0.12, 0.15, 0.20])
+
+# Rates scanned for a sign change of NPV before the IRR search
+IRR_BRACKET_GRID = np.concatenate([
+    np.linspace(-0.95, -0.1, 18), np.linspace(-0.05, 1.0, 43), np.array([1.5, 2.0, 3.0, 5.0, 10.0])
+])
+IRR_TOLERANCE = 1e-10
+IRR_MAX_ITERATIONS = 100
+
+# ============================================================================
+# CASH FLOW MATRIX
+# ============================================================================
+
+def build_cash_flow_matrix(cash_flow_data, project_col='project_id'):
+    """
+    Projects x periods net cash flow matrix from the cash flow table.
+
+    Each row's initial_investment is an outflow at its own time step and
+    its cash_flow an inflow one step later, so a single investment in the
+    first row is valued as -investment + sum(cf_i / (1 + r) ** (i + 1)).
+    Rows are grouped by project_col when present, otherwise the table is
+    one project.
+
+    Returns:
+        tuple: (project ids, np.ndarray of shape (projects, periods + 1))
+    """
+    if cash_flow_data is None or cash_flow_data.empty:
+        return np.array([]), np.zeros((0, 1))
+
+    def column(name):
+        if name not in cash_flow_data.columns:
+            return np.zeros(len(cash_flow_data))
+        return pd.to_numeric(cash_flow_data[name], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+    inflows, investments = column('cash_flow'), column('initial_investment')
+    if project_col in cash_flow_data.columns:
+        project_codes, project_ids = pd.factorize(cash_flow_data[project_col], sort=True)
+        # Position of each row within its project, in table order
+        steps = pd.Series(project_codes).groupby(project_codes).cumcount().to_numpy()
+    else:
+        project_codes = np.zeros(len(cash_flow_data), dtype=np.int64)
+        project_ids = np.array(['Portfolio'])
+        steps = np.arange(len(cash_flow_data))
+
+    matrix = np.zeros((len(project_ids), steps.max() + 2))
+    np.add.at(matrix, (project_codes, steps), -investments)
+    np.add.at(matrix, (project_codes, steps + 1), inflows)
+    return np.asarray(project_ids), matrix
+
+# ============================================================================
+# VALUATION KERNELS
+# ============================================================================
+
+def discount_factors(rates, n_periods):
+    """(rates x periods) matrix of 1 / (1 + r) ** t for t = 0..n_periods - 1."""
+    rates = np.atleast_1d(np.asarray(rates, dtype=np.float64))
+    return (1 + rates[:, None]) ** -np.arange(n_periods, dtype=np.float64)
+
+
+def npv_surface(cash_flows, rates=DEFAULT_RATE_GRID):
+    """
+    NPV of every project at every discount rate.
+
+    Returns:
+        np.ndarray: shape (projects, rates)
+    """
+    cash_flows = np.atleast_2d(cash_flows)
+    return cash_flows @ discount_factors(rates, cash_flows.shape[1]).T
+
+
+def npv(cash_flows, rate=DEFAULT_DISCOUNT_RATE):
+    """NPV per project at one discount rate."""
+    return npv_surface(cash_flows, [rate])[:, 0]
+
+
+def _npv_and_slope(cash_flows, rates):
+    """NPV and dNPV/dr per project at per-project rates (Horner's scheme)."""
+    x = 1 / (1 + rates)
+    value = np.zeros_like(rates)
+    slope_x = np.zeros_like(rates)
+    for t in range(cash_flows.shape[1] - 1, -1, -1):
+        slope_x = slope_x * x + value
+        value = value * x + cash_flows[:, t]
+    return value, -slope_x * x * x
+
+
+def irr(cash_flows, guess=DEFAULT_DISCOUNT_RATE, tol=IRR_TOLERANCE, max_iterations=IRR_MAX_ITERATIONS):
+    """
+    Internal rate of return per project.
+
+    Each project's bracket is the IRR_BRACKET_GRID interval where NPV
+    changes sign closest to guess, which picks the economically relevant
+    root when mixed-sign cash flows have several. Newton steps are taken
+    inside the bracket and replaced by bisection whenever they would
+    leave it. A grid rate where NPV is exactly zero is a root in itself.
+
+    Returns:
+        np.ndarray: IRR per project, NaN where NPV never changes sign or
+        every cash flow is zero
+    """
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    surface = npv_surface(cash_flows, IRR_BRACKET_GRID)
+    nonzero = (cash_flows != 0).any(axis=1)[:, None]
+    signs = np.sign(surface)
+    crossing = (signs[:, :-1] * signs[:, 1:] < 0) & nonzero
+    exact = (surface == 0) & nonzero
+    result = np.full(len(cash_flows), np.nan)
+
+    # Exact roots on the grid are taken as they are when closer to guess
+    # than any bracketed root
+    midpoints = (IRR_BRACKET_GRID[:-1] + IRR_BRACKET_GRID[1:]) / 2
+    bracket_distance = np.where(crossing, np.abs(midpoints - guess), np.inf)
+    exact_distance = np.where(exact, np.abs(IRR_BRACKET_GRID - guess), np.inf)
+    nearest_exact = exact_distance.argmin(axis=1)
+    on_grid = exact.any(axis=1) & (exact_distance.min(axis=1) <= bracket_distance.min(axis=1))
+    result[on_grid] = IRR_BRACKET_GRID[nearest_exact[on_grid]]
+
+    has_root = crossing.any(axis=1) & ~on_grid
+    if not has_root.any():
+        return result
+
+    rows = np.flatnonzero(has_root)
+    bracket = bracket_distance[rows].argmin(axis=1)
+    lo, hi = IRR_BRACKET_GRID[bracket], IRR_BRACKET_GRID[bracket + 1]
+    f_lo = surface[rows, bracket]
+    f_hi = surface[rows, bracket + 1]
+    flows = cash_flows[rows]
+    # Start from the secant point of the bracket
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.where(f_hi != f_lo, lo - f_lo * (hi - lo) / (f_hi - f_lo), (lo + hi) / 2)
+
+    active = np.arange(len(rows))
+    for _ in range(max_iterations):
+        value, slope = _npv_and_slope(flows[active], rate[active])
+        # Keep the bracket around the root
+        same_side = np.sign(value) == np.sign(f_lo[active])
+        lo[active] = np.where(same_side, rate[active], lo[active])
+        f_lo[active] = np.where(same_side, value, f_lo[active])
+        hi[active] = np.where(same_side, hi[active], rate[active])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = rate[active] - value / slope
+        inside = np.isfinite(newton) & (newton > lo[active]) & (newton < hi[active])
+        new_rate = np.where(inside, newton, (lo[active] + hi[active]) / 2)
+        done = (np.abs(new_rate - rate[active]) < tol) | (value == 0)
+        rate[active] = new_rate
+        active = active[~done]
+        if active.size == 0:
+            break
+
+    result[rows] = rate
+    return result
+
+
+def payback_period(cash_flows, rate=0.0):
+    """
+    Periods until cumulative (discounted) cash flow turns non-negative.
+
+    Interpolates within the period in which the balance crosses zero;
+    rate=0 gives the simple payback period.
+
+    Returns:
+        np.ndarray: Payback in periods per project, inf when never recovered
+    """
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    discounted = cash_flows * discount_factors([rate], cash_flows.shape[1])
+    cumulative = np.cumsum(discounted, axis=1)
+    # The last period that is still under water; payback follows it
+    still_negative = cumulative < 0
+    last_negative = cash_flows.shape[1] - 1 - np.argmax(still_negative[:, ::-1], axis=1)
+    never_negative = ~still_negative.any(axis=1)
+    recovers = ~never_negative & (last_negative < cash_flows.shape[1] - 1)
+
+    result = np.full(len(cash_flows), np.inf)
+    result[never_negative] = 0.0
+    rows = np.flatnonzero(recovers)
+    step = last_negative[rows]
+    shortfall = -cumulative[rows, step]
+    result[rows] = step + shortfall / discounted[rows, step + 1]
+    return result
+
+
+def economic_value_added(nopat, capital_employed, wacc):
+    """EVA = NOPAT - WACC x capital employed, broadcast over any array shapes."""
+    return np.asarray(nopat, dtype=np.float64) - np.asarray(wacc, dtype=np.float64) * np.asarray(capital_employed, dtype=np.float64)
+
+# ============================================================================
+# PORTFOLIO VALUATION
+# ============================================================================
+
+def value_projects(cash_flows, project_ids=None, discount_rate=DEFAULT_DISCOUNT_RATE):
+    """
+    Valuation summary per project.
+
+    Args:
+        cash_flows (np.ndarray): (projects x periods) net cash flows
+        project_ids (array-like): Labels, defaults to 0..n-1
+        discount_rate (float): Rate for NPV, discounted payback and PI
+
+    Returns:
+        pd.DataFrame: project_id, npv, irr, payback_period,
+        discounted_payback_period and profitability_index
+    """
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    discounted = cash_flows * discount_factors([discount_rate], cash_flows.shape[1])
+    present_inflows = np.where(discounted > 0, discounted, 0).sum(axis=1)
+    present_outflows = -np.where(discounted < 0, discounted, 0).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        profitability_index = np.where(present_outflows > 0, present_inflows / present_outflows, np.nan)
+
+    return pd.DataFrame({
+        'project_id': np.arange(len(cash_flows)) if project_ids is None else np.asarray(project_ids),
+        'npv': discounted.sum(axis=1),
+        'irr': irr(cash_flows),
+        'payback_period': payback_period(cash_flows),
+        'discounted_payback_period': payback_period(cash_flows, discount_rate),
+        'profitability_index': profitability_index
+    })
+
+
+def value_cash_flow_table(cash_flow_data, discount_rate=DEFAULT_DISCOUNT_RATE, rates=DEFAULT_RATE_GRID):
+    """
+    Valuation summary and NPV sensitivity for the cash flow table.
+
+    Returns:
+        tuple: (per-project summary DataFrame, NPV surface DataFrame with
+        one row per project and one column per discount rate)
+    """
+    project_ids, matrix = build_cash_flow_matrix(cash_flow_data)
+    if len(project_ids) == 0:
+        return pd.DataFrame(), pd.DataFrame()
+    summary = value_projects(matrix, project_ids, discount_rate)
+    surface = pd.DataFrame(npv_surface(matrix, rates), index=project_ids, columns=np.asarray(rates))
+    return summary, surface
@@ -0,0 +1,303 @@
+"""
+Finance Budget Variance Engine
+==============================
+
+Budget vs actual vs forecast over a cost-center hierarchy (division ->
+department -> cost center, or any prefix of it):
+- Budget lines are reduced once into a (hierarchy node x period x
+  measure) cube that holds every subtree total, plus an all-periods
+  column, so any drill level is an array lookup rather than a groupby
+- Node paths and periods are indexed by dicts; children of a node are a
+  slice of a parent-sorted array
+- Editing or posting lines adds the change to the leaf and to each of
+  its ancestors only, along a precomputed ancestor path
+- Amounts are held in integer cents (as fin_ledger does), so incremental
+  updates always match a full rebuild exactly
+
+A positive variance means actual (or forecast) above budget; percentages
+follow safe_calculate_variance and are 0 where the budget is not positive.
+"""
+
+import numpy as np
+import pandas as pd
+
+from fin_ledger import to_cents
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+HIERARCHY_LEVELS = ['division', 'department', 'cost_center']
+MEASURES = ['budget', 'actual', 'forecast']
+TOTAL_NODE = 'Total'
+UNASSIGNED = 'Unassigned'
+
+VARIANCE_COLUMNS = MEASURES + ['variance', 'variance_pct', 'forecast_variance', 'forecast_variance_pct']
+
+
+class VarianceError(Exception):
+    """Raised when budget lines cannot be indexed or a node or period is unknown."""
+
+
+def hierarchy_levels(table):
+    """The HIERARCHY_LEVELS columns present in a table, top level first."""
+    return [level for level in HIERARCHY_LEVELS if level in table.columns]
+
+# ============================================================================
+# VARIANCE CUBE
+# ============================================================================
+
+def _variance_frame(cents):
+    """Measures and variances from an (n, len(MEASURES)) cents array."""
+    amounts = cents / 100.0
+    budget, actual, forecast = amounts[:, 0], amounts[:, 1], amounts[:, 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance_pct = np.where(budget > 0, (actual - budget) / budget * 100, 0.0)
+        forecast_variance_pct = np.where(budget > 0, (forecast - budget) / budget * 100, 0.0)
+    return pd.DataFrame({
+        'budget': budget, 'actual': actual, 'forecast': forecast,
+        'variance': actual - budget, 'variance_pct': variance_pct,
+        'forecast_variance': forecast - budget, 'forecast_variance_pct': forecast_variance_pct
+    })
+
+
+class VarianceCube:
+    """
+    Subtree budget, actual and forecast totals for every hierarchy node
+    and period.
+
+    Nodes are numbered level by level (the total is node 0), so each
+    level is a contiguous id range. Paths are tuples of labels from the
+    top level down; the total is the empty path.
+    """
+
+    def __init__(self, lines, levels=None, period_column='period'):
+        """
+        Args:
+            lines (pd.DataFrame): One row per budget line with the hierarchy
+                columns, the period column and any of 'budget', 'actual' and
+                'forecast' (missing measures count as zero)
+            levels (list): Hierarchy columns top level first, default the
+                HIERARCHY_LEVELS present in lines
+            period_column (str): Period label column
+        """
+        self.levels = hierarchy_levels(lines) if levels is None else list(levels)
+        if not self.levels:
+            raise VarianceError(f"Budget lines need hierarchy columns ({', '.join(HIERARCHY_LEVELS)})")
+        missing = [column for column in self.levels + [period_column] if column not in lines.columns]
+        if missing:
+            raise VarianceError(f"Budget lines are missing columns: {', '.join(missing)}")
+        if not any(measure in lines.columns for measure in MEASURES):
+            raise VarianceError(f"Budget lines need at least one of: {', '.join(MEASURES)}")
+        self.period_column = period_column
+        self.measures = [measure for measure in MEASURES if measure in lines.columns]
+
+        # Node ids, one contiguous range per level in label order. A node's
+        # key is (parent position in its level, label code), packed in an int
+        depth_count = len(self.levels)
+        row_nodes = np.zeros((depth_count + 1, len(lines)), dtype=np.int64)
+        parent = [np.array([-1])]
+        paths = [()]
+        self._level_start = [0]
+        self._level_labels = []
+        self._level_keys = [np.zeros(1, dtype=np.int64)]
+        for depth, level in enumerate(self.levels, start=1):
+            codes, labels = pd.factorize(lines[level].fillna(UNASSIGNED).astype(str), sort=True)
+            keys, positions = np.unique((row_nodes[depth - 1] - self._level_start[-1]) * len(labels) + codes,
+                                        return_inverse=True)
+            start = len(paths)
+            row_nodes[depth] = start + positions
+            parent.append(self._level_start[-1] + keys // len(labels))
+            paths.extend(paths[parent_node] + (labels[code],) for parent_node, code in zip(parent[-1], keys % len(labels)))
+            self._level_start.append(start)
+            self._level_labels.append(pd.Index(labels))
+            self._level_keys.append(keys)
+        self._level_start.append(len(paths))
+        self._parent = np.concatenate(parent)
+        self._paths = paths
+        self._node_index = {path: node for node, path in enumerate(paths)}
+
+        # Ids are in parent order, so a node's children are a contiguous id range
+        self._child_start = np.searchsorted(self._parent, np.arange(len(paths) + 1))
+
+        # Leaf -> ancestor path (total first, leaf last), for incremental roll-ups
+        leaf_start = self._level_start[depth_count]
+        ancestors = np.empty((len(paths) - leaf_start, depth_count + 1), dtype=np.int64)
+        ancestors[:, depth_count] = np.arange(leaf_start, len(paths))
+        for depth in range(depth_count, 0, -1):
+            ancestors[:, depth - 1] = self._parent[ancestors[:, depth]]
+        self._ancestors = ancestors
+
+        # Periods; the extra last column holds all-periods totals
+        period_codes, periods = pd.factorize(lines[period_column].astype(str), sort=True)
+        self.periods = list(periods)
+        self._period_index = {period: position for position, period in enumerate(self.periods)}
+
+        # Leaf cells from the lines, then each level from the one below
+        cell_count = len(self.periods) + 1
+        self._cents = np.zeros((len(paths), cell_count, len(MEASURES)), dtype=np.int64)
+        flat = row_nodes[depth_count] * cell_count + period_codes
+        for position, measure in enumerate(MEASURES):
+            if measure in self.measures:
+                totals = np.bincount(flat, weights=to_cents(lines[measure]), minlength=len(paths) * cell_count)
+                self._cents[:, :, position] = np.rint(totals).astype(np.int64).reshape(len(paths), cell_count)
+        for depth in range(depth_count, 0, -1):
+            nodes = slice(self._level_start[depth], self._level_start[depth + 1])
+            np.add.at(self._cents, self._parent[nodes], self._cents[nodes])
+        self._cents[:, -1, :] = self._cents[:, :-1, :].sum(axis=1)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _path(path):
+        if path is None:
+            return ()
+        return (path,) if isinstance(path, str) else tuple(path)
+
+    def node(self, path):
+        """Node id of a path such as ('Operations', 'IT'); () is the total."""
+        path = self._path(path)
+        node = self._node_index.get(path)
+        if node is None:
+            raise VarianceError(f"Unknown hierarchy node: {' / '.join(path)}")
+        return node
+
+    def _period(self, period):
+        if period is None:
+            return len(self.periods)
+        position = self._period_index.get(str(period))
+        if position is None:
+            raise VarianceError(f"Unknown period: {period}")
+        return position
+
+    def _measure(self, measure):
+        if measure not in MEASURES:
+            raise VarianceError(f"Unknown measure: {measure}")
+        return MEASURES.index(measure)
+
+    def value(self, path=(), period=None, measure='actual'):
+        """One measure of a node for a period, or all periods when period is None."""
+        return int(self._cents[self.node(path), self._period(period), self._measure(measure)]) / 100
+
+    def variance(self, path=(), period=None):
+        """Measures and variances of a node as a dict of VARIANCE_COLUMNS."""
+        cents = self._cents[self.node(path), self._period(period)][np.newaxis, :]
+        return _variance_frame(cents).iloc[0].to_dict()
+
+    def children(self, path=()):
+        """Paths of the nodes directly below a node."""
+        node = self.node(path)
+        return self._paths[self._child_start[node]:self._child_start[node + 1]]
+
+    def drill(self, path=(), period=None):
+        """
+        Variance of each node directly below a node.
+
+        Returns:
+            pd.DataFrame: 'node' label plus VARIANCE_COLUMNS, one row per child
+        """
+        node = self.node(path)
+        children = slice(self._child_start[node], self._child_start[node + 1])
+        frame = _variance_frame(self._cents[children, self._period(period)])
+        frame.insert(0, 'node', [path[-1] for path in self._paths[children]])
+        return frame
+
+    def level(self, depth, period=None):
+        """
+        Variance of every node at one level (1 = top level).
+
+        Returns:
+            pd.DataFrame: The level columns down to depth plus VARIANCE_COLUMNS
+        """
+        if not 1 <= depth <= len(self.levels):
+            raise VarianceError(f"Depth must be between 1 and {len(self.levels)}")
+        nodes = np.arange(self._level_start[depth], self._level_start[depth + 1])
+        frame = _variance_frame(self._cents[nodes, self._period(period)])
+        keys = pd.DataFrame([self._paths[node] for node in nodes], columns=self.levels[:depth])
+        return pd.concat([keys, frame], axis=1)
+
+    def history(self, path=()):
+        """
+        Variance of a node for every period.
+
+        Returns:
+            pd.DataFrame: 'period' plus VARIANCE_COLUMNS, one row per period
+        """
+        frame = _variance_frame(self._cents[self.node(path), :-1])
+        frame.insert(0, 'period', self.periods)
+        return frame
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def _leaf_offset(self, path):
+        node = self.node(path)
+        if node < self._level_start[len(self.levels)]:
+            raise VarianceError(f"Only {self.levels[-1]} cells can be edited, not {' / '.join(self._paths[node]) or TOTAL_NODE}")
+        return node - self._level_start[len(self.levels)]
+
+    def _add_measures(self, measures):
+        self.measures = [measure for measure in MEASURES if measure in self.measures or measure in measures]
+
+    def set_value(self, path, period, measure, amount):
+        """
+        Replace one leaf cell and roll the change up its ancestor path.
+
+        Only single-period cells can be set; the all-periods column is
+        their sum and follows from them.
+
+        Returns:
+            float: The change applied
+        """
+        if period is None:
+            raise VarianceError("A period is required; all-periods totals cannot be edited")
+        ancestors = self._ancestors[self._leaf_offset(path)]
+        position, column = self._period(period), self._measure(measure)
+        delta = int(to_cents(pd.Series([amount]))[0]) - int(self._cents[ancestors[-1], position, column])
+        self._cents[ancestors, position, column] += delta
+        self._cents[ancestors, -1, column] += delta
+        self._add_measures([measure])
+        return delta / 100
+
+    def apply_lines(self, lines):
+        """
+        Add new or adjusting budget lines for existing nodes and periods.
+
+        Each line's amounts are added to its leaf and that leaf's ancestors
+        only; the rest of the cube is untouched.
+
+        Args:
+            lines (pd.DataFrame): Rows in the layout the cube was built from
+        """
+        if lines.empty:
+            return
+        missing = [column for column in self.levels + [self.period_column] if column not in lines.columns]
+        if missing:
+            raise VarianceError(f"Budget lines are missing columns: {', '.join(missing)}")
+        # Walk the levels as the constructor numbered them: position in the
+        # level found by searching the packed (parent, label) keys
+        leaves = np.zeros(len(lines), dtype=np.int64)
+        known = np.ones(len(lines), dtype=bool)
+        for depth, level in enumerate(self.levels, start=1):
+            labels, keys = self._level_labels[depth - 1], self._level_keys[depth]
+            codes = labels.get_indexer(lines[level].fillna(UNASSIGNED).astype(str))
+            wanted = leaves * len(labels) + codes
+            leaves = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+            known &= (codes >= 0) & (keys[leaves] == wanted)
+        positions = pd.Index(self.periods).get_indexer(lines[self.period_column].astype(str))
+        unknown = ~known | (positions < 0)
+        if unknown.any():
+            raise VarianceError(f"{int(unknown.sum())} lines have new nodes or periods; rebuild the cube to add them")
+
+        ancestors = self._ancestors[leaves]
+        depth_count = ancestors.shape[1]
+        for column, measure in enumerate(MEASURES):
+            if measure not in lines.columns:
+                continue
+            cents = np.repeat(to_cents(lines[measure]), depth_count)
+            np.add.at(self._cents[:, :, column], (ancestors.ravel(), np.repeat(positions, depth_count)), cents)
+            np.add.at(self._cents[:, -1, column], ancestors.ravel(), cents)
+        self._add_measures(lines.columns)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the finance data layer
+Checks version tokens, the content-hash fallback, cache hit counting and input-safe preprocessing
+"""
+
+import sys
+import os
+import gc
+import pandas as pd
+import streamlit as st
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from benchmark_fin_data_layer import generate_gl_lines
+from fin_data_layer import (bump_table_version, cache_hit_stats, finance_cache, register_table,
+                            reset_cache_stats, set_table, table_version)
+from fin_forecast_cache import table_fingerprint
+from fin_metrics import preprocess_financial_data
+from fin_predictive import FinancePredictiveAnalytics
+
+
+@finance_cache(ttl=600, max_entries=10)
+def account_count(gl_lines):
+    return gl_lines['account'].nunique()
+
+
+def test_preprocessing_leaves_input_untouched():
+    """Missing amounts are filled in the result only."""
+    gl_lines = generate_gl_lines(20_000)
+    before = gl_lines.copy()
+    cleaned = preprocess_financial_data(gl_lines, ['amount', 'account'])
+    assert gl_lines.equals(before), "preprocess_financial_data mutated its input"
+    assert before['amount'].isna().any() and not cleaned['amount'].isna().any()
+    print("✅ Preprocessing leaves its input untouched")
+
+
+def test_set_and_bump_change_the_token():
+    """set_table and bump_table_version each give the table a new version."""
+    set_table('income_statement', generate_gl_lines(100))
+    first = table_version(st.session_state.income_statement)
+    assert first[0] == 'version'
+    assert table_version(st.session_state.income_statement) == first, "Unchanged table got a new token"
+
+    bump_table_version('income_statement')
+    bumped = table_version(st.session_state.income_statement)
+    set_table('income_statement', generate_gl_lines(100))
+    replaced = table_version(st.session_state.income_statement)
+    assert len({first, bumped, replaced}) == 3
+    print("✅ set_table and bump_table_version change the token")
+
+
+def test_recycled_id_falls_back_to_content_hash():
+    """A frame at a freed registered frame's address is keyed by content, not the old token."""
+    reused = 0
+    for seed in range(50):
+        registered = generate_gl_lines(100, seed)
+        frame_id = id(registered)
+        register_table('gl_lines', registered)
+        del registered
+        gc.collect()
+        fresh = generate_gl_lines(100, seed + 1)
+        reused += id(fresh) == frame_id
+        assert table_version(fresh) == ('content', table_fingerprint(fresh))
+        del fresh
+    print(f"✅ Unregistered frames are keyed by content ({reused} reused an id)")
+
+
+def test_cache_hit_stats_count_calls():
+    """Repeat calls on one version are hits; a new version is computed again."""
+    account_count.clear()
+    reset_cache_stats()
+    gl_lines = generate_gl_lines(1_000)
+    register_table('gl_lines', gl_lines)
+    for _ in range(3):
+        account_count(gl_lines)
+    register_table('gl_lines', gl_lines)
+    account_count(gl_lines)
+
+    stats = cache_hit_stats().set_index('function').loc['account_count']
+    assert (stats['calls'], stats['computed'], stats['hits']) == (4, 2, 2)
+    assert stats['hit_rate'] == 50.0
+    print("✅ Cache hit stats count calls and computations")
+
+
+def test_predictive_analytics_uses_version_tokens():
+    """Forecast cache keys for registered tables are their version tokens."""
+    income_statement = pd.DataFrame({'period': ['2024-01', '2024-02', '2024-03'], 'revenue': [100.0, 110.0, 120.0]})
+    set_table('income_statement', income_statement)
+    empty = pd.DataFrame()
+    analytics = FinancePredictiveAnalytics(income_statement, *[empty] * 8)
+    assert analytics.table_fingerprint('income_statement') == table_version(income_statement)
+    assert analytics.table_fingerprint('income_statement')[0] == 'version'
+    assert analytics.table_fingerprint('cash_flow') == ('content', table_fingerprint(empty))
+    print("✅ Predictive analytics keys tables by version")
+
+
+if __name__ == "__main__":
+    test_preprocessing_leaves_input_untouched()
+    test_set_and_bump_change_the_token()
+    test_recycled_id_falls_back_to_content_hash()
+    test_cache_hit_stats_count_calls()
+    test_predictive_analytics_uses_version_tokens()
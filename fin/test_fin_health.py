@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the finance health scoring engine
+Checks parity with predict_financial_health_score, period order and incremental appends
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from benchmark_fin_health import generate_statements, predictor_scores
+from fin_health import HealthScoreError, HealthScorer, score_components, score_entities
+
+
+def test_scores_match_predictor():
+    """Per-period scores equal predict_financial_health_score entity by entity."""
+    income_statement, balance_sheet, cash_flow, peers = generate_statements(40, 12)
+    components = score_components(income_statement, balance_sheet, cash_flow)
+    sample = peers['entity'].iloc[:10].tolist()
+    expected = predictor_scores(income_statement, balance_sheet, cash_flow, sample)
+    for name in sample:
+        batch = components.loc[components['entity'] == name, 'health_score'].to_numpy()
+        assert np.array_equal(batch, expected[name]), f"Scores for {name} differ from the predictor"
+    print("✅ Scores match predict_financial_health_score")
+
+
+def test_quarter_labels_keep_row_order():
+    """Labels that do not sort chronologically are scored in table order."""
+    periods = ['Q3 2023', 'Q4 2023', 'Q1 2024']
+    income_statement = pd.DataFrame({'entity': 'A', 'period': periods,
+                                     'revenue': [100.0, 120.0, 90.0], 'net_income': [10.0, 12.0, 9.0]})
+    balance_sheet = pd.DataFrame({'entity': 'A', 'period': periods,
+                                  'current_assets': [200.0] * 3, 'current_liabilities': [100.0] * 3})
+    cash_flow = pd.DataFrame({'entity': 'A', 'period': periods, 'operating_cash_flow': [15.0] * 3})
+
+    components = score_components(income_statement, balance_sheet, cash_flow)
+    assert components['period'].tolist() == periods
+    assert np.isnan(components['revenue_growth_pct'].iloc[0])
+    assert np.isclose(components['revenue_growth_pct'].iloc[2], -25.0)
+
+    latest = score_entities(income_statement, balance_sheet, cash_flow)
+    assert latest['period'].tolist() == ['Q1 2024']
+
+    scorer = HealthScorer()
+    scorer.append(*(table.iloc[:2] for table in (income_statement, balance_sheet, cash_flow)))
+    scorer.append(*(table.iloc[2:] for table in (income_statement, balance_sheet, cash_flow)))
+    assert scorer.latest()['period'].tolist() == ['Q1 2024']
+    assert np.isclose(scorer.scores['revenue_growth_pct'].iloc[-1], -25.0)
+    print("✅ Row order is kept for non-sortable period labels")
+
+
+def test_append_matches_full_rescore():
+    """Scoring history then appending a quarter equals scoring everything at once."""
+    income_statement, balance_sheet, cash_flow, peers = generate_statements(300, 8)
+    tables = (income_statement, balance_sheet, cash_flow)
+    full = score_entities(*tables, peers)
+
+    last = income_statement['period'].max()
+    history = [(table['period'] < last).to_numpy() for table in tables]
+    scorer = HealthScorer(peers)
+    scorer.append(*(table[mask] for table, mask in zip(tables, history)))
+    scorer.append(*(table[~mask] for table, mask in zip(tables, history)))
+    incremental = scorer.latest()
+    for column in full.columns:
+        if pd.api.types.is_float_dtype(full[column]):
+            assert np.allclose(full[column], incremental[column], equal_nan=True), f"{column} differs after append"
+        else:
+            assert full[column].equals(incremental[column]), f"{column} differs after append"
+
+    try:
+        scorer.append(*(table[~mask] for table, mask in zip(tables, history)))
+    except HealthScoreError:
+        pass
+    else:
+        raise AssertionError("Appending an already scored period was accepted")
+    print("✅ Appending a quarter matches a full rescore")
+
+
+def test_peer_medians_match_groupby():
+    """Peer-group medians equal a plain groupby of the latest scores."""
+    income_statement, balance_sheet, cash_flow, peers = generate_statements(300, 4)
+    full = score_entities(income_statement, balance_sheet, cash_flow, peers)
+    medians = full.groupby(['industry', 'size_band'])['health_score'].median()
+    expected = medians.reindex(pd.MultiIndex.from_frame(full[['industry', 'size_band']])).to_numpy()
+    assert np.allclose(full['peer_median'], expected)
+    print("✅ Peer medians match a groupby")
+
+
+if __name__ == "__main__":
+    test_scores_match_predictor()
+    test_quarter_labels_keep_row_order()
+    test_append_matches_full_rescore()
+    test_peer_medians_match_groupby()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the general ledger roll-up
+Checks balanced statements, cent-exact totals and incremental month close
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from benchmark_fin_ledger import CHART_OF_ACCOUNTS, generate_journal
+from fin_ledger import GeneralLedgerRollup, to_cents
+from fin_metrics import calculate_financial_performance_metrics, calculate_liquidity_solvency_metrics
+
+
+def month_mask(journal, month):
+    """Journal lines posted in a 'YYYY-MM-01' month."""
+    return (pd.to_datetime(journal['posting_date']).dt.strftime('%Y-%m-01') == month).to_numpy()
+
+
+def test_statements_balance_and_tie_to_journal():
+    """The balance sheet balances and revenue ties to the journal to the cent."""
+    journal = generate_journal(40_000, 4, 6)
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = os.path.join(folder, 'journal.csv')
+        journal.to_csv(csv_path, index=False)
+        rollup = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+        rollup.ingest_file(csv_path, chunk_rows=7_000)
+
+    in_memory = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+    in_memory.ingest(journal)
+    assert rollup.activity_cents().equals(in_memory.activity_cents()), "Chunked and in-memory totals differ"
+    assert rollup.lines_read == len(journal)
+
+    statements = rollup.statements()
+    balance_sheet = statements['balance_sheet']
+    gap = (balance_sheet['total_assets'] - balance_sheet['total_liabilities'] - balance_sheet['shareholder_equity']).abs().max()
+    assert gap < 0.005, f"Balance sheet out by {gap}"
+    journal_revenue = -to_cents(journal.loc[journal['account'] == '4000', 'amount']).sum()
+    assert rollup.activity_cents()['revenue'].sum() == journal_revenue
+    assert rollup.imbalances().empty and rollup.unmapped_accounts().empty
+
+    performance, message = calculate_financial_performance_metrics(statements['income_statement'], balance_sheet)
+    liquidity, _ = calculate_liquidity_solvency_metrics(balance_sheet, statements['cash_flow'])
+    assert not performance.empty and not liquidity.empty, message
+    print("✅ Statements balance and tie to the journal")
+
+
+def test_month_close_matches_full_rollup():
+    """Closing the last month, and re-closing it for one entity, equals a full roll-up."""
+    journal = generate_journal(40_000, 4, 6)
+    full = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+    full.ingest(journal)
+
+    last_month = full.periods[-1]
+    in_last_month = month_mask(journal, last_month)
+    incremental = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+    incremental.ingest(journal[~in_last_month])
+    incremental.close_month(journal[in_last_month])
+    assert incremental.activity_cents().equals(full.activity_cents()), "Month close differs from a full roll-up"
+
+    first_entity = full.entities[0]
+    entity_month = in_last_month & (journal['entity'] == first_entity).to_numpy()
+    for _ in range(2):
+        incremental.close_month(journal[entity_month])
+    assert incremental.entities == full.entities, "Re-close dropped entities"
+    assert incremental.activity_cents().equals(full.activity_cents()), "Re-close changed other entities"
+    assert incremental.lines_read == full.lines_read, "Re-close double-counted journal lines"
+    print("✅ Month close matches a full roll-up")
+
+
+def test_reclose_replaces_unmapped_totals():
+    """Unmapped accounts are replaced, not added, when a month is closed again."""
+    journal = pd.DataFrame({
+        'posting_date': ['2024-01-05'] * 4,
+        'entity': ['A', 'A', 'B', 'B'],
+        'account': ['9999', '1000', '9999', '1000'],
+        'amount': [-7.0, 7.0, -7.0, 7.0]
+    })
+    rollup = GeneralLedgerRollup(CHART_OF_ACCOUNTS)
+    rollup.ingest(journal)
+    for _ in range(2):
+        rollup.close_month(journal[journal['entity'] == 'A'])
+    assert rollup.entities == ['A', 'B']
+    assert np.isclose(rollup.unmapped_accounts()['9999'], -14.0)
+    assert rollup.lines_read == 4
+    print("✅ Re-closing replaces unmapped totals")
+
+
+if __name__ == "__main__":
+    test_statements_balance_and_tie_to_journal()
+    test_month_close_matches_full_rollup()
+    test_reclose_replaces_unmapped_totals()
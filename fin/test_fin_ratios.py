@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script for the finance ratio engine
+Checks statement alignment and parity with calculate_efficiency_metrics
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from benchmark_fin_ratios import generate_statements
+from fin_metrics import calculate_efficiency_metrics
+from fin_ratios import ratio_panel
+
+
+def test_join_order_does_not_change_ratios():
+    """A shuffled balance sheet gives the same panel as an aligned one."""
+    income_statement, balance_sheet = generate_statements(50, 24)
+    panel = ratio_panel(income_statement, balance_sheet)
+    shuffled = ratio_panel(income_statement, balance_sheet.sample(frac=1.0, random_state=7))
+    assert len(panel) == len(income_statement) * panel['ratio'].nunique()
+    assert shuffled['value'].equals(panel['value'])
+    print("✅ Join order does not change the ratios")
+
+
+def test_panel_matches_efficiency_metrics():
+    """ROA and ROE for one entity equal calculate_efficiency_metrics."""
+    income_statement, balance_sheet = generate_statements(5, 24)
+    panel = ratio_panel(income_statement, balance_sheet)
+    first_entity = income_statement['entity'].iloc[0]
+    efficiency, _ = calculate_efficiency_metrics(income_statement[income_statement['entity'] == first_entity],
+                                                 balance_sheet[balance_sheet['entity'] == first_entity])
+    for ratio in ('roa_pct', 'roe_pct'):
+        values = panel[(panel['entity'] == first_entity) & (panel['ratio'] == ratio)]['value'].to_numpy()
+        assert np.allclose(values, efficiency[ratio].to_numpy()), f"{ratio} differs"
+    print("✅ Panel matches calculate_efficiency_metrics")
+
+
+def test_entity_column_on_one_side_aligns_on_period():
+    """Without an entity column on both tables, rows match on period alone."""
+    income_statement, balance_sheet = generate_statements(1, 12)
+    expected = ratio_panel(income_statement, balance_sheet, tidy=False)
+    for income, balance in ((income_statement, balance_sheet.drop(columns='entity')),
+                            (income_statement.drop(columns='entity'), balance_sheet)):
+        wide = ratio_panel(income, balance, tidy=False)
+        assert len(wide) == len(expected)
+        assert np.allclose(wide['roa_pct'], expected['roa_pct'])
+
+    efficiency, _ = calculate_efficiency_metrics(income_statement, balance_sheet.drop(columns='entity'))
+    assert len(efficiency) == len(income_statement)
+    print("✅ Period-only alignment verified")
+
+
+if __name__ == "__main__":
+    test_join_order_does_not_change_ratios()
+    test_panel_matches_efficiency_metrics()
+    test_entity_column_on_one_side_aligns_on_period()
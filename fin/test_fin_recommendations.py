@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for the finance recommendation engine
+Checks that shared-context and cached page recommendations match the per-section calls
+"""
+
+import sys
+import os
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from benchmark_fin_recommendations import cached_page_renders, enlarge, per_section_calls
+from fin_data_layer import FINANCE_TABLES, set_table
+from fin_data_utils import generate_sample_finance_data, initialize_session_state
+from fin_recommendations import FinanceContext, RECOMMENDATION_RULES, generate_recommendations
+
+
+def load_tables(n_rows):
+    """Sample tables repeated to n_rows, stored in the session."""
+    initialize_session_state()
+    tables = enlarge(generate_sample_finance_data(), n_rows)
+    for name in FINANCE_TABLES:
+        set_table(name, tables[name])
+    return tables
+
+
+def test_shared_context_matches_per_section_calls():
+    """Every rule set gives the same text from one context as from its own entry point."""
+    tables = load_tables(500)
+    individual = per_section_calls(tables, 1)
+    batch = generate_recommendations(FinanceContext(**tables))
+    assert set(batch) == set(RECOMMENDATION_RULES)
+    for name, text in individual.items():
+        assert batch[name] == text, f"{name} differs between per-section and shared evaluation"
+    print(f"✅ {len(individual)} rule sets match their entry points")
+
+
+def test_cached_pages_match_shared_context():
+    """Cached page renders serve the shared-context text, before and after a table changes."""
+    tables = load_tables(500)
+    batch = generate_recommendations(FinanceContext(**tables))
+    for _ in range(2):
+        cached = cached_page_renders(1)
+        assert all(cached[name] == batch[name] for name in cached), "Cached pages changed the text"
+
+    tables = load_tables(800)
+    batch = generate_recommendations(FinanceContext(**tables))
+    cached = cached_page_renders(1)
+    assert all(cached[name] == batch[name] for name in cached), "Cached pages kept stale text"
+    print("✅ Cached pages match the shared context")
+
+
+if __name__ == "__main__":
+    test_shared_context_matches_per_section_calls()
+    test_cached_pages_match_shared_context()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test script for the finance investment valuation engine
+Checks IRR roots, including exact zeros and cash flows without a root
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from fin_valuation import irr, npv
+
+
+def test_irr_zeroes_npv():
+    """IRR solves NPV = 0 for ordinary and mixed-sign projects."""
+    rng = np.random.default_rng(3)
+    cash_flows = np.column_stack([-rng.uniform(50, 150, 200), rng.uniform(5, 40, (200, 8))])
+    rates = irr(cash_flows)
+    assert np.isfinite(rates).all()
+    values = np.array([npv(row[np.newaxis, :], rate)[0] for row, rate in zip(cash_flows, rates)])
+    assert np.allclose(values, 0, atol=1e-6)
+    assert np.isclose(irr([[-100, 0, 121]])[0], 0.1)
+    print("✅ IRR zeroes NPV")
+
+
+def test_irr_exact_zeros_and_degenerate_rows():
+    """Grid rates with NPV exactly zero are roots; all-zero rows have none."""
+    rates = irr([[-100, 50, 50], [-100, 110, 0], [0, 0, 0], [100, 10, 10], [0, 0, 0]])
+    assert rates[0] == 0.0
+    assert np.isclose(rates[1], 0.1)
+    assert np.isnan(rates[2:]).all()
+    print("✅ Exact roots and rows without a sign change verified")
+
+
+if __name__ == "__main__":
+    test_irr_zeroes_npv()
+    test_irr_exact_zeros_and_degenerate_rows()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for the finance budget variance engine
+Checks cube totals against a groupby and incremental edits against a rebuild
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from benchmark_fin_variance import generate_budget_lines
+from fin_variance import MEASURES, VarianceCube, VarianceError
+
+
+def test_cube_levels_match_groupby():
+    """Every level and drill-down equals summing the budget lines."""
+    lines = generate_budget_lines(20_000, 300, 6)
+    cube = VarianceCube(lines)
+
+    for depth in range(1, len(cube.levels) + 1):
+        level = cube.level(depth)
+        grouped = lines.groupby(cube.levels[:depth])[MEASURES].sum().reset_index()
+        merged = level.merge(grouped, on=cube.levels[:depth], suffixes=('', '_lines'))
+        assert len(merged) == len(grouped) == len(level)
+        for measure in MEASURES:
+            assert np.allclose(merged[measure], merged[f"{measure}_lines"]), f"{measure} differs at depth {depth}"
+
+    period = cube.periods[-1]
+    division = cube.children()[0]
+    in_division = lines[(lines['division'] == division[0]) & (lines['period'] == period)]
+    drill = cube.drill(division, period).set_index('node')
+    expected = in_division.groupby('department')['actual'].sum()
+    assert np.allclose(drill.loc[expected.index, 'actual'], expected)
+    print("✅ Cube levels match a groupby")
+
+
+def test_incremental_edits_match_rebuild():
+    """Posting lines and setting a cell equals rebuilding from all lines."""
+    lines = generate_budget_lines(20_000, 300, 6)
+    cube = VarianceCube(lines)
+    rng = np.random.default_rng(7)
+
+    edits = lines.sample(500, random_state=11).copy()
+    edits[MEASURES] = np.round(rng.normal(0, 1_000, (len(edits), len(MEASURES))), 2)
+    cube.apply_lines(edits)
+    leaf = cube.children(cube.children(cube.children()[0])[0])[0]
+    period = cube.periods[-1]
+    cube.set_value(leaf, period, 'budget', 12_345.67)
+
+    rebuilt = VarianceCube(pd.concat([lines, edits], ignore_index=True))
+    rebuilt.set_value(leaf, period, 'budget', 12_345.67)
+    assert cube.value(leaf, period, 'budget') == 12_345.67
+    for period_label in cube.periods + [None]:
+        for depth in range(1, len(cube.levels) + 1):
+            assert cube.level(depth, period_label).equals(rebuilt.level(depth, period_label)), \
+                "Incremental roll-up differs from a rebuild"
+    print("✅ Incremental edits match a rebuild")
+
+
+def test_set_value_requires_a_period():
+    """The all-periods column is derived and cannot be set directly."""
+    cube = VarianceCube(generate_budget_lines(2_000, 50, 3))
+    leaf = cube.children(cube.children(cube.children()[0])[0])[0]
+    total = cube.value((), None, 'budget')
+    try:
+        cube.set_value(leaf, None, 'budget', 100.0)
+    except VarianceError:
+        pass
+    else:
+        raise AssertionError("set_value accepted period=None")
+    assert cube.value((), None, 'budget') == total
+    print("✅ All-periods cells are read-only")
+
+
+if __name__ == "__main__":
+    test_cube_levels_match_groupby()
+    test_incremental_edits_match_rebuild()
+    test_set_value_requires_a_period()
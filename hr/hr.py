@@ -2212,73 +2212,54 @@ def calculate_onboarding_effectiveness(employees_df, engagement_df):
         # Simulate days employed if hire_date is not available
         merged_data['days_employed'] = merged_data['employee_id'].astype(str).str[-3:].astype(int) * 10
     
-    # Calculate onboarding effectiveness metrics
-    onboarding_data = []
-    
-    for dept in merged_data['department'].unique():
-        dept_data = merged_data[merged_data['department'] == dept]
-        
-        # Calculate average engagement by employment duration groups
-        duration_groups = {
-            '0-30 days': (0, 30),
-            '31-90 days': (31, 90),
-            '91-180 days': (91, 180),
-            '181-365 days': (181, 365),
-            '1+ years': (366, float('inf'))
-        }
-        
-        for group_name, (min_days, max_days) in duration_groups.items():
-            group_data = dept_data[
-                (dept_data['days_employed'] >= min_days) & 
-                (dept_data['days_employed'] <= max_days)
-            ]
-            
-            if not group_data.empty:
-                avg_engagement = group_data['engagement_score'].mean()
-                employee_count = len(group_data)
-                
-                # Calculate retention risk based on engagement and employment duration
-                if avg_engagement < 3.0 and group_data['days_employed'].mean() < 90:
-                    retention_risk = "High"
-                elif avg_engagement < 4.0 and group_data['days_employed'].mean() < 180:
-                    retention_risk = "Medium"
-                else:
-                    retention_risk = "Low"
-                
-                onboarding_data.append({
-                    'employee_id': group_data['employee_id'].iloc[0],  # Representative employee
-                    'department': dept,
-                    'job_title': group_data['job_title'].iloc[0],
-                    'performance_rating': group_data.get('performance_rating', 3.0).iloc[0] if 'performance_rating' in group_data.columns else 3.0,
-                    'retention_risk': retention_risk,
-                    'engagement_score': avg_engagement,
-                    'days_employed': group_data['days_employed'].mean(),
-                    'employee_count': employee_count
-                })
+    # Calculate onboarding effectiveness metrics by department and employment duration group
+    # (inclusive day ranges 0-30, 31-90, 91-180, 181-365 and 366+)
+    duration_labels = ['0-30 days', '31-90 days', '91-180 days', '181-365 days', '1+ years']
+    duration_group = pd.cut(merged_data['days_employed'], bins=[-1, 30, 90, 180, 365, np.inf],
+                            labels=duration_labels)
+    department = pd.Categorical(merged_data['department'], categories=merged_data['department'].dropna().unique())
+    has_performance = 'performance_rating' in merged_data.columns
+    
+    grouped = merged_data.groupby([department, duration_group], observed=True, sort=True)
+    group_stats = grouped.agg(
+        engagement_score=('engagement_score', 'mean'),
+        days_employed=('days_employed', 'mean'),
+        employee_count=('employee_id', 'size')
+    )
+    # Representative employee is the first row of each group
+    first_rows = grouped.cumcount().to_numpy() == 0
+    representative_keys = pd.MultiIndex.from_arrays([department[first_rows], duration_group[first_rows]])
+    representatives = merged_data[first_rows].set_axis(representative_keys).reindex(group_stats.index)
+    
+    onboarding_df = pd.DataFrame({
+        'employee_id': representatives['employee_id'].to_numpy(),
+        'department': group_stats.index.get_level_values(0).astype(object),
+        'job_title': representatives['job_title'].to_numpy(),
+        'performance_rating': representatives['performance_rating'].to_numpy() if has_performance else 3.0,
+        'engagement_score': group_stats['engagement_score'].to_numpy(),
+        'days_employed': group_stats['days_employed'].to_numpy(),
+        'employee_count': group_stats['employee_count'].to_numpy()
+    })
     
     # If no grouped data, create individual employee records
-    if not onboarding_data:
-        for _, employee in merged_data.iterrows():
-            # Calculate retention risk
-            if employee['engagement_score'] < 3.0 and employee['days_employed'] < 90:
-                retention_risk = "High"
-            elif employee['engagement_score'] < 4.0 and employee['days_employed'] < 180:
-                retention_risk = "Medium"
-            else:
-                retention_risk = "Low"
-            
-            onboarding_data.append({
-                'employee_id': employee['employee_id'],
-                'department': employee['department'],
-                'job_title': employee['job_title'],
-                'performance_rating': employee.get('performance_rating', 3.0) if 'performance_rating' in employee else 3.0,
-                'retention_risk': retention_risk,
-                'engagement_score': employee['engagement_score'],
-                'days_employed': employee['days_employed']
-            })
-    
-    # Convert to DataFrame
-    onboarding_df = pd.DataFrame(onboarding_data)
+    if onboarding_df.empty:
+        onboarding_df = pd.DataFrame({
+            'employee_id': merged_data['employee_id'],
+            'department': merged_data['department'],
+            'job_title': merged_data['job_title'],
+            'performance_rating': merged_data['performance_rating'] if has_performance else 3.0,
+            'engagement_score': merged_data['engagement_score'],
+            'days_employed': merged_data['days_employed']
+        }).reset_index(drop=True)
+    
+    # Retention risk based on engagement and employment duration
+    if not onboarding_df.empty:
+        onboarding_df.insert(4, 'retention_risk', np.select(
+            [(onboarding_df['engagement_score'] < 3.0) & (onboarding_df['days_employed'] < 90),
+             (onboarding_df['engagement_score'] < 4.0) & (onboarding_df['days_employed'] < 180)],
+            ['High', 'Medium'],
+            default='Low'
+        ))
     
     # Calculate overall onboarding effectiveness
     if not onboarding_df.empty:
@@ -34,6 +34,9 @@ except ImportError:
     ML_AVAILABLE = False
     st.warning("⚠️ Advanced ML features require sklearn. Some predictive features may be limited.")
 
+from utils.feature_store import get_feature_store, TURNOVER_BLOCKS, PERFORMANCE_BLOCKS
+from utils.model_registry import get_model_registry
+
 class HRPredictiveAnalytics:
     """Advanced HR Predictive Analytics with Machine Learning capabilities."""
     
@@ -901,7 +904,7 @@ class HRPredictiveAnalytics:
         return True
     
     def _build_turnover_model(self, employees_df, performance_df, engagement_df, turnover_df):
-        """Build and train turnover prediction model."""
+        """Build and train turnover prediction model (reused from the model registry when unchanged)."""
         try:
             # Prepare features
             features = self._prepare_turnover_features(employees_df, performance_df, engagement_df, turnover_df)
@@ -912,35 +915,45 @@ class HRPredictiveAnalytics:
             # Split features and target
             X = features.drop('turnover_risk', axis=1)
             y = features['turnover_risk']
+            params = {'n_estimators': 100, 'random_state': 42, 'test_size': 0.3}
             
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-            
-            # Scale features
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-            
-            # Train Random Forest model
-            rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
-            rf_model.fit(X_train_scaled, y_train)
-            
-            # Evaluate model
-            y_pred = rf_model.predict(X_test_scaled)
-            accuracy = accuracy_score(y_test, y_pred)
-            precision = precision_score(y_test, y_pred, average='weighted')
-            recall = recall_score(y_test, y_pred, average='weighted')
-            f1 = f1_score(y_test, y_pred, average='weighted')
+            def train():
+                # Split data
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+                
+                # Scale features
+                scaler = StandardScaler()
+                X_train_scaled = scaler.fit_transform(X_train)
+                X_test_scaled = scaler.transform(X_test)
+                
+                # Train Random Forest model
+                rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
+                rf_model.fit(X_train_scaled, y_train)
+                
+                # Evaluate model
+                y_pred = rf_model.predict(X_test_scaled)
+                return {
+                    'model': rf_model,
+                    'scaler': scaler,
+                    'metrics': {
+                        'accuracy': accuracy_score(y_test, y_pred),
+                        'precision': precision_score(y_test, y_pred, average='weighted'),
+                        'recall': recall_score(y_test, y_pred, average='weighted'),
+                        'f1_score': f1_score(y_test, y_pred, average='weighted')
+                    }
+                }
+            
+            artifact = get_model_registry().get_or_train(
+                'predictive_turnover', features.attrs.get('feature_version', ''), params, train, list(X.columns)
+            )
+            if artifact is None:
+                return False
             
             # Store model and results
-            self.models['turnover_prediction'] = rf_model
-            self.scalers['turnover'] = self.scaler
-            self.feature_importance['turnover'] = dict(zip(X.columns, rf_model.feature_importances_))
-            self.model_performance['turnover'] = {
-                'accuracy': accuracy,
-                'precision': precision,
-                'recall': recall,
-                'f1_score': f1
-            }
+            self.models['turnover_prediction'] = artifact['model']
+            self.scalers['turnover'] = artifact['scaler']
+            self.feature_importance['turnover'] = dict(zip(X.columns, artifact['model'].feature_importances_))
+            self.model_performance['turnover'] = artifact['metrics']
             
             return True
             
@@ -949,51 +962,17 @@ class HRPredictiveAnalytics:
             return False
     
     def _prepare_turnover_features(self, employees_df, performance_df, engagement_df, turnover_df):
-        """Prepare features for turnover prediction."""
+        """Prepare features for turnover prediction from the shared feature store."""
         try:
-            # Create turnover labels
-            turnover_employees = set(turnover_df['employee_id'].unique())
-            
-            # Start with employee base features
-            features = employees_df.copy()
-            features['turnover_risk'] = features['employee_id'].map(
-                lambda x: 1 if x in turnover_employees else 0
+            matrix = get_feature_store().get_features(
+                employees_df, performance_df, engagement_df, turnover_df=turnover_df
             )
+            if matrix is None:
+                return None
             
-            # Add performance metrics
-            if not performance_df.empty:
-                perf_agg = performance_df.groupby('employee_id').agg({
-                    'performance_rating': ['mean', 'std', 'count'],
-                    'goal_achievement_rate': 'mean',
-                    'productivity_score': 'mean'
-                }).round(3)
-                
-                perf_agg.columns = ['perf_rating_mean', 'perf_rating_std', 'perf_review_count', 
-                                  'goal_achievement_mean', 'productivity_mean']
-                
-                features = features.merge(perf_agg, left_on='employee_id', right_index=True, how='left')
-            
-            # Add engagement metrics
-            if not engagement_df.empty:
-                eng_agg = engagement_df.groupby('employee_id').agg({
-                    'engagement_score': ['mean', 'std'],
-                    'satisfaction_score': 'mean',
-                    'work_life_balance_score': 'mean'
-                }).round(3)
-                
-                eng_agg.columns = ['engagement_mean', 'engagement_std', 'satisfaction_mean', 'wlb_mean']
-                features = features.merge(eng_agg, left_on='employee_id', right_index=True, how='left')
-            
-            # Encode categorical variables
-            categorical_cols = ['department', 'gender', 'ethnicity', 'education_level']
-            for col in categorical_cols:
-                if col in features.columns:
-                    features[f'{col}_encoded'] = pd.Categorical(features[col]).codes
-            
-            # Select numeric features
-            numeric_cols = features.select_dtypes(include=[np.number]).columns
-            features = features[numeric_cols].fillna(0)
-            
+            features = matrix.to_frame(TURNOVER_BLOCKS)
+            features['turnover_risk'] = matrix.targets['turnover_risk']
+            features.attrs['feature_version'] = matrix.version
             return features
             
         except Exception as e:
@@ -1411,7 +1390,7 @@ class HRPredictiveAnalytics:
                 """)
     
     def _build_performance_model(self, employees_df, performance_df, engagement_df):
-        """Build performance prediction model."""
+        """Build performance prediction model (reused from the model registry when unchanged)."""
         try:
             # Prepare features for performance prediction
             features = self._prepare_performance_features(employees_df, performance_df, engagement_df)
@@ -1422,32 +1401,45 @@ class HRPredictiveAnalytics:
             # Split features and target
             X = features.drop('performance_target', axis=1)
             y = features['performance_target']
+            params = {'n_estimators': 100, 'random_state': 42, 'test_size': 0.3}
             
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-            
-            # Scale features
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-            
-            # Train Gradient Boosting model
-            gb_model = GradientBoostingRegressor(n_estimators=100, random_state=42)
-            gb_model.fit(X_train_scaled, y_train)
-            
-            # Evaluate model
-            y_pred = gb_model.predict(X_test_scaled)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
+            def train():
+                # Split data
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+                
+                # Scale features
+                scaler = StandardScaler()
+                X_train_scaled = scaler.fit_transform(X_train)
+                X_test_scaled = scaler.transform(X_test)
+                
+                # Train Gradient Boosting model
+                gb_model = GradientBoostingRegressor(n_estimators=100, random_state=42)
+                gb_model.fit(X_train_scaled, y_train)
+                
+                # Evaluate model
+                y_pred = gb_model.predict(X_test_scaled)
+                mse = mean_squared_error(y_test, y_pred)
+                return {
+                    'model': gb_model,
+                    'scaler': scaler,
+                    'metrics': {
+                        'mse': mse,
+                        'r2_score': r2_score(y_test, y_pred),
+                        'rmse': np.sqrt(mse)
+                    }
+                }
+            
+            artifact = get_model_registry().get_or_train(
+                'predictive_performance', features.attrs.get('feature_version', ''), params, train, list(X.columns)
+            )
+            if artifact is None:
+                return False
             
             # Store model and results
-            self.models['performance_prediction'] = gb_model
-            self.scalers['performance'] = self.scaler
-            self.feature_importance['performance'] = dict(zip(X.columns, gb_model.feature_importances_))
-            self.model_performance['performance'] = {
-                'mse': mse,
-                'r2_score': r2,
-                'rmse': np.sqrt(mse)
-            }
+            self.models['performance_prediction'] = artifact['model']
+            self.scalers['performance'] = artifact['scaler']
+            self.feature_importance['performance'] = dict(zip(X.columns, artifact['model'].feature_importances_))
+            self.model_performance['performance'] = artifact['metrics']
             
             return True
             
@@ -1456,43 +1448,16 @@ class HRPredictiveAnalytics:
             return False
     
     def _prepare_performance_features(self, employees_df, performance_df, engagement_df):
-        """Prepare features for performance prediction."""
+        """Prepare features for performance prediction from the shared feature store."""
         try:
-            # Get latest performance rating for each employee
-            latest_perf = performance_df.sort_values('review_date').groupby('employee_id').last()
-            
-            # Start with employee base features
-            features = employees_df.copy()
-            
-            # Add performance target
-            features = features.merge(
-                latest_perf[['performance_rating']].rename(columns={'performance_rating': 'performance_target'}),
-                left_on='employee_id',
-                right_index=True,
-                how='left'
-            )
-            
-            # Add engagement metrics
-            if not engagement_df.empty:
-                eng_agg = engagement_df.groupby('employee_id').agg({
-                    'engagement_score': ['mean', 'std'],
-                    'satisfaction_score': 'mean',
-                    'work_life_balance_score': 'mean'
-                }).round(3)
-                
-                eng_agg.columns = ['engagement_mean', 'engagement_std', 'satisfaction_mean', 'wlb_mean']
-                features = features.merge(eng_agg, left_on='employee_id', right_index=True, how='left')
-            
-            # Encode categorical variables
-            categorical_cols = ['department', 'gender', 'ethnicity', 'education_level']
-            for col in categorical_cols:
-                if col in features.columns:
-                    features[f'{col}_encoded'] = pd.Categorical(features[col]).codes
-            
-            # Select numeric features
-            numeric_cols = features.select_dtypes(include=[np.number]).columns
-            features = features[numeric_cols].fillna(0)
-            
+            matrix = get_feature_store().get_features(employees_df, performance_df, engagement_df)
+            if matrix is None:
+                return None
+            
+            features = matrix.to_frame(PERFORMANCE_BLOCKS)
+            # Employees without a review keep a zero target, as before
+            features['performance_target'] = np.nan_to_num(matrix.targets['performance_target'])
+            features.attrs['feature_version'] = matrix.version
             return features
             
         except Exception as e:
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared HR employee feature store
+Checks aggregate parity, float32 layout, caching and incremental rebuilds
+"""
+
+import sys
+import os
+import pandas as pd
+import numpy as np
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from utils.feature_store import HRFeatureStore, TURNOVER_BLOCKS, INSIGHT_BLOCKS
+
+
+def create_sample_tables(n_employees=60, seed=7):
+    """Create small employee, performance, engagement and compensation tables."""
+    rng = np.random.default_rng(seed)
+    employee_ids = [f'EMP{i+1:03d}' for i in range(n_employees)]
+    employees_df = pd.DataFrame({
+        'employee_id': employee_ids,
+        'department': rng.choice(['Engineering', 'Sales', 'HR'], n_employees),
+        'gender': rng.choice(['Male', 'Female'], n_employees),
+        'salary': rng.integers(40000, 150000, n_employees),
+        'age': rng.integers(22, 65, n_employees)
+    })
+    performance_df = pd.DataFrame({
+        'employee_id': rng.choice(employee_ids, 150),
+        'review_date': pd.date_range('2024-01-01', periods=150, freq='D').strftime('%Y-%m-%d'),
+        'performance_rating': rng.uniform(2.0, 5.0, 150).round(1),
+        'goal_achievement_rate': rng.uniform(0.5, 1.2, 150).round(2),
+        'productivity_score': rng.uniform(60, 100, 150).round(1)
+    })
+    engagement_df = pd.DataFrame({
+        'employee_id': rng.choice(employee_ids, 120),
+        'engagement_score': rng.uniform(1.0, 5.0, 120).round(1),
+        'satisfaction_score': rng.uniform(1.0, 5.0, 120).round(1),
+        'work_life_balance_score': rng.uniform(1.0, 5.0, 120).round(1)
+    })
+    compensation_df = pd.DataFrame({
+        'employee_id': rng.choice(employee_ids, 80),
+        'base_salary': rng.integers(40000, 150000, 80),
+        'bonus_amount': rng.integers(0, 20000, 80),
+        'total_compensation': rng.integers(50000, 180000, 80)
+    })
+    turnover_df = pd.DataFrame({'employee_id': employee_ids[:5]})
+    return employees_df, performance_df, engagement_df, compensation_df, turnover_df
+
+
+def test_feature_matrix_layout():
+    """Feature matrix is float32 and matches direct groupby aggregates."""
+    employees_df, performance_df, engagement_df, compensation_df, turnover_df = create_sample_tables()
+    store = HRFeatureStore()
+    matrix = store.get_features(employees_df, performance_df, engagement_df, compensation_df, turnover_df)
+
+    assert matrix.values.dtype == np.float32
+    assert matrix.values.shape == (len(employees_df), len(matrix.columns))
+
+    frame = matrix.to_frame(INSIGHT_BLOCKS)
+    expected = (performance_df.groupby('employee_id')['performance_rating'].mean().round(3)
+                .reindex(employees_df['employee_id']).fillna(0).to_numpy())
+    assert np.allclose(frame['perf_rating_mean'].to_numpy(), expected, atol=1e-4)
+    assert frame.columns[-1].endswith('_encoded')
+    assert 'salary_mean' not in matrix.columns_for(TURNOVER_BLOCKS)
+
+    assert matrix.targets['turnover_risk'].sum() == 5
+    print("✅ Feature matrix layout and aggregates verified")
+
+
+def test_feature_store_caching():
+    """Identical tables reuse the cached matrix; one changed table rebuilds one block."""
+    employees_df, performance_df, engagement_df, compensation_df, turnover_df = create_sample_tables()
+    store = HRFeatureStore()
+    first = store.get_features(employees_df, performance_df, engagement_df, compensation_df, turnover_df)
+    second = store.get_features(employees_df.copy(), performance_df, engagement_df, compensation_df, turnover_df)
+
+    assert first is second
+    assert store.stats['matrix_hits'] == 1
+    builds_before = store.stats['block_builds']
+
+    changed_engagement = engagement_df.copy()
+    changed_engagement.loc[0, 'engagement_score'] = 5.0
+    third = store.get_features(employees_df, performance_df, changed_engagement, compensation_df, turnover_df)
+
+    assert third.version != first.version
+    assert store.stats['block_builds'] == builds_before + 1
+    print("✅ Feature store caching and incremental rebuild verified")
+
+
+if __name__ == "__main__":
+    test_feature_matrix_layout()
+    test_feature_store_caching()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script for the HR model registry
+Checks persistence, reuse and stale-while-retraining behaviour
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+import numpy as np
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from sklearn.linear_model import LinearRegression
+
+from utils.model_registry import ModelRegistry
+
+
+def make_trainer(slope, calls):
+    """Return a train function fitting y = slope * x and counting invocations."""
+    def train():
+        calls.append(slope)
+        X = np.arange(20, dtype=float).reshape(-1, 1)
+        model = LinearRegression().fit(X, slope * X.ravel())
+        return {'model': model, 'metrics': {'slope': slope}}
+    return train
+
+
+def test_registry_reuses_and_persists_models():
+    """Same key is served from memory, and from disk after a restart."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        calls = []
+        registry = ModelRegistry(root_dir)
+        first = registry.get_or_train('demo', 'v1', {'alpha': 1}, make_trainer(2.0, calls), ['x'])
+        second = registry.get_or_train('demo', 'v1', {'alpha': 1}, make_trainer(2.0, calls), ['x'])
+
+        assert calls == [2.0]
+        assert first['stale'] is False and second['stale'] is False
+        assert registry.stats['memory_hits'] == 1
+
+        restarted = ModelRegistry(root_dir)
+        loaded = restarted.get_or_train('demo', 'v1', {'alpha': 1}, make_trainer(2.0, calls), ['x'])
+        assert calls == [2.0]
+        assert restarted.stats['disk_hits'] == 1
+        assert np.isclose(loaded['model'].coef_[0], 2.0)
+    print("✅ Model registry reuse and persistence verified")
+
+
+def test_registry_serves_previous_model_while_retraining():
+    """New data version serves the previous model until the background fit finishes."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        calls = []
+        registry = ModelRegistry(root_dir)
+        registry.get_or_train('demo', 'v1', {'alpha': 1}, make_trainer(2.0, calls), ['x'])
+
+        stale = registry.get_or_train('demo', 'v2', {'alpha': 1}, make_trainer(3.0, calls), ['x'])
+        assert stale['stale'] is True
+        assert stale['metrics']['slope'] == 2.0
+
+        registry.wait(timeout=30)
+        fresh = registry.get_or_train('demo', 'v2', {'alpha': 1}, make_trainer(3.0, calls), ['x'])
+        assert fresh['stale'] is False
+        assert fresh['metrics']['slope'] == 3.0
+        assert calls == [2.0, 3.0]
+
+        # A changed feature layout cannot reuse the old estimator
+        changed = registry.get_or_train('demo', 'v3', {'alpha': 1}, make_trainer(4.0, calls), ['x', 'y'])
+        assert changed['stale'] is False
+        assert changed['metrics']['slope'] == 4.0
+    print("✅ Stale-while-retraining behaviour verified")
+
+
+def test_registry_evicts_least_recently_used_artifacts():
+    """Artifacts beyond max_artifacts are dropped from memory and disk, least recently used first."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        calls = []
+        registry = ModelRegistry(root_dir, max_artifacts=2)
+        registry.get_or_train('first', 'v1', {}, make_trainer(1.0, calls), ['x'])
+        registry.get_or_train('second', 'v1', {}, make_trainer(2.0, calls), ['x'])
+        # Using the first model makes the second the least recently used
+        registry.get_or_train('first', 'v1', {}, make_trainer(1.0, calls), ['x'])
+        registry.get_or_train('third', 'v1', {}, make_trainer(3.0, calls), ['x'])
+
+        files = sorted(f for f in os.listdir(root_dir) if f.endswith('.joblib'))
+        assert files == sorted(ModelRegistry.make_key(name, 'v1', {}) + '.joblib' for name in ('first', 'third'))
+        assert registry.stats['evicted'] == 1
+
+        # A new data version replaces the old one once it is the least recently used
+        registry.get_or_train('third', 'v2', {}, make_trainer(4.0, calls), ['x'])
+        registry.wait(timeout=30)
+        assert ModelRegistry.make_key('first', 'v1', {}) + '.joblib' not in os.listdir(root_dir)
+
+        # Files left by an earlier process are pruned on the next fit too
+        for stale in ('demo-old1', 'demo-old2'):
+            path = os.path.join(root_dir, f"{stale}.joblib")
+            with open(path, 'wb') as handle:
+                handle.write(b'')
+            os.utime(path, (0, 0))
+        registry.get_or_train('fourth', 'v1', {}, make_trainer(5.0, calls), ['x'])
+        remaining = [f for f in os.listdir(root_dir) if f.endswith('.joblib')]
+        assert len(remaining) == 2 and not any(f.startswith('demo-old') for f in remaining)
+    print("✅ LRU eviction of artifacts verified")
+
+
+def test_failed_retrain_can_be_retried():
+    """A failed background fit leaves nothing pending, so the key trains again."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        calls = []
+        registry = ModelRegistry(root_dir)
+        registry.get_or_train('demo', 'v1', {}, make_trainer(2.0, calls), ['x'])
+
+        def failing():
+            raise ValueError("singular matrix")
+        registry.get_or_train('demo', 'v2', {}, failing, ['x'])
+        registry.wait(timeout=30)
+        assert registry.failures['demo'] == "singular matrix"
+        assert not registry._pending
+
+        stale = registry.get_or_train('demo', 'v2', {}, make_trainer(3.0, calls), ['x'])
+        assert stale['stale'] is True
+        registry.wait(timeout=30)
+        fresh = registry.get_or_train('demo', 'v2', {}, make_trainer(3.0, calls), ['x'])
+        assert fresh['stale'] is False and fresh['metrics']['slope'] == 3.0
+        assert 'demo' not in registry.failures
+    print("✅ Failed retrains are cleared and retried")
+
+
+def test_imports_without_ml_dependencies():
+    """Without sklearn and joblib the analytics module falls back and the registry stays in memory."""
+    code = """
+import os, sys, tempfile
+sys.modules['sklearn'] = sys.modules['joblib'] = None
+import hr_predictive_analytics
+from utils.model_registry import JOBLIB_AVAILABLE, ModelRegistry
+assert not hr_predictive_analytics.ML_AVAILABLE and not JOBLIB_AVAILABLE
+with tempfile.TemporaryDirectory() as root_dir:
+    registry = ModelRegistry(root_dir)
+    artifact = registry.get_or_train('demo', 'v1', {}, lambda: {'model': 'fitted', 'metrics': {}}, ['x'])
+    assert artifact['model'] == 'fitted'
+    assert registry.get_or_train('demo', 'v1', {}, lambda: None, ['x'])['model'] == 'fitted'
+    assert registry.stats['memory_hits'] == 1
+    assert not os.listdir(root_dir)
+"""
+    result = subprocess.run([sys.executable, '-c', code], cwd=current_dir, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+    print("✅ Imports fall back without sklearn and joblib")
+
+
+if __name__ == "__main__":
+    test_registry_reuses_and_persists_models()
+    test_registry_serves_previous_model_while_retraining()
+    test_registry_evicts_least_recently_used_artifacts()
+    test_failed_retrain_can_be_retried()
+    test_imports_without_ml_dependencies()
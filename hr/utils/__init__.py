@@ -3,6 +3,9 @@
 # Import main classes to make them available at package level
 from .insight_manager import AdvancedInsightManager
 from .dashboard_renderer import render_world_class_insights_dashboard
+from .feature_store import HRFeatureStore, EmployeeFeatureMatrix, get_feature_store
+from .model_registry import ModelRegistry, get_model_registry
+from .risk_scoring import calculate_composite_risk_scores, summarize_at_risk_employees
 from .advanced_insights import (
     generate_executive_summary,
     generate_predictive_insights,
@@ -14,6 +17,13 @@ from .advanced_insights import (
 __all__ = [
     'AdvancedInsightManager',
     'render_world_class_insights_dashboard',
+    'HRFeatureStore',
+    'EmployeeFeatureMatrix',
+    'get_feature_store',
+    'ModelRegistry',
+    'get_model_registry',
+    'calculate_composite_risk_scores',
+    'summarize_at_risk_employees',
     'generate_executive_summary',
     'generate_predictive_insights',
     'generate_segmentation_insights',
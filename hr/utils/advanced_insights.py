@@ -8,6 +8,12 @@ from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import json
 
+# Import risk scoring with fallback for different import contexts
+try:
+    from .risk_scoring import calculate_composite_risk_scores
+except ImportError:
+    from risk_scoring import calculate_composite_risk_scores
+
 def generate_executive_summary(insight_manager, employees_df, recruitment_df, performance_df, 
                              compensation_df, training_df, engagement_df, turnover_df, benefits_df):
     """Generate executive-level summary insights."""
@@ -142,22 +148,9 @@ def generate_predictive_insights(insight_manager, employees_df, performance_df,
     
     # Risk scoring insights
     if not employees_df.empty:
-        # Calculate composite risk scores
-        risk_employees = []
-        for _, emp in employees_df.iterrows():
-            risk_score = 0
-            
-            # Performance risk
-            if emp.get('performance_rating', 3.5) < 3.0:
-                risk_score += 30
-            
-            # Tenure risk
-            if emp.get('tenure_days', 365) < 365:
-                risk_score += 20
-                
-            # Add to high-risk list if score > 40
-            if risk_score > 40:
-                risk_employees.append(emp['employee_id'])
+        # Composite risk from performance and tenure only
+        risk = calculate_composite_risk_scores(employees_df)
+        risk_employees = risk.loc[risk['score'] > 40, 'employee_id'].tolist()
         
         if len(risk_employees) > 0:
             insights.append({
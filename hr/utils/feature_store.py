@@ -0,0 +1,246 @@
+import threading
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Categorical employee attributes encoded as integer codes
+CATEGORICAL_COLUMNS = ['department', 'gender', 'ethnicity', 'education_level']
+
+# Per-employee aggregates of each source table: (source column, agg, feature name)
+PERFORMANCE_AGGREGATES = [
+    ('performance_rating', 'mean', 'perf_rating_mean'),
+    ('performance_rating', 'std', 'perf_rating_std'),
+    ('performance_rating', 'count', 'perf_review_count'),
+    ('goal_achievement_rate', 'mean', 'goal_achievement_mean'),
+    ('productivity_score', 'mean', 'productivity_mean')
+]
+
+ENGAGEMENT_AGGREGATES = [
+    ('engagement_score', 'mean', 'engagement_mean'),
+    ('engagement_score', 'std', 'engagement_std'),
+    ('satisfaction_score', 'mean', 'satisfaction_mean'),
+    ('work_life_balance_score', 'mean', 'wlb_mean')
+]
+
+COMPENSATION_AGGREGATES = [
+    ('base_salary', 'mean', 'salary_mean'),
+    ('bonus_amount', 'mean', 'bonus_mean'),
+    ('total_compensation', 'mean', 'total_comp_mean')
+]
+
+# Block name -> (aggregate spec, rounding) for the per-employee source tables
+AGGREGATE_BLOCKS = {
+    'performance': (PERFORMANCE_AGGREGATES, 3),
+    'engagement': (ENGAGEMENT_AGGREGATES, 3),
+    'compensation': (COMPENSATION_AGGREGATES, 0)
+}
+
+# Feature blocks used by each consumer model
+TURNOVER_BLOCKS = ('base', 'performance', 'engagement')
+PERFORMANCE_BLOCKS = ('base', 'engagement')
+INSIGHT_BLOCKS = ('base', 'performance', 'engagement', 'compensation')
+
+
+def dataframe_fingerprint(df: Optional[pd.DataFrame]) -> str:
+    """Content hash of a DataFrame, used as its dataset version."""
+    if df is None or df.empty:
+        return 'empty'
+    digest = hashlib.sha1()
+    digest.update(str(df.shape).encode())
+    digest.update('|'.join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+class EmployeeFeatureMatrix:
+    """Compact float32 employee feature matrix with column metadata."""
+
+    def __init__(self, values: np.ndarray, columns: List[str], blocks: Dict[str, List[str]],
+                 employee_ids: np.ndarray, index: pd.Index, targets: Dict[str, np.ndarray],
+                 version: str):
+        self.values = values
+        self.columns = columns
+        self.blocks = blocks
+        self.employee_ids = employee_ids
+        self.index = index
+        self.targets = targets
+        self.version = version
+        self._positions = {name: i for i, name in enumerate(columns)}
+
+    def columns_for(self, blocks=INSIGHT_BLOCKS, exclude_encoded=False) -> List[str]:
+        """Feature names for a set of blocks, in the order models were trained on."""
+        # Encoded categoricals always come last, matching the historical layout
+        selected = [c for block in blocks if block != 'base' for c in self.blocks.get(block, [])]
+        base = self.blocks.get('base', []) if 'base' in blocks else []
+        numeric = [c for c in base if not c.endswith('_encoded')]
+        encoded = [] if exclude_encoded else [c for c in base if c.endswith('_encoded')]
+        return numeric + selected + encoded
+
+    def select(self, columns: List[str]) -> np.ndarray:
+        """float32 view of the requested columns."""
+        return self.values[:, [self._positions[c] for c in columns]]
+
+    def to_frame(self, blocks=INSIGHT_BLOCKS, exclude_encoded=False) -> pd.DataFrame:
+        """DataFrame of a block selection, indexed like the employees table."""
+        columns = self.columns_for(blocks, exclude_encoded)
+        return pd.DataFrame(self.select(columns), columns=columns, index=self.index)
+
+
+class HRFeatureStore:
+    """
+    Process-wide cache of employee feature matrices.
+
+    Each source table is fingerprinted independently and its per-employee
+    aggregate block is cached under that fingerprint, so when only one table
+    changes only that block is recomputed before the matrix is reassembled.
+    Assembled matrices are kept in a small LRU keyed by the combined version.
+    """
+
+    def __init__(self, max_versions: int = 4, max_blocks: int = 16):
+        self.max_versions = max_versions
+        self.max_blocks = max_blocks
+        self._matrices: 'OrderedDict[str, EmployeeFeatureMatrix]' = OrderedDict()
+        self._blocks: 'OrderedDict[Tuple[str, str], pd.DataFrame]' = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {'matrix_hits': 0, 'matrix_builds': 0, 'block_hits': 0, 'block_builds': 0}
+
+    def get_features(self, employees_df, performance_df=None, engagement_df=None,
+                     compensation_df=None, turnover_df=None) -> Optional[EmployeeFeatureMatrix]:
+        """
+        Return the feature matrix for the given tables, building only what changed.
+
+        Args:
+            employees_df (pd.DataFrame): Employee master table
+            performance_df, engagement_df, compensation_df (pd.DataFrame): Source tables
+            turnover_df (pd.DataFrame): Separations, used for the turnover label
+
+        Returns:
+            EmployeeFeatureMatrix or None if there are no employees
+        """
+        if employees_df is None or employees_df.empty:
+            return None
+
+        sources = {
+            'base': employees_df,
+            'performance': performance_df,
+            'engagement': engagement_df,
+            'compensation': compensation_df,
+            'turnover': turnover_df
+        }
+        fingerprints = {name: dataframe_fingerprint(df) for name, df in sources.items()}
+        version = hashlib.sha1('|'.join(f"{k}:{v}" for k, v in fingerprints.items()).encode()).hexdigest()[:16]
+
+        with self._lock:
+            if version in self._matrices:
+                self._matrices.move_to_end(version)
+                self.stats['matrix_hits'] += 1
+                return self._matrices[version]
+
+        base = self._get_block('base', fingerprints['base'], lambda: self._build_base_block(employees_df))
+        employee_ids = employees_df['employee_id'] if 'employee_id' in employees_df.columns else pd.Series(
+            np.arange(len(employees_df)), index=employees_df.index)
+
+        frames = [base]
+        blocks = {'base': list(base.columns)}
+        for name, (spec, decimals) in AGGREGATE_BLOCKS.items():
+            aggregates = self._get_block(
+                name, fingerprints[name],
+                lambda df=sources[name], spec=spec, decimals=decimals: self._build_aggregate_block(df, spec, decimals)
+            )
+            if aggregates is None:
+                blocks[name] = []
+                continue
+            aligned = aggregates.reindex(employee_ids.to_numpy())
+            aligned.index = employees_df.index
+            frames.append(aligned)
+            blocks[name] = list(aggregates.columns)
+
+        features = pd.concat(frames, axis=1).fillna(0)
+        matrix = EmployeeFeatureMatrix(
+            values=features.to_numpy(dtype=np.float32),
+            columns=list(features.columns),
+            blocks=blocks,
+            employee_ids=employee_ids.to_numpy(),
+            index=employees_df.index,
+            targets=self._build_targets(employee_ids, performance_df, turnover_df),
+            version=version
+        )
+
+        with self._lock:
+            self.stats['matrix_builds'] += 1
+            self._matrices[version] = matrix
+            while len(self._matrices) > self.max_versions:
+                self._matrices.popitem(last=False)
+        return matrix
+
+    def clear(self):
+        """Drop every cached block and matrix."""
+        with self._lock:
+            self._matrices.clear()
+            self._blocks.clear()
+
+    def _get_block(self, name, fingerprint, builder):
+        """Cached per-table block lookup."""
+        key = (name, fingerprint)
+        with self._lock:
+            if key in self._blocks:
+                self._blocks.move_to_end(key)
+                self.stats['block_hits'] += 1
+                return self._blocks[key]
+
+        block = builder()
+        with self._lock:
+            self.stats['block_builds'] += 1
+            self._blocks[key] = block
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        return block
+
+    @staticmethod
+    def _build_base_block(employees_df):
+        """Numeric employee attributes plus integer-coded categoricals."""
+        base = employees_df.select_dtypes(include=[np.number]).copy()
+        for col in CATEGORICAL_COLUMNS:
+            if col in employees_df.columns:
+                base[f'{col}_encoded'] = pd.Categorical(employees_df[col]).codes
+        return base
+
+    @staticmethod
+    def _build_aggregate_block(source_df, spec, decimals):
+        """Per-employee aggregates of one source table, indexed by employee_id."""
+        if source_df is None or source_df.empty or 'employee_id' not in source_df.columns:
+            return None
+        available = [(col, agg, name) for col, agg, name in spec if col in source_df.columns]
+        if not available:
+            return None
+        grouped = source_df.groupby('employee_id')
+        aggregates = grouped.agg(**{name: (col, agg) for col, agg, name in available})
+        return aggregates.round(decimals)
+
+    @staticmethod
+    def _build_targets(employee_ids, performance_df, turnover_df):
+        """Turnover label and latest performance rating aligned to employees."""
+        targets = {}
+        if turnover_df is not None and not turnover_df.empty and 'employee_id' in turnover_df.columns:
+            targets['turnover_risk'] = employee_ids.isin(turnover_df['employee_id']).to_numpy(dtype=np.int8)
+        else:
+            targets['turnover_risk'] = np.zeros(len(employee_ids), dtype=np.int8)
+
+        if (performance_df is not None and not performance_df.empty
+                and {'employee_id', 'review_date', 'performance_rating'}.issubset(performance_df.columns)):
+            latest = performance_df.sort_values('review_date').groupby('employee_id')['performance_rating'].last()
+            targets['performance_target'] = latest.reindex(employee_ids.to_numpy()).to_numpy(dtype=np.float32)
+        else:
+            targets['performance_target'] = np.full(len(employee_ids), np.nan, dtype=np.float32)
+        return targets
+
+
+_feature_store = HRFeatureStore()
+
+
+def get_feature_store() -> HRFeatureStore:
+    """Shared feature store instance for every page and session in this process."""
+    return _feature_store
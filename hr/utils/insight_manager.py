@@ -43,6 +43,9 @@ try:
         generate_segmentation_insights, generate_correlation_insights, 
         generate_kpi_insights
     )
+    from .feature_store import get_feature_store, INSIGHT_BLOCKS
+    from .model_registry import get_model_registry
+    from .risk_scoring import calculate_composite_risk_scores, summarize_at_risk_employees
 except ImportError:
     # Fallback for when imported directly
     from advanced_insights import (
@@ -50,6 +53,9 @@ except ImportError:
         generate_segmentation_insights, generate_correlation_insights, 
         generate_kpi_insights
     )
+    from feature_store import get_feature_store, INSIGHT_BLOCKS
+    from model_registry import get_model_registry
+    from risk_scoring import calculate_composite_risk_scores, summarize_at_risk_employees
 
 class AdvancedInsightManager:
     """World-class AI-powered HR insights manager with advanced machine learning capabilities."""
@@ -62,6 +68,7 @@ class AdvancedInsightManager:
         self.clustering_results = {}
         self.anomaly_scores = {}
         self.statistical_tests = {}
+        self.model_status = {}
         
         # Initialize ML components if available
         if ML_AVAILABLE:
@@ -124,10 +131,11 @@ class AdvancedInsightManager:
             return
             
         try:
-            # Prepare data for ML models
-            ml_data = self._prepare_ml_features(employees_df, performance_df, engagement_df, compensation_df)
+            # Shared employee feature matrix (cached per dataset version)
+            ml_data = self._prepare_ml_features(employees_df, performance_df, engagement_df,
+                                                compensation_df, turnover_df)
             
-            if ml_data is not None and len(ml_data) > 10:
+            if ml_data is not None and len(ml_data.values) > 10:
                 # Turnover prediction model
                 if not turnover_df.empty:
                     self._build_turnover_prediction_model(ml_data, turnover_df)
@@ -145,55 +153,13 @@ class AdvancedInsightManager:
         except Exception as e:
             st.warning(f"ML model building encountered an issue: {str(e)}")
     
-    def _prepare_ml_features(self, employees_df, performance_df, engagement_df, compensation_df):
-        """Prepare feature matrix for machine learning models."""
+    def _prepare_ml_features(self, employees_df, performance_df, engagement_df, compensation_df,
+                             turnover_df=None):
+        """Fetch the employee feature matrix for machine learning models from the feature store."""
         try:
-            # Start with employee base features
-            features = employees_df.copy()
-            
-            # Add performance metrics
-            if not performance_df.empty:
-                perf_agg = performance_df.groupby('employee_id').agg({
-                    'performance_rating': ['mean', 'std', 'count'],
-                    'goal_achievement_rate': 'mean',
-                    'productivity_score': 'mean'
-                }).round(3)
-                perf_agg.columns = ['perf_rating_mean', 'perf_rating_std', 'perf_review_count', 
-                                  'goal_achievement_mean', 'productivity_mean']
-                features = features.merge(perf_agg, left_on='employee_id', right_index=True, how='left')
-            
-            # Add engagement metrics
-            if not engagement_df.empty:
-                eng_agg = engagement_df.groupby('employee_id').agg({
-                    'engagement_score': ['mean', 'std'],
-                    'satisfaction_score': 'mean',
-                    'work_life_balance_score': 'mean'
-                }).round(3)
-                eng_agg.columns = ['engagement_mean', 'engagement_std', 'satisfaction_mean', 'wlb_mean']
-                features = features.merge(eng_agg, left_on='employee_id', right_index=True, how='left')
-            
-            # Add compensation metrics
-            if not compensation_df.empty:
-                comp_agg = compensation_df.groupby('employee_id').agg({
-                    'base_salary': 'mean',
-                    'bonus_amount': 'mean',
-                    'total_compensation': 'mean'
-                }).round(0)
-                comp_agg.columns = ['salary_mean', 'bonus_mean', 'total_comp_mean']
-                features = features.merge(comp_agg, left_on='employee_id', right_index=True, how='left')
-            
-            # Encode categorical variables
-            categorical_cols = ['department', 'gender', 'ethnicity', 'education_level']
-            for col in categorical_cols:
-                if col in features.columns:
-                    features[f'{col}_encoded'] = pd.Categorical(features[col]).codes
-            
-            # Select numeric features for ML
-            numeric_cols = features.select_dtypes(include=[np.number]).columns
-            ml_features = features[numeric_cols].fillna(0)
-            
-            return ml_features
-            
+            return get_feature_store().get_features(
+                employees_df, performance_df, engagement_df, compensation_df, turnover_df
+            )
         except Exception as e:
             st.warning(f"Feature preparation failed: {str(e)}")
             return None
@@ -201,33 +167,37 @@ class AdvancedInsightManager:
     def _build_turnover_prediction_model(self, ml_data, turnover_df):
         """Build a model to predict employee turnover risk."""
         try:
-            # Create turnover labels
-            turnover_employees = set(turnover_df['employee_id'].unique())
-            ml_data['turnover_risk'] = ml_data.index.map(
-                lambda x: 1 if f'EMP{x+1:03d}' in turnover_employees else 0
-            )
-            
             # Prepare features and target
-            feature_cols = [col for col in ml_data.columns if col != 'turnover_risk']
-            X = ml_data[feature_cols]
-            y = ml_data['turnover_risk']
+            X = ml_data.to_frame(INSIGHT_BLOCKS)
+            feature_cols = list(X.columns)
+            y = ml_data.targets['turnover_risk']
             
             if len(X) > 10 and y.sum() > 0:
-                # Split data
-                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+                params = {'n_estimators': 100, 'random_state': 42, 'test_size': 0.3}
                 
-                # Train Random Forest model
-                rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
-                rf_model.fit(X_train, y_train)
+                def train():
+                    # Split data
+                    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+                    
+                    # Train Random Forest model
+                    rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
+                    rf_model.fit(X_train, y_train)
+                    
+                    # Evaluate model
+                    y_pred = rf_model.predict(X_test)
+                    return {'model': rf_model, 'metrics': {'accuracy': accuracy_score(y_test, y_pred)}}
                 
-                # Evaluate model
-                y_pred = rf_model.predict(X_test)
-                accuracy = accuracy_score(y_test, y_pred)
+                artifact = get_model_registry().get_or_train(
+                    'insight_turnover', ml_data.version, params, train, feature_cols
+                )
+                if artifact is None:
+                    return
                 
                 # Store model and results
-                self.ml_models['turnover_prediction'] = rf_model
-                self.prediction_accuracy['turnover'] = accuracy
-                self.feature_importance['turnover'] = dict(zip(feature_cols, rf_model.feature_importances_))
+                self.ml_models['turnover_prediction'] = artifact['model']
+                self.prediction_accuracy['turnover'] = artifact['metrics']['accuracy']
+                self.feature_importance['turnover'] = dict(zip(feature_cols, artifact['model'].feature_importances_))
+                self.model_status['turnover'] = 'retraining' if artifact['stale'] else 'current'
                 
         except Exception as e:
             st.warning(f"Turnover prediction model failed: {str(e)}")
@@ -235,43 +205,40 @@ class AdvancedInsightManager:
     def _build_performance_prediction_model(self, ml_data, performance_df):
         """Build a model to predict employee performance."""
         try:
-            # Get latest performance rating for each employee
-            latest_perf = performance_df.sort_values('review_date').groupby('employee_id').last()
-            
-            # Match with ML data
-            perf_target = []
-            for idx in ml_data.index:
-                emp_id = f'EMP{idx+1:03d}'
-                if emp_id in latest_perf.index:
-                    perf_target.append(latest_perf.loc[emp_id, 'performance_rating'])
-                else:
-                    perf_target.append(np.nan)
-            
-            ml_data['performance_target'] = perf_target
-            
-            # Remove rows with missing targets
-            valid_data = ml_data.dropna(subset=['performance_target'])
-            
-            if len(valid_data) > 10:
-                feature_cols = [col for col in valid_data.columns if col != 'performance_target']
-                X = valid_data[feature_cols]
-                y = valid_data['performance_target']
+            # Latest performance rating for each employee, aligned by the feature store
+            y = ml_data.targets['performance_target']
+            valid = ~np.isnan(y)
+            
+            if valid.sum() > 10:
+                X = ml_data.to_frame(INSIGHT_BLOCKS)[valid]
+                feature_cols = list(X.columns)
+                y = y[valid]
+                params = {'n_estimators': 100, 'random_state': 42, 'test_size': 0.3}
                 
-                # Split data
-                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-                
-                # Train Gradient Boosting model
-                gb_model = GradientBoostingRegressor(n_estimators=100, random_state=42)
-                gb_model.fit(X_train, y_train)
+                def train():
+                    # Split data
+                    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+                    
+                    # Train Gradient Boosting model
+                    gb_model = GradientBoostingRegressor(n_estimators=100, random_state=42)
+                    gb_model.fit(X_train, y_train)
+                    
+                    # Evaluate model
+                    mse = mean_squared_error(y_test, gb_model.predict(X_test))
+                    # Convert MSE to accuracy-like metric
+                    return {'model': gb_model, 'metrics': {'accuracy': 1 / (1 + mse)}}
                 
-                # Evaluate model
-                y_pred = gb_model.predict(X_test)
-                mse = mean_squared_error(y_test, y_pred)
+                artifact = get_model_registry().get_or_train(
+                    'insight_performance', ml_data.version, params, train, feature_cols
+                )
+                if artifact is None:
+                    return
                 
                 # Store model and results
-                self.ml_models['performance_prediction'] = gb_model
-                self.prediction_accuracy['performance'] = 1 / (1 + mse)  # Convert MSE to accuracy-like metric
-                self.feature_importance['performance'] = dict(zip(feature_cols, gb_model.feature_importances_))
+                self.ml_models['performance_prediction'] = artifact['model']
+                self.prediction_accuracy['performance'] = artifact['metrics']['accuracy']
+                self.feature_importance['performance'] = dict(zip(feature_cols, artifact['model'].feature_importances_))
+                self.model_status['performance'] = 'retraining' if artifact['stale'] else 'current'
                 
         except Exception as e:
             st.warning(f"Performance prediction model failed: {str(e)}")
@@ -280,30 +247,47 @@ class AdvancedInsightManager:
         """Build employee segmentation using clustering."""
         try:
             # Select features for clustering
-            feature_cols = [col for col in ml_data.columns if 'encoded' not in col]
-            X = ml_data[feature_cols].fillna(0)
+            X = ml_data.to_frame(INSIGHT_BLOCKS, exclude_encoded=True)
+            feature_cols = list(X.columns)
             
             if len(X) > 5:
-                # Standardize features
-                X_scaled = self.scaler.fit_transform(X)
-                
-                # K-means clustering
                 n_clusters = min(5, len(X) // 2)  # Adaptive cluster count
-                kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-                cluster_labels = kmeans.fit_predict(X_scaled)
+                params = {'n_clusters': n_clusters, 'random_state': 42}
                 
-                # Calculate silhouette score
-                if len(set(cluster_labels)) > 1:
-                    silhouette = silhouette_score(X_scaled, cluster_labels)
+                def train():
+                    # Standardize features
+                    scaler = StandardScaler()
+                    X_scaled = scaler.fit_transform(X)
                     
-                    # Store results
-                    self.clustering_results = {
-                        'model': kmeans,
-                        'labels': cluster_labels,
-                        'silhouette_score': silhouette,
-                        'n_clusters': n_clusters,
-                        'feature_names': feature_cols
-                    }
+                    # K-means clustering
+                    kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+                    cluster_labels = kmeans.fit_predict(X_scaled)
+                    if len(set(cluster_labels)) <= 1:
+                        return None
+                    
+                    # Calculate silhouette score
+                    silhouette = silhouette_score(X_scaled, cluster_labels)
+                    return {'model': kmeans, 'scaler': scaler, 'metrics': {'silhouette_score': silhouette}}
+                
+                artifact = get_model_registry().get_or_train(
+                    'insight_clustering', ml_data.version, params, train, feature_cols
+                )
+                if artifact is None:
+                    return
+                
+                # Label the current employees, even when a previous model is being served
+                kmeans = artifact['model']
+                cluster_labels = kmeans.predict(artifact['scaler'].transform(X))
+                
+                # Store results
+                self.clustering_results = {
+                    'model': kmeans,
+                    'labels': cluster_labels,
+                    'silhouette_score': artifact['metrics']['silhouette_score'],
+                    'n_clusters': kmeans.n_clusters,
+                    'feature_names': feature_cols
+                }
+                self.model_status['clustering'] = 'retraining' if artifact['stale'] else 'current'
                 
         except Exception as e:
             st.warning(f"Employee clustering failed: {str(e)}")
@@ -312,13 +296,25 @@ class AdvancedInsightManager:
         """Build anomaly detection model."""
         try:
             # Select features for anomaly detection
-            feature_cols = [col for col in ml_data.columns if 'encoded' not in col]
-            X = ml_data[feature_cols].fillna(0)
+            X = ml_data.to_frame(INSIGHT_BLOCKS, exclude_encoded=True)
             
             if len(X) > 5:
-                # Isolation Forest for anomaly detection
-                isolation_forest = IsolationForest(contamination=0.1, random_state=42)
-                anomaly_scores = isolation_forest.fit_predict(X)
+                params = {'contamination': 0.1, 'random_state': 42}
+                
+                def train():
+                    # Isolation Forest for anomaly detection
+                    isolation_forest = IsolationForest(contamination=0.1, random_state=42)
+                    isolation_forest.fit(X)
+                    return {'model': isolation_forest, 'metrics': {}}
+                
+                artifact = get_model_registry().get_or_train(
+                    'insight_anomaly', ml_data.version, params, train, list(X.columns)
+                )
+                if artifact is None:
+                    return
+                
+                isolation_forest = artifact['model']
+                anomaly_scores = isolation_forest.predict(X)
                 
                 # Store results
                 self.anomaly_scores = {
@@ -326,6 +322,7 @@ class AdvancedInsightManager:
                     'scores': anomaly_scores,
                     'outlier_indices': np.where(anomaly_scores == -1)[0]
                 }
+                self.model_status['anomaly'] = 'retraining' if artifact['stale'] else 'current'
                 
         except Exception as e:
             st.warning(f"Anomaly detection failed: {str(e)}")
@@ -740,42 +737,13 @@ class AdvancedInsightManager:
         insights = []
         
         if not employees_df.empty:
-            # Calculate composite risk scores
-            risk_scores = {}
-            
-            for _, emp in employees_df.iterrows():
-                emp_id = emp['employee_id']
-                risk_score = 0
-                risk_factors = []
-                
-                # Performance risk (30% weight)
-                if emp.get('performance_rating', 3.5) < 3.0:
-                    risk_score += 30
-                    risk_factors.append('Low Performance')
-                
-                # Tenure risk (20% weight)
-                if emp.get('tenure_days', 365) < 365:
-                    risk_score += 20
-                    risk_factors.append('Short Tenure')
-                
-                # Engagement risk (25% weight)
-                if not engagement_df.empty:
-                    emp_engagement = engagement_df[engagement_df['employee_id'] == emp_id]['engagement_score'].mean()
-                    if emp_engagement < 3.0:
-                        risk_score += 25
-                        risk_factors.append('Low Engagement')
-                
-                # Store risk assessment
-                if risk_score > 0:
-                    risk_scores[emp_id] = {
-                        'score': risk_score,
-                        'factors': risk_factors,
-                        'level': 'High' if risk_score > 50 else 'Medium' if risk_score > 25 else 'Low'
-                    }
+            # Calculate composite risk scores (performance 30, tenure 20, engagement 25)
+            risk = calculate_composite_risk_scores(employees_df, engagement_df)
+            at_risk = summarize_at_risk_employees(risk)
             
             # Generate insights based on risk analysis
-            high_risk_count = sum(1 for r in risk_scores.values() if r['score'] > 50)
-            total_at_risk = len(risk_scores)
+            high_risk_count = int((at_risk['score'] > 50).sum())
+            total_at_risk = len(at_risk)
             
             if high_risk_count > 0:
                 insights.append({
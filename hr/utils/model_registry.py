@@ -0,0 +1,251 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import joblib
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    # Without joblib, artifacts are kept in memory only
+    JOBLIB_AVAILABLE = False
+
+# Default on-disk location for fitted estimators
+MODEL_REGISTRY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'models'
+)
+
+
+class ModelRegistry:
+    """
+    Disk-backed registry of fitted HR models.
+
+    Artifacts are keyed by (model name, feature-store version, hyperparameters)
+    and hold the estimator(s), evaluation metrics and the feature columns used.
+    When the data changes and a model for the same name and feature layout
+    already exists, that model keeps being served while a background worker
+    retrains; the first model for a name is trained synchronously.
+    At most max_artifacts artifacts are kept: the least recently used are
+    evicted from memory and their files deleted.
+    """
+
+    def __init__(self, root_dir: str = MODEL_REGISTRY_DIR, max_workers: int = 1, max_artifacts: int = 16):
+        self.root_dir = root_dir
+        self.max_artifacts = max_artifacts
+        self._memory: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._latest: Dict[str, str] = {}
+        self._pending: Dict[str, Any] = {}
+        self.failures: Dict[str, str] = {}
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hr-model-registry')
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'trained': 0, 'stale_served': 0, 'evicted': 0}
+
+    @staticmethod
+    def make_key(name: str, feature_version: str, params: Dict[str, Any]) -> str:
+        """Registry key for a model name, feature version and hyperparameters."""
+        payload = json.dumps({'name': name, 'features': feature_version, 'params': params},
+                             sort_keys=True, default=str)
+        return f"{name}-{hashlib.sha1(payload.encode()).hexdigest()[:16]}"
+
+    def get_or_train(self, name: str, feature_version: str, params: Dict[str, Any],
+                     train_fn: Callable[[], Optional[Dict[str, Any]]],
+                     feature_columns=None) -> Optional[Dict[str, Any]]:
+        """
+        Return a fitted artifact, training or scheduling a retrain as needed.
+
+        Args:
+            name (str): Model name, e.g. 'insight_turnover'
+            feature_version (str): Feature-store version the model is trained on
+            params (dict): Hyperparameters that identify the model
+            train_fn (callable): Returns a dict with at least 'model' and 'metrics',
+                or None if there is not enough data. Runs off the Streamlit
+                thread when retraining, so it must not call ``st``.
+            feature_columns (list): Feature layout the caller will predict with
+
+        Returns:
+            dict or None: Artifact with 'model', 'metrics', 'feature_columns',
+            'feature_version', 'params', 'trained_at' and 'stale'
+        """
+        key = self.make_key(name, feature_version, params)
+        artifact = self._load(key)
+        if artifact is not None:
+            with self._lock:
+                self._latest[name] = key
+            return dict(artifact, stale=False)
+
+        previous = self._previous(name, feature_columns)
+        if previous is None:
+            artifact = self._train(key, name, feature_version, params, train_fn, feature_columns)
+            return dict(artifact, stale=False) if artifact is not None else None
+
+        with self._lock:
+            if key not in self._pending:
+                future = self._executor.submit(
+                    self._train, key, name, feature_version, params, train_fn, feature_columns
+                )
+                self._pending[key] = future
+                future.add_done_callback(lambda done, key=key: self._finished(key, done))
+            self.stats['stale_served'] += 1
+        return dict(previous, stale=True)
+
+    def is_pending(self, name: Optional[str] = None) -> bool:
+        """Whether any (or the named) model is being retrained in the background."""
+        with self._lock:
+            self._pending = {k: f for k, f in self._pending.items() if not f.done()}
+            if name is None:
+                return bool(self._pending)
+            return any(k.startswith(f"{name}-") for k in self._pending)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Block until background retraining finishes (used by tests and scripts)."""
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            future.result(timeout=timeout)
+
+    def _finished(self, key: str, future):
+        """Drop a finished (or failed) retrain so the key can be trained again."""
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def clear_memory(self):
+        """Forget in-memory artifacts; disk artifacts are kept."""
+        with self._lock:
+            self._memory.clear()
+            self._latest.clear()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root_dir, f"{key}.joblib")
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look an artifact up in memory, then on disk."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return self._memory[key]
+
+        path = self._path(key)
+        if not JOBLIB_AVAILABLE or not os.path.exists(path):
+            return None
+        try:
+            artifact = joblib.load(path)
+        except Exception:
+            return None
+        with self._lock:
+            self._remember(key, artifact)
+            self.stats['disk_hits'] += 1
+        return artifact
+
+    def _remember(self, key: str, artifact: Dict[str, Any]):
+        """Keep an artifact in memory, evicting the least recently used beyond max_artifacts."""
+        self._memory[key] = artifact
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_artifacts:
+            evicted, _ = self._memory.popitem(last=False)
+            self._latest = {name: latest for name, latest in self._latest.items() if latest != evicted}
+            self._remove_file(evicted)
+            self.stats['evicted'] += 1
+
+    def _remove_file(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _prune_disk(self):
+        """Delete the oldest artifact files beyond max_artifacts, e.g. left by earlier processes."""
+        try:
+            files = [f for f in os.listdir(self.root_dir) if f.endswith('.joblib')]
+            files.sort(key=lambda f: os.path.getmtime(os.path.join(self.root_dir, f)))
+        except OSError:
+            return
+        with self._lock:
+            stale = [f[:-len('.joblib')] for f in files if f[:-len('.joblib')] not in self._memory]
+            for key in stale[:max(len(files) - self.max_artifacts, 0)]:
+                self._remove_file(key)
+                self.stats['evicted'] += 1
+
+    def _previous(self, name: str, feature_columns) -> Optional[Dict[str, Any]]:
+        """Most recent artifact for a name that is compatible with the feature layout."""
+        with self._lock:
+            key = self._latest.get(name)
+        artifact = self._load(key) if key else None
+        if artifact is None:
+            artifact = self._latest_on_disk(name)
+        if artifact is None:
+            return None
+        if feature_columns is not None and list(artifact.get('feature_columns') or []) != list(feature_columns):
+            return None
+        return artifact
+
+    def _latest_on_disk(self, name: str) -> Optional[Dict[str, Any]]:
+        """Newest persisted artifact for a name, e.g. after a process restart."""
+        if not os.path.isdir(self.root_dir):
+            return None
+        candidates = [f for f in os.listdir(self.root_dir)
+                      if f.startswith(f"{name}-") and f.endswith('.joblib')]
+        if not candidates:
+            return None
+        newest = max(candidates, key=lambda f: os.path.getmtime(os.path.join(self.root_dir, f)))
+        key = newest[:-len('.joblib')]
+        artifact = self._load(key)
+        if artifact is not None:
+            with self._lock:
+                self._latest[name] = key
+        return artifact
+
+    def _train(self, key, name, feature_version, params, train_fn, feature_columns):
+        """Fit, persist and publish an artifact."""
+        try:
+            result = train_fn()
+        except Exception as e:
+            with self._lock:
+                self.failures[name] = str(e)
+            return None
+        if result is None:
+            return None
+
+        artifact = dict(result)
+        artifact.update({
+            'feature_columns': list(feature_columns) if feature_columns is not None else None,
+            'feature_version': feature_version,
+            'params': params,
+            'trained_at': time.time()
+        })
+
+        if JOBLIB_AVAILABLE:
+            try:
+                os.makedirs(self.root_dir, exist_ok=True)
+                temp_path = f"{self._path(key)}.tmp"
+                joblib.dump(artifact, temp_path)
+                os.replace(temp_path, self._path(key))
+            except OSError:
+                # Persisting is an optimization; the in-memory artifact is still served
+                pass
+
+        with self._lock:
+            self._remember(key, artifact)
+            self._latest[name] = key
+            self.failures.pop(name, None)
+            self.stats['trained'] += 1
+        self._prune_disk()
+        return artifact
+
+
+_model_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Shared model registry for every page and session in this process."""
+    global _model_registry
+    with _registry_lock:
+        if _model_registry is None:
+            _model_registry = ModelRegistry()
+        return _model_registry
@@ -0,0 +1,101 @@
+# Vectorized composite employee risk scoring for HR Analytics
+import numpy as np
+import pandas as pd
+
+# Risk points and thresholds shared by the insight engines
+PERFORMANCE_RISK_POINTS = 30
+TENURE_RISK_POINTS = 20
+ENGAGEMENT_RISK_POINTS = 25
+
+LOW_PERFORMANCE_THRESHOLD = 3.0
+SHORT_TENURE_DAYS = 365
+LOW_ENGAGEMENT_THRESHOLD = 3.0
+
+HIGH_RISK_SCORE = 50
+MEDIUM_RISK_SCORE = 25
+
+RISK_FACTOR_LABELS = {
+    'low_performance': 'Low Performance',
+    'short_tenure': 'Short Tenure',
+    'low_engagement': 'Low Engagement'
+}
+
+
+def calculate_composite_risk_scores(employees_df, engagement_df=None):
+    """
+    Score every employee row with the composite risk model in one pass.
+
+    Performance and tenure come from the employee table (missing columns
+    count as no risk); engagement is the mean survey score per employee,
+    computed with a single groupby instead of a filter per employee.
+
+    Args:
+        employees_df (pd.DataFrame): Employee data
+        engagement_df (pd.DataFrame): Engagement surveys, or None to skip engagement risk
+
+    Returns:
+        pd.DataFrame: One row per employee row (same index) with employee_id,
+        the boolean risk factors, score and level
+    """
+    n_rows = len(employees_df)
+    risk = pd.DataFrame(index=employees_df.index)
+    risk['employee_id'] = employees_df['employee_id'] if 'employee_id' in employees_df.columns else None
+
+    if 'performance_rating' in employees_df.columns:
+        performance = pd.to_numeric(employees_df['performance_rating'], errors='coerce')
+        risk['low_performance'] = (performance < LOW_PERFORMANCE_THRESHOLD).to_numpy()
+    else:
+        risk['low_performance'] = np.zeros(n_rows, dtype=bool)
+
+    if 'tenure_days' in employees_df.columns:
+        tenure = pd.to_numeric(employees_df['tenure_days'], errors='coerce')
+        risk['short_tenure'] = (tenure < SHORT_TENURE_DAYS).to_numpy()
+    else:
+        risk['short_tenure'] = np.zeros(n_rows, dtype=bool)
+
+    if engagement_df is not None and not engagement_df.empty:
+        mean_engagement = engagement_df.groupby('employee_id')['engagement_score'].mean()
+        employee_engagement = employees_df['employee_id'].map(mean_engagement)
+        risk['low_engagement'] = (employee_engagement < LOW_ENGAGEMENT_THRESHOLD).to_numpy()
+    else:
+        risk['low_engagement'] = np.zeros(n_rows, dtype=bool)
+
+    risk['score'] = (
+        risk['low_performance'] * PERFORMANCE_RISK_POINTS
+        + risk['short_tenure'] * TENURE_RISK_POINTS
+        + risk['low_engagement'] * ENGAGEMENT_RISK_POINTS
+    ).astype(int)
+    risk['level'] = np.select(
+        [risk['score'] > HIGH_RISK_SCORE, risk['score'] > MEDIUM_RISK_SCORE],
+        ['High', 'Medium'],
+        default='Low'
+    )
+    return risk
+
+
+def summarize_at_risk_employees(risk):
+    """
+    Reduce per-row risk scores to one entry per at-risk employee.
+
+    Matches the historical dict-based bookkeeping: only rows with a positive
+    score are recorded, a later row for the same employee wins, and each
+    entry lists its readable risk factors.
+
+    Args:
+        risk (pd.DataFrame): Output of calculate_composite_risk_scores
+
+    Returns:
+        pd.DataFrame: At-risk employees indexed by employee_id, with a
+        'factors' list column
+    """
+    at_risk = risk[risk['score'] > 0]
+    at_risk = at_risk[~at_risk['employee_id'].duplicated(keep='last')].copy()
+    at_risk['factors'] = risk_factor_labels(at_risk)
+    return at_risk.set_index('employee_id')
+
+
+def risk_factor_labels(risk):
+    """Readable risk factor lists per row, e.g. ['Low Performance', 'Short Tenure']."""
+    flags = risk[list(RISK_FACTOR_LABELS)].to_numpy()
+    labels = np.array(list(RISK_FACTOR_LABELS.values()))
+    return pd.Series([list(labels[row]) for row in flags], index=risk.index)
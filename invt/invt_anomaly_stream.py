@@ -0,0 +1,456 @@
+import hashlib
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import streamlit as st
+import warnings
+warnings.filterwarnings('ignore')
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Numeric movement fields tracked by the streaming detector
+STREAM_METRICS = ('current_stock', 'quantity', 'unit_cost')
+
+# Grouping dimensions: dimension name -> key column in the movement log
+STREAM_DIMENSIONS = {'sku': 'item_id', 'supplier': 'supplier_id'}
+
+# Default on-disk checkpoint used by the dashboard
+STREAM_CHECKPOINT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.cache', 'invt_anomaly_state.pkl'
+)
+
+_STATE_INDEX = ['dimension', 'key', 'metric']
+_SKETCH_INDEX = _STATE_INDEX + ['bucket']
+_CHECKPOINT_VERSION = 2
+
+# Leading rows hashed to recognise the movement log a checkpoint came from
+FINGERPRINT_ROWS = 100
+
+def dataset_fingerprint(movements, rows=FINGERPRINT_ROWS):
+    """
+    Hash of a movement log's columns and first rows.
+
+    Appending rows leaves it unchanged, so it identifies the log a
+    checkpoint was built from.
+
+    Args:
+        movements (pd.DataFrame): Stock movement log
+        rows (int): Leading rows to hash
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256('\x1f'.join(map(str, movements.columns)).encode())
+    head = movements.iloc[:rows]
+    if not head.empty:
+        digest.update(pd.util.hash_pandas_object(head.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+# ============================================================================
+# STREAMING ANOMALY DETECTOR
+# ============================================================================
+
+class StreamingAnomalyDetector:
+    """
+    Online anomaly detector for inventory stock movements.
+
+    Keeps running mean/variance (Welford, merged batch-wise with Chan's
+    parallel update) and a log-bucketed quantile sketch per
+    (dimension, key, metric). Each batch is scored against the state
+    accumulated *before* it and then folded in, so history is never
+    rescanned.
+    """
+
+    def __init__(self, metrics=STREAM_METRICS, dimensions=None, z_threshold=3.0,
+                 iqr_multiplier=1.5, relative_accuracy=0.02, min_history=10,
+                 min_value=1e-6):
+        """
+        Initialize an empty detector.
+
+        Args:
+            metrics (iterable): Numeric columns to track
+            dimensions (dict): Dimension name -> key column mapping
+            z_threshold (float): Absolute z-score above which a value is anomalous
+            iqr_multiplier (float): IQR fence multiplier (matches batch detectors)
+            relative_accuracy (float): Relative error of the quantile sketch
+            min_history (int): Observations required before a key is scored
+            min_value (float): Magnitude below which values fall in the zero bucket
+        """
+        self.metrics = tuple(metrics)
+        self.dimensions = dict(dimensions or STREAM_DIMENSIONS)
+        self.z_threshold = z_threshold
+        self.iqr_multiplier = iqr_multiplier
+        self.relative_accuracy = relative_accuracy
+        self.min_history = min_history
+        self.min_value = min_value
+        self._log_gamma = np.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.rows_seen = 0
+        self.batches_seen = 0
+        # Fingerprint of the first fingerprint_rows rows of the log consumed
+        self.fingerprint = None
+        self.fingerprint_rows = 0
+        self._stats = pd.DataFrame(
+            columns=['count', 'mean', 'm2'],
+            index=pd.MultiIndex.from_tuples([], names=_STATE_INDEX),
+            dtype=float
+        )
+        self._sketch = pd.Series(
+            index=pd.MultiIndex.from_tuples([], names=_SKETCH_INDEX),
+            dtype=float, name='count'
+        )
+
+    # ------------------------------------------------------------------
+    # Batch reshaping and sketch bucketing
+    # ------------------------------------------------------------------
+
+    def _to_long(self, batch):
+        """Reshape a movement batch to long (dimension, key, metric, value) rows."""
+        metrics = [m for m in self.metrics if m in batch.columns]
+        frames = []
+        for dimension, key_column in self.dimensions.items():
+            if key_column not in batch.columns or not metrics:
+                continue
+            long = batch[[key_column] + metrics].melt(
+                id_vars=key_column, var_name='metric', value_name='value', ignore_index=False
+            )
+            long = long.rename(columns={key_column: 'key'})
+            long['dimension'] = dimension
+            frames.append(long)
+
+        if not frames:
+            return pd.DataFrame(columns=['dimension', 'key', 'metric', 'value'])
+
+        long = pd.concat(frames)
+        long['value'] = pd.to_numeric(long['value'], errors='coerce')
+        long = long.dropna(subset=['key', 'value'])
+        long['key'] = long['key'].astype(str)
+        long.index.name = 'row'
+        return long[['dimension', 'key', 'metric', 'value']]
+
+    def _bucketize(self, values):
+        """Map values to signed, order-preserving log buckets (0 is the zero bucket)."""
+        values = np.asarray(values, dtype=float)
+        magnitude = np.abs(values)
+        buckets = np.zeros(len(values), dtype=np.int64)
+        nonzero = magnitude >= self.min_value
+        buckets[nonzero] = (
+            np.ceil(np.log(magnitude[nonzero] / self.min_value) / self._log_gamma).astype(np.int64) + 1
+        )
+        return buckets * np.sign(values).astype(np.int64)
+
+    def _bucket_values(self, buckets):
+        """Representative value of each sketch bucket."""
+        buckets = np.asarray(buckets, dtype=np.int64)
+        exponent = np.maximum(np.abs(buckets) - 1, 0)
+        gamma = np.exp(self._log_gamma)
+        values = self.min_value * 2 * np.exp(exponent * self._log_gamma) / (gamma + 1)
+        return np.where(buckets == 0, 0.0, np.sign(buckets) * values)
+
+    # ------------------------------------------------------------------
+    # State access
+    # ------------------------------------------------------------------
+
+    def quantiles(self, probabilities=(0.25, 0.5, 0.75), keys=None):
+        """
+        Approximate quantiles from the sketch.
+
+        Args:
+            probabilities (iterable): Quantile levels in [0, 1]
+            keys (pd.MultiIndex): Optional (dimension, key, metric) subset
+
+        Returns:
+            pd.DataFrame: One row per (dimension, key, metric), one column per level
+        """
+        sketch = self._sketch
+        if keys is not None and not sketch.empty:
+            group_index = sketch.index.droplevel('bucket')
+            sketch = sketch[group_index.isin(keys)]
+        if sketch.empty:
+            return pd.DataFrame(columns=list(probabilities),
+                                index=pd.MultiIndex.from_tuples([], names=_STATE_INDEX))
+
+        sketch = sketch.sort_index()
+        grouped = sketch.groupby(level=_STATE_INDEX, sort=False)
+        cumulative = grouped.cumsum().to_numpy()
+        total = grouped.transform('sum').to_numpy()
+        bucket_values = self._bucket_values(sketch.index.get_level_values('bucket'))
+        group_index = sketch.index.droplevel('bucket')
+
+        result = {}
+        for probability in probabilities:
+            reached = cumulative > probability * (total - 1)
+            hits = pd.Series(bucket_values[reached], index=group_index[reached])
+            result[probability] = hits.groupby(level=_STATE_INDEX, sort=False).first()
+        return pd.DataFrame(result)
+
+    def statistics(self):
+        """Running count, mean and standard deviation per (dimension, key, metric)."""
+        stats = self._stats.copy()
+        stats['std'] = np.sqrt(stats['m2'] / (stats['count'] - 1).where(stats['count'] > 1))
+        return stats[['count', 'mean', 'std']]
+
+    # ------------------------------------------------------------------
+    # Scoring and updating
+    # ------------------------------------------------------------------
+
+    def score_batch(self, batch):
+        """
+        Score a movement batch against the current state without updating it.
+
+        Args:
+            batch (pd.DataFrame): New stock movements
+
+        Returns:
+            pd.DataFrame: Long-format scores indexed by the batch row label
+        """
+        long = self._to_long(batch)
+        if long.empty:
+            return long.assign(z_score=[], lower_bound=[], upper_bound=[],
+                               z_anomaly=[], iqr_anomaly=[], is_anomaly=[])
+
+        group_keys = pd.MultiIndex.from_frame(long[_STATE_INDEX])
+        stats = self.statistics().reindex(group_keys)
+        bounds = self.quantiles((0.25, 0.75), keys=group_keys.unique()).reindex(group_keys)
+
+        eligible = (stats['count'] >= self.min_history).to_numpy()
+        values = long['value'].to_numpy()
+        std = stats['std'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_score = np.where(eligible & (std > 0), (values - stats['mean'].to_numpy()) / std, 0.0)
+
+        q1 = bounds[0.25].to_numpy(dtype=float)
+        q3 = bounds[0.75].to_numpy(dtype=float)
+        spread = self.iqr_multiplier * (q3 - q1)
+        lower_bound = np.where(eligible, q1 - spread, np.nan)
+        upper_bound = np.where(eligible, q3 + spread, np.nan)
+
+        long = long.copy()
+        long['z_score'] = np.nan_to_num(z_score)
+        long['lower_bound'] = lower_bound
+        long['upper_bound'] = upper_bound
+        long['z_anomaly'] = np.abs(long['z_score'].to_numpy()) > self.z_threshold
+        long['iqr_anomaly'] = eligible & ((values < lower_bound) | (values > upper_bound))
+        long['is_anomaly'] = long['z_anomaly'] | long['iqr_anomaly']
+        return long
+
+    def update(self, batch):
+        """
+        Fold a movement batch into the running state.
+
+        Args:
+            batch (pd.DataFrame): New stock movements
+        """
+        long = self._to_long(batch)
+        self.rows_seen += len(batch)
+        self.batches_seen += 1
+        if long.empty:
+            return
+
+        # Chan's parallel variant of Welford: merge batch moments into the state
+        grouped = long.groupby(_STATE_INDEX, sort=False)['value']
+        batch_count = grouped.count().astype(float)
+        batch_stats = pd.DataFrame({
+            'count': batch_count,
+            'mean': grouped.mean(),
+            'm2': grouped.var(ddof=0) * batch_count
+        })
+
+        # Keys already in the state are merged in place, so once the key set is
+        # stable an update costs O(batch); new keys are appended with a concat,
+        # which copies the state
+        positions = self._stats.index.get_indexer(batch_stats.index)
+        seen = positions >= 0
+        if seen.any():
+            rows = positions[seen]
+            old = self._stats.iloc[rows].to_numpy()
+            new = batch_stats[seen].to_numpy()
+            count = old[:, 0] + new[:, 0]
+            delta = new[:, 1] - old[:, 1]
+            merged = np.column_stack([
+                count,
+                old[:, 1] + delta * new[:, 0] / count,
+                old[:, 2] + new[:, 2] + delta ** 2 * old[:, 0] * new[:, 0] / count
+            ])
+            self._stats.iloc[rows] = merged
+        if not seen.all():
+            self._stats = pd.concat([self._stats, batch_stats[~seen]])
+
+        bucket_counts = (long.assign(bucket=self._bucketize(long['value']))
+                         .groupby(_SKETCH_INDEX, sort=False).size().astype(float))
+        positions = self._sketch.index.get_indexer(bucket_counts.index)
+        seen = positions >= 0
+        if seen.any():
+            # Group keys are unique, so each bucket is hit at most once
+            self._sketch.iloc[positions[seen]] += bucket_counts.to_numpy()[seen]
+        if not seen.all():
+            self._sketch = pd.concat([self._sketch, bucket_counts[~seen]]).rename('count')
+
+    def process_batch(self, batch):
+        """Score a batch against prior state, then fold it in."""
+        scores = self.score_batch(batch)
+        self.update(batch)
+        return scores
+
+    def summarize(self, scores):
+        """
+        Summarize batch scores in the shape of the batch anomaly detectors.
+
+        Args:
+            scores (pd.DataFrame): Output of ``score_batch``/``process_batch``
+
+        Returns:
+            dict: Anomaly counts and flagged keys per dimension/metric
+        """
+        if scores.empty:
+            return {'anomalous_keys': {}, 'anomaly_score': 0, 'flagged_rows': 0, 'scored_rows': 0}
+
+        flagged = scores[scores['is_anomaly']]
+        anomalous_keys = (flagged.groupby(['dimension', 'metric'])['key']
+                          .unique().apply(list).to_dict())
+        scored_rows = scores.index.nunique()
+        flagged_rows = flagged.index.nunique()
+        return {
+            'anomalous_keys': anomalous_keys,
+            'anomaly_score': flagged_rows / scored_rows * 100 if scored_rows else 0,
+            'flagged_rows': flagged_rows,
+            'scored_rows': scored_rows
+        }
+
+    # ------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------
+
+    def save_checkpoint(self, path=STREAM_CHECKPOINT_PATH):
+        """Atomically write the detector state to disk."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state = {
+            'version': _CHECKPOINT_VERSION,
+            'config': {
+                'metrics': self.metrics,
+                'dimensions': self.dimensions,
+                'z_threshold': self.z_threshold,
+                'iqr_multiplier': self.iqr_multiplier,
+                'relative_accuracy': self.relative_accuracy,
+                'min_history': self.min_history,
+                'min_value': self.min_value
+            },
+            'rows_seen': self.rows_seen,
+            'batches_seen': self.batches_seen,
+            'fingerprint': self.fingerprint,
+            'fingerprint_rows': self.fingerprint_rows,
+            'stats': self._stats,
+            'sketch': self._sketch
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load_checkpoint(cls, path=STREAM_CHECKPOINT_PATH):
+        """
+        Restore a detector from disk.
+
+        Returns:
+            StreamingAnomalyDetector or None: None if no usable checkpoint exists
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as handle:
+                state = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if state.get('version') != _CHECKPOINT_VERSION:
+            return None
+
+        detector = cls(**state['config'])
+        detector.rows_seen = state['rows_seen']
+        detector.batches_seen = state['batches_seen']
+        detector.fingerprint = state['fingerprint']
+        detector.fingerprint_rows = state['fingerprint_rows']
+        detector._stats = state['stats']
+        detector._sketch = state['sketch']
+        return detector
+
+# ============================================================================
+# DASHBOARD INTEGRATION
+# ============================================================================
+
+def update_streaming_anomalies(movements, checkpoint_path=STREAM_CHECKPOINT_PATH):
+    """
+    Consume only the rows appended to a movement log since the last refresh.
+
+    The detector lives in session state and is checkpointed to disk, so a
+    growing log is never rescanned. If the log shrinks or its leading rows
+    no longer match the checkpoint's fingerprint (a different dataset), the
+    state is rebuilt from scratch.
+
+    Args:
+        movements (pd.DataFrame): Append-only stock movement log
+        checkpoint_path (str): Checkpoint location, or None to keep state in memory
+
+    Returns:
+        tuple: (StreamingAnomalyDetector, pd.DataFrame of scores for the new rows)
+    """
+    detector = st.session_state.get('invt_stream_detector')
+    if detector is None and checkpoint_path:
+        detector = StreamingAnomalyDetector.load_checkpoint(checkpoint_path)
+    if (detector is None or detector.rows_seen > len(movements)
+            or detector.fingerprint != dataset_fingerprint(movements, detector.fingerprint_rows)):
+        detector = StreamingAnomalyDetector()
+
+    new_rows = movements.iloc[detector.rows_seen:]
+    scores = detector.process_batch(new_rows) if not new_rows.empty else detector.score_batch(new_rows)
+    if detector.fingerprint_rows < FINGERPRINT_ROWS:
+        detector.fingerprint_rows = min(len(movements), FINGERPRINT_ROWS)
+        detector.fingerprint = dataset_fingerprint(movements, detector.fingerprint_rows)
+
+    if checkpoint_path and not new_rows.empty:
+        try:
+            detector.save_checkpoint(checkpoint_path)
+        except OSError as e:
+            st.warning(f"Could not checkpoint anomaly state: {str(e)}")
+
+    st.session_state['invt_stream_detector'] = detector
+    return detector, scores
+
+def display_streaming_anomaly_section(data):
+    """Display incremental anomaly scores for the latest stock movements."""
+    movements = st.session_state.get('transactions_data')
+    if movements is None or movements.empty:
+        movements = data
+    if movements is None or movements.empty:
+        return
+
+    # Movements carry item ids only; attach suppliers from the item master
+    if ('supplier_id' not in movements.columns and data is not None
+            and {'item_id', 'supplier_id'}.issubset(data.columns) and 'item_id' in movements.columns):
+        supplier_map = data.drop_duplicates('item_id').set_index('item_id')['supplier_id']
+        movements = movements.assign(supplier_id=movements['item_id'].map(supplier_map))
+
+    st.subheader("🔄 Streaming Movement Anomalies")
+    detector, scores = update_streaming_anomalies(movements)
+    summary = detector.summarize(scores)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(label="Movements Tracked", value=f"{detector.rows_seen:,}")
+    with col2:
+        st.metric(label="New Rows Scored", value=f"{summary['scored_rows']:,}")
+    with col3:
+        st.metric(label="Flagged in Latest Batch", value=f"{summary['anomaly_score']:.1f}%")
+
+    if summary['flagged_rows']:
+        flagged = scores[scores['is_anomaly']]
+        st.dataframe(
+            flagged[['dimension', 'key', 'metric', 'value', 'z_score', 'lower_bound', 'upper_bound']],
+            use_container_width=True
+        )
+    else:
+        st.info("No anomalies in the latest movement batch.")
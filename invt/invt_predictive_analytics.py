@@ -19,6 +19,8 @@ try:
 except ImportError:
     ML_AVAILABLE = False
 
+from invt_anomaly_stream import display_streaming_anomaly_section
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -684,7 +686,7 @@ def display_inventory_predictive_analytics_dashboard(data):
         display_trend_analysis_tab(analysis_results)
     
     with tabs[2]:  # Anomaly Detection
-        display_anomaly_detection_tab(analysis_results)
+        display_anomaly_detection_tab(analysis_results, data)
     
     with tabs[3]:  # Optimization
         display_optimization_tab(analysis_results)
@@ -895,7 +897,7 @@ def display_trend_analysis_tab(analysis_results):
             
             st.plotly_chart(fig_seasonality, use_container_width=True)
 
-def display_anomaly_detection_tab(analysis_results):
+def display_anomaly_detection_tab(analysis_results, data=None):
     """Display anomaly detection results."""
     st.subheader("⚠️ Anomaly Detection")
     
@@ -974,6 +976,10 @@ def display_anomaly_detection_tab(analysis_results):
                 value=len(cost_anomalies['anomalous_costs']),
                 delta="Items with unusual costs"
             )
+    
+    # Incremental scoring of newly appended stock movements
+    if data is not None:
+        display_streaming_anomaly_section(data)
 
 def display_optimization_tab(analysis_results):
     """Display optimization recommendations."""
@@ -11,8 +11,117 @@ warnings.filterwarnings('ignore')
 # INVENTORY RISK ANALYZER CLASS
 # ============================================================================
 
+# Risk categories, in the column order of the per-item risk matrix
+RISK_CATEGORIES = [
+    'stockout_risk',
+    'supplier_risk',
+    'cost_risk',
+    'operational_risk',
+    'market_risk',
+    'quality_risk',
+    'compliance_risk'
+]
+
+RISK_WEIGHTS = {
+    'stockout_risk': 0.25,
+    'supplier_risk': 0.20,
+    'cost_risk': 0.20,
+    'operational_risk': 0.15,
+    'market_risk': 0.10,
+    'quality_risk': 0.05,
+    'compliance_risk': 0.05
+}
+
+# Mitigation strategies per category: (score > 70, score > 40, otherwise)
+MITIGATION_STRATEGIES = {
+    'stockout_risk': (
+        ["Implement safety stock for critical items",
+         "Establish backup supplier relationships",
+         "Improve demand forecasting accuracy",
+         "Set up automated reorder triggers"],
+        ["Review reorder points and lead times",
+         "Monitor stock levels more frequently",
+         "Consider vendor-managed inventory"],
+        ["Maintain current inventory management practices",
+         "Regular review of reorder parameters"]
+    ),
+    'supplier_risk': (
+        ["Develop multiple supplier relationships",
+         "Implement supplier performance monitoring",
+         "Establish backup supplier agreements",
+         "Consider supplier development programs"],
+        ["Diversify supplier base",
+         "Improve supplier communication",
+         "Set performance improvement targets"],
+        ["Maintain current supplier relationships",
+         "Regular supplier performance reviews"]
+    ),
+    'cost_risk': (
+        ["Implement just-in-time inventory",
+         "Negotiate better supplier terms",
+         "Optimize order quantities using EOQ",
+         "Consider bulk purchasing discounts"],
+        ["Review stocking levels",
+         "Optimize reorder frequencies",
+         "Monitor price trends"],
+        ["Maintain current cost management practices",
+         "Regular cost analysis and benchmarking"]
+    ),
+    'operational_risk': (
+        ["Optimize warehouse layout and storage",
+         "Implement automated picking systems",
+         "Review and optimize pick routes",
+         "Improve inventory turnover through better forecasting"],
+        ["Analyze space utilization patterns",
+         "Optimize pick processes",
+         "Review slow-moving inventory"],
+        ["Maintain current operational practices",
+         "Regular efficiency monitoring"]
+    ),
+    'market_risk': (
+        ["Improve demand forecasting models",
+         "Implement safety stock for volatile items",
+         "Develop flexible supply chain strategies",
+         "Monitor market trends and adjust accordingly"],
+        ["Enhance forecasting accuracy",
+         "Implement demand planning processes",
+         "Review seasonal inventory strategies"],
+        ["Maintain current forecasting practices",
+         "Regular market trend analysis"]
+    ),
+    'quality_risk': (
+        ["Implement quality control procedures",
+         "Review supplier quality standards",
+         "Establish quality monitoring systems",
+         "Consider alternative suppliers for low-quality items"],
+        ["Enhance quality monitoring",
+         "Review quality standards",
+         "Improve supplier communication"],
+        ["Maintain current quality standards",
+         "Regular quality assessments"]
+    ),
+    'compliance_risk': (
+        ["Implement data validation procedures",
+         "Establish data quality standards",
+         "Regular compliance audits",
+         "Staff training on compliance requirements"],
+        ["Improve data collection processes",
+         "Implement data quality checks",
+         "Regular compliance reviews"],
+        ["Maintain current compliance practices",
+         "Regular compliance monitoring"]
+    )
+}
+
 class InventoryRiskAnalyzer:
-    """Class for comprehensive inventory risk analysis and assessment."""
+    """
+    Class for comprehensive inventory risk analysis and assessment.
+
+    All risk factors are evaluated in a single pass over the item columns and
+    stored as a float32 ``risk_matrix`` (items x ``RISK_CATEGORIES``). Category
+    scores, critical-item lists and per-item rankings are derived from that
+    block with boolean masks instead of re-filtering the DataFrame.
+    """
     
     def __init__(self, data):
         """
@@ -21,24 +130,27 @@ class InventoryRiskAnalyzer:
         Args:
             data (pd.DataFrame): Inventory data
         """
-        self.data = data.copy()
+        self.data = data
         self.risk_scores = {}
         self.risk_categories = {}
         self.mitigation_strategies = {}
+        self.risk_matrix = np.zeros((len(data), len(RISK_CATEGORIES)), dtype=np.float32)
+        self.active_categories = np.zeros(len(RISK_CATEGORIES), dtype=bool)
+        self.overall_risk_level = 'Unknown'
+        self.overall_risk_score = 0
         
     def analyze_all_risks(self):
         """Perform comprehensive risk analysis across all categories."""
         if self.data.empty:
             return {}
         
-        # Calculate all risk metrics
-        self._calculate_stockout_risks()
-        self._calculate_supplier_risks()
-        self._calculate_cost_risks()
-        self._calculate_operational_risks()
-        self._calculate_market_risks()
-        self._calculate_quality_risks()
-        self._calculate_compliance_risks()
+        self._build_risk_matrix()
+        
+        for category in RISK_CATEGORIES:
+            if category in self.risk_scores:
+                self.mitigation_strategies[category] = self._select_mitigation(
+                    category, self.risk_scores[category]
+                )
         
         # Generate overall risk assessment
         self._generate_overall_risk_assessment()
@@ -47,368 +159,288 @@ class InventoryRiskAnalyzer:
             'risk_scores': self.risk_scores,
             'risk_categories': self.risk_categories,
             'mitigation_strategies': self.mitigation_strategies,
-            'overall_risk_level': self.overall_risk_level
+            'overall_risk_level': self.overall_risk_level,
+            'overall_risk_score': self.overall_risk_score,
+            'risk_matrix': self.risk_matrix,
+            'risk_matrix_columns': RISK_CATEGORIES
         }
     
-    def _calculate_stockout_risks(self):
-        """Calculate stockout and inventory availability risks."""
-        if 'current_stock' in self.data.columns and 'reorder_point' in self.data.columns:
-            # Stockout probability
-            stockout_probability = len(self.data[self.data['current_stock'] <= self.data['reorder_point']]) / len(self.data)
+    def _column(self, name, dtype=np.float64):
+        """Return a column as a NumPy array, or None if it is missing."""
+        if name not in self.data.columns:
+            return None
+        return pd.to_numeric(self.data[name], errors='coerce').to_numpy(dtype=dtype, na_value=np.nan)
+    
+    def _set_category(self, category, item_scores, aggregate_score, details):
+        """Store a category's per-item column, aggregate score and details."""
+        column = RISK_CATEGORIES.index(category)
+        self.risk_matrix[:, column] = np.nan_to_num(item_scores, nan=0.0, posinf=100.0, neginf=0.0)
+        self.active_categories[column] = True
+        self.risk_scores[category] = aggregate_score
+        self.risk_categories[category] = details
+    
+    def _build_risk_matrix(self):
+        """Evaluate every risk factor once and fill the per-item risk matrix."""
+        n_items = len(self.data)
+        item_names = self.data['item_name'].array if 'item_name' in self.data.columns else np.arange(n_items)
+        
+        current_stock = self._column('current_stock')
+        reorder_point = self._column('reorder_point')
+        
+        # Stockout risk
+        if current_stock is not None and reorder_point is not None:
+            below_reorder = current_stock <= reorder_point
+            stockout_probability = below_reorder.mean()
             
-            # Days until stockout
-            if 'daily_demand' in self.data.columns:
-                days_until_stockout = self.data['current_stock'] / self.data['daily_demand']
-                avg_days_until_stockout = days_until_stockout.mean()
+            daily_demand = self._column('daily_demand')
+            if daily_demand is not None:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    days_until_stockout = current_stock / daily_demand
+                avg_days_until_stockout = np.nanmean(days_until_stockout)
             else:
+                days_until_stockout = np.zeros(n_items)
                 avg_days_until_stockout = 0
             
-            # Stockout risk score (0-100)
-            stockout_risk_score = min(100, stockout_probability * 100 + (30 - avg_days_until_stockout) * 2)
-            
-            self.risk_scores['stockout_risk'] = stockout_risk_score
-            self.risk_categories['stockout_risk'] = {
-                'probability': stockout_probability,
-                'avg_days_until_stockout': avg_days_until_stockout,
-                'critical_items': self.data[self.data['current_stock'] <= self.data['reorder_point']]['item_name'].tolist()
-            }
-            
-            # Mitigation strategies
-            if stockout_risk_score > 70:
-                self.mitigation_strategies['stockout_risk'] = [
-                    "Implement safety stock for critical items",
-                    "Establish backup supplier relationships",
-                    "Improve demand forecasting accuracy",
-                    "Set up automated reorder triggers"
-                ]
-            elif stockout_risk_score > 40:
-                self.mitigation_strategies['stockout_risk'] = [
-                    "Review reorder points and lead times",
-                    "Monitor stock levels more frequently",
-                    "Consider vendor-managed inventory"
-                ]
-            else:
-                self.mitigation_strategies['stockout_risk'] = [
-                    "Maintain current inventory management practices",
-                    "Regular review of reorder parameters"
-                ]
-    
-    def _calculate_supplier_risks(self):
-        """Calculate supplier-related risks."""
+            item_days = np.nan_to_num(days_until_stockout, nan=0.0)
+            self._set_category(
+                'stockout_risk',
+                np.clip(below_reorder * 100 + (30 - item_days) * 2, 0, 100),
+                min(100, stockout_probability * 100 + (30 - avg_days_until_stockout) * 2),
+                {
+                    'probability': stockout_probability,
+                    'avg_days_until_stockout': avg_days_until_stockout,
+                    'critical_items': list(item_names[below_reorder])
+                }
+            )
+        
+        # Supplier risk
         if 'supplier_id' in self.data.columns:
-            supplier_risks = {}
+            supplier_codes, suppliers = pd.factorize(self.data['supplier_id'])
+            concentration_risk = 1 - (len(suppliers) / n_items)
             
-            # Supplier concentration risk
-            supplier_counts = self.data['supplier_id'].value_counts()
-            concentration_risk = 1 - (len(supplier_counts) / len(self.data))
-            
-            # Supplier performance risk
-            if 'supplier_performance' in self.data.columns:
-                poor_performers = self.data[self.data['supplier_performance'] < 60]
-                performance_risk = len(poor_performers) / len(self.data) * 100
+            supplier_performance = self._column('supplier_performance')
+            if supplier_performance is not None:
+                poor_performer = supplier_performance < 60
+                performance_risk = poor_performer.mean() * 100
+                # In order of first appearance among the poor rows
+                poor_performing_suppliers = list(pd.unique(self.data['supplier_id'].to_numpy()[poor_performer]))
             else:
+                poor_performer = np.zeros(n_items, dtype=bool)
                 performance_risk = 0
+                poor_performing_suppliers = []
             
-            # Lead time variance risk
-            if 'lead_time' in self.data.columns:
-                lead_time_variance = self.data.groupby('supplier_id')['lead_time'].var().fillna(0)
-                avg_lead_time_variance = lead_time_variance.mean()
-                lead_time_risk = min(100, avg_lead_time_variance / 10)  # Normalize to 0-100
+            lead_time = self._column('lead_time')
+            if lead_time is not None:
+                supplier_variance = self._grouped_variance(lead_time, supplier_codes, len(suppliers))
+                lead_time_risk = min(100, supplier_variance.mean() / 10) if len(suppliers) else 0
+                item_lead_time_risk = np.where(
+                    supplier_codes >= 0,
+                    np.minimum(100, supplier_variance[np.maximum(supplier_codes, 0)] / 10),
+                    0
+                )
             else:
                 lead_time_risk = 0
+                item_lead_time_risk = np.zeros(n_items)
             
-            # Overall supplier risk
-            supplier_risk_score = (concentration_risk * 30 + performance_risk * 40 + lead_time_risk * 30) / 100
-            
-            self.risk_scores['supplier_risk'] = supplier_risk_score
-            self.risk_categories['supplier_risk'] = {
-                'concentration_risk': concentration_risk,
-                'performance_risk': performance_risk,
-                'lead_time_risk': lead_time_risk,
-                'poor_performing_suppliers': self.data[self.data['supplier_performance'] < 60]['supplier_id'].unique().tolist() if 'supplier_performance' in self.data.columns else []
-            }
-            
-            # Mitigation strategies
-            if supplier_risk_score > 70:
-                self.mitigation_strategies['supplier_risk'] = [
-                    "Develop multiple supplier relationships",
-                    "Implement supplier performance monitoring",
-                    "Establish backup supplier agreements",
-                    "Consider supplier development programs"
-                ]
-            elif supplier_risk_score > 40:
-                self.mitigation_strategies['supplier_risk'] = [
-                    "Diversify supplier base",
-                    "Improve supplier communication",
-                    "Set performance improvement targets"
-                ]
-            else:
-                self.mitigation_strategies['supplier_risk'] = [
-                    "Maintain current supplier relationships",
-                    "Regular supplier performance reviews"
-                ]
-    
-    def _calculate_cost_risks(self):
-        """Calculate cost-related risks."""
-        cost_risks = {}
-        
-        # Holding cost risk
-        if 'annual_holding_cost' in self.data.columns:
-            total_holding_cost = self.data['annual_holding_cost'].sum()
-            avg_holding_cost_per_item = total_holding_cost / len(self.data)
-            
-            # Compare to industry benchmarks (assuming 20% of inventory value is reasonable)
-            if 'stock_value' in self.data.columns:
-                total_stock_value = self.data['stock_value'].sum()
-                benchmark_holding_cost = total_stock_value * 0.2
-                holding_cost_risk = min(100, (total_holding_cost / benchmark_holding_cost) * 50)
-            else:
-                holding_cost_risk = 0
-        else:
-            holding_cost_risk = 0
-        
-        # Price volatility risk
-        if 'unit_cost' in self.data.columns:
-            cost_volatility = self.data['unit_cost'].std() / self.data['unit_cost'].mean()
-            price_volatility_risk = min(100, cost_volatility * 100)
+            self._set_category(
+                'supplier_risk',
+                (concentration_risk * 30 + poor_performer * 100 * 40 + item_lead_time_risk * 30) / 100,
+                (concentration_risk * 30 + performance_risk * 40 + lead_time_risk * 30) / 100,
+                {
+                    'concentration_risk': concentration_risk,
+                    'performance_risk': performance_risk,
+                    'lead_time_risk': lead_time_risk,
+                    'poor_performing_suppliers': poor_performing_suppliers
+                }
+            )
+        
+        # Cost risk
+        holding_cost = self._column('annual_holding_cost')
+        stock_value = self._column('stock_value')
+        total_holding_cost = 0
+        holding_cost_risk = 0
+        item_holding_risk = np.zeros(n_items)
+        if holding_cost is not None:
+            total_holding_cost = np.nansum(holding_cost)
+            if stock_value is not None:
+                # Compare to industry benchmarks (assuming 20% of inventory value is reasonable)
+                holding_cost_risk = min(100, (total_holding_cost / (np.nansum(stock_value) * 0.2)) * 50)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    item_holding_risk = np.minimum(100, holding_cost / (stock_value * 0.2) * 50)
+        
+        unit_cost = self._column('unit_cost')
+        if unit_cost is not None:
+            mean_cost = np.nanmean(unit_cost)
+            price_volatility_risk = min(100, np.nanstd(unit_cost, ddof=1) / mean_cost * 100)
+            item_price_risk = np.minimum(100, np.abs(unit_cost - mean_cost) / mean_cost * 100)
         else:
             price_volatility_risk = 0
+            item_price_risk = np.zeros(n_items)
+        
+        self._set_category(
+            'cost_risk',
+            (item_holding_risk * 60 + item_price_risk * 40) / 100,
+            (holding_cost_risk * 60 + price_volatility_risk * 40) / 100,
+            {
+                'holding_cost_risk': holding_cost_risk,
+                'price_volatility_risk': price_volatility_risk,
+                'total_holding_cost': total_holding_cost
+            }
+        )
         
-        # Overall cost risk
-        cost_risk_score = (holding_cost_risk * 60 + price_volatility_risk * 40) / 100
-        
-        self.risk_scores['cost_risk'] = cost_risk_score
-        self.risk_categories['cost_risk'] = {
-            'holding_cost_risk': holding_cost_risk,
-            'price_volatility_risk': price_volatility_risk,
-            'total_holding_cost': total_holding_cost if 'annual_holding_cost' in self.data.columns else 0
-        }
-        
-        # Mitigation strategies
-        if cost_risk_score > 70:
-            self.mitigation_strategies['cost_risk'] = [
-                "Implement just-in-time inventory",
-                "Negotiate better supplier terms",
-                "Optimize order quantities using EOQ",
-                "Consider bulk purchasing discounts"
-            ]
-        elif cost_risk_score > 40:
-            self.mitigation_strategies['cost_risk'] = [
-                "Review stocking levels",
-                "Optimize reorder frequencies",
-                "Monitor price trends"
-            ]
-        else:
-            self.mitigation_strategies['cost_risk'] = [
-                "Maintain current cost management practices",
-                "Regular cost analysis and benchmarking"
-            ]
-    
-    def _calculate_operational_risks(self):
-        """Calculate operational and efficiency risks."""
-        operational_risks = {}
-        
-        # Space utilization risk
-        if 'space_utilization' in self.data.columns:
-            low_utilization = len(self.data[self.data['space_utilization'] < 50])
-            high_utilization = len(self.data[self.data['space_utilization'] > 90])
-            
-            space_risk = (low_utilization * 0.3 + high_utilization * 0.7) / len(self.data) * 100
-        else:
-            space_risk = 0
-        
-        # Pick efficiency risk
-        if 'pick_efficiency' in self.data.columns:
-            low_pick_efficiency = len(self.data[self.data['pick_efficiency'] < 60])
-            pick_efficiency_risk = (low_pick_efficiency / len(self.data)) * 100
-        else:
-            pick_efficiency_risk = 0
-        
-        # Turnover risk
-        if 'turnover_rate' in self.data.columns:
-            low_turnover = len(self.data[self.data['turnover_rate'] < self.data['turnover_rate'].quantile(0.25)])
-            turnover_risk = (low_turnover / len(self.data)) * 100
-        else:
-            turnover_risk = 0
-        
-        # Overall operational risk
-        operational_risk_score = (space_risk * 30 + pick_efficiency_risk * 40 + turnover_risk * 30) / 100
-        
-        self.risk_scores['operational_risk'] = operational_risk_score
-        self.risk_categories['operational_risk'] = {
-            'space_risk': space_risk,
-            'pick_efficiency_risk': pick_efficiency_risk,
-            'turnover_risk': turnover_risk
-        }
-        
-        # Mitigation strategies
-        if operational_risk_score > 70:
-            self.mitigation_strategies['operational_risk'] = [
-                "Optimize warehouse layout and storage",
-                "Implement automated picking systems",
-                "Review and optimize pick routes",
-                "Improve inventory turnover through better forecasting"
-            ]
-        elif operational_risk_score > 40:
-            self.mitigation_strategies['operational_risk'] = [
-                "Analyze space utilization patterns",
-                "Optimize pick processes",
-                "Review slow-moving inventory"
-            ]
-        else:
-            self.mitigation_strategies['operational_risk'] = [
-                "Maintain current operational practices",
-                "Regular efficiency monitoring"
-            ]
-    
-    def _calculate_market_risks(self):
-        """Calculate market and demand-related risks."""
-        market_risks = {}
-        
-        # Demand volatility risk
-        if 'demand_volatility' in self.data.columns:
-            high_volatility = len(self.data[self.data['demand_volatility'] > 0.5])
-            demand_volatility_risk = (high_volatility / len(self.data)) * 100
-        else:
-            demand_volatility_risk = 0
-        
-        # Forecast accuracy risk
-        if 'forecast_accuracy' in self.data.columns:
-            low_accuracy = len(self.data[self.data['forecast_accuracy'] < 80])
-            forecast_accuracy_risk = (low_accuracy / len(self.data)) * 100
-        else:
-            forecast_accuracy_risk = 0
-        
-        # Seasonality risk
-        if 'seasonality_score' in self.data.columns:
-            high_seasonality = len(self.data[self.data['seasonality_score'] > 0.7])
-            seasonality_risk = (high_seasonality / len(self.data)) * 50  # Seasonality itself isn't always risky
-        else:
-            seasonality_risk = 0
-        
-        # Overall market risk
-        market_risk_score = (demand_volatility_risk * 40 + forecast_accuracy_risk * 40 + seasonality_risk * 20) / 100
-        
-        self.risk_scores['market_risk'] = market_risk_score
-        self.risk_categories['market_risk'] = {
-            'demand_volatility_risk': demand_volatility_risk,
-            'forecast_accuracy_risk': forecast_accuracy_risk,
-            'seasonality_risk': seasonality_risk
-        }
+        # Operational risk
+        space_utilization = self._column('space_utilization')
+        pick_efficiency = self._column('pick_efficiency')
+        turnover_rate = self._column('turnover_rate')
+        item_space_risk = ((space_utilization < 50) * 0.3 + (space_utilization > 90) * 0.7) * 100 \
+            if space_utilization is not None else np.zeros(n_items)
+        item_pick_risk = (pick_efficiency < 60) * 100.0 if pick_efficiency is not None else np.zeros(n_items)
+        item_turnover_risk = (turnover_rate < np.nanquantile(turnover_rate, 0.25)) * 100.0 \
+            if turnover_rate is not None else np.zeros(n_items)
+        
+        space_risk = item_space_risk.mean()
+        pick_efficiency_risk = item_pick_risk.mean()
+        turnover_risk = item_turnover_risk.mean()
+        self._set_category(
+            'operational_risk',
+            (item_space_risk * 30 + item_pick_risk * 40 + item_turnover_risk * 30) / 100,
+            (space_risk * 30 + pick_efficiency_risk * 40 + turnover_risk * 30) / 100,
+            {
+                'space_risk': space_risk,
+                'pick_efficiency_risk': pick_efficiency_risk,
+                'turnover_risk': turnover_risk
+            }
+        )
         
-        # Mitigation strategies
-        if market_risk_score > 70:
-            self.mitigation_strategies['market_risk'] = [
-                "Improve demand forecasting models",
-                "Implement safety stock for volatile items",
-                "Develop flexible supply chain strategies",
-                "Monitor market trends and adjust accordingly"
-            ]
-        elif market_risk_score > 40:
-            self.mitigation_strategies['market_risk'] = [
-                "Enhance forecasting accuracy",
-                "Implement demand planning processes",
-                "Review seasonal inventory strategies"
-            ]
-        else:
-            self.mitigation_strategies['market_risk'] = [
-                "Maintain current forecasting practices",
-                "Regular market trend analysis"
-            ]
-    
-    def _calculate_quality_risks(self):
-        """Calculate quality and compliance risks."""
-        quality_risks = {}
-        
-        # Quality score risk
-        if 'quality_score' in self.data.columns:
-            low_quality = len(self.data[self.data['quality_score'] < 80])
-            quality_risk = (low_quality / len(self.data)) * 100
-        else:
-            quality_risk = 0
+        # Market risk
+        demand_volatility = self._column('demand_volatility')
+        forecast_accuracy = self._column('forecast_accuracy')
+        seasonality_score = self._column('seasonality_score')
+        item_volatility_risk = (demand_volatility > 0.5) * 100.0 \
+            if demand_volatility is not None else np.zeros(n_items)
+        item_accuracy_risk = (forecast_accuracy < 80) * 100.0 \
+            if forecast_accuracy is not None else np.zeros(n_items)
+        # Seasonality itself isn't always risky
+        item_seasonality_risk = (seasonality_score > 0.7) * 50.0 \
+            if seasonality_score is not None else np.zeros(n_items)
+        
+        demand_volatility_risk = item_volatility_risk.mean()
+        forecast_accuracy_risk = item_accuracy_risk.mean()
+        seasonality_risk = item_seasonality_risk.mean()
+        self._set_category(
+            'market_risk',
+            (item_volatility_risk * 40 + item_accuracy_risk * 40 + item_seasonality_risk * 20) / 100,
+            (demand_volatility_risk * 40 + forecast_accuracy_risk * 40 + seasonality_risk * 20) / 100,
+            {
+                'demand_volatility_risk': demand_volatility_risk,
+                'forecast_accuracy_risk': forecast_accuracy_risk,
+                'seasonality_risk': seasonality_risk
+            }
+        )
         
-        # Expiry risk (if applicable)
+        # Quality risk
+        quality_score = self._column('quality_score')
+        item_quality_risk = (quality_score < 80) * 100.0 if quality_score is not None else np.zeros(n_items)
         if 'expiry_date' in self.data.columns:
-            current_date = datetime.now()
-            expiring_soon = len(self.data[pd.to_datetime(self.data['expiry_date']) < current_date + timedelta(days=30)])
-            expiry_risk = (expiring_soon / len(self.data)) * 100
+            expiry_date = pd.to_datetime(self.data['expiry_date'], errors='coerce').to_numpy()
+            item_expiry_risk = (expiry_date < np.datetime64(datetime.now() + timedelta(days=30))) * 100.0
         else:
-            expiry_risk = 0
-        
-        # Overall quality risk
-        quality_risk_score = (quality_risk * 70 + expiry_risk * 30) / 100
-        
-        self.risk_scores['quality_risk'] = quality_risk_score
-        self.risk_categories['quality_risk'] = {
-            'quality_risk': quality_risk,
-            'expiry_risk': expiry_risk
-        }
-        
-        # Mitigation strategies
-        if quality_risk_score > 70:
-            self.mitigation_strategies['quality_risk'] = [
-                "Implement quality control procedures",
-                "Review supplier quality standards",
-                "Establish quality monitoring systems",
-                "Consider alternative suppliers for low-quality items"
-            ]
-        elif quality_risk_score > 40:
-            self.mitigation_strategies['quality_risk'] = [
-                "Enhance quality monitoring",
-                "Review quality standards",
-                "Improve supplier communication"
-            ]
-        else:
-            self.mitigation_strategies['quality_risk'] = [
-                "Maintain current quality standards",
-                "Regular quality assessments"
-            ]
-    
-    def _calculate_compliance_risks(self):
-        """Calculate compliance and regulatory risks."""
-        compliance_risks = {}
-        
-        # Basic compliance risk (placeholder for industry-specific requirements)
-        compliance_risk = 0  # This would be customized based on industry requirements
+            item_expiry_risk = np.zeros(n_items)
+        
+        quality_risk = item_quality_risk.mean()
+        expiry_risk = item_expiry_risk.mean()
+        self._set_category(
+            'quality_risk',
+            (item_quality_risk * 70 + item_expiry_risk * 30) / 100,
+            (quality_risk * 70 + expiry_risk * 30) / 100,
+            {
+                'quality_risk': quality_risk,
+                'expiry_risk': expiry_risk
+            }
+        )
         
-        # Documentation risk
-        missing_fields = 0
+        # Compliance risk (basic compliance is a placeholder for industry-specific requirements)
+        compliance_risk = 0
         required_fields = ['item_name', 'current_stock', 'unit_cost']
-        for field in required_fields:
-            if field in self.data.columns:
-                missing_fields += self.data[field].isna().sum()
-        
-        documentation_risk = (missing_fields / (len(self.data) * len(required_fields))) * 100
+        present_fields = [field for field in required_fields if field in self.data.columns]
+        item_missing = (self.data[present_fields].isna().to_numpy().sum(axis=1)
+                        if present_fields else np.zeros(n_items))
+        missing_fields = int(item_missing.sum())
+        
+        item_documentation_risk = item_missing / len(required_fields) * 100
+        documentation_risk = (missing_fields / (n_items * len(required_fields))) * 100
+        self._set_category(
+            'compliance_risk',
+            (compliance_risk * 30 + item_documentation_risk * 70) / 100,
+            (compliance_risk * 30 + documentation_risk * 70) / 100,
+            {
+                'compliance_risk': compliance_risk,
+                'documentation_risk': documentation_risk,
+                'missing_data_points': missing_fields
+            }
+        )
+    
+    @staticmethod
+    def _grouped_variance(values, codes, n_groups):
+        """Per-group sample variance (NaN-skipping, 0 for single-item groups) via bincount."""
+        valid = (codes >= 0) & ~np.isnan(values)
+        group_codes = codes[valid]
+        group_values = values[valid]
+        counts = np.bincount(group_codes, minlength=n_groups)
+        sums = np.bincount(group_codes, weights=group_values, minlength=n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / counts
+            squared = np.bincount(group_codes, weights=(group_values - means[group_codes]) ** 2,
+                                  minlength=n_groups)
+            variance = squared / (counts - 1)
+        return np.where(counts > 1, variance, 0.0)
+    
+    @staticmethod
+    def _select_mitigation(category, score):
+        """Pick the mitigation strategies matching a category score."""
+        high, medium, low = MITIGATION_STRATEGIES[category]
+        if score > 70:
+            return list(high)
+        if score > 40:
+            return list(medium)
+        return list(low)
+    
+    def get_item_risk_scores(self):
+        """
+        Weighted overall risk per item from the risk matrix.
         
-        # Overall compliance risk
-        compliance_risk_score = (compliance_risk * 30 + documentation_risk * 70) / 100
+        Returns:
+            np.ndarray: float32 score per item (0-100)
+        """
+        weights = np.array([RISK_WEIGHTS[c] for c in RISK_CATEGORIES], dtype=np.float32)
+        weights = weights * self.active_categories
+        if weights.sum() == 0:
+            return np.zeros(len(self.risk_matrix), dtype=np.float32)
+        return self.risk_matrix @ (weights / weights.sum())
+    
+    def get_critical_items(self, category=None, threshold=60):
+        """
+        Items whose risk score meets a threshold.
         
-        self.risk_scores['compliance_risk'] = compliance_risk_score
-        self.risk_categories['compliance_risk'] = {
-            'compliance_risk': compliance_risk,
-            'documentation_risk': documentation_risk,
-            'missing_data_points': missing_fields
-        }
+        Args:
+            category (str): Risk category, or None for the weighted overall score
+            threshold (float): Minimum score to be considered critical
         
-        # Mitigation strategies
-        if compliance_risk_score > 70:
-            self.mitigation_strategies['compliance_risk'] = [
-                "Implement data validation procedures",
-                "Establish data quality standards",
-                "Regular compliance audits",
-                "Staff training on compliance requirements"
-            ]
-        elif compliance_risk_score > 40:
-            self.mitigation_strategies['compliance_risk'] = [
-                "Improve data collection processes",
-                "Implement data quality checks",
-                "Regular compliance reviews"
-            ]
+        Returns:
+            pd.DataFrame: Critical items with their scores, highest first
+        """
+        if category is None:
+            scores = self.get_item_risk_scores()
         else:
-            self.mitigation_strategies['compliance_risk'] = [
-                "Maintain current compliance practices",
-                "Regular compliance monitoring"
-            ]
+            scores = self.risk_matrix[:, RISK_CATEGORIES.index(category)]
+        mask = scores >= threshold
+        
+        critical = pd.DataFrame(self.risk_matrix[mask], columns=RISK_CATEGORIES,
+                                index=self.data.index[mask])
+        critical.insert(0, 'risk_score', scores[mask])
+        if 'item_name' in self.data.columns:
+            critical.insert(0, 'item_name', self.data['item_name'].array[mask])
+        return critical.sort_values('risk_score', ascending=False)
     
     def _generate_overall_risk_assessment(self):
         """Generate overall risk assessment and scoring."""
@@ -417,20 +449,10 @@ class InventoryRiskAnalyzer:
             return
         
         # Calculate weighted average risk score
-        risk_weights = {
-            'stockout_risk': 0.25,
-            'supplier_risk': 0.20,
-            'cost_risk': 0.20,
-            'operational_risk': 0.15,
-            'market_risk': 0.10,
-            'quality_risk': 0.05,
-            'compliance_risk': 0.05
-        }
-        
         overall_score = 0
         total_weight = 0
         
-        for risk_type, weight in risk_weights.items():
+        for risk_type, weight in RISK_WEIGHTS.items():
             if risk_type in self.risk_scores:
                 overall_score += self.risk_scores[risk_type] * weight
                 total_weight += weight
@@ -485,6 +507,9 @@ def display_risk_dashboard(data):
     
     # Display risk trends and patterns
     display_risk_trends(data, risk_results)
+    
+    # Display the highest-risk items from the per-item risk matrix
+    display_item_risk_ranking(risk_analyzer)
 
 def display_overall_risk_assessment(risk_results):
     """Display overall risk assessment summary."""
@@ -715,6 +740,31 @@ def display_risk_trends(data, risk_results):
             else:
                 st.success(f"{i}. {risk_name}: {score:.1f}")
 
+def display_item_risk_ranking(risk_analyzer, top_n=20):
+    """Display the items with the highest weighted risk across categories."""
+    st.subheader("🧾 Highest-Risk Items")
+    
+    item_scores = risk_analyzer.get_item_risk_scores()
+    if len(item_scores) == 0:
+        st.info("No item-level risk data available.")
+        return
+    
+    # Partial sort keeps this cheap for very large catalogues
+    top_n = min(top_n, len(item_scores))
+    top_positions = np.argpartition(-item_scores, top_n - 1)[:top_n]
+    top_positions = top_positions[np.argsort(-item_scores[top_positions])]
+    
+    active_columns = [c for c, active in zip(RISK_CATEGORIES, risk_analyzer.active_categories) if active]
+    ranking = pd.DataFrame(
+        risk_analyzer.risk_matrix[top_positions][:, risk_analyzer.active_categories],
+        columns=[c.replace('_', ' ').title() for c in active_columns]
+    )
+    ranking.insert(0, 'Overall Risk', item_scores[top_positions])
+    if 'item_name' in risk_analyzer.data.columns:
+        ranking.insert(0, 'Item', risk_analyzer.data['item_name'].array[top_positions])
+    
+    st.dataframe(ranking.round(1), use_container_width=True)
+
 def generate_risk_report(data):
     """Generate a comprehensive risk report."""
     if data is None or data.empty:
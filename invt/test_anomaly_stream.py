@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming inventory anomaly detector
+Checks incremental scoring, checkpoint reuse and dataset fingerprints
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from invt_anomaly_stream import StreamingAnomalyDetector, dataset_fingerprint, update_streaming_anomalies
+
+
+def make_movements(n_rows, seed):
+    """Synthetic stock movement log over a handful of items and suppliers."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'item_id': rng.choice([f"ITEM_{i:03d}" for i in range(10)], n_rows),
+        'supplier_id': rng.choice([f"SUP_{i:02d}" for i in range(3)], n_rows),
+        'quantity': rng.normal(50, 10, n_rows).round(),
+        'unit_cost': rng.gamma(4.0, 5.0, n_rows).round(2),
+        'current_stock': rng.integers(0, 500, n_rows)
+    })
+
+
+def reset_session():
+    st.session_state.pop('invt_stream_detector', None)
+
+
+def test_incremental_updates_match_one_batch():
+    """Folding a log in two batches gives the state of folding it at once."""
+    movements = make_movements(400, seed=1)
+    whole = StreamingAnomalyDetector()
+    whole.update(movements)
+    split = StreamingAnomalyDetector()
+    split.update(movements.iloc[:150])
+    split.update(movements.iloc[150:])
+
+    assert split.rows_seen == whole.rows_seen == 400
+    merged = split.statistics().sort_index()
+    expected = whole.statistics().sort_index()
+    assert merged.index.equals(expected.index)
+    assert np.allclose(merged.to_numpy(dtype=float), expected.to_numpy(dtype=float), equal_nan=True)
+    print("✅ Incremental updates match a single batch")
+
+
+def test_fingerprint_ignores_appended_rows():
+    """Appending rows keeps the fingerprint; different leading rows change it."""
+    movements = make_movements(300, seed=2)
+    assert dataset_fingerprint(movements) == dataset_fingerprint(pd.concat([movements, make_movements(50, seed=3)]))
+    assert dataset_fingerprint(movements) != dataset_fingerprint(make_movements(300, seed=4))
+    assert dataset_fingerprint(movements) != dataset_fingerprint(movements.drop(columns='unit_cost'))
+    print("✅ Dataset fingerprints verified")
+
+
+def test_checkpoint_resumes_only_the_same_log():
+    """A growing log resumes the checkpoint; another dataset starts fresh."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        path = os.path.join(root_dir, 'state.pkl')
+        movements = make_movements(500, seed=5)
+
+        reset_session()
+        detector, _ = update_streaming_anomalies(movements.iloc[:300], checkpoint_path=path)
+        assert detector.rows_seen == 300
+
+        # Restart: the checkpoint is resumed and only the appended rows are scored
+        reset_session()
+        detector, scores = update_streaming_anomalies(movements, checkpoint_path=path)
+        assert detector.rows_seen == 500 and detector.batches_seen == 2
+        assert scores.index.nunique() <= 200
+
+        # A different, longer log must not resume the checkpoint
+        reset_session()
+        other = make_movements(800, seed=6)
+        detector, _ = update_streaming_anomalies(other, checkpoint_path=path)
+        assert detector.rows_seen == 800 and detector.batches_seen == 1
+
+        # Logs shorter than the fingerprint window are recognised as they grow
+        reset_session()
+        detector, _ = update_streaming_anomalies(movements.iloc[:20], checkpoint_path=path)
+        detector, _ = update_streaming_anomalies(movements.iloc[:60], checkpoint_path=path)
+        assert detector.rows_seen == 60 and detector.batches_seen == 2
+        detector, _ = update_streaming_anomalies(other.iloc[:90], checkpoint_path=path)
+        assert detector.rows_seen == 90 and detector.batches_seen == 1
+    reset_session()
+    print("✅ Checkpoint resume and dataset fingerprint checks verified")
+
+
+if __name__ == "__main__":
+    test_incremental_updates_match_one_batch()
+    test_fingerprint_ignores_appended_rows()
+    test_checkpoint_resumes_only_the_same_log()
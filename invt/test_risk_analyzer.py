@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for the inventory risk analyzer
+Checks per-category scores and details against the original row-filtering formulas
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from invt_risk_analyzer import InventoryRiskAnalyzer
+
+
+def make_inventory(n_items, seed):
+    """Synthetic catalogue with every risk column and a few missing values."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        'item_name': [f"Item {i}" for i in range(n_items)],
+        'supplier_id': rng.choice([f"SUP_{i:02d}" for i in range(12)], n_items),
+        'current_stock': rng.integers(0, 400, n_items).astype(float),
+        'reorder_point': rng.integers(20, 150, n_items),
+        'daily_demand': rng.uniform(1, 20, n_items).round(2),
+        'supplier_performance': rng.uniform(30, 100, n_items).round(1),
+        'lead_time': rng.integers(2, 40, n_items),
+        'annual_holding_cost': rng.uniform(10, 500, n_items).round(2),
+        'stock_value': rng.uniform(100, 5000, n_items).round(2),
+        'unit_cost': rng.gamma(3.0, 8.0, n_items).round(2),
+        'space_utilization': rng.uniform(20, 100, n_items),
+        'pick_efficiency': rng.uniform(40, 100, n_items),
+        'turnover_rate': rng.uniform(0.5, 12, n_items),
+        'demand_volatility': rng.uniform(0, 1, n_items),
+        'forecast_accuracy': rng.uniform(50, 100, n_items),
+        'seasonality_score': rng.uniform(0, 1, n_items),
+        'quality_score': rng.uniform(60, 100, n_items),
+        'expiry_date': np.where(rng.random(n_items) < 0.2, '2000-01-01', '2100-01-01')
+    })
+    data.loc[rng.random(n_items) < 0.02, 'item_name'] = None
+    data.loc[rng.random(n_items) < 0.02, 'current_stock'] = np.nan
+    return data
+
+
+def original_risks(data):
+    """Category scores and details computed with the original per-category row filters."""
+    n = len(data)
+    scores, categories = {}, {}
+
+    below = data[data['current_stock'] <= data['reorder_point']]
+    avg_days = (data['current_stock'] / data['daily_demand']).mean()
+    scores['stockout_risk'] = min(100, len(below) / n * 100 + (30 - avg_days) * 2)
+    categories['stockout_risk'] = {'probability': len(below) / n, 'avg_days_until_stockout': avg_days,
+                                   'critical_items': below['item_name'].tolist()}
+
+    concentration = 1 - (len(data['supplier_id'].value_counts()) / n)
+    performance = len(data[data['supplier_performance'] < 60]) / n * 100
+    lead_time = min(100, data.groupby('supplier_id')['lead_time'].var().fillna(0).mean() / 10)
+    scores['supplier_risk'] = (concentration * 30 + performance * 40 + lead_time * 30) / 100
+    categories['supplier_risk'] = {
+        'concentration_risk': concentration, 'performance_risk': performance, 'lead_time_risk': lead_time,
+        'poor_performing_suppliers': data[data['supplier_performance'] < 60]['supplier_id'].unique().tolist()
+    }
+
+    total_holding = data['annual_holding_cost'].sum()
+    holding = min(100, (total_holding / (data['stock_value'].sum() * 0.2)) * 50)
+    volatility = min(100, data['unit_cost'].std() / data['unit_cost'].mean() * 100)
+    scores['cost_risk'] = (holding * 60 + volatility * 40) / 100
+    categories['cost_risk'] = {'holding_cost_risk': holding, 'price_volatility_risk': volatility,
+                               'total_holding_cost': total_holding}
+
+    space = (len(data[data['space_utilization'] < 50]) * 0.3 + len(data[data['space_utilization'] > 90]) * 0.7) / n * 100
+    pick = len(data[data['pick_efficiency'] < 60]) / n * 100
+    turnover = len(data[data['turnover_rate'] < data['turnover_rate'].quantile(0.25)]) / n * 100
+    scores['operational_risk'] = (space * 30 + pick * 40 + turnover * 30) / 100
+    categories['operational_risk'] = {'space_risk': space, 'pick_efficiency_risk': pick, 'turnover_risk': turnover}
+
+    demand = len(data[data['demand_volatility'] > 0.5]) / n * 100
+    accuracy = len(data[data['forecast_accuracy'] < 80]) / n * 100
+    seasonality = len(data[data['seasonality_score'] > 0.7]) / n * 50
+    scores['market_risk'] = (demand * 40 + accuracy * 40 + seasonality * 20) / 100
+    categories['market_risk'] = {'demand_volatility_risk': demand, 'forecast_accuracy_risk': accuracy,
+                                 'seasonality_risk': seasonality}
+
+    quality = len(data[data['quality_score'] < 80]) / n * 100
+    expiry = len(data[pd.to_datetime(data['expiry_date']) < datetime.now() + timedelta(days=30)]) / n * 100
+    scores['quality_risk'] = (quality * 70 + expiry * 30) / 100
+    categories['quality_risk'] = {'quality_risk': quality, 'expiry_risk': expiry}
+
+    missing = sum(data[field].isna().sum() for field in ['item_name', 'current_stock', 'unit_cost'])
+    documentation = missing / (n * 3) * 100
+    scores['compliance_risk'] = documentation * 70 / 100
+    categories['compliance_risk'] = {'compliance_risk': 0, 'documentation_risk': documentation,
+                                     'missing_data_points': missing}
+    return scores, categories
+
+
+def assert_details_match(category, actual, expected):
+    assert set(actual) == set(expected), f"{category} details differ: {sorted(actual)}"
+    for key, value in expected.items():
+        if isinstance(value, list):
+            assert list(actual[key]) == value, f"{category}.{key} differs"
+        else:
+            assert np.isclose(actual[key], value, equal_nan=True), f"{category}.{key}: {actual[key]} != {value}"
+
+
+def test_categories_match_original_formulas():
+    """Every category score and detail equals the original row-filtering result."""
+    for seed in (1, 2):
+        data = make_inventory(3_000, seed)
+        results = InventoryRiskAnalyzer(data).analyze_all_risks()
+        scores, categories = original_risks(data)
+        assert set(results['risk_scores']) == set(scores)
+        for category, score in scores.items():
+            assert np.isclose(results['risk_scores'][category], score), f"{category} score differs"
+            assert_details_match(category, results['risk_categories'][category], categories[category])
+    print("✅ Category scores and details match the original formulas")
+
+
+def test_poor_suppliers_keep_poor_row_order():
+    """A supplier first seen on a good row is listed where its first poor row appears."""
+    data = make_inventory(6, 3).assign(
+        supplier_id=['SUP_A', 'SUP_B', 'SUP_C', 'SUP_A', 'SUP_B', 'SUP_C'],
+        supplier_performance=[95.0, 90.0, 40.0, 30.0, 20.0, 50.0]
+    )
+    details = InventoryRiskAnalyzer(data).analyze_all_risks()['risk_categories']['supplier_risk']
+    assert details['poor_performing_suppliers'] == ['SUP_C', 'SUP_A', 'SUP_B']
+    print("✅ Poor suppliers are listed in poor-row order")
+
+
+if __name__ == "__main__":
+    test_categories_match_original_formulas()
+    test_poor_suppliers_keep_poor_row_order()